@@ -0,0 +1,51 @@
+"""Add MinHash LSH band keys to memory_items for write-path dedup.
+
+Near-duplicate suppression: the write path probes minhash_bands
+(GIN, array overlap) for candidates, then verifies them with exact
+shingle Jaccard on content. Existing rows keep NULL band keys and are
+simply never matched; no backfill is required.
+
+Revision ID: 007_memory_item_minhash
+Revises: 006_tool_usage_records
+Create Date: 2026-10-18
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "007_memory_item_minhash"
+down_revision = "006_tool_usage_records"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible via downgrade()
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+
+def upgrade() -> None:
+    op.add_column(
+        "memory_items",
+        sa.Column(
+            "minhash_bands",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=True,
+            comment="MinHash LSH band keys for near-duplicate probing",
+        ),
+    )
+    op.create_index(
+        "ix_memory_items_minhash_bands",
+        "memory_items",
+        ["minhash_bands"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memory_items_minhash_bands", table_name="memory_items")
+    op.drop_column("memory_items", "minhash_bands")
@@ -0,0 +1,88 @@
+"""Create memory_receipt_daily rollup for receipt analytics.
+
+One row per (memory_item_id, receipt_type, day) holding the number of
+receipts written that UTC day. PgReceiptStore upserts the rollup in the
+same transaction as the receipt insert, so windowed frequencies
+(promotion's frequency_30d, analytics) read O(days) rows instead of
+scanning memory_receipts. Existing receipts are backfilled once here.
+
+Revision ID: 008_memory_receipt_daily
+Revises: 007_memory_item_minhash
+Create Date: 2026-10-18
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "008_memory_receipt_daily"
+down_revision = "007_memory_item_minhash"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible; rollup is derived data
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+_UUID = postgresql.UUID(as_uuid=True)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_receipt_daily",
+        sa.Column(
+            "memory_item_id",
+            _UUID,
+            sa.ForeignKey("memory_items.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "receipt_type",
+            sa.String(32),
+            primary_key=True,
+            comment="injection | retrieval",
+        ),
+        sa.Column("day", sa.Date(), primary_key=True, comment="UTC day of created_at"),
+        sa.Column(
+            "org_id",
+            _UUID,
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+    op.create_index(
+        "ix_memory_receipt_daily_org_day",
+        "memory_receipt_daily",
+        ["org_id", "day"],
+    )
+
+    # Backfill from existing receipts (one GROUP BY pass)
+    op.execute("""
+        INSERT INTO memory_receipt_daily (memory_item_id, receipt_type, day, org_id, count)
+        SELECT memory_item_id, receipt_type, (created_at AT TIME ZONE 'UTC')::date,
+               org_id, count(*)
+        FROM memory_receipts
+        GROUP BY memory_item_id, receipt_type, (created_at AT TIME ZONE 'UTC')::date, org_id
+    """)
+
+    # RLS
+    op.execute("ALTER TABLE memory_receipt_daily ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE memory_receipt_daily FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY memory_receipt_daily_isolation ON memory_receipt_daily
+        USING (org_id = current_setting('app.current_org_id')::uuid)
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP POLICY IF EXISTS memory_receipt_daily_isolation ON memory_receipt_daily",
+    )
+    op.drop_index("ix_memory_receipt_daily_org_day", table_name="memory_receipt_daily")
+    op.drop_table("memory_receipt_daily")
@@ -0,0 +1,110 @@
+"""Create memory_promotion_proposals for the batch promotion scanner.
+
+Every memory the scanner evaluates gets exactly one row (unique
+source_memory_id): pending proposals awaiting approval as well as
+candidates rejected by sanitization or the knowledge conflict check.
+The scan skips memories that already have a row, so nightly runs only
+look at new candidates. Superseding a memory creates a new id, which is
+evaluated afresh.
+
+Revision ID: 009_memory_promotion_proposals
+Revises: 008_memory_receipt_daily
+Create Date: 2026-10-18
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "009_memory_promotion_proposals"
+down_revision = "008_memory_receipt_daily"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible via downgrade()
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+_UUID = postgresql.UUID(as_uuid=True)
+_NOW = sa.text("now()")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_promotion_proposals",
+        sa.Column("id", _UUID, primary_key=True),
+        sa.Column(
+            "org_id",
+            _UUID,
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("user_id", _UUID, nullable=False),
+        sa.Column(
+            "source_memory_id",
+            _UUID,
+            sa.ForeignKey("memory_items.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.String(32),
+            nullable=False,
+            comment="pending_approval | approved | rejected | sanitize_failed | expired",
+        ),
+        sa.Column("sanitized_content", sa.Text(), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("target_visibility", sa.String(16), nullable=False),
+        sa.Column("similar_knowledge_id", _UUID, nullable=True),
+        sa.Column("similarity_score", sa.Float(), nullable=True),
+        sa.Column("rejection_reason", sa.String(256), nullable=True),
+        sa.Column("approved_by", _UUID, nullable=True),
+        sa.Column("approved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("knowledge_id", _UUID, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=_NOW,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.create_index(
+        "uq_memory_promotion_proposals_source",
+        "memory_promotion_proposals",
+        ["source_memory_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_memory_promotion_proposals_org_status",
+        "memory_promotion_proposals",
+        ["org_id", "status", "user_id"],
+    )
+
+    # RLS
+    op.execute("ALTER TABLE memory_promotion_proposals ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE memory_promotion_proposals FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY memory_promotion_proposals_isolation ON memory_promotion_proposals
+        USING (org_id = current_setting('app.current_org_id')::uuid)
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP POLICY IF EXISTS memory_promotion_proposals_isolation ON memory_promotion_proposals",
+    )
+    op.drop_index(
+        "ix_memory_promotion_proposals_org_status",
+        table_name="memory_promotion_proposals",
+    )
+    op.drop_index(
+        "uq_memory_promotion_proposals_source",
+        table_name="memory_promotion_proposals",
+    )
+    op.drop_table("memory_promotion_proposals")
@@ -0,0 +1,80 @@
+"""Create memory_feedback for the persistent negative-feedback fuse.
+
+One row per memory that received negative feedback. negative_count is
+incremented atomically (INSERT ... ON CONFLICT DO UPDATE) and fused_at is
+set the first time the count reaches the fuse threshold, so every worker
+sees the same fused set. The partial index serves the per-user fused-ID
+scan used to build the retrieval Bloom filter.
+
+Revision ID: 010_memory_feedback
+Revises: 009_memory_promotion_proposals
+Create Date: 2026-10-18
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "010_memory_feedback"
+down_revision = "009_memory_promotion_proposals"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible via downgrade()
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+_UUID = postgresql.UUID(as_uuid=True)
+_NOW = sa.text("now()")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_feedback",
+        sa.Column(
+            "memory_item_id",
+            _UUID,
+            sa.ForeignKey("memory_items.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "org_id",
+            _UUID,
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("user_id", _UUID, nullable=False),
+        sa.Column("negative_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("fused_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=_NOW,
+        ),
+    )
+
+    op.create_index(
+        "ix_memory_feedback_user_fused",
+        "memory_feedback",
+        ["user_id"],
+        postgresql_where=sa.text("fused_at IS NOT NULL"),
+    )
+
+    # RLS
+    op.execute("ALTER TABLE memory_feedback ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE memory_feedback FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY memory_feedback_isolation ON memory_feedback
+        USING (org_id = current_setting('app.current_org_id')::uuid)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS memory_feedback_isolation ON memory_feedback")
+    op.drop_index("ix_memory_feedback_user_fused", table_name="memory_feedback")
+    op.drop_table("memory_feedback")
@@ -0,0 +1,222 @@
+"""Range-partition conversation_events by month on created_at.
+
+The table is rebuilt as a declaratively partitioned parent with one
+partition per calendar month (conversation_events_pYYYYMM). Existing rows
+are copied into partitions covering their months; partitions for the
+current and next two months are created up front, and a daily app task
+keeps creating them ahead (conversation_events_ensure_partition).
+A DEFAULT partition (conversation_events_default) catches rows for months
+without a partition, so appends never fail if upkeep falls behind;
+ensure_partition moves such rows into the month's partition when it is
+created.
+
+Retention becomes a partition drop (conversation_events_drop_partition)
+after the month has been archived to object storage, instead of
+row-by-row deletes.
+
+PostgreSQL requires unique constraints on a partitioned table to include
+the partition key, so the primary key becomes (id, created_at) and the
+per-session ordering constraint becomes (session_id, sequence_number,
+created_at). That constraint no longer stops two appends from taking the
+same sequence_number, so PgConversationEventStore.append_event assigns
+max + 1 under a per-session pg_advisory_xact_lock.
+
+Revision ID: 011_conversation_events_partitioning
+Revises: 010_memory_feedback
+Create Date: 2026-10-18
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "011_conversation_events_partitioning"
+down_revision = "010_memory_feedback"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible; months already dropped stay archived
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+_PREMAKE_MONTHS = 2
+
+_COPY_FROM_UNPARTITIONED = """
+    INSERT INTO conversation_events (
+        id, org_id, session_id, user_id, event_type, role, content,
+        content_schema_version, sequence_number, parent_event_id, metadata, created_at
+    )
+    SELECT id, org_id, session_id, user_id, event_type, role, content,
+           content_schema_version, sequence_number, parent_event_id, metadata, created_at
+    FROM conversation_events_unpartitioned
+"""
+
+_COPY_FROM_PARTITIONED = _COPY_FROM_UNPARTITIONED.replace(
+    "conversation_events_unpartitioned", "conversation_events_partitioned"
+)
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_conversation_events_org_id", "conversation_events", ["org_id"])
+    op.create_index("ix_conversation_events_session_id", "conversation_events", ["session_id"])
+    op.create_index("ix_conversation_events_user_id", "conversation_events", ["user_id"])
+    op.create_index("ix_conversation_events_created_at", "conversation_events", ["created_at"])
+
+
+def _enable_rls() -> None:
+    op.execute("ALTER TABLE conversation_events ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE conversation_events FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY conversation_events_isolation ON conversation_events
+        USING (org_id = current_setting('app.current_org_id')::uuid)
+    """)
+
+
+def upgrade() -> None:
+    # [CONFIRMED-DESTRUCTIVE] the old table and its indexes are dropped only
+    # after every row has been copied into the partitioned parent.
+    op.execute("ALTER TABLE conversation_events RENAME TO conversation_events_unpartitioned")
+    # Free the index names for the partitioned parent
+    for name in ("org_id", "session_id", "user_id", "session_seq", "created_at"):
+        op.execute(f"DROP INDEX IF EXISTS ix_conversation_events_{name}")
+
+    op.execute("""
+        CREATE TABLE conversation_events (
+            id uuid NOT NULL DEFAULT gen_random_uuid(),
+            org_id uuid NOT NULL REFERENCES organizations (id) ON DELETE CASCADE,
+            session_id uuid NOT NULL,
+            user_id uuid REFERENCES users (id) ON DELETE SET NULL,
+            event_type varchar(64) NOT NULL,
+            role varchar(32) NOT NULL DEFAULT 'user',
+            content jsonb NOT NULL DEFAULT '{}'::jsonb,
+            content_schema_version varchar(16) NOT NULL DEFAULT 'v3.6',
+            sequence_number integer NOT NULL,
+            parent_event_id uuid,
+            metadata jsonb NOT NULL DEFAULT '{}'::jsonb,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            CONSTRAINT pk_conversation_events PRIMARY KEY (id, created_at),
+            CONSTRAINT ix_conversation_events_session_seq
+                UNIQUE (session_id, sequence_number, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    op.execute("CREATE TABLE conversation_events_default PARTITION OF conversation_events DEFAULT")
+
+    # Partition maintenance helpers; identifiers are built server-side so
+    # callers only ever pass a date.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION conversation_events_ensure_partition(month date)
+        RETURNS boolean LANGUAGE plpgsql AS $$
+        DECLARE
+            lo timestamptz := date_trunc('month', month)::timestamp AT TIME ZONE 'UTC';
+            hi timestamptz := (date_trunc('month', month) + interval '1 month')::timestamp
+                              AT TIME ZONE 'UTC';
+            part text := 'conversation_events_p' || to_char(month, 'YYYYMM');
+        BEGIN
+            IF to_regclass(part) IS NOT NULL THEN
+                RETURN false;
+            END IF;
+            IF NOT EXISTS (
+                SELECT 1 FROM conversation_events_default
+                WHERE created_at >= lo AND created_at < hi
+            ) THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF conversation_events '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    part, lo, hi
+                );
+                RETURN true;
+            END IF;
+            -- Rows of this month landed in the default partition: move them
+            -- into a new table, then attach it (attaching re-checks default)
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE conversation_events INCLUDING DEFAULTS)', part
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM conversation_events_default '
+                'WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                lo, hi, part
+            );
+            EXECUTE format(
+                'ALTER TABLE conversation_events ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                part, lo, hi
+            );
+            RETURN true;
+        END $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION conversation_events_drop_partition(month date)
+        RETURNS boolean LANGUAGE plpgsql AS $$
+        DECLARE
+            part text := 'conversation_events_p' || to_char(month, 'YYYYMM');
+        BEGIN
+            IF to_regclass(part) IS NULL THEN
+                RETURN false;
+            END IF;
+            EXECUTE format('ALTER TABLE conversation_events DETACH PARTITION %I', part);
+            EXECUTE format('DROP TABLE %I', part);
+            RETURN true;
+        END $$
+    """)
+
+    op.execute(f"""
+        SELECT conversation_events_ensure_partition(m::date)
+        FROM generate_series(
+            date_trunc('month', LEAST(
+                COALESCE((SELECT min(created_at) FROM conversation_events_unpartitioned), now()),
+                now()
+            ) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{_PREMAKE_MONTHS} months',
+            interval '1 month'
+        ) AS m
+    """)  # noqa: S608 -- _PREMAKE_MONTHS is a module constant
+    op.execute(_COPY_FROM_UNPARTITIONED)
+    op.execute("DROP TABLE conversation_events_unpartitioned")
+
+    _create_indexes()
+    _enable_rls()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE conversation_events RENAME TO conversation_events_partitioned")
+    op.execute("ALTER TABLE conversation_events_partitioned DROP CONSTRAINT pk_conversation_events")
+    op.execute(
+        "ALTER TABLE conversation_events_partitioned "
+        "DROP CONSTRAINT ix_conversation_events_session_seq"
+    )
+    for name in ("org_id", "session_id", "user_id", "created_at"):
+        op.execute(f"DROP INDEX IF EXISTS ix_conversation_events_{name}")
+
+    op.execute("""
+        CREATE TABLE conversation_events (
+            id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+            org_id uuid NOT NULL REFERENCES organizations (id) ON DELETE CASCADE,
+            session_id uuid NOT NULL,
+            user_id uuid REFERENCES users (id) ON DELETE SET NULL,
+            event_type varchar(64) NOT NULL,
+            role varchar(32) NOT NULL DEFAULT 'user',
+            content jsonb NOT NULL DEFAULT '{}'::jsonb,
+            content_schema_version varchar(16) NOT NULL DEFAULT 'v3.6',
+            sequence_number integer NOT NULL,
+            parent_event_id uuid,
+            metadata jsonb NOT NULL DEFAULT '{}'::jsonb,
+            created_at timestamptz NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute(_COPY_FROM_PARTITIONED)
+    op.execute("DROP TABLE conversation_events_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS conversation_events_ensure_partition(date)")
+    op.execute("DROP FUNCTION IF EXISTS conversation_events_drop_partition(date)")
+
+    _create_indexes()
+    op.create_index(
+        "ix_conversation_events_session_seq",
+        "conversation_events",
+        ["session_id", "sequence_number"],
+        unique=True,
+    )
+    _enable_rls()
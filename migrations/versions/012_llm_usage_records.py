@@ -0,0 +1,88 @@
+"""Create llm_usage_records for persistent LLM token metering.
+
+One row per LLM call (prompt / completion tokens), written in batches by
+the usage tracker's write-behind flusher. Attribution columns (brand,
+provider, price, skill, task) match tool_usage_records (006) and are
+NULL when the caller does not know them. Together with
+tool_usage_records (006) it is the durable record behind the in-process
+running counters, which are re-seeded from both tables at startup.
+
+Revision ID: 012_llm_usage_records
+Revises: 011_conversation_events_partitioning
+Create Date: 2026-10-18
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "012_llm_usage_records"
+down_revision = "011_conversation_events_partitioning"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible via downgrade()
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+_UUID = postgresql.UUID(as_uuid=True)
+_NOW = sa.text("now()")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_usage_records",
+        sa.Column("id", _UUID, primary_key=True),
+        sa.Column(
+            "org_id",
+            _UUID,
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("user_id", _UUID, nullable=False),
+        sa.Column("brand_id", _UUID, nullable=True),
+        sa.Column("model_id", sa.Text(), nullable=False),
+        sa.Column("provider", sa.Text(), nullable=True),
+        sa.Column("input_tokens", sa.Integer(), nullable=False),
+        sa.Column("output_tokens", sa.Integer(), nullable=False),
+        sa.Column("total_tokens", sa.Integer(), nullable=False),
+        sa.Column("cost_amount", sa.Numeric(precision=12, scale=6), nullable=True),
+        sa.Column("skill_id", sa.Text(), nullable=True),
+        sa.Column("task_id", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=_NOW,
+        ),
+    )
+
+    op.create_index(
+        "ix_llm_usage_org_created",
+        "llm_usage_records",
+        ["org_id", "created_at"],
+    )
+    op.create_index(
+        "ix_llm_usage_user_created",
+        "llm_usage_records",
+        ["user_id", "created_at"],
+    )
+
+    # RLS
+    op.execute("ALTER TABLE llm_usage_records ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE llm_usage_records FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY llm_usage_records_isolation ON llm_usage_records
+        USING (org_id = current_setting('app.current_org_id')::uuid)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS llm_usage_records_isolation ON llm_usage_records")
+    op.drop_index("ix_llm_usage_user_created", table_name="llm_usage_records")
+    op.drop_index("ix_llm_usage_org_created", table_name="llm_usage_records")
+    op.drop_table("llm_usage_records")
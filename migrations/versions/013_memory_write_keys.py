@@ -0,0 +1,65 @@
+"""Create memory_write_keys for idempotent batch memory writes.
+
+One row per (source session, user, memory_type, content) that a batch
+write has applied. PgMemoryCoreAdapter.write_many claims the keys with
+INSERT ... ON CONFLICT DO NOTHING RETURNING in the same transaction as
+the memory rows, and applies only what it claimed. A replayed batch,
+which may have reinforced a near-duplicate rather than inserting its own
+row, is therefore not applied a second time.
+
+Revision ID: 013_memory_write_keys
+Revises: 012_llm_usage_records
+Create Date: 2026-10-19
+
+Rollback: alembic downgrade -1
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "013_memory_write_keys"
+down_revision = "012_llm_usage_records"
+branch_labels = None
+depends_on = None
+
+reversible_type = "full"  # DDL fully reversible via downgrade()
+rollback_artifact = "alembic downgrade -1"
+drill_evidence_id = "pending"  # to be filled after upgrade->downgrade->upgrade drill
+
+_UUID = postgresql.UUID(as_uuid=True)
+_NOW = sa.text("now()")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_write_keys",
+        sa.Column("write_key", _UUID, primary_key=True),
+        sa.Column(
+            "org_id",
+            _UUID,
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "applied_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=_NOW,
+        ),
+    )
+
+    # RLS
+    op.execute("ALTER TABLE memory_write_keys ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE memory_write_keys FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY memory_write_keys_isolation ON memory_write_keys
+        USING (org_id = current_setting('app.current_org_id')::uuid)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP POLICY IF EXISTS memory_write_keys_isolation ON memory_write_keys")
+    op.drop_table("memory_write_keys")
@@ -22,6 +22,13 @@ _DEFAULT_KNOWLEDGE_RATIO = 0.30
 _DEFAULT_HISTORY_RATIO = 0.30
 
 
+def _unmet(need: int | None, allocated: int, surplus: int) -> int:
+    """Share of surplus a component can use (all of it when need is unknown)."""
+    if need is None:
+        return surplus
+    return min(surplus, max(0, need - allocated))
+
+
 @dataclass(frozen=True)
 class TokenBudget:
     """Allocated token budget for a single context assembly."""
@@ -112,19 +119,20 @@ class BudgetAllocator:
             surplus += hist_alloc - history_token_count
             hist_alloc = history_token_count
 
-        # Redistribute surplus: prefer knowledge > memories > history
+        # Redistribute surplus: prefer knowledge > memories > history, where
+        # memories/history take it only up to their unmet need (unknown = all)
         if surplus > 0:
             if knowledge_available and know_alloc > 0:
                 know_alloc += surplus
                 surplus = 0
-            elif memory_token_count is None:
-                mem_alloc += surplus
-                surplus = 0
-            elif history_token_count is None:
-                hist_alloc += surplus
-                surplus = 0
             else:
-                # All capped — give to response_reserve
+                mem_extra = _unmet(memory_token_count, mem_alloc, surplus)
+                mem_alloc += mem_extra
+                surplus -= mem_extra
+                hist_extra = _unmet(history_token_count, hist_alloc, surplus)
+                hist_alloc += hist_extra
+                surplus -= hist_extra
+                # Whatever no component needs goes to response_reserve
                 response_reserve += surplus
                 surplus = 0
 
@@ -0,0 +1,228 @@
+"""Prompt context compaction.
+
+Task card: B4-3 (context compaction)
+- Memories and knowledge snippets that near-duplicate another snippet are
+  dropped: MinHash band keys find candidates, shingle Jaccard verifies them
+- Sentences repeated across snippets (the same fact restated by several
+  memories / knowledge chunks) are kept only at their first occurrence
+- Snippets are compacted in stable order (oldest memory, lowest knowledge
+  id first), so which copy survives depends on the retrieved set, not on
+  its rank order; results keep rank order for budgeting
+- stable_order() gives rendered memories and knowledge a deterministic
+  order, so consecutive prompts share a byte-identical prefix that
+  provider prompt caches can match
+- History is never rewritten. Compacting the system prompt against it
+  (dedup_against_history) saves more tokens but changes the prompt
+  prefix whenever the history window slides, so it is off by default
+
+Fingerprints (band keys, normalized sentences) are memoized per content,
+so history turns and memories that recur every turn are hashed once.
+
+Architecture: Section 2.2 (Context Assembly Pipeline)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from src.brain.context.truncation import split_sentences
+from src.shared.similarity import (
+    band_keys,
+    content_similarity,
+    minhash_signature,
+    normalize_content,
+)
+
+if TYPE_CHECKING:
+    from src.shared.types import MemoryItem
+
+
+@dataclass(frozen=True)
+class CompactionPolicy:
+    """Near-duplicate threshold and sentence collapsing limits."""
+
+    similarity_threshold: float = 0.8
+    min_sentence_chars: int = 12  # shorter sentences ("Yes.", "OK.") never collapse
+    cache_size: int = 8192  # memoized content fingerprints
+    dedup_against_history: bool = False  # trades prefix-cache hits for tokens
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.similarity_threshold <= 1.0:
+            msg = f"similarity_threshold must be in (0, 1], got {self.similarity_threshold}"
+            raise ValueError(msg)
+
+
+@dataclass
+class CompactionReport:
+    """What compaction removed from one assembly."""
+
+    snippets_in: int = 0
+    near_duplicates: int = 0  # snippets dropped as near-duplicates
+    emptied: int = 0  # snippets dropped after all their sentences collapsed
+    sentences_collapsed: int = 0
+    chars_in: int = 0
+    chars_out: int = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of memory/knowledge characters removed."""
+        if self.chars_in == 0:
+            return 0.0
+        return 1 - self.chars_out / self.chars_in
+
+
+@dataclass(frozen=True)
+class CompactedContext:
+    """Memories and knowledge after compaction (rank order preserved)."""
+
+    memories: list[MemoryItem] = field(default_factory=list)
+    knowledge: list[dict[str, Any]] = field(default_factory=list)
+    report: CompactionReport = field(default_factory=CompactionReport)
+
+
+def _memory_key(memory: MemoryItem) -> tuple[Any, str]:
+    return (memory.valid_at, str(memory.memory_id))
+
+
+def _knowledge_key(item: dict[str, Any]) -> tuple[str, str]:
+    return (str(item.get("id") or item.get("graph_node_id") or ""), str(item.get("content", "")))
+
+
+@dataclass(frozen=True)
+class _Fingerprint:
+    bands: tuple[int, ...]
+    sentences: tuple[tuple[str, str], ...]  # (original piece, normalized key)
+
+
+class ContextCompactor:
+    """Removes cross-source redundancy from assembled context.
+
+    Args:
+        policy: Thresholds; defaults to CompactionPolicy().
+    """
+
+    def __init__(self, policy: CompactionPolicy | None = None) -> None:
+        self._policy = policy or CompactionPolicy()
+        self._fingerprints: OrderedDict[bytes, _Fingerprint] = OrderedDict()
+
+    def compact(
+        self,
+        *,
+        memories: list[MemoryItem],
+        knowledge: list[dict[str, Any]],
+        history: list[dict[str, Any]],
+    ) -> CompactedContext:
+        """Drop redundant memories / knowledge, keeping rank order."""
+        report = CompactionReport()
+        kept_texts: list[str] = []
+        buckets: dict[int, list[int]] = {}
+        seen_sentences: set[str] = set()
+
+        def index(text: str, fingerprint: _Fingerprint) -> None:
+            kept_texts.append(text)
+            for key in fingerprint.bands:
+                buckets.setdefault(key, []).append(len(kept_texts) - 1)
+            seen_sentences.update(k for _, k in fingerprint.sentences if k)
+
+        if self._policy.dedup_against_history:
+            for message in history:
+                said = str(message.get("content", ""))
+                if said:
+                    index(said, self._fingerprint(said))
+
+        def compact_text(text: str) -> str | None:
+            """Compacted text, or None when the snippet should be dropped."""
+            report.snippets_in += 1
+            report.chars_in += len(text)
+            fingerprint = self._fingerprint(text)
+            if self._near_duplicate(text, fingerprint, kept_texts, buckets):
+                report.near_duplicates += 1
+                return None
+            pieces = [piece for piece, key in fingerprint.sentences if key not in seen_sentences]
+            report.sentences_collapsed += len(fingerprint.sentences) - len(pieces)
+            compacted = (
+                "".join(pieces).strip() if len(pieces) < len(fingerprint.sentences) else text
+            )
+            if not compacted:
+                report.emptied += 1
+                return None
+            index(text, fingerprint)
+            report.chars_out += len(compacted)
+            return compacted
+
+        memory_texts: dict[int, str | None] = {}
+        for i in sorted(range(len(memories)), key=lambda i: _memory_key(memories[i])):
+            memory_texts[i] = compact_text(memories[i].content)
+        knowledge_texts: dict[int, str | None] = {}
+        for i in sorted(range(len(knowledge)), key=lambda i: _knowledge_key(knowledge[i])):
+            knowledge_texts[i] = compact_text(str(knowledge[i].get("content", "")))
+
+        kept_memories: list[MemoryItem] = []
+        for i, memory in enumerate(memories):
+            compacted = memory_texts[i]
+            if compacted is not None:
+                kept_memories.append(
+                    memory if compacted == memory.content else replace(memory, content=compacted)
+                )
+        kept_knowledge: list[dict[str, Any]] = []
+        for i, item in enumerate(knowledge):
+            compacted = knowledge_texts[i]
+            if compacted is not None:
+                kept_knowledge.append(
+                    item if compacted == item.get("content") else {**item, "content": compacted}
+                )
+
+        return CompactedContext(memories=kept_memories, knowledge=kept_knowledge, report=report)
+
+    def stable_order(
+        self,
+        memories: list[MemoryItem],
+        knowledge: list[dict[str, Any]],
+    ) -> tuple[list[MemoryItem], list[dict[str, Any]]]:
+        """Deterministic render order for a cache-friendly prompt prefix.
+
+        Memories oldest first (new ones append at the end instead of
+        shifting everything after them); knowledge by its id, then content.
+        """
+        return sorted(memories, key=_memory_key), sorted(knowledge, key=_knowledge_key)
+
+    def _near_duplicate(
+        self,
+        text: str,
+        fingerprint: _Fingerprint,
+        kept_texts: list[str],
+        buckets: dict[int, list[int]],
+    ) -> bool:
+        checked: set[int] = set()
+        for key in fingerprint.bands:
+            for position in buckets.get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                similarity = content_similarity(text, kept_texts[position])
+                if similarity >= self._policy.similarity_threshold:
+                    return True
+        return False
+
+    def _fingerprint(self, text: str) -> _Fingerprint:
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._fingerprints.get(key)
+        if cached is not None:
+            self._fingerprints.move_to_end(key)
+            return cached
+        sentences = []
+        for piece in split_sentences(text):
+            normalized = normalize_content(piece)
+            collapsible = len(normalized) >= self._policy.min_sentence_chars
+            sentences.append((piece, normalized if collapsible else ""))
+        fingerprint = _Fingerprint(
+            bands=tuple(band_keys(minhash_signature(text))),
+            sentences=tuple(sentences),
+        )
+        self._fingerprints[key] = fingerprint
+        if len(self._fingerprints) > self._policy.cache_size:
+            self._fingerprints.popitem(last=False)
+        return fingerprint
@@ -4,6 +4,10 @@ Task card: B4-3
 - When assembled context exceeds the token budget, truncate by priority
 - Priority order: SYSTEM > MEMORY > KNOWLEDGE > HISTORY
 - Higher-priority blocks are fully preserved before lower ones are trimmed
+- With a token counter, content is actually cut to its allocation at a
+  sentence boundary (word boundary if no sentence fits)
+- ContextFitter fits memories, knowledge and history into the
+  BudgetAllocator split by counted tokens
 
 Architecture: Section 2.2 (Context Assembly Pipeline)
 """
@@ -11,7 +15,77 @@ Architecture: Section 2.2 (Context Assembly Pipeline)
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from src.brain.budget.allocator import BudgetAllocator, TokenBudget
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Sentence ends: Latin and CJK terminators (full stop, ! ? ; ellipsis), closing
+# quotes/brackets, or a line break; clause ends: commas, enumeration comma, colons
+_SENTENCE_END = re.compile(
+    r"[.!?;\u3002\uff01\uff1f\uff1b\u2026]+[\"')\]\u300d\u300f]*(?=\s|$)"
+    r"|[\u3002\uff01\uff1f\uff1b]+|\n+"
+)
+_CLAUSE_END = re.compile(r"[,:\uff0c\u3001\uff1a]+")
+_WORD_END = re.compile(r"\S(?=\s)")
+
+# Per-item prompt framing ("- ", role prefix, separators)
+_ITEM_OVERHEAD_TOKENS = 3
+# Below this, a trimmed fragment is dropped rather than included
+_MIN_FRAGMENT_TOKENS = 16
+
+
+def _longest_fitting(
+    text: str, cuts: list[int], max_tokens: int, count: Callable[[str], int]
+) -> str:
+    """Longest text[:cut] within max_tokens (binary search over cut points)."""
+    best = ""
+    lo, hi = 0, len(cuts) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        candidate = text[: cuts[mid]].rstrip()
+        if count(candidate) <= max_tokens:
+            best = candidate
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return best
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text after each sentence end; "".join(result) == text."""
+    pieces: list[str] = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        if match.end() > start:
+            pieces.append(text[start : match.end()])
+            start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+def trim_to_tokens(text: str, max_tokens: int, count: Callable[[str], int]) -> str:
+    """Cut text to at most max_tokens, preferring sentence boundaries.
+
+    Keeps the leading sentences that fit; if even the first sentence is too
+    long, falls back to clauses, then words, then characters (unspaced
+    scripts).
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    if count(text) <= max_tokens:
+        return text
+    for pattern in (_SENTENCE_END, _CLAUSE_END, _WORD_END):
+        cuts = [m.end() for m in pattern.finditer(text)]
+        trimmed = _longest_fitting(text, cuts, max_tokens, count)
+        if trimmed:
+            return trimmed
+    return _longest_fitting(text, list(range(1, len(text) + 1)), max_tokens, count)
 
 
 class Priority(enum.IntEnum):
@@ -37,10 +111,14 @@ class FixedPriorityPolicy:
     """Truncate context blocks by fixed priority order.
 
     Strategy: sort blocks by priority descending, greedily allocate budget.
-    Blocks that don't fit get their token_count reduced (content is logically
-    truncated to fit). Original input order is preserved in the output.
+    Blocks that don't fit get their token_count reduced; with a counter the
+    content is cut to the allocation as well (otherwise it is logically
+    truncated only). Original input order is preserved in the output.
     """
 
+    def __init__(self, counter: Callable[[str], int] | None = None) -> None:
+        self._counter = counter
+
     def truncate(
         self,
         blocks: list[ContextBlock],
@@ -67,12 +145,118 @@ class FixedPriorityPolicy:
             remaining -= give
 
         # Return in original order with adjusted token_count
-        return [
-            ContextBlock(
-                name=b.name,
-                content=b.content,
-                token_count=allocation[b.name],
-                priority=b.priority,
+        result: list[ContextBlock] = []
+        for b in blocks:
+            content, tokens = b.content, allocation[b.name]
+            if self._counter is not None and tokens < b.token_count:
+                content = trim_to_tokens(b.content, tokens, self._counter)
+                tokens = self._counter(content)
+            result.append(
+                ContextBlock(name=b.name, content=content, token_count=tokens, priority=b.priority)
             )
-            for b in blocks
-        ]
+        return result
+
+
+@dataclass(frozen=True)
+class FittedContext:
+    """Context components cut to their token budgets.
+
+    memories / knowledge keep the input order and are a prefix of the
+    input (the last kept item may be trimmed); history keeps the newest
+    messages (the oldest kept one may be trimmed).
+    """
+
+    budget: TokenBudget
+    memories: list[str] = field(default_factory=list)
+    knowledge: list[str] = field(default_factory=list)
+    history: list[dict[str, Any]] = field(default_factory=list)
+    tokens: dict[str, int] = field(default_factory=dict)  # used per component
+
+
+class ContextFitter:
+    """Fit memories, knowledge and history into the BudgetAllocator split.
+
+    Component sizes are counted with the token counter; the allocator
+    splits the window (redistributing what short components leave), then
+    each component is filled in rank order and its last item trimmed at a
+    sentence boundary. Budget left over by memories and knowledge goes to
+    history.
+
+    Args:
+        counter: Token counter (e.g. src.shared.tokens.TokenCounter).
+        allocator: Window split; defaults to BudgetAllocator().
+    """
+
+    def __init__(
+        self,
+        counter: Callable[[str], int],
+        allocator: BudgetAllocator | None = None,
+    ) -> None:
+        self._count = counter
+        self._allocator = allocator or BudgetAllocator()
+
+    @property
+    def counter(self) -> Callable[[str], int]:
+        return self._count
+
+    def fit(
+        self,
+        *,
+        memories: list[str],
+        knowledge: list[str],
+        history: list[dict[str, Any]],
+    ) -> FittedContext:
+        """Cut each component to its allocation."""
+        history_texts = [str(m.get("content", "")) for m in history]
+        budget = self._allocator.allocate(
+            history_token_count=self._total(history_texts),
+            memory_token_count=self._total(memories),
+            knowledge_available=bool(knowledge),
+        )
+
+        fitted_memories, memory_tokens = self._fill(memories, budget.memories)
+        fitted_knowledge, knowledge_tokens = self._fill(knowledge, budget.knowledge)
+        history_budget = (
+            budget.history
+            + (budget.memories - memory_tokens)
+            + (budget.knowledge - knowledge_tokens)
+        )
+        newest_first, history_tokens = self._fill(history_texts[::-1], history_budget)
+        kept = len(newest_first)
+        fitted_history = [dict(m) for m in history[len(history) - kept :]] if kept else []
+        if kept:
+            fitted_history[0]["content"] = newest_first[-1]
+
+        return FittedContext(
+            budget=budget,
+            memories=fitted_memories,
+            knowledge=fitted_knowledge,
+            history=fitted_history,
+            tokens={
+                "memories": memory_tokens,
+                "knowledge": knowledge_tokens,
+                "history": history_tokens,
+            },
+        )
+
+    def _total(self, texts: list[str]) -> int:
+        return sum(self._count(t) + _ITEM_OVERHEAD_TOKENS for t in texts)
+
+    def _fill(self, texts: list[str], max_tokens: int) -> tuple[list[str], int]:
+        """Leading texts within max_tokens; the first that overflows is trimmed."""
+        kept: list[str] = []
+        used = 0
+        for text in texts:
+            cost = self._count(text) + _ITEM_OVERHEAD_TOKENS
+            if used + cost <= max_tokens:
+                kept.append(text)
+                used += cost
+                continue
+            room = max_tokens - used - _ITEM_OVERHEAD_TOKENS
+            if room >= _MIN_FRAGMENT_TOKENS:
+                fragment = trim_to_tokens(text, room, self._count)
+                if fragment:
+                    kept.append(fragment)
+                    used += self._count(fragment) + _ITEM_OVERHEAD_TOKENS
+            break
+        return kept, used
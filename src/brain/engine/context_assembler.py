@@ -6,6 +6,17 @@ Task cards: B2-3 (v1), B2-4 (CE enhanced with RRF), B2-7 (graceful degradation)
 - Assembles into assembled_context for LLM
 - CE enhancement: Query Rewriting + Hybrid Retrieval (FTS+pgvector+RRF)
 - B4-1: Memory + Knowledge queries run in parallel via asyncio.gather
+- B4-1: Session prefetch: results warmed by SessionPrefetcher (WS open /
+  typing) are consumed instead of re-queried
+- B3-4: Fused memories (repeated negative feedback) are dropped before
+  injection via PersistentFeedbackFuse
+- B4-2: With a ContextFitter, memories, knowledge and history are cut to
+  the BudgetAllocator split by counted tokens instead of fixed item counts
+- B4-3: With a ContextCompactor, memories / knowledge redundant with
+  each other are dropped before fitting, and the system prompt renders
+  them in a stable order (cache-friendly prefix)
+- B4-4: The persona and the rendered memories / knowledge are also kept
+  apart (persona, context_prompt) for structured, cacheable prompts
 
 Architecture: Section 2.2 (Context Assembly Pipeline)
              ADR-022 (Privacy boundary: Knowledge cannot access MemoryCore)
@@ -15,12 +26,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from src.brain.budget.allocator import TokenBudget
+    from src.brain.context.compaction import CompactionReport, ContextCompactor
+    from src.brain.context.truncation import ContextFitter
+    from src.brain.engine.prefetch import SessionPrefetcher
+    from src.brain.memory.feedback import PersistentFeedbackFuse
     from src.brain.metrics.sli import BrainSLI
     from src.memory.receipt import ReceiptStoreProtocol
     from src.ports.knowledge_port import KnowledgePort
@@ -29,6 +45,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PERSONA = "You are a helpful assistant."
+
 
 @dataclass(frozen=True)
 class AssembledContext:
@@ -41,9 +59,13 @@ class AssembledContext:
     personal_memories: list[MemoryItem] = field(default_factory=list)
     knowledge_bundle: KnowledgeBundle | None = None
     conversation_history: list[dict[str, Any]] = field(default_factory=list)
-    system_prompt: str = ""
+    system_prompt: str = ""  # persona + context_prompt
+    persona: str = ""
+    context_prompt: str = ""  # rendered memories and knowledge
     degraded: bool = False
     degraded_reason: str = ""
+    token_budget: TokenBudget | None = None  # set when fitted to a token budget
+    compaction: CompactionReport | None = None  # set when compacted
 
     def to_prompt_context(self) -> str:
         """Convert assembled context to a text block for LLM system prompt."""
@@ -82,11 +104,19 @@ class ContextAssembler:
         knowledge: KnowledgePort | None = None,
         receipt_store: ReceiptStoreProtocol | None = None,
         sli: BrainSLI | None = None,
+        feedback_fuse: PersistentFeedbackFuse | None = None,
+        prefetcher: SessionPrefetcher | None = None,
+        context_fitter: ContextFitter | None = None,
+        compactor: ContextCompactor | None = None,
     ) -> None:
         self._memory_core = memory_core
         self._knowledge = knowledge
         self._receipt_store = receipt_store
         self._sli = sli
+        self._feedback_fuse = feedback_fuse
+        self._prefetcher = prefetcher
+        self._context_fitter = context_fitter
+        self._compactor = compactor
 
     async def assemble(
         self,
@@ -96,6 +126,7 @@ class ContextAssembler:
         org_context: OrganizationContext | None = None,
         conversation_history: list[dict[str, Any]] | None = None,
         top_k_memories: int = 10,
+        session_id: UUID | None = None,
     ) -> AssembledContext:
         """Assemble context for an LLM call.
 
@@ -113,8 +144,10 @@ class ContextAssembler:
         with timer_ctx:
             # Step 1: Parallel retrieval — Memory (hard) + Knowledge (soft)
             personal_memories, knowledge_result = await asyncio.gather(
-                self._fetch_memories(user_id=user_id, query=query, top_k=top_k_memories),
-                self._fetch_knowledge(query=query, org_context=org_context),
+                self._fetch_memories(
+                    user_id=user_id, query=query, top_k=top_k_memories, session_id=session_id
+                ),
+                self._fetch_knowledge(query=query, org_context=org_context, session_id=session_id),
             )
 
             # Step 1b: Record retrieval receipts (non-blocking)
@@ -133,21 +166,75 @@ class ContextAssembler:
 
             # Step 2: Unpack knowledge result
             knowledge_bundle, degraded, degraded_reason = knowledge_result
+            history = conversation_history or []
+
+            # Step 2b: Drop redundant snippets, then cut components to budgets
+            compaction: CompactionReport | None = None
+            if self._compactor is not None:
+                compacted = self._compactor.compact(
+                    memories=personal_memories,
+                    knowledge=knowledge_bundle.semantic_contents if knowledge_bundle else [],
+                    history=history,
+                )
+                personal_memories, compaction = compacted.memories, compacted.report
+                if knowledge_bundle is not None:
+                    knowledge_bundle = replace(
+                        knowledge_bundle, semantic_contents=compacted.knowledge
+                    )
+
+            token_budget: TokenBudget | None = None
+            if self._context_fitter is not None:
+                personal_memories, knowledge_bundle, history, token_budget = self._fit(
+                    personal_memories, knowledge_bundle, history
+                )
 
             # Step 3: Build system prompt
-            system_prompt = self._build_system_prompt(
+            context_prompt = self._render_context(
                 personal_memories=personal_memories,
                 knowledge_bundle=knowledge_bundle,
+                fitted=token_budget is not None,
             )
 
             return AssembledContext(
                 personal_memories=personal_memories,
                 knowledge_bundle=knowledge_bundle,
-                conversation_history=conversation_history or [],
-                system_prompt=system_prompt,
+                conversation_history=history,
+                system_prompt="\n\n".join(p for p in (PERSONA, context_prompt) if p),
+                persona=PERSONA,
+                context_prompt=context_prompt,
                 degraded=degraded,
                 degraded_reason=degraded_reason,
+                token_budget=token_budget,
+                compaction=compaction,
+            )
+
+    def _fit(
+        self,
+        memories: list[MemoryItem],
+        bundle: KnowledgeBundle | None,
+        history: list[dict[str, Any]],
+    ) -> tuple[list[MemoryItem], KnowledgeBundle | None, list[dict[str, Any]], TokenBudget]:
+        """Apply the ContextFitter; kept items are a ranked prefix, last one trimmed."""
+        assert self._context_fitter is not None
+        semantic = bundle.semantic_contents if bundle else []
+        fitted = self._context_fitter.fit(
+            memories=[m.content for m in memories],
+            knowledge=[str(item.get("content", "")) for item in semantic],
+            history=history,
+        )
+        memories = [
+            m if m.content == text else replace(m, content=text)
+            for m, text in zip(memories, fitted.memories, strict=False)
+        ]
+        if bundle is not None:
+            bundle = replace(
+                bundle,
+                semantic_contents=[
+                    item if item.get("content") == text else {**item, "content": text}
+                    for item, text in zip(semantic, fitted.knowledge, strict=False)
+                ],
             )
+        return memories, bundle, fitted.history, fitted.budget
 
     async def _fetch_memories(
         self,
@@ -155,19 +242,30 @@ class ContextAssembler:
         user_id: UUID,
         query: str,
         top_k: int,
+        session_id: UUID | None = None,
     ) -> list[MemoryItem]:
-        """Fetch personal memories from MemoryCorePort."""
-        return await self._memory_core.read_personal_memories(
-            user_id=user_id,
-            query=query,
-            top_k=top_k,
-        )
+        """Fetch personal memories from MemoryCorePort, minus fused ones."""
+        memories: list[MemoryItem] | None = None
+        if self._prefetcher is not None and session_id is not None:
+            memories = await self._prefetcher.memories(
+                session_id, user_id=user_id, query=query, top_k=top_k
+            )
+        if memories is None:
+            memories = await self._memory_core.read_personal_memories(
+                user_id=user_id,
+                query=query,
+                top_k=top_k,
+            )
+        if self._feedback_fuse is not None:
+            memories = await self._feedback_fuse.filter_fused(user_id, memories)
+        return memories
 
     async def _fetch_knowledge(
         self,
         *,
         query: str,
         org_context: OrganizationContext | None,
+        session_id: UUID | None = None,
     ) -> tuple[KnowledgeBundle | None, bool, str]:
         """Fetch knowledge from KnowledgePort with graceful degradation.
 
@@ -178,6 +276,11 @@ class ContextAssembler:
         if org_context is None:
             return None, True, "No org context provided"
 
+        if self._prefetcher is not None and session_id is not None:
+            prefetched = await self._prefetcher.knowledge(session_id, org_id=org_context.org_id)
+            if prefetched is not None:
+                return prefetched, False, ""
+
         try:
             bundle = await self._knowledge.resolve(
                 profile_id="default",
@@ -200,6 +303,7 @@ class ContextAssembler:
         org_context: OrganizationContext | None = None,
         conversation_history: list[dict[str, Any]] | None = None,
         top_k_memories: int = 10,
+        session_id: UUID | None = None,
     ) -> AssembledContext:
         """CE-enhanced assembly with query rewriting and RRF.
 
@@ -214,6 +318,7 @@ class ContextAssembler:
             org_context=org_context,
             conversation_history=conversation_history,
             top_k_memories=top_k_memories,
+            session_id=session_id,
         )
 
     def _rewrite_query(
@@ -269,22 +374,32 @@ class ContextAssembler:
                     exc_info=True,
                 )
 
-    def _build_system_prompt(
+    def _render_context(
         self,
         personal_memories: list[MemoryItem],
         knowledge_bundle: KnowledgeBundle | None,
+        *,
+        fitted: bool = False,
     ) -> str:
-        """Build a system prompt from context components."""
-        parts: list[str] = ["You are a helpful assistant."]
+        """Render memories and knowledge for the system prompt.
 
-        if personal_memories:
-            memory_context = "\n".join(f"- {m.content}" for m in personal_memories[:5])
+        Unfitted context is capped at 5 memories / 3 knowledge items;
+        fitted context is already within its token budget. With a
+        compactor, the selected items are rendered in stable order.
+        """
+        parts: list[str] = []
+        max_memories, max_knowledge = (None, None) if fitted else (5, 3)
+        memories = personal_memories[:max_memories]
+        knowledge = knowledge_bundle.semantic_contents[:max_knowledge] if knowledge_bundle else []
+        if self._compactor is not None:
+            memories, knowledge = self._compactor.stable_order(memories, knowledge)
+
+        if memories:
+            memory_context = "\n".join(f"- {m.content}" for m in memories)
             parts.append(f"About the user:\n{memory_context}")
 
-        if knowledge_bundle and knowledge_bundle.semantic_contents:
-            kb_context = "\n".join(
-                f"- {item.get('content', '')}" for item in knowledge_bundle.semantic_contents[:3]
-            )
+        if knowledge:
+            kb_context = "\n".join(f"- {item.get('content', '')}" for item in knowledge)
             parts.append(f"Relevant knowledge:\n{kb_context}")
 
         return "\n\n".join(parts)
@@ -16,10 +16,23 @@ from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID, uuid4
 
 from src.brain.engine.context_assembler import AssembledContext, ContextAssembler
+from src.brain.engine.prefetch import PrefetchPolicy, SessionPrefetcher
+from src.brain.engine.prompt_builder import PromptBuilder, PromptCacheStats
+from src.brain.engine.summarizer import (
+    SUMMARY_EVENT_TYPE,
+    RollingSummarizer,
+    SessionSummary,
+    SummaryPolicy,
+    estimate_tokens,
+)
+from src.shared.org_scope import org_scope
 from src.shared.types import OrganizationContext
 
 if TYPE_CHECKING:
+    from src.brain.context.compaction import ContextCompactor
+    from src.brain.context.truncation import ContextFitter
     from src.brain.intent.classifier import IntentClassifier
+    from src.brain.memory.feedback import PersistentFeedbackFuse
     from src.brain.memory.pipeline import MemoryWritePipeline
     from src.brain.skill.orchestrator import SkillOrchestrator
     from src.memory.receipt import ReceiptStoreProtocol
@@ -59,6 +72,7 @@ class UsageRecorder(Protocol):
         model_id: str,
         input_tokens: int,
         output_tokens: int,
+        brand_id: UUID | None = None,
     ) -> Any: ...
 
 
@@ -146,6 +160,12 @@ class ConversationEngine:
         event_store: EventStoreProtocol | None = None,
         receipt_store: ReceiptStoreProtocol | None = None,
         skill_orchestrator: SkillOrchestrator | None = None,
+        feedback_fuse: PersistentFeedbackFuse | None = None,
+        prefetch_policy: PrefetchPolicy | None = None,
+        summary_policy: SummaryPolicy | None = None,
+        context_fitter: ContextFitter | None = None,
+        context_compactor: ContextCompactor | None = None,
+        prompt_builder: PromptBuilder | None = None,
         default_model: str = "gpt-4o",
     ) -> None:
         self._llm = llm
@@ -157,12 +177,85 @@ class ConversationEngine:
         self._event_store = event_store
         self._skill_orchestrator = skill_orchestrator
         self._default_model = default_model
+        self._prompt_builder = prompt_builder
+        self._prompt_cache_stats = PromptCacheStats()
+        # Rolling summary needs somewhere to persist summary events
+        self._summarizer = (
+            RollingSummarizer(
+                llm=llm,
+                event_store=event_store,
+                policy=summary_policy,
+                model_id=default_model,
+                count_tokens=context_fitter.counter if context_fitter else estimate_tokens,
+                usage_tracker=usage_tracker,
+            )
+            if summary_policy is not None and event_store is not None
+            else None
+        )
+        self._prefetcher = (
+            SessionPrefetcher(
+                memory_core=memory_core,
+                knowledge=knowledge,
+                history_loader=self._load_session_history,
+                policy=prefetch_policy,
+            )
+            if prefetch_policy is not None
+            else None
+        )
         self._context_assembler = ContextAssembler(
             memory_core=memory_core,
             knowledge=knowledge,
             receipt_store=receipt_store,
+            feedback_fuse=feedback_fuse,
+            prefetcher=self._prefetcher,
+            context_fitter=context_fitter,
+            compactor=context_compactor,
+        )
+
+    @property
+    def summarizer(self) -> RollingSummarizer | None:
+        """Rolling session summarizer (None when summarization is disabled)."""
+        return self._summarizer
+
+    @property
+    def prompt_cache_stats(self) -> PromptCacheStats:
+        """Provider-reported prompt-cache hits across this engine's LLM calls."""
+        return self._prompt_cache_stats
+
+    @property
+    def prefetcher(self) -> SessionPrefetcher | None:
+        """Session prefetcher (None when prefetch is disabled)."""
+        return self._prefetcher
+
+    def prefetch_session(
+        self,
+        session_id: UUID,
+        *,
+        user_id: UUID,
+        org_id: UUID,
+        org_context: OrganizationContext | None = None,
+        draft: str = "",
+    ) -> None:
+        """Speculatively warm history, memories and knowledge for a session.
+
+        Called on WS open/resume and typing/draft events; returns at once.
+        Memories are warmed only from a draft (see SessionPrefetcher.warm).
+        No-op when prefetch is disabled.
+        """
+        if self._prefetcher is None:
+            return
+        self._prefetcher.warm(
+            session_id,
+            user_id=user_id,
+            org_context=org_context or _default_org_context(org_id, user_id),
+            draft=draft,
         )
 
+    def end_session(self, session_id: UUID) -> None:
+        """Drop prefetched state for a closed session."""
+        if self._prefetcher is not None:
+            self._prefetcher.discard(session_id)
+
     async def process_message(
         self,
         *,
@@ -192,14 +285,18 @@ class ConversationEngine:
         skill_response_text: str | None = None
         resolved_model = model_id or self._default_model
 
+        tier = org_context.org_tier if org_context else None
+
         if intent_type != "chat" and self._skill_orchestrator:
             try:
-                orch_result = await self._skill_orchestrator.orchestrate(
-                    intent_type=intent_type,
-                    org_context=org_context or _default_org_context(org_id, user_id),
-                    user_message=message,
-                    matched_skill_hint=matched_skill_hint,
-                )
+                # Skills' tool calls are billed to this org and user
+                with org_scope(org_id, tier, user_id=user_id):
+                    orch_result = await self._skill_orchestrator.orchestrate(
+                        intent_type=intent_type,
+                        org_context=org_context or _default_org_context(org_id, user_id),
+                        user_message=message,
+                        matched_skill_hint=matched_skill_hint,
+                    )
                 if orch_result.executed and orch_result.skill_result:
                     if orch_result.skill_result.success:
                         skill_response_text = str(orch_result.skill_result.output or "")
@@ -221,6 +318,7 @@ class ConversationEngine:
             query=message,
             org_context=org_context,
             conversation_history=conversation_history,
+            session_id=session_id,
         )
 
         if skill_response_text is not None:
@@ -230,20 +328,26 @@ class ConversationEngine:
             response_model_id = f"skill:{intent_type}"
         else:
             # Step 4: Build messages for LLM
-            messages = self._build_llm_messages(
+            summary = await self._summarizer.current(session_id) if self._summarizer else None
+            prompt, content_parts = self._build_llm_messages(
                 message=message,
                 context=context,
                 conversation_history=conversation_history,
+                summary=summary,
             )
 
-            # Step 5: Call LLM
-            llm_response = await self._llm.call(
-                prompt=messages,
-                model_id=resolved_model,
-            )
+            # Step 5: Call LLM (org scope keys tool-layer response caches;
+            # the tier weights the org in the LLM call scheduler)
+            with org_scope(org_id, tier, user_id=user_id):
+                llm_response = await self._llm.call(
+                    prompt=prompt,
+                    model_id=resolved_model,
+                    content_parts=content_parts,
+                )
             response_text = llm_response.text
             tokens_used = llm_response.tokens_used
             response_model_id = llm_response.model_id
+            self._prompt_cache_stats.record(tokens_used)
 
         # Step 6: Record usage (zero metering loss)
         if self._usage_tracker and tokens_used:
@@ -253,6 +357,7 @@ class ConversationEngine:
                 model_id=response_model_id or resolved_model,
                 input_tokens=tokens_used.get("input", 0),
                 output_tokens=tokens_used.get("output", 0),
+                brand_id=org_context.brand_id if org_context else None,
             )
 
         # Step 7: Persist conversation events (non-blocking)
@@ -279,6 +384,19 @@ class ConversationEngine:
                     "Event store write failed (non-blocking)",
                     exc_info=True,
                 )
+            else:
+                if self._summarizer:
+                    self._summarizer.schedule(
+                        session_id,
+                        org_id=org_id,
+                        user_id=user_id,
+                        tier=org_context.org_tier if org_context else None,
+                        history=[
+                            *(conversation_history or []),
+                            {"role": "user", "content": message},
+                            {"role": "assistant", "content": response_text},
+                        ],
+                    )
 
         # Step 8: Memory write pipeline (async, non-blocking)
         if self._memory_pipeline:
@@ -316,13 +434,26 @@ class ConversationEngine:
         Returns list of {"role": ..., "content": ...} dicts suitable for
         passing as conversation_history to process_message().
         Returns [] if no event_store is configured or the session is empty.
+        Served from the session prefetch when one is warm.
         """
+        if self._prefetcher is not None:
+            prefetched = await self._prefetcher.history(session_id)
+            if prefetched is not None:
+                return prefetched
+        return await self._load_session_history(session_id)
+
+    async def _load_session_history(self, session_id: UUID) -> list[dict[str, Any]]:
         if not self._event_store:
             return []
 
         events = await self._event_store.get_session_events(session_id)
         history: list[dict[str, Any]] = []
         for event in events:
+            event_type = getattr(event, "event_type", None)
+            if event_type is None and isinstance(event, dict):
+                event_type = event.get("event_type")
+            if event_type == SUMMARY_EVENT_TYPE:
+                continue
             role = getattr(event, "role", None) or event.get("role", "user")
             content_obj = getattr(event, "content", None) or event.get("content", {})
             if isinstance(content_obj, dict):
@@ -337,22 +468,53 @@ class ConversationEngine:
         message: str,
         context: AssembledContext,
         conversation_history: list[dict[str, Any]] | None,
-    ) -> str:
-        """Build the prompt string for LLM call.
+        summary: SessionSummary | None = None,
+    ) -> tuple[str, list[ContentBlock] | None]:
+        """Build the prompt string (and structured blocks) for LLM call.
 
         Combines system prompt, conversation history, and user message.
+        With summarization enabled, history is the rolling summary plus the
+        newest messages that fit the history token budget (the fitter's
+        history share when the context was fitted); with a context fitter
+        alone, the history the assembler fitted; otherwise the last 10
+        messages. With a prompt builder, the same sections are also returned
+        as role-tagged blocks (the string stays as the text fallback).
         """
         parts: list[str] = []
 
         if context.system_prompt:
             parts.append(f"System: {context.system_prompt}")
 
-        if conversation_history:
-            for msg in conversation_history[-10:]:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                parts.append(f"{role.capitalize()}: {content}")
+        summary_text = ""
+        if self._summarizer is not None:
+            fitted_summary, recent = self._summarizer.fit(
+                conversation_history or [],
+                summary,
+                budget_tokens=context.token_budget.history if context.token_budget else None,
+            )
+            summary_text = fitted_summary or ""
+            if summary_text:
+                parts.append(f"Summary of earlier conversation: {summary_text}")
+        elif context.token_budget is not None:
+            recent = context.conversation_history
+        else:
+            recent = (conversation_history or [])[-10:]
+
+        for msg in recent:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            parts.append(f"{role.capitalize()}: {content}")
 
         parts.append(f"User: {message}")
 
-        return "\n\n".join(parts)
+        if self._prompt_builder is None:
+            return "\n\n".join(parts), None
+        structured = self._prompt_builder.build(
+            persona=context.persona,
+            context=context.context_prompt,
+            summary=summary_text,
+            history=recent,
+            message=message,
+        )
+        logger.debug("Prompt section tokens: %s", structured.section_tokens)
+        return "\n\n".join(parts), structured.blocks
@@ -0,0 +1,261 @@
+"""Speculative per-session context prefetch.
+
+Task card: B4-1 (first-turn latency)
+- When a WS session opens/resumes, or a typing/draft event arrives, the
+  retrievals assemble() will need are started in the background:
+  conversation history and the org's default knowledge profile
+  (query-independent); the user's memories only once a draft gives the
+  query, since assemble() can use them only for that exact query
+- assemble() and get_session_history() consume the prefetched results;
+  a read that arrives while a prefetch is still running joins it instead
+  of issuing a duplicate query
+- Bounded: at most max_sessions entries (LRU), each expiring after
+  ttl_seconds; evicted entries cancel their pending work
+- History and memory results are handed out once per warm, since the
+  turn that consumes them appends events and may write memories; the
+  default-profile knowledge bundle is reused until the entry expires
+
+Architecture: Section 2.2 (Context Assembly Pipeline)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from src.ports.knowledge_port import KnowledgePort
+    from src.ports.memory_core_port import MemoryCorePort
+    from src.shared.types import KnowledgeBundle, MemoryItem, OrganizationContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KNOWLEDGE_PROFILE = "default"
+_MAX_DRAFTS_PER_SESSION = 4  # latest typing drafts kept per session
+
+
+@dataclass(frozen=True)
+class PrefetchPolicy:
+    """Bounds for the session prefetch cache."""
+
+    max_sessions: int = 1024
+    ttl_seconds: float = 60.0
+    top_k_memories: int = 10
+
+    def __post_init__(self) -> None:
+        if self.max_sessions <= 0 or self.ttl_seconds <= 0:
+            msg = (
+                "max_sessions and ttl_seconds must be positive, got "
+                f"{self.max_sessions}/{self.ttl_seconds}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass
+class PrefetchStats:
+    """Prefetch effectiveness counters."""
+
+    warms: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _SessionEntry:
+    user_id: UUID
+    org_id: UUID
+    expires_at: float
+    history: asyncio.Task[list[dict[str, Any]]] | None = None
+    knowledge: asyncio.Task[KnowledgeBundle] | None = None
+    memories: dict[tuple[str, int], asyncio.Task[list[MemoryItem]]] = field(default_factory=dict)
+
+    def tasks(self) -> list[asyncio.Task[Any]]:
+        pending: list[asyncio.Task[Any]] = list(self.memories.values())
+        if self.history is not None:
+            pending.append(self.history)
+        if self.knowledge is not None:
+            pending.append(self.knowledge)
+        return pending
+
+
+class SessionPrefetcher:
+    """Warms history, memories and knowledge for a session ahead of its turn.
+
+    Args:
+        memory_core: MemoryCorePort used for memory retrieval.
+        knowledge: Optional KnowledgePort (default profile is warmed).
+        history_loader: Loads a session's history (ConversationEngine).
+        policy: Size/TTL bounds.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_core: MemoryCorePort,
+        knowledge: KnowledgePort | None = None,
+        history_loader: Callable[[UUID], Awaitable[list[dict[str, Any]]]] | None = None,
+        policy: PrefetchPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._memory_core = memory_core
+        self._knowledge = knowledge
+        self._history_loader = history_loader
+        self._policy = policy or PrefetchPolicy()
+        self._clock = clock
+        self._sessions: OrderedDict[UUID, _SessionEntry] = OrderedDict()
+        self._stats = PrefetchStats()
+
+    @property
+    def stats(self) -> PrefetchStats:
+        return self._stats
+
+    def warm(
+        self,
+        session_id: UUID,
+        *,
+        user_id: UUID,
+        org_context: OrganizationContext,
+        draft: str = "",
+    ) -> None:
+        """Start background retrievals for a session; returns immediately.
+
+        Memories are warmed only for a non-blank draft: a turn reads them
+        with its own query, which an open/resume warm cannot know. Work
+        already running or cached for the session is not repeated.
+        Must be called from a running event loop.
+        """
+        entry = self._entry(session_id)
+        if entry is None or entry.user_id != user_id or entry.org_id != org_context.org_id:
+            self._drop(session_id)
+            entry = _SessionEntry(
+                user_id=user_id,
+                org_id=org_context.org_id,
+                expires_at=self._clock() + self._policy.ttl_seconds,
+            )
+            self._sessions[session_id] = entry
+            self._evict_overflow()
+        else:
+            entry.expires_at = self._clock() + self._policy.ttl_seconds
+        self._sessions.move_to_end(session_id)
+        self._stats.warms += 1
+
+        if entry.history is None and self._history_loader is not None:
+            entry.history = self._spawn(self._history_loader(session_id))
+        if entry.knowledge is None and self._knowledge is not None:
+            entry.knowledge = self._spawn(
+                self._knowledge.resolve(
+                    profile_id=DEFAULT_KNOWLEDGE_PROFILE,
+                    query=draft,
+                    org_context=org_context,
+                )
+            )
+        key = (draft, self._policy.top_k_memories)
+        if draft.strip() and key not in entry.memories:
+            while len(entry.memories) >= _MAX_DRAFTS_PER_SESSION:
+                stale = entry.memories.pop(next(iter(entry.memories)))
+                stale.cancel()
+            entry.memories[key] = self._spawn(
+                # Same call shape as ContextAssembler._fetch_memories
+                self._memory_core.read_personal_memories(
+                    user_id=user_id,
+                    query=draft,
+                    top_k=self._policy.top_k_memories,
+                )
+            )
+
+    async def history(self, session_id: UUID) -> list[dict[str, Any]] | None:
+        """Prefetched history (handed out once), or None."""
+        entry = self._entry(session_id)
+        task = entry.history if entry is not None else None
+        if entry is not None:
+            entry.history = None
+        history: list[dict[str, Any]] | None = await self._result(task)
+        return history
+
+    async def memories(
+        self,
+        session_id: UUID,
+        *,
+        user_id: UUID,
+        query: str,
+        top_k: int,
+    ) -> list[MemoryItem] | None:
+        """Prefetched memories for exactly this query (handed out once), or None."""
+        entry = self._entry(session_id)
+        task = None
+        if entry is not None and entry.user_id == user_id:
+            task = entry.memories.pop((query, top_k), None)
+        memories: list[MemoryItem] | None = await self._result(task)
+        return memories
+
+    async def knowledge(self, session_id: UUID, *, org_id: UUID) -> KnowledgeBundle | None:
+        """Prefetched default-profile knowledge for the session's org, or None."""
+        entry = self._entry(session_id)
+        task = entry.knowledge if entry is not None and entry.org_id == org_id else None
+        bundle: KnowledgeBundle | None = await self._result(task)
+        return bundle
+
+    def discard(self, session_id: UUID) -> None:
+        """Forget a session (e.g. on WS close), cancelling pending work."""
+        self._drop(session_id)
+
+    def _entry(self, session_id: UUID) -> _SessionEntry | None:
+        entry = self._sessions.get(session_id)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._drop(session_id)
+            return None
+        return entry
+
+    async def _result(self, task: asyncio.Task[Any] | None) -> Any:
+        if task is None:
+            self._stats.misses += 1
+            return None
+        try:
+            # shield: a cancelled reader must not cancel the shared prefetch
+            value = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                self._stats.misses += 1
+                return None
+            raise
+        except Exception:
+            logger.debug("Prefetch failed; falling back to direct read", exc_info=True)
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return value
+
+    @staticmethod
+    def _spawn(coro: Awaitable[Any]) -> asyncio.Task[Any]:
+        task = asyncio.ensure_future(coro)
+        # Failures surface to readers; mark them retrieved for unread tasks.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    def _drop(self, session_id: UUID) -> None:
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
+        for task in entry.tasks():
+            if not task.done():
+                task.cancel()
+
+    def _evict_overflow(self) -> None:
+        while len(self._sessions) > self._policy.max_sessions:
+            session_id = next(iter(self._sessions))
+            self._drop(session_id)
+            self._stats.evictions += 1
@@ -0,0 +1,271 @@
+"""Rolling per-session conversation summary.
+
+Task card: B4-2 (history budget)
+- The session's older messages are folded into one running summary,
+  stored in the event store as a "conversation_summary" event whose
+  content records how many messages it covers
+- After each turn, if the unsummarized tail (excluding the most recent
+  keep_recent_messages) exceeds trigger_tokens, a background task asks the
+  LLM to fold that tail into the previous summary and appends a new
+  summary event; at most one refresh per session is in flight
+- The prompt then carries the summary plus as many recent messages as fit
+  in history_budget_tokens, instead of the last 10 messages regardless of
+  their size
+- Refresh calls run under the turn's org scope at "batch" priority, so
+  the scheduler serves chat first, and their tokens are metered like
+  any other call
+
+Architecture: Section 2.2 (Context Assembly Pipeline)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.shared.org_scope import call_priority, org_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from src.brain.engine.conversation import (
+        EventStoreProtocol,
+        LLMCallProtocol,
+        UsageRecorder,
+    )
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_EVENT_TYPE = "conversation_summary"
+
+_SUMMARY_INSTRUCTIONS = (
+    "Update the running summary of this conversation. Keep facts, decisions, "
+    "user preferences and open questions; drop greetings and filler. "
+    "Reply with the updated summary only."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+@dataclass(frozen=True)
+class SummaryPolicy:
+    """When to summarize and how much history the prompt may carry."""
+
+    trigger_tokens: int = 1500  # unsummarized tail size that triggers a refresh
+    keep_recent_messages: int = 6  # never folded; always eligible verbatim
+    history_budget_tokens: int = 2000  # summary + recent messages in the prompt
+    summary_max_tokens: int = 400
+    max_sessions: int = 4096  # cached summaries kept in process
+
+    def __post_init__(self) -> None:
+        if self.trigger_tokens <= 0 or self.history_budget_tokens <= 0:
+            msg = (
+                "trigger_tokens and history_budget_tokens must be positive, got "
+                f"{self.trigger_tokens}/{self.history_budget_tokens}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class SessionSummary:
+    """Latest rolling summary of a session."""
+
+    text: str
+    covered_messages: int  # leading history messages folded into text
+
+
+class RollingSummarizer:
+    """Maintains and applies rolling session summaries.
+
+    Args:
+        llm: LLM used to write summaries.
+        event_store: Where summary events are persisted and reloaded from.
+        policy: Thresholds and prompt budget.
+        model_id: Model for summary calls.
+        count_tokens: Token counter for history text.
+        usage_tracker: Records the tokens of summary calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        llm: LLMCallProtocol,
+        event_store: EventStoreProtocol,
+        policy: SummaryPolicy | None = None,
+        model_id: str = "gpt-4o",
+        count_tokens: Callable[[str], int] = estimate_tokens,
+        usage_tracker: UsageRecorder | None = None,
+    ) -> None:
+        self._llm = llm
+        self._usage_tracker = usage_tracker
+        self._event_store = event_store
+        self._policy = policy or SummaryPolicy()
+        self._model_id = model_id
+        self._count_tokens = count_tokens
+        self._summaries: OrderedDict[UUID, SessionSummary | None] = OrderedDict()
+        self._inflight: dict[UUID, asyncio.Task[SessionSummary | None]] = {}
+        self.refresh_count = 0
+
+    @property
+    def policy(self) -> SummaryPolicy:
+        return self._policy
+
+    async def current(self, session_id: UUID) -> SessionSummary | None:
+        """Latest summary for a session (cached; loaded from events on a miss)."""
+        if session_id in self._summaries:
+            self._summaries.move_to_end(session_id)
+            return self._summaries[session_id]
+        summary: SessionSummary | None = None
+        for event in reversed(await self._event_store.get_session_events(session_id)):
+            if _field(event, "event_type") == SUMMARY_EVENT_TYPE:
+                content = _field(event, "content") or {}
+                summary = SessionSummary(
+                    text=str(content.get("text", "")),
+                    covered_messages=int(content.get("covered_messages", 0)),
+                )
+                break
+        self._remember(session_id, summary)
+        return summary
+
+    def fit(
+        self,
+        history: list[dict[str, Any]],
+        summary: SessionSummary | None,
+        *,
+        budget_tokens: int | None = None,
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """Summary text plus the newest unsummarized messages within budget.
+
+        Args:
+            budget_tokens: History share of a fitted context window; defaults
+                to the policy's history_budget_tokens.
+        """
+        budget = self._policy.history_budget_tokens if budget_tokens is None else budget_tokens
+        summary_text = summary.text if summary and summary.text else None
+        covered = min(summary.covered_messages, len(history)) if summary else 0
+        if summary_text:
+            budget -= self._count_tokens(summary_text)
+
+        recent: list[dict[str, Any]] = []
+        for msg in reversed(history[covered:]):
+            cost = self._count_tokens(str(msg.get("content", "")))
+            if cost > budget:
+                break
+            budget -= cost
+            recent.append(msg)
+        recent.reverse()
+        return summary_text, recent
+
+    def schedule(
+        self,
+        session_id: UUID,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        history: list[dict[str, Any]],
+        tier: str | None = None,
+    ) -> None:
+        """Start a background refresh if none is running for the session."""
+        task = self._inflight.get(session_id)
+        if task is not None and not task.done():
+            return
+        task = asyncio.ensure_future(
+            self.refresh(session_id, org_id=org_id, user_id=user_id, history=history, tier=tier)
+        )
+        self._inflight[session_id] = task
+        task.add_done_callback(lambda t: self._finished(session_id, t))
+
+    async def refresh(
+        self,
+        session_id: UUID,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        history: list[dict[str, Any]],
+        tier: str | None = None,
+    ) -> SessionSummary | None:
+        """Fold the unsummarized tail into the summary if it is over threshold.
+
+        Args:
+            tier: The org's tier (fair-queuing weight in the LLM scheduler).
+
+        Returns the new summary, or None when no refresh was needed.
+        """
+        previous = await self.current(session_id)
+        covered = min(previous.covered_messages, len(history)) if previous else 0
+        fold_until = len(history) - self._policy.keep_recent_messages
+        tail = history[covered:fold_until]
+        if not tail:
+            return None
+        transcript = _transcript(tail)
+        if self._count_tokens(transcript) < self._policy.trigger_tokens:
+            return None
+
+        parts = [_SUMMARY_INSTRUCTIONS]
+        if previous and previous.text:
+            parts.append(f"Current summary:\n{previous.text}")
+        parts.append(f"New messages:\n{transcript}")
+        with org_scope(org_id, tier, user_id=user_id), call_priority("batch"):
+            response = await self._llm.call(
+                prompt="\n\n".join(parts),
+                model_id=self._model_id,
+                parameters={"max_tokens": self._policy.summary_max_tokens},
+            )
+        if self._usage_tracker and response.tokens_used:
+            self._usage_tracker.record_usage(
+                org_id=org_id,
+                user_id=user_id,
+                model_id=response.model_id or self._model_id,
+                input_tokens=response.tokens_used.get("input", 0),
+                output_tokens=response.tokens_used.get("output", 0),
+            )
+
+        summary = SessionSummary(text=response.text.strip(), covered_messages=fold_until)
+        await self._event_store.append_event(
+            org_id=org_id,
+            session_id=session_id,
+            user_id=user_id,
+            event_type=SUMMARY_EVENT_TYPE,
+            role="system",
+            content={"text": summary.text, "covered_messages": summary.covered_messages},
+        )
+        self._remember(session_id, summary)
+        self.refresh_count += 1
+        return summary
+
+    async def drain(self) -> None:
+        """Wait for in-flight refreshes (tests, shutdown)."""
+        pending = [t for t in self._inflight.values() if not t.done()]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _remember(self, session_id: UUID, summary: SessionSummary | None) -> None:
+        self._summaries[session_id] = summary
+        self._summaries.move_to_end(session_id)
+        while len(self._summaries) > self._policy.max_sessions:
+            self._summaries.popitem(last=False)
+
+    def _finished(self, session_id: UUID, task: asyncio.Task[SessionSummary | None]) -> None:
+        if self._inflight.get(session_id) is task:
+            del self._inflight[session_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Summary refresh failed (non-blocking)", exc_info=task.exception())
+
+
+def _field(event: Any, name: str) -> Any:
+    if isinstance(event, dict):
+        return event.get(name)
+    return getattr(event, name, None)
+
+
+def _transcript(messages: list[dict[str, Any]]) -> str:
+    return "\n".join(
+        f"{str(m.get('role', 'user')).capitalize()}: {m.get('content', '')}" for m in messages
+    )
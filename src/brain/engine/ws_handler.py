@@ -4,6 +4,7 @@ Task card: B2-8
 - Interface with Gateway WS endpoint
 - Enable streaming replies + session persistence
 - First-byte latency < 500ms
+- open/resume/typing/draft events start a speculative context prefetch
 
 Architecture: delivery/phase2-runtime-config.yaml (realtime section)
 """
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PREFETCH_MESSAGE_TYPES = frozenset({"open", "resume", "typing", "draft"})
+
 
 class WSChatHandler:
     """WebSocket handler for real-time conversation.
@@ -46,6 +49,7 @@ class WSChatHandler:
         Routes based on message type:
         - message: Process through conversation engine
         - ping: Return pong
+        - open/resume/typing/draft: Warm context for the coming turn (no reply)
         - close: Clean up session
         """
         if message.type == "ping":
@@ -56,7 +60,18 @@ class WSChatHandler:
             await sender.send({"type": "pong"})
             return response
 
+        if message.type in PREFETCH_MESSAGE_TYPES:
+            self._engine.prefetch_session(
+                message.session_id,
+                user_id=message.user_id,
+                org_id=message.org_id,
+                org_context=org_context,
+                draft=message.content,
+            )
+            return WSResponse(type="prefetch", session_id=message.session_id)
+
         if message.type == "close":
+            self._engine.end_session(message.session_id)
             return WSResponse(
                 type="close",
                 session_id=message.session_id,
@@ -4,19 +4,32 @@ Task card: B3-4
 - 3 consecutive negative feedback events -> confidence drops to 0
 - Fused memory no longer injected into context
 - Threshold configurable
+- PersistentFeedbackFuse: counts live in a shared FeedbackStore (PG) so
+  every worker agrees; retrieval filters fused memories through a per-user
+  Bloom filter cached in process (snapshot shared via StoragePort), and
+  only Bloom hits are confirmed against the store
 
 Architecture: docs/architecture/01-Brain Section 2.3 (Memory Quality)
 """
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from uuid import UUID
 
+    from src.ports.storage_port import StoragePort
+    from src.shared.types import MemoryItem
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,7 +59,7 @@ class NegativeFeedbackFuse:
     confidence drops to 0.0 and it is excluded from context assembly.
 
     Thread-safe for single-process operation. For multi-process,
-    use external store (PG-backed in Phase 4).
+    use PersistentFeedbackFuse (PG-backed store).
     """
 
     def __init__(self, *, threshold: int = 3) -> None:
@@ -77,13 +90,11 @@ class NegativeFeedbackFuse:
                 record.negative_count,
             )
 
-        confidence = 0.0 if record.fused else max(0.0, 1.0 - record.negative_count * 0.2)
-
         return FuseResult(
             memory_id=memory_id,
             negative_count=record.negative_count,
             fused=record.fused,
-            confidence=confidence,
+            confidence=_fuse_confidence(record.negative_count, fused=record.fused),
         )
 
     def is_fused(self, memory_id: UUID) -> bool:
@@ -128,3 +139,296 @@ class NegativeFeedbackFuse:
     def fused_memories(self) -> frozenset[UUID]:
         """Return set of all fused memory IDs."""
         return frozenset(record.memory_id for record in self._records.values() if record.fused)
+
+
+def _fuse_confidence(negative_count: int, *, fused: bool) -> float:
+    return 0.0 if fused else max(0.0, 1.0 - negative_count * 0.2)
+
+
+# ---------------------------------------------------------------------------
+# Persistent fuse (shared store + per-user Bloom filter)
+# ---------------------------------------------------------------------------
+
+SNAPSHOT_KEY_PREFIX = "brain:fused"
+SNAPSHOT_TTL_SECONDS = 24 * 3600
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over UUIDs (double hashing on blake2b).
+
+    Never reports a false negative; false positives occur at roughly the
+    rate the filter was sized for.
+    """
+
+    def __init__(self, size_bits: int, num_hashes: int, bits: bytes | None = None) -> None:
+        if size_bits <= 0 or num_hashes <= 0:
+            msg = f"size_bits and num_hashes must be positive, got {size_bits}/{num_hashes}"
+            raise ValueError(msg)
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray(bits) if bits is not None else bytearray((size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float = 0.01) -> BloomFilter:
+        """Size a filter for `capacity` items at the given false positive rate."""
+        n = max(capacity, 16)
+        m = math.ceil(-n * math.log(false_positive_rate) / (math.log(2) ** 2))
+        k = max(1, round(m / n * math.log(2)))
+        return cls(m, k)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[UUID], false_positive_rate: float = 0.01) -> BloomFilter:
+        items = list(ids)
+        bloom = cls.for_capacity(len(items), false_positive_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: UUID) -> list[int]:
+        digest = hashlib.blake2b(item.bytes, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.num_hashes)]
+
+    def add(self, item: UUID) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: UUID) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-safe snapshot for StoragePort."""
+        return {
+            "m": self.size_bits,
+            "k": self.num_hashes,
+            "bits": base64.b64encode(bytes(self._bits)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BloomFilter:
+        return cls(int(data["m"]), int(data["k"]), base64.b64decode(data["bits"]))
+
+
+class FeedbackStore(Protocol):
+    """Shared negative-feedback state (one row per memory)."""
+
+    async def record_negative(
+        self,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        memory_id: UUID,
+        threshold: int,
+    ) -> tuple[int, bool]:
+        """Atomically count one negation; returns (negative_count, fused)."""
+        ...
+
+    async def fused_ids(self, user_id: UUID) -> set[UUID]:
+        """All fused memory IDs of a user."""
+        ...
+
+    async def fused_among(self, user_id: UUID, memory_ids: list[UUID]) -> set[UUID]:
+        """The subset of memory_ids that is fused."""
+        ...
+
+    async def reset(self, user_id: UUID, memory_id: UUID) -> None:
+        """Forget all feedback for a memory."""
+        ...
+
+
+class InMemoryFeedbackStore:
+    """FeedbackStore backed by a dict, for tests and single-process use."""
+
+    def __init__(self) -> None:
+        self._records: dict[UUID, tuple[UUID, FeedbackRecord]] = {}
+        self.fused_ids_calls = 0
+        self.fused_among_calls = 0
+
+    async def record_negative(
+        self,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        memory_id: UUID,
+        threshold: int,
+    ) -> tuple[int, bool]:
+        _, record = self._records.setdefault(
+            memory_id, (user_id, FeedbackRecord(memory_id=memory_id))
+        )
+        record.negative_count += 1
+        record.fused = record.fused or record.negative_count >= threshold
+        return record.negative_count, record.fused
+
+    async def fused_ids(self, user_id: UUID) -> set[UUID]:
+        self.fused_ids_calls += 1
+        return {mid for mid, (uid, r) in self._records.items() if uid == user_id and r.fused}
+
+    async def fused_among(self, user_id: UUID, memory_ids: list[UUID]) -> set[UUID]:
+        self.fused_among_calls += 1
+        return {
+            mid
+            for mid in memory_ids
+            if (entry := self._records.get(mid)) and entry[0] == user_id and entry[1].fused
+        }
+
+    async def reset(self, user_id: UUID, memory_id: UUID) -> None:
+        self._records.pop(memory_id, None)
+
+
+@dataclass
+class _UserFilter:
+    bloom: BloomFilter
+    expires_at: float
+    confirmed: set[UUID] = field(default_factory=set)  # Bloom hits that are fused
+    cleared: set[UUID] = field(default_factory=set)  # Bloom false positives
+
+
+class PersistentFeedbackFuse:
+    """NegativeFeedbackFuse over a shared FeedbackStore.
+
+    Feedback counts and fuse state are persisted in the store, so they
+    survive restarts and every worker sees the same fused set. For
+    retrieval, each worker keeps a per-user Bloom filter of fused IDs
+    (LRU-bounded, refreshed every refresh_seconds); a Bloom miss means
+    "not fused" with no I/O, and hits are confirmed against the store in
+    one batched query, so false positives never suppress a memory.
+
+    With `shared` set, the serialized filter is published through
+    StoragePort (Redis) whenever a memory fuses or is reset, and workers
+    refresh from that snapshot instead of rebuilding from the store. A
+    fuse recorded on another worker becomes visible here within
+    refresh_seconds.
+    """
+
+    def __init__(
+        self,
+        store: FeedbackStore,
+        *,
+        shared: StoragePort | None = None,
+        threshold: int = 3,
+        false_positive_rate: float = 0.01,
+        refresh_seconds: float = 30.0,
+        max_users: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if threshold <= 0 or max_users <= 0:
+            msg = f"threshold and max_users must be positive, got {threshold}/{max_users}"
+            raise ValueError(msg)
+        if not 0.0 < false_positive_rate < 1.0:
+            msg = f"false_positive_rate must be in (0, 1), got {false_positive_rate}"
+            raise ValueError(msg)
+        self._store = store
+        self._shared = shared
+        self._threshold = threshold
+        self._fp_rate = false_positive_rate
+        self._refresh_seconds = refresh_seconds
+        self._max_users = max_users
+        self._clock = clock
+        self._filters: OrderedDict[UUID, _UserFilter] = OrderedDict()
+
+    async def record_negative(
+        self,
+        memory_id: UUID,
+        *,
+        user_id: UUID,
+        org_id: UUID,
+    ) -> FuseResult:
+        """Record a negative feedback event; fusing updates the filters.
+
+        org_id is required: memory_feedback rows are read back under the
+        org's RLS policy.
+        """
+        count, fused = await self._store.record_negative(
+            org_id=org_id, user_id=user_id, memory_id=memory_id, threshold=self._threshold
+        )
+        if fused and count == self._threshold:
+            logger.info("Memory %s fused after %d negative feedbacks", memory_id, count)
+            entry = self._filters.get(user_id)
+            if entry is not None:
+                entry.bloom.add(memory_id)
+                entry.confirmed.add(memory_id)
+                entry.cleared.discard(memory_id)
+            await self._publish(user_id)
+        return FuseResult(
+            memory_id=memory_id,
+            negative_count=count,
+            fused=fused,
+            confidence=_fuse_confidence(count, fused=fused),
+        )
+
+    async def reset(self, memory_id: UUID, *, user_id: UUID) -> None:
+        """Forget feedback for a memory (e.g. after it was updated)."""
+        await self._store.reset(user_id, memory_id)
+        # Bloom filters cannot delete; rebuild the user's snapshot.
+        self._filters.pop(user_id, None)
+        await self._publish(user_id)
+
+    async def is_fused(self, memory_id: UUID, *, user_id: UUID) -> bool:
+        return bool(await self._fused_subset(user_id, [memory_id]))
+
+    async def filter_fused(self, user_id: UUID, memories: list[MemoryItem]) -> list[MemoryItem]:
+        """Drop fused memories, preserving order."""
+        if not memories:
+            return memories
+        fused = await self._fused_subset(user_id, [m.memory_id for m in memories])
+        if not fused:
+            return memories
+        return [m for m in memories if m.memory_id not in fused]
+
+    def invalidate(self, user_id: UUID | None = None) -> None:
+        """Drop cached filters (one user or all)."""
+        if user_id is None:
+            self._filters.clear()
+        else:
+            self._filters.pop(user_id, None)
+
+    async def _fused_subset(self, user_id: UUID, memory_ids: list[UUID]) -> set[UUID]:
+        entry = await self._filter_for(user_id)
+        fused = {mid for mid in memory_ids if mid in entry.confirmed}
+        suspects = [
+            mid
+            for mid in memory_ids
+            if mid not in fused and mid not in entry.cleared and mid in entry.bloom
+        ]
+        if suspects:
+            confirmed = await self._store.fused_among(user_id, suspects)
+            entry.confirmed.update(confirmed)
+            entry.cleared.update(mid for mid in suspects if mid not in confirmed)
+            fused |= confirmed
+        return fused
+
+    async def _filter_for(self, user_id: UUID) -> _UserFilter:
+        now = self._clock()
+        entry = self._filters.get(user_id)
+        if entry is not None and entry.expires_at > now:
+            self._filters.move_to_end(user_id)
+            return entry
+
+        bloom: BloomFilter | None = None
+        if self._shared is not None:
+            snapshot = await self._shared.get(_snapshot_key(user_id))
+            if snapshot is not None:
+                bloom = BloomFilter.from_dict(snapshot)
+        if bloom is None:
+            bloom = await self._publish(user_id)
+
+        entry = _UserFilter(bloom=bloom, expires_at=now + self._refresh_seconds)
+        self._filters[user_id] = entry
+        self._filters.move_to_end(user_id)
+        while len(self._filters) > self._max_users:
+            self._filters.popitem(last=False)
+        return entry
+
+    async def _publish(self, user_id: UUID) -> BloomFilter:
+        """Rebuild the user's filter from the store and share the snapshot."""
+        bloom = BloomFilter.from_ids(await self._store.fused_ids(user_id), self._fp_rate)
+        if self._shared is not None:
+            await self._shared.put(
+                _snapshot_key(user_id), bloom.to_dict(), ttl=SNAPSHOT_TTL_SECONDS
+            )
+        return bloom
+
+
+def _snapshot_key(user_id: UUID) -> str:
+    return f"{SNAPSHOT_KEY_PREFIX}:{user_id}"
@@ -33,6 +33,7 @@ from src.shared.errors import (
     AuthorizationError,
     DiyuError,
     NotFoundError,
+    QuotaExceededError,
     ServiceUnavailableError,
     ValidationError,
 )
@@ -157,6 +158,15 @@ def create_app(
             content={"error": exc.code, "message": str(exc)},
         )
 
+    @app.exception_handler(QuotaExceededError)
+    async def _quota_exceeded(_: Request, exc: QuotaExceededError) -> JSONResponse:
+        # 402 (budget) as in BudgetPreCheckMiddleware, not 429 (rate limit)
+        return JSONResponse(
+            status_code=402,
+            content={"error": exc.code, "message": str(exc)},
+            headers={"X-Budget-Remaining": str(max(exc.limit - exc.current, 0))},
+        )
+
     @app.exception_handler(ServiceUnavailableError)
     async def _service_unavailable(_: Request, exc: ServiceUnavailableError) -> JSONResponse:
         return JSONResponse(
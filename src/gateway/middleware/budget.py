@@ -3,6 +3,9 @@
 Task card: G2-4
 - Budget exhausted -> 402 + X-Budget-Remaining header
 - 402 vs 429 semantic distinction (budget vs rate limit)
+- Balance read from the same ledger BudgetGuard reserves against
+  (TokenBudgetManager or RedisBudgetLedger), so the pre-check and the
+  header agree across workers
 
 Architecture: 05-Gateway Section 6, ADR-047
 """
@@ -10,7 +13,7 @@ Architecture: 05-Gateway Section 6, ADR-047
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 from fastapi.responses import JSONResponse
 
@@ -20,13 +23,19 @@ if TYPE_CHECKING:
 
     from fastapi import Request, Response
 
-    from src.infra.billing.budget import TokenBudgetManager
-
 logger = logging.getLogger(__name__)
 
 _EXEMPT_PATHS = frozenset({"/healthz", "/docs", "/openapi.json", "/redoc"})
 
 
+class BudgetBalance(Protocol):
+    """Balance lookup shared by TokenBudgetManager and RedisBudgetLedger."""
+
+    async def remaining(self, budget_id: UUID) -> int:
+        """Tokens neither used nor held. Raises KeyError if unknown."""
+        ...
+
+
 class BudgetResolver:
     """Resolves org_id to budget_id.
 
@@ -54,12 +63,18 @@ class BudgetPreCheckMiddleware:
     Usage with FastAPI:
         middleware = BudgetPreCheckMiddleware(budget_manager=mgr, budget_resolver=resolver)
         app.middleware("http")(middleware)
+
+    Args:
+        budget_manager: Budget ledger; pass the one BudgetGuard reserves
+            against so in-flight holds from every worker are seen.
+        budget_resolver: org_id -> budget_id.
+        exempt_paths: Paths never checked.
     """
 
     def __init__(
         self,
         *,
-        budget_manager: TokenBudgetManager,
+        budget_manager: BudgetBalance,
         budget_resolver: BudgetResolver | None = None,
         exempt_paths: frozenset[str] | None = None,
     ) -> None:
@@ -82,16 +97,20 @@ class BudgetPreCheckMiddleware:
             return await call_next(request)
 
         # Resolve budget for org
-        budget = None
+        remaining: int | None = None
         if self._budget_resolver:
             budget_id = self._budget_resolver.resolve(org_id)
             if budget_id:
                 try:
-                    budget = self._budget_manager.check_budget(budget_id)
+                    remaining = await self._budget_manager.remaining(budget_id)
                 except KeyError:
-                    budget = None
+                    remaining = None
+                except Exception:
+                    # Same as BudgetGuard: a ledger outage fails open
+                    logger.warning("Budget ledger unavailable; pre-check skipped", exc_info=True)
+                    remaining = None
 
-        if budget is not None and budget.status.value == "exhausted":
+        if remaining is not None and remaining <= 0:
             return JSONResponse(
                 status_code=402,
                 content={"error": "QUOTA_EXCEEDED", "message": "Token budget exhausted"},
@@ -100,8 +119,8 @@ class BudgetPreCheckMiddleware:
 
         response = await call_next(request)
 
-        # Add budget header to response
-        remaining = str(budget.remaining_tokens) if budget else "unknown"
-        response.headers["X-Budget-Remaining"] = remaining
+        # Add budget header to response (tokens held by in-flight calls excluded)
+        header = str(max(remaining, 0)) if remaining is not None else "unknown"
+        response.headers["X-Budget-Remaining"] = header
 
         return response
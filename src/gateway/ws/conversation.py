@@ -88,6 +88,17 @@ def create_ws_router(*, handler: WSChatPort, jwt_secret: str) -> APIRouter:
         )
 
         try:
+            # Warm history/memory/knowledge while the user is still typing
+            await handler.handle_message(
+                WSMessage(
+                    type="open",
+                    session_id=session_id,
+                    user_id=payload.user_id,
+                    org_id=payload.org_id,
+                ),
+                sender,
+                org_context=org_context,
+            )
             while True:
                 data = await websocket.receive_json()
                 msg_type = data.get("type", "message")
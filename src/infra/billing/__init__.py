@@ -4,14 +4,20 @@ from .budget import (
     Budget,
     BudgetStatus,
     DeductionReceipt,
+    Reservation,
     TokenBudgetManager,
     UsageSummary,
 )
+from .redis_ledger import RedisBudgetLedger
+from .usage_store import PgUsageStore
 
 __all__ = [
     "Budget",
     "BudgetStatus",
     "DeductionReceipt",
+    "PgUsageStore",
+    "RedisBudgetLedger",
+    "Reservation",
     "TokenBudgetManager",
     "UsageSummary",
 ]
@@ -4,16 +4,33 @@ Task card: I2-3
 - LLM call -> token metering -> usage_budgets deduction -> reject on exhaustion
 - Billing error = 0 (hard requirement)
 
+Task card: I2-3b (reservation-based enforcement)
+- reserve(): atomically hold a call's estimated tokens before it runs,
+  so concurrent large requests cannot all pass the check and overdraw
+- settle(): replace the hold with the actual usage (always charged, even
+  past the limit: tokens the provider already spent are billed)
+- release(): drop a hold without charging (call failed before usage)
+- Holds expire after ttl_seconds so a crashed caller cannot pin budget
+
 Architecture: ADR-047, 06 Section 1.5
 """
 
 from __future__ import annotations
 
 import enum
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from src.shared.errors import QuotaExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_HOLD_SECONDS = 300.0
+
 
 class BudgetStatus(enum.Enum):
     """Budget lifecycle states."""
@@ -33,11 +50,27 @@ class Budget:
     used_tokens: int = 0
     status: BudgetStatus = BudgetStatus.ACTIVE
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    reserved_tokens: int = 0
 
     @property
     def remaining_tokens(self) -> int:
         return self.total_tokens - self.used_tokens
 
+    @property
+    def available_tokens(self) -> int:
+        """Remaining tokens not held by in-flight reservations."""
+        return self.remaining_tokens - self.reserved_tokens
+
+
+@dataclass(frozen=True)
+class Reservation:
+    """Tokens held against a budget for one in-flight call."""
+
+    reservation_id: UUID
+    budget_id: UUID
+    tokens: int
+    expires_at: float  # monotonic (in-memory) or epoch (Redis) seconds
+
 
 @dataclass(frozen=True)
 class DeductionReceipt:
@@ -70,9 +103,11 @@ class TokenBudgetManager:
     Production adapter will use PostgreSQL usage_budgets table.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
         self._budgets: dict[UUID, Budget] = {}
         self._receipts: dict[UUID, list[DeductionReceipt]] = {}
+        self._holds: dict[UUID, Reservation] = {}
+        self._clock = clock
 
     def create_budget(self, org_id: UUID, total_tokens: int) -> Budget:
         """Create a new token budget for an organization.
@@ -128,27 +163,105 @@ class TokenBudgetManager:
             msg = f"Budget {budget_id} is {budget.status.value}, cannot deduct"
             raise PermissionError(msg)
 
-        if budget.remaining_tokens < tokens:
-            budget.status = BudgetStatus.EXHAUSTED
-            msg = f"Insufficient tokens: requested {tokens}, remaining {budget.remaining_tokens}"
+        self._reclaim_expired()
+        if budget.available_tokens < tokens:
+            if budget.reserved_tokens == 0:
+                budget.status = BudgetStatus.EXHAUSTED
+            msg = f"Insufficient tokens: requested {tokens}, remaining {budget.available_tokens}"
             raise PermissionError(msg)
 
+        return self._charge(budget, tokens)
+
+    async def reserve(
+        self,
+        budget_id: UUID,
+        tokens: int,
+        *,
+        ttl_seconds: float = DEFAULT_HOLD_SECONDS,
+    ) -> Reservation:
+        """Hold ``tokens`` for an in-flight call (async for parity with Redis).
+
+        Raises:
+            ValueError: If tokens <= 0.
+            KeyError: If budget not found.
+            QuotaExceededError: If the budget cannot cover the hold.
+        """
+        if tokens <= 0:
+            msg = f"tokens must be positive, got {tokens}"
+            raise ValueError(msg)
+        budget = self.check_budget(budget_id)
+        self._reclaim_expired()
+        if budget.status != BudgetStatus.ACTIVE or budget.available_tokens < tokens:
+            raise QuotaExceededError(
+                "tokens", budget.total_tokens, budget.used_tokens + budget.reserved_tokens
+            )
+        reservation = Reservation(
+            reservation_id=uuid4(),
+            budget_id=budget_id,
+            tokens=tokens,
+            expires_at=self._clock() + ttl_seconds,
+        )
+        budget.reserved_tokens += tokens
+        self._holds[reservation.reservation_id] = reservation
+        return reservation
+
+    async def settle(self, reservation: Reservation, actual_tokens: int) -> DeductionReceipt:
+        """Replace a hold with the call's actual usage.
+
+        Actual usage is charged even if it exceeds the hold or the budget.
+
+        Raises:
+            ValueError: If actual_tokens < 0.
+            KeyError: If budget not found.
+        """
+        if actual_tokens < 0:
+            msg = f"actual_tokens must be non-negative, got {actual_tokens}"
+            raise ValueError(msg)
+        budget = self.check_budget(reservation.budget_id)
+        self._drop_hold(reservation)
+        return self._charge(budget, actual_tokens)
+
+    async def release(self, reservation: Reservation) -> None:
+        """Drop a hold without charging (no-op if already settled or expired)."""
+        self._drop_hold(reservation)
+
+    def _drop_hold(self, reservation: Reservation) -> None:
+        if self._holds.pop(reservation.reservation_id, None) is not None:
+            budget = self._budgets.get(reservation.budget_id)
+            if budget is not None:
+                budget.reserved_tokens -= reservation.tokens
+
+    def _reclaim_expired(self) -> None:
+        now = self._clock()
+        for reservation in [r for r in self._holds.values() if r.expires_at <= now]:
+            self._drop_hold(reservation)
+
+    def _charge(self, budget: Budget, tokens: int) -> DeductionReceipt:
         budget.used_tokens += tokens
 
         receipt = DeductionReceipt(
             receipt_id=uuid4(),
-            budget_id=budget_id,
+            budget_id=budget.id,
             tokens_deducted=tokens,
-            tokens_remaining=budget.remaining_tokens,
+            tokens_remaining=max(budget.remaining_tokens, 0),
             timestamp=datetime.now(UTC),
         )
-        self._receipts[budget_id].append(receipt)
+        self._receipts[budget.id].append(receipt)
 
-        if budget.remaining_tokens == 0:
+        if budget.remaining_tokens <= 0:
             budget.status = BudgetStatus.EXHAUSTED
 
         return receipt
 
+    async def remaining(self, budget_id: UUID) -> int:
+        """Tokens neither used nor held (async for parity with Redis).
+
+        Raises:
+            KeyError: If budget not found.
+        """
+        self._reclaim_expired()
+        return self.check_budget(budget_id).available_tokens
+
     def check_budget(self, budget_id: UUID) -> Budget:
         """Check current budget status.
 
@@ -0,0 +1,213 @@
+"""Redis-backed token budget ledger for multi-worker reservation.
+
+Task card: I2-3b (reservation-based enforcement)
+- One hash per budget (total / used / reserved) and one sorted set of
+  holds scored by expiry; every operation is O(1) or O(log n) round trips
+- reserve(): MULTI { HINCRBY reserved; HMGET total used; ZADD hold } so
+  the balance check sees its own hold; an over-limit hold is rolled back.
+  Workers racing for the last tokens can both be refused, never both admitted
+- settle() / release(): WATCH the holds set, check the hold, then
+  MULTI { ZREM hold; HINCRBY reserved; HINCRBY used }. Removing the hold
+  and returning its tokens commit together (a crash cannot leak reserved
+  tokens), and only one caller or the expiry sweep can return a hold; a
+  racing removal aborts the transaction, which is retried
+- Expired holds of crashed callers are swept on the next reserve()
+
+Architecture: ADR-047, 06 Section 1.5
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+import redis.asyncio as aioredis
+from redis.exceptions import WatchError
+
+from src.infra.billing.budget import DEFAULT_HOLD_SECONDS, DeductionReceipt, Reservation
+from src.shared.errors import QuotaExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BUDGET_KEY_PREFIX = "billing:budget"
+_SWEEP_BATCH = 64
+
+
+class RedisBudgetLedger:
+    """Token budgets shared by every worker through Redis.
+
+    Same reserve / settle / release contract as TokenBudgetManager.
+
+    Args:
+        redis_url: Redis connection URL (client created on first use).
+        clock: Epoch seconds; hold expiry is compared across workers.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._redis_url = redis_url
+        self._client: Any = None
+        self._clock = clock
+
+    async def _get_client(self) -> Any:
+        if self._client is None:
+            self._client = aioredis.from_url(self._redis_url, decode_responses=False)
+        return self._client
+
+    async def set_budget(self, budget_id: UUID, total_tokens: int) -> None:
+        """Create a budget or change its allocation (usage is kept)."""
+        if total_tokens <= 0:
+            msg = f"total_tokens must be positive, got {total_tokens}"
+            raise ValueError(msg)
+        client = await self._get_client()
+        await client.hset(_budget_key(budget_id), mapping={"total": total_tokens})
+
+    async def remaining(self, budget_id: UUID) -> int:
+        """Tokens neither used nor held.
+
+        Raises:
+            KeyError: If budget not found.
+        """
+        client = await self._get_client()
+        total, used, reserved = await client.hmget(
+            _budget_key(budget_id), ["total", "used", "reserved"]
+        )
+        if total is None:
+            msg = f"Budget {budget_id} not found"
+            raise KeyError(msg)
+        return int(total) - int(used or 0) - int(reserved or 0)
+
+    async def reserve(
+        self,
+        budget_id: UUID,
+        tokens: int,
+        *,
+        ttl_seconds: float = DEFAULT_HOLD_SECONDS,
+    ) -> Reservation:
+        """Hold ``tokens`` for an in-flight call.
+
+        Raises:
+            ValueError: If tokens <= 0.
+            KeyError: If budget not found.
+            QuotaExceededError: If the budget cannot cover the hold.
+        """
+        if tokens <= 0:
+            msg = f"tokens must be positive, got {tokens}"
+            raise ValueError(msg)
+        client = await self._get_client()
+        await self._sweep_expired(client, budget_id)
+
+        reservation = Reservation(
+            reservation_id=uuid4(),
+            budget_id=budget_id,
+            tokens=tokens,
+            expires_at=self._clock() + ttl_seconds,
+        )
+        key, member = _budget_key(budget_id), _member(reservation)
+        pipe = client.pipeline(transaction=True)
+        pipe.hincrby(key, "reserved", tokens)
+        pipe.hmget(key, ["total", "used"])
+        pipe.zadd(_holds_key(budget_id), {member: reservation.expires_at})
+        reserved, (total, used), _ = await pipe.execute()
+
+        if total is None or int(used or 0) + int(reserved) > int(total):
+            await self._return_hold(client, budget_id, member, tokens)
+            if total is None:
+                msg = f"Budget {budget_id} not found"
+                raise KeyError(msg)
+            raise QuotaExceededError("tokens", int(total), int(used or 0) + int(reserved) - tokens)
+        return reservation
+
+    async def settle(self, reservation: Reservation, actual_tokens: int) -> DeductionReceipt:
+        """Replace a hold with the call's actual usage (always charged)."""
+        if actual_tokens < 0:
+            msg = f"actual_tokens must be non-negative, got {actual_tokens}"
+            raise ValueError(msg)
+        client = await self._get_client()
+        budget_id = reservation.budget_id
+        *_, used, total = await self._return_hold(
+            client, budget_id, _member(reservation), reservation.tokens, charge=actual_tokens
+        )
+
+        return DeductionReceipt(
+            receipt_id=uuid4(),
+            budget_id=budget_id,
+            tokens_deducted=actual_tokens,
+            tokens_remaining=max(int(total or 0) - int(used), 0),
+            timestamp=datetime.now(UTC),
+        )
+
+    async def release(self, reservation: Reservation) -> None:
+        """Drop a hold without charging (no-op if already settled or expired)."""
+        client = await self._get_client()
+        await self._return_hold(
+            client, reservation.budget_id, _member(reservation), reservation.tokens
+        )
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _return_hold(
+        self,
+        client: Any,
+        budget_id: UUID,
+        member: str,
+        tokens: int,
+        *,
+        charge: int | None = None,
+    ) -> list[Any]:
+        """Remove a hold and return its tokens in one transaction.
+
+        With charge, the same transaction adds it to used and reads total;
+        the result then ends with (used, total).
+        """
+        holds, key = _holds_key(budget_id), _budget_key(budget_id)
+        async with client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(holds)
+                    held = await pipe.zscore(holds, member) is not None
+                    if not held and charge is None:
+                        return []
+                    pipe.multi()
+                    if held:
+                        pipe.zrem(holds, member)
+                        pipe.hincrby(key, "reserved", -tokens)
+                    if charge is not None:
+                        pipe.hincrby(key, "used", charge)
+                        pipe.hget(key, "total")
+                    result: list[Any] = await pipe.execute()
+                except WatchError:
+                    continue  # the hold changed under us; re-check it
+                return result
+
+    async def _sweep_expired(self, client: Any, budget_id: UUID) -> None:
+        expired = await client.zrangebyscore(
+            _holds_key(budget_id), "-inf", self._clock(), start=0, num=_SWEEP_BATCH
+        )
+        for raw in expired:
+            member = raw.decode() if isinstance(raw, bytes) else raw
+            await self._return_hold(client, budget_id, member, int(member.rsplit(":", 1)[1]))
+
+
+def _budget_key(budget_id: UUID) -> str:
+    return f"{BUDGET_KEY_PREFIX}:{budget_id}"
+
+
+def _holds_key(budget_id: UUID) -> str:
+    return f"{BUDGET_KEY_PREFIX}:{budget_id}:holds"
+
+
+def _member(reservation: Reservation) -> str:
+    # The held amount travels with the member so the sweep needs no extra key
+    return f"{reservation.reservation_id}:{reservation.tokens}"
@@ -0,0 +1,216 @@
+"""PostgreSQL store for LLM and tool usage records.
+
+Task card: I2-3c
+- Batched write-behind target for UsageTracker (one multi-row INSERT per batch)
+- llm_usage_records (012) and tool_usage_records (006)
+- Per-org lifetime totals for seeding running counters at startup
+- Per-org per-day totals since a date (current month) for seeding the
+  day rollups the monthly budget check reads
+
+Architecture: delivery/phase2-runtime-config.yaml (billing section)
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy as sa
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class PgUsageStore:
+    """Batch writer / aggregate reader over the usage tables.
+
+    Records are duck-typed (attribute access only) so callers in other
+    layers do not need to import a shared record type.
+    """
+
+    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def write_llm_usage(self, records: Sequence[Any]) -> None:
+        """Insert LLM usage records with one multi-row INSERT and one commit."""
+        from src.infra.models import LLMUsageRecordModel
+
+        if not records:
+            return
+        stmt = sa.insert(LLMUsageRecordModel).values(
+            [
+                {
+                    "id": r.id,
+                    "org_id": r.org_id,
+                    "user_id": r.user_id,
+                    "brand_id": r.brand_id,
+                    "model_id": r.model_id,
+                    "provider": r.provider,
+                    "input_tokens": r.input_tokens,
+                    "output_tokens": r.output_tokens,
+                    "total_tokens": r.total_tokens,
+                    "cost_amount": (None if r.cost_amount is None else Decimal(str(r.cost_amount))),
+                    "skill_id": r.skill_id,
+                    "task_id": r.task_id,
+                    "created_at": r.created_at,
+                }
+                for r in records
+            ]
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def write_tool_usage(self, records: Sequence[Any]) -> None:
+        """Insert tool usage records with one multi-row INSERT and one commit."""
+        from src.infra.models import ToolUsageRecordModel
+
+        if not records:
+            return
+        stmt = sa.insert(ToolUsageRecordModel).values(
+            [
+                {
+                    "org_id": r.org_id,
+                    "user_id": r.user_id,
+                    "brand_id": r.brand_id,
+                    "tool_name": r.tool_name,
+                    "tool_version": r.tool_version,
+                    "skill_id": r.skill_id,
+                    "duration_ms": r.duration_ms,
+                    "cost_amount": Decimal(str(r.cost_amount)),
+                    "billing_unit": r.billing_unit,
+                    "status": r.status,
+                    "created_at": r.created_at,
+                }
+                for r in records
+            ]
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def load_org_totals(self) -> list[dict[str, Any]]:
+        """Lifetime per-org totals from both usage tables (two GROUP BYs).
+
+        Returns one dict per org with input_tokens, output_tokens,
+        record_count, tool_calls and tool_cost.
+        """
+        from src.infra.models import LLMUsageRecordModel as Llm
+        from src.infra.models import ToolUsageRecordModel as Tool
+
+        llm_stmt = sa.select(
+            Llm.org_id,
+            sa.func.coalesce(sa.func.sum(Llm.input_tokens), 0),
+            sa.func.coalesce(sa.func.sum(Llm.output_tokens), 0),
+            sa.func.count(),
+        ).group_by(Llm.org_id)
+        tool_stmt = sa.select(
+            Tool.org_id,
+            sa.func.count(),
+            sa.func.coalesce(sa.func.sum(Tool.cost_amount), 0),
+        ).group_by(Tool.org_id)
+
+        async with self._session_factory() as session:
+            llm_rows = (await session.execute(llm_stmt)).all()
+            tool_rows = (await session.execute(tool_stmt)).all()
+
+        totals: dict[Any, dict[str, Any]] = {}
+        for org_id, input_tokens, output_tokens, count in llm_rows:
+            totals[org_id] = {
+                "org_id": org_id,
+                "input_tokens": int(input_tokens),
+                "output_tokens": int(output_tokens),
+                "record_count": int(count),
+                "tool_calls": 0,
+                "tool_cost": 0.0,
+            }
+        for org_id, calls, cost in tool_rows:
+            entry = totals.setdefault(
+                org_id,
+                {
+                    "org_id": org_id,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "record_count": 0,
+                },
+            )
+            entry["tool_calls"] = int(calls)
+            entry["tool_cost"] = float(cost)
+        return list(totals.values())
+
+    async def load_day_totals(self, since: datetime) -> list[dict[str, Any]]:
+        """Per-org, per-UTC-day totals of records created at or after since.
+
+        Returns one dict per (org, day) with day (aware UTC midnight),
+        input_tokens, output_tokens, record_count, tool_calls and tool_cost.
+        Both scans use the (org_id, created_at) indexes' created_at bound.
+        """
+        from src.infra.models import LLMUsageRecordModel as Llm
+        from src.infra.models import ToolUsageRecordModel as Tool
+
+        def utc_day(column: Any) -> Any:
+            return sa.func.date_trunc("day", sa.func.timezone("UTC", column))
+
+        llm_day = utc_day(Llm.created_at)
+        llm_stmt = (
+            sa.select(
+                Llm.org_id,
+                llm_day,
+                sa.func.coalesce(sa.func.sum(Llm.input_tokens), 0),
+                sa.func.coalesce(sa.func.sum(Llm.output_tokens), 0),
+                sa.func.count(),
+            )
+            .where(Llm.created_at >= since)
+            .group_by(Llm.org_id, llm_day)
+        )
+        tool_day = utc_day(Tool.created_at)
+        tool_stmt = (
+            sa.select(
+                Tool.org_id,
+                tool_day,
+                sa.func.count(),
+                sa.func.coalesce(sa.func.sum(Tool.cost_amount), 0),
+            )
+            .where(Tool.created_at >= since)
+            .group_by(Tool.org_id, tool_day)
+        )
+
+        async with self._session_factory() as session:
+            llm_rows = (await session.execute(llm_stmt)).all()
+            tool_rows = (await session.execute(tool_stmt)).all()
+
+        totals: dict[tuple[Any, datetime], dict[str, Any]] = {}
+        for org_id, day, input_tokens, output_tokens, count in llm_rows:
+            key = (org_id, _as_utc(day))
+            totals[key] = {
+                "org_id": org_id,
+                "day": key[1],
+                "input_tokens": int(input_tokens),
+                "output_tokens": int(output_tokens),
+                "record_count": int(count),
+                "tool_calls": 0,
+                "tool_cost": 0.0,
+            }
+        for org_id, day, calls, cost in tool_rows:
+            key = (org_id, _as_utc(day))
+            entry = totals.setdefault(
+                key,
+                {
+                    "org_id": org_id,
+                    "day": key[1],
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "record_count": 0,
+                },
+            )
+            entry["tool_calls"] = int(calls)
+            entry["tool_cost"] = float(cost)
+        return list(totals.values())
+
+
+def _as_utc(day: datetime) -> datetime:
+    """date_trunc over timezone('UTC', ...) yields a naive UTC timestamp."""
+    return day.replace(tzinfo=UTC) if day.tzinfo is None else day.astimezone(UTC)
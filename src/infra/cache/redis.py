@@ -46,6 +46,17 @@ class RedisStorageAdapter(StoragePort):
         else:
             await client.set(key, encoded)
 
+    async def put_if_absent(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> bool:
+        """Atomic SET NX (with optional TTL); True if this call stored the value."""
+        client = await self._get_client()
+        encoded = json.dumps(value).encode("utf-8")
+        return bool(await client.set(key, encoded, ex=ttl, nx=True))
+
     async def get(self, key: str) -> Any | None:
         """Retrieve a value by key, returning None if absent or expired."""
         client = await self._get_client()
@@ -0,0 +1,13 @@
+"""PostgreSQL adapters for Memory Core batch jobs."""
+
+from .consolidation import PgConsolidationSource
+from .promotion import PgPromotionSource
+from .purge import PgPurgeStore
+from .sessions import PgCompletedSessions
+
+__all__ = [
+    "PgCompletedSessions",
+    "PgConsolidationSource",
+    "PgPromotionSource",
+    "PgPurgeStore",
+]
@@ -0,0 +1,249 @@
+"""PostgreSQL source for the batch memory consolidation job.
+
+- ConsolidationSource over memory_items: keyset-paginated user scan
+- LSH buckets in one statement per user: active rows grouped by
+  (memory_type, minhash_bands key); rows without bands are backfilled first
+- Pairwise similarity by pgvector, one statement per candidate group
+- Merges in one transaction: the new version (leader's content, embedding
+  and band keys, union of source sessions) is inserted and the leader and
+  members are retired together, or nothing is applied
+
+Architecture: Section 2.2 (Memory evolution), ADR-033 (MemoryItem versioning)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import sqlalchemy as sa
+
+from src.memory.consolidation import merged_confidence, merged_sessions
+from src.memory.items import row_to_memory_item
+from src.shared.similarity import band_keys, minhash_signature
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.memory.consolidation import Cluster
+    from src.memory.working_set import MemoryWorkingSet
+    from src.shared.types import MemoryItem
+
+_INSERT_MERGED_VERSION = sa.text(
+    """
+    INSERT INTO memory_items (
+        id, org_id, user_id, memory_type, content, confidence, epistemic_type,
+        version, source_sessions, provenance, embedding, minhash_bands,
+        last_validated_at, valid_at
+    )
+    SELECT CAST(:new_id AS uuid), src.org_id, src.user_id, src.memory_type,
+           src.content, :confidence, src.epistemic_type, src.version + 1,
+           CAST(:source_sessions AS uuid[]), src.provenance, src.embedding,
+           src.minhash_bands, src.last_validated_at, now()
+    FROM memory_items AS src
+    WHERE src.id = :leader_id
+      AND src.org_id = :org_id
+      AND src.superseded_by IS NULL
+    RETURNING user_id
+    """
+)
+
+_BAND_BUCKETS = sa.text(
+    """
+    SELECT array_agg(b.id ORDER BY b.id)
+    FROM (
+        SELECT id, memory_type, unnest(minhash_bands) AS band
+        FROM memory_items
+        WHERE org_id = :org_id
+          AND user_id = :user_id
+          AND superseded_by IS NULL
+          AND invalid_at IS NULL
+    ) AS b
+    GROUP BY b.memory_type, b.band
+    HAVING count(*) > 1
+    """
+)
+
+_BACKFILL_BANDS = sa.text(
+    "UPDATE memory_items SET minhash_bands = CAST(:bands AS integer[]) WHERE id = :id"
+)
+
+_SUPERSEDE_CLUSTER = sa.text(
+    """
+    UPDATE memory_items
+    SET superseded_by = CAST(:new_id AS uuid), invalid_at = now()
+    WHERE id = ANY(CAST(:ids AS uuid[]))
+      AND org_id = :org_id
+      AND superseded_by IS NULL
+    """
+)
+
+
+class PgConsolidationSource:
+    """PostgreSQL-backed ConsolidationSource.
+
+    A merge is a single transaction: it inserts the next version of the
+    leader and supersedes the leader and every member. If any of them was
+    retired concurrently the transaction is not committed and the merge
+    raises; the surviving items are clustered again by the next run.
+
+    Args:
+        session_factory: Async session factory.
+        working_set: Optional per-user memory cache, invalidated after a merge.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        working_set: MemoryWorkingSet | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._working_set = working_set
+
+    async def list_users(self, org_id: UUID, *, after: UUID | None, limit: int) -> list[UUID]:
+        from src.infra.models import MemoryItemModel
+
+        stmt = (
+            sa.select(MemoryItemModel.user_id)
+            .where(
+                MemoryItemModel.org_id == org_id,
+                MemoryItemModel.superseded_by.is_(None),
+                MemoryItemModel.invalid_at.is_(None),
+            )
+            .distinct()
+            .order_by(MemoryItemModel.user_id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(MemoryItemModel.user_id > after)
+
+        async with self._session_factory() as session:
+            result = await session.scalars(stmt)
+            return list(result.all())
+
+    async def band_buckets(self, org_id: UUID, user_id: UUID) -> list[list[UUID]]:
+        from src.infra.models import MemoryItemModel
+
+        unbanded = sa.select(MemoryItemModel.id, MemoryItemModel.content).where(
+            MemoryItemModel.org_id == org_id,
+            MemoryItemModel.user_id == user_id,
+            MemoryItemModel.superseded_by.is_(None),
+            MemoryItemModel.invalid_at.is_(None),
+            MemoryItemModel.minhash_bands.is_(None),
+        )
+        async with self._session_factory() as session:
+            # Rows written without the dedup path carry no bands yet
+            missing = (await session.execute(unbanded)).fetchall()
+            if missing:
+                await session.execute(
+                    _BACKFILL_BANDS,
+                    [
+                        {"id": str(row[0]), "bands": band_keys(minhash_signature(row[1]))}
+                        for row in missing
+                    ],
+                )
+                await session.commit()
+
+            cursor = await session.execute(
+                _BAND_BUCKETS, {"org_id": str(org_id), "user_id": str(user_id)}
+            )
+            rows = cursor.fetchall()
+
+        return [list(row[0]) for row in rows]
+
+    async def get_active(self, org_id: UUID, memory_ids: list[UUID]) -> list[MemoryItem]:
+        from src.infra.models import MemoryItemModel
+
+        stmt = (
+            sa.select(MemoryItemModel)
+            .where(
+                MemoryItemModel.org_id == org_id,
+                MemoryItemModel.id.in_(memory_ids),
+                MemoryItemModel.superseded_by.is_(None),
+                MemoryItemModel.invalid_at.is_(None),
+            )
+            .order_by(MemoryItemModel.id)
+        )
+        async with self._session_factory() as session:
+            result = await session.scalars(stmt)
+            rows = result.all()
+
+        return [row_to_memory_item(row) for row in rows]
+
+    async def similar_pairs(
+        self,
+        org_id: UUID,
+        memory_ids: list[UUID],
+        *,
+        threshold: float,
+    ) -> list[tuple[UUID, UUID, float]]:
+        if len(memory_ids) < 2:
+            return []
+        sql = sa.text(
+            """
+            SELECT a.id, b.id, 1 - (a.embedding <=> b.embedding) AS similarity
+            FROM memory_items a
+            JOIN memory_items b
+              ON b.id = ANY(CAST(:ids AS uuid[]))
+             AND a.id < b.id
+             AND b.memory_type = a.memory_type
+             AND b.org_id = a.org_id
+            WHERE a.id = ANY(CAST(:ids AS uuid[]))
+              AND a.org_id = :org_id
+              AND a.embedding IS NOT NULL
+              AND b.embedding IS NOT NULL
+              AND 1 - (a.embedding <=> b.embedding) >= :threshold
+            """
+        )
+        async with self._session_factory() as session:
+            cursor = await session.execute(
+                sql,
+                {
+                    "ids": [str(mid) for mid in memory_ids],
+                    "org_id": str(org_id),
+                    "threshold": threshold,
+                },
+            )
+            rows = cursor.fetchall()
+
+        return [(row[0], row[1], float(row[2])) for row in rows]
+
+    async def merge(self, org_id: UUID, cluster: Cluster) -> UUID:
+        new_id = uuid4()
+        member_ids = [str(m.memory_id) for m in cluster.members]
+        async with self._session_factory() as session:
+            created = await session.execute(
+                _INSERT_MERGED_VERSION,
+                {
+                    "new_id": str(new_id),
+                    "leader_id": str(cluster.leader.memory_id),
+                    "org_id": str(org_id),
+                    "confidence": merged_confidence(cluster),
+                    "source_sessions": [str(s) for s in merged_sessions(cluster)],
+                },
+            )
+            user_id = created.scalar_one_or_none()
+            if user_id is None:
+                msg = f"MemoryItem {cluster.leader.memory_id} is no longer active"
+                raise KeyError(msg)
+            retired = await session.execute(
+                _SUPERSEDE_CLUSTER,
+                {
+                    "new_id": str(new_id),
+                    "ids": [str(cluster.leader.memory_id), *member_ids],
+                    "org_id": str(org_id),
+                },
+            )
+            if int(getattr(retired, "rowcount", 0) or 0) != len(member_ids) + 1:
+                # A member was retired since the scan; the session closes
+                # without commit, so nothing of this merge is applied.
+                msg = f"Cluster of {cluster.leader.memory_id} changed during the merge"
+                raise KeyError(msg)
+            await session.commit()
+
+        if self._working_set is not None:
+            await self._working_set.invalidate(user_id)
+        return new_id
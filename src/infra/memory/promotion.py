@@ -0,0 +1,168 @@
+"""PostgreSQL source for the batch promotion candidate scanner.
+
+Milestone: MC3-1
+- PromotionCandidateSource over memory_items, memory_receipt_daily and
+  memory_promotion_proposals
+- One candidate statement per chunk; proposals written with one multi-row
+  INSERT ... ON CONFLICT (source_memory_id) DO NOTHING
+
+See: docs/architecture/02-Knowledge Section 7.2 (Promotion Pipeline)
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from src.memory.promotion.scanner import PromotionCandidate
+from src.memory.receipt import window_start
+from src.shared.types import MemoryItem
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.memory.promotion.pipeline import EvolutionProposal, PromotionThresholds
+
+
+class PgPromotionSource:
+    """PostgreSQL-backed PromotionCandidateSource.
+
+    scan_candidates is a single statement per chunk: keyset scan of active
+    memory_items filtered by confidence and age, a LATERAL sum over the
+    item's memory_receipt_daily rows for the 30-day frequency, and an
+    anti-join on memory_promotion_proposals. Proposals are written with
+    one multi-row INSERT ... ON CONFLICT (source_memory_id) DO NOTHING.
+    """
+
+    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def scan_candidates(
+        self,
+        org_id: UUID,
+        *,
+        thresholds: PromotionThresholds,
+        after: UUID | None,
+        limit: int,
+        now: datetime,
+    ) -> list[PromotionCandidate]:
+        sql = sa.text(
+            """
+            SELECT m.id, m.user_id, m.memory_type, m.content, m.confidence,
+                   m.epistemic_type, m.version, m.source_sessions, m.provenance,
+                   m.valid_at, f.frequency, m.embedding::text AS embedding
+            FROM memory_items m
+            CROSS JOIN LATERAL (
+                SELECT COALESCE(SUM(d.count), 0) AS frequency
+                FROM memory_receipt_daily d
+                WHERE d.memory_item_id = m.id
+                  AND d.day >= :window_start
+            ) f
+            WHERE m.org_id = :org_id
+              AND m.superseded_by IS NULL
+              AND m.invalid_at IS NULL
+              AND m.confidence >= :confidence_min
+              AND m.valid_at <= :oldest
+              AND m.id > CAST(:after AS uuid)
+              AND f.frequency >= :frequency_min
+              AND NOT EXISTS (
+                  SELECT 1 FROM memory_promotion_proposals p
+                  WHERE p.source_memory_id = m.id
+              )
+            ORDER BY m.id
+            LIMIT :limit
+            """
+        )
+        params = {
+            "org_id": str(org_id),
+            "window_start": window_start(30, now),
+            "confidence_min": thresholds.confidence_min,
+            "oldest": now - timedelta(days=thresholds.min_age_days),
+            "after": str(after or UUID(int=0)),
+            "frequency_min": thresholds.frequency_min_30d,
+            "limit": limit,
+        }
+        async with self._session_factory() as session:
+            cursor = await session.execute(sql, params)
+            rows = cursor.fetchall()
+
+        return [
+            PromotionCandidate(
+                memory=MemoryItem(
+                    memory_id=row[0],
+                    user_id=row[1],
+                    memory_type=row[2],
+                    content=row[3],
+                    confidence=row[4],
+                    epistemic_type=row[5],
+                    version=row[6],
+                    source_sessions=list(row[7]) if row[7] else [],
+                    provenance=row[8],
+                    valid_at=row[9],
+                ),
+                frequency_30d=int(row[10]),
+                embedding=json.loads(row[11]) if row[11] else None,
+            )
+            for row in rows
+        ]
+
+    async def pending_counts(self, org_id: UUID, user_ids: list[UUID]) -> dict[UUID, int]:
+        from src.infra.models import MemoryPromotionProposalModel as Proposal
+
+        if not user_ids:
+            return {}
+        stmt = (
+            sa.select(Proposal.user_id, sa.func.count())
+            .where(
+                Proposal.org_id == org_id,
+                Proposal.status == "pending_approval",
+                Proposal.user_id.in_(user_ids),
+            )
+            .group_by(Proposal.user_id)
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            rows = result.fetchall()
+        return {user_id: int(n) for user_id, n in rows}
+
+    async def save_proposals(self, org_id: UUID, proposals: list[EvolutionProposal]) -> int:
+        from sqlalchemy.dialects.postgresql import insert
+
+        from src.infra.models import MemoryPromotionProposalModel as Proposal
+
+        if not proposals:
+            return 0
+        stmt = (
+            insert(Proposal)
+            .values(
+                [
+                    {
+                        "id": p.proposal_id,
+                        "org_id": org_id,
+                        "user_id": p.user_id,
+                        "source_memory_id": p.source_memory_id,
+                        "status": p.status,
+                        "sanitized_content": p.sanitized_content,
+                        "confidence": p.confidence,
+                        "target_visibility": p.target_visibility,
+                        "similar_knowledge_id": p.similar_knowledge_id,
+                        "similarity_score": p.similarity_score,
+                        "rejection_reason": p.rejection_reason,
+                        "created_at": p.created_at,
+                        "expires_at": p.expires_at,
+                    }
+                    for p in proposals
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[Proposal.source_memory_id])
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
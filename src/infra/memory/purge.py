@@ -0,0 +1,72 @@
+"""PostgreSQL store for the bulk purge engine.
+
+Task card: MC4-1 / MC4-3 / ADR-039
+- PurgeStore over memory_items: keyset chunks of (id, provenance object keys)
+- Chunked DELETE per org; memory_receipts rows cascade via FK
+
+Architecture: Section 2.1 (Memory Core Deletion Pipeline)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+
+from src.memory.deletion.purge import PurgeTarget
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.memory.deletion.purge import PurgeRequest
+
+
+class PgPurgeStore:
+    """PostgreSQL-backed PurgeStore.
+
+    Media attached to a memory is referenced from provenance['object_keys'].
+    memory_receipts rows go with the item via ON DELETE CASCADE.
+    """
+
+    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def fetch_chunk(
+        self,
+        request: PurgeRequest,
+        *,
+        after: UUID | None,
+        limit: int,
+    ) -> list[PurgeTarget]:
+        from src.infra.models import MemoryItemModel
+
+        stmt = (
+            sa.select(MemoryItemModel.id, MemoryItemModel.provenance["object_keys"])
+            .where(MemoryItemModel.org_id == request.org_id)
+            .order_by(MemoryItemModel.id)
+            .limit(limit)
+        )
+        if request.user_id is not None:
+            stmt = stmt.where(MemoryItemModel.user_id == request.user_id)
+        if after is not None:
+            stmt = stmt.where(MemoryItemModel.id > after)
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            rows = result.fetchall()
+
+        return [PurgeTarget(memory_id=row[0], object_keys=tuple(row[1] or ())) for row in rows]
+
+    async def delete_rows(self, org_id: UUID, memory_ids: list[UUID]) -> int:
+        from src.infra.models import MemoryItemModel
+
+        stmt = sa.delete(MemoryItemModel).where(
+            MemoryItemModel.org_id == org_id,
+            MemoryItemModel.id.in_(memory_ids),
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
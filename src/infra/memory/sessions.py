@@ -0,0 +1,124 @@
+"""PostgreSQL source of completed sessions for batch evolution.
+
+Task card: MC2-5
+- Streams CompletedSession records from conversation_events for
+  BatchEvolutionRunner (via evolution_batch_task)
+- A session belongs to the UTC day of its last message; a day's stream is
+  ordered by session_id, so once the day is over the runner's checkpointed
+  offset addresses the same sessions on every replay
+- Keyset-paged: one statement for a page of sessions, one for their messages
+
+A session that continues past midnight is streamed again on its new day;
+the Memory Core write path reinforces the repeated facts instead of
+inserting them twice.
+
+Architecture: Section 2.2 (Three-stage async pipeline)
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from src.memory.evolution.batch import CompletedSession
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_MESSAGE_TYPES = ("user_message", "assistant_message")
+
+_SESSION_PAGE = sa.text(
+    """
+    SELECT session_id, org_id, min(CAST(user_id AS text)) AS user_id
+    FROM conversation_events
+    WHERE event_type IN :event_types
+      AND session_id > :after
+    GROUP BY session_id, org_id
+    HAVING max(created_at) >= :start
+       AND max(created_at) < :end
+       AND count(user_id) > 0
+    ORDER BY session_id
+    LIMIT :limit
+    """
+).bindparams(sa.bindparam("event_types", expanding=True))
+
+_SESSION_MESSAGES = sa.text(
+    """
+    SELECT session_id, role, content->>'text' AS text
+    FROM conversation_events
+    WHERE session_id IN :session_ids
+      AND event_type IN :event_types
+    ORDER BY session_id, sequence_number
+    """
+).bindparams(
+    sa.bindparam("session_ids", expanding=True),
+    sa.bindparam("event_types", expanding=True),
+)
+
+
+class PgCompletedSessions:
+    """Completed conversations read back from conversation_events.
+
+    Args:
+        session_factory: Async session factory.
+        page_size: Sessions fetched per statement pair.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        page_size: int = 200,
+    ) -> None:
+        if page_size <= 0:
+            msg = f"page_size must be positive, got {page_size}"
+            raise ValueError(msg)
+        self._session_factory = session_factory
+        self._page_size = page_size
+
+    async def stream(self, day: str) -> AsyncIterator[CompletedSession]:
+        """Sessions whose last message falls on `day` (ISO date, UTC)."""
+        start = datetime.combine(date.fromisoformat(day), time.min, tzinfo=UTC)
+        after = UUID(int=0)
+        while True:
+            async with self._session_factory() as session:
+                cursor = await session.execute(
+                    _SESSION_PAGE,
+                    {
+                        "event_types": list(_MESSAGE_TYPES),
+                        "after": after,
+                        "start": start,
+                        "end": start + timedelta(days=1),
+                        "limit": self._page_size,
+                    },
+                )
+                page = cursor.fetchall()
+                if not page:
+                    return
+                cursor = await session.execute(
+                    _SESSION_MESSAGES,
+                    {
+                        "session_ids": [row[0] for row in page],
+                        "event_types": list(_MESSAGE_TYPES),
+                    },
+                )
+                messages: dict[UUID, list[dict[str, str]]] = {}
+                for session_id, role, text in cursor.fetchall():
+                    if text:
+                        messages.setdefault(session_id, []).append({"role": role, "content": text})
+
+            for session_id, org_id, user_id in page:
+                yield CompletedSession(
+                    session_id=session_id,
+                    org_id=org_id,
+                    user_id=UUID(user_id),
+                    messages=messages.get(session_id, []),
+                )
+            if len(page) < self._page_size:
+                return
+            after = page[-1][0]
@@ -5,6 +5,14 @@ Maps to migration DDL in migrations/versions/:
   002_create_audit_events_table.py   -> AuditEvent
   003_create_conversation_events.py  -> ConversationEvent
   004_create_memory_items.py         -> MemoryItemModel, MemoryReceiptModel
+  006_create_tool_usage_records.py   -> ToolUsageRecordModel
+  007_memory_item_minhash.py         -> MemoryItemModel (dedup LSH band keys)
+  008_memory_receipt_daily.py        -> MemoryReceiptDailyModel
+  009_memory_promotion_proposals.py  -> MemoryPromotionProposalModel
+  010_memory_feedback.py             -> MemoryFeedbackModel
+  011_conversation_events_partitioning.py -> ConversationEvent (monthly partitions)
+  012_llm_usage_records.py           -> LLMUsageRecordModel
+  013_memory_write_keys.py           -> MemoryWriteKeyModel
 
 These models live in the Infrastructure layer and implement
 persistence for Port interfaces. Brain/Knowledge/Skill layers
@@ -16,7 +24,8 @@ See: docs/architecture/00-*.md Section 6 (Infrastructure)
 from __future__ import annotations
 
 import uuid as _uuid  # noqa: TC003 -- SQLAlchemy resolves Mapped[] annotations at runtime
-from datetime import datetime  # noqa: TC003
+from datetime import date, datetime  # noqa: TC003
+from decimal import Decimal  # noqa: TC003
 from typing import Any
 
 import sqlalchemy as sa
@@ -328,7 +337,10 @@ class AuditEvent(Base):
 class ConversationEvent(Base):
     """Conversation event (message/turn record).
 
-    See: 003_create_conversation_events migration
+    Range-partitioned by month on created_at, so created_at is part of the
+    primary key and of the per-session ordering constraint.
+
+    See: 003_create_conversation_events, 011_conversation_events_partitioning
     """
 
     __tablename__ = "conversation_events"
@@ -375,7 +387,7 @@ class ConversationEvent(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True),
-        nullable=False,
+        primary_key=True,
         server_default=_NOW,
     )
 
@@ -386,9 +398,11 @@ class ConversationEvent(Base):
         sa.UniqueConstraint(
             "session_id",
             "sequence_number",
+            "created_at",
             name="ix_conversation_events_session_seq",
         ),
         sa.Index("ix_conversation_events_created_at", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
 
@@ -444,6 +458,11 @@ class MemoryItemModel(Base):
     )
     # Note: embedding column is vector(1536), managed via raw SQL in migration 004.
     # Access via raw SQL or pgvector-sqlalchemy extension.
+    minhash_bands: Mapped[list[int] | None] = mapped_column(
+        postgresql.ARRAY(sa.Integer()),
+        nullable=True,
+        comment="MinHash LSH band keys for near-duplicate probing",
+    )
     valid_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True),
         nullable=False,
@@ -481,6 +500,11 @@ class MemoryItemModel(Base):
         sa.Index("ix_memory_items_memory_type", "memory_type"),
         sa.Index("ix_memory_items_valid_at", "valid_at"),
         sa.Index("ix_memory_items_superseded_by", "superseded_by"),
+        sa.Index(
+            "ix_memory_items_minhash_bands",
+            "minhash_bands",
+            postgresql_using="gin",
+        ),
     )
 
 
@@ -535,14 +559,229 @@ class MemoryReceiptModel(Base):
     )
 
 
+class MemoryReceiptDailyModel(Base):
+    """Daily receipt counts per memory item and type (incremental rollup).
+
+    See: 008_memory_receipt_daily migration
+    """
+
+    __tablename__ = "memory_receipt_daily"
+
+    memory_item_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("memory_items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    receipt_type: Mapped[str] = mapped_column(sa.String(32), primary_key=True)
+    day: Mapped[date] = mapped_column(sa.Date(), primary_key=True)
+    org_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    count: Mapped[int] = mapped_column(
+        sa.Integer(),
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+
+    __table_args__ = (sa.Index("ix_memory_receipt_daily_org_day", "org_id", "day"),)
+
+
+class MemoryPromotionProposalModel(Base):
+    """Memory-to-knowledge promotion proposal (one per evaluated memory).
+
+    See: 009_memory_promotion_proposals migration
+    """
+
+    __tablename__ = "memory_promotion_proposals"
+
+    id: Mapped[_uuid.UUID] = mapped_column(_UUID, primary_key=True)
+    org_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[_uuid.UUID] = mapped_column(_UUID, nullable=False)
+    source_memory_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("memory_items.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(sa.String(32), nullable=False)
+    sanitized_content: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    confidence: Mapped[float] = mapped_column(sa.Float(), nullable=False)
+    target_visibility: Mapped[str] = mapped_column(sa.String(16), nullable=False)
+    similar_knowledge_id: Mapped[_uuid.UUID | None] = mapped_column(_UUID, nullable=True)
+    similarity_score: Mapped[float | None] = mapped_column(sa.Float(), nullable=True)
+    rejection_reason: Mapped[str | None] = mapped_column(sa.String(256), nullable=True)
+    approved_by: Mapped[_uuid.UUID | None] = mapped_column(_UUID, nullable=True)
+    approved_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    knowledge_id: Mapped[_uuid.UUID | None] = mapped_column(_UUID, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=_NOW,
+    )
+    expires_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        sa.Index("uq_memory_promotion_proposals_source", "source_memory_id", unique=True),
+        sa.Index("ix_memory_promotion_proposals_org_status", "org_id", "status", "user_id"),
+    )
+
+
+class MemoryFeedbackModel(Base):
+    """Negative-feedback counter and fuse state per memory item.
+
+    See: 010_memory_feedback migration
+    """
+
+    __tablename__ = "memory_feedback"
+
+    memory_item_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("memory_items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    org_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[_uuid.UUID] = mapped_column(_UUID, nullable=False)
+    negative_count: Mapped[int] = mapped_column(sa.Integer(), nullable=False, server_default="0")
+    fused_at: Mapped[datetime | None] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=_NOW,
+    )
+
+    __table_args__ = (
+        sa.Index(
+            "ix_memory_feedback_user_fused",
+            "user_id",
+            postgresql_where=sa.text("fused_at IS NOT NULL"),
+        ),
+    )
+
+
+class MemoryWriteKeyModel(Base):
+    """Idempotency key of one applied batch memory write.
+
+    See: 013_memory_write_keys migration
+    """
+
+    __tablename__ = "memory_write_keys"
+
+    write_key: Mapped[_uuid.UUID] = mapped_column(_UUID, primary_key=True)
+    org_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    applied_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=_NOW,
+    )
+
+
+class LLMUsageRecordModel(Base):
+    """Token usage of one LLM call (billing metering).
+
+    See: 012_llm_usage_records migration
+    """
+
+    __tablename__ = "llm_usage_records"
+
+    id: Mapped[_uuid.UUID] = mapped_column(_UUID, primary_key=True)
+    org_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[_uuid.UUID] = mapped_column(_UUID, nullable=False)
+    brand_id: Mapped[_uuid.UUID | None] = mapped_column(_UUID, nullable=True)
+    model_id: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    provider: Mapped[str | None] = mapped_column(sa.Text(), nullable=True)
+    input_tokens: Mapped[int] = mapped_column(sa.Integer(), nullable=False)
+    output_tokens: Mapped[int] = mapped_column(sa.Integer(), nullable=False)
+    total_tokens: Mapped[int] = mapped_column(sa.Integer(), nullable=False)
+    cost_amount: Mapped[Decimal | None] = mapped_column(
+        sa.Numeric(precision=12, scale=6), nullable=True
+    )
+    skill_id: Mapped[str | None] = mapped_column(sa.Text(), nullable=True)
+    task_id: Mapped[str | None] = mapped_column(sa.Text(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=_NOW,
+    )
+
+    __table_args__ = (
+        sa.Index("ix_llm_usage_org_created", "org_id", "created_at"),
+        sa.Index("ix_llm_usage_user_created", "user_id", "created_at"),
+    )
+
+
+class ToolUsageRecordModel(Base):
+    """Billing record of one tool call, separate from LLM tokens.
+
+    See: 006_create_tool_usage_records migration
+    """
+
+    __tablename__ = "tool_usage_records"
+
+    id: Mapped[int] = mapped_column(sa.BigInteger(), primary_key=True, autoincrement=True)
+    org_id: Mapped[_uuid.UUID] = mapped_column(
+        _UUID,
+        sa.ForeignKey("organizations.id"),
+        nullable=False,
+    )
+    user_id: Mapped[_uuid.UUID] = mapped_column(_UUID, nullable=False)
+    brand_id: Mapped[_uuid.UUID | None] = mapped_column(_UUID, nullable=True)
+    tool_name: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    tool_version: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    skill_id: Mapped[str | None] = mapped_column(sa.Text(), nullable=True)
+    input_summary: Mapped[str | None] = mapped_column(sa.Text(), nullable=True)
+    duration_ms: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    cost_amount: Mapped[Decimal] = mapped_column(sa.Numeric(precision=12, scale=6), nullable=False)
+    billing_unit: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    status: Mapped[str] = mapped_column(sa.Text(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=_NOW,
+    )
+
+    __table_args__ = (
+        sa.CheckConstraint(
+            "status IN ('success', 'error', 'rate_limited')",
+            name="ck_tool_usage_status",
+        ),
+        sa.Index("ix_tool_usage_org_created", "org_id", "created_at"),
+        sa.Index("ix_tool_usage_user_created", "user_id", "created_at"),
+    )
+
+
 __all__ = [
     "AuditEvent",
     "Base",
     "ConversationEvent",
+    "LLMUsageRecordModel",
+    "MemoryFeedbackModel",
     "MemoryItemModel",
+    "MemoryPromotionProposalModel",
+    "MemoryReceiptDailyModel",
     "MemoryReceiptModel",
     "OrgMember",
     "OrgSettings",
     "Organization",
+    "ToolUsageRecordModel",
     "User",
 ]
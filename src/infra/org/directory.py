@@ -0,0 +1,43 @@
+"""Organization directory reads for background jobs.
+
+Task card: I2-2 (memory batch jobs)
+- PgOrgDirectory.active_org_ids: the orgs a per-org sweep (consolidation,
+  promotion scan) runs for
+
+Architecture: 06 Section 1 (Organization Model)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+
+from src.infra.models import Organization
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class PgOrgDirectory:
+    """Organization IDs read from the organizations table.
+
+    Args:
+        session_factory: Async session factory.
+    """
+
+    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def active_org_ids(self) -> list[UUID]:
+        """IDs of active organizations, in ID order."""
+        stmt = (
+            sa.select(Organization.id)
+            .where(Organization.is_active.is_(True))
+            .order_by(Organization.id)
+        )
+        async with self._session_factory() as session:
+            result = await session.scalars(stmt)
+            return list(result.all())
@@ -0,0 +1,140 @@
+"""S3/MinIO implementation of StoragePort for cold data.
+
+Task card: MC2-2 (retention)
+Layer: Infrastructure
+
+Stores JSON values as objects under an optional key prefix, so components
+written against StoragePort (e.g. EventArchive) can target object storage
+instead of Redis. TTLs are not enforced per object; expiry belongs to the
+bucket's lifecycle rules.
+
+boto3 is synchronous; calls run in a worker thread to keep the event loop
+free while archives are transferred.
+
+See: docs/architecture/00-*.md Section 12.3 (StoragePort)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import json
+import logging
+import os
+from typing import Any
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+_MISSING_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+_GLOB_CHARS = "*?["
+
+
+class S3StorageAdapter(StoragePort):
+    """StoragePort over one S3/MinIO bucket.
+
+    Args:
+        bucket: Target bucket.
+        prefix: Prepended to every key (e.g. "diyu/").
+        client: Pre-built S3 client; otherwise connect() builds one from
+            the same MINIO_* / AWS_* environment as S3Adapter.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        region: str = "us-east-1",
+        client: Any = None,
+    ) -> None:
+        self._bucket = bucket
+        self._prefix = prefix
+        self._endpoint_url = endpoint_url or os.environ.get(
+            "MINIO_ENDPOINT", "http://localhost:9000"
+        )
+        self._access_key = access_key or os.environ.get(
+            "MINIO_ACCESS_KEY", os.environ.get("AWS_ACCESS_KEY_ID", "")
+        )
+        self._secret_key = secret_key or os.environ.get(
+            "MINIO_SECRET_KEY", os.environ.get("AWS_SECRET_ACCESS_KEY", "")
+        )
+        self._region = region
+        self._client: Any = client
+
+    def connect(self) -> None:
+        """Create the S3 client (no network I/O until the first call)."""
+        self._client = boto3.client(
+            "s3",
+            endpoint_url=self._endpoint_url,
+            aws_access_key_id=self._access_key,
+            aws_secret_access_key=self._secret_key,
+            region_name=self._region,
+            config=Config(signature_version="s3v4"),
+        )
+        logger.info("S3 storage adapter connected: %s/%s", self._endpoint_url, self._bucket)
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            msg = "S3 not connected. Call connect() first."
+            raise RuntimeError(msg)
+        return self._client
+
+    async def put(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store a JSON value; ttl is left to bucket lifecycle rules."""
+        body = json.dumps(value).encode("utf-8")
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self._bucket,
+            Key=self._prefix + key,
+            Body=body,
+            ContentType="application/json",
+        )
+
+    async def get(self, key: str) -> Any | None:
+        body = await asyncio.to_thread(self._read_object, self._prefix + key)
+        return None if body is None else json.loads(body)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self.client.delete_object, Bucket=self._bucket, Key=self._prefix + key
+        )
+
+    async def list_keys(self, pattern: str) -> list[str]:
+        """List keys matching a glob; the literal head of the pattern is the S3 prefix."""
+        literal = pattern
+        for i, char in enumerate(pattern):
+            if char in _GLOB_CHARS:
+                literal = pattern[:i]
+                break
+        keys: list[str] = []
+        params: dict[str, Any] = {"Bucket": self._bucket, "Prefix": self._prefix + literal}
+        while True:
+            resp = await asyncio.to_thread(self.client.list_objects_v2, **params)
+            for obj in resp.get("Contents", []):
+                key = obj["Key"][len(self._prefix) :]
+                if fnmatch.fnmatchcase(key, pattern):
+                    keys.append(key)
+            if not resp.get("IsTruncated"):
+                return keys
+            params["ContinuationToken"] = resp["NextContinuationToken"]
+
+    def _read_object(self, key: str) -> bytes | None:
+        """Fetch and read an object body; blocking, so run in a worker thread."""
+        try:
+            resp = self.client.get_object(Bucket=self._bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") in _MISSING_CODES:
+                return None
+            raise
+        body: bytes = resp["Body"].read()
+        return body
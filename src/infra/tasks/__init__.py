@@ -1,5 +1,6 @@
 """Async task infrastructure (Celery + Redis Broker)."""
 
+from .background import BackgroundTaskExecutor
 from .celery_app import CeleryTaskManager, TaskResult, TaskStatus
 
-__all__ = ["CeleryTaskManager", "TaskResult", "TaskStatus"]
+__all__ = ["BackgroundTaskExecutor", "CeleryTaskManager", "TaskResult", "TaskStatus"]
@@ -0,0 +1,225 @@
+"""In-process async task executor with periodic schedules.
+
+Task card: I2-2 (memory batch jobs)
+- BackgroundTaskExecutor: TaskExecutor whose registered bodies are
+  coroutine functions run on the app's event loop, so they share its
+  database engine and Redis clients; send_task returns at once
+- schedule(): run a task once per interval_seconds slot (at startup and
+  at every slot boundary), once for each kwargs set a provider returns
+  (e.g. one per org); runs of one schedule are sequential
+- With a lease store, a StoragePort lease per slot lets exactly one worker
+  run it, however many app workers start the schedule
+- start() / close() bracket the app lifespan; close() cancels running
+  work, which resumes from its checkpoint on the next run
+
+Architecture: 06 Section 2 (Celery + Redis Broker)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from src.infra.tasks.celery_app import TaskResult, TaskStatus
+
+if TYPE_CHECKING:
+    from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY_PREFIX = "tasks:schedule"
+
+AsyncTaskBody = Callable[..., Awaitable[Any]]
+KwargsProvider = Callable[[], Awaitable[list[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class _Schedule:
+    task_name: str
+    interval_seconds: float
+    kwargs: KwargsProvider | None
+
+
+class BackgroundTaskExecutor:
+    """Runs async task bodies in the background of the running event loop.
+
+    Args:
+        leases: Optional cross-worker lease store (RedisStorageAdapter)
+            for scheduled runs.
+        max_results: Task results kept for get_result (oldest dropped).
+        clock: Wall clock in seconds (slot boundaries; injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        leases: StoragePort | None = None,
+        max_results: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_results <= 0:
+            msg = f"max_results must be positive, got {max_results}"
+            raise ValueError(msg)
+        self._leases = leases
+        self._max_results = max_results
+        self._clock = clock
+        self._registry: dict[str, AsyncTaskBody] = {}
+        self._schedules: list[_Schedule] = []
+        self._results: OrderedDict[UUID, TaskResult] = OrderedDict()
+        self._running: set[asyncio.Task[Any]] = set()
+        self._loops: list[asyncio.Task[None]] = []
+
+    def register(self, task_name: str, func: AsyncTaskBody) -> None:
+        """Register an async task body."""
+        self._registry[task_name] = func
+
+    def schedule(
+        self,
+        task_name: str,
+        *,
+        interval_seconds: float,
+        kwargs: KwargsProvider | None = None,
+    ) -> None:
+        """Run a registered task every interval once start() was called.
+
+        kwargs is awaited at each run; the task runs once per returned
+        kwargs set (no provider: once without arguments).
+        """
+        if task_name not in self._registry:
+            msg = f"Unknown task: {task_name}"
+            raise ValueError(msg)
+        if interval_seconds <= 0:
+            msg = f"interval_seconds must be positive, got {interval_seconds}"
+            raise ValueError(msg)
+        self._schedules.append(_Schedule(task_name, interval_seconds, kwargs))
+
+    def send_task(
+        self,
+        task_name: str,
+        args: tuple[Any, ...] | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> UUID:
+        """Start a task in the background; returns its ID at once.
+
+        Must be called from the running event loop.
+        """
+        result = self._new_result(task_name)
+        func = self._registry.get(task_name)
+        if func is None:
+            self._finish(result, error=f"Unknown task: {task_name}")
+            return result.task_id
+        task = asyncio.get_running_loop().create_task(
+            self._execute(result, func, args or (), kwargs or {})
+        )
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        return result.task_id
+
+    async def run_task(
+        self,
+        task_name: str,
+        args: tuple[Any, ...] | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> TaskResult:
+        """Run a task to completion and return its result."""
+        result = self._new_result(task_name)
+        func = self._registry.get(task_name)
+        if func is None:
+            self._finish(result, error=f"Unknown task: {task_name}")
+            return result
+        await self._execute(result, func, args or (), kwargs or {})
+        return result
+
+    def get_result(self, task_id: UUID) -> TaskResult | None:
+        """Retrieve result by task ID."""
+        return self._results.get(task_id)
+
+    async def run_scheduled(self, task_name: str) -> list[TaskResult]:
+        """Run the current slot of a schedule now (unless another worker holds it)."""
+        for schedule in self._schedules:
+            if schedule.task_name == task_name:
+                return await self._run_slot(schedule, self._slot(schedule))
+        msg = f"Task not scheduled: {task_name}"
+        raise ValueError(msg)
+
+    def start(self) -> None:
+        """Start the schedules (app startup); must run on the app's event loop."""
+        if self._loops:
+            return
+        loop = asyncio.get_running_loop()
+        self._loops = [loop.create_task(self._every(s)) for s in self._schedules]
+
+    async def close(self) -> None:
+        """Stop the schedules and cancel running tasks (app shutdown)."""
+        pending = [*self._loops, *self._running]
+        self._loops = []
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _every(self, schedule: _Schedule) -> None:
+        last_slot = None
+        while True:
+            slot = self._slot(schedule)
+            if slot != last_slot:
+                last_slot = slot
+                try:
+                    await self._run_slot(schedule, slot)
+                except Exception:
+                    logger.exception("Scheduled task %s failed", schedule.task_name)
+            interval = schedule.interval_seconds
+            await asyncio.sleep(interval - self._clock() % interval)
+
+    def _slot(self, schedule: _Schedule) -> int:
+        return int(self._clock() // schedule.interval_seconds)
+
+    async def _run_slot(self, schedule: _Schedule, slot: int) -> list[TaskResult]:
+        if self._leases is not None and not await self._leases.put_if_absent(
+            f"{LEASE_KEY_PREFIX}:{schedule.task_name}:{slot}",
+            str(uuid4()),
+            ttl=math.ceil(schedule.interval_seconds),
+        ):
+            return []  # another worker runs this slot
+        kwargs_sets = await schedule.kwargs() if schedule.kwargs is not None else [{}]
+        return [await self.run_task(schedule.task_name, kwargs=kw) for kw in kwargs_sets]
+
+    async def _execute(
+        self,
+        result: TaskResult,
+        func: AsyncTaskBody,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        result.status = TaskStatus.RUNNING
+        try:
+            output = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            self._finish(result, error="cancelled")
+            raise
+        except Exception as exc:
+            logger.exception("Task %s (%s) failed", result.task_name, result.task_id)
+            self._finish(result, error=str(exc))
+        else:
+            result.result = output
+            self._finish(result)
+
+    def _new_result(self, task_name: str) -> TaskResult:
+        result = TaskResult(task_id=uuid4(), task_name=task_name, status=TaskStatus.PENDING)
+        self._results[result.task_id] = result
+        while len(self._results) > self._max_results:
+            self._results.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _finish(result: TaskResult, *, error: str | None = None) -> None:
+        result.status = TaskStatus.FAILURE if error is not None else TaskStatus.SUCCESS
+        result.error = error
+        result.completed_at = datetime.now(UTC)
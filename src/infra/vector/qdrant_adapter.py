@@ -174,6 +174,19 @@ class QdrantAdapter:
         )
         return True
 
+    async def delete_points(self, point_ids: list[UUID]) -> None:
+        """Delete many vector points in one request (idempotent).
+
+        Args:
+            point_ids: Point identifiers; unknown IDs are ignored.
+        """
+        if not point_ids:
+            return
+        await self.client.delete(
+            collection_name=self._collection_name,
+            points_selector=[str(pid) for pid in point_ids],
+        )
+
     async def search(
         self,
         query_vector: list[float],
@@ -229,6 +242,60 @@ class QdrantAdapter:
 
         return points
 
+    async def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        *,
+        org_id: UUID | None = None,
+        limit: int = 10,
+    ) -> list[list[VectorPoint]]:
+        """Run many semantic searches in one request.
+
+        Args:
+            query_vectors: Query embeddings.
+            org_id: Optional org filter applied to every query.
+            limit: Maximum results per query.
+
+        Returns:
+            One ranked VectorPoint list per query vector, in input order.
+            Vectors are not returned (payload only).
+        """
+        if not query_vectors:
+            return []
+        from qdrant_client.models import FieldCondition, Filter, MatchValue, QueryRequest
+
+        query_filter = None
+        if org_id is not None:
+            query_filter = Filter(
+                must=[FieldCondition(key="org_id", match=MatchValue(value=str(org_id)))]
+            )
+
+        responses = await self.client.query_batch_points(
+            collection_name=self._collection_name,
+            requests=[
+                QueryRequest(query=vector, filter=query_filter, limit=limit, with_payload=True)
+                for vector in query_vectors
+            ],
+        )
+
+        batches: list[list[VectorPoint]] = []
+        for response in responses:
+            points: list[VectorPoint] = []
+            for scored in response.points:
+                payload = scored.payload or {}
+                gn_id = payload.pop("graph_node_id", None)
+                points.append(
+                    VectorPoint(
+                        point_id=UUID(str(scored.id)),
+                        vector=[],
+                        payload=payload,
+                        graph_node_id=UUID(gn_id) if gn_id else None,
+                        score=scored.score,
+                    )
+                )
+            batches.append(points)
+        return batches
+
     async def count(self) -> int:
         """Return total number of points in the collection."""
         info = await self.client.get_collection(self._collection_name)
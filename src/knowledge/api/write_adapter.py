@@ -8,15 +8,22 @@ When Neo4j/Qdrant are unavailable (local dev without docker-compose),
 the adapter operates in degraded mode with in-process storage.
 When the adapters are provided, it delegates to FK-consistent dual-write
 via ``FKRegistry``.
+
+``on_change`` (optional) is awaited with the org_id after every successful
+create / update / delete, so caches derived from knowledge (the LLM
+response cache) can drop stale entries.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,11 +63,13 @@ class KnowledgeWriteAdapter:
         qdrant: Any = None,
         fk_registry: Any = None,
         embedder: Any = None,
+        on_change: Callable[[UUID], Awaitable[None]] | None = None,
     ) -> None:
         self._neo4j = neo4j
         self._qdrant = qdrant
         self._fk_registry = fk_registry
         self._embedder = embedder
+        self._on_change = on_change
         # In-memory fallback when external stores are unavailable
         self._store: dict[UUID, dict[str, Any]] = {}
 
@@ -87,7 +96,7 @@ class KnowledgeWriteAdapter:
         if self._has_stores:
             # Build semantic content + embedding for Qdrant dual-write
             semantic = _semantic_text(entity_type, properties)
-            embedding = self._embedder.embed(semantic) if self._embedder else None
+            embedding = await self._embed(semantic)
 
             result = await self._fk_registry.write_with_fk(
                 entity_type=entity_type,
@@ -128,6 +137,7 @@ class KnowledgeWriteAdapter:
                 org_id,
             )
 
+        await self._changed(org_id)
         return entry
 
     # -- READ single --
@@ -174,7 +184,7 @@ class KnowledgeWriteAdapter:
 
             # Use FK registry for consistent dual-write update
             semantic = _semantic_text(existing.entity_type, merged_props)
-            embedding = self._embedder.embed(semantic) if self._embedder else None
+            embedding = await self._embed(semantic)
 
             result = await self._fk_registry.update_with_fk(
                 node_id=entry_id,
@@ -183,6 +193,7 @@ class KnowledgeWriteAdapter:
                 embedding=embedding,
             )
             updated = result.graph_node
+            await self._changed(org_id)
             return {
                 "entry_id": updated.node_id,
                 "entity_type": updated.entity_type,
@@ -195,6 +206,7 @@ class KnowledgeWriteAdapter:
             return None
         entry["properties"] = {**entry.get("properties", {}), **properties}
         entry["updated_by"] = user_id
+        await self._changed(org_id)
         return entry
 
     # -- DELETE --
@@ -217,6 +229,7 @@ class KnowledgeWriteAdapter:
                     entry_id,
                     user_id,
                 )
+                await self._changed(org_id)
             return deleted
 
         entry = self._store.get(entry_id)
@@ -228,8 +241,30 @@ class KnowledgeWriteAdapter:
             entry_id,
             user_id,
         )
+        await self._changed(org_id)
         return True
 
+    async def _embed(self, text: str) -> list[float] | None:
+        """Embedding for dual-write; coalesced when the embedder supports it."""
+        if self._embedder is None:
+            return None
+        if hasattr(self._embedder, "aembed"):
+            embedding: list[float] = await self._embedder.aembed(text)
+            return embedding
+        embedding = self._embedder.embed(text)
+        return embedding
+
+    # -- Change notification --
+
+    async def _changed(self, org_id: UUID) -> None:
+        """Notify on_change; a failing listener never fails the write."""
+        if self._on_change is None:
+            return
+        try:
+            await self._on_change(org_id)
+        except Exception:
+            logger.warning("Knowledge change listener failed (org=%s)", org_id, exc_info=True)
+
     # -- LIST --
 
     async def list_entries(
@@ -4,14 +4,24 @@ Provides a pluggable EmbeddingAdapter protocol and a deterministic
 dummy implementation for CI/testing.  The real LLM-backed adapter
 can be swapped in later without touching any call-sites.
 
+CoalescingEmbedder adds an async entry point (aembed) that runs the
+wrapped embedder off the event loop and coalesces concurrent requests for
+the same text into one embedding call (SingleFlight).
+
 Decision ref: Audit R2 -- Decision 1 (B: deterministic dummy).
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import math
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+from src.shared.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from src.shared.singleflight import SingleFlightStats
 
 
 class EmbeddingAdapter(Protocol):
@@ -48,4 +58,30 @@ class DeterministicEmbedder:
         return [x / norm for x in raw]
 
 
-__all__ = ["DeterministicEmbedder", "EmbeddingAdapter"]
+class CoalescingEmbedder:
+    """EmbeddingAdapter wrapper that coalesces concurrent identical texts.
+
+    ``embed`` stays a synchronous pass-through; ``aembed`` runs the wrapped
+    embedder in a worker thread, and concurrent callers embedding the same
+    text share that one call.
+    """
+
+    def __init__(self, inner: EmbeddingAdapter, singleflight: SingleFlight | None = None) -> None:
+        self._inner = inner
+        self._singleflight = singleflight or SingleFlight()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return self._singleflight.stats
+
+    def embed(self, text: str) -> list[float]:
+        """Embed synchronously (no coalescing)."""
+        return self._inner.embed(text)
+
+    async def aembed(self, text: str) -> list[float]:
+        """Embed off the event loop; concurrent identical texts share one call."""
+        key = "emb:" + hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return await self._singleflight.do(key, lambda: asyncio.to_thread(self._inner.embed, text))
+
+
+__all__ = ["CoalescingEmbedder", "DeterministicEmbedder", "EmbeddingAdapter"]
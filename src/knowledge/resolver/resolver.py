@@ -7,20 +7,29 @@ Query interface returning KnowledgeBundle with graph + vector hybrid
 results. Supports multiple resolution profiles with different FK
 strategies (graph-only, graph-first, vector-first, parallel).
 
+Optional singleflight: concurrent identical resolutions (same profile,
+query and org scope -- e.g. the brand context for every user of an org
+during a burst) share one graph/vector round trip, across workers too
+when the SingleFlight has a lease store.
+
 See: docs/architecture/02-Knowledge Section 5.4.1 (KnowledgeBundle)
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from src.ports.knowledge_port import KnowledgePort
 from src.shared.types import GraphNode, KnowledgeBundle, OrganizationContext, ResolutionMetadata
 
+if TYPE_CHECKING:
+    from src.shared.singleflight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,10 +102,12 @@ class DiyuResolver(KnowledgePort):
         neo4j: Any,  # Neo4j adapter (duck-typed)
         qdrant: Any,  # Qdrant adapter (duck-typed)
         profiles: dict[str, ResolverProfile] | None = None,
+        singleflight: SingleFlight | None = None,
     ) -> None:
         self._neo4j = neo4j
         self._qdrant = qdrant
         self._profiles = profiles if profiles is not None else dict(BUILTIN_PROFILES)
+        self._singleflight = singleflight
 
     async def capabilities(self) -> set[str]:
         """Return set of capabilities this knowledge provider supports."""
@@ -139,6 +150,21 @@ class DiyuResolver(KnowledgePort):
             msg = f"Profile not found: {profile_id}"
             raise ValueError(msg)
 
+        if self._singleflight is None:
+            return await self._resolve(profile, query, org_context)
+        return await self._singleflight.do(
+            _flight_key(profile, query, org_context),
+            lambda: self._resolve(profile, query, org_context),
+            encode=_bundle_to_dict,
+            decode=_bundle_from_dict,
+        )
+
+    async def _resolve(
+        self,
+        profile: ResolverProfile,
+        query: str,
+        org_context: OrganizationContext,
+    ) -> KnowledgeBundle:
         start = datetime.now(tz=UTC)
 
         if profile.fk_strategy == "none":
@@ -328,3 +354,39 @@ class DiyuResolver(KnowledgePort):
             }
             groups.setdefault(node.entity_type, []).append(entry)
         return groups
+
+
+def _flight_key(profile: ResolverProfile, query: str, org_context: OrganizationContext) -> str:
+    """Everything a bundle depends on; the user is deliberately not part of it."""
+    scope = [
+        profile.profile_id,
+        query,
+        str(org_context.org_id),
+        org_context.org_tier,
+        [str(uid) for uid in org_context.org_chain],
+    ]
+    return "kr:" + json.dumps(scope, separators=(",", ":"))
+
+
+def _bundle_to_dict(bundle: KnowledgeBundle) -> dict[str, Any]:
+    data = asdict(bundle)
+    if bundle.metadata is not None:
+        resolved_at = bundle.metadata.resolved_at
+        data["metadata"]["resolved_at"] = resolved_at.isoformat() if resolved_at else None
+        data["metadata"]["org_chain_used"] = [str(u) for u in bundle.metadata.org_chain_used]
+    return json.loads(json.dumps(data, default=str))  # type: ignore[no-any-return]
+
+
+def _bundle_from_dict(data: dict[str, Any]) -> KnowledgeBundle:
+    meta = data.get("metadata")
+    metadata = None
+    if meta is not None:
+        resolved_at = meta["resolved_at"]
+        metadata = ResolutionMetadata(
+            **{
+                **meta,
+                "resolved_at": datetime.fromisoformat(resolved_at) if resolved_at else None,
+                "org_chain_used": [UUID(u) for u in meta["org_chain_used"]],
+            }
+        )
+    return KnowledgeBundle(**{**data, "metadata": metadata})
@@ -4,6 +4,8 @@ Task card: MC2-7
 - Old memories' effective confidence decays over time
 - 30 days after last validation -> observable decay
 - Decay is read-only (computed at retrieval, not stored)
+- decay_ranked: the same formula as a SQL expression, so retrieval can
+  order/filter by effective confidence inside the database
 
 Architecture: ADR-042.2, Section 2.3.2.4
 """
@@ -11,7 +13,34 @@ Architecture: ADR-042.2, Section 2.3.2.4
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
+
+import sqlalchemy as sa
+
+DEFAULT_HALF_LIFE_DAYS = 90.0
+DEFAULT_STALE_THRESHOLD = 0.3
+
+
+@dataclass(frozen=True)
+class DecayRanking:
+    """Retrieval mode that ranks by effective (decayed) confidence in SQL.
+
+    Attributes:
+        half_life_days: Decay half-life, same meaning as confidence_effective.
+        stale_threshold: When set, rows whose effective confidence is below
+            this value are filtered out before they enter a candidate pool.
+        candidate_k: Per-source candidate pool for RRF fusion. The pool is
+            evaluated inside the database; only the final top_k rows are
+            returned to the application.
+        rrf_k: RRF constant (standard value 60).
+    """
+
+    half_life_days: float = DEFAULT_HALF_LIFE_DAYS
+    stale_threshold: float | None = None
+    candidate_k: int = 50
+    rrf_k: int = 60
 
 
 def confidence_effective(
@@ -19,7 +48,7 @@ def confidence_effective(
     valid_at: datetime,
     last_validated_at: datetime | None = None,
     now: datetime | None = None,
-    half_life_days: float = 90.0,
+    half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
 ) -> float:
     """Compute effective confidence with time-based decay.
 
@@ -62,9 +91,9 @@ def is_stale(
     base_confidence: float,
     valid_at: datetime,
     last_validated_at: datetime | None = None,
-    threshold: float = 0.3,
+    threshold: float = DEFAULT_STALE_THRESHOLD,
     now: datetime | None = None,
-    half_life_days: float = 90.0,
+    half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
 ) -> bool:
     """Check if a memory's effective confidence has decayed below threshold.
 
@@ -87,3 +116,37 @@ def is_stale(
         half_life_days=half_life_days,
     )
     return effective < threshold
+
+
+def effective_confidence_expr(
+    confidence: Any,
+    valid_at: Any,
+    last_validated_at: Any,
+    *,
+    now: datetime,
+    half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+) -> sa.ColumnElement[float]:
+    """SQL expression equivalent of confidence_effective (PostgreSQL).
+
+        confidence * 2 ^ (-max(days_since_baseline, 0) / half_life)
+
+    Args:
+        confidence: Base confidence column.
+        valid_at: Creation/update timestamp column.
+        last_validated_at: Last validation timestamp column (nullable).
+        now: Reference time, bound as a parameter so every row in one query
+            decays against the same instant.
+        half_life_days: Half-life in days.
+    """
+    baseline = sa.func.coalesce(last_validated_at, valid_at)
+    elapsed_days = sa.func.greatest(
+        sa.extract(
+            "epoch", sa.bindparam("decay_now", now, type_=sa.DateTime(timezone=True)) - baseline
+        )
+        / 86400.0,
+        0.0,
+    )
+    decayed: sa.ColumnElement[float] = confidence * sa.func.power(
+        2.0, -elapsed_days / half_life_days
+    )
+    return decayed
@@ -0,0 +1,423 @@
+"""Batch memory consolidation job.
+
+- Buckets each user's active memories by MinHash LSH band key (same
+  memory_type) across all of the user's items, so near-duplicates are
+  compared however far apart their IDs are; items sharing a bucket form
+  candidate groups
+- Clusters semantically similar items within a candidate group (embedding
+  cosine similarity >= threshold). Pairwise similarity is computed by
+  pgvector in one statement per group; Python only groups the returned edges
+- Merges each cluster into a consolidated version of its leader (highest
+  confidence) via update_item, then retires the other members with
+  supersede_item so version chains stay traceable
+- Resumable: the (user, last candidate group) cursor is checkpointed
+  through StoragePort after every group; a finished run clears its checkpoint
+- Throttled per org: a run stops once the org's merge or scan budget is
+  spent and the next scheduled run resumes from the checkpoint
+- Runs in-process (await run_org()) or as a task via consolidation_task
+
+EvolutionPipeline only sees the current session; this job bounds the
+long-lived working set so retrieval latency and prompt size stay flat as
+accounts age.
+
+Architecture: Section 2.2 (Memory evolution), ADR-033 (MemoryItem versioning)
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID
+
+from src.memory.vector_search import cosine_similarity
+from src.shared.similarity import band_keys, minhash_signature
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from src.memory.items import MemoryItemStore
+    from src.ports.storage_port import StoragePort
+    from src.shared.types import MemoryItem
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = "memory:consolidation"
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+CONSOLIDATION_TASK = "memory.consolidation"
+
+
+@dataclass(frozen=True)
+class ConsolidationPolicy:
+    """Clustering and paging knobs."""
+
+    similarity_threshold: float = 0.9
+    batch_size: int = 500  # largest candidate group compared in one statement
+    max_cluster_size: int = 8
+    user_page_size: int = 100
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.similarity_threshold <= 1.0:
+            msg = f"similarity_threshold must be in (0, 1], got {self.similarity_threshold}"
+            raise ValueError(msg)
+        if self.max_cluster_size < 2:
+            msg = f"max_cluster_size must be >= 2, got {self.max_cluster_size}"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class ConsolidationBudget:
+    """Per-org, per-run work limits."""
+
+    max_merges: int = 200
+    max_scanned: int = 20_000
+
+
+@dataclass
+class ConsolidationReport:
+    """Outcome of one consolidation run for an org."""
+
+    org_id: UUID
+    users_scanned: int = 0
+    items_scanned: int = 0
+    clusters_merged: int = 0
+    items_superseded: int = 0
+    resumed: bool = False
+    completed: bool = False
+    budget_exhausted: bool = False
+
+
+@dataclass(frozen=True)
+class Cluster:
+    """A leader and the members it absorbs."""
+
+    leader: MemoryItem
+    members: list[MemoryItem]
+
+
+class ConsolidationSource(Protocol):
+    """Storage operations the consolidator needs."""
+
+    async def list_users(self, org_id: UUID, *, after: UUID | None, limit: int) -> list[UUID]:
+        """User IDs with active memories, ascending, strictly after `after`."""
+        ...
+
+    async def band_buckets(self, org_id: UUID, user_id: UUID) -> list[list[UUID]]:
+        """IDs of a user's active memories sharing an LSH band key and memory_type.
+
+        One list per bucket holding two or more items.
+        """
+        ...
+
+    async def get_active(self, org_id: UUID, memory_ids: list[UUID]) -> list[MemoryItem]:
+        """The memories of memory_ids that are still active."""
+        ...
+
+    async def similar_pairs(
+        self,
+        org_id: UUID,
+        memory_ids: list[UUID],
+        *,
+        threshold: float,
+    ) -> list[tuple[UUID, UUID, float]]:
+        """(a, b, similarity) for same-type pairs within memory_ids above threshold."""
+        ...
+
+    async def merge(self, org_id: UUID, cluster: Cluster) -> UUID:
+        """Write the consolidated version and supersede members. Returns new ID."""
+        ...
+
+
+def build_clusters(
+    items: list[MemoryItem],
+    pairs: list[tuple[UUID, UUID, float]],
+    *,
+    max_cluster_size: int,
+) -> list[Cluster]:
+    """Greedy leader clustering over a similarity edge list.
+
+    Items are visited by confidence descending (newest first on ties); each
+    unassigned item becomes a leader and absorbs its most similar unassigned
+    neighbours. Every member is directly similar to its leader, so chains
+    of weak links never collapse unrelated memories.
+    """
+    neighbours: dict[UUID, list[tuple[float, UUID]]] = {}
+    for a, b, similarity in pairs:
+        neighbours.setdefault(a, []).append((similarity, b))
+        neighbours.setdefault(b, []).append((similarity, a))
+
+    by_id = {item.memory_id: item for item in items}
+    order = sorted(items, key=lambda i: (i.confidence, i.valid_at), reverse=True)
+    assigned: set[UUID] = set()
+    clusters: list[Cluster] = []
+
+    for leader in order:
+        if leader.memory_id in assigned or leader.memory_id not in neighbours:
+            continue
+        candidates = sorted(neighbours[leader.memory_id], key=lambda e: e[0], reverse=True)
+        members = [
+            by_id[mid]
+            for _, mid in candidates
+            if mid not in assigned and mid in by_id and mid != leader.memory_id
+        ][: max_cluster_size - 1]
+        if not members:
+            continue
+        assigned.add(leader.memory_id)
+        assigned.update(m.memory_id for m in members)
+        clusters.append(Cluster(leader=leader, members=members))
+
+    return clusters
+
+
+def candidate_groups(buckets: list[list[UUID]], *, max_size: int) -> list[list[UUID]]:
+    """Join LSH buckets that share an item into candidate groups.
+
+    Groups are sorted by ID and ordered by their first ID (the resume
+    cursor); a group above max_size is split into ID-ordered chunks.
+    """
+    parent: dict[UUID, UUID] = {}
+
+    def _root(mid: UUID) -> UUID:
+        while parent[mid] != mid:
+            parent[mid] = parent[parent[mid]]
+            mid = parent[mid]
+        return mid
+
+    for bucket in buckets:
+        for mid in bucket:
+            parent.setdefault(mid, mid)
+        first = _root(bucket[0])
+        for mid in bucket[1:]:
+            parent[_root(mid)] = first
+
+    components: dict[UUID, list[UUID]] = {}
+    for mid in sorted(parent):
+        components.setdefault(_root(mid), []).append(mid)
+    groups = [
+        ids[start : start + max_size]
+        for ids in components.values()
+        for start in range(0, len(ids), max_size)
+    ]
+    return sorted((g for g in groups if len(g) > 1), key=lambda g: g[0])
+
+
+def merged_sessions(cluster: Cluster) -> list[UUID]:
+    """Union of source sessions across the cluster, order preserved."""
+    seen: dict[UUID, None] = {}
+    for item in [cluster.leader, *cluster.members]:
+        for sid in item.source_sessions:
+            seen.setdefault(sid, None)
+    return list(seen)
+
+
+def merged_confidence(cluster: Cluster) -> float:
+    """Confidence of the consolidated item: the cluster's highest."""
+    return max(item.confidence for item in [cluster.leader, *cluster.members])
+
+
+class MemoryConsolidator:
+    """Runs consolidation for one org at a time.
+
+    Args:
+        source: Storage operations (src.infra.memory.PgConsolidationSource
+            or in-memory).
+        checkpoints: StoragePort holding per-org cursors (Redis in production).
+        policy: Clustering and paging knobs.
+        budgets: Per-org overrides; orgs not listed use default_budget.
+        default_budget: Budget applied when an org has no override.
+    """
+
+    def __init__(
+        self,
+        source: ConsolidationSource,
+        *,
+        checkpoints: StoragePort,
+        policy: ConsolidationPolicy | None = None,
+        budgets: dict[UUID, ConsolidationBudget] | None = None,
+        default_budget: ConsolidationBudget | None = None,
+    ) -> None:
+        self._source = source
+        self._checkpoints = checkpoints
+        self._policy = policy or ConsolidationPolicy()
+        self._budgets = budgets or {}
+        self._default_budget = default_budget or ConsolidationBudget()
+
+    def budget_for(self, org_id: UUID) -> ConsolidationBudget:
+        """Budget applied to org_id."""
+        return self._budgets.get(org_id, self._default_budget)
+
+    async def run_org(self, org_id: UUID) -> ConsolidationReport:
+        """Consolidate an org, resuming from its checkpoint if one exists."""
+        budget = self.budget_for(org_id)
+        report = ConsolidationReport(org_id=org_id)
+        key = f"{CHECKPOINT_KEY_PREFIX}:{org_id}"
+
+        state: dict[str, Any] | None = await self._checkpoints.get(key)
+        user_id: UUID | None = None
+        after_id: UUID | None = None
+        if state:
+            report.resumed = True
+            user_id = UUID(state["user_id"])
+            after_id = UUID(state["after_id"]) if state.get("after_id") else None
+
+        pending_users: list[UUID] = [user_id] if user_id is not None else []
+        last_user = user_id
+        while True:
+            if not pending_users:
+                pending_users = await self._source.list_users(
+                    org_id, after=last_user, limit=self._policy.user_page_size
+                )
+                if not pending_users:
+                    break
+            current = pending_users.pop(0)
+            if current != user_id:
+                after_id = None
+            user_id = current
+            last_user = current
+            report.users_scanned += 1
+
+            after_id, exhausted = await self._consolidate_user(
+                org_id, current, after_id, budget, report, key
+            )
+            if exhausted:
+                report.budget_exhausted = True
+                logger.info(
+                    "Consolidation budget exhausted for org %s after %d merges",
+                    org_id,
+                    report.clusters_merged,
+                )
+                return report
+
+        await self._checkpoints.delete(key)
+        report.completed = True
+        return report
+
+    async def _consolidate_user(
+        self,
+        org_id: UUID,
+        user_id: UUID,
+        after_id: UUID | None,
+        budget: ConsolidationBudget,
+        report: ConsolidationReport,
+        key: str,
+    ) -> tuple[UUID | None, bool]:
+        """Work through one user's candidate groups. Returns (cursor, budget_exhausted)."""
+        groups = candidate_groups(
+            await self._source.band_buckets(org_id, user_id),
+            max_size=self._policy.batch_size,
+        )
+        for group in groups:
+            if after_id is not None and group[0] <= after_id:
+                continue  # done before the checkpoint
+            if report.items_scanned >= budget.max_scanned:
+                return after_id, True
+
+            items = await self._source.get_active(org_id, group)
+            report.items_scanned += len(items)
+            pairs = await self._source.similar_pairs(
+                org_id,
+                [item.memory_id for item in items],
+                threshold=self._policy.similarity_threshold,
+            )
+            clusters = build_clusters(items, pairs, max_cluster_size=self._policy.max_cluster_size)
+            for cluster in clusters:
+                if report.clusters_merged >= budget.max_merges:
+                    # Cursor is not advanced: the unmerged clusters of this
+                    # group are compared again by the next run.
+                    return after_id, True
+                await self._source.merge(org_id, cluster)
+                report.clusters_merged += 1
+                report.items_superseded += len(cluster.members) + 1
+
+            after_id = group[0]
+            await self._checkpoints.put(
+                key,
+                {"user_id": str(user_id), "after_id": str(after_id)},
+                ttl=CHECKPOINT_TTL_SECONDS,
+            )
+        return after_id, False
+
+
+def consolidation_task(
+    consolidator: MemoryConsolidator,
+) -> Callable[[str], Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(CONSOLIDATION_TASK, ...).
+
+    The returned coroutine function consolidates one org on the caller's
+    event loop and returns the report as a plain dict.
+    """
+
+    async def _task(org_id: str) -> dict[str, Any]:
+        report = await consolidator.run_org(UUID(org_id))
+        return {**asdict(report), "org_id": org_id}
+
+    return _task
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+
+class InMemoryConsolidationSource:
+    """ConsolidationSource over MemoryItemStore for unit testing."""
+
+    def __init__(
+        self,
+        store: MemoryItemStore,
+        *,
+        embeddings: dict[UUID, list[float]],
+        users_by_org: dict[UUID, list[UUID]],
+    ) -> None:
+        self._store = store
+        self._embeddings = embeddings
+        self._users_by_org = users_by_org
+
+    async def list_users(self, org_id: UUID, *, after: UUID | None, limit: int) -> list[UUID]:
+        users = sorted(
+            u
+            for u in self._users_by_org.get(org_id, [])
+            if (after is None or u > after) and self._store.list_active(u)
+        )
+        return users[:limit]
+
+    async def band_buckets(self, org_id: UUID, user_id: UUID) -> list[list[UUID]]:
+        buckets: dict[tuple[str, int], list[UUID]] = {}
+        for item in sorted(self._store.list_active(user_id), key=lambda i: i.memory_id):
+            for band in band_keys(minhash_signature(item.content)):
+                buckets.setdefault((item.memory_type, band), []).append(item.memory_id)
+        return [ids for ids in buckets.values() if len(ids) > 1]
+
+    async def get_active(self, org_id: UUID, memory_ids: list[UUID]) -> list[MemoryItem]:
+        items = [self._store.get(mid) for mid in memory_ids]
+        return [i for i in items if i is not None and i.superseded_by is None]
+
+    async def similar_pairs(
+        self,
+        org_id: UUID,
+        memory_ids: list[UUID],
+        *,
+        threshold: float,
+    ) -> list[tuple[UUID, UUID, float]]:
+        items = [self._store.get(mid) for mid in memory_ids]
+        scoped = [i for i in items if i is not None and i.memory_id in self._embeddings]
+        pairs: list[tuple[UUID, UUID, float]] = []
+        for idx, a in enumerate(scoped):
+            for b in scoped[idx + 1 :]:
+                if a.memory_type != b.memory_type:
+                    continue
+                sim = cosine_similarity(
+                    self._embeddings[a.memory_id], self._embeddings[b.memory_id]
+                )
+                if sim >= threshold:
+                    pairs.append((a.memory_id, b.memory_id, sim))
+        return pairs
+
+    async def merge(self, org_id: UUID, cluster: Cluster) -> UUID:
+        new_item = self._store.update(
+            cluster.leader.memory_id, confidence=merged_confidence(cluster)
+        )
+        for member in cluster.members:
+            self._store.supersede(member.memory_id, new_memory_id=new_item.memory_id)
+        self._embeddings[new_item.memory_id] = self._embeddings[cluster.leader.memory_id]
+        return new_item.memory_id
@@ -0,0 +1,122 @@
+"""Near-duplicate suppression for the memory write path.
+
+- MinHash signature (32 permutations) over character shingles of
+  normalized content
+- LSH banding: 8 bands x 4 rows, each band hashed to one INTEGER key.
+  Pairs with Jaccard >= 0.8 share a band key with p ~= 0.985, so candidate
+  lookup is an indexed band-overlap probe (GIN on minhash_bands) rather
+  than a scan over the user's memories
+- Candidates are verified with exact shingle Jaccard on their content, and
+  must carry the same numbers ("12 stores" never merges with "15 stores");
+  a near-duplicate reinforces the existing item's confidence instead of
+  inserting a new row
+
+The shingle / MinHash / band primitives live in src.shared.similarity
+and are re-exported here.
+
+Architecture: Section 2.2 (Memory Write Pipeline)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.shared.similarity import (
+    BAND_COUNT,
+    NUM_PERMUTATIONS,
+    ROWS_PER_BAND,
+    band_keys,
+    content_similarity,
+    jaccard,
+    minhash_signature,
+    normalize_content,
+    shingles,
+)
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+__all__ = [
+    "BAND_COUNT",
+    "NUM_PERMUTATIONS",
+    "ROWS_PER_BAND",
+    "DedupPolicy",
+    "DedupStats",
+    "NearDuplicateIndex",
+    "band_keys",
+    "content_similarity",
+    "jaccard",
+    "minhash_signature",
+    "normalize_content",
+    "shingles",
+]
+
+
+@dataclass(frozen=True)
+class DedupPolicy:
+    """Tuning knobs for near-duplicate detection and reinforcement."""
+
+    similarity_threshold: float = 0.8
+    reinforce_step: float = 0.1
+    confidence_ceiling: float = 0.9  # only confirmed_by_user reaches 1.0
+    max_candidates: int = 16
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.similarity_threshold <= 1.0:
+            msg = f"similarity_threshold must be in (0, 1], got {self.similarity_threshold}"
+            raise ValueError(msg)
+
+    def reinforced_confidence(self, current: float) -> float:
+        """Confidence after one reinforcement; never lowers the stored value."""
+        return max(current, min(self.confidence_ceiling, current + self.reinforce_step))
+
+
+@dataclass
+class DedupStats:
+    """Counters for write amplification reporting."""
+
+    writes: int = 0
+    inserted: int = 0
+    reinforced: int = 0
+
+    @property
+    def write_amplification_reduction(self) -> float:
+        """Fraction of writes absorbed by reinforcement (0.0 - 1.0)."""
+        if self.writes == 0:
+            return 0.0
+        return self.reinforced / self.writes
+
+
+class NearDuplicateIndex:
+    """In-memory LSH index for unit testing and corpus replay.
+
+    Mirrors the band-overlap probe PgMemoryCoreAdapter runs against the
+    minhash_bands GIN index: lookup cost depends on band collisions,
+    not on how many memories the user has.
+    """
+
+    def __init__(self, policy: DedupPolicy | None = None) -> None:
+        self._policy = policy or DedupPolicy()
+        self._buckets: dict[tuple[UUID, int], list[UUID]] = {}
+        self._contents: dict[UUID, str] = {}
+
+    def find(self, user_id: UUID, content: str) -> UUID | None:
+        """Return the most similar indexed item above the threshold, if any."""
+        best: tuple[float, UUID] | None = None
+        seen: set[UUID] = set()
+        for key in band_keys(minhash_signature(content)):
+            for memory_id in self._buckets.get((user_id, key), ()):
+                if memory_id in seen:
+                    continue
+                seen.add(memory_id)
+                score = content_similarity(content, self._contents[memory_id])
+                if score >= self._policy.similarity_threshold and (best is None or score > best[0]):
+                    best = (score, memory_id)
+        return best[1] if best else None
+
+    def add(self, user_id: UUID, memory_id: UUID, content: str) -> None:
+        """Index content under each of its band keys."""
+        self._contents[memory_id] = content
+        for key in band_keys(minhash_signature(content)):
+            self._buckets.setdefault((user_id, key), []).append(memory_id)
@@ -0,0 +1,80 @@
+"""Deletion pipeline SLI metrics for Prometheus.
+
+Task card: MC4-3 / ADR-037, ADR-039
+- memory_deletion_purged_total    — items purged (rows, vectors, objects gone)
+- memory_deletion_failed_total    — items that entered FAILED
+- memory_deletion_timeout_total   — items finished (or still pending) past SLA
+- memory_deletion_timeout_rate    — timeout_total / processed (target: 0)
+- memory_deletion_batch_duration_seconds — per-chunk purge latency
+
+Architecture: Section 2.1 (Memory Core Deletion Pipeline), Section 7 (Observability)
+"""
+
+from __future__ import annotations
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+
+_BATCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+
+class DeletionSLI:
+    """Deletion SLI counters plus a running timeout rate.
+
+    Pass a custom CollectorRegistry for testing isolation.
+    In production, use the default global registry (registry=None).
+    """
+
+    def __init__(self, *, registry: CollectorRegistry | None = None) -> None:
+        reg = registry if registry is not None else REGISTRY
+
+        self.purged_total = Counter(
+            "memory_deletion_purged_total",
+            "Memory items purged by the deletion pipeline",
+            ["reason"],
+            registry=reg,
+        )
+        self.failed_total = Counter(
+            "memory_deletion_failed_total",
+            "Memory items whose purge failed",
+            ["reason"],
+            registry=reg,
+        )
+        self.timeout_total = Counter(
+            "memory_deletion_timeout_total",
+            "Memory items not purged within the deletion SLA",
+            ["reason"],
+            registry=reg,
+        )
+        self.timeout_rate = Gauge(
+            "memory_deletion_timeout_rate",
+            "Share of processed deletions that exceeded the SLA (SLO: 0)",
+            registry=reg,
+        )
+        self.batch_duration = Histogram(
+            "memory_deletion_batch_duration_seconds",
+            "Time spent purging one chunk of memory items",
+            buckets=_BATCH_BUCKETS,
+            registry=reg,
+        )
+
+        self._processed = 0
+        self._timed_out = 0
+
+    @property
+    def deletion_timeout_rate(self) -> float:
+        """Timed-out share of all processed deletions (0.0 when idle)."""
+        if self._processed == 0:
+            return 0.0
+        return self._timed_out / self._processed
+
+    def record(self, *, reason: str, purged: int, failed: int, timed_out: int) -> None:
+        """Record the outcome of one purge chunk."""
+        if purged:
+            self.purged_total.labels(reason=reason).inc(purged)
+        if failed:
+            self.failed_total.labels(reason=reason).inc(failed)
+        if timed_out:
+            self.timeout_total.labels(reason=reason).inc(timed_out)
+        self._processed += purged + failed
+        self._timed_out += timed_out
+        self.timeout_rate.set(self.deletion_timeout_rate)
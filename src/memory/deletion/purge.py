@@ -0,0 +1,383 @@
+"""Bulk, resumable purge engine for the deletion pipeline.
+
+Task card: MC4-1 / MC4-3 / ADR-039
+- Drives DeletionFSM instances chunk by chunk (PURGE_QUEUED -> PURGING ->
+  PURGED | FAILED) instead of one transition + delete per memory item
+- Per chunk: one batched object-storage delete per 1000 keys, one batched
+  vector delete, one chunked SQL DELETE (receipts cascade via FK)
+- Delete order is objects -> vectors -> rows: rows are the source of truth
+  for what still needs purging, so a crash mid-chunk simply re-discovers
+  the chunk on resume (all three deletes are idempotent)
+- Keyset cursor checkpointed through StoragePort after every chunk
+- SLI: deletion_timeout_rate (items finished past the request SLA)
+- Purged rows invalidate the affected MemoryWorkingSet entries
+- Runs in-process (await run()) or as a task via purge_task
+
+Items whose objects fail to delete go to FAILED and keep their row; the
+next run of the same request picks them up again (FAILED -> retry).
+
+Architecture: Section 2.1 (Memory Core Deletion Pipeline)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID
+
+from src.memory.deletion.fsm import DeletionEvent, DeletionFSM, DeletionState
+
+if TYPE_CHECKING:
+    from src.memory.deletion.metrics import DeletionSLI
+    from src.memory.working_set import MemoryWorkingSet
+    from src.ports.object_storage_port import ObjectStoragePort
+    from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = "memory:purge"
+CHECKPOINT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_SLA_DAYS = 30
+OBJECT_DELETE_BATCH = 1000  # S3 DeleteObjects limit
+PURGE_TASK = "memory.deletion.purge"
+
+
+@dataclass(frozen=True)
+class PurgeRequest:
+    """A bulk erasure request (GDPR user erasure or org offboarding)."""
+
+    job_id: UUID
+    org_id: UUID
+    user_id: UUID | None = None  # None = whole org
+    reason: str = "gdpr_erasure"
+    requested_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    sla_days: int = DEFAULT_SLA_DAYS
+
+    @property
+    def deadline(self) -> datetime:
+        return self.requested_at + timedelta(days=self.sla_days)
+
+
+@dataclass(frozen=True)
+class PurgeTarget:
+    """One memory item to purge and the objects it references."""
+
+    memory_id: UUID
+    object_keys: tuple[str, ...] = ()
+
+
+@dataclass
+class PurgeReport:
+    """Outcome of one purge run."""
+
+    job_id: UUID
+    chunks: int = 0
+    purged: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    objects_deleted: int = 0
+    resumed: bool = False
+    completed: bool = False
+    failed_ids: list[UUID] = field(default_factory=list)
+
+
+class PurgeStore(Protocol):
+    """Row-level operations for the purge engine."""
+
+    async def fetch_chunk(
+        self,
+        request: PurgeRequest,
+        *,
+        after: UUID | None,
+        limit: int,
+    ) -> list[PurgeTarget]:
+        """Targets in scope ordered by memory_id, strictly after `after`."""
+        ...
+
+    async def delete_rows(self, org_id: UUID, memory_ids: list[UUID]) -> int:
+        """Delete rows in one statement. Returns rows deleted."""
+        ...
+
+
+class VectorDeleter(Protocol):
+    """Batch vector delete (e.g. QdrantAdapter.delete_points)."""
+
+    async def delete_points(self, point_ids: list[UUID]) -> None: ...
+
+
+EventSink = Callable[[list[DeletionEvent]], Awaitable[None]]
+
+
+class PurgeEngine:
+    """Purges memory items in chunks with checkpointed progress.
+
+    Args:
+        store: Row fetch/delete operations (src.infra.memory.PgPurgeStore
+            or in-memory).
+        checkpoints: StoragePort holding per-job cursors.
+        object_storage: Optional ObjectStoragePort for attached media.
+        bucket: Bucket holding memory media objects.
+        vectors: Optional external vector store (pgvector embeddings live
+            on the memory_items row and go with the SQL delete).
+        sli: Optional DeletionSLI for Prometheus metrics.
+        event_sink: Optional async callback receiving each chunk's
+            DeletionEvents for audit.
+        working_set: Optional retrieval cache invalidated after row deletes.
+        chunk_size: Items per chunk.
+        clock: Current time source (tests pin it to simulate SLA breaches).
+    """
+
+    def __init__(
+        self,
+        store: PurgeStore,
+        *,
+        checkpoints: StoragePort,
+        object_storage: ObjectStoragePort | None = None,
+        bucket: str = "memory-media",
+        vectors: VectorDeleter | None = None,
+        sli: DeletionSLI | None = None,
+        event_sink: EventSink | None = None,
+        working_set: MemoryWorkingSet | None = None,
+        chunk_size: int = 5000,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if chunk_size <= 0:
+            msg = f"chunk_size must be positive, got {chunk_size}"
+            raise ValueError(msg)
+        self._store = store
+        self._checkpoints = checkpoints
+        self._object_storage = object_storage
+        self._bucket = bucket
+        self._vectors = vectors
+        self._sli = sli
+        self._event_sink = event_sink
+        self._working_set = working_set
+        self._chunk_size = chunk_size
+        self._clock = clock or (lambda: datetime.now(UTC))
+
+    async def run(self, request: PurgeRequest, *, max_chunks: int | None = None) -> PurgeReport:
+        """Purge everything in scope, resuming from the job checkpoint.
+
+        Args:
+            request: The erasure request.
+            max_chunks: Stop after this many chunks (checkpoint kept), so a
+                scheduler can interleave long purges with other work.
+        """
+        report = PurgeReport(job_id=request.job_id)
+        key = f"{CHECKPOINT_KEY_PREFIX}:{request.job_id}"
+
+        state: dict[str, Any] | None = await self._checkpoints.get(key)
+        after: UUID | None = None
+        if state:
+            report.resumed = True
+            after = UUID(state["after_id"]) if state.get("after_id") else None
+
+        while max_chunks is None or report.chunks < max_chunks:
+            targets = await self._store.fetch_chunk(request, after=after, limit=self._chunk_size)
+            if not targets:
+                await self._checkpoints.delete(key)
+                report.completed = True
+                break
+
+            await self._purge_chunk(request, targets, report)
+            report.chunks += 1
+            after = targets[-1].memory_id
+            await self._checkpoints.put(
+                key,
+                {"after_id": str(after), "org_id": str(request.org_id)},
+                ttl=CHECKPOINT_TTL_SECONDS,
+            )
+            if len(targets) < self._chunk_size:
+                await self._checkpoints.delete(key)
+                report.completed = True
+                break
+
+        return report
+
+    async def _purge_chunk(
+        self,
+        request: PurgeRequest,
+        targets: list[PurgeTarget],
+        report: PurgeReport,
+    ) -> None:
+        start = time.monotonic()
+        fsms = {
+            t.memory_id: DeletionFSM(
+                memory_id=t.memory_id,
+                org_id=request.org_id,
+                initial_state=DeletionState.PURGE_QUEUED,
+            )
+            for t in targets
+        }
+        for fsm in fsms.values():
+            fsm.start_purge()
+
+        object_errors = await self._delete_objects(targets, report)
+        deletable = [t.memory_id for t in targets if t.memory_id not in object_errors]
+
+        if self._vectors is not None and deletable:
+            await self._vectors.delete_points(deletable)
+        if deletable:
+            await self._store.delete_rows(request.org_id, deletable)
+            if self._working_set is not None:
+                if request.user_id is not None:
+                    await self._working_set.invalidate(request.user_id)
+                else:
+                    await self._working_set.invalidate_org(request.org_id)
+
+        for memory_id, fsm in fsms.items():
+            error = object_errors.get(memory_id)
+            if error is None:
+                fsm.complete_purge()
+            else:
+                fsm.fail(error=error)
+                report.failed_ids.append(memory_id)
+
+        failed = len(object_errors)
+        purged = len(targets) - failed
+        timed_out = len(targets) if self._clock() > request.deadline else 0
+        report.purged += purged
+        report.failed += failed
+        report.timed_out += timed_out
+
+        if self._sli is not None:
+            self._sli.record(
+                reason=request.reason, purged=purged, failed=failed, timed_out=timed_out
+            )
+            self._sli.batch_duration.observe(time.monotonic() - start)
+        if self._event_sink is not None:
+            await self._event_sink([e for fsm in fsms.values() for e in fsm.events])
+        if failed:
+            logger.warning(
+                "Purge job %s: %d of %d items failed in chunk", request.job_id, failed, len(targets)
+            )
+
+    async def _delete_objects(
+        self,
+        targets: list[PurgeTarget],
+        report: PurgeReport,
+    ) -> dict[UUID, str]:
+        """Batch-delete referenced objects. Returns memory_id -> error."""
+        if self._object_storage is None:
+            return {}
+        owner: dict[str, UUID] = {}
+        for t in targets:
+            for k in t.object_keys:
+                owner[k] = t.memory_id
+        keys = list(owner)
+        errors: dict[UUID, str] = {}
+        for i in range(0, len(keys), OBJECT_DELETE_BATCH):
+            result = await self._object_storage.delete_objects(
+                self._bucket, keys[i : i + OBJECT_DELETE_BATCH]
+            )
+            report.objects_deleted += len(result.deleted)
+            for err in result.errors:
+                memory_id = owner.get(err.get("key", ""))
+                if memory_id is not None:
+                    errors.setdefault(memory_id, err.get("error", "object delete failed"))
+        return errors
+
+
+def purge_task(engine: PurgeEngine) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(PURGE_TASK, ...).
+
+    Arguments are the PurgeRequest fields as JSON values (UUIDs as strings,
+    requested_at as ISO 8601); resubmitting the same job resumes it from
+    its checkpoint. Returns the report as a plain dict.
+    """
+
+    async def _task(
+        job_id: str,
+        org_id: str,
+        user_id: str | None = None,
+        reason: str = "gdpr_erasure",
+        requested_at: str | None = None,
+        sla_days: int = DEFAULT_SLA_DAYS,
+        max_chunks: int | None = None,
+    ) -> dict[str, Any]:
+        request = PurgeRequest(
+            job_id=UUID(job_id),
+            org_id=UUID(org_id),
+            user_id=UUID(user_id) if user_id else None,
+            reason=reason,
+            requested_at=(
+                datetime.fromisoformat(requested_at) if requested_at else datetime.now(UTC)
+            ),
+            sla_days=sla_days,
+        )
+        report = await engine.run(request, max_chunks=max_chunks)
+        return {
+            **asdict(report),
+            "job_id": job_id,
+            "failed_ids": [str(mid) for mid in report.failed_ids],
+        }
+
+    return _task
+
+
+# ---------------------------------------------------------------------------
+# Stores
+# ---------------------------------------------------------------------------
+
+
+class InMemoryPurgeStore:
+    """PurgeStore over a dict of rows for unit testing and benchmarks."""
+
+    def __init__(self) -> None:
+        # memory_id -> (org_id, user_id, object_keys)
+        self.rows: dict[UUID, tuple[UUID, UUID, tuple[str, ...]]] = {}
+        self._ordered: list[UUID] | None = None
+        self.delete_calls = 0
+
+    def add(
+        self,
+        memory_id: UUID,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        object_keys: tuple[str, ...] = (),
+    ) -> None:
+        self.rows[memory_id] = (org_id, user_id, object_keys)
+        self._ordered = None
+
+    async def fetch_chunk(
+        self,
+        request: PurgeRequest,
+        *,
+        after: UUID | None,
+        limit: int,
+    ) -> list[PurgeTarget]:
+        import bisect
+
+        if self._ordered is None:
+            self._ordered = sorted(self.rows)
+        start = 0 if after is None else bisect.bisect_right(self._ordered, after)
+        targets: list[PurgeTarget] = []
+        for idx in range(start, len(self._ordered)):
+            memory_id = self._ordered[idx]
+            row = self.rows.get(memory_id)
+            if row is None:
+                continue
+            org_id, user_id, keys = row
+            if org_id != request.org_id:
+                continue
+            if request.user_id is not None and user_id != request.user_id:
+                continue
+            targets.append(PurgeTarget(memory_id=memory_id, object_keys=keys))
+            if len(targets) >= limit:
+                break
+        return targets
+
+    async def delete_rows(self, org_id: UUID, memory_ids: list[UUID]) -> int:
+        self.delete_calls += 1
+        deleted = 0
+        for memory_id in memory_ids:
+            row = self.rows.get(memory_id)
+            if row is not None and row[0] == org_id:
+                del self.rows[memory_id]
+                deleted += 1
+        return deleted
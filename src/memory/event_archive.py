@@ -0,0 +1,563 @@
+"""Monthly partition maintenance and cold archival for conversation_events.
+
+Task card: MC2-2 (retention)
+- conversation_events is range-partitioned by month on created_at
+  (011_conversation_events_partitioning); a DEFAULT partition takes rows
+  of months that have no partition yet
+- PartitionMaintainer keeps month partitions created ahead of now; it runs
+  on its own schedule (event_partition_task), archive bucket or not
+- EventArchiver also creates partitions ahead and, for every
+  partition older than hot_months, streams it in keyset pages to object
+  storage as gzip-compressed JSONL (one object per session and month),
+  then drops the partition. Retention is a partition drop, not
+  row-by-row deletes
+- EventArchive pages archived sessions back in for
+  PgConversationEventStore through a per-session manifest (months, event
+  count, last sequence_number)
+- Crash-safe: a month is marked archived only after all its sessions are
+  written, and a marked month is dropped without being re-read
+- Both run in-process (await run()) or as async task bodies
+  (event_partition_task, event_archive_task)
+
+Architecture: Section 2.1 (conversation_events table)
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from src.memory.events import ConversationEvent
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_KEY_PREFIX = "archive:conversation_events"
+ARCHIVE_FORMAT = "jsonl+gzip"
+EVENT_ARCHIVE_TASK = "memory.events.archive"
+EVENT_PARTITION_TASK = "memory.events.partitions"
+PARTITION_PREFIX = "conversation_events_p"
+
+_NIL_UUID = UUID(int=0)
+
+
+def month_start(moment: datetime | date) -> date:
+    """First day of the (UTC) month containing moment."""
+    if isinstance(moment, datetime):
+        moment = moment.astimezone(UTC) if moment.tzinfo else moment
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_label(month: date) -> str:
+    return f"{month.year:04d}-{month.month:02d}"
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month.year:04d}{month.month:02d}"
+
+
+@dataclass(frozen=True)
+class ArchivedSession:
+    """Manifest of a session's archived events."""
+
+    session_id: UUID
+    months: dict[str, int]  # month label -> events archived for that month
+    last_sequence: int
+
+    @property
+    def events(self) -> int:
+        return sum(self.months.values())
+
+
+@dataclass
+class ArchiveReport:
+    """Outcome of one archiver run."""
+
+    partitions_created: int = 0
+    months_archived: list[str] = field(default_factory=list)
+    sessions: int = 0
+    events: int = 0
+    partitions_dropped: int = 0
+
+
+class EventPartitions(Protocol):
+    """Month partitions of conversation_events."""
+
+    async def list_partitions(self) -> list[date]:
+        """Months that currently have a partition, ascending."""
+        ...
+
+    async def ensure_partition(self, month: date) -> bool:
+        """Create the month's partition if missing. Returns True if created."""
+        ...
+
+    def stream_month(
+        self, month: date, *, page_size: int
+    ) -> AsyncIterator[list[ConversationEvent]]:
+        """Pages of a month's events ordered by (session_id, sequence_number)."""
+        ...
+
+    async def drop_partition(self, month: date) -> bool:
+        """Detach and drop the month's partition. Returns True if it existed."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Archive (object storage through StoragePort)
+# ---------------------------------------------------------------------------
+
+
+class EventArchive:
+    """Compressed per-session, per-month event objects plus manifests.
+
+    Args:
+        storage: StoragePort backed by object storage (S3StorageAdapter).
+        compresslevel: gzip level for archived JSONL.
+    """
+
+    def __init__(self, storage: StoragePort, *, compresslevel: int = 6) -> None:
+        self._storage = storage
+        self._compresslevel = compresslevel
+
+    async def write_session(self, month: date, events: list[ConversationEvent]) -> None:
+        """Archive one session's events for a month and update its manifest."""
+        if not events:
+            return
+        session_id = events[0].session_id
+        label = month_label(month)
+        lines = "\n".join(json.dumps(_event_to_dict(e), separators=(",", ":")) for e in events)
+        payload = gzip.compress(lines.encode(), compresslevel=self._compresslevel)
+        await self._storage.put(
+            _chunk_key(label, session_id),
+            {
+                "format": ARCHIVE_FORMAT,
+                "events": len(events),
+                "data": base64.b64encode(payload).decode("ascii"),
+            },
+        )
+        manifest = await self.manifest(session_id)
+        months = dict(manifest.months) if manifest else {}
+        months[label] = len(events)  # idempotent on re-archive
+        last = max(e.sequence_number for e in events)
+        await self._storage.put(
+            _manifest_key(session_id),
+            {
+                "months": months,
+                "last_sequence": max(last, manifest.last_sequence if manifest else 0),
+            },
+        )
+
+    async def manifest(self, session_id: UUID) -> ArchivedSession | None:
+        data = await self._storage.get(_manifest_key(session_id))
+        if data is None:
+            return None
+        return ArchivedSession(
+            session_id=session_id,
+            months={k: int(v) for k, v in data["months"].items()},
+            last_sequence=int(data["last_sequence"]),
+        )
+
+    async def read_session(self, session_id: UUID) -> list[ConversationEvent]:
+        """All archived events of a session, ordered by sequence_number."""
+        manifest = await self.manifest(session_id)
+        if manifest is None:
+            return []
+        events: list[ConversationEvent] = []
+        for label in sorted(manifest.months):
+            chunk = await self._storage.get(_chunk_key(label, session_id))
+            if chunk is None:
+                logger.warning("Archived chunk missing: %s/%s", label, session_id)
+                continue
+            raw = gzip.decompress(base64.b64decode(chunk["data"])).decode()
+            events.extend(_event_from_dict(json.loads(line)) for line in raw.splitlines())
+        events.sort(key=lambda e: e.sequence_number)
+        return events
+
+    async def delete_session(self, session_id: UUID) -> int:
+        """Delete a session's archived events. Returns the event count removed."""
+        manifest = await self.manifest(session_id)
+        if manifest is None:
+            return 0
+        for label in manifest.months:
+            await self._storage.delete(_chunk_key(label, session_id))
+        await self._storage.delete(_manifest_key(session_id))
+        return manifest.events
+
+    async def is_archived(self, month: date) -> bool:
+        return await self._storage.get(_month_key(month_label(month))) is not None
+
+    async def mark_archived(self, month: date, *, sessions: int, events: int) -> None:
+        await self._storage.put(
+            _month_key(month_label(month)),
+            {
+                "sessions": sessions,
+                "events": events,
+                "archived_at": datetime.now(UTC).isoformat(),
+            },
+        )
+
+
+# ---------------------------------------------------------------------------
+# Archiver
+# ---------------------------------------------------------------------------
+
+
+class PartitionMaintainer:
+    """Creates conversation_events month partitions ahead of now.
+
+    Args:
+        partitions: Month partitions (Pg or in-memory).
+        premake_months: Partitions created ahead of the current month.
+        clock: Returns "now" (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        partitions: EventPartitions,
+        *,
+        premake_months: int = 2,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        if premake_months < 0:
+            msg = f"premake_months must be non-negative, got {premake_months}"
+            raise ValueError(msg)
+        self._partitions = partitions
+        self._premake_months = premake_months
+        self._clock = clock
+
+    async def run(self) -> int:
+        """Ensure the current and upcoming months' partitions. Returns partitions created."""
+        current = month_start(self._clock())
+        created = 0
+        for offset in range(self._premake_months + 1):
+            if await self._partitions.ensure_partition(add_months(current, offset)):
+                created += 1
+        return created
+
+
+class EventArchiver:
+    """Creates partitions ahead, archives and drops cold ones.
+
+    Args:
+        partitions: Month partitions (Pg or in-memory).
+        archive: Destination for cold months.
+        hot_months: Months kept in PostgreSQL, including the current one.
+        premake_months: Partitions created ahead of the current month.
+        page_size: Rows per keyset page when streaming a partition.
+        clock: Returns "now" (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        partitions: EventPartitions,
+        archive: EventArchive,
+        *,
+        hot_months: int = 3,
+        premake_months: int = 2,
+        page_size: int = 5000,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        if hot_months <= 0 or premake_months < 0 or page_size <= 0:
+            msg = (
+                "hot_months and page_size must be positive and premake_months "
+                f"non-negative, got {hot_months}/{premake_months}/{page_size}"
+            )
+            raise ValueError(msg)
+        self._partitions = partitions
+        self._archive = archive
+        self._maintainer = PartitionMaintainer(
+            partitions, premake_months=premake_months, clock=clock
+        )
+        self._hot_months = hot_months
+        self._page_size = page_size
+        self._clock = clock
+
+    async def run(self) -> ArchiveReport:
+        report = ArchiveReport(partitions_created=await self._maintainer.run())
+        current = month_start(self._clock())
+        cutoff = add_months(current, 1 - self._hot_months)
+        for month in await self._partitions.list_partitions():
+            if month >= cutoff:
+                continue
+            if not await self._archive.is_archived(month):
+                sessions, events = await self._archive_month(month)
+                await self._archive.mark_archived(month, sessions=sessions, events=events)
+                report.months_archived.append(month_label(month))
+                report.sessions += sessions
+                report.events += events
+            if await self._partitions.drop_partition(month):
+                report.partitions_dropped += 1
+        return report
+
+    async def _archive_month(self, month: date) -> tuple[int, int]:
+        sessions = events = 0
+        pending: list[ConversationEvent] = []
+        async for page in self._partitions.stream_month(month, page_size=self._page_size):
+            for event in page:
+                if pending and pending[0].session_id != event.session_id:
+                    await self._archive.write_session(month, pending)
+                    sessions += 1
+                    events += len(pending)
+                    pending = []
+                pending.append(event)
+        if pending:
+            await self._archive.write_session(month, pending)
+            sessions += 1
+            events += len(pending)
+        logger.info("Archived %s: %d events in %d sessions", month_label(month), events, sessions)
+        return sessions, events
+
+
+def event_partition_task(
+    maintainer: PartitionMaintainer,
+) -> Callable[[], Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(EVENT_PARTITION_TASK, ...)."""
+
+    async def _task() -> dict[str, Any]:
+        return {"partitions_created": await maintainer.run()}
+
+    return _task
+
+
+def event_archive_task(archiver: EventArchiver) -> Callable[[], Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(EVENT_ARCHIVE_TASK, ...)."""
+
+    async def _task() -> dict[str, Any]:
+        return asdict(await archiver.run())
+
+    return _task
+
+
+# ---------------------------------------------------------------------------
+# Partition sources
+# ---------------------------------------------------------------------------
+
+
+class InMemoryEventPartitions:
+    """EventPartitions over in-process month buckets for unit testing."""
+
+    def __init__(self) -> None:
+        self._months: dict[date, dict[UUID, list[ConversationEvent]]] = {}
+        self._default: list[ConversationEvent] = []
+
+    def insert(self, event: ConversationEvent) -> None:
+        """Route an event to its month (or the default partition), as PostgreSQL does."""
+        bucket = self._months.get(month_start(event.created_at))
+        if bucket is None:
+            self._default.append(event)
+            return
+        bucket.setdefault(event.session_id, []).append(event)
+
+    def default_rows(self) -> int:
+        """Rows held by the default partition."""
+        return len(self._default)
+
+    def session_events(self, session_id: UUID) -> list[ConversationEvent]:
+        """Hot events of a session across partitions, ordered by sequence_number."""
+        events = [e for bucket in self._months.values() for e in bucket.get(session_id, [])]
+        events += [e for e in self._default if e.session_id == session_id]
+        return sorted(events, key=lambda e: e.sequence_number)
+
+    def row_count(self) -> int:
+        months = sum(len(v) for bucket in self._months.values() for v in bucket.values())
+        return months + len(self._default)
+
+    async def list_partitions(self) -> list[date]:
+        return sorted(self._months)
+
+    async def ensure_partition(self, month: date) -> bool:
+        if month in self._months:
+            return False
+        self._months[month] = {}
+        moved = [e for e in self._default if month_start(e.created_at) == month]
+        self._default = [e for e in self._default if month_start(e.created_at) != month]
+        for event in moved:
+            self.insert(event)
+        return True
+
+    async def stream_month(
+        self, month: date, *, page_size: int
+    ) -> AsyncIterator[list[ConversationEvent]]:
+        bucket = self._months.get(month, {})
+        rows = [
+            e
+            for session_id in sorted(bucket, key=str)
+            for e in sorted(bucket[session_id], key=lambda e: e.sequence_number)
+        ]
+        for start in range(0, len(rows), page_size):
+            yield rows[start : start + page_size]
+
+    async def drop_partition(self, month: date) -> bool:
+        return self._months.pop(month, None) is not None
+
+
+_LIST_PARTITIONS = sa.text(
+    """
+    SELECT c.relname FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    JOIN pg_class p ON p.oid = i.inhparent
+    WHERE p.relname = 'conversation_events'
+    """
+)
+
+_ENSURE_PARTITION = sa.text("SELECT conversation_events_ensure_partition(:month)")
+
+_DROP_PARTITION = sa.text("SELECT conversation_events_drop_partition(:month)")
+
+# Keyset page: partition pruning on created_at, index order on
+# (session_id, sequence_number, created_at).
+_STREAM_PAGE = sa.text(
+    """
+    SELECT id, org_id, session_id, user_id, event_type, role, content,
+           content_schema_version, sequence_number, parent_event_id,
+           metadata AS metadata_, created_at
+    FROM conversation_events
+    WHERE created_at >= :lo AND created_at < :hi
+      AND (session_id, sequence_number) > (:after_session, :after_seq)
+    ORDER BY session_id, sequence_number
+    LIMIT :limit
+    """
+)
+
+
+class PgEventPartitions:
+    """PostgreSQL EventPartitions using the 011 maintenance functions."""
+
+    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def list_partitions(self) -> list[date]:
+        async with self._session_factory() as session:
+            result = await session.execute(_LIST_PARTITIONS)
+            rows = result.fetchall()
+        months = []
+        for row in rows:
+            name = str(row[0])
+            suffix = name.removeprefix(PARTITION_PREFIX)
+            if suffix != name and len(suffix) == 6 and suffix.isdigit():
+                months.append(date(int(suffix[:4]), int(suffix[4:]), 1))
+        return sorted(months)
+
+    async def ensure_partition(self, month: date) -> bool:
+        async with self._session_factory() as session:
+            result = await session.execute(_ENSURE_PARTITION, {"month": month})
+            created = bool(result.scalar_one())
+            await session.commit()
+        return created
+
+    async def stream_month(
+        self, month: date, *, page_size: int
+    ) -> AsyncIterator[list[ConversationEvent]]:
+        params: dict[str, Any] = {
+            "lo": datetime(month.year, month.month, 1, tzinfo=UTC),
+            "hi": datetime.combine(add_months(month, 1), datetime.min.time(), tzinfo=UTC),
+            "after_session": _NIL_UUID,
+            "after_seq": -1,
+            "limit": page_size,
+        }
+        while True:
+            async with self._session_factory() as session:
+                result = await session.execute(_STREAM_PAGE, params)
+                rows = result.fetchall()
+            if not rows:
+                return
+            page = [_event_from_row(row) for row in rows]
+            yield page
+            if len(rows) < page_size:
+                return
+            params["after_session"] = page[-1].session_id
+            params["after_seq"] = page[-1].sequence_number
+
+    async def drop_partition(self, month: date) -> bool:
+        async with self._session_factory() as session:
+            result = await session.execute(_DROP_PARTITION, {"month": month})
+            dropped = bool(result.scalar_one())
+            await session.commit()
+        return dropped
+
+
+# ---------------------------------------------------------------------------
+# Codec
+# ---------------------------------------------------------------------------
+
+
+def _chunk_key(label: str, session_id: UUID) -> str:
+    return f"{ARCHIVE_KEY_PREFIX}:{label}:{session_id}"
+
+
+def _manifest_key(session_id: UUID) -> str:
+    return f"{ARCHIVE_KEY_PREFIX}:manifest:{session_id}"
+
+
+def _month_key(label: str) -> str:
+    return f"{ARCHIVE_KEY_PREFIX}:month:{label}"
+
+
+def _event_from_row(row: Any) -> ConversationEvent:
+    return ConversationEvent(
+        id=row.id,
+        org_id=row.org_id,
+        session_id=row.session_id,
+        user_id=row.user_id,
+        event_type=row.event_type,
+        role=row.role,
+        content=row.content,
+        sequence_number=row.sequence_number,
+        content_schema_version=row.content_schema_version,
+        parent_event_id=row.parent_event_id,
+        metadata=row.metadata_,
+        created_at=row.created_at,
+    )
+
+
+def _event_to_dict(event: ConversationEvent) -> dict[str, Any]:
+    return {
+        "id": str(event.id),
+        "org_id": str(event.org_id),
+        "session_id": str(event.session_id),
+        "user_id": str(event.user_id) if event.user_id else None,
+        "event_type": event.event_type,
+        "role": event.role,
+        "content": event.content,
+        "sequence_number": event.sequence_number,
+        "content_schema_version": event.content_schema_version,
+        "parent_event_id": str(event.parent_event_id) if event.parent_event_id else None,
+        "metadata": event.metadata,
+        "created_at": event.created_at.isoformat(),
+    }
+
+
+def _event_from_dict(data: dict[str, Any]) -> ConversationEvent:
+    return ConversationEvent(
+        id=UUID(data["id"]),
+        org_id=UUID(data["org_id"]),
+        session_id=UUID(data["session_id"]),
+        user_id=UUID(data["user_id"]) if data["user_id"] else None,
+        event_type=data["event_type"],
+        role=data["role"],
+        content=data["content"],
+        sequence_number=data["sequence_number"],
+        content_schema_version=data["content_schema_version"],
+        parent_event_id=UUID(data["parent_event_id"]) if data["parent_event_id"] else None,
+        metadata=data["metadata"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
@@ -3,6 +3,8 @@
 Task card: MC2-2
 - Write conversation event -> query by session_id -> return time-ordered list
 - Events are append-mostly, ordered by sequence_number within session
+- With an EventArchive, sessions whose older months were archived and
+  dropped (src.memory.event_archive) are paged back in transparently
 
 Provides:
 - ConversationEvent: domain dataclass
@@ -14,6 +16,7 @@ Architecture: Section 2.1 (conversation_events table)
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -25,6 +28,7 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from src.infra.models import ConversationEvent as ConversationEventModel
+    from src.memory.event_archive import EventArchive
 
 
 @dataclass
@@ -131,10 +135,29 @@ class PgConversationEventStore:
 
     All methods are async. Uses async_sessionmaker for DB access.
     RLS SET LOCAL is handled externally by src.infra.db.get_db_session.
+
+    Args:
+        session_factory: Async session factory.
+        archive: Optional EventArchive holding months dropped from PostgreSQL.
+            Session reads, counts, deletes and sequence numbering then span
+            both tiers; get_event() stays hot-only.
+        archive_cache_sessions: Sessions whose archived prefix is kept in
+            process (0 disables the cache).
     """
 
-    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        archive: EventArchive | None = None,
+        archive_cache_sessions: int = 256,
+    ) -> None:
         self._session_factory = session_factory
+        self._archive = archive
+        # Archived events never change, so a session's archived prefix is
+        # cached; it is re-read only when more months have been archived
+        self._archive_cache_size = archive_cache_sessions
+        self._archived_prefix: OrderedDict[UUID, list[ConversationEvent]] = OrderedDict()
 
     async def append_event(
         self,
@@ -150,18 +173,31 @@ class PgConversationEventStore:
     ) -> ConversationEvent:
         """Append a new event to a conversation session.
 
-        Determines next sequence_number by counting existing events.
+        Next sequence_number is the session's current max + 1; a session
+        with no hot rows continues from its archived manifest. Appends to one
+        session are serialized by a transaction-scoped advisory lock: the
+        partitioned table's unique constraint includes created_at, so it no
+        longer rejects two concurrent appends taking the same number.
         """
         from src.infra.models import ConversationEvent as ConversationEventModel
 
         async with self._session_factory() as session:
+            # Held until commit; other sessions' appends are not blocked
+            await session.execute(
+                sa.select(sa.func.pg_advisory_xact_lock(sa.func.hashtext(str(session_id))))
+            )
             # Get current max sequence number for this session
-            count_stmt = sa.select(sa.func.count()).where(
+            max_stmt = sa.select(
+                sa.func.coalesce(sa.func.max(ConversationEventModel.sequence_number), 0)
+            ).where(
                 ConversationEventModel.session_id == session_id,
             )
-            result = await session.execute(count_stmt)
-            current_count = result.scalar_one()
-            seq = current_count + 1
+            result = await session.execute(max_stmt)
+            current_max = int(result.scalar_one())
+            if current_max == 0 and self._archive is not None:
+                manifest = await self._archive.manifest(session_id)
+                current_max = manifest.last_sequence if manifest else 0
+            seq = current_max + 1
 
             event_id = uuid4()
             now = datetime.now(UTC)
@@ -202,7 +238,13 @@ class PgConversationEventStore:
         *,
         limit: int | None = None,
     ) -> list[ConversationEvent]:
-        """Get events for a session, ordered by sequence_number."""
+        """Get events for a session, ordered by sequence_number.
+
+        Archived events are merged in only when the hot rows do not start at
+        sequence_number 1 (older months were archived) or are empty, and
+        then only if the session's archive manifest lists archived months.
+        The archived prefix is cached per session.
+        """
         from src.infra.models import ConversationEvent as ConversationEventModel
 
         stmt = (
@@ -217,7 +259,18 @@ class PgConversationEventStore:
             result = await session.scalars(stmt)
             rows = result.all()
 
-        return [_row_to_event(row) for row in rows]
+        events = [_row_to_event(row) for row in rows]
+        if self._archive is None or (events and events[0].sequence_number == 1):
+            return events
+        archived = await self._archived_events(
+            self._archive, session_id, first_hot=events[0].sequence_number if events else None
+        )
+        if not archived:
+            return events
+        hot_ids = {e.id for e in events}
+        merged = [e for e in archived if e.id not in hot_ids] + events
+        merged.sort(key=lambda e: e.sequence_number)
+        return merged[:limit] if limit is not None else merged
 
     async def get_event(self, event_id: UUID) -> ConversationEvent | None:
         """Get a single event by ID."""
@@ -235,7 +288,7 @@ class PgConversationEventStore:
         return _row_to_event(row)
 
     async def count_session_events(self, session_id: UUID) -> int:
-        """Count events in a session."""
+        """Count events in a session (hot and archived)."""
         from src.infra.models import ConversationEvent as ConversationEventModel
 
         stmt = sa.select(sa.func.count()).where(
@@ -243,10 +296,18 @@ class PgConversationEventStore:
         )
         async with self._session_factory() as session:
             result = await session.execute(stmt)
-            return result.scalar_one()
+            count: int = result.scalar_one()
+        if self._archive is not None:
+            manifest = await self._archive.manifest(session_id)
+            count += manifest.events if manifest else 0
+        return count
 
     async def delete_session(self, session_id: UUID) -> int:
-        """Delete all events for a session. Returns count deleted."""
+        """Delete all events for a session, hot and archived. Returns count deleted.
+
+        Time-based retention drops whole partitions (EventArchiver); this is
+        for explicit per-session deletion.
+        """
         from src.infra.models import ConversationEvent as ConversationEventModel
 
         stmt = sa.delete(ConversationEventModel).where(
@@ -256,7 +317,36 @@ class PgConversationEventStore:
             result = await session.execute(stmt)
             await session.commit()
             count: int = result.rowcount  # type: ignore[attr-defined]
-            return count
+        if self._archive is not None:
+            self._archived_prefix.pop(session_id, None)
+            count += await self._archive.delete_session(session_id)
+        return count
+
+    async def _archived_events(
+        self, archive: EventArchive, session_id: UUID, *, first_hot: int | None
+    ) -> list[ConversationEvent]:
+        """A session's archived events, from cache while it still reaches the hot rows."""
+        cached = self._archived_prefix.get(session_id)
+        if (
+            cached is not None
+            and first_hot is not None
+            and cached[-1].sequence_number >= first_hot - 1
+        ):
+            self._archived_prefix.move_to_end(session_id)
+            return cached
+        manifest = await archive.manifest(session_id)
+        if manifest is None or not manifest.months:
+            return []
+        if cached is not None and cached[-1].sequence_number >= manifest.last_sequence:
+            self._archived_prefix.move_to_end(session_id)
+            return cached
+        archived = await archive.read_session(session_id)
+        if archived and self._archive_cache_size > 0:
+            self._archived_prefix[session_id] = archived
+            self._archived_prefix.move_to_end(session_id)
+            while len(self._archived_prefix) > self._archive_cache_size:
+                self._archived_prefix.popitem(last=False)
+        return archived
 
 
 def _row_to_event(row: ConversationEventModel) -> ConversationEvent:
@@ -0,0 +1,348 @@
+"""Multi-session batch mode for the evolution pipeline.
+
+Task card: MC2-5
+- Consumes a stream of completed sessions in fixed-size windows
+- Observer stage: one precompiled SignalMatcher scan per user message
+- Observations are aggregated per (user, memory_type, content) across all
+  sessions of a window, so a fact repeated in ten sessions becomes one
+  write carrying ten source sessions
+- Analyzer/Evolver rules are reused unchanged; surviving writes go out in
+  batches through the Memory Core write path, several in flight (bounded
+  concurrency)
+- Resumable: the stream offset is checkpointed through StoragePort after
+  each window. Memory IDs are derived from (job, window, user, type,
+  content), and the Pg writer records an idempotency key per (source
+  session, write), so replaying a window after a crash neither inserts
+  nor reinforces twice
+- Runs in-process (await run()) or as a task via evolution_batch_task
+
+Architecture: Section 2.2 (Three-stage async pipeline)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID, uuid5
+
+from src.memory.evolution.pipeline import (
+    Analyzer,
+    Evolver,
+    ExtractedObservation,
+    Observer,
+    SignalMatcher,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from src.memory.items import MemoryItemStore
+    from src.memory.pg_adapter import PgMemoryCoreAdapter
+    from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = "memory:evolution"
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+EVOLUTION_BATCH_TASK = "memory.evolution.batch"
+
+_ID_NAMESPACE = UUID("5b0f3f9e-8d0c-4c8e-9a59-7e1f2f6f4a11")
+
+
+@dataclass(frozen=True)
+class CompletedSession:
+    """A finished conversation ready for evolution."""
+
+    session_id: UUID
+    org_id: UUID
+    user_id: UUID
+    messages: list[dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class EvolutionWrite:
+    """One memory item to create, aggregated across a window's sessions."""
+
+    memory_id: UUID
+    org_id: UUID
+    user_id: UUID
+    memory_type: str
+    content: str
+    confidence: float
+    source_sessions: list[UUID] = field(default_factory=list)
+
+
+@dataclass
+class BatchEvolutionReport:
+    """Progress and outcome of a batch evolution job."""
+
+    job_id: str
+    sessions: int = 0
+    skipped: int = 0  # already processed before a resume
+    observations: int = 0
+    writes: int = 0
+    users: int = 0
+    windows: int = 0
+    elapsed_seconds: float = 0.0
+    resumed: bool = False
+    completed: bool = False
+
+    @property
+    def sessions_per_second(self) -> float:
+        """Throughput over the sessions processed by this run."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.sessions / self.elapsed_seconds
+
+
+class EvolutionWriter(Protocol):
+    """Bulk destination for evolution writes."""
+
+    async def write_many(self, writes: list[EvolutionWrite]) -> int:
+        """Persist writes; already-applied writes are skipped. Returns rows written."""
+        ...
+
+
+class BatchEvolutionRunner:
+    """Runs Observer -> Analyzer -> Evolver over many sessions at once.
+
+    Args:
+        writer: Bulk memory writer (Pg or in-memory).
+        checkpoints: StoragePort holding per-job stream offsets.
+        matcher: Signal matcher shared with Observer.
+        analyzer: Stage-2 rules (default Analyzer).
+        window_size: Sessions aggregated per window / checkpoint.
+        write_batch_size: Writes per write_many call.
+        concurrency: Write batches in flight at once.
+        on_progress: Called with the running report after every window.
+    """
+
+    def __init__(
+        self,
+        writer: EvolutionWriter,
+        *,
+        checkpoints: StoragePort,
+        matcher: SignalMatcher | None = None,
+        analyzer: Analyzer | None = None,
+        window_size: int = 1000,
+        write_batch_size: int = 500,
+        concurrency: int = 4,
+        on_progress: Callable[[BatchEvolutionReport], None] | None = None,
+    ) -> None:
+        if window_size <= 0 or write_batch_size <= 0 or concurrency <= 0:
+            msg = (
+                "window_size, write_batch_size and concurrency must be positive, got "
+                f"{window_size}/{write_batch_size}/{concurrency}"
+            )
+            raise ValueError(msg)
+        self._writer = writer
+        self._checkpoints = checkpoints
+        self._matcher = matcher or SignalMatcher()
+        self._analyzer = analyzer or Analyzer()
+        self._window_size = window_size
+        self._write_batch_size = write_batch_size
+        self._concurrency = concurrency
+        self._on_progress = on_progress
+
+    async def run(
+        self,
+        job_id: str,
+        sessions: AsyncIterable[CompletedSession] | Iterable[CompletedSession],
+    ) -> BatchEvolutionReport:
+        """Process a session stream, resuming after the checkpointed offset.
+
+        The stream must yield sessions in the same order on every attempt
+        (e.g. ordered by ended_at, id) for resume to skip the right prefix.
+        """
+        report = BatchEvolutionReport(job_id=job_id)
+        key = f"{CHECKPOINT_KEY_PREFIX}:{job_id}"
+        state: dict[str, Any] | None = await self._checkpoints.get(key)
+        skip = int(state["offset"]) if state else 0
+        report.resumed = state is not None
+        users: set[UUID] = set()
+
+        started = time.perf_counter()
+        offset = 0
+        window: list[CompletedSession] = []
+        async for session in _aiter(sessions):
+            offset += 1
+            if offset <= skip:
+                report.skipped += 1
+                continue
+            window.append(session)
+            if len(window) >= self._window_size:
+                await self._process_window(job_id, offset, window, report, users, started)
+                await self._checkpoints.put(key, {"offset": offset}, ttl=CHECKPOINT_TTL_SECONDS)
+                window = []
+        if window:
+            await self._process_window(job_id, offset, window, report, users, started)
+
+        await self._checkpoints.delete(key)
+        report.elapsed_seconds = time.perf_counter() - started
+        report.completed = True
+        logger.info(
+            "Evolution batch %s: %d sessions, %d writes, %.0f sessions/s",
+            job_id,
+            report.sessions,
+            report.writes,
+            report.sessions_per_second,
+        )
+        return report
+
+    async def _process_window(
+        self,
+        job_id: str,
+        end_offset: int,
+        window: list[CompletedSession],
+        report: BatchEvolutionReport,
+        users: set[UUID],
+        started: float,
+    ) -> None:
+        writes = await self._aggregate(f"{job_id}:{end_offset}", window, report)
+        writes.sort(key=lambda w: (w.user_id, w.memory_id))
+        batches = [
+            writes[i : i + self._write_batch_size]
+            for i in range(0, len(writes), self._write_batch_size)
+        ]
+        gate = asyncio.Semaphore(self._concurrency)
+
+        async def _write(batch: list[EvolutionWrite]) -> int:
+            async with gate:
+                return await self._writer.write_many(batch)
+
+        written = await asyncio.gather(*(_write(b) for b in batches))
+
+        users.update(s.user_id for s in window)
+        report.sessions += len(window)
+        report.writes += sum(written)
+        report.users = len(users)
+        report.windows += 1
+        report.elapsed_seconds = time.perf_counter() - started
+        if self._on_progress is not None:
+            self._on_progress(report)
+
+    async def _aggregate(
+        self,
+        window_key: str,
+        window: list[CompletedSession],
+        report: BatchEvolutionReport,
+    ) -> list[EvolutionWrite]:
+        """Extract signals and fold them per (user, memory_type, content)."""
+        grouped: dict[tuple[UUID, str, str], tuple[CompletedSession, list[UUID]]] = {}
+        for session in window:
+            for msg in session.messages:
+                content = msg.get("content", "")
+                if msg.get("role") != "user" or not content:
+                    continue
+                for memory_type in self._matcher.match(content):
+                    report.observations += 1
+                    entry = grouped.setdefault(
+                        (session.user_id, memory_type, content), (session, [])
+                    )
+                    if session.session_id not in entry[1]:
+                        entry[1].append(session.session_id)
+
+        writes: list[EvolutionWrite] = []
+        for (user_id, memory_type, content), (first, session_ids) in grouped.items():
+            observation = ExtractedObservation(
+                id=uuid5(_ID_NAMESPACE, f"{window_key}:{user_id}:{memory_type}:{content}"),
+                content=content,
+                memory_type=memory_type,
+                confidence=min(self._matcher.confidence(memory_type), Observer.MAX_CONFIDENCE),
+                source_session_id=first.session_id,
+            )
+            analysis = await self._analyzer.analyze(observation)
+            if analysis.suggested_confidence < Evolver.MIN_CONFIDENCE:
+                continue
+            writes.append(
+                EvolutionWrite(
+                    memory_id=observation.id,
+                    org_id=first.org_id,
+                    user_id=user_id,
+                    memory_type=analysis.suggested_memory_type,
+                    content=content,
+                    confidence=analysis.suggested_confidence,
+                    source_sessions=session_ids,
+                )
+            )
+        return writes
+
+
+def evolution_batch_task(
+    runner: BatchEvolutionRunner,
+    sessions_factory: Callable[..., AsyncIterable[CompletedSession] | Iterable[CompletedSession]],
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(EVOLUTION_BATCH_TASK, ...).
+
+    The returned coroutine function runs one job to completion on the
+    caller's event loop and returns the report as a plain dict. Task
+    kwargs are passed to sessions_factory, which must yield the same
+    stream for the same job so a resumed job skips what it already did.
+    """
+
+    async def _task(job_id: str, **stream_params: Any) -> dict[str, Any]:
+        report = await runner.run(job_id, sessions_factory(**stream_params))
+        return {**asdict(report), "sessions_per_second": report.sessions_per_second}
+
+    return _task
+
+
+async def _aiter(
+    items: AsyncIterable[CompletedSession] | Iterable[CompletedSession],
+) -> AsyncIterator[CompletedSession]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+
+class InMemoryEvolutionWriter:
+    """EvolutionWriter over MemoryItemStore for unit testing."""
+
+    def __init__(self, store: MemoryItemStore) -> None:
+        self._store = store
+        self.written: dict[UUID, EvolutionWrite] = {}
+        self.batches: list[int] = []
+
+    async def write_many(self, writes: list[EvolutionWrite]) -> int:
+        self.batches.append(len(writes))
+        count = 0
+        for w in writes:
+            if w.memory_id in self.written:
+                continue
+            self.written[w.memory_id] = w
+            self._store.create(
+                user_id=w.user_id,
+                memory_type=w.memory_type,
+                content=w.content,
+                confidence=w.confidence,
+                source_session_id=w.source_sessions[0] if w.source_sessions else None,
+            )
+            count += 1
+        return count
+
+
+class PgEvolutionWriter:
+    """PostgreSQL EvolutionWriter over PgMemoryCoreAdapter.write_many.
+
+    Batch writes take the same path as write_observation: MinHash bands,
+    near-duplicate reinforcement and working-set invalidation, plus
+    per-session idempotency keys so a replay is not applied again.
+    """
+
+    def __init__(self, *, memory_core: PgMemoryCoreAdapter) -> None:
+        self._memory_core = memory_core
+
+    async def write_many(self, writes: list[EvolutionWrite]) -> int:
+        return await self._memory_core.write_many(writes)
@@ -11,6 +11,7 @@ Architecture: Section 2.2 (Three-stage async pipeline)
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -69,6 +70,63 @@ class EvolutionResult:
     evolved_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+# ---------------------------------------------------------------------------
+# Signal matching
+# ---------------------------------------------------------------------------
+
+# memory_type -> (confidence, substring signals); declaration order is the
+# order observations are emitted for a message
+DEFAULT_SIGNALS: dict[str, tuple[float, tuple[str, ...]]] = {
+    "preference": (0.5, ("i prefer", "i like", "i want", "i need", "my favorite")),
+    "observation": (
+        0.6,
+        (
+            "i am",
+            "i work",
+            "my name",
+            "i live",
+            "i have",
+            "my pet",
+            "my dog",
+            "my cat",
+            "remember",
+        ),
+    ),
+}
+
+
+class SignalMatcher:
+    """Precompiled multi-pattern matcher for rule-based extraction.
+
+    All signals are folded into one regex with a named group per memory
+    type, wrapped in a lookahead so overlapping signals are still seen.
+    Matching is a single scan per message instead of one substring test
+    per signal, with the same case-insensitive substring semantics.
+    """
+
+    def __init__(self, signals: dict[str, tuple[float, tuple[str, ...]]] | None = None) -> None:
+        self._signals = signals if signals is not None else DEFAULT_SIGNALS
+        self._types = list(self._signals)
+        groups = "|".join(
+            f"(?P<g{i}>{'|'.join(re.escape(s) for s in phrases)})"
+            for i, (_, phrases) in enumerate(self._signals.values())
+        )
+        self._pattern = re.compile(f"(?=(?:{groups}))", re.IGNORECASE)
+
+    def confidence(self, memory_type: str) -> float:
+        """Base confidence for observations of memory_type."""
+        return self._signals[memory_type][0]
+
+    def match(self, content: str) -> list[str]:
+        """Memory types signalled by content, in declaration order."""
+        found: set[int] = set()
+        for m in self._pattern.finditer(content):
+            found.add(int(m.lastgroup[1:]) if m.lastgroup else 0)
+            if len(found) == len(self._types):
+                break
+        return [self._types[i] for i in sorted(found)]
+
+
 # ---------------------------------------------------------------------------
 # Pipeline stages
 # ---------------------------------------------------------------------------
@@ -82,6 +140,9 @@ class Observer:
 
     MAX_CONFIDENCE = 0.6
 
+    def __init__(self, matcher: SignalMatcher | None = None) -> None:
+        self._matcher = matcher or SignalMatcher()
+
     async def extract(
         self,
         session_id: UUID,
@@ -113,51 +174,17 @@ class Observer:
         content: str,
         session_id: UUID,
     ) -> list[ExtractedObservation]:
-        """Simple rule-based extraction for Day-1."""
-        observations: list[ExtractedObservation] = []
-        content_lower = content.lower()
-
-        # Preference detection
-        preference_signals = ["i prefer", "i like", "i want", "i need", "my favorite"]
-        for signal in preference_signals:
-            if signal in content_lower:
-                observations.append(
-                    ExtractedObservation(
-                        id=uuid4(),
-                        content=content,
-                        memory_type="preference",
-                        confidence=min(0.5, self.MAX_CONFIDENCE),
-                        source_session_id=session_id,
-                    )
-                )
-                break
-
-        # Fact/statement detection
-        fact_signals = [
-            "i am",
-            "i work",
-            "my name",
-            "i live",
-            "i have",
-            "my pet",
-            "my dog",
-            "my cat",
-            "remember",
+        """Rule-based extraction: one observation per signalled memory type."""
+        return [
+            ExtractedObservation(
+                id=uuid4(),
+                content=content,
+                memory_type=memory_type,
+                confidence=min(self._matcher.confidence(memory_type), self.MAX_CONFIDENCE),
+                source_session_id=session_id,
+            )
+            for memory_type in self._matcher.match(content)
         ]
-        for signal in fact_signals:
-            if signal in content_lower:
-                observations.append(
-                    ExtractedObservation(
-                        id=uuid4(),
-                        content=content,
-                        memory_type="observation",
-                        confidence=min(0.6, self.MAX_CONFIDENCE),
-                        source_session_id=session_id,
-                    )
-                )
-                break
-
-        return observations
 
 
 class Analyzer:
@@ -204,13 +231,15 @@ class Evolver:
     Only confirmed_by_user reaches confidence 1.0.
     """
 
+    MIN_CONFIDENCE = 0.3
+
     async def evolve(
         self,
         observation: ExtractedObservation,
         analysis: AnalysisResult,
     ) -> EvolutionResult:
         """Decide whether to create/update/skip based on analysis."""
-        if analysis.suggested_confidence < 0.3:
+        if analysis.suggested_confidence < self.MIN_CONFIDENCE:
             return EvolutionResult(
                 observation_id=observation.id,
                 action="skipped",
@@ -0,0 +1,112 @@
+"""PostgreSQL store for negative memory feedback.
+
+Task card: B3-4 (persistence)
+- memory_feedback holds one row per negated memory: negative_count and
+  fused_at (set once the count reaches the fuse threshold)
+- record_negative is a single upsert ... RETURNING, so concurrent workers
+  never lose a count and agree on when a memory fuses
+- fused_ids / fused_among serve the Brain's per-user Bloom filter
+  (PersistentFeedbackFuse) and its confirmation of filter hits
+
+Architecture: docs/architecture/01-Brain Section 2.3 (Memory Quality)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import sqlalchemy as sa
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_RECORD_NEGATIVE = sa.text(
+    """
+    INSERT INTO memory_feedback
+        (memory_item_id, org_id, user_id, negative_count, fused_at, updated_at)
+    VALUES
+        (:memory_id, :org_id, :user_id, 1,
+         CASE WHEN 1 >= :threshold THEN now() END, now())
+    ON CONFLICT (memory_item_id) DO UPDATE SET
+        negative_count = memory_feedback.negative_count + 1,
+        fused_at = COALESCE(
+            memory_feedback.fused_at,
+            CASE WHEN memory_feedback.negative_count + 1 >= :threshold THEN now() END
+        ),
+        updated_at = now()
+    RETURNING negative_count, fused_at IS NOT NULL AS fused
+    """
+)
+
+_FUSED_IDS = sa.text(
+    """
+    SELECT memory_item_id FROM memory_feedback
+    WHERE user_id = :user_id AND fused_at IS NOT NULL
+    """
+)
+
+_FUSED_AMONG = sa.text(
+    """
+    SELECT memory_item_id FROM memory_feedback
+    WHERE user_id = :user_id AND fused_at IS NOT NULL
+      AND memory_item_id IN :memory_ids
+    """
+).bindparams(sa.bindparam("memory_ids", expanding=True))
+
+_RESET = sa.text(
+    "DELETE FROM memory_feedback WHERE memory_item_id = :memory_id AND user_id = :user_id"
+)
+
+
+class PgFeedbackStore:
+    """PostgreSQL implementation of the Brain's FeedbackStore protocol."""
+
+    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def record_negative(
+        self,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        memory_id: UUID,
+        threshold: int,
+    ) -> tuple[int, bool]:
+        params = {
+            "memory_id": str(memory_id),
+            "org_id": str(org_id),
+            "user_id": str(user_id),
+            "threshold": threshold,
+        }
+        async with self._session_factory() as session:
+            result = await session.execute(_RECORD_NEGATIVE, params)
+            row = result.fetchone()
+            await session.commit()
+        if row is None:
+            return 0, False
+        return int(row[0]), bool(row[1])
+
+    async def fused_ids(self, user_id: UUID) -> set[UUID]:
+        async with self._session_factory() as session:
+            result = await session.execute(_FUSED_IDS, {"user_id": str(user_id)})
+            rows = result.fetchall()
+        return {_as_uuid(row[0]) for row in rows}
+
+    async def fused_among(self, user_id: UUID, memory_ids: list[UUID]) -> set[UUID]:
+        if not memory_ids:
+            return set()
+        params = {"user_id": str(user_id), "memory_ids": [str(m) for m in memory_ids]}
+        async with self._session_factory() as session:
+            result = await session.execute(_FUSED_AMONG, params)
+            rows = result.fetchall()
+        return {_as_uuid(row[0]) for row in rows}
+
+    async def reset(self, user_id: UUID, memory_id: UUID) -> None:
+        async with self._session_factory() as session:
+            await session.execute(_RESET, {"memory_id": str(memory_id), "user_id": str(user_id)})
+            await session.commit()
+
+
+def _as_uuid(value: object) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
@@ -3,12 +3,14 @@
 Task card: MC2-3
 - Create -> Update (version+1) -> Read latest -> Query history
 - Version chain must be complete and traceable
+- PgMemoryItemStore writes invalidate the user's MemoryWorkingSet entries
 
 Architecture: ADR-033, Section 2.3.1 (MemoryItem versioning)
 """
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
@@ -21,6 +23,7 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from src.infra.models import MemoryItemModel
+    from src.memory.working_set import MemoryWorkingSet
 
 
 class MemoryItemStore:
@@ -130,6 +133,21 @@ class MemoryItemStore:
 
         return new_item
 
+    def supersede(self, memory_id: UUID, *, new_memory_id: UUID) -> MemoryItem:
+        """Mark an item as superseded by new_memory_id (no new version).
+
+        Raises:
+            KeyError: If memory_id not found.
+        """
+        old = self._items.get(memory_id)
+        if old is None:
+            msg = f"MemoryItem {memory_id} not found"
+            raise KeyError(msg)
+
+        superseded = replace(old, superseded_by=new_memory_id, invalid_at=datetime.now(UTC))
+        self._items[memory_id] = superseded
+        return superseded
+
     def get(self, memory_id: UUID) -> MemoryItem | None:
         """Get a memory item by ID (any version)."""
         return self._items.get(memory_id)
@@ -171,8 +189,18 @@ class PgMemoryItemStore:
     RLS SET LOCAL is handled externally by src.infra.db.get_db_session.
     """
 
-    def __init__(self, *, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        working_set: MemoryWorkingSet | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._working_set = working_set
+
+    async def _invalidate(self, user_id: UUID) -> None:
+        if self._working_set is not None:
+            await self._working_set.invalidate(user_id)
 
     async def add_item(
         self,
@@ -211,6 +239,7 @@ class PgMemoryItemStore:
         async with self._session_factory() as session:
             session.add(model)
             await session.commit()
+        await self._invalidate(user_id)
 
         return MemoryItem(
             memory_id=memory_id,
@@ -238,7 +267,7 @@ class PgMemoryItemStore:
 
         if row is None:
             return None
-        return _row_to_memory_item(row)
+        return row_to_memory_item(row)
 
     async def get_items_for_user(
         self,
@@ -262,7 +291,7 @@ class PgMemoryItemStore:
             result = await session.scalars(stmt)
             rows = result.all()
 
-        return [_row_to_memory_item(row) for row in rows]
+        return [row_to_memory_item(row) for row in rows]
 
     async def update_item(
         self,
@@ -319,6 +348,7 @@ class PgMemoryItemStore:
 
             session.add(new_model)
             await session.commit()
+        await self._invalidate(new_model.user_id)
 
         return MemoryItem(
             memory_id=new_id,
@@ -364,9 +394,10 @@ class PgMemoryItemStore:
             row.superseded_by = new_memory_id
             row.invalid_at = now
             await session.commit()
+        await self._invalidate(row.user_id)
 
 
-def _row_to_memory_item(row: MemoryItemModel) -> MemoryItem:
+def row_to_memory_item(row: MemoryItemModel) -> MemoryItem:
     """Convert an ORM row to a domain MemoryItem."""
     return MemoryItem(
         memory_id=row.id,
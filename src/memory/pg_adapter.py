@@ -6,6 +6,11 @@ Task card: MC2-1, MC2-4
 - RLS SET LOCAL is handled by src.infra.db.get_db_session (not here)
 - Adapter implements Port interface; consumers unchanged
 - Hybrid retrieval: pgvector semantic search + ILIKE keyword, fused via RRF
+- Optional write-path dedup: MinHash/LSH near-duplicates reinforce, not insert
+- write_many: batch writes from pipelines share write_observation's path;
+  one idempotency key per (source session, write) makes replays no-ops
+- Optional decay-ranked retrieval: effective confidence computed in SQL
+- Optional per-user working set: repeat retrievals skip PG until a write
 
 Architecture: Section 2.1 (PostgreSQL as Memory Core primary storage)
 """
@@ -13,25 +18,44 @@ Architecture: Section 2.1 (PostgreSQL as Memory Core primary storage)
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Protocol
-from uuid import uuid4
+from uuid import UUID, uuid4, uuid5
 
 import sqlalchemy as sa
-
+from sqlalchemy.dialects import postgresql
+
+from src.memory.confidence import DecayRanking, effective_confidence_expr
+from src.memory.dedup import (
+    DedupPolicy,
+    DedupStats,
+    band_keys,
+    content_similarity,
+    minhash_signature,
+)
 from src.ports.memory_core_port import MemoryCorePort
 from src.shared.types import MemoryItem, Observation, PromotionReceipt, WriteReceipt
 
 if TYPE_CHECKING:
-    from uuid import UUID
+    from collections.abc import Sequence
 
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from src.infra.models import MemoryItemModel
     from src.memory.vector_search import PgVectorSearchEngine
+    from src.memory.working_set import MemoryWorkingSet, WorkingSetStats
 
 logger = logging.getLogger(__name__)
 
+_WRITE_KEY_NAMESPACE = UUID("0c6f1d4e-2b7a-4f35-9a0e-5d8c3e71b962")
+_MEMORY_WRITE_KEYS = sa.table(
+    "memory_write_keys",
+    sa.column("write_key", sa.Uuid()),
+    sa.column("org_id", sa.Uuid()),
+    sa.column("applied_at", sa.DateTime(timezone=True)),
+)
+
 
 class QueryEmbedderProtocol(Protocol):
     """Protocol for query text -> embedding vector conversion."""
@@ -39,6 +63,36 @@ class QueryEmbedderProtocol(Protocol):
     async def embed(self, text: str) -> list[float]: ...
 
 
+class NewMemory(Protocol):
+    """A memory item to write with a caller-chosen ID (see write_many)."""
+
+    @property
+    def memory_id(self) -> UUID: ...
+    @property
+    def org_id(self) -> UUID: ...
+    @property
+    def user_id(self) -> UUID: ...
+    @property
+    def memory_type(self) -> str: ...
+    @property
+    def content(self) -> str: ...
+    @property
+    def confidence(self) -> float: ...
+    @property
+    def source_sessions(self) -> Sequence[UUID]: ...
+
+
+@dataclass(frozen=True)
+class _NewMemory:
+    memory_id: UUID
+    org_id: UUID
+    user_id: UUID
+    memory_type: str
+    content: str
+    confidence: float
+    source_sessions: list[UUID] = field(default_factory=list)
+
+
 class PgMemoryCoreAdapter(MemoryCorePort):
     """PostgreSQL-backed implementation of MemoryCorePort.
 
@@ -48,6 +102,17 @@ class PgMemoryCoreAdapter(MemoryCorePort):
     When a PgVectorSearchEngine and query_embedder are provided, the main
     retrieval path uses hybrid search (pgvector + ILIKE via RRF fusion).
     Falls back to ILIKE-only when vector search is unavailable.
+
+    When a DedupPolicy is provided, write_observation probes MinHash band keys and
+    reinforces an existing near-duplicate of the same user/type instead of
+    inserting a new row.
+
+    When a DecayRanking is provided, both retrieval paths order by effective
+    (time-decayed) confidence in SQL and optionally drop stale rows there,
+    so top-k selection accounts for decay without over-fetching.
+
+    When a MemoryWorkingSet is provided, retrieval results are cached per
+    user and write_observation invalidates the writer's entries.
     """
 
     def __init__(
@@ -56,10 +121,27 @@ class PgMemoryCoreAdapter(MemoryCorePort):
         session_factory: async_sessionmaker[AsyncSession],
         vector_engine: PgVectorSearchEngine | None = None,
         query_embedder: QueryEmbedderProtocol | None = None,
+        dedup_policy: DedupPolicy | None = None,
+        decay_ranking: DecayRanking | None = None,
+        working_set: MemoryWorkingSet | None = None,
     ) -> None:
         self._session_factory = session_factory
         self._vector_engine = vector_engine
         self._query_embedder = query_embedder
+        self._dedup_policy = dedup_policy
+        self._decay_ranking = decay_ranking
+        self._working_set = working_set
+        self._dedup_stats = DedupStats()
+
+    @property
+    def dedup_stats(self) -> DedupStats:
+        """Write-path dedup counters (inserted vs reinforced)."""
+        return self._dedup_stats
+
+    @property
+    def working_set_stats(self) -> WorkingSetStats | None:
+        """Retrieval cache hit ratio / round trips avoided (None when disabled)."""
+        return self._working_set.stats if self._working_set is not None else None
 
     async def read_personal_memories(
         self,
@@ -73,7 +155,30 @@ class PgMemoryCoreAdapter(MemoryCorePort):
 
         Primary path (MC2-4): RRF fusion of pgvector semantic + ILIKE keyword.
         Fallback: ILIKE keyword-only when vector engine is unavailable.
+        Served from the working set when one is configured and warm.
         """
+        if self._working_set is not None:
+            cached = await self._working_set.get(user_id, query, top_k, org_id=org_id)
+            if cached is not None:
+                return cached
+        generation = None
+        if self._working_set is not None:
+            generation = await self._working_set.generation(user_id)
+        items = await self._retrieve(user_id=user_id, query=query, top_k=top_k, org_id=org_id)
+        if self._working_set is not None:
+            await self._working_set.put(
+                user_id, query, top_k, items, org_id=org_id, generation=generation
+            )
+        return items
+
+    async def _retrieve(
+        self,
+        *,
+        user_id: UUID,
+        query: str,
+        top_k: int,
+        org_id: UUID | None,
+    ) -> list[MemoryItem]:
         # Primary path: hybrid search when vector engine + embedder are available
         if self._vector_engine and self._query_embedder and org_id and query:
             try:
@@ -112,13 +217,24 @@ class PgMemoryCoreAdapter(MemoryCorePort):
         assert self._query_embedder is not None
 
         embedding = await self._query_embedder.embed(query)
-        fused = await self._vector_engine.hybrid_search(
-            embedding=embedding,
-            query=query,
-            org_id=org_id,
-            user_id=user_id,
-            top_k=top_k,
-        )
+        if self._decay_ranking is not None:
+            fused = await self._vector_engine.decay_ranked_search(
+                embedding=embedding,
+                query=query,
+                org_id=org_id,
+                user_id=user_id,
+                ranking=self._decay_ranking,
+                now=datetime.now(UTC),
+                top_k=top_k,
+            )
+        else:
+            fused = await self._vector_engine.hybrid_search(
+                embedding=embedding,
+                query=query,
+                org_id=org_id,
+                user_id=user_id,
+                top_k=top_k,
+            )
 
         if not fused:
             return []
@@ -141,9 +257,14 @@ class PgMemoryCoreAdapter(MemoryCorePort):
         org_id: UUID | None,
         top_k: int,
     ) -> list[MemoryItem]:
-        """ILIKE keyword-only retrieval (fallback path)."""
+        """ILIKE keyword-only retrieval (fallback path).
+
+        Orders by raw confidence, or by effective confidence when decay
+        ranking is enabled.
+        """
         from src.infra.models import MemoryItemModel
 
+        now = datetime.now(UTC)
         stmt = (
             sa.select(MemoryItemModel)
             .where(
@@ -151,13 +272,26 @@ class PgMemoryCoreAdapter(MemoryCorePort):
                 MemoryItemModel.superseded_by.is_(None),
                 sa.or_(
                     MemoryItemModel.invalid_at.is_(None),
-                    MemoryItemModel.invalid_at > datetime.now(UTC),
+                    MemoryItemModel.invalid_at > now,
                 ),
             )
-            .order_by(MemoryItemModel.confidence.desc())
             .limit(top_k)
         )
 
+        if self._decay_ranking is not None:
+            effective = effective_confidence_expr(
+                MemoryItemModel.confidence,
+                MemoryItemModel.valid_at,
+                MemoryItemModel.last_validated_at,
+                now=now,
+                half_life_days=self._decay_ranking.half_life_days,
+            )
+            stmt = stmt.order_by(effective.desc())
+            if self._decay_ranking.stale_threshold is not None:
+                stmt = stmt.where(effective >= self._decay_ranking.stale_threshold)
+        else:
+            stmt = stmt.order_by(MemoryItemModel.confidence.desc())
+
         if org_id is not None:
             stmt = stmt.where(MemoryItemModel.org_id == org_id)
 
@@ -182,40 +316,212 @@ class PgMemoryCoreAdapter(MemoryCorePort):
         *,
         org_id: UUID | None = None,
     ) -> WriteReceipt:
-        """Write a new observation as a MemoryItemModel row."""
-        from src.infra.models import MemoryItemModel
+        """Write a new observation as a MemoryItemModel row.
 
+        With dedup enabled, a near-duplicate of an active item (same user,
+        org and memory_type) is reinforced in place and its receipt returned.
+        """
         if org_id is None:
             msg = "org_id is required for PG write operations"
             raise ValueError(msg)
 
         now = datetime.now(UTC)
-        memory_id = uuid4()
-        model = MemoryItemModel(
-            id=memory_id,
+        write = _NewMemory(
+            memory_id=uuid4(),
             org_id=org_id,
             user_id=user_id,
             memory_type=observation.memory_type,
             content=observation.content,
             confidence=observation.confidence,
-            epistemic_type="fact",
-            version=1,
             source_sessions=(
                 [observation.source_session_id] if observation.source_session_id else []
             ),
-            valid_at=now,
         )
-
         async with self._session_factory() as session:
-            session.add(model)
+            ((row, reinforced),) = await self._stage(session, [write], now=now)
             await session.commit()
 
+        await self._invalidate_working_set(user_id)
         return WriteReceipt(
-            memory_id=model.id,
-            version=1,
+            memory_id=row.id,
+            version=row.version if reinforced else 1,
             written_at=now,
         )
 
+    async def write_many(self, writes: Sequence[NewMemory]) -> int:
+        """Batch form of write_observation for pipeline writers (one commit).
+
+        Rows get the same MinHash bands, near-duplicate reinforcement and
+        working-set invalidation as write_observation. Each write is applied
+        at most once per source session (see _claim_write_keys), so replaying
+        a batch neither inserts nor reinforces twice. Returns rows inserted
+        or reinforced.
+        """
+        if not writes:
+            return 0
+        now = datetime.now(UTC)
+        async with self._session_factory() as session:
+            fresh = await self._claim_write_keys(session, writes, now=now)
+            staged = await self._stage(session, fresh, now=now)
+            await session.commit()
+
+        for user_id in {w.user_id for w in fresh}:
+            await self._invalidate_working_set(user_id)
+        return len(staged)
+
+    async def _claim_write_keys(
+        self,
+        session: AsyncSession,
+        writes: Sequence[NewMemory],
+        *,
+        now: datetime,
+    ) -> list[NewMemory]:
+        """Claim one idempotency key per (source session, write); keep what was claimed.
+
+        Keys are claimed with INSERT ... ON CONFLICT DO NOTHING RETURNING in
+        the caller's transaction, so a concurrent replay waits on the first
+        and then finds the keys taken. A write whose sessions were all
+        applied before is dropped; a partly applied one keeps only its new
+        sessions. Writes without source sessions are keyed by memory_id.
+        """
+        planned: list[tuple[NewMemory, dict[UUID, UUID | None]]] = []
+        for write in writes:
+            keys: dict[UUID, UUID | None] = {
+                _write_key(write, session_id): session_id for session_id in write.source_sessions
+            } or {write.memory_id: None}
+            planned.append((write, keys))
+
+        result = await session.execute(
+            postgresql.insert(_MEMORY_WRITE_KEYS)
+            .values(
+                [
+                    {"write_key": key, "org_id": write.org_id, "applied_at": now}
+                    for write, keys in planned
+                    for key in keys
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["write_key"])
+            .returning(_MEMORY_WRITE_KEYS.c.write_key)
+        )
+        claimed = {row[0] for row in result.fetchall()}
+
+        fresh: list[NewMemory] = []
+        for write, keys in planned:
+            taken = [key for key in keys if key in claimed]
+            claimed.difference_update(taken)
+            if len(taken) == len(keys):
+                fresh.append(write)
+            elif taken:
+                fresh.append(
+                    _NewMemory(
+                        memory_id=write.memory_id,
+                        org_id=write.org_id,
+                        user_id=write.user_id,
+                        memory_type=write.memory_type,
+                        content=write.content,
+                        confidence=write.confidence,
+                        source_sessions=[sid for key in taken if (sid := keys[key]) is not None],
+                    )
+                )
+        return fresh
+
+    async def _stage(
+        self,
+        session: AsyncSession,
+        writes: Sequence[NewMemory],
+        *,
+        now: datetime,
+    ) -> list[tuple[MemoryItemModel, bool]]:
+        """Add new rows to the session or reinforce their near-duplicates.
+
+        Returns (row, reinforced) per staged write.
+        """
+        from src.infra.models import MemoryItemModel
+
+        staged: list[tuple[MemoryItemModel, bool]] = []
+        for write in writes:
+            bands: list[int] | None = None
+            if self._dedup_policy is not None:
+                self._dedup_stats.writes += 1
+                bands = band_keys(minhash_signature(write.content))
+                duplicate = await self._find_near_duplicate(session, MemoryItemModel, write, bands)
+                if duplicate is not None:
+                    self._reinforce(duplicate, write.source_sessions, now)
+                    self._dedup_stats.reinforced += 1
+                    staged.append((duplicate, True))
+                    continue
+                self._dedup_stats.inserted += 1
+
+            model = MemoryItemModel(
+                id=write.memory_id,
+                org_id=write.org_id,
+                user_id=write.user_id,
+                memory_type=write.memory_type,
+                content=write.content,
+                confidence=write.confidence,
+                epistemic_type="fact",
+                version=1,
+                source_sessions=list(write.source_sessions),
+                minhash_bands=bands,
+                valid_at=now,
+            )
+            session.add(model)
+            staged.append((model, False))
+        return staged
+
+    async def _invalidate_working_set(self, user_id: UUID) -> None:
+        if self._working_set is not None:
+            await self._working_set.invalidate(user_id)
+
+    async def _find_near_duplicate(
+        self,
+        session: AsyncSession,
+        model: type[MemoryItemModel],
+        write: NewMemory,
+        bands: list[int],
+    ) -> MemoryItemModel | None:
+        """Probe the band index and return the most similar active near-duplicate."""
+        assert self._dedup_policy is not None
+
+        stmt = (
+            sa.select(model)
+            .where(
+                model.org_id == write.org_id,
+                model.user_id == write.user_id,
+                model.memory_type == write.memory_type,
+                model.superseded_by.is_(None),
+                model.invalid_at.is_(None),
+                model.minhash_bands.overlap(bands),
+            )
+            .limit(self._dedup_policy.max_candidates)
+        )
+        result = await session.scalars(stmt)
+
+        best: MemoryItemModel | None = None
+        best_score = self._dedup_policy.similarity_threshold
+        for row in result.all():
+            score = content_similarity(write.content, row.content)
+            if score >= best_score:
+                best, best_score = row, score
+        return best
+
+    def _reinforce(
+        self,
+        row: MemoryItemModel,
+        session_ids: Sequence[UUID],
+        now: datetime,
+    ) -> None:
+        """Bump confidence and revalidate an existing item in place."""
+        assert self._dedup_policy is not None
+
+        row.confidence = self._dedup_policy.reinforced_confidence(row.confidence)
+        row.last_validated_at = now
+        row.updated_at = now
+        sessions = list(row.source_sessions or [])
+        new_sessions = [s for s in session_ids if s not in sessions]
+        if new_sessions:
+            row.source_sessions = [*sessions, *new_sessions]
+
     async def get_session(self, session_id: UUID) -> object:
         """Retrieve a conversation session by ID.
 
@@ -268,3 +574,11 @@ def _row_to_memory_item(row: MemoryItemModel) -> MemoryItem:
         provenance=row.provenance,
         epistemic_type=row.epistemic_type,
     )
+
+
+def _write_key(write: NewMemory, session_id: UUID) -> UUID:
+    """Idempotency key of one source session's contribution to a write."""
+    return uuid5(
+        _WRITE_KEY_NAMESPACE,
+        f"{session_id}:{write.user_id}:{write.memory_type}:{write.content}",
+    )
@@ -16,11 +16,14 @@ import logging
 import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID, uuid4
 
 from src.shared.types import MemoryItem, PromotionReceipt
 
+if TYPE_CHECKING:
+    from src.shared.types import VectorPoint
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +55,55 @@ class ConflictCheckResult:
     similarity_score: float = 0.0
 
 
+class KnowledgeConflictIndex(Protocol):
+    """Batched nearest-neighbour lookup over org knowledge (QdrantAdapter)."""
+
+    async def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        *,
+        org_id: UUID | None = None,
+        limit: int = 10,
+    ) -> list[list[VectorPoint]]: ...
+
+
+class ContentEmbedder(Protocol):
+    """Text -> embedding vector, for content without a stored embedding."""
+
+    async def embed(self, text: str) -> list[float]: ...
+
+
+async def find_conflicts(
+    index: KnowledgeConflictIndex,
+    vectors: list[list[float]],
+    *,
+    org_id: UUID,
+    threshold: float,
+) -> list[ConflictCheckResult]:
+    """Conflict-check many embeddings with one batched knowledge lookup.
+
+    A vector conflicts when its nearest org knowledge scores >= threshold.
+    Results are in input order.
+    """
+    if not vectors:
+        return []
+    hits = await index.search_batch(vectors, org_id=org_id, limit=1)
+    results: list[ConflictCheckResult] = []
+    for nearest in hits:
+        top = nearest[0] if nearest else None
+        if top is None or (top.score or 0.0) < threshold:
+            results.append(ConflictCheckResult(has_conflict=False))
+            continue
+        results.append(
+            ConflictCheckResult(
+                has_conflict=True,
+                similar_knowledge_id=top.graph_node_id or top.point_id,
+                similarity_score=top.score or 0.0,
+            )
+        )
+    return results
+
+
 @dataclass
 class EvolutionProposal:
     """A promotion proposal pending approval."""
@@ -68,6 +120,24 @@ class EvolutionProposal:
     approved_by: UUID | None = None
     approved_at: datetime | None = None
     knowledge_id: UUID | None = None
+    user_id: UUID | None = None
+    similar_knowledge_id: UUID | None = None
+    similarity_score: float | None = None
+    rejection_reason: str | None = None
+
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_PHONE_RE = re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b")
+_CC_RE = re.compile(r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b")
+
+# (violation, pattern, mask) applied in order; each mask is PII-free
+_PII_RULES: tuple[tuple[str, re.Pattern[str], str], ...] = (
+    ("email_detected", _EMAIL_RE, "[REDACTED_EMAIL]"),
+    ("phone_detected", _PHONE_RE, "[REDACTED_PHONE]"),
+    ("credit_card_detected", _CC_RE, "[REDACTED_CC]"),
+)
+# Single-pass screen: clean content (the common case) never runs the rules
+_ANY_PII_RE = re.compile("|".join(f"(?:{p.pattern})" for _, p, _ in _PII_RULES))
 
 
 def sanitize_content(content: str) -> SanitizationResult:
@@ -87,23 +157,10 @@ def sanitize_content(content: str) -> SanitizationResult:
     violations: list[str] = []
     sanitized = content
 
-    # Email detection
-    email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    if re.search(email_pattern, sanitized):
-        violations.append("email_detected")
-        sanitized = re.sub(email_pattern, "[REDACTED_EMAIL]", sanitized)
-
-    # Phone detection (simple patterns)
-    phone_pattern = r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"
-    if re.search(phone_pattern, sanitized):
-        violations.append("phone_detected")
-        sanitized = re.sub(phone_pattern, "[REDACTED_PHONE]", sanitized)
-
-    # Credit card patterns
-    cc_pattern = r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"
-    if re.search(cc_pattern, sanitized):
-        violations.append("credit_card_detected")
-        sanitized = re.sub(cc_pattern, "[REDACTED_CC]", sanitized)
+    for violation, pattern, mask in _PII_RULES:
+        sanitized, hits = pattern.subn(mask, sanitized)
+        if hits:
+            violations.append(violation)
 
     return SanitizationResult(
         is_clean=len(violations) == 0,
@@ -112,10 +169,28 @@ def sanitize_content(content: str) -> SanitizationResult:
     )
 
 
+def sanitize_many(contents: list[str]) -> list[SanitizationResult]:
+    """Bulk sanitize_content: one combined-pattern screen per item.
+
+    Results are identical to calling sanitize_content on each item; only
+    contents that hit the combined screen pay for the per-rule passes.
+    """
+    return [
+        sanitize_content(c)
+        if _ANY_PII_RE.search(c)
+        else SanitizationResult(is_clean=True, sanitized_content=c)
+        for c in contents
+    ]
+
+
 class PromotionPipeline:
     """Orchestrates the memory-to-knowledge promotion flow.
 
     Flow: candidate -> sanitize -> conflict check -> proposal -> approval -> write
+
+    The conflict check is PromotionScanner's batched lookup (find_conflicts)
+    for a single memory: its stored embedding when the caller has one,
+    otherwise the sanitized content embedded with `embedder`.
     """
 
     def __init__(
@@ -123,11 +198,15 @@ class PromotionPipeline:
         *,
         thresholds: PromotionThresholds | None = None,
         knowledge_writer: Any | None = None,  # KnowledgeWriteService
-        vector_search: Any | None = None,  # QdrantAdapter for conflict check
+        vector_search: KnowledgeConflictIndex | None = None,  # QdrantAdapter
+        embedder: ContentEmbedder | None = None,
+        conflict_similarity: float = 0.92,
     ) -> None:
         self._thresholds = thresholds or PromotionThresholds()
         self._writer = knowledge_writer
         self._vector_search = vector_search
+        self._embedder = embedder
+        self._conflict_similarity = conflict_similarity
         self._proposals: dict[str, EvolutionProposal] = {}
         self._receipts: list[PromotionReceipt] = []
 
@@ -151,6 +230,7 @@ class PromotionPipeline:
         *,
         target_org_id: UUID,
         target_visibility: str = "store",
+        embedding: list[float] | None = None,
     ) -> PromotionReceipt:
         """Create a promotion proposal from a memory item.
 
@@ -161,6 +241,7 @@ class PromotionPipeline:
             memory: Source memory item.
             target_org_id: Target organization.
             target_visibility: Visibility level.
+            embedding: The memory's stored embedding, if the caller has it.
 
         Returns:
             PromotionReceipt tracking the proposal status.
@@ -182,7 +263,9 @@ class PromotionPipeline:
             return receipt
 
         # Step 2: Conflict check
-        conflict = await self._check_conflict(sanitization.sanitized_content, target_org_id)
+        conflict = await self._check_conflict(
+            sanitization.sanitized_content, target_org_id, embedding=embedding
+        )
 
         if conflict.has_conflict:
             receipt = PromotionReceipt(
@@ -303,14 +386,25 @@ class PromotionPipeline:
         self,
         content: str,
         org_id: UUID,
+        *,
+        embedding: list[float] | None = None,
     ) -> ConflictCheckResult:
         """Check for duplicate knowledge via semantic similarity."""
         # Without vector search, no conflict detection
         if self._vector_search is None:
             return ConflictCheckResult(has_conflict=False)
-
-        # Real implementation would embed content and search
-        return ConflictCheckResult(has_conflict=False)
+        if embedding is None:
+            if self._embedder is None:
+                return ConflictCheckResult(has_conflict=False)
+            embedding = await self._embedder.embed(content)
+
+        (result,) = await find_conflicts(
+            self._vector_search,
+            [embedding],
+            org_id=org_id,
+            threshold=self._conflict_similarity,
+        )
+        return result
 
     def get_proposal(self, proposal_id: UUID) -> EvolutionProposal | None:
         """Look up a proposal by ID."""
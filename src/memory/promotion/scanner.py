@@ -0,0 +1,356 @@
+"""Batch promotion candidate scanner.
+
+Milestone: MC3-1
+Layer: Memory Core (cross-SSOT boundary)
+
+Nightly counterpart of PromotionPipeline.create_proposal for whole orgs:
+- One SQL pass per chunk selects eligible memories: active, old enough,
+  confidence >= threshold and 30-day receipt frequency (memory_receipt_daily
+  rollup) >= threshold, with no existing proposal
+- sanitize_many screens the whole chunk
+- Conflict detection embeds nothing: the memories' stored embeddings are
+  sent to the knowledge vector index as one batched lookup per chunk
+- Every evaluated memory gets exactly one persisted proposal row (pending,
+  rejected or sanitize_failed), so later scans only see new candidates
+- Bounded: a run stops after max_chunks / time_budget_seconds and resumes
+  from the keyset cursor checkpointed through StoragePort
+- Runs in-process (await run_org()) or as a task via promotion_scan_task
+
+See: docs/architecture/02-Knowledge Section 7.2 (Promotion Pipeline)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID, uuid4
+
+from src.memory.promotion.pipeline import (
+    EvolutionProposal,
+    KnowledgeConflictIndex,
+    PromotionThresholds,
+    find_conflicts,
+    sanitize_many,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from src.memory.items import MemoryItemStore
+    from src.memory.receipt import ReceiptStore
+    from src.ports.storage_port import StoragePort
+    from src.shared.types import MemoryItem
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = "memory:promotion"
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+PROMOTION_SCAN_TASK = "memory.promotion.scan"
+
+
+@dataclass(frozen=True)
+class PromotionScanPolicy:
+    """Chunking, conflict and time-budget knobs for a scan."""
+
+    chunk_size: int = 500
+    conflict_similarity: float = 0.92
+    target_visibility: str = "store"
+    time_budget_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.chunk_size <= 0:
+            msg = f"chunk_size must be positive, got {self.chunk_size}"
+            raise ValueError(msg)
+        if not 0.0 < self.conflict_similarity <= 1.0:
+            msg = f"conflict_similarity must be in (0, 1], got {self.conflict_similarity}"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class PromotionCandidate:
+    """An eligible memory with its windowed frequency and stored embedding."""
+
+    memory: MemoryItem
+    frequency_30d: int
+    embedding: list[float] | None = None
+
+
+@dataclass
+class PromotionScanReport:
+    """Outcome of one scan run for an org."""
+
+    org_id: UUID
+    scanned: int = 0
+    proposed: int = 0
+    sanitize_failed: int = 0
+    conflicts: int = 0
+    deferred: int = 0  # user already at max_pending_per_user; retried next run
+    chunks: int = 0
+    resumed: bool = False
+    completed: bool = False
+    budget_exhausted: bool = False
+
+
+class PromotionCandidateSource(Protocol):
+    """Storage operations the scanner needs."""
+
+    async def scan_candidates(
+        self,
+        org_id: UUID,
+        *,
+        thresholds: PromotionThresholds,
+        after: UUID | None,
+        limit: int,
+        now: datetime,
+    ) -> list[PromotionCandidate]:
+        """Eligible memories without a proposal, ordered by memory_id after `after`."""
+        ...
+
+    async def pending_counts(self, org_id: UUID, user_ids: list[UUID]) -> dict[UUID, int]:
+        """Pending-approval proposals per user (missing users have none)."""
+        ...
+
+    async def save_proposals(self, org_id: UUID, proposals: list[EvolutionProposal]) -> int:
+        """Persist proposals; rows for already-proposed memories are skipped."""
+        ...
+
+
+class PromotionScanner:
+    """Scans an org for promotion candidates and persists proposals.
+
+    Args:
+        source: Storage operations (src.infra.memory.PgPromotionSource
+            or in-memory).
+        checkpoints: StoragePort holding per-org cursors (Redis in production).
+        conflicts: Knowledge vector index; None skips the conflict check.
+        thresholds: Eligibility thresholds shared with PromotionPipeline.
+        policy: Chunking, conflict and time-budget knobs.
+        clock: Wall clock for eligibility windows and proposal timestamps.
+    """
+
+    def __init__(
+        self,
+        source: PromotionCandidateSource,
+        *,
+        checkpoints: StoragePort,
+        conflicts: KnowledgeConflictIndex | None = None,
+        thresholds: PromotionThresholds | None = None,
+        policy: PromotionScanPolicy | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._source = source
+        self._checkpoints = checkpoints
+        self._conflicts = conflicts
+        self._thresholds = thresholds or PromotionThresholds()
+        self._policy = policy or PromotionScanPolicy()
+        self._clock = clock or (lambda: datetime.now(UTC))
+
+    async def run_org(self, org_id: UUID, *, max_chunks: int | None = None) -> PromotionScanReport:
+        """Scan an org, resuming from its checkpoint if one exists."""
+        report = PromotionScanReport(org_id=org_id)
+        key = f"{CHECKPOINT_KEY_PREFIX}:{org_id}"
+        started = time.monotonic()
+        budget = self._policy.time_budget_seconds
+
+        state: dict[str, Any] | None = await self._checkpoints.get(key)
+        after: UUID | None = None
+        if state:
+            report.resumed = True
+            after = UUID(state["after_id"])
+
+        while True:
+            if (max_chunks is not None and report.chunks >= max_chunks) or (
+                budget is not None and time.monotonic() - started >= budget
+            ):
+                report.budget_exhausted = True
+                logger.info(
+                    "Promotion scan for org %s paused after %d chunks", org_id, report.chunks
+                )
+                return report
+
+            now = self._clock()
+            chunk = await self._source.scan_candidates(
+                org_id,
+                thresholds=self._thresholds,
+                after=after,
+                limit=self._policy.chunk_size,
+                now=now,
+            )
+            if not chunk:
+                break
+            report.chunks += 1
+            report.scanned += len(chunk)
+
+            proposals = await self._evaluate(org_id, chunk, now, report)
+            if proposals:
+                await self._source.save_proposals(org_id, proposals)
+
+            after = chunk[-1].memory.memory_id
+            await self._checkpoints.put(key, {"after_id": str(after)}, ttl=CHECKPOINT_TTL_SECONDS)
+            if len(chunk) < self._policy.chunk_size:
+                break
+
+        await self._checkpoints.delete(key)
+        report.completed = True
+        return report
+
+    async def _evaluate(
+        self,
+        org_id: UUID,
+        chunk: list[PromotionCandidate],
+        now: datetime,
+        report: PromotionScanReport,
+    ) -> list[EvolutionProposal]:
+        """Apply the per-user cap, sanitize, and conflict-check one chunk."""
+        pending = await self._source.pending_counts(
+            org_id, sorted({c.memory.user_id for c in chunk})
+        )
+        admitted: list[PromotionCandidate] = []
+        for candidate in chunk:
+            user_id = candidate.memory.user_id
+            if pending.get(user_id, 0) >= self._thresholds.max_pending_per_user:
+                report.deferred += 1
+                continue
+            pending[user_id] = pending.get(user_id, 0) + 1
+            admitted.append(candidate)
+
+        sanitized = sanitize_many([c.memory.content for c in admitted])
+        proposals: list[EvolutionProposal] = []
+        to_check: list[int] = []
+        for candidate, result in zip(admitted, sanitized, strict=True):
+            proposal = EvolutionProposal(
+                proposal_id=uuid4(),
+                source_memory_id=candidate.memory.memory_id,
+                sanitized_content=result.sanitized_content,
+                confidence=candidate.memory.confidence,
+                target_org_id=org_id,
+                target_visibility=self._policy.target_visibility,
+                created_at=now,
+                expires_at=now + timedelta(days=7),
+                user_id=candidate.memory.user_id,
+            )
+            if not result.is_clean:
+                report.sanitize_failed += 1
+                proposal.status = "sanitize_failed"
+                proposal.rejection_reason = f"PII detected: {', '.join(result.violations)}"
+            elif candidate.embedding is not None and self._conflicts is not None:
+                to_check.append(len(proposals))
+            proposals.append(proposal)
+
+        if to_check and self._conflicts is not None:
+            conflicts = await find_conflicts(
+                self._conflicts,
+                [admitted[i].embedding or [] for i in to_check],
+                org_id=org_id,
+                threshold=self._policy.conflict_similarity,
+            )
+            for idx, conflict in zip(to_check, conflicts, strict=True):
+                if not conflict.has_conflict:
+                    continue
+                report.conflicts += 1
+                proposals[idx] = replace(
+                    proposals[idx],
+                    status="rejected",
+                    similar_knowledge_id=conflict.similar_knowledge_id,
+                    similarity_score=conflict.similarity_score,
+                    rejection_reason=(
+                        f"Similar knowledge exists (similarity={conflict.similarity_score:.2f})"
+                    ),
+                )
+
+        report.proposed += sum(1 for p in proposals if p.status == "pending_approval")
+        return proposals
+
+
+def promotion_scan_task(scanner: PromotionScanner) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(PROMOTION_SCAN_TASK, ...).
+
+    The returned coroutine function scans one org on the caller's event
+    loop and returns the report as a plain dict.
+    """
+
+    async def _task(org_id: str, max_chunks: int | None = None) -> dict[str, Any]:
+        report = await scanner.run_org(UUID(org_id), max_chunks=max_chunks)
+        return {**asdict(report), "org_id": org_id}
+
+    return _task
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+
+class InMemoryPromotionSource:
+    """PromotionCandidateSource over MemoryItemStore + ReceiptStore for unit testing."""
+
+    def __init__(
+        self,
+        store: MemoryItemStore,
+        receipts: ReceiptStore,
+        *,
+        users_by_org: dict[UUID, list[UUID]],
+        embeddings: dict[UUID, list[float]] | None = None,
+    ) -> None:
+        self._store = store
+        self._receipts = receipts
+        self._users_by_org = users_by_org
+        self._embeddings = embeddings or {}
+        self.proposals: dict[UUID, EvolutionProposal] = {}  # by source_memory_id
+        self.scan_calls = 0
+
+    async def scan_candidates(
+        self,
+        org_id: UUID,
+        *,
+        thresholds: PromotionThresholds,
+        after: UUID | None,
+        limit: int,
+        now: datetime,
+    ) -> list[PromotionCandidate]:
+        self.scan_calls += 1
+        oldest = now - timedelta(days=thresholds.min_age_days)
+        items = sorted(
+            (
+                item
+                for user_id in self._users_by_org.get(org_id, [])
+                for item in self._store.list_active(user_id)
+                if (after is None or item.memory_id > after)
+                and item.memory_id not in self.proposals
+                and item.confidence >= thresholds.confidence_min
+                and item.valid_at <= oldest
+            ),
+            key=lambda i: i.memory_id,
+        )
+        frequencies = await self._receipts.frequencies(
+            [i.memory_id for i in items], days=30, now=now
+        )
+        return [
+            PromotionCandidate(
+                memory=item,
+                frequency_30d=frequencies[item.memory_id],
+                embedding=self._embeddings.get(item.memory_id),
+            )
+            for item in items
+            if frequencies[item.memory_id] >= thresholds.frequency_min_30d
+        ][:limit]
+
+    async def pending_counts(self, org_id: UUID, user_ids: list[UUID]) -> dict[UUID, int]:
+        wanted = set(user_ids)
+        counts: dict[UUID, int] = {}
+        for p in self.proposals.values():
+            if p.status == "pending_approval" and p.user_id in wanted:
+                assert p.user_id is not None
+                counts[p.user_id] = counts.get(p.user_id, 0) + 1
+        return counts
+
+    async def save_proposals(self, org_id: UUID, proposals: list[EvolutionProposal]) -> int:
+        saved = 0
+        for p in proposals:
+            if p.source_memory_id not in self.proposals:
+                self.proposals[p.source_memory_id] = p
+                saved += 1
+        return saved
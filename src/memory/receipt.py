@@ -3,24 +3,75 @@
 Task card: MC2-6
 - memory_receipts table records 5-tuple per injection:
   candidate_score, decision_reason, policy_version, guardrail_hit, context_position
+- BufferedReceiptWriter: receipts are enqueued in memory on the request path
+  and flushed as multi-row INSERTs by a background task (size/time
+  thresholds, bounded queue with a loss counter, flush on shutdown)
+- memory_receipt_daily rollup: receipt counts per (item, type, UTC day),
+  upserted alongside every insert; windowed frequency queries read
+  O(days) rollup rows instead of O(receipts)
 
 Architecture: ADR-038 (Receipt structure for Confidence Calibration feedback)
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID, uuid4
 
 import sqlalchemy as sa
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from src.infra.models import MemoryReceiptModel
 
+logger = logging.getLogger(__name__)
+
+# memory_receipt_daily is read and upserted as plain SQL: one row per
+# (item, type, UTC day), count added to on conflict
+_UPSERT_DAILY = sa.text(
+    """
+    INSERT INTO memory_receipt_daily (memory_item_id, receipt_type, day, org_id, count)
+    VALUES (:memory_item_id, :receipt_type, :day, :org_id, :count)
+    ON CONFLICT (memory_item_id, receipt_type, day) DO UPDATE SET
+        count = memory_receipt_daily.count + excluded.count
+    """
+)
+
+_COUNT_BY_TYPE = sa.text(
+    """
+    SELECT receipt_type, sum(count) FROM memory_receipt_daily
+    WHERE memory_item_id = :memory_item_id
+    GROUP BY receipt_type
+    """
+)
+
+_FREQUENCIES = sa.text(
+    """
+    SELECT memory_item_id, sum(count) FROM memory_receipt_daily
+    WHERE memory_item_id IN :memory_item_ids
+      AND day >= :since
+      AND (CAST(:receipt_type AS text) IS NULL OR receipt_type = :receipt_type)
+    GROUP BY memory_item_id
+    """
+).bindparams(sa.bindparam("memory_item_ids", expanding=True))
+
+_DAILY_COUNTS = sa.text(
+    """
+    SELECT day, receipt_type, count FROM memory_receipt_daily
+    WHERE memory_item_id = :memory_item_id AND day >= :since
+    ORDER BY day, receipt_type
+    """
+)
+
 
 @dataclass(frozen=True)
 class MemoryReceipt:
@@ -42,6 +93,15 @@ class MemoryReceipt:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+@dataclass(frozen=True)
+class ReceiptDailyCount:
+    """One memory_receipt_daily row: receipts of one type on one UTC day."""
+
+    day: date
+    receipt_type: str
+    count: int
+
+
 @runtime_checkable
 class ReceiptStoreProtocol(Protocol):
     """Protocol for receipt storage (structural typing).
@@ -131,6 +191,12 @@ class ReceiptStore:
             context_position=context_position,
         )
 
+    async def record_many(self, receipts: list[MemoryReceipt]) -> None:
+        """Store pre-built receipts (batch sink for BufferedReceiptWriter)."""
+        for receipt in receipts:
+            self._receipts[receipt.id] = receipt
+            self._by_memory_item.setdefault(receipt.memory_item_id, []).append(receipt.id)
+
     async def get_receipts_for_item(
         self,
         memory_item_id: UUID,
@@ -150,6 +216,59 @@ class ReceiptStore:
             counts[r.receipt_type] = counts.get(r.receipt_type, 0) + 1
         return counts
 
+    async def frequency(
+        self,
+        memory_item_id: UUID,
+        *,
+        days: int = 30,
+        receipt_type: str | None = None,
+        now: datetime | None = None,
+    ) -> int:
+        """Receipts for one item within the trailing `days` UTC days."""
+        counts = await self.frequencies(
+            [memory_item_id], days=days, receipt_type=receipt_type, now=now
+        )
+        return counts[memory_item_id]
+
+    async def frequencies(
+        self,
+        memory_item_ids: list[UUID],
+        *,
+        days: int = 30,
+        receipt_type: str | None = None,
+        now: datetime | None = None,
+    ) -> dict[UUID, int]:
+        """Windowed receipt counts for many items (0 for items without receipts)."""
+        start = window_start(days, now)
+        counts = dict.fromkeys(memory_item_ids, 0)
+        for mid in memory_item_ids:
+            for r in await self.get_receipts_for_item(mid):
+                if receipt_type is not None and r.receipt_type != receipt_type:
+                    continue
+                if _utc_day(r.created_at) >= start:
+                    counts[mid] += 1
+        return counts
+
+    async def daily_counts(
+        self,
+        memory_item_id: UUID,
+        *,
+        days: int = 30,
+        now: datetime | None = None,
+    ) -> list[ReceiptDailyCount]:
+        """Per-day, per-type receipt counts within the window, oldest first."""
+        start = window_start(days, now)
+        receipts = await self.get_receipts_for_item(memory_item_id)
+        rows = [
+            row
+            for row in _rollup(receipts).values()
+            if row["memory_item_id"] == memory_item_id and row["day"] >= start
+        ]
+        return sorted(
+            (ReceiptDailyCount(r["day"], r["receipt_type"], r["count"]) for r in rows),
+            key=lambda c: (c.day, c.receipt_type),
+        )
+
     def _record(
         self,
         *,
@@ -234,6 +353,36 @@ class PgReceiptStore:
             context_position=context_position,
         )
 
+    async def record_many(self, receipts: list[MemoryReceipt]) -> None:
+        """Insert pre-built receipts in one flush and one commit.
+
+        The ORM batches the rows into a multi-row INSERT. The daily rollup
+        is upserted in the same transaction, pre-aggregated so a batch
+        touches each (item, type, day) row once.
+        """
+        from src.infra.models import MemoryReceiptModel
+
+        if not receipts:
+            return
+        async with self._session_factory() as session:
+            for r in receipts:
+                session.add(
+                    MemoryReceiptModel(
+                        id=r.id,
+                        org_id=r.org_id,
+                        memory_item_id=r.memory_item_id,
+                        receipt_type=r.receipt_type,
+                        candidate_score=r.candidate_score,
+                        decision_reason=r.decision_reason,
+                        policy_version=r.policy_version,
+                        guardrail_hit=r.guardrail_hit,
+                        context_position=r.context_position,
+                        created_at=r.created_at,
+                    )
+                )
+            await session.execute(_UPSERT_DAILY, list(_rollup(receipts).values()))
+            await session.commit()
+
     async def get_receipts_for_item(
         self,
         memory_item_id: UUID,
@@ -256,13 +405,78 @@ class PgReceiptStore:
         self,
         memory_item_id: UUID,
     ) -> dict[str, int]:
-        """Count receipts grouped by type for a memory item."""
-        receipts = await self.get_receipts_for_item(memory_item_id)
+        """Count receipts grouped by type for a memory item.
+
+        Sums the daily rollup (GROUP BY receipt_type), so the cost grows
+        with the item's active days, not its receipt count.
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(_COUNT_BY_TYPE, {"memory_item_id": memory_item_id})
+            rows = result.fetchall()
+
         counts: dict[str, int] = {"injection": 0, "retrieval": 0}
-        for r in receipts:
-            counts[r.receipt_type] = counts.get(r.receipt_type, 0) + 1
+        for receipt_type, total in rows:
+            counts[receipt_type] = int(total)
         return counts
 
+    async def frequency(
+        self,
+        memory_item_id: UUID,
+        *,
+        days: int = 30,
+        receipt_type: str | None = None,
+        now: datetime | None = None,
+    ) -> int:
+        """Receipts for one item within the trailing `days` UTC days."""
+        counts = await self.frequencies(
+            [memory_item_id], days=days, receipt_type=receipt_type, now=now
+        )
+        return counts[memory_item_id]
+
+    async def frequencies(
+        self,
+        memory_item_ids: list[UUID],
+        *,
+        days: int = 30,
+        receipt_type: str | None = None,
+        now: datetime | None = None,
+    ) -> dict[UUID, int]:
+        """Windowed receipt counts for many items in one GROUP BY query.
+
+        Items without receipts in the window map to 0. This is the bulk
+        source for PromotionPipeline.is_eligible(frequency_30d=...).
+        """
+        counts = dict.fromkeys(memory_item_ids, 0)
+        if not memory_item_ids:
+            return counts
+        params = {
+            "memory_item_ids": memory_item_ids,
+            "since": window_start(days, now),
+            "receipt_type": receipt_type,
+        }
+        async with self._session_factory() as session:
+            result = await session.execute(_FREQUENCIES, params)
+            rows = result.fetchall()
+
+        for memory_item_id, total in rows:
+            counts[memory_item_id] = int(total)
+        return counts
+
+    async def daily_counts(
+        self,
+        memory_item_id: UUID,
+        *,
+        days: int = 30,
+        now: datetime | None = None,
+    ) -> list[ReceiptDailyCount]:
+        """Per-day, per-type receipt counts within the window, oldest first."""
+        params = {"memory_item_id": memory_item_id, "since": window_start(days, now)}
+        async with self._session_factory() as session:
+            result = await session.execute(_DAILY_COUNTS, params)
+            rows = result.fetchall()
+
+        return [ReceiptDailyCount(day=d, receipt_type=t, count=c) for d, t, c in rows]
+
     async def _record(
         self,
         *,
@@ -275,39 +489,210 @@ class PgReceiptStore:
         guardrail_hit: bool,
         context_position: int | None,
     ) -> MemoryReceipt:
-        from src.infra.models import MemoryReceiptModel
-
-        receipt_id = uuid4()
-        now = datetime.now(UTC)
-        model = MemoryReceiptModel(
-            id=receipt_id,
-            org_id=org_id,
+        receipt = MemoryReceipt(
+            id=uuid4(),
             memory_item_id=memory_item_id,
+            org_id=org_id,
             receipt_type=receipt_type,
             candidate_score=candidate_score,
             decision_reason=decision_reason,
             policy_version=policy_version,
             guardrail_hit=guardrail_hit,
             context_position=context_position,
-            created_at=now,
         )
-        async with self._session_factory() as session:
-            session.add(model)
-            await session.commit()
+        await self.record_many([receipt])
+        return receipt
+
+
+class ReceiptBatchSink(Protocol):
+    """Destination for flushed receipt batches (ReceiptStore / PgReceiptStore)."""
+
+    async def record_many(self, receipts: list[MemoryReceipt]) -> None: ...
+
+
+@dataclass
+class ReceiptWriterStats:
+    """Counters for BufferedReceiptWriter."""
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0  # queue full or failed flush: receipts lost for good
+    flushes: int = 0
+
+
+class BufferedReceiptWriter:
+    """ReceiptStoreProtocol implementation that batches writes off the hot path.
+
+    record_injection / record_retrieval build the receipt and append it to
+    a bounded in-process queue; nothing touches the database on the
+    request path. A background task flushes with multi-row inserts when
+    batch_size receipts are waiting or every flush_interval seconds.
+    When the queue is full new receipts are dropped and counted: receipts
+    are calibration telemetry, and losing some beats back-pressuring chat.
+
+    Call start() once the event loop is running and close() on shutdown
+    (close drains everything still queued).
+    """
+
+    def __init__(
+        self,
+        sink: ReceiptBatchSink,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if batch_size <= 0 or max_queue < batch_size:
+            msg = f"need 0 < batch_size <= max_queue, got {batch_size}/{max_queue}"
+            raise ValueError(msg)
+        self._sink = sink
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: deque[MemoryReceipt] = deque()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+        self.stats = ReceiptWriterStats()
+
+    @property
+    def pending(self) -> int:
+        """Receipts queued but not yet flushed."""
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the background flush loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run(), name="receipt-writer")
+
+    async def close(self) -> None:
+        """Stop the flush loop and drain the queue."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def record_injection(
+        self,
+        *,
+        memory_item_id: UUID,
+        org_id: UUID,
+        candidate_score: float,
+        decision_reason: str,
+        policy_version: str = "v1",
+        guardrail_hit: bool = False,
+        context_position: int | None = None,
+    ) -> MemoryReceipt:
+        """Queue an injection receipt."""
+        return self._enqueue(
+            memory_item_id=memory_item_id,
+            org_id=org_id,
+            receipt_type="injection",
+            candidate_score=candidate_score,
+            decision_reason=decision_reason,
+            policy_version=policy_version,
+            guardrail_hit=guardrail_hit,
+            context_position=context_position,
+        )
 
-        return MemoryReceipt(
-            id=receipt_id,
+    async def record_retrieval(
+        self,
+        *,
+        memory_item_id: UUID,
+        org_id: UUID,
+        candidate_score: float,
+        decision_reason: str,
+        policy_version: str = "v1",
+        guardrail_hit: bool = False,
+        context_position: int | None = None,
+    ) -> MemoryReceipt:
+        """Queue a retrieval receipt."""
+        return self._enqueue(
             memory_item_id=memory_item_id,
             org_id=org_id,
-            receipt_type=receipt_type,
+            receipt_type="retrieval",
             candidate_score=candidate_score,
             decision_reason=decision_reason,
             policy_version=policy_version,
             guardrail_hit=guardrail_hit,
             context_position=context_position,
-            created_at=now,
         )
 
+    async def flush(self) -> int:
+        """Write everything queued right now. Returns receipts written."""
+        written = 0
+        async with self._flush_lock:
+            while self._queue:
+                take = min(self._batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(take)]
+                try:
+                    await self._sink.record_many(batch)
+                except Exception:
+                    self.stats.dropped += len(batch)
+                    logger.warning(
+                        "Dropped %d receipts: batch write failed", len(batch), exc_info=True
+                    )
+                    continue
+                self.stats.written += len(batch)
+                self.stats.flushes += 1
+                written += len(batch)
+        return written
+
+    def _enqueue(self, **fields: Any) -> MemoryReceipt:
+        receipt = MemoryReceipt(id=uuid4(), **fields)
+        if len(self._queue) >= self._max_queue:
+            self.stats.dropped += 1
+            return receipt
+        self._queue.append(receipt)
+        self.stats.enqueued += 1
+        if len(self._queue) >= self._batch_size:
+            self._wakeup.set()
+        return receipt
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+
+def window_start(days: int, now: datetime | None = None) -> date:
+    """First UTC day of a trailing window of `days` days ending today."""
+    if days <= 0:
+        msg = f"days must be positive, got {days}"
+        raise ValueError(msg)
+    return _utc_day(now or datetime.now(UTC)) - timedelta(days=days - 1)
+
+
+def _utc_day(moment: datetime) -> date:
+    return moment.astimezone(UTC).date() if moment.tzinfo else moment.date()
+
+
+def _rollup(receipts: Iterable[MemoryReceipt]) -> dict[tuple[UUID, str, date], dict[str, Any]]:
+    """Aggregate receipts into memory_receipt_daily rows keyed by primary key."""
+    rows: dict[tuple[UUID, str, date], dict[str, Any]] = {}
+    for r in receipts:
+        day = _utc_day(r.created_at)
+        key = (r.memory_item_id, r.receipt_type, day)
+        row = rows.get(key)
+        if row is None:
+            rows[key] = {
+                "memory_item_id": r.memory_item_id,
+                "receipt_type": r.receipt_type,
+                "day": day,
+                "org_id": r.org_id,
+                "count": 1,
+            }
+        else:
+            row["count"] += 1
+    return rows
+
 
 def _orm_to_domain(row: MemoryReceiptModel) -> MemoryReceipt:
     """Convert a MemoryReceiptModel ORM row to MemoryReceipt domain dataclass."""
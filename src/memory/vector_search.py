@@ -4,6 +4,12 @@ Task card: MC2-4
 - Write embedding -> similarity query Top-5 -> RRF fusion ranking
 - Top-5 recall >= 80%
 
+Decay-ranked mode: vector + keyword candidates, RRF fusion and effective
+confidence (90-day half-life, see confidence.py) are computed in one SQL
+statement, so only the final top-k rows leave the database. The stale
+threshold is applied inside each candidate pool, using the same decay
+expression as the relational path (confidence.effective_confidence_expr).
+
 Architecture: ADR-042 (pgvector as Day-1 default vector search)
 """
 
@@ -11,15 +17,20 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import sqlalchemy as sa
 
+from src.memory.confidence import effective_confidence_expr
+
 if TYPE_CHECKING:
+    from datetime import datetime
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+    from src.memory.confidence import DecayRanking
+
 
 @dataclass(frozen=True)
 class SearchResult:
@@ -40,6 +51,7 @@ class FusedResult:
     rrf_score: float
     vector_rank: int | None = None
     keyword_rank: int | None = None
+    effective_confidence: float | None = None  # set by decay-ranked search
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -348,3 +360,151 @@ class PgVectorSearchEngine:
             return []
 
         return rrf_fuse([vec_results, kw_results], top_n=top_k)
+
+    # ------------------------------------------------------------------
+    # Decay-ranked hybrid search (single statement)
+    # ------------------------------------------------------------------
+
+    async def decay_ranked_search(
+        self,
+        embedding: list[float],
+        query: str,
+        org_id: UUID,
+        user_id: UUID,
+        *,
+        ranking: DecayRanking,
+        now: datetime,
+        top_k: int = 5,
+    ) -> list[FusedResult]:
+        """Hybrid search ranked by RRF score x effective confidence in SQL.
+
+        Vector and keyword candidate pools (ranking.candidate_k each) are
+        ranked with ROW_NUMBER(), fused with a FULL OUTER JOIN, weighted by
+        the decayed confidence and cut to top_k inside PostgreSQL. When
+        ranking.stale_threshold is set, stale rows are dropped inside both
+        candidate pools, so they cannot crowd fresh rows out of the pool.
+
+        Returns:
+            Exactly the top_k FusedResult items (fewer if not enough
+            candidates), ordered by the combined score descending.
+        """
+        stmt = _decay_ranked_statement(
+            embedding, query, org_id, user_id, ranking=ranking, now=now, top_k=top_k
+        )
+        async with self._session_factory() as session:
+            cursor = await session.execute(stmt)
+            rows = cursor.fetchall()
+
+        return [
+            FusedResult(
+                memory_id=row[0],
+                content="",
+                rrf_score=float(row[1]),
+                effective_confidence=float(row[2]),
+                vector_rank=row[3],
+                keyword_rank=row[4],
+            )
+            for row in rows
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Decay-ranked statement
+# ---------------------------------------------------------------------------
+
+
+class _Vector(sa.types.UserDefinedType[str]):
+    """pgvector column type, only used to CAST the bound query embedding."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: object) -> str:
+        return "vector"
+
+
+_MEMORY_ITEMS = sa.table(
+    "memory_items",
+    sa.column("id", sa.Uuid()),
+    sa.column("org_id", sa.Uuid()),
+    sa.column("user_id", sa.Uuid()),
+    sa.column("content", sa.Text()),
+    sa.column("embedding", _Vector()),
+    sa.column("confidence", sa.Float()),
+    sa.column("valid_at", sa.DateTime(timezone=True)),
+    sa.column("last_validated_at", sa.DateTime(timezone=True)),
+    sa.column("invalid_at", sa.DateTime(timezone=True)),
+)
+
+
+def _decay_ranked_statement(
+    embedding: list[float],
+    query: str,
+    org_id: UUID,
+    user_id: UUID,
+    *,
+    ranking: DecayRanking,
+    now: datetime,
+    top_k: int,
+) -> sa.Select[Any]:
+    """Build the single-statement decay-ranked hybrid search."""
+    m = _MEMORY_ITEMS
+    effective = effective_confidence_expr(
+        m.c.confidence,
+        m.c.valid_at,
+        m.c.last_validated_at,
+        now=now,
+        half_life_days=ranking.half_life_days,
+    )
+    scope = [m.c.org_id == org_id, m.c.user_id == user_id, m.c.invalid_at.is_(None)]
+    if ranking.stale_threshold is not None:
+        scope.append(effective >= sa.bindparam("stale_threshold", ranking.stale_threshold))
+    candidate_k: sa.BindParameter[int] = sa.bindparam(
+        "candidate_k", max(ranking.candidate_k, top_k)
+    )
+
+    embedding_literal = f"[{', '.join(str(v) for v in embedding)}]"
+    distance = m.c.embedding.op("<=>")(
+        sa.cast(sa.bindparam("query_embedding", embedding_literal), _Vector())
+    )
+    vec = (
+        sa.select(m.c.id, sa.func.row_number().over(order_by=distance).label("rnk"))
+        .where(*scope, m.c.embedding.is_not(None))
+        .order_by(distance)
+        .limit(candidate_k)
+        .cte("vec")
+    )
+    kw = (
+        sa.select(m.c.id, sa.func.row_number().over(order_by=m.c.confidence.desc()).label("rnk"))
+        .where(*scope, m.c.content.ilike(sa.bindparam("pattern", f"%{query}%")))
+        .order_by(m.c.confidence.desc())
+        .limit(candidate_k)
+        .cte("kw")
+    )
+
+    rrf_k: sa.BindParameter[int] = sa.bindparam("rrf_k", ranking.rrf_k)
+    fused = (
+        sa.select(
+            sa.func.coalesce(vec.c.id, kw.c.id).label("id"),
+            vec.c.rnk.label("vector_rank"),
+            kw.c.rnk.label("keyword_rank"),
+            (
+                sa.func.coalesce(1.0 / (rrf_k + vec.c.rnk), 0.0)
+                + sa.func.coalesce(1.0 / (rrf_k + kw.c.rnk), 0.0)
+            ).label("rrf_score"),
+        )
+        .select_from(vec.outerjoin(kw, vec.c.id == kw.c.id, full=True))
+        .cte("fused")
+    )
+
+    return (
+        sa.select(
+            fused.c.id,
+            fused.c.rrf_score,
+            effective.label("effective_confidence"),
+            fused.c.vector_rank,
+            fused.c.keyword_rank,
+        )
+        .select_from(fused.join(m, m.c.id == fused.c.id))
+        .order_by((fused.c.rrf_score * effective).desc())
+        .limit(sa.bindparam("top_k", top_k))
+    )
@@ -0,0 +1,313 @@
+"""Per-user hot-memory working set.
+
+Task card: MC2-4 (retrieval latency)
+- Caches recent read_personal_memories results per user in an
+  in-process LRU (bounded users, bounded queries per user, TTL)
+- Optional shared tier through StoragePort (Redis): a local miss checks
+  the shared copy before going to PostgreSQL, so a user's working set
+  survives hopping between workers
+- Results are keyed by (org, query, top_k) in both tiers: a user who
+  belongs to several orgs never sees one org's memories under another
+- Change-driven invalidation: write_observation, update_item,
+  supersede_item and purge drop the user's entries locally and rotate
+  the user's generation token in the shared tier, orphaning every result
+  cached under the old token (they expire by TTL)
+- Readers take generation() before querying PostgreSQL and hand it to
+  put(); a result read before an invalidation is not cached after it
+- WorkingSetStats reports hit ratio and PG round trips avoided
+
+A write on another worker is seen here once the local entry expires
+(local_ttl_seconds); the shared tier is never stale past an invalidation.
+
+Architecture: Section 2.1 (PostgreSQL as Memory Core primary storage)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from src.shared.types import MemoryItem
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY_PREFIX = "memory:ws"
+_NO_ORG = "-"
+
+
+@dataclass
+class WorkingSetStats:
+    """Counters for working-set effectiveness."""
+
+    lookups: int = 0
+    hits: int = 0  # served from the in-process LRU
+    shared_hits: int = 0  # served from the shared tier
+    invalidations: int = 0
+
+    @property
+    def misses(self) -> int:
+        return self.lookups - self.hits - self.shared_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served without PostgreSQL (0.0 - 1.0)."""
+        if self.lookups == 0:
+            return 0.0
+        return (self.hits + self.shared_hits) / self.lookups
+
+    @property
+    def round_trips_avoided(self) -> int:
+        """PG retrieval round trips saved (one per turn served from cache)."""
+        return self.hits + self.shared_hits
+
+
+@dataclass(frozen=True)
+class WorkingSetGeneration:
+    """A user's cache generation, taken before a PostgreSQL read."""
+
+    local: int
+    shared: str | None = None
+
+
+@dataclass
+class _UserEntry:
+    orgs: set[UUID | None] = field(default_factory=set)
+    results: OrderedDict[str, tuple[list[MemoryItem], float]] = field(default_factory=OrderedDict)
+
+
+class MemoryWorkingSet:
+    """LRU of per-user retrieval results, optionally backed by StoragePort.
+
+    Args:
+        shared: Optional cross-worker tier (RedisStorageAdapter).
+        max_users: Users kept in process before LRU eviction.
+        max_queries_per_user: Distinct (query, top_k) results kept per user.
+        local_ttl_seconds: Lifetime of an in-process result.
+        shared_ttl_seconds: Lifetime of a result in the shared tier.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        shared: StoragePort | None = None,
+        max_users: int = 10_000,
+        max_queries_per_user: int = 16,
+        local_ttl_seconds: float = 30.0,
+        shared_ttl_seconds: int = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_users <= 0 or max_queries_per_user <= 0:
+            msg = (
+                "max_users and max_queries_per_user must be positive, got "
+                f"{max_users}/{max_queries_per_user}"
+            )
+            raise ValueError(msg)
+        self._shared = shared
+        self._max_users = max_users
+        self._max_queries = max_queries_per_user
+        self._local_ttl = local_ttl_seconds
+        self._shared_ttl = shared_ttl_seconds
+        self._clock = clock
+        self._users: OrderedDict[UUID, _UserEntry] = OrderedDict()
+        # Local generation per invalidated user; users forgotten by the LRU
+        # fall back to the newest generation ever evicted, so an old
+        # snapshot still fails the check
+        self._generations: OrderedDict[UUID, int] = OrderedDict()
+        self._generation_floor = 0
+        self._next_generation = 0
+        self._stats = WorkingSetStats()
+
+    @property
+    def stats(self) -> WorkingSetStats:
+        return self._stats
+
+    async def get(
+        self,
+        user_id: UUID,
+        query: str,
+        top_k: int,
+        *,
+        org_id: UUID | None = None,
+    ) -> list[MemoryItem] | None:
+        """Cached retrieval result, or None on a miss."""
+        self._stats.lookups += 1
+        key = _result_key(query, top_k, org_id)
+        entry = self._users.get(user_id)
+        if entry is not None:
+            cached = entry.results.get(key)
+            if cached is not None and cached[1] > self._clock():
+                self._users.move_to_end(user_id)
+                entry.results.move_to_end(key)
+                self._stats.hits += 1
+                return list(cached[0])
+
+        if self._shared is not None:
+            token = await self._shared.get(_generation_key(user_id))
+            if token is not None:
+                payload = await self._shared.get(_shared_key(org_id, user_id, token, key))
+                if payload is not None:
+                    items = [_item_from_dict(d) for d in payload]
+                    self._store_local(user_id, org_id, key, items)
+                    self._stats.shared_hits += 1
+                    return list(items)
+        return None
+
+    async def generation(self, user_id: UUID) -> WorkingSetGeneration:
+        """Snapshot the user's generation; take it before reading PostgreSQL."""
+        local = self._generations.get(user_id, self._generation_floor)
+        if self._shared is None:
+            return WorkingSetGeneration(local=local)
+        return WorkingSetGeneration(local=local, shared=await _shared_token(self._shared, user_id))
+
+    async def put(
+        self,
+        user_id: UUID,
+        query: str,
+        top_k: int,
+        items: list[MemoryItem],
+        *,
+        org_id: UUID | None = None,
+        generation: WorkingSetGeneration | None = None,
+    ) -> None:
+        """Cache a retrieval result computed from PostgreSQL.
+
+        With a generation snapshot, the result is dropped when the user was
+        invalidated since the snapshot (the read may predate the write).
+        """
+        key = _result_key(query, top_k, org_id)
+        token = None
+        if self._shared is not None:
+            token = await _shared_token(self._shared, user_id)
+            if generation is not None and generation.shared not in (None, token):
+                return
+        # Checked after the await: an invalidation may have run meanwhile
+        if generation is not None and generation.local != self._generations.get(
+            user_id, self._generation_floor
+        ):
+            return
+        self._store_local(user_id, org_id, key, items)
+        if self._shared is not None and token is not None:
+            await self._shared.put(
+                _shared_key(org_id, user_id, token, key),
+                [_item_to_dict(i) for i in items],
+                ttl=self._shared_ttl,
+            )
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop a user's working set here and in the shared tier."""
+        self._stats.invalidations += 1
+        self._drop_local(user_id)
+        self._bump_generation(user_id)
+        if self._shared is not None:
+            await self._shared.put(_generation_key(user_id), uuid4().hex)
+
+    async def invalidate_org(self, org_id: UUID) -> None:
+        """Drop every working set of an org (org-wide purge).
+
+        Local entries whose org is unknown are dropped too.
+        """
+        self._stats.invalidations += 1
+        for user_id in [u for u, e in self._users.items() if e.orgs & {org_id, None}]:
+            self._drop_local(user_id)
+            self._bump_generation(user_id)
+        if self._shared is not None:
+            for key in await self._shared.list_keys(f"{SHARED_KEY_PREFIX}:{org_id}:*"):
+                await self._shared.delete(key)
+
+    def clear(self) -> None:
+        """Drop all process-local entries."""
+        self._users.clear()
+
+    def _store_local(
+        self, user_id: UUID, org_id: UUID | None, key: str, items: list[MemoryItem]
+    ) -> None:
+        entry = self._users.get(user_id)
+        if entry is None:
+            entry = _UserEntry()
+            self._users[user_id] = entry
+        entry.orgs.add(org_id)
+        self._users.move_to_end(user_id)
+        entry.results[key] = (list(items), self._clock() + self._local_ttl)
+        entry.results.move_to_end(key)
+        while len(entry.results) > self._max_queries:
+            entry.results.popitem(last=False)
+        while len(self._users) > self._max_users:
+            self._users.popitem(last=False)
+
+    def _bump_generation(self, user_id: UUID) -> None:
+        self._next_generation += 1
+        self._generations[user_id] = self._next_generation
+        self._generations.move_to_end(user_id)
+        while len(self._generations) > self._max_users:
+            _, evicted = self._generations.popitem(last=False)
+            self._generation_floor = max(self._generation_floor, evicted)
+
+    def _drop_local(self, user_id: UUID) -> None:
+        self._users.pop(user_id, None)
+
+
+def _result_key(query: str, top_k: int, org_id: UUID | None) -> str:
+    raw = f"{org_id or _NO_ORG}\x00{top_k}\x00{query}".encode()
+    return hashlib.blake2b(raw, digest_size=12).hexdigest()
+
+
+def _generation_key(user_id: UUID) -> str:
+    return f"{SHARED_KEY_PREFIX}:gen:{user_id}"
+
+
+async def _shared_token(shared: StoragePort, user_id: UUID) -> str:
+    token = await shared.get(_generation_key(user_id))
+    if token is None:
+        token = uuid4().hex
+        await shared.put(_generation_key(user_id), token)
+    return str(token)
+
+
+def _shared_key(org_id: UUID | None, user_id: UUID, token: str, key: str) -> str:
+    return f"{SHARED_KEY_PREFIX}:{org_id or _NO_ORG}:{user_id}:{token}:{key}"
+
+
+def _item_to_dict(item: MemoryItem) -> dict[str, Any]:
+    return {
+        "memory_id": str(item.memory_id),
+        "user_id": str(item.user_id),
+        "memory_type": item.memory_type,
+        "content": item.content,
+        "valid_at": item.valid_at.isoformat(),
+        "invalid_at": item.invalid_at.isoformat() if item.invalid_at else None,
+        "confidence": item.confidence,
+        "source_sessions": [str(s) for s in item.source_sessions],
+        "superseded_by": str(item.superseded_by) if item.superseded_by else None,
+        "version": item.version,
+        "provenance": item.provenance,
+        "epistemic_type": item.epistemic_type,
+    }
+
+
+def _item_from_dict(data: dict[str, Any]) -> MemoryItem:
+    return MemoryItem(
+        memory_id=UUID(data["memory_id"]),
+        user_id=UUID(data["user_id"]),
+        memory_type=data["memory_type"],
+        content=data["content"],
+        valid_at=datetime.fromisoformat(data["valid_at"]),
+        invalid_at=datetime.fromisoformat(data["invalid_at"]) if data["invalid_at"] else None,
+        confidence=data["confidence"],
+        source_sessions=[UUID(s) for s in data["source_sessions"]],
+        superseded_by=UUID(data["superseded_by"]) if data["superseded_by"] else None,
+        version=data["version"],
+        provenance=data["provenance"],
+        epistemic_type=data["epistemic_type"],
+    )
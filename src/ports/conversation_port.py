@@ -60,7 +60,7 @@ class WebSocketSender(Protocol):
 class WSMessage:
     """A WebSocket message from client."""
 
-    type: str  # "message" | "ping" | "close"
+    type: str  # "message" | "ping" | "close" | "open" | "resume" | "typing" | "draft"
     session_id: UUID
     user_id: UUID
     org_id: UUID
@@ -72,7 +72,7 @@ class WSMessage:
 class WSResponse:
     """A WebSocket response to client."""
 
-    type: str  # "message" | "pong" | "error" | "stream_start" | "stream_end"
+    type: str  # "message" | "pong" | "error" | "stream_start" | "stream_end" | "prefetch"
     session_id: UUID
     content: str = ""
     turn_id: UUID | None = None
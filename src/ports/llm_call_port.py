@@ -1,7 +1,9 @@
 """LLMCallPort - LLM invocation interface.
 
 Encapsulates all LLM API calls. v3.6 expanded with content_parts
-for multimodal support.
+for multimodal support. Blocks that carry a role are a structured
+prompt (one message per block, `prompt` is then only a text fallback);
+`cache` marks the end of a stable prefix for provider prompt caching.
 Day-1 implementation: Stub returning fixed text.
 Real implementation: LLM Gateway + Model Registry (LiteLLM).
 
@@ -25,6 +27,8 @@ class ContentBlock:
     media_id: str | None = None
     text_fallback: str = ""  # LAW: mandatory for non-text blocks
     mime_type: str | None = None
+    role: str = ""  # "system" | "user" | "assistant"; "" = attachment to the user turn
+    cache: bool = False  # prompt-cache breakpoint: prefix up to here is stable
 
 
 @dataclass(frozen=True)
@@ -32,10 +36,18 @@ class LLMResponse:
     """Response from LLM invocation."""
 
     text: str
-    tokens_used: dict[str, int] = field(default_factory=dict)  # {input, output}
+    tokens_used: dict[str, int] = field(default_factory=dict)  # {input, output, cached_input}
     model_id: str = ""
     finish_reason: str = "stop"  # "stop" | "length" | "error"
 
+    @property
+    def cached_ratio(self) -> float:
+        """Share of input tokens served from the provider's prompt cache."""
+        input_tokens = self.tokens_used.get("input", 0)
+        if input_tokens <= 0:
+            return 0.0
+        return self.tokens_used.get("cached_input", 0) / input_tokens
+
 
 class LLMCallPort(ABC):
     """Port: LLM invocation operations."""
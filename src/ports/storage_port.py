@@ -45,6 +45,30 @@ class StoragePort(ABC):
             Stored value or None if not found.
         """
 
+    async def put_if_absent(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> bool:
+        """Store a value only if the key does not exist (lease acquisition).
+
+        The default is get-then-put and NOT atomic across processes;
+        adapters backed by a shared store must override it atomically.
+
+        Args:
+            key: Storage key.
+            value: Value to store (must be serializable).
+            ttl: Time-to-live in seconds (None = no expiry).
+
+        Returns:
+            True if the value was stored, False if the key already existed.
+        """
+        if await self.get(key) is not None:
+            return False
+        await self.put(key, value, ttl=ttl)
+        return True
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete a value by key.
@@ -0,0 +1,84 @@
+"""Org-id propagation via contextvars.
+
+Task card: T2-5 (org-scoped LLM response cache)
+- Brain / Gateway set the org for the duration of an LLM call
+- Lower layers (tool-layer caches) read it via get_org_id() instead of
+  widening LLMCallPort.call
+- Same mechanism as trace_context: zero dependency, async-safe
+
+Task card: T2-8 (LLM call scheduler)
+- org_scope() optionally carries the org tier (fair-queuing weight)
+- call_priority() marks calls as "interactive" (default) or "batch"
+
+Task card: T3-1 (tool result cache billing)
+- org_scope() optionally carries the acting user; tool usage metering
+  reads it via get_user_id() so one meter serves every user
+
+Architecture: Section 7 (Observability)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator  # noqa: TC003 -- used at runtime by contextmanager
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uuid import UUID  # noqa: TC003 -- ContextVar type parameter is evaluated at runtime
+
+current_org_id: ContextVar[UUID | None] = ContextVar("current_org_id", default=None)
+current_org_tier: ContextVar[str | None] = ContextVar("current_org_tier", default=None)
+current_user_id: ContextVar[UUID | None] = ContextVar("current_user_id", default=None)
+current_priority: ContextVar[str] = ContextVar("current_priority", default="interactive")
+
+PRIORITIES = ("interactive", "batch")
+
+
+def get_org_id() -> UUID | None:
+    """Return the org of the current call (None outside any org scope)."""
+    return current_org_id.get()
+
+
+def get_org_tier() -> str | None:
+    """Return the org tier of the current call (None when not supplied)."""
+    return current_org_tier.get()
+
+
+def get_user_id() -> UUID | None:
+    """Return the acting user of the current call (None when not supplied)."""
+    return current_user_id.get()
+
+
+def get_priority() -> str:
+    """Return the priority class of the current call."""
+    return current_priority.get()
+
+
+@contextmanager
+def org_scope(
+    org_id: UUID | None,
+    tier: str | None = None,
+    *,
+    user_id: UUID | None = None,
+) -> Generator[UUID | None, None, None]:
+    """Scoped org (and acting user) context manager; restores the previous on exit."""
+    token = current_org_id.set(org_id)
+    tier_token = current_org_tier.set(tier)
+    user_token = current_user_id.set(user_id)
+    try:
+        yield org_id
+    finally:
+        current_user_id.reset(user_token)
+        current_org_tier.reset(tier_token)
+        current_org_id.reset(token)
+
+
+@contextmanager
+def call_priority(priority: str) -> Generator[str, None, None]:
+    """Scoped priority class ("interactive" | "batch") for LLM calls."""
+    if priority not in PRIORITIES:
+        msg = f"priority must be one of {PRIORITIES}, got {priority!r}"
+        raise ValueError(msg)
+    token = current_priority.set(priority)
+    try:
+        yield priority
+    finally:
+        current_priority.reset(token)
@@ -0,0 +1,106 @@
+"""Text near-duplicate primitives: character shingles, MinHash, LSH bands.
+
+- MinHash signature (32 permutations) over character shingles of
+  normalized content; permutations are fixed so signatures are stable
+  across processes and can be persisted
+- LSH banding: 8 bands x 4 rows, each band hashed to one INTEGER key
+- Exact shingle Jaccard for verification; content_similarity also
+  requires the same numbers ("12 stores" never matches "15 stores")
+
+Character shingles (not word n-grams) keep this meaningful for CJK text,
+which has no whitespace word boundaries. Used by the memory write path
+(src.memory.dedup) and prompt context compaction (Brain).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+NUM_PERMUTATIONS = 32
+BAND_COUNT = 8
+ROWS_PER_BAND = NUM_PERMUTATIONS // BAND_COUNT
+
+_SHINGLE_SIZE = 4
+_MERSENNE_PRIME = (1 << 61) - 1
+_HASH_MASK = (1 << 31) - 1  # keep values inside a signed INTEGER column
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def _permutation_params() -> list[tuple[int, int]]:
+    """Fixed (a, b) pairs for the universal hash family; stable across processes."""
+    params: list[tuple[int, int]] = []
+    for i in range(NUM_PERMUTATIONS):
+        digest = hashlib.blake2b(f"diyu-minhash-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], "big") % (_MERSENNE_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:], "big") % _MERSENNE_PRIME
+        params.append((a, b))
+    return params
+
+
+_PERMUTATIONS = _permutation_params()
+
+
+def normalize_content(content: str) -> str:
+    """Case-fold, strip punctuation and collapse whitespace."""
+    text = unicodedata.normalize("NFKC", content).casefold()
+    text = _PUNCT_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def shingles(content: str) -> set[str]:
+    """Character shingles of normalized content."""
+    text = normalize_content(content)
+    if not text:
+        return set()
+    if len(text) <= _SHINGLE_SIZE:
+        return {text}
+    return {text[i : i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(content: str) -> list[int]:
+    """Compute the MinHash signature of content (NUM_PERMUTATIONS values)."""
+    base_hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles(content)
+    ]
+    if not base_hashes:
+        return [_HASH_MASK] * NUM_PERMUTATIONS
+
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _HASH_MASK for h in base_hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def content_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of two contents; 0.0 when their numbers differ."""
+    norm_a, norm_b = normalize_content(a), normalize_content(b)
+    if _NUMBER_RE.findall(norm_a) != _NUMBER_RE.findall(norm_b):
+        return 0.0
+    return jaccard(shingles(norm_a), shingles(norm_b))
+
+
+def band_keys(signature: list[int]) -> list[int]:
+    """Hash each LSH band of a signature into one INTEGER key.
+
+    The band index is mixed into the hash so equal rows in different bands
+    never collide.
+    """
+    keys: list[int] = []
+    for band in range(BAND_COUNT):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        payload = f"{band}:" + ",".join(str(v) for v in rows)
+        digest = hashlib.blake2b(payload.encode(), digest_size=4).digest()
+        keys.append(int.from_bytes(digest, "big") & _HASH_MASK)
+    return keys
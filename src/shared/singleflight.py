@@ -0,0 +1,253 @@
+"""Singleflight: coalesce identical in-flight calls.
+
+Task card: T2-6 (request coalescing under bursts)
+- Concurrent do(key, fn) calls with the same key share one execution of
+  fn; later calls (after it finishes) run fn again -- this is not a cache
+- Cancellation safe: the execution runs in its own task; a cancelled
+  caller only stops waiting, and the execution is cancelled only when no
+  caller waits for it any more
+- Cross-worker mode (optional): with a LeaseStore (StoragePort / Redis)
+  and an encode/decode pair, the first worker takes a lease and publishes
+  the result under the lease token; other workers poll for it and fall
+  back to calling fn themselves if the lease holder fails or times out
+- SingleFlightStats reports executions vs calls (downstream calls saved)
+
+Architecture: Section 4 (Tool Layer Resilience)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LeaseStore(Protocol):
+    """Key-value store with an atomic set-if-absent (StoragePort shape)."""
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def put(self, key: str, value: Any, ttl: int | None = None) -> None: ...
+
+    async def put_if_absent(self, key: str, value: Any, ttl: int | None = None) -> bool: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+@dataclass(frozen=True)
+class LeasePolicy:
+    """Cross-worker lease timing.
+
+    Attributes:
+        lease_seconds: Lease lifetime; frees the key if the holder dies.
+            Must exceed the slowest call.
+        result_seconds: How long a published result stays readable.
+        poll_interval: Follower poll period while the lease is held.
+        wait_seconds: Longest a follower waits before calling through.
+    """
+
+    lease_seconds: int = 30
+    result_seconds: int = 10
+    poll_interval: float = 0.05
+    wait_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.lease_seconds <= 0 or self.result_seconds <= 0:
+            msg = (
+                "lease_seconds and result_seconds must be positive, got "
+                f"{self.lease_seconds}/{self.result_seconds}"
+            )
+            raise ValueError(msg)
+        if self.poll_interval <= 0 or self.wait_seconds < 0:
+            msg = (
+                "poll_interval must be positive and wait_seconds non-negative, got "
+                f"{self.poll_interval}/{self.wait_seconds}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for coalescing effectiveness."""
+
+    calls: int = 0
+    executions: int = 0  # fn actually run in this process
+    local_shared: int = 0  # joined an in-flight call in this process
+    remote_shared: int = 0  # read another worker's published result
+    fallbacks: int = 0  # lease holder failed or timed out; ran fn here
+
+    @property
+    def coalesced(self) -> int:
+        return self.local_shared + self.remote_shared
+
+    @property
+    def coalesced_ratio(self) -> float:
+        """Fraction of calls served by another caller's execution (0.0 - 1.0)."""
+        if self.calls == 0:
+            return 0.0
+        return self.coalesced / self.calls
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task[tuple[Any, bool]]  # (result, fn ran in this process)
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key.
+
+    Args:
+        store: Optional cross-worker lease store (RedisStorageAdapter).
+        policy: Lease timing for the cross-worker mode.
+        namespace: Key prefix in the lease store.
+        sleep: Async sleep (injectable for tests).
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        store: LeaseStore | None = None,
+        policy: LeasePolicy | None = None,
+        namespace: str = "sf",
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._store = store
+        self._policy = policy or LeasePolicy()
+        self._namespace = namespace
+        self._sleep = sleep
+        self._clock = clock
+        self._flights: dict[str, _Flight] = {}
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return self._stats
+
+    def in_flight(self) -> int:
+        """Keys currently executing in this process."""
+        return len(self._flights)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        encode: Callable[[T], Any] | None = None,
+        decode: Callable[[Any], T] | None = None,
+    ) -> T:
+        """Run fn once for all concurrent callers of key; return its result.
+
+        encode / decode (result <-> JSON-serializable payload) enable the
+        cross-worker mode when a store is configured.
+        """
+        result, _ = await self.do_shared(key, fn, encode=encode, decode=decode)
+        return result
+
+    async def do_shared(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        encode: Callable[[T], Any] | None = None,
+        decode: Callable[[Any], T] | None = None,
+    ) -> tuple[T, bool]:
+        """Like do(); also reports whether the result came from another caller."""
+        self._stats.calls += 1
+        flight = self._flights.get(key)
+        leader = flight is None
+        if flight is None:
+            task = asyncio.ensure_future(self._run(key, fn, encode, decode))
+            flight = _Flight(task=task)
+            self._flights[key] = flight
+            task.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self._stats.local_shared += 1
+
+        flight.waiters += 1
+        try:
+            result, executed = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()  # nobody is waiting any more
+        return result, not (leader and executed)
+
+    def _land(self, key: str, task: asyncio.Task[tuple[Any, bool]]) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved: waiters re-raise it themselves
+
+    async def _run(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any] | None,
+        decode: Callable[[Any], T] | None,
+    ) -> tuple[T, bool]:
+        if self._store is None or encode is None or decode is None:
+            return await self._execute(fn), True
+        return await self._run_leased(self._store, key, fn, encode, decode)
+
+    async def _execute(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self._stats.executions += 1
+        return await fn()
+
+    async def _run_leased(
+        self,
+        store: LeaseStore,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+    ) -> tuple[T, bool]:
+        lease_key = f"{self._namespace}:lease:{key}"
+        token = uuid4().hex
+        if await store.put_if_absent(lease_key, token, ttl=self._policy.lease_seconds):
+            try:
+                result = await self._execute(fn)
+                await store.put(
+                    _result_key(self._namespace, key, token),
+                    encode(result),
+                    ttl=self._policy.result_seconds,
+                )
+                return result, True
+            finally:
+                if await store.get(lease_key) == token:
+                    await store.delete(lease_key)
+
+        # Follower: wait for the lease holder's result
+        deadline = self._clock() + self._policy.wait_seconds
+        holder: str | None = None
+        while True:
+            current = await store.get(lease_key)
+            holder = current if current is not None else holder
+            if holder is not None:
+                payload = await store.get(_result_key(self._namespace, key, holder))
+                if payload is not None:
+                    self._stats.remote_shared += 1
+                    return decode(payload), False
+            if current is None or self._clock() >= deadline:
+                break
+            await self._sleep(self._policy.poll_interval)
+        self._stats.fallbacks += 1
+        logger.debug("Singleflight lease for %s released without a result", key)
+        return await self._execute(fn), True
+
+
+def _result_key(namespace: str, key: str, token: str) -> str:
+    return f"{namespace}:result:{key}:{token}"
@@ -0,0 +1,211 @@
+"""Token counting service.
+
+Task card: B4-2 (tokenizer-accurate budgeting)
+- Counts tokens with the model's BPE (tiktoken) when its vocabulary is
+  available locally; never downloads it at runtime
+- Falls back to a character-class estimator (ASCII vs CJK vs other),
+  which can be calibrated against a reference counter
+- Counts are memoized per content hash, so re-counting the same memory,
+  knowledge snippet or history message is a dict lookup
+
+Architecture: Section 2.2 (Context Assembly Pipeline)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import math
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+_TIKTOKEN_BLOB_URL = "https://openaipublic.blob.core.windows.net/encodings/{name}.tiktoken"
+
+
+def _is_cjk(ch: str) -> bool:
+    code = ord(ch)
+    return (
+        0x4E00 <= code <= 0x9FFF  # CJK unified ideographs
+        or 0x3400 <= code <= 0x4DBF  # extension A
+        or 0x3040 <= code <= 0x30FF  # hiragana / katakana
+        or 0xAC00 <= code <= 0xD7AF  # hangul
+        or 0x3000 <= code <= 0x303F  # CJK punctuation
+        or 0xFF00 <= code <= 0xFFEF  # full-width forms
+    )
+
+
+@dataclass(frozen=True)
+class TokenEstimator:
+    """Character-class token estimate.
+
+    Defaults approximate cl100k_base and err high for English: ~4 ASCII
+    characters per token, ~1.25 tokens per CJK character, ~2 characters
+    per token for other non-ASCII text (accented Latin, Cyrillic, emoji).
+    """
+
+    ascii_per_token: float = 4.0
+    cjk_per_token: float = 0.8
+    other_per_token: float = 2.0
+    scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        ratios = (self.ascii_per_token, self.cjk_per_token, self.other_per_token, self.scale)
+        if min(ratios) <= 0:
+            msg = f"Estimator ratios must be positive, got {ratios}"
+            raise ValueError(msg)
+
+    def __call__(self, text: str) -> int:
+        if not text:
+            return 0
+        ascii_chars = cjk = other = 0
+        for ch in text:
+            if ch.isascii():
+                ascii_chars += 1
+            elif _is_cjk(ch):
+                cjk += 1
+            else:
+                other += 1
+        raw = (
+            ascii_chars / self.ascii_per_token
+            + cjk / self.cjk_per_token
+            + other / self.other_per_token
+        )
+        return max(1, math.ceil(raw * self.scale))
+
+    def calibrated(self, samples: Iterable[str], reference: Callable[[str], int]) -> TokenEstimator:
+        """Copy whose scale makes total estimates match ``reference`` on samples."""
+        estimated = actual = 0
+        for text in samples:
+            estimated += self(text)
+            actual += reference(text)
+        if estimated == 0 or actual == 0:
+            return self
+        return TokenEstimator(
+            ascii_per_token=self.ascii_per_token,
+            cjk_per_token=self.cjk_per_token,
+            other_per_token=self.other_per_token,
+            scale=self.scale * actual / estimated,
+        )
+
+
+def _vocabulary_dirs() -> list[Path]:
+    """Where a tiktoken vocabulary may already be on disk.
+
+    The configured tiktoken cache dir, then the copy litellm bundles for
+    offline use.
+    """
+    configured = os.environ.get("TIKTOKEN_CACHE_DIR")
+    dirs = [Path(configured)] if configured else []
+    spec = importlib.util.find_spec("litellm")
+    if spec is not None and spec.origin is not None:
+        dirs.append(Path(spec.origin).parent / "litellm_core_utils" / "tokenizers")
+    return dirs
+
+
+def load_offline_encoding(name: str) -> Any | None:
+    """Load a tiktoken encoding only if its vocabulary is already local.
+
+    Returns None when tiktoken is not installed or the vocabulary would
+    have to be downloaded.
+    """
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    cache_key = hashlib.sha1(_TIKTOKEN_BLOB_URL.format(name=name).encode()).hexdigest()  # noqa: S324 -- tiktoken's cache naming
+    for directory in _vocabulary_dirs():
+        if (directory / cache_key).is_file():
+            # tiktoken resolves its cache dir from the environment at load time
+            configured = os.environ.get("TIKTOKEN_CACHE_DIR")
+            if configured and Path(configured) != directory:
+                continue
+            os.environ["TIKTOKEN_CACHE_DIR"] = str(directory)
+            try:
+                import tiktoken
+
+                return tiktoken.get_encoding(name)
+            except Exception:
+                logger.warning("tiktoken encoding %s failed to load", name, exc_info=True)
+                return None
+    return None
+
+
+@dataclass
+class TokenCountStats:
+    """Memo cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TokenCounter:
+    """Memoized token counter.
+
+    Args:
+        encoding: tiktoken encoding name used when available offline.
+        estimator: Fallback when the encoding is unavailable (or
+            use_tokenizer is False).
+        use_tokenizer: Set False to always use the estimator.
+        cache_size: Distinct texts whose counts are kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        encoding: str = "cl100k_base",
+        estimator: TokenEstimator | None = None,
+        use_tokenizer: bool = True,
+        cache_size: int = 65536,
+    ) -> None:
+        if cache_size <= 0:
+            msg = f"cache_size must be positive, got {cache_size}"
+            raise ValueError(msg)
+        self._estimator = estimator or TokenEstimator()
+        self._encoding = load_offline_encoding(encoding) if use_tokenizer else None
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self.stats = TokenCountStats()
+        if use_tokenizer and self._encoding is None:
+            logger.info("Tokenizer %s not available offline; estimating token counts", encoding)
+
+    @property
+    def backend(self) -> str:
+        """ "tiktoken" or "estimate"."""
+        return "tiktoken" if self._encoding is not None else "estimate"
+
+    def count(self, text: str) -> int:
+        """Token count of ``text`` (memoized by content hash)."""
+        if not text:
+            return 0
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats.hits += 1
+            return cached
+        self.stats.misses += 1
+        tokens = self._count_uncached(text)
+        self._cache[key] = tokens
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def __call__(self, text: str) -> int:
+        return self.count(text)
+
+    def _count_uncached(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return self._estimator(text)
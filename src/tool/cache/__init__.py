@@ -0,0 +1 @@
+"""Tool result caching sub-package (Tool layer)."""
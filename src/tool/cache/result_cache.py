@@ -0,0 +1,499 @@
+"""Tool result cache: reuse web_search / image_analyze / audio_transcribe results.
+
+Task card: T3-1 / T3-2 / T3-3 (tool result cache)
+- Wraps a tool (execute(params) -> ToolResult) and serves repeated calls
+  without a backend round trip
+- Keys: normalized query for search (case, width, whitespace, trailing
+  punctuation); content hash (storage checksum_sha256) for media, so a
+  re-signed presigned URL of the same object still hits
+- Per-tool policy: TTL, plus a short (or zero = no caching) TTL for
+  time-sensitive queries ("latest", "today", ...)
+- Scope: the org comes from src.shared.org_scope; in-process LRU per org,
+  optional shared tier through StoragePort (Redis)
+- Only status == "success" results are stored
+- Billing: every call emits a ToolCallEvent; hits carry cost 0 and
+  billing_unit "cache_hit" (usage_meter() forwards to UsageTracker).
+  The acting user, like the org, comes from org_scope
+- ToolCacheStats reports hit ratio
+
+Architecture: docs/architecture/04-Tool Section 3 (ToolProtocol)
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from src.shared.org_scope import get_org_id, get_user_id
+from src.tool.implementations.audio_transcribe import AudioTranscribeTool
+from src.tool.implementations.audio_transcribe import ToolResult as AudioToolResult
+from src.tool.implementations.image_analyze import ImageAnalyzeTool
+from src.tool.implementations.image_analyze import ToolResult as ImageToolResult
+from src.tool.implementations.web_search import ToolResult as SearchToolResult
+from src.tool.implementations.web_search import WebSearchTool
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from src.ports.storage_port import StoragePort
+    from src.tool.llm.usage_tracker import UsageTracker
+
+    KeyBuilder = Callable[[dict[str, Any]], Awaitable[str | None]]
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY_PREFIX = "tool:rc"
+CACHE_HIT_BILLING_UNIT = "cache_hit"
+_NO_ORG = "-"
+_TRAILING_PUNCTUATION = ".?!,;:。"  # NFKC folds fullwidth forms to ASCII
+
+# Queries whose answer changes within minutes
+TIME_SENSITIVE_TERMS = frozenset(
+    {
+        "today",
+        "now",
+        "latest",
+        "news",
+        "live",
+        "breaking",
+        "current",
+        "price",
+        "weather",
+        "score",
+        "stock",
+        "今天",
+        "最新",
+        "新闻",
+        "实时",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """How long one tool's results are reused, and what a backend call costs.
+
+    Attributes:
+        ttl_seconds: Lifetime of a cached result.
+        volatile_ttl_seconds: Lifetime for queries containing a volatile
+            term; 0 sends them to the backend every time.
+        volatile_terms: Terms marking a query time-sensitive (matched
+            against the normalized "query" parameter).
+        cost_amount: Billed cost of one backend call.
+        billing_unit: Unit recorded with cost_amount.
+        max_entries_per_org: Results kept in process per org (LRU).
+        max_orgs: Orgs kept in process before LRU eviction.
+    """
+
+    ttl_seconds: int = 900
+    volatile_ttl_seconds: int = 0
+    volatile_terms: frozenset[str] = frozenset()
+    cost_amount: float = 0.0
+    billing_unit: str = "call"
+    max_entries_per_org: int = 1024
+    max_orgs: int = 1000
+
+    def __post_init__(self) -> None:
+        if self.ttl_seconds <= 0 or self.volatile_ttl_seconds < 0:
+            msg = (
+                "need ttl_seconds > 0 and volatile_ttl_seconds >= 0, got "
+                f"{self.ttl_seconds}/{self.volatile_ttl_seconds}"
+            )
+            raise ValueError(msg)
+        if min(self.max_entries_per_org, self.max_orgs) <= 0:
+            msg = (
+                "max_entries_per_org and max_orgs must be positive, got "
+                f"{self.max_entries_per_org}/{self.max_orgs}"
+            )
+            raise ValueError(msg)
+
+    def ttl_for(self, params: dict[str, Any]) -> int:
+        """TTL for one call: volatile_ttl_seconds when the query is time-sensitive."""
+        if not self.volatile_terms:
+            return self.ttl_seconds
+        query = normalize_query(str(params.get("query", "")))
+        words = set(query.split())
+        for term in self.volatile_terms:
+            # Latin terms match whole words ("now" not "know"); CJK has no spaces
+            if term in words if term.isascii() else term in query:
+                return self.volatile_ttl_seconds
+        return self.ttl_seconds
+
+
+# Search results drift within the hour; media analysis of identical bytes does not
+DEFAULT_TOOL_POLICIES: dict[str, ToolCachePolicy] = {
+    WebSearchTool.name: ToolCachePolicy(
+        ttl_seconds=900,
+        volatile_ttl_seconds=60,
+        volatile_terms=TIME_SENSITIVE_TERMS,
+        billing_unit="query",
+    ),
+    ImageAnalyzeTool.name: ToolCachePolicy(ttl_seconds=86400, billing_unit="image"),
+    AudioTranscribeTool.name: ToolCachePolicy(ttl_seconds=86400, billing_unit="file"),
+}
+
+
+@dataclass(frozen=True)
+class ToolCallEvent:
+    """One tool call as seen by billing (backend call or cache hit)."""
+
+    org_id: UUID | None
+    tool_name: str
+    tool_version: str
+    status: str
+    cost_amount: float
+    billing_unit: str
+    duration_ms: int
+    cache_hit: bool
+    user_id: UUID | None = None
+
+
+@dataclass
+class ToolCacheStats:
+    """Counters for tool result cache effectiveness."""
+
+    lookups: int = 0  # calls with a cache key
+    bypassed: int = 0  # no key or volatile query with zero TTL
+    local_hits: int = 0
+    shared_hits: int = 0
+    stores: int = 0
+    key_failures: int = 0  # fingerprinting failed: call went to the backend
+    saved_cost: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.shared_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of calls served without the backend (0.0 - 1.0)."""
+        calls = self.lookups + self.bypassed
+        if calls == 0:
+            return 0.0
+        return self.hits / calls
+
+
+@dataclass
+class _Entry:
+    result: Any
+    expires_at: float
+
+
+@dataclass
+class _OrgEntries:
+    entries: OrderedDict[str, _Entry] = field(default_factory=OrderedDict)
+
+
+class ToolResultCache:
+    """Caching wrapper around one tool.
+
+    Exposes the wrapped tool's name, version, description and schemas,
+    so it can be registered in place of the tool.
+
+    Args:
+        tool: The tool to wrap (execute(params) -> ToolResult).
+        key: Async key builder; returns None when a call must not be cached.
+        result_type: The tool's ToolResult class (rebuilds shared-tier hits).
+        policy: TTL, freshness, cost and bounds.
+        shared: Optional cross-worker tier (RedisStorageAdapter).
+        meter: Receives a ToolCallEvent per call (hit or backend call).
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        tool: Any,
+        *,
+        key: KeyBuilder,
+        result_type: Callable[..., Any],
+        policy: ToolCachePolicy | None = None,
+        shared: StoragePort | None = None,
+        meter: Callable[[ToolCallEvent], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._tool = tool
+        self._key = key
+        self._result_type = result_type
+        self._policy = policy or ToolCachePolicy()
+        self._shared = shared
+        self._meter = meter
+        self._clock = clock
+        self._orgs: OrderedDict[str, _OrgEntries] = OrderedDict()
+        self._stats = ToolCacheStats()
+        self.name: str = tool.name
+        self.version: str = tool.version
+        self.description: str = getattr(tool, "description", "")
+        self.INPUT_SCHEMA: dict[str, Any] = getattr(tool, "INPUT_SCHEMA", {})
+        self.OUTPUT_SCHEMA: dict[str, Any] = getattr(tool, "OUTPUT_SCHEMA", {})
+
+    @property
+    def stats(self) -> ToolCacheStats:
+        return self._stats
+
+    async def execute(self, params: dict[str, Any]) -> Any:
+        """Serve from cache when possible, otherwise execute and store."""
+        started = self._clock()
+        org_id = get_org_id()
+        org = str(org_id or _NO_ORG)
+        ttl = self._policy.ttl_for(params)
+        key = None
+        if ttl > 0:
+            try:
+                key = await self._key(params)
+            except Exception:
+                self._stats.key_failures += 1
+                logger.warning("Cache key for %s failed, calling backend", self.name, exc_info=True)
+
+        if key is None:
+            self._stats.bypassed += 1
+            return await self._call(params, org_id, started)
+
+        self._stats.lookups += 1
+        cached = self._local_get(org, key)
+        if cached is not None:
+            self._stats.local_hits += 1
+            return self._served(cached, org_id, started)
+
+        shared_key = f"{SHARED_KEY_PREFIX}:{org}:{self.name}:{self.version}:{key}"
+        if self._shared is not None:
+            payload = await self._shared.get(shared_key)
+            if payload is not None:
+                result = self._result_type(**payload)
+                self._store_local(org, key, result, ttl)
+                self._stats.shared_hits += 1
+                return self._served(result, org_id, started)
+
+        result = await self._call(params, org_id, started)
+        if result.status == "success":
+            self._stats.stores += 1
+            self._store_local(org, key, result, ttl)
+            if self._shared is not None:
+                await self._shared.put(shared_key, _result_to_dict(result), ttl=ttl)
+        return result
+
+    def invalidate_org(self, org_id: UUID | None) -> None:
+        """Drop one org's process-local results (shared entries expire by TTL)."""
+        self._orgs.pop(str(org_id or _NO_ORG), None)
+
+    def clear(self) -> None:
+        """Drop all process-local entries."""
+        self._orgs.clear()
+
+    async def _call(self, params: dict[str, Any], org_id: UUID | None, started: float) -> Any:
+        result = await self._tool.execute(params)
+        self._emit(
+            org_id,
+            status=result.status,
+            cost_amount=self._policy.cost_amount,
+            billing_unit=self._policy.billing_unit,
+            started=started,
+            cache_hit=False,
+        )
+        return result
+
+    def _served(self, result: Any, org_id: UUID | None, started: float) -> Any:
+        self._stats.saved_cost += self._policy.cost_amount
+        self._emit(
+            org_id,
+            status="success",
+            cost_amount=0.0,
+            billing_unit=CACHE_HIT_BILLING_UNIT,
+            started=started,
+            cache_hit=True,
+        )
+        return replace(
+            result,
+            data=copy.deepcopy(result.data),
+            metadata={**result.metadata, "cache_hit": True},
+        )
+
+    def _emit(
+        self,
+        org_id: UUID | None,
+        *,
+        status: str,
+        cost_amount: float,
+        billing_unit: str,
+        started: float,
+        cache_hit: bool,
+    ) -> None:
+        if self._meter is None:
+            return
+        event = ToolCallEvent(
+            org_id=org_id,
+            tool_name=self.name,
+            tool_version=self.version,
+            status=status,
+            cost_amount=cost_amount,
+            billing_unit=billing_unit,
+            duration_ms=int((self._clock() - started) * 1000),
+            cache_hit=cache_hit,
+            user_id=get_user_id(),
+        )
+        try:
+            self._meter(event)
+        except Exception:
+            logger.exception("Tool usage metering failed: %s", event)
+
+    def _org(self, org: str) -> _OrgEntries:
+        entries = self._orgs.get(org)
+        if entries is None:
+            entries = _OrgEntries()
+            self._orgs[org] = entries
+            while len(self._orgs) > self._policy.max_orgs:
+                self._orgs.popitem(last=False)
+        self._orgs.move_to_end(org)
+        return entries
+
+    def _local_get(self, org: str, key: str) -> Any | None:
+        entries = self._org(org).entries
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return entry.result
+
+    def _store_local(self, org: str, key: str, result: Any, ttl: int) -> None:
+        entries = self._org(org).entries
+        entries[key] = _Entry(result=result, expires_at=self._clock() + ttl)
+        entries.move_to_end(key)
+        while len(entries) > self._policy.max_entries_per_org:
+            entries.popitem(last=False)
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a search query: NFKC, casefolded, single-spaced."""
+    text = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+    return text.rstrip(_TRAILING_PUNCTUATION).strip()
+
+
+async def search_key(params: dict[str, Any]) -> str | None:
+    """Cache key for web_search: normalized query plus result-shaping options."""
+    query = normalize_query(str(params.get("query", "")))
+    if not query:
+        return None
+    return _digest([query, params.get("top_k", 10), params.get("safe_search", True)])
+
+
+class MediaKey:
+    """Cache key for media tools: content hash of the referenced object.
+
+    The object's checksum_sha256 comes from storage_backend.head_object,
+    so the same bytes behind differently signed URLs share one entry.
+    Without a storage backend (or checksum) the key falls back to the URL
+    itself, which still catches literal repeats.
+
+    Args:
+        url_param: Parameter holding the media URL.
+        option_params: Parameters (with defaults) that change the result.
+        storage_backend: Object metadata source (head_object(url)).
+    """
+
+    def __init__(
+        self,
+        url_param: str,
+        option_params: dict[str, Any],
+        storage_backend: Any | None = None,
+    ) -> None:
+        self._url_param = url_param
+        self._options = option_params
+        self._storage = storage_backend
+
+    async def __call__(self, params: dict[str, Any]) -> str | None:
+        url = str(params.get(self._url_param, ""))
+        if not url:
+            return None
+        content = f"url:{url}"
+        if self._storage is not None:
+            metadata = await self._storage.head_object(url)
+            checksum = getattr(metadata, "checksum_sha256", "")
+            if checksum:
+                content = f"sha256:{checksum}"
+        options = [params.get(name, default) for name, default in sorted(self._options.items())]
+        return _digest([content, options])
+
+
+def cache_tool(
+    tool: Any,
+    *,
+    storage_backend: Any | None = None,
+    shared: StoragePort | None = None,
+    meter: Callable[[ToolCallEvent], None] | None = None,
+    policies: dict[str, ToolCachePolicy] | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> ToolResultCache:
+    """Wrap one of the built-in tools with its default key builder and policy."""
+    policy = {**DEFAULT_TOOL_POLICIES, **(policies or {})}.get(tool.name)
+    key: KeyBuilder
+    result_type: Callable[..., Any]
+    if tool.name == WebSearchTool.name:
+        key, result_type = search_key, SearchToolResult
+    elif tool.name == ImageAnalyzeTool.name:
+        options = {"analysis_type": "general", "detail_level": "medium"}
+        key, result_type = MediaKey("image_url", options, storage_backend), ImageToolResult
+    elif tool.name == AudioTranscribeTool.name:
+        options = {"language": "auto", "format": "json"}
+        key, result_type = MediaKey("audio_url", options, storage_backend), AudioToolResult
+    else:
+        msg = f"No default cache key for tool {tool.name!r}; construct ToolResultCache directly"
+        raise ValueError(msg)
+    return ToolResultCache(
+        tool,
+        key=key,
+        result_type=result_type,
+        policy=policy,
+        shared=shared,
+        meter=meter,
+        clock=clock,
+    )
+
+
+def usage_meter(tracker: UsageTracker) -> Callable[[ToolCallEvent], None]:
+    """Meter that records tool calls on the acting user's behalf.
+
+    The user is the event's, taken from org_scope(..., user_id=) when the
+    call ran. Calls without an org or user are not recorded
+    (tool_usage_records rows belong to both).
+    """
+
+    def record(event: ToolCallEvent) -> None:
+        if event.org_id is None or event.user_id is None:
+            logger.debug("Tool call not metered (no org/user scope): %s", event)
+            return
+        tracker.record_tool_usage(
+            org_id=event.org_id,
+            user_id=event.user_id,
+            tool_name=event.tool_name,
+            tool_version=event.tool_version,
+            cost_amount=event.cost_amount,
+            billing_unit=event.billing_unit,
+            status=event.status,
+            duration_ms=event.duration_ms,
+        )
+
+    return record
+
+
+def _result_to_dict(result: Any) -> dict[str, Any]:
+    return {
+        "status": result.status,
+        "data": result.data,
+        "error": result.error,
+        "metadata": dict(result.metadata),
+    }
+
+
+def _digest(parts: list[Any]) -> str:
+    raw = json.dumps(parts, ensure_ascii=False, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
@@ -0,0 +1 @@
+"""Pooled HTTP transport sub-package (Tool layer)."""
@@ -0,0 +1,380 @@
+"""Shared, pooled HTTP clients for LLM and tool backends.
+
+Task card: T3-4 (pooled HTTP transport)
+- HttpClientPool: one long-lived httpx.AsyncClient per backend name,
+  created on first use and closed in the app lifespan, so TCP/TLS setup
+  is paid once per connection instead of once per call
+- Keep-alive pool limits from HttpPoolPolicy; HTTP/2 (one multiplexed
+  connection per host) when the h2 package is installed
+- DNS cache shared by every client of the pool: a hostname resolves once
+  per dns_ttl_seconds, not on every new connection. TLS still verifies
+  (and sends SNI for) the hostname, only the TCP connect uses the address
+- httpx takes no network backend, so each client's transport is a thin
+  httpx.AsyncBaseTransport over an httpcore.AsyncConnectionPool built with
+  the caching backend (public APIs of httpx 0.28 / httpcore 1.x)
+- httpx ignores env proxies once a transport is passed, so HTTP(S)_PROXY /
+  ALL_PROXY / NO_PROXY are mounted explicitly (trust_env); proxied hosts
+  resolve through the proxy, not the DNS cache
+- HttpPoolStats per client: requests, new connections, TLS handshakes
+  (httpcore trace events) -> connection reuse ratio; DNS lookups vs hits
+
+Architecture: Section 4 (Tool Layer Resilience)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import ipaddress
+import logging
+import socket
+import time
+import urllib.request
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpcore
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HttpPoolPolicy:
+    """Connection pool, keep-alive and DNS cache settings.
+
+    Attributes:
+        max_connections: Open connections per client.
+        max_keepalive_connections: Idle connections kept per client.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Negotiate HTTP/2 when the h2 package is installed.
+        connect_timeout: Seconds to establish a connection.
+        timeout: Default seconds for read / write / pool waits.
+        dns_ttl_seconds: Lifetime of a cached DNS answer; 0 disables the cache.
+        trust_env: Route requests through the environment's HTTP(S)_PROXY /
+            ALL_PROXY, honouring NO_PROXY.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+    connect_timeout: float = 5.0
+    timeout: float = 60.0
+    dns_ttl_seconds: float = 300.0
+    trust_env: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_connections <= 0 or self.max_keepalive_connections < 0:
+            msg = (
+                "max_connections must be positive and max_keepalive_connections "
+                f"non-negative, got {self.max_connections}/{self.max_keepalive_connections}"
+            )
+            raise ValueError(msg)
+        if self.dns_ttl_seconds < 0:
+            msg = f"dns_ttl_seconds must be non-negative, got {self.dns_ttl_seconds}"
+            raise ValueError(msg)
+
+
+@dataclass
+class HttpPoolStats:
+    """Connection reuse counters (one client, or the pool total)."""
+
+    requests: int = 0
+    connections: int = 0  # TCP connections opened
+    tls_handshakes: int = 0
+    dns_lookups: int = 0  # pool-wide: resolver calls
+    dns_hits: int = 0  # pool-wide: answers served from the cache
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests sent over an already-open connection (0.0 - 1.0)."""
+        if self.requests == 0:
+            return 0.0
+        return max(self.requests - self.connections, 0) / self.requests
+
+
+class _CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that resolves hostnames through a TTL cache."""
+
+    def __init__(
+        self,
+        inner: httpcore.AsyncNetworkBackend,
+        *,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if self._ttl <= 0 or _is_ip(host):
+            return await self._inner.connect_tcp(host, port, timeout, local_address, socket_options)
+
+        addresses = await self._resolve(host, port)
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_error = exc
+        # Every cached address failed: forget them so the next connect re-resolves
+        self._cache.pop((host, port), None)
+        assert last_error is not None
+        raise last_error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        now = self._clock()
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[1]
+        self.lookups += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._cache[(host, port)] = (now + self._ttl, addresses)
+        return addresses
+
+
+# Most specific first: the first isinstance match wins
+_HTTPCORE_ERRORS: tuple[tuple[type[Exception], type[httpx.HTTPError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _httpx_errors() -> Iterator[None]:
+    """Re-raise httpcore errors as their httpx counterparts."""
+    try:
+        yield
+    except Exception as exc:
+        for source, target in _HTTPCORE_ERRORS:
+            if isinstance(exc, source):
+                raise target(str(exc)) from exc
+        raise
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: AsyncIterable[bytes]) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _httpx_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class _PoolTransport(httpx.AsyncBaseTransport):
+    """httpx transport over an httpcore connection pool."""
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.AsyncByteStream)
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(core_request)
+        assert isinstance(response.stream, AsyncIterable)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class HttpClientPool:
+    """Registry of shared, pooled httpx.AsyncClient instances.
+
+    Args:
+        policy: Pool limits, keep-alive, HTTP/2 and DNS cache settings.
+    """
+
+    def __init__(self, policy: HttpPoolPolicy | None = None) -> None:
+        self._policy = policy or HttpPoolPolicy()
+        self._http2 = self._policy.http2 and importlib.util.find_spec("h2") is not None
+        self._dns: _CachingDNSBackend | None = None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._stats: dict[str, HttpPoolStats] = {}
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    def client(
+        self,
+        name: str,
+        *,
+        base_url: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> httpx.AsyncClient:
+        """The shared client for one backend (created on first use)."""
+        existing = self._clients.get(name)
+        if existing is not None and not existing.is_closed:
+            return existing
+
+        policy = self._policy
+        if self._dns is None:
+            self._dns = _CachingDNSBackend(
+                httpcore.AnyIOBackend(), ttl_seconds=policy.dns_ttl_seconds
+            )
+        transport = _PoolTransport(
+            httpcore.AsyncConnectionPool(
+                ssl_context=httpx.create_ssl_context(),
+                max_connections=policy.max_connections,
+                max_keepalive_connections=policy.max_keepalive_connections,
+                keepalive_expiry=policy.keepalive_expiry,
+                http1=True,
+                http2=self._http2,
+                network_backend=self._dns,
+            )
+        )
+
+        stats = self._stats.setdefault(name, HttpPoolStats())
+
+        async def _trace(event: str, info: dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                stats.connections += 1
+            elif event == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+
+        async def _on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = _trace
+
+        limits = httpx.Limits(
+            max_connections=policy.max_connections,
+            max_keepalive_connections=policy.max_keepalive_connections,
+            keepalive_expiry=policy.keepalive_expiry,
+        )
+        mounts: dict[str, httpx.AsyncBaseTransport | None] = {
+            pattern: None
+            if proxy is None
+            else httpx.AsyncHTTPTransport(proxy=proxy, http2=self._http2, limits=limits)
+            for pattern, proxy in (_env_proxies() if policy.trust_env else {}).items()
+        }
+
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            transport=transport,
+            mounts=mounts,
+            timeout=httpx.Timeout(policy.timeout, connect=policy.connect_timeout),
+            event_hooks={"request": [_on_request]},
+        )
+        self._clients[name] = client
+        return client
+
+    def stats(self, name: str | None = None) -> HttpPoolStats:
+        """Counters for one client, or summed over the pool."""
+        if name is not None:
+            return self._stats.get(name, HttpPoolStats())
+        total = HttpPoolStats(
+            requests=sum(s.requests for s in self._stats.values()),
+            connections=sum(s.connections for s in self._stats.values()),
+            tls_handshakes=sum(s.tls_handshakes for s in self._stats.values()),
+        )
+        if self._dns is not None:
+            total.dns_lookups, total.dns_hits = self._dns.lookups, self._dns.hits
+        return total
+
+    async def aclose(self) -> None:
+        """Close every client (app shutdown)."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                logger.debug("HTTP client close failed", exc_info=True)
+
+
+def _env_proxies() -> dict[str, str | None]:
+    """httpx mount patterns for the environment's proxies (None: go direct)."""
+    proxies = urllib.request.getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+    for host in (h.strip() for h in proxies.get("no", "").split(",")):
+        if not host:
+            continue
+        if host == "*":
+            return {}
+        if "://" in host:
+            mounts[host] = None
+        elif _is_ip(host) or host.lower() == "localhost":
+            mounts[f"all://[{host}]" if ":" in host else f"all://{host}"] = None
+        else:
+            mounts[f"all://*{host.removeprefix('*')}"] = None
+    return mounts
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,650 @@
+"""Batch LLM jobs for offline generation workloads.
+
+Task card: T2-9 (batch LLM execution)
+- One job carries many prompts; results stream out as they finish
+  (stream()), come back together (run()), or are polled from storage
+  (status() / results()), also from another worker
+- Items are processed in chunks; each finished chunk is checkpointed
+  through StoragePort. A restarted job skips finished chunks (items must be
+  passed in the same order) and re-polls a provider batch it had already
+  submitted instead of paying for it twice
+- Interactive path: bounded concurrency through the regular LLM caller
+  (BudgetGuard in front of LLMScheduler), under call_priority("batch") so
+  the scheduler keeps serving chat first; an item the org's budget cannot
+  cover fails without retries
+- Provider batch path (optional ProviderBatchAPI, e.g. LiteLLMBatchAPI for
+  OpenAI's /v1/batches): one provider batch per chunk and model, billed at
+  the provider's batch rate and polled until done, for at most the 24h
+  completion window (max_wait_seconds, counted from submission across
+  resumes) or the job's deadline. A batch still running then is cancelled
+  and its items go through the interactive path. With a BudgetGuard, the
+  chunk's estimated tokens are held on the org budget before submission
+  (a chunk the budget cannot cover is not submitted) and settled from the
+  usage the provider reports
+- Per-item retries with exponential backoff; items a provider batch
+  failed (or models it does not serve) go through the interactive path
+- Every answered item, from either path, is recorded on the UsageTracker
+  under the job's org and user
+- BatchJobReport: items/s, tokens, and cost at the rates actually used
+  next to the same tokens at interactive rates (pricing callable, e.g.
+  gateway_adapter.litellm_cost)
+
+Architecture: delivery/phase2-runtime-config.yaml (llm section)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable, Callable, Iterable
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+from src.ports.llm_call_port import LLMResponse
+from src.shared.errors import QuotaExceededError
+from src.shared.org_scope import call_priority, org_scope
+from src.tool.llm.budget_guard import UsageMeter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable
+    from uuid import UUID
+
+    from src.ports.llm_call_port import ContentBlock, LLMCallPort
+    from src.ports.storage_port import StoragePort
+    from src.tool.llm.budget_guard import BudgetGuard
+    from src.tool.llm.usage_tracker import UsageTracker
+
+logger = logging.getLogger(__name__)
+
+BATCH_KEY_PREFIX = "llm:batch"
+BATCH_TTL_SECONDS = 7 * 24 * 3600
+LLM_BATCH_TASK = "llm.batch"
+BATCH_COMPLETION_WINDOW_SECONDS = 24 * 3600
+
+# (model_id, input_tokens, output_tokens, provider_batch) -> USD
+Pricing = Callable[[str, int, int, bool], float]
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One prompt of a batch job; item_id must be unique within the job."""
+
+    item_id: str
+    prompt: str
+    model_id: str = ""
+    content_parts: list[ContentBlock] | None = None
+    parameters: dict[str, Any] | None = None
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one item (error is set when every attempt failed)."""
+
+    item_id: str
+    text: str = ""
+    tokens_used: dict[str, int] = field(default_factory=dict)
+    model_id: str = ""
+    finish_reason: str = "stop"
+    error: str | None = None
+    attempts: int = 0
+    provider_batch: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchJobReport:
+    """Progress and outcome of a batch LLM job."""
+
+    job_id: str
+    items: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    restored: int = 0  # finished before a resume
+    retries: int = 0
+    provider_batch_items: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    interactive_cost_usd: float = 0.0  # same tokens at interactive rates
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    resumed: bool = False
+    completed: bool = False
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput over the items processed by this run."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.items - self.restored) / self.elapsed_seconds
+
+    @property
+    def savings_usd(self) -> float:
+        return self.interactive_cost_usd - self.cost_usd
+
+
+class ProviderBatchAPI(Protocol):
+    """A provider's asynchronous batch endpoint."""
+
+    def supports(self, model_id: str) -> bool:
+        """Whether items for this model can go through the batch endpoint."""
+        ...
+
+    async def submit(self, items: list[BatchItem], model_id: str) -> str:
+        """Submit items for one model; returns the provider batch id."""
+        ...
+
+    async def fetch(self, batch_id: str) -> dict[str, LLMResponse | str] | None:
+        """None while the batch runs; then item_id -> response or error message."""
+        ...
+
+    async def cancel(self, batch_id: str) -> None:
+        """Stop a batch that is no longer waited for."""
+        ...
+
+
+class BatchJobRunner:
+    """Runs batch LLM jobs with checkpoints, retries and bounded concurrency.
+
+    Args:
+        llm: Interactive LLM caller (BudgetGuard, LLMScheduler, ModelRegistry
+            or adapter).
+        checkpoints: StoragePort holding job state and finished chunks.
+        provider_batch: Optional provider batch endpoint.
+        budget_guard: Holds provider batch chunks on the org budget
+            (interactive calls are guarded by llm itself).
+        pricing: Cost function for the report (costs stay 0 without it).
+        usage_tracker: Records the tokens of every answered item; jobs are
+            metered when submitted with an org_id and user_id.
+        chunk_size: Items per chunk / checkpoint / provider batch.
+        concurrency: Interactive calls in flight at once.
+        max_attempts: Interactive attempts per item.
+        backoff_seconds: First retry delay; doubles per attempt.
+        max_backoff_seconds: Retry delay cap.
+        poll_seconds: Delay between provider batch status checks.
+        max_wait_seconds: Longest wait for a provider batch after submission.
+        on_progress: Called with the running report after every chunk.
+        clock: Epoch seconds (submission times are checkpointed).
+    """
+
+    def __init__(
+        self,
+        llm: LLMCallPort | Any,
+        *,
+        checkpoints: StoragePort,
+        provider_batch: ProviderBatchAPI | None = None,
+        budget_guard: BudgetGuard | None = None,
+        pricing: Pricing | None = None,
+        usage_tracker: UsageTracker | None = None,
+        chunk_size: int = 200,
+        concurrency: int = 8,
+        max_attempts: int = 3,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0,
+        poll_seconds: float = 30.0,
+        max_wait_seconds: float = BATCH_COMPLETION_WINDOW_SECONDS,
+        on_progress: Callable[[BatchJobReport], None] | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if min(chunk_size, concurrency, max_attempts) <= 0:
+            msg = (
+                "chunk_size, concurrency and max_attempts must be positive, got "
+                f"{chunk_size}/{concurrency}/{max_attempts}"
+            )
+            raise ValueError(msg)
+        self._llm = llm
+        self._checkpoints = checkpoints
+        self._provider_batch = provider_batch
+        self._budget_guard = budget_guard
+        self._pricing = pricing
+        self._usage_tracker = usage_tracker
+        self._chunk_size = chunk_size
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._poll_seconds = poll_seconds
+        self._max_wait_seconds = max_wait_seconds
+        self._on_progress = on_progress
+        self._sleep = sleep
+        self._clock = clock
+        self._jobs: set[asyncio.Task[BatchJobReport]] = set()
+
+    def submit(
+        self,
+        job_id: str,
+        items: AsyncIterable[BatchItem] | Iterable[BatchItem],
+        *,
+        org_id: UUID | None = None,
+        user_id: UUID | None = None,
+        tier: str | None = None,
+        deadline: float | None = None,
+    ) -> asyncio.Task[BatchJobReport]:
+        """Start a job in the background; poll it with status() / results()."""
+        task = asyncio.create_task(
+            self.run(job_id, items, org_id=org_id, user_id=user_id, tier=tier, deadline=deadline)
+        )
+        self._jobs.add(task)
+        task.add_done_callback(self._jobs.discard)
+        return task
+
+    async def run(
+        self,
+        job_id: str,
+        items: AsyncIterable[BatchItem] | Iterable[BatchItem],
+        *,
+        org_id: UUID | None = None,
+        user_id: UUID | None = None,
+        tier: str | None = None,
+        deadline: float | None = None,
+    ) -> BatchJobReport:
+        """Run a job to completion, resuming after its last finished chunk.
+
+        deadline (epoch seconds) bounds how long provider batches are
+        waited for; past it their items are answered interactively.
+        """
+        report = BatchJobReport(job_id=job_id)
+        async for _ in self._stream(job_id, items, org_id, user_id, tier, deadline, report):
+            pass
+        return report
+
+    async def stream(
+        self,
+        job_id: str,
+        items: AsyncIterable[BatchItem] | Iterable[BatchItem],
+        *,
+        org_id: UUID | None = None,
+        user_id: UUID | None = None,
+        tier: str | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Run a job, yielding each result as it finishes.
+
+        Results restored from an earlier run are not yielded again; use
+        results() for the full set.
+        """
+        report = BatchJobReport(job_id=job_id)
+        async for result in self._stream(job_id, items, org_id, user_id, tier, deadline, report):
+            yield result
+
+    async def status(self, job_id: str) -> BatchJobReport | None:
+        """Latest checkpointed report of a job (None if unknown or expired)."""
+        state: dict[str, Any] | None = await self._checkpoints.get(_state_key(job_id))
+        if state is None:
+            return None
+        return BatchJobReport(**state["report"])
+
+    async def results(self, job_id: str) -> list[BatchItemResult]:
+        """Results of every checkpointed chunk, in submission order."""
+        state: dict[str, Any] | None = await self._checkpoints.get(_state_key(job_id))
+        if state is None:
+            return []
+        results: list[BatchItemResult] = []
+        for index in range(int(state["chunks_done"])):
+            stored = await self._checkpoints.get(_chunk_key(job_id, index)) or []
+            results.extend(BatchItemResult(**r) for r in stored)
+        return results
+
+    async def _stream(
+        self,
+        job_id: str,
+        items: AsyncIterable[BatchItem] | Iterable[BatchItem],
+        org_id: UUID | None,
+        user_id: UUID | None,
+        tier: str | None,
+        deadline: float | None,
+        report: BatchJobReport,
+    ) -> AsyncIterator[BatchItemResult]:
+        state: dict[str, Any] | None = await self._checkpoints.get(_state_key(job_id))
+        done, pending = 0, None
+        if state is not None:
+            for name, value in state["report"].items():
+                setattr(report, name, value)
+            if report.completed:
+                return
+            report.resumed = True
+            report.restored = report.items
+            done, pending = int(state["chunks_done"]), state.get("pending")
+        base_elapsed = report.elapsed_seconds
+
+        started = time.perf_counter()
+        index = 0
+        async for chunk in _chunks(items, self._chunk_size):
+            if index < done:
+                index += 1
+                continue
+            submitted = pending if pending and pending["chunk"] == index else None
+            results: list[BatchItemResult] = []
+            async for result in self._process(
+                job_id, index, chunk, submitted, report, org_id, tier, deadline
+            ):
+                self._account(report, result)
+                self._record_usage(job_id, result, org_id, user_id)
+                results.append(result)
+                yield result
+            await self._checkpoints.put(
+                _chunk_key(job_id, index), [asdict(r) for r in results], ttl=BATCH_TTL_SECONDS
+            )
+            index += 1
+            report.chunks += 1
+            report.elapsed_seconds = base_elapsed + time.perf_counter() - started
+            await self._save(job_id, report, index, None)
+            if self._on_progress is not None:
+                self._on_progress(report)
+
+        report.elapsed_seconds = base_elapsed + time.perf_counter() - started
+        report.completed = True
+        await self._save(job_id, report, index, None)
+        logger.info(
+            "LLM batch %s: %d items (%d failed), %.1f items/s, $%.4f (interactive $%.4f)",
+            job_id,
+            report.items,
+            report.failed,
+            report.items_per_second,
+            report.cost_usd,
+            report.interactive_cost_usd,
+        )
+
+    async def _process(
+        self,
+        job_id: str,
+        index: int,
+        chunk: list[BatchItem],
+        submitted: dict[str, Any] | None,
+        report: BatchJobReport,
+        org_id: UUID | None,
+        tier: str | None,
+        deadline: float | None,
+    ) -> AsyncIterator[BatchItemResult]:
+        remaining: list[BatchItem] = chunk
+        batched: set[str] = set()  # items that already had a provider batch attempt
+        api = self._provider_batch
+        groups: dict[str, list[BatchItem]] = {}
+        if api is not None:
+            for item in chunk:
+                if api.supports(item.model_id):
+                    groups.setdefault(item.model_id, []).append(item)
+        if api is not None and groups:
+            batches: dict[str, str] = dict(submitted["batches"]) if submitted else {}
+            # Checkpoints from before submitted_at was recorded start the window now
+            submitted_at = float((submitted or {}).get("submitted_at") or self._clock())
+            wait_until = submitted_at + self._max_wait_seconds
+            if deadline is not None:
+                wait_until = min(wait_until, deadline)
+            async with AsyncExitStack() as holds:
+                meter = await self._hold_chunk(holds, groups, org_id, tier, wait_until)
+                if meter is None:
+                    # The budget cannot cover new batches: their items go
+                    # interactive; batches submitted before a restart are polled
+                    groups = {m: g for m, g in groups.items() if m in batches}
+                for model_id, group in groups.items():
+                    if model_id in batches:
+                        continue
+                    try:
+                        batches[model_id] = await api.submit(group, model_id)
+                    except Exception:
+                        logger.warning(
+                            "Provider batch submit failed for %s", model_id, exc_info=True
+                        )
+                # Persist batch ids before waiting: a restart re-polls instead of resubmitting
+                await self._save(
+                    job_id,
+                    report,
+                    index,
+                    {"chunk": index, "batches": batches, "submitted_at": submitted_at},
+                )
+
+                answered: dict[str, LLMResponse | str] = {}
+                for batch_id in batches.values():
+                    answered.update(await self._wait(api, batch_id, wait_until))
+                batched = {i.item_id for m in batches for i in groups.get(m, [])}
+                remaining = []
+                for item in chunk:
+                    outcome = answered.get(item.item_id)
+                    if isinstance(outcome, LLMResponse) and outcome.finish_reason != "error":
+                        if meter is not None:
+                            meter.add(
+                                input_tokens=outcome.tokens_used.get("input", 0),
+                                output_tokens=outcome.tokens_used.get("output", 0),
+                            )
+                        yield _result(item, outcome, attempts=1, provider_batch=True)
+                    else:
+                        remaining.append(item)
+
+        async for result in self._interactive(remaining, org_id, tier):
+            result.attempts += int(result.item_id in batched)
+            yield result
+
+    async def _hold_chunk(
+        self,
+        holds: AsyncExitStack,
+        groups: dict[str, list[BatchItem]],
+        org_id: UUID | None,
+        tier: str | None,
+        wait_until: float,
+    ) -> UsageMeter | None:
+        """Hold the chunk's provider-batched items on the org budget.
+
+        Returns the meter settled on exit (a detached one without a guard),
+        or None when the budget cannot cover the items.
+        """
+        if self._budget_guard is None:
+            return UsageMeter()
+        calls = [(i.prompt, i.content_parts, i.parameters) for g in groups.values() for i in g]
+        # Held until the wait ends, plus one poll interval of slack
+        hold_seconds = max(wait_until - self._clock(), 0.0) + self._poll_seconds
+        try:
+            with org_scope(org_id, tier):
+                return await holds.enter_async_context(
+                    self._budget_guard.hold_calls(calls, hold_seconds=hold_seconds)
+                )
+        except QuotaExceededError:
+            logger.warning("Budget cannot cover a provider batch of %d items", len(calls))
+            return None
+
+    async def _wait(
+        self, api: ProviderBatchAPI, batch_id: str, wait_until: float
+    ) -> dict[str, LLMResponse | str]:
+        """Poll until done; past wait_until cancel and answer nothing."""
+        while True:
+            outcome = await api.fetch(batch_id)
+            if outcome is not None:
+                return outcome
+            left = wait_until - self._clock()
+            if left <= 0:
+                logger.warning(
+                    "Provider batch %s not done by its deadline; cancelling, items go interactive",
+                    batch_id,
+                )
+                try:
+                    await api.cancel(batch_id)
+                except Exception:
+                    logger.warning("Provider batch cancel failed for %s", batch_id, exc_info=True)
+                return {}
+            await self._sleep(min(self._poll_seconds, left))
+
+    async def _interactive(
+        self,
+        items: list[BatchItem],
+        org_id: UUID | None,
+        tier: str | None,
+    ) -> AsyncIterator[BatchItemResult]:
+        gate = asyncio.Semaphore(self._concurrency)
+
+        async def _one(item: BatchItem) -> BatchItemResult:
+            async with gate:
+                return await self._call_with_retry(item, org_id, tier)
+
+        tasks = [asyncio.create_task(_one(item)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _call_with_retry(
+        self,
+        item: BatchItem,
+        org_id: UUID | None,
+        tier: str | None,
+    ) -> BatchItemResult:
+        error = ""
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                with org_scope(org_id, tier), call_priority("batch"):
+                    response = await self._llm.call(
+                        prompt=item.prompt,
+                        model_id=item.model_id,
+                        content_parts=item.content_parts,
+                        parameters=item.parameters,
+                    )
+                if response.finish_reason != "error":
+                    return _result(item, response, attempts=attempt)
+                error = "provider returned finish_reason=error"
+            except QuotaExceededError as exc:
+                # Retrying cannot help until the org's budget is raised
+                error = f"{type(exc).__name__}: {exc}"
+                break
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            if attempt < self._max_attempts:
+                delay = self._backoff_seconds * 2 ** (attempt - 1)
+                await self._sleep(min(delay, self._max_backoff_seconds))
+        logger.warning("Batch item %s failed after %d attempts: %s", item.item_id, attempt, error)
+        return BatchItemResult(
+            item_id=item.item_id, model_id=item.model_id, error=error, attempts=attempt
+        )
+
+    def _account(self, report: BatchJobReport, result: BatchItemResult) -> None:
+        report.items += 1
+        report.retries += max(result.attempts - 1, 0)
+        if not result.ok:
+            report.failed += 1
+            return
+        report.succeeded += 1
+        report.provider_batch_items += int(result.provider_batch)
+        input_tokens = result.tokens_used.get("input", 0)
+        output_tokens = result.tokens_used.get("output", 0)
+        report.input_tokens += input_tokens
+        report.output_tokens += output_tokens
+        if self._pricing is not None:
+            model_id = result.model_id
+            report.cost_usd += self._pricing(
+                model_id, input_tokens, output_tokens, result.provider_batch
+            )
+            report.interactive_cost_usd += self._pricing(
+                model_id, input_tokens, output_tokens, False
+            )
+
+    def _record_usage(
+        self,
+        job_id: str,
+        result: BatchItemResult,
+        org_id: UUID | None,
+        user_id: UUID | None,
+    ) -> None:
+        if self._usage_tracker is None or org_id is None or user_id is None:
+            return
+        if not result.ok or not result.tokens_used:
+            return
+        input_tokens = result.tokens_used.get("input", 0)
+        output_tokens = result.tokens_used.get("output", 0)
+        self._usage_tracker.record_usage(
+            org_id=org_id,
+            user_id=user_id,
+            model_id=result.model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_amount=(
+                self._pricing(result.model_id, input_tokens, output_tokens, result.provider_batch)
+                if self._pricing is not None
+                else None
+            ),
+            task_id=job_id,
+        )
+
+    async def _save(
+        self,
+        job_id: str,
+        report: BatchJobReport,
+        chunks_done: int,
+        pending: dict[str, Any] | None,
+    ) -> None:
+        state = {"report": asdict(report), "chunks_done": chunks_done, "pending": pending}
+        await self._checkpoints.put(_state_key(job_id), state, ttl=BATCH_TTL_SECONDS)
+
+
+def llm_batch_task(
+    runner: BatchJobRunner,
+    items_factory: Callable[[str], AsyncIterable[BatchItem] | Iterable[BatchItem]],
+) -> Callable[[str], Awaitable[dict[str, Any]]]:
+    """Async task body for BackgroundTaskExecutor.register(LLM_BATCH_TASK, ...).
+
+    The returned coroutine function runs one job (items_factory(job_id)) to
+    completion on the caller's event loop and returns the report as a plain
+    dict.
+    """
+
+    async def _task(job_id: str) -> dict[str, Any]:
+        report = await runner.run(job_id, items_factory(job_id))
+        return {
+            **asdict(report),
+            "items_per_second": report.items_per_second,
+            "savings_usd": report.savings_usd,
+        }
+
+    return _task
+
+
+def _result(
+    item: BatchItem,
+    response: LLMResponse,
+    *,
+    attempts: int,
+    provider_batch: bool = False,
+) -> BatchItemResult:
+    return BatchItemResult(
+        item_id=item.item_id,
+        text=response.text,
+        tokens_used=dict(response.tokens_used),
+        model_id=response.model_id or item.model_id,
+        finish_reason=response.finish_reason,
+        attempts=attempts,
+        provider_batch=provider_batch,
+    )
+
+
+def _state_key(job_id: str) -> str:
+    return f"{BATCH_KEY_PREFIX}:{job_id}"
+
+
+def _chunk_key(job_id: str, index: int) -> str:
+    return f"{BATCH_KEY_PREFIX}:{job_id}:chunk:{index}"
+
+
+async def _chunks(
+    items: AsyncIterable[BatchItem] | Iterable[BatchItem],
+    size: int,
+) -> AsyncIterator[list[BatchItem]]:
+    chunk: list[BatchItem] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
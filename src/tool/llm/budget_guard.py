@@ -0,0 +1,294 @@
+"""Pre-call token estimation and budget reservation for LLM calls.
+
+Task card: T2-10 (reservation-based budget enforcement)
+- PromptTokenEstimator: fast, memoized (TokenCounter) size of a call
+  before it is sent: prompt or role blocks, per-message framing, a flat
+  allowance per media block, plus the output cap (max_tokens, or
+  policy.default_output_tokens when the caller sets none)
+- BudgetGuard wraps an LLMCallPort-compatible caller: reserve the
+  estimate on the org's budget ledger, call through, settle with the
+  actual LLMResponse usage; release the hold if the call fails
+- hold(): the same reserve / settle around a streamed response; the
+  caller meters usage chunk by chunk and whatever was metered is settled
+  on exit, also when the stream breaks off
+- hold_calls(): one reservation for many calls answered together (a
+  provider batch), held for as long as the batch may run
+- An exhausted budget raises QuotaExceededError (402) before the
+  provider is called. A ledger outage fails open: the call proceeds
+  unguarded and is counted in BudgetGuardStats.unguarded
+- Calls outside any org scope, or of orgs without a budget, pass through
+
+The ledger is TokenBudgetManager (one worker) or RedisBudgetLedger
+(multi-worker); both satisfy TokenLedger.
+
+Architecture: ADR-047, 05-Gateway Section 6
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+from src.shared.errors import QuotaExceededError
+from src.shared.org_scope import get_org_id
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+    from uuid import UUID
+
+    from src.ports.llm_call_port import ContentBlock, LLMCallPort, LLMResponse
+    from src.shared.tokens import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+# (prompt, content_parts, parameters) of one call
+CallShape = tuple[str, "list[ContentBlock] | None", "dict[str, Any] | None"]
+
+
+class TokenLedger(Protocol):
+    """Reserve / settle / release contract of the billing ledgers."""
+
+    async def reserve(self, budget_id: UUID, tokens: int, *, ttl_seconds: float = ...) -> Any:
+        """Hold tokens; returns an opaque reservation passed back below."""
+        ...
+
+    async def settle(self, reservation: Any, actual_tokens: int) -> Any: ...
+
+    async def release(self, reservation: Any) -> None: ...
+
+
+@dataclass(frozen=True)
+class BudgetGuardPolicy:
+    """How calls are sized and how long their holds live.
+
+    Attributes:
+        default_output_tokens: Output reserved when parameters carry no
+            max_tokens.
+        per_message_tokens: Framing overhead per chat message.
+        media_block_tokens: Allowance per image / audio / document block.
+        hold_seconds: Hold lifetime; longer than the slowest call.
+    """
+
+    default_output_tokens: int = 1024
+    per_message_tokens: int = 4
+    media_block_tokens: int = 1000
+    hold_seconds: float = 300.0
+
+    def __post_init__(self) -> None:
+        sizes = (self.default_output_tokens, self.per_message_tokens, self.media_block_tokens)
+        if min(sizes) < 0 or self.hold_seconds <= 0:
+            msg = (
+                f"token allowances must be non-negative and hold_seconds positive, "
+                f"got {sizes}/{self.hold_seconds}"
+            )
+            raise ValueError(msg)
+
+
+class PromptTokenEstimator:
+    """Upper-leaning token estimate of one LLM call (input + output cap).
+
+    Args:
+        counter: Memoized counter for text (tiktoken when available offline).
+        policy: Output and framing allowances.
+    """
+
+    def __init__(self, counter: TokenCounter, policy: BudgetGuardPolicy | None = None) -> None:
+        self._counter = counter
+        self._policy = policy or BudgetGuardPolicy()
+
+    def input_tokens(self, prompt: str, content_parts: list[ContentBlock] | None = None) -> int:
+        policy = self._policy
+        blocks = content_parts or []
+        messages = [b for b in blocks if b.role]
+        total = 0
+        if not messages:
+            total += self._counter.count(prompt) + policy.per_message_tokens
+        for block in blocks:
+            if block.type == "text":
+                total += self._counter.count(block.text)
+            else:
+                total += policy.media_block_tokens + self._counter.count(block.text_fallback)
+        return total + len(messages) * policy.per_message_tokens
+
+    def output_tokens(self, parameters: dict[str, Any] | None = None) -> int:
+        cap = (parameters or {}).get("max_tokens")
+        if isinstance(cap, int) and cap > 0:
+            return cap
+        return self._policy.default_output_tokens
+
+    def estimate(
+        self,
+        prompt: str,
+        content_parts: list[ContentBlock] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> int:
+        return self.input_tokens(prompt, content_parts) + self.output_tokens(parameters)
+
+
+@dataclass
+class BudgetGuardStats:
+    """Reservation counters; estimated vs actual shows estimator accuracy."""
+
+    reserved: int = 0
+    rejected: int = 0  # budget could not cover the estimate
+    released: int = 0  # call failed, hold returned
+    unguarded: int = 0  # ledger unavailable, call let through
+    estimated_tokens: int = 0
+    actual_tokens: int = 0  # settled usage of guarded calls
+
+
+class UsageMeter:
+    """Usage of one guarded call; settled when the hold closes."""
+
+    def __init__(self) -> None:
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    @property
+    def total(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(self, *, input_tokens: int = 0, output_tokens: int = 0) -> None:
+        """Meter a streamed chunk."""
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+    def record(self, response: LLMResponse) -> None:
+        """Meter a complete response (replaces chunk counts)."""
+        self.input_tokens = response.tokens_used.get("input", 0)
+        self.output_tokens = response.tokens_used.get("output", 0)
+
+
+class BudgetGuard:
+    """Reserves an LLM call's estimated tokens on the org budget first.
+
+    Args:
+        inner: The LLM caller to guard (scheduler, registry or adapter).
+        ledger: Budget ledger holding the reservations.
+        resolve_budget: org_id -> budget_id (None = org has no budget).
+        estimator: Pre-call size estimate.
+    """
+
+    def __init__(
+        self,
+        inner: LLMCallPort | Any,
+        *,
+        ledger: TokenLedger,
+        resolve_budget: Callable[[UUID], UUID | None],
+        estimator: PromptTokenEstimator,
+        policy: BudgetGuardPolicy | None = None,
+    ) -> None:
+        self._inner = inner
+        self._ledger = ledger
+        self._resolve_budget = resolve_budget
+        self._estimator = estimator
+        self._policy = policy or BudgetGuardPolicy()
+        self._stats = BudgetGuardStats()
+
+    @property
+    def stats(self) -> BudgetGuardStats:
+        return self._stats
+
+    async def call(
+        self,
+        prompt: str,
+        model_id: str = "",
+        content_parts: list[ContentBlock] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        """Reserve the estimate, call through, settle actual usage."""
+        async with self.hold(prompt, content_parts, parameters) as meter:
+            response: LLMResponse = await self._inner.call(
+                prompt=prompt,
+                model_id=model_id,
+                content_parts=content_parts,
+                parameters=parameters,
+            )
+            meter.record(response)
+        return response
+
+    @asynccontextmanager
+    async def hold(
+        self,
+        prompt: str,
+        content_parts: list[ContentBlock] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[UsageMeter]:
+        """Reserve for a call made inside the block (e.g. a stream).
+
+        Raises:
+            QuotaExceededError: The org's budget cannot cover the estimate.
+        """
+        async with self._hold(
+            lambda: self._estimator.estimate(prompt, content_parts, parameters),
+            self._policy.hold_seconds,
+        ) as meter:
+            yield meter
+
+    @asynccontextmanager
+    async def hold_calls(
+        self,
+        calls: Sequence[CallShape],
+        *,
+        hold_seconds: float,
+    ) -> AsyncIterator[UsageMeter]:
+        """Reserve the summed estimate of calls answered together.
+
+        The caller meters each answered call with UsageMeter.add; the total
+        is settled on exit (nothing metered: the hold is released).
+
+        Raises:
+            QuotaExceededError: The org's budget cannot cover the estimate.
+        """
+        async with self._hold(
+            lambda: sum(self._estimator.estimate(*call) for call in calls), hold_seconds
+        ) as meter:
+            yield meter
+
+    @asynccontextmanager
+    async def _hold(
+        self, estimate_tokens: Callable[[], int], hold_seconds: float
+    ) -> AsyncIterator[UsageMeter]:
+        meter = UsageMeter()
+        org_id = get_org_id()
+        budget_id = self._resolve_budget(org_id) if org_id is not None else None
+        reservation: Any = None
+        if budget_id is not None:
+            estimate = estimate_tokens()
+            try:
+                reservation = await self._ledger.reserve(
+                    budget_id, estimate, ttl_seconds=hold_seconds
+                )
+            except QuotaExceededError:
+                self._stats.rejected += 1
+                raise
+            except Exception:
+                logger.warning("Budget ledger unavailable; call not guarded", exc_info=True)
+                self._stats.unguarded += 1
+            else:
+                self._stats.reserved += 1
+                self._stats.estimated_tokens += estimate
+
+        if reservation is None:
+            yield meter
+            return
+        try:
+            yield meter
+        except BaseException:
+            await self._close(reservation, meter)
+            raise
+        await self._close(reservation, meter)
+
+    async def _close(self, reservation: Any, meter: UsageMeter) -> None:
+        try:
+            if meter.total == 0:
+                self._stats.released += 1
+                await self._ledger.release(reservation)
+                return
+            self._stats.actual_tokens += meter.total
+            await self._ledger.settle(reservation, meter.total)
+        except Exception:
+            # The hold expires on its own; the usage is lost to billing
+            logger.exception("Budget settlement failed (%d tokens)", meter.total)
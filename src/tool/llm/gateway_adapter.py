@@ -4,21 +4,42 @@ Task card: T2-1
 - Replace Stub with real LLM provider calls via LiteLLM
 - Supports OpenAI, Anthropic, DeepSeek via unified interface
 - Token metering write to records
+- Structured prompts (role-tagged ContentBlocks) become one message per
+  block; cache hints become Anthropic-style cache_control breakpoints and
+  provider-reported cached input tokens are surfaced as cached_input
+
+Task card: T3-4
+- http_client: a shared pooled httpx client (HttpClientPool) becomes
+  LiteLLM's async session, so OpenAI-compatible calls reuse keep-alive
+  connections instead of per-call setup
+
+Task card: T2-9
+- LiteLLMBatchAPI: ProviderBatchAPI over LiteLLM's files + batches
+  endpoints (JSONL upload, /v1/batches, output file download)
+- litellm_cost(): interactive or batch price from LiteLLM's cost map
+- litellm_provider(): provider of a model id, for usage attribution
 
 Architecture: Section 12.3 (LLMCallPort)
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from collections.abc import Callable, Coroutine
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import litellm
 
 from src.ports.llm_call_port import ContentBlock, LLMCallPort, LLMResponse
 
+if TYPE_CHECKING:
+    import httpx
+
+    from src.tool.llm.batch import BatchItem
+
 # Type alias for the async completion callable (DI seam for testing)
 ACompletionFn = Callable[..., Coroutine[Any, Any, Any]]
 
@@ -42,6 +63,7 @@ class LiteLLMGatewayAdapter(LLMCallPort):
         api_key: str | None = None,
         base_url: str | None = None,
         acompletion_fn: ACompletionFn | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self._default_model = default_model or os.environ.get("LLM_MODEL", "gpt-4o")
         self._timeout_s = timeout_s
@@ -51,6 +73,8 @@ class LiteLLMGatewayAdapter(LLMCallPort):
         self._acompletion = acompletion_fn or litellm.acompletion
 
         litellm.drop_params = True
+        if http_client is not None:
+            litellm.aclient_session = http_client
 
     async def call(
         self,
@@ -96,6 +120,11 @@ class LiteLLMGatewayAdapter(LLMCallPort):
                 "input": usage.prompt_tokens if usage else 0,
                 "output": usage.completion_tokens if usage else 0,
             }
+            # LiteLLM normalizes provider cache reads into prompt_tokens_details
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached = getattr(details, "cached_tokens", None)
+            if cached:
+                tokens_used["cached_input"] = cached
             finish_reason = response.choices[0].finish_reason or "stop"
 
             return LLMResponse(
@@ -117,22 +146,225 @@ class LiteLLMGatewayAdapter(LLMCallPort):
         """Build LiteLLM messages from prompt and optional content_parts."""
         if not content_parts:
             return [{"role": "user", "content": prompt}]
+        if any(block.role for block in content_parts):
+            return self._build_structured_messages(content_parts)
 
         parts: list[dict[str, Any]] = []
         if prompt:
             parts.append({"type": "text", "text": prompt})
+        parts.extend(self._content_part(block) for block in content_parts)
+
+        return [{"role": "user", "content": parts}]
 
+    def _build_structured_messages(
+        self,
+        content_parts: list[ContentBlock],
+    ) -> list[dict[str, Any]]:
+        """One message per role-tagged block; role-less blocks attach to the last user turn.
+
+        Cache hints become cache_control breakpoints (Anthropic and other
+        providers that honour them; LiteLLM strips them for the rest, where
+        caching is automatic on the shared prefix).
+        """
+        messages: list[dict[str, Any]] = []
         for block in content_parts:
-            if block.type == "text":
-                parts.append({"type": "text", "text": block.text})
-            elif block.type == "image" and block.media_id:
-                parts.append(
+            if not block.role:
+                continue
+            if block.cache:
+                part = {**self._content_part(block), "cache_control": {"type": "ephemeral"}}
+                messages.append({"role": block.role, "content": [part]})
+            else:
+                messages.append({"role": block.role, "content": block.text})
+
+        attachments = [self._content_part(block) for block in content_parts if not block.role]
+        if attachments:
+            last_user = next((m for m in reversed(messages) if m["role"] == "user"), None)
+            if last_user is None:
+                last_user = {"role": "user", "content": ""}
+                messages.append(last_user)
+            content = last_user["content"]
+            text_parts = [{"type": "text", "text": content}] if content else []
+            last_user["content"] = (
+                [*content, *attachments] if isinstance(content, list) else text_parts + attachments
+            )
+        return messages
+
+    @staticmethod
+    def _content_part(block: ContentBlock) -> dict[str, Any]:
+        if block.type == "text":
+            return {"type": "text", "text": block.text}
+        if block.type == "image" and block.media_id:
+            return {"type": "image_url", "image_url": {"url": block.media_id}}
+        return {"type": "text", "text": block.text_fallback or block.text}
+
+
+# Batch states after which the output (and error) files are final
+_BATCH_DONE = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class LiteLLMBatchAPI:
+    """Provider batch endpoint (OpenAI-compatible /v1/batches) via LiteLLM.
+
+    Requests are built exactly like LiteLLMGatewayAdapter.call builds them,
+    uploaded as one JSONL file per batch and billed at the provider's batch
+    rate. Custom base_url gateways are not assumed to implement batches.
+    """
+
+    def __init__(
+        self,
+        adapter: LiteLLMGatewayAdapter,
+        *,
+        provider: str = "openai",
+        create_file_fn: ACompletionFn | None = None,
+        create_batch_fn: ACompletionFn | None = None,
+        retrieve_batch_fn: ACompletionFn | None = None,
+        file_content_fn: ACompletionFn | None = None,
+        cancel_batch_fn: ACompletionFn | None = None,
+    ) -> None:
+        self._adapter = adapter
+        self._provider = provider
+        self._create_file = create_file_fn or litellm.acreate_file
+        self._create_batch = create_batch_fn or litellm.acreate_batch
+        self._retrieve_batch = retrieve_batch_fn or litellm.aretrieve_batch
+        self._file_content = file_content_fn or litellm.afile_content
+        self._cancel_batch: ACompletionFn = cancel_batch_fn or litellm.acancel_batch
+
+    def supports(self, model_id: str) -> bool:
+        if self._adapter._base_url:
+            return False
+        try:
+            _, provider, _, _ = litellm.get_llm_provider(model_id or self._adapter._default_model)
+        except Exception:
+            return False
+        return bool(provider == self._provider)
+
+    async def submit(self, items: list[BatchItem], model_id: str) -> str:
+        model = model_id or self._adapter._default_model
+        lines = []
+        for item in items:
+            params = item.parameters or {}
+            body: dict[str, Any] = {
+                "model": model,
+                "messages": self._adapter._build_messages(item.prompt, item.content_parts),
+                "temperature": params.get("temperature", 0.7),
+            }
+            if params.get("max_tokens") is not None:
+                body["max_tokens"] = params["max_tokens"]
+            lines.append(
+                json.dumps(
                     {
-                        "type": "image_url",
-                        "image_url": {"url": block.media_id},
+                        "custom_id": item.item_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
                     }
                 )
-            else:
-                parts.append({"type": "text", "text": block.text_fallback or block.text})
+            )
+        upload = await self._create_file(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+            custom_llm_provider=self._provider,
+            **self._auth(),
+        )
+        batch = await self._create_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=upload.id,
+            custom_llm_provider=self._provider,
+            **self._auth(),
+        )
+        return str(batch.id)
 
-        return [{"role": "user", "content": parts}]
+    async def fetch(self, batch_id: str) -> dict[str, LLMResponse | str] | None:
+        batch = await self._retrieve_batch(
+            batch_id=batch_id, custom_llm_provider=self._provider, **self._auth()
+        )
+        if batch.status not in _BATCH_DONE:
+            return None
+        if batch.status != "completed":
+            logger.warning("Provider batch %s ended as %s", batch_id, batch.status)
+        outcomes: dict[str, LLMResponse | str] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self._file_content(
+                file_id=file_id, custom_llm_provider=self._provider, **self._auth()
+            )
+            raw = getattr(content, "content", content)
+            text = raw.decode() if isinstance(raw, bytes) else str(raw)
+            for line in text.splitlines():
+                if line.strip():
+                    custom_id, outcome = _parse_batch_line(json.loads(line))
+                    outcomes[custom_id] = outcome
+        return outcomes
+
+    async def cancel(self, batch_id: str) -> None:
+        await self._cancel_batch(
+            batch_id=batch_id, custom_llm_provider=self._provider, **self._auth()
+        )
+
+    def _auth(self) -> dict[str, Any]:
+        return {"api_key": self._adapter._api_key} if self._adapter._api_key else {}
+
+
+def _parse_batch_line(record: dict[str, Any]) -> tuple[str, LLMResponse | str]:
+    """One line of a batch output/error file -> (custom_id, response or error)."""
+    custom_id = str(record.get("custom_id", ""))
+    response = record.get("response") or {}
+    body = response.get("body") or {}
+    if record.get("error") or response.get("status_code") != 200 or not body.get("choices"):
+        error = record.get("error") or body.get("error") or "no response"
+        return custom_id, json.dumps(error) if not isinstance(error, str) else error
+    choice = body["choices"][0]
+    usage = body.get("usage") or {}
+    tokens_used = {
+        "input": usage.get("prompt_tokens", 0),
+        "output": usage.get("completion_tokens", 0),
+    }
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+    if cached:
+        tokens_used["cached_input"] = cached
+    return custom_id, LLMResponse(
+        text=(choice.get("message") or {}).get("content") or "",
+        tokens_used=tokens_used,
+        model_id=body.get("model", ""),
+        finish_reason=choice.get("finish_reason") or "stop",
+    )
+
+
+def litellm_cost(
+    model_id: str,
+    input_tokens: int,
+    output_tokens: int,
+    provider_batch: bool = False,
+) -> float:
+    """USD price of a call from LiteLLM's cost map (0.0 for unknown models).
+
+    Batch prices fall back to interactive prices when the map has none.
+    """
+    info = litellm.model_cost.get(model_id) or litellm.model_cost.get(
+        model_id.split("/", 1)[-1], {}
+    )
+    suffix = "_batches" if provider_batch else ""
+    input_rate = info.get(f"input_cost_per_token{suffix}", info.get("input_cost_per_token", 0.0))
+    output_rate = info.get(f"output_cost_per_token{suffix}", info.get("output_cost_per_token", 0.0))
+    return float(input_tokens * (input_rate or 0.0) + output_tokens * (output_rate or 0.0))
+
+
+@lru_cache(maxsize=256)
+def litellm_provider(model_id: str) -> str | None:
+    """Provider LiteLLM routes a model to (None if it cannot tell), cached per model."""
+    try:
+        _, provider, _, _ = litellm.get_llm_provider(model_id)
+    except Exception:
+        return None
+    return str(provider) if provider else None
+
+
+def litellm_context_window(model_id: str, default: int = 4096) -> int:
+    """Input context window of a model from LiteLLM's cost map (default if unknown)."""
+    info = litellm.model_cost.get(model_id) or litellm.model_cost.get(
+        model_id.split("/", 1)[-1], {}
+    )
+    window = info.get("max_input_tokens") or info.get("max_tokens")
+    return int(window) if window else default
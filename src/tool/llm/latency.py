@@ -0,0 +1,95 @@
+"""Per-provider LLM latency tracking.
+
+Task card: T2-7 (latency-aware model selection)
+- EWMA of call latency (fast-moving mean for routing weights)
+- Quantile sketch: log-spaced buckets with ~2% relative error, over a
+  rotating window (current + previous window of samples), so p95 follows
+  a provider that slows down instead of averaging over its whole life
+- Fixed memory per provider; O(1) observe, O(buckets) quantile
+
+Architecture: delivery/phase2-runtime-config.yaml (llm section)
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+
+_MIN_MS = 0.1  # everything faster lands in the first bucket
+
+
+@dataclass
+class LatencySketch:
+    """Log-bucketed latency histogram with a rotating window.
+
+    Attributes:
+        relative_accuracy: Bucket width; quantiles are within this
+            relative error of the true sample.
+        window: Samples per window; quantiles cover the last one to two
+            windows.
+    """
+
+    relative_accuracy: float = 0.02
+    window: int = 512
+    _current: Counter[int] = field(default_factory=Counter)
+    _previous: Counter[int] = field(default_factory=Counter)
+    _current_count: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0 < self.relative_accuracy < 1:
+            msg = f"relative_accuracy must be in (0, 1), got {self.relative_accuracy}"
+            raise ValueError(msg)
+        if self.window <= 0:
+            msg = f"window must be positive, got {self.window}"
+            raise ValueError(msg)
+        self._gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    @property
+    def count(self) -> int:
+        return self._current_count + sum(self._previous.values())
+
+    def observe(self, latency_ms: float) -> None:
+        if self._current_count >= self.window:
+            self._previous, self._current = self._current, Counter()
+            self._current_count = 0
+        bucket = math.ceil(math.log(max(latency_ms, _MIN_MS) / _MIN_MS) / self._log_gamma)
+        self._current[bucket] += 1
+        self._current_count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Latency (ms) at quantile q, or None without samples."""
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        merged = self._current + self._previous
+        for bucket in sorted(merged):
+            seen += merged[bucket]
+            if seen > rank:
+                # Bucket midpoint (in log space) is within relative_accuracy
+                return float(_MIN_MS * 2 * self._gamma**bucket / (self._gamma + 1))
+        return None  # unreachable: seen reaches total
+
+
+@dataclass
+class LatencyStats:
+    """EWMA + quantile sketch for one provider."""
+
+    alpha: float = 0.2
+    ewma_ms: float | None = None
+    samples: int = 0
+    sketch: LatencySketch = field(default_factory=LatencySketch)
+
+    def observe(self, latency_ms: float) -> None:
+        self.samples += 1
+        self.sketch.observe(latency_ms)
+        if self.ewma_ms is None:
+            self.ewma_ms = latency_ms
+        else:
+            self.ewma_ms += self.alpha * (latency_ms - self.ewma_ms)
+
+    def quantile(self, q: float) -> float | None:
+        return self.sketch.quantile(q)
@@ -4,19 +4,40 @@ Task card: T2-2
 - Circuit breaker pattern for LLM provider resilience
 - Automatic failover to backup model on primary failure
 - Fallback latency < 2s
+- Optional singleflight: concurrent identical calls (model, prompt,
+  blocks, parameters) share one provider call; callers that joined get
+  the answer with zero metered tokens (see response_cache.reused)
+
+Task card: T2-7 (latency-aware model selection)
+- Per-provider latency: EWMA + windowed quantile sketch (latency.py)
+- Optional hedging (HedgePolicy): when the current provider has not
+  answered after its own p95 (adaptive delay), the next available
+  provider in the chain is started too; the first success wins and the
+  loser is cancelled. A token bucket caps hedges at a share of calls
+- Optional latency routing: providers sharing an equivalence label are
+  tried in a latency-weighted random order instead of configured order
 
 Architecture: delivery/phase2-runtime-config.yaml (llm section)
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from src.shared.org_scope import get_org_id
+from src.tool.llm.latency import LatencyStats
+from src.tool.llm.response_cache import call_key, reused
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.ports.llm_call_port import ContentBlock, LLMCallPort, LLMResponse
+    from src.shared.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +56,7 @@ class ProviderConfig:
     default_model: str
     timeout_s: int = 30
     max_retries: int = 2
+    equivalence: str = ""  # providers sharing a label are interchangeable (latency routing)
 
 
 @dataclass
@@ -48,6 +70,75 @@ class CircuitState:
     recovery_timeout_s: float = 60.0
 
 
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to start a backup provider for a slow call.
+
+    Attributes:
+        quantile: The current provider's latency quantile used as delay.
+        min_samples: Samples needed before the quantile is trusted.
+        initial_delay_ms: Delay until then.
+        min_delay_ms / max_delay_ms: Bounds on the adaptive delay.
+        budget_ratio: Hedges allowed per call on average (0.1 = 10%).
+        max_burst: Unused hedge budget that can accumulate.
+    """
+
+    quantile: float = 0.95
+    min_samples: int = 20
+    initial_delay_ms: float = 2000.0
+    min_delay_ms: float = 50.0
+    max_delay_ms: float = 10_000.0
+    budget_ratio: float = 0.1
+    max_burst: float = 10.0
+
+    def __post_init__(self) -> None:
+        if not 0 < self.quantile < 1:
+            msg = f"quantile must be in (0, 1), got {self.quantile}"
+            raise ValueError(msg)
+        if not 0 <= self.min_delay_ms <= self.max_delay_ms:
+            msg = (
+                "min_delay_ms must be non-negative and <= max_delay_ms, got "
+                f"{self.min_delay_ms}/{self.max_delay_ms}"
+            )
+            raise ValueError(msg)
+        if not 0 <= self.budget_ratio <= 1 or self.max_burst < 1:
+            msg = (
+                "budget_ratio must be in [0, 1] and max_burst >= 1, got "
+                f"{self.budget_ratio}/{self.max_burst}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass
+class HedgeStats:
+    """Counters for hedged requests."""
+
+    hedges: int = 0  # backup calls started
+    hedge_wins: int = 0  # backup answered first
+    budget_denied: int = 0  # slow call, but no hedge budget left
+
+
+@dataclass
+class _HedgeBudget:
+    tokens: float = 1.0
+
+    def earn(self, policy: HedgePolicy) -> None:
+        self.tokens = min(self.tokens + policy.budget_ratio, policy.max_burst)
+
+    def spend(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _Request(NamedTuple):
+    prompt: str
+    model_id: str
+    content_parts: list[ContentBlock] | None
+    parameters: dict[str, Any] | None
+
+
 @dataclass
 class ModelRegistry:
     """Registry of LLM providers with circuit breaker and fallback.
@@ -56,13 +147,22 @@ class ModelRegistry:
     - Per-provider circuit breaker
     - Automatic failover through fallback chain
     - Provider health tracking
+    - Per-provider latency tracking, optional hedging and latency routing
     """
 
     adapter: LLMCallPort
     primary: str = "openai"
     fallback_chain: list[str] = field(default_factory=list)
     providers: dict[str, ProviderConfig] = field(default_factory=dict)
+    singleflight: SingleFlight | None = None
+    hedge: HedgePolicy | None = None
+    latency_routing: bool = False
+    rng: random.Random = field(default_factory=random.Random)
+    clock: Callable[[], float] = time.monotonic
     _circuits: dict[str, CircuitState] = field(default_factory=dict)
+    _latency: dict[str, LatencyStats] = field(default_factory=dict)
+    _hedge_budget: _HedgeBudget = field(default_factory=_HedgeBudget)
+    _hedge_stats: HedgeStats = field(default_factory=HedgeStats)
 
     def __post_init__(self) -> None:
         for name in [self.primary, *self.fallback_chain]:
@@ -79,49 +179,194 @@ class ModelRegistry:
         """Call LLM with automatic fallback on failure.
 
         Tries primary provider first, then each fallback in order.
-        Uses circuit breaker to skip known-failed providers.
+        Uses circuit breaker to skip known-failed providers. With a hedge
+        policy, a slow provider is raced against the next one in the chain.
+        With singleflight, identical concurrent calls of the same org (from
+        org_scope) share one provider call; orgs never share a response.
 
         Args:
             model_id: Target model. Empty string uses provider default.
         """
-        chain = [self.primary, *self.fallback_chain]
+        if self.singleflight is None:
+            return await self._call_chain(prompt, model_id, content_parts, parameters)
+        org = get_org_id() or "-"
+        response, shared = await self.singleflight.do_shared(
+            f"llm:{org}:" + call_key(prompt, model_id, content_parts, parameters),
+            lambda: self._call_chain(prompt, model_id, content_parts, parameters),
+        )
+        return reused(response) if shared else response
+
+    async def _call_chain(
+        self,
+        prompt: str,
+        model_id: str,
+        content_parts: list[ContentBlock] | None,
+        parameters: dict[str, Any] | None,
+    ) -> LLMResponse:
+        chain = self._ordered_chain()
+        request = _Request(prompt, model_id, content_parts, parameters)
+        if self.hedge is not None:
+            self._hedge_budget.earn(self.hedge)
+        tried: set[str] = set()
         last_error: Exception | None = None
 
         for provider_name in chain:
-            circuit = self._circuits.get(provider_name)
-            if circuit is None:
-                circuit = CircuitState()
-                self._circuits[provider_name] = circuit
-
+            if provider_name in tried:
+                continue
+            circuit = self._circuit(provider_name)
             if not self._is_available(circuit):
                 logger.info("Skipping provider=%s (circuit open)", provider_name)
                 continue
 
-            config = self.providers.get(provider_name)
-            resolved_model = model_id or (config.default_model if config else provider_name)
-
+            tried.add(provider_name)
+            backup = self._hedge_backup(chain, tried)
             try:
-                response = await self.adapter.call(
-                    prompt=prompt,
-                    model_id=resolved_model,
-                    content_parts=content_parts,
-                    parameters=parameters,
-                )
-                self._record_success(circuit)
-                return response
-
+                if backup is None:
+                    return await self._attempt(provider_name, request)
+                return await self._hedged(provider_name, backup, request, tried)
             except Exception as e:
                 logger.warning(
                     "Provider %s failed: %s, trying next",
                     provider_name,
                     str(e)[:200],
                 )
-                self._record_failure(circuit)
                 last_error = e
 
         msg = f"All providers in chain {chain} failed"
         raise RuntimeError(msg) from last_error
 
+    async def _attempt(self, provider_name: str, request: _Request) -> LLMResponse:
+        """One provider call: circuit breaker and latency bookkeeping."""
+        circuit = self._circuit(provider_name)
+        config = self.providers.get(provider_name)
+        resolved_model = request.model_id or (config.default_model if config else provider_name)
+        stats = self._latency.setdefault(provider_name, LatencyStats())
+        start = self.clock()
+        try:
+            response = await self.adapter.call(
+                prompt=request.prompt,
+                model_id=resolved_model,
+                content_parts=request.content_parts,
+                parameters=request.parameters,
+            )
+        except asyncio.CancelledError:
+            # Lost a hedge race: the elapsed time is a lower bound, still worth
+            # recording so a slow provider keeps looking slow
+            stats.observe((self.clock() - start) * 1000)
+            raise
+        except Exception:
+            self._record_failure(circuit)
+            raise
+        stats.observe((self.clock() - start) * 1000)
+        self._record_success(circuit)
+        return response
+
+    async def _hedged(
+        self,
+        provider_name: str,
+        backup: str,
+        request: _Request,
+        tried: set[str],
+    ) -> LLMResponse:
+        """Race the backup against a primary that is slower than usual."""
+        assert self.hedge is not None
+        first = asyncio.ensure_future(self._attempt(provider_name, request))
+        racers = {first}
+        try:
+            await asyncio.wait(racers, timeout=self._hedge_delay_ms(provider_name) / 1000)
+            if first.done():
+                return first.result()
+            if not self._hedge_budget.spend():
+                self._hedge_stats.budget_denied += 1
+                return await first
+
+            tried.add(backup)
+            self._hedge_stats.hedges += 1
+            second = asyncio.ensure_future(self._attempt(backup, request))
+            racers.add(second)
+            error: BaseException | None = None
+            while racers:
+                done, racers = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is second:
+                            self._hedge_stats.hedge_wins += 1
+                        return task.result()
+            assert error is not None
+            raise error
+        finally:
+            for task in racers:
+                task.cancel()  # the loser
+
+    def _ordered_chain(self) -> list[str]:
+        """Fallback chain; equivalent providers ordered by latency when enabled."""
+        chain = [self.primary, *self.fallback_chain]
+        if not self.latency_routing:
+            return chain
+        slots: list[list[str]] = []
+        groups: dict[str, list[str]] = {}
+        for name in chain:
+            config = self.providers.get(name)
+            label = config.equivalence if config else ""
+            if not label:
+                slots.append([name])
+            elif label in groups:
+                groups[label].append(name)
+            else:
+                groups[label] = [name]
+                slots.append(groups[label])
+        return [name for members in slots for name in self._latency_weighted(members)]
+
+    def _latency_weighted(self, members: list[str]) -> list[str]:
+        """Weighted shuffle by 1 / EWMA latency (unmeasured: as fast as the best)."""
+        if len(members) == 1:
+            return members
+        known = [s.ewma_ms for m in members if (s := self._latency.get(m)) and s.ewma_ms]
+        optimistic = min(known) if known else 1.0
+        remaining = list(members)
+        ordered: list[str] = []
+        while remaining:
+            weights = [1 / self._ewma(name, optimistic) for name in remaining]
+            pick = self.rng.choices(range(len(remaining)), weights)[0]
+            ordered.append(remaining.pop(pick))
+        return ordered
+
+    def _ewma(self, provider_name: str, default: float) -> float:
+        stats = self._latency.get(provider_name)
+        return max(stats.ewma_ms, 1e-3) if stats and stats.ewma_ms else default
+
+    def _hedge_backup(self, chain: list[str], tried: set[str]) -> str | None:
+        if self.hedge is None:
+            return None
+        for name in chain:
+            if name not in tried and self._is_available(self._circuit(name)):
+                return name
+        return None
+
+    def _hedge_delay_ms(self, provider_name: str) -> float:
+        assert self.hedge is not None
+        stats = self._latency.get(provider_name)
+        if stats is None or stats.samples < self.hedge.min_samples:
+            return self.hedge.initial_delay_ms
+        delay = stats.quantile(self.hedge.quantile) or self.hedge.initial_delay_ms
+        return min(max(delay, self.hedge.min_delay_ms), self.hedge.max_delay_ms)
+
+    def latency(self, provider: str) -> LatencyStats | None:
+        """Observed latency (EWMA + quantiles) of a provider."""
+        return self._latency.get(provider)
+
+    @property
+    def hedge_stats(self) -> HedgeStats:
+        return self._hedge_stats
+
+    def _circuit(self, provider_name: str) -> CircuitState:
+        circuit = self._circuits.get(provider_name)
+        if circuit is None:
+            circuit = CircuitState()
+            self._circuits[provider_name] = circuit
+        return circuit
+
     def get_default_model(self, provider: str | None = None) -> str:
         """Get the default model for a provider."""
         name = provider or self.primary
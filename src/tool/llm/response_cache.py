@@ -0,0 +1,437 @@
+"""Opt-in LLM response cache: exact and semantic tiers, scoped per org.
+
+Task card: T2-5 (LLM response cache)
+- Wraps an LLMCallPort (or ModelRegistry) and serves repeated calls
+  without a provider round trip
+- Opt-in per call: only calls that pin parameters["temperature"] at or
+  below policy.max_temperature are cached; sampled calls always go through
+- Exact tier: blake2b of model, prompt, content blocks and parameters;
+  in-process LRU per org, optional shared tier through StoragePort (Redis)
+- Semantic tier (optional, needs an embedder): a miss is served by the
+  most similar cached prompt of the same org, model and parameters when
+  cosine similarity reaches policy.semantic_threshold (in-process only)
+- Scope: the org comes from src.shared.org_scope (set by the caller);
+  calls outside any org scope share the "-" scope
+- Invalidation: invalidate_org() drops one org; knowledge_changed()
+  rotates the knowledge generation, orphaning every cached answer, since
+  knowledge is inherited down the org tree. Shared entries are orphaned by
+  rotated generation tokens and expire by TTL. With a shared tier, local
+  entries remember the tokens they were stored under and are served only
+  while those are still current, so an invalidation on any worker
+  reaches every worker's LRU
+- ResponseCacheStats reports hit ratio and provider tokens saved
+
+A hit returns the cached text with tokens_used {"input": 0, "output": 0,
+"saved_input": n, "saved_output": m}: no provider tokens were spent, and
+usage metering records none.
+
+Architecture: delivery/phase2-runtime-config.yaml (llm section)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from src.ports.llm_call_port import LLMResponse
+from src.shared.org_scope import get_org_id
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.ports.llm_call_port import ContentBlock, LLMCallPort
+    from src.ports.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY_PREFIX = "llm:rc"
+_NO_ORG = "-"
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """When and for how long LLM responses are reused.
+
+    Attributes:
+        ttl_seconds: Lifetime of a cached response (local and shared tier).
+        max_temperature: Highest pinned temperature still considered
+            deterministic enough to cache.
+        semantic_threshold: Cosine similarity a cached prompt needs to
+            answer a different prompt; None disables the semantic tier.
+        max_entries_per_org: Responses kept in process per org (LRU).
+        max_orgs: Orgs kept in process before LRU eviction.
+        max_semantic_candidates: Most recent entries compared per lookup.
+    """
+
+    ttl_seconds: int = 600
+    max_temperature: float = 0.0
+    semantic_threshold: float | None = None
+    max_entries_per_org: int = 1024
+    max_orgs: int = 1000
+    max_semantic_candidates: int = 256
+
+    def __post_init__(self) -> None:
+        if self.ttl_seconds <= 0:
+            msg = f"ttl_seconds must be positive, got {self.ttl_seconds}"
+            raise ValueError(msg)
+        if self.semantic_threshold is not None and not 0 < self.semantic_threshold <= 1:
+            msg = f"semantic_threshold must be in (0, 1], got {self.semantic_threshold}"
+            raise ValueError(msg)
+        if min(self.max_entries_per_org, self.max_orgs, self.max_semantic_candidates) <= 0:
+            msg = (
+                "max_entries_per_org, max_orgs and max_semantic_candidates must be "
+                f"positive, got {self.max_entries_per_org}/{self.max_orgs}/"
+                f"{self.max_semantic_candidates}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters for response-cache effectiveness."""
+
+    lookups: int = 0  # cacheable calls
+    bypassed: int = 0  # sampled calls, never cached
+    exact_hits: int = 0  # served from the in-process LRU
+    shared_hits: int = 0  # served from the shared tier
+    semantic_hits: int = 0
+    invalidations: int = 0
+    saved_input_tokens: int = 0
+    saved_output_tokens: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.exact_hits + self.shared_hits + self.semantic_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of cacheable calls served without the provider (0.0 - 1.0)."""
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+
+@dataclass
+class _Entry:
+    response: LLMResponse
+    bucket: str  # model + parameters: semantic matches never cross buckets
+    expires_at: float
+    embedding: list[float] | None = None
+    scope: str = ""  # shared generation tokens at store time ("" without a shared tier)
+
+
+@dataclass
+class _OrgEntries:
+    generation: int = 0
+    entries: OrderedDict[str, _Entry] = field(default_factory=OrderedDict)
+
+
+class ResponseCache:
+    """Caching wrapper around an LLMCallPort-compatible caller.
+
+    Args:
+        inner: The LLM caller to wrap (adapter or ModelRegistry).
+        policy: Cacheability, TTL, semantic threshold and bounds.
+        embed: Text embedder for the semantic tier (required when
+            policy.semantic_threshold is set).
+        shared: Optional cross-worker tier (RedisStorageAdapter).
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        inner: LLMCallPort | Any,
+        *,
+        policy: ResponseCachePolicy | None = None,
+        embed: Callable[[str], list[float]] | None = None,
+        shared: StoragePort | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policy = policy or ResponseCachePolicy()
+        if self._policy.semantic_threshold is not None and embed is None:
+            msg = "semantic_threshold requires an embed function"
+            raise ValueError(msg)
+        self._inner = inner
+        self._embed = embed
+        self._shared = shared
+        self._clock = clock
+        self._orgs: OrderedDict[str, _OrgEntries] = OrderedDict()
+        self._stats = ResponseCacheStats()
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        return self._stats
+
+    async def call(
+        self,
+        prompt: str,
+        model_id: str = "",
+        content_parts: list[ContentBlock] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        """Serve from cache when possible, otherwise call through and store."""
+        if not self._cacheable(parameters):
+            self._stats.bypassed += 1
+            return await self._inner.call(
+                prompt=prompt,
+                model_id=model_id,
+                content_parts=content_parts,
+                parameters=parameters,
+            )
+
+        self._stats.lookups += 1
+        org = str(get_org_id() or _NO_ORG)
+        bucket = _bucket(model_id, parameters)
+        key = call_key(prompt, model_id, content_parts, parameters)
+        semantic_text = self._semantic_text(prompt, content_parts)
+        generation = self._org(org).generation
+        shared = self._shared
+        scope = await _shared_scope(shared, org) if shared is not None else ""
+
+        cached = self._local_get(org, key, scope)
+        if cached is not None:
+            self._stats.exact_hits += 1
+            return self._served(cached)
+
+        shared_key = f"{SHARED_KEY_PREFIX}:{org}:{scope}:{key}"
+        if shared is not None:
+            payload = await shared.get(shared_key)
+            if payload is not None:
+                response = _response_from_dict(payload)
+                self._store_local(org, generation, scope, key, bucket, response, None)
+                self._stats.shared_hits += 1
+                return self._served(response)
+
+        embedding = None
+        if semantic_text is not None and self._embed is not None:
+            embedding = _normalize(self._embed(semantic_text))
+            similar = self._nearest(org, bucket, embedding, scope)
+            if similar is not None:
+                self._stats.semantic_hits += 1
+                return self._served(similar)
+
+        response = await self._inner.call(
+            prompt=prompt,
+            model_id=model_id,
+            content_parts=content_parts,
+            parameters=parameters,
+        )
+        if response.finish_reason != "stop":
+            return response
+        self._store_local(org, generation, scope, key, bucket, response, embedding)
+        if shared is not None:
+            await shared.put(shared_key, _response_to_dict(response), ttl=self._policy.ttl_seconds)
+        return response
+
+    async def invalidate_org(self, org_id: UUID | None) -> None:
+        """Drop every cached response of one org, here and in the shared tier."""
+        self._stats.invalidations += 1
+        org = str(org_id or _NO_ORG)
+        entries = self._org(org)
+        entries.generation += 1
+        entries.entries.clear()
+        if self._shared is not None:
+            await self._shared.put(_generation_key(org), uuid4().hex)
+
+    async def knowledge_changed(self, org_id: UUID | None = None) -> None:
+        """Knowledge version moved: drop every cached response.
+
+        Knowledge written for one org is visible to its whole subtree, so
+        the cache cannot tell which orgs' answers went stale. org_id is
+        accepted for the KnowledgeWriteAdapter on_change hook.
+        """
+        self._stats.invalidations += 1
+        for entries in self._orgs.values():
+            entries.generation += 1
+            entries.entries.clear()
+        if self._shared is not None:
+            await self._shared.put(_generation_key(None), uuid4().hex)
+
+    def clear(self) -> None:
+        """Drop all process-local entries."""
+        self._orgs.clear()
+
+    def _cacheable(self, parameters: dict[str, Any] | None) -> bool:
+        temperature = (parameters or {}).get("temperature")
+        if temperature is None:
+            return False  # provider default temperature samples
+        return bool(float(temperature) <= self._policy.max_temperature)
+
+    def _semantic_text(self, prompt: str, content_parts: list[ContentBlock] | None) -> str | None:
+        if self._policy.semantic_threshold is None:
+            return None
+        if not content_parts:
+            return prompt
+        if any(block.type != "text" for block in content_parts):
+            return None  # media the embedder cannot see: exact matches only
+        return "\n".join(block.text for block in content_parts)
+
+    def _org(self, org: str) -> _OrgEntries:
+        entries = self._orgs.get(org)
+        if entries is None:
+            entries = _OrgEntries()
+            self._orgs[org] = entries
+            while len(self._orgs) > self._policy.max_orgs:
+                self._orgs.popitem(last=False)
+        self._orgs.move_to_end(org)
+        return entries
+
+    def _local_get(self, org: str, key: str, scope: str) -> LLMResponse | None:
+        # _org, not _orgs[org]: the org may have been evicted during an await
+        entries = self._org(org).entries
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock() or entry.scope != scope:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return entry.response
+
+    def _nearest(
+        self, org: str, bucket: str, embedding: list[float], scope: str
+    ) -> LLMResponse | None:
+        threshold = self._policy.semantic_threshold
+        if threshold is None:
+            return None
+        now = self._clock()
+        best_key, best_score = None, threshold
+        entries = self._org(org).entries
+        recent = itertools.islice(reversed(entries.items()), self._policy.max_semantic_candidates)
+        for key, entry in recent:
+            if entry.embedding is None or entry.bucket != bucket or entry.expires_at <= now:
+                continue
+            if entry.scope != scope:
+                continue
+            score = math.sumprod(embedding, entry.embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        entries.move_to_end(best_key)
+        return entries[best_key].response
+
+    def _store_local(
+        self,
+        org: str,
+        generation: int,
+        scope: str,
+        key: str,
+        bucket: str,
+        response: LLMResponse,
+        embedding: list[float] | None,
+    ) -> None:
+        org_entries = self._org(org)
+        if org_entries.generation != generation:
+            return  # invalidated while the call was in flight
+        entries = org_entries.entries
+        entries[key] = _Entry(
+            response=response,
+            bucket=bucket,
+            expires_at=self._clock() + self._policy.ttl_seconds,
+            embedding=embedding,
+            scope=scope,
+        )
+        entries.move_to_end(key)
+        while len(entries) > self._policy.max_entries_per_org:
+            entries.popitem(last=False)
+
+    def _served(self, response: LLMResponse) -> LLMResponse:
+        self._stats.saved_input_tokens += response.tokens_used.get("input", 0)
+        self._stats.saved_output_tokens += response.tokens_used.get("output", 0)
+        return reused(response)
+
+
+def call_key(
+    prompt: str,
+    model_id: str,
+    content_parts: list[ContentBlock] | None,
+    parameters: dict[str, Any] | None,
+) -> str:
+    """Digest identifying an LLM call: model, prompt, content blocks, parameters."""
+    return _digest([_bucket(model_id, parameters), prompt, _blocks(content_parts)])
+
+
+def reused(response: LLMResponse) -> LLMResponse:
+    """The response as seen by a caller that did not pay for it.
+
+    Input / output drop to zero (nothing to meter) and move to
+    saved_input / saved_output.
+    """
+    return LLMResponse(
+        text=response.text,
+        tokens_used={
+            "input": 0,
+            "output": 0,
+            "saved_input": response.tokens_used.get("input", 0),
+            "saved_output": response.tokens_used.get("output", 0),
+        },
+        model_id=response.model_id,
+        finish_reason=response.finish_reason,
+    )
+
+
+def _bucket(model_id: str, parameters: dict[str, Any] | None) -> str:
+    return _digest([model_id, json.dumps(parameters or {}, sort_keys=True, default=str)])
+
+
+def _blocks(content_parts: list[ContentBlock] | None) -> list[list[Any]]:
+    # The cache hint does not change the answer, so it stays out of the key
+    return [
+        [b.type, b.role, b.text, b.media_id, b.text_fallback, b.mime_type]
+        for b in content_parts or []
+    ]
+
+
+def _digest(parts: list[Any]) -> str:
+    raw = json.dumps(parts, ensure_ascii=False, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(math.sumprod(vector, vector))
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+async def _shared_scope(shared: StoragePort, org: str) -> str:
+    """Current knowledge and org generation tokens, created if missing."""
+    tokens = []
+    for generation_key in (_generation_key(None), _generation_key(org)):
+        token = await shared.get(generation_key)
+        if token is None:
+            token = uuid4().hex
+            await shared.put(generation_key, token)
+        tokens.append(token)
+    return f"{tokens[0]}:{tokens[1]}"
+
+
+def _generation_key(org: str | None) -> str:
+    return f"{SHARED_KEY_PREFIX}:gen:{org or 'knowledge'}"
+
+
+def _response_to_dict(response: LLMResponse) -> dict[str, Any]:
+    return {
+        "text": response.text,
+        "tokens_used": dict(response.tokens_used),
+        "model_id": response.model_id,
+        "finish_reason": response.finish_reason,
+    }
+
+
+def _response_from_dict(data: dict[str, Any]) -> LLMResponse:
+    return LLMResponse(
+        text=data["text"],
+        tokens_used={k: int(v) for k, v in data["tokens_used"].items()},
+        model_id=data["model_id"],
+        finish_reason=data["finish_reason"],
+    )
@@ -0,0 +1,267 @@
+"""Fair-queuing scheduler for LLM calls.
+
+Task card: T2-8 (LLM call scheduler)
+- Wraps ModelRegistry (any LLMCallPort-compatible caller) and bounds
+  concurrent provider calls globally and per model
+- Weighted fair queuing across orgs (start-time fair queuing): every org
+  is a flow weighted by its tier, so one org's bulk job gets its share of
+  the provider instead of all of it
+- Priority classes: queued "interactive" calls are always dispatched
+  before queued "batch" calls; each class has its own queue deadline
+- A call that cannot start before its deadline, or that arrives at a full
+  queue, fails fast with ServiceUnavailableError instead of piling up
+- SchedulerStats reports queue depth, running calls and queue-wait
+  quantiles per priority class
+- Org, tier and priority come from src.shared.org_scope (set by the caller)
+
+Architecture: delivery/phase2-runtime-config.yaml (llm section)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from src.shared.errors import ServiceUnavailableError
+from src.shared.org_scope import PRIORITIES, get_org_id, get_org_tier, get_priority
+from src.tool.llm.latency import LatencySketch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from src.ports.llm_call_port import ContentBlock, LLMCallPort, LLMResponse
+
+_NO_ORG = "-"
+
+DEFAULT_TIER_WEIGHTS: dict[str, float] = {
+    "platform": 4.0,
+    "brand_hq": 4.0,
+    "brand_dept": 2.0,
+    "regional_agent": 2.0,
+    "franchise_store": 1.0,
+}
+
+
+@dataclass(frozen=True)
+class SchedulerPolicy:
+    """Concurrency caps, fairness weights and queue limits.
+
+    Attributes:
+        max_concurrency: Provider calls in flight across all models.
+        model_concurrency: Per-model cap, keyed by model_id.
+        default_model_concurrency: Cap for models not listed in
+            model_concurrency; None leaves them bounded only globally.
+        tier_weights: Fair-share weight per org tier.
+        default_weight: Weight of orgs with an unknown or missing tier.
+        interactive_deadline_seconds: Longest queue wait of an
+            interactive call before it is rejected.
+        batch_deadline_seconds: Same for batch calls.
+        max_queue_depth: Queued calls (all classes) before new calls
+            are rejected outright.
+    """
+
+    max_concurrency: int = 32
+    model_concurrency: Mapping[str, int] = field(default_factory=dict)
+    default_model_concurrency: int | None = None
+    tier_weights: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_TIER_WEIGHTS))
+    default_weight: float = 1.0
+    interactive_deadline_seconds: float = 30.0
+    batch_deadline_seconds: float = 600.0
+    max_queue_depth: int = 1000
+
+    def __post_init__(self) -> None:
+        caps = [self.max_concurrency, self.max_queue_depth, *self.model_concurrency.values()]
+        if self.default_model_concurrency is not None:
+            caps.append(self.default_model_concurrency)
+        if min(caps) <= 0:
+            msg = f"concurrency caps and max_queue_depth must be positive, got {caps}"
+            raise ValueError(msg)
+        weights = [self.default_weight, *self.tier_weights.values()]
+        if min(weights) <= 0:
+            msg = f"tier weights must be positive, got {weights}"
+            raise ValueError(msg)
+        if min(self.interactive_deadline_seconds, self.batch_deadline_seconds) <= 0:
+            msg = (
+                "queue deadlines must be positive, got "
+                f"{self.interactive_deadline_seconds}/{self.batch_deadline_seconds}"
+            )
+            raise ValueError(msg)
+
+    def deadline(self, priority: str) -> float:
+        if priority == "batch":
+            return self.batch_deadline_seconds
+        return self.interactive_deadline_seconds
+
+    def model_cap(self, model_id: str) -> int | None:
+        return self.model_concurrency.get(model_id, self.default_model_concurrency)
+
+
+@dataclass
+class SchedulerStats:
+    """Counters and gauges for the LLM call scheduler."""
+
+    submitted: int = 0
+    immediate: int = 0  # started without waiting
+    rejected: int = 0  # queue full
+    expired: int = 0  # queue deadline exceeded
+    running: int = 0
+    depth: Counter[str] = field(default_factory=Counter)  # queued calls per priority
+    waits: dict[str, LatencySketch] = field(
+        default_factory=lambda: {p: LatencySketch(window=2048) for p in PRIORITIES}
+    )
+
+    def wait_ms(self, priority: str, q: float) -> float | None:
+        """Queue wait (ms) at quantile q for one priority class."""
+        return self.waits[priority].quantile(q)
+
+
+@dataclass(order=True)
+class _Waiter:
+    start: float  # virtual start tag
+    seq: int
+    model: str = field(compare=False)
+    priority: str = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+    granted: bool = field(default=False, compare=False)
+
+
+@dataclass
+class _ClassQueue:
+    heap: list[_Waiter] = field(default_factory=list)
+    virtual_time: float = 0.0
+    finish: dict[str, float] = field(default_factory=dict)  # last finish tag per org
+
+
+class LLMScheduler:
+    """Concurrency-capped, org-fair queue in front of an LLM caller.
+
+    Args:
+        inner: The LLM caller to schedule (ModelRegistry or adapter).
+        policy: Caps, weights, deadlines and queue bound.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        inner: LLMCallPort | Any,
+        *,
+        policy: SchedulerPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._policy = policy or SchedulerPolicy()
+        self._clock = clock
+        self._queues = {p: _ClassQueue() for p in PRIORITIES}
+        self._model_running: Counter[str] = Counter()
+        self._seq = 0
+        self._stats = SchedulerStats()
+
+    @property
+    def stats(self) -> SchedulerStats:
+        return self._stats
+
+    async def call(
+        self,
+        prompt: str,
+        model_id: str = "",
+        content_parts: list[ContentBlock] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        """Wait for a fair turn within the caps, then call through."""
+        await self._acquire(model_id, get_priority())
+        try:
+            return await self._inner.call(
+                prompt=prompt,
+                model_id=model_id,
+                content_parts=content_parts,
+                parameters=parameters,
+            )
+        finally:
+            self._release(model_id)
+
+    async def _acquire(self, model_id: str, priority: str) -> None:
+        self._stats.submitted += 1
+        if sum(self._stats.depth.values()) >= self._policy.max_queue_depth:
+            self._stats.rejected += 1
+            msg = f"LLM queue full ({self._policy.max_queue_depth} calls waiting)"
+            raise ServiceUnavailableError("llm", msg)
+
+        enqueued_at = self._clock()
+        waiter = self._enqueue(model_id, priority)
+        self._dispatch()
+        if waiter.granted:
+            self._stats.immediate += 1
+        else:
+            deadline = self._policy.deadline(priority)
+            try:
+                await asyncio.wait_for(waiter.future, timeout=deadline)
+            except TimeoutError:
+                self._abandon(waiter)
+                self._stats.expired += 1
+                msg = f"LLM call waited over {deadline:g}s in the {priority} queue"
+                raise ServiceUnavailableError("llm", msg) from None
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+        self._stats.waits[priority].observe((self._clock() - enqueued_at) * 1000)
+
+    def _enqueue(self, model_id: str, priority: str) -> _Waiter:
+        queue = self._queues[priority]
+        org = str(get_org_id() or _NO_ORG)
+        weight = self._policy.tier_weights.get(get_org_tier() or "", self._policy.default_weight)
+        start = max(queue.virtual_time, queue.finish.get(org, 0.0))
+        queue.finish[org] = start + 1.0 / weight
+        if len(queue.finish) > 2 * self._policy.max_queue_depth:
+            # Orgs whose finish tag is behind virtual time restart from it anyway
+            queue.finish = {o: f for o, f in queue.finish.items() if f > queue.virtual_time}
+
+        self._seq += 1
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(start, self._seq, model_id, priority, loop.create_future())
+        heapq.heappush(queue.heap, waiter)
+        self._stats.depth[priority] += 1
+        return waiter
+
+    def _dispatch(self) -> None:
+        """Grant free slots: interactive first, smallest start tag first."""
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            blocked: list[_Waiter] = []
+            while queue.heap and self._stats.running < self._policy.max_concurrency:
+                waiter = heapq.heappop(queue.heap)
+                if waiter.future.done():
+                    continue  # timed out or cancelled; _abandon settles it
+                cap = self._policy.model_cap(waiter.model)
+                if cap is not None and self._model_running[waiter.model] >= cap:
+                    blocked.append(waiter)
+                    continue
+                queue.virtual_time = waiter.start
+                self._grant(waiter)
+            for waiter in blocked:
+                heapq.heappush(queue.heap, waiter)
+
+    def _grant(self, waiter: _Waiter) -> None:
+        waiter.granted = True
+        self._stats.depth[waiter.priority] -= 1
+        self._stats.running += 1
+        self._model_running[waiter.model] += 1
+        waiter.future.set_result(None)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        if waiter.granted:
+            # Slot was handed over as the wait ended; give it back
+            self._release(waiter.model)
+        else:
+            self._stats.depth[waiter.priority] -= 1
+            waiter.future.cancel()
+
+    def _release(self, model_id: str) -> None:
+        self._stats.running -= 1
+        self._model_running[model_id] -= 1
+        if self._model_running[model_id] <= 0:
+            del self._model_running[model_id]
+        self._dispatch()
@@ -4,19 +4,39 @@ Task card: T2-3
 - Write prompt/completion tokens after each LLM call
 - Zero metering loss: every call recorded
 - Supports pre-check (budget) and post-settle
+- Running per-org counters and minute/hour/day rollups: O(1) summary and budget check
+- Monthly budgets are checked against the current UTC month's day rollups
+- Write-behind persistence to llm_usage_records / tool_usage_records in batches
+- LLM records carry brand, provider, price, skill and task when known
 
 Architecture: delivery/phase2-runtime-config.yaml (billing section)
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID, uuid4
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
 logger = logging.getLogger(__name__)
 
+# Rollup bucket width in seconds, per granularity
+ROLLUP_GRANULARITIES: dict[str, int] = {"minute": 60, "hour": 3600, "day": 86400}
+
+# Buckets kept per org and granularity: 24h of minutes, 30d of hours, ~13 months of days
+_DEFAULT_RETENTION: dict[str, int] = {"minute": 1440, "hour": 720, "day": 400}
+
+_TOOL_STATUSES = frozenset({"success", "error", "rate_limited"})
+
 
 @dataclass(frozen=True)
 class UsageRecord:
@@ -30,6 +50,28 @@ class UsageRecord:
     output_tokens: int
     total_tokens: int
     created_at: datetime
+    brand_id: UUID | None = None
+    provider: str | None = None
+    cost_amount: float | None = None
+    skill_id: str | None = None
+    task_id: str | None = None
+
+
+@dataclass(frozen=True)
+class ToolUsageRecord:
+    """A single tool call billing record (tool_usage_records row)."""
+
+    org_id: UUID
+    user_id: UUID
+    tool_name: str
+    tool_version: str
+    cost_amount: float
+    billing_unit: str
+    status: str
+    created_at: datetime
+    duration_ms: int | None = None
+    brand_id: UUID | None = None
+    skill_id: str | None = None
 
 
 @dataclass
@@ -41,19 +83,159 @@ class UsageSummary:
     total_output: int = 0
     total_tokens: int = 0
     record_count: int = 0
+    tool_calls: int = 0
+    tool_cost: float = 0.0
 
 
-class UsageTracker:
-    """In-memory usage tracker for unit testing.
+@dataclass
+class UsageBucket:
+    """Usage inside one rollup window [start, start + width)."""
+
+    start: datetime
+    input_tokens: int = 0
+    output_tokens: int = 0
+    record_count: int = 0
+    tool_calls: int = 0
+    tool_cost: float = 0.0
 
-    Production implementation uses llm_usage_records table via SQLAlchemy.
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class UsageWriterStats:
+    """Counters for the write-behind flusher."""
+
+    enqueued: int = 0
+    written: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0  # batch kept and retried on the next flush
+    dropped: int = 0  # pending queue overflowed or unwritten at close: reported as loss
+
+
+class UsageSink(Protocol):
+    """Durable store behind UsageTracker (PgUsageStore in production)."""
+
+    async def write_llm_usage(self, records: Sequence[UsageRecord]) -> None: ...
+
+    async def write_tool_usage(self, records: Sequence[ToolUsageRecord]) -> None: ...
+
+    async def load_org_totals(self) -> list[dict[str, Any]]: ...
+
+    async def load_day_totals(self, since: datetime) -> list[dict[str, Any]]: ...
+
+
+class UsageTracker:
+    """Usage tracker with running aggregates and optional write-behind.
+
+    record_usage / record_tool_usage update the org's running totals and
+    its minute/hour/day rollup buckets in place, so get_org_summary,
+    check_budget and get_usage_series never scan history. Only the last
+    recent_limit records per org are kept in memory. check_budget compares
+    the monthly budget with the current UTC month's day buckets.
+
+    With a sink, records are also queued and written in batches by a
+    background task (batch_size waiting or every flush_interval seconds).
+    A failed batch is put back at the head of the queue and retried, so an
+    outage delays writes instead of losing them; only overflow past
+    max_pending or records still unwritten at close() are dropped, and
+    those are reported to the MeteringLossTracker.
+
+    Without a sink the tracker is purely in-memory (unit tests, dev).
+    Call start() once the event loop is running and close() on shutdown.
+
+    With pricing / provider_of, an LLM record whose caller did not pass a
+    cost_amount / provider gets them from its model_id.
     """
 
-    def __init__(self) -> None:
-        self._records: dict[UUID, UsageRecord] = {}
-        self._by_org: dict[UUID, list[UUID]] = {}
-        self._by_user: dict[UUID, list[UUID]] = {}
+    def __init__(
+        self,
+        *,
+        sink: UsageSink | None = None,
+        loss_tracker: MeteringLossTracker | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 100_000,
+        recent_limit: int = 1000,
+        retention: dict[str, int] | None = None,
+        clock: Callable[[], float] = time.time,
+        pricing: Callable[[str, int, int], float] | None = None,
+        provider_of: Callable[[str], str | None] | None = None,
+    ) -> None:
+        if batch_size <= 0 or max_pending < batch_size:
+            msg = f"need 0 < batch_size <= max_pending, got {batch_size}/{max_pending}"
+            raise ValueError(msg)
+        self._sink = sink
+        self.loss_tracker = loss_tracker or MeteringLossTracker()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._recent_limit = recent_limit
+        self._retention = {**_DEFAULT_RETENTION, **(retention or {})}
+        self._clock = clock
+        self._pricing = pricing
+        self._provider_of = provider_of
+        self._totals: dict[UUID, UsageSummary] = {}
+        self._rollups: dict[tuple[UUID, str], deque[tuple[int, UsageBucket]]] = {}
+        self._recent: dict[UUID, deque[UsageRecord]] = {}
         self._budgets: dict[UUID, int] = {}
+        self._llm_queue: deque[UsageRecord] = deque()
+        self._tool_queue: deque[ToolUsageRecord] = deque()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+        self.stats = UsageWriterStats()
+
+    @property
+    def pending(self) -> int:
+        """Records queued but not yet persisted."""
+        return len(self._llm_queue) + len(self._tool_queue)
+
+    async def start(self) -> None:
+        """Seed running totals from the sink and start the flush loop (idempotent).
+
+        Lifetime totals seed the summaries; the current month's per-day
+        totals seed the day rollups the budget check reads. A failed seed is
+        logged and the tracker starts from zero; persisted history is still
+        intact and the next restart picks it up.
+        """
+        if self._sink is None or (self._task is not None and not self._task.done()):
+            return
+        month_start = datetime.fromtimestamp(_month_start(self._clock()), UTC)
+        try:
+            rows = await self._sink.load_org_totals()
+            days = await self._sink.load_day_totals(month_start)
+        except Exception:
+            logger.warning("Usage totals not seeded: sink read failed", exc_info=True)
+            rows, days = [], []
+        for row in rows:
+            summary = self._summary(row["org_id"])
+            summary.total_input += row["input_tokens"]
+            summary.total_output += row["output_tokens"]
+            summary.total_tokens += row["input_tokens"] + row["output_tokens"]
+            summary.record_count += row["record_count"]
+            summary.tool_calls += row.get("tool_calls", 0)
+            summary.tool_cost += row.get("tool_cost", 0.0)
+        for row in sorted(days, key=lambda r: r["day"]):
+            self._seed_day(row)
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="usage-writer")
+
+    async def close(self) -> None:
+        """Stop the flush loop, drain the queue and report anything left as lost."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+        while self._llm_queue:
+            self._lose(self._llm_queue.popleft(), "sink unavailable at shutdown")
+        while self._tool_queue:
+            self._lose(self._tool_queue.popleft(), "sink unavailable at shutdown")
 
     def record_usage(
         self,
@@ -63,12 +245,22 @@ class UsageTracker:
         model_id: str,
         input_tokens: int,
         output_tokens: int,
+        brand_id: UUID | None = None,
+        provider: str | None = None,
+        cost_amount: float | None = None,
+        skill_id: str | None = None,
+        task_id: str | None = None,
     ) -> UsageRecord:
         """Record token usage from an LLM call.
 
         Must be called after every successful LLM call.
         Zero metering loss: failures are logged, never silently dropped.
         """
+        if provider is None and self._provider_of is not None:
+            provider = self._provider_of(model_id)
+        if cost_amount is None and self._pricing is not None:
+            cost_amount = self._pricing(model_id, input_tokens, output_tokens)
+        now = self._clock()
         record = UsageRecord(
             id=uuid4(),
             org_id=org_id,
@@ -77,12 +269,29 @@ class UsageTracker:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=input_tokens + output_tokens,
-            created_at=datetime.now(UTC),
+            created_at=datetime.fromtimestamp(now, UTC),
+            brand_id=brand_id,
+            provider=provider,
+            cost_amount=cost_amount,
+            skill_id=skill_id,
+            task_id=task_id,
         )
 
-        self._records[record.id] = record
-        self._by_org.setdefault(org_id, []).append(record.id)
-        self._by_user.setdefault(user_id, []).append(record.id)
+        summary = self._summary(org_id)
+        summary.total_input += input_tokens
+        summary.total_output += output_tokens
+        summary.total_tokens += record.total_tokens
+        summary.record_count += 1
+        for bucket in self._buckets(org_id, now):
+            bucket.input_tokens += input_tokens
+            bucket.output_tokens += output_tokens
+            bucket.record_count += 1
+
+        recent = self._recent.get(org_id)
+        if recent is None:
+            recent = self._recent[org_id] = deque(maxlen=self._recent_limit)
+        recent.append(record)
+        self._enqueue(self._llm_queue, record)
 
         logger.debug(
             "Recorded usage: org=%s user=%s model=%s tokens=%d",
@@ -93,20 +302,68 @@ class UsageTracker:
         )
         return record
 
+    def record_tool_usage(
+        self,
+        *,
+        org_id: UUID,
+        user_id: UUID,
+        tool_name: str,
+        tool_version: str,
+        cost_amount: float,
+        billing_unit: str,
+        status: str = "success",
+        duration_ms: int | None = None,
+        brand_id: UUID | None = None,
+        skill_id: str | None = None,
+    ) -> ToolUsageRecord:
+        """Record one tool call for billing (separate from LLM tokens)."""
+        if status not in _TOOL_STATUSES:
+            msg = f"status must be one of {sorted(_TOOL_STATUSES)}, got {status!r}"
+            raise ValueError(msg)
+        now = self._clock()
+        record = ToolUsageRecord(
+            org_id=org_id,
+            user_id=user_id,
+            tool_name=tool_name,
+            tool_version=tool_version,
+            cost_amount=cost_amount,
+            billing_unit=billing_unit,
+            status=status,
+            created_at=datetime.fromtimestamp(now, UTC),
+            duration_ms=duration_ms,
+            brand_id=brand_id,
+            skill_id=skill_id,
+        )
+
+        summary = self._summary(org_id)
+        summary.tool_calls += 1
+        summary.tool_cost += cost_amount
+        for bucket in self._buckets(org_id, now):
+            bucket.tool_calls += 1
+            bucket.tool_cost += cost_amount
+        self._enqueue(self._tool_queue, record)
+        return record
+
     def get_org_summary(self, org_id: UUID) -> UsageSummary:
-        """Get aggregated usage summary for an organization."""
-        record_ids = self._by_org.get(org_id, [])
-        summary = UsageSummary(org_id=org_id)
-
-        for rid in record_ids:
-            record = self._records.get(rid)
-            if record:
-                summary.total_input += record.input_tokens
-                summary.total_output += record.output_tokens
-                summary.total_tokens += record.total_tokens
-                summary.record_count += 1
+        """Get aggregated usage summary for an organization (O(1) copy)."""
+        summary = self._totals.get(org_id)
+        return replace(summary) if summary else UsageSummary(org_id=org_id)
 
-        return summary
+    def get_usage_series(
+        self,
+        org_id: UUID,
+        granularity: str,
+        *,
+        since: datetime | None = None,
+    ) -> list[UsageBucket]:
+        """Rollup buckets for an org, oldest first; empty windows are omitted."""
+        if granularity not in ROLLUP_GRANULARITIES:
+            msg = f"granularity must be one of {sorted(ROLLUP_GRANULARITIES)}, got {granularity!r}"
+            raise ValueError(msg)
+        series = self._rollups.get((org_id, granularity), ())
+        cutoff = since.timestamp() if since else float("-inf")
+        width = ROLLUP_GRANULARITIES[granularity]
+        return [replace(bucket) for start, bucket in series if start + width > cutoff]
 
     def set_budget(self, org_id: UUID, monthly_tokens: int) -> None:
         """Set a monthly token budget for an organization."""
@@ -115,14 +372,17 @@ class UsageTracker:
     def check_budget(self, org_id: UUID, estimated_tokens: int) -> bool:
         """Pre-check: verify org has sufficient budget for estimated usage.
 
+        Usage is the current UTC month's, summed from the day rollups.
         Returns True if call should proceed, False if budget exceeded.
         """
         budget = self._budgets.get(org_id)
         if budget is None:
             return True  # No budget set = unlimited
 
-        summary = self.get_org_summary(org_id)
-        return (summary.total_tokens + estimated_tokens) <= budget
+        since = _month_start(self._clock())
+        series = self._rollups.get((org_id, "day"), ())
+        used = sum(bucket.total_tokens for start, bucket in series if start >= since)
+        return (used + estimated_tokens) <= budget
 
     def get_records_for_org(
         self,
@@ -130,13 +390,133 @@ class UsageTracker:
         *,
         limit: int | None = None,
     ) -> list[UsageRecord]:
-        """Get usage records for an org, newest first."""
-        record_ids = self._by_org.get(org_id, [])
-        records = [self._records[rid] for rid in reversed(record_ids) if rid in self._records]
+        """Get recent usage records for an org, newest first.
+
+        Only the last recent_limit records are held in memory; older
+        history lives in llm_usage_records.
+        """
+        records = list(reversed(self._recent.get(org_id, ())))
         if limit is not None:
             records = records[:limit]
         return records
 
+    async def flush(self) -> int:
+        """Write everything queued right now. Returns records written.
+
+        Stops at the first failed batch and puts it back at the head of
+        its queue, so the next flush retries it in order.
+        """
+        if self._sink is None:
+            return 0
+        async with self._flush_lock:
+            written, ok = await self._drain(self._llm_queue, self._sink.write_llm_usage)
+            if ok:
+                more, _ = await self._drain(self._tool_queue, self._sink.write_tool_usage)
+                written += more
+        return written
+
+    async def _drain(
+        self, queue: deque[Any], write: Callable[[list[Any]], Awaitable[None]]
+    ) -> tuple[int, bool]:
+        written = 0
+        while queue:
+            take = min(self._batch_size, len(queue))
+            batch = [queue.popleft() for _ in range(take)]
+            try:
+                await write(batch)
+            except Exception:
+                queue.extendleft(reversed(batch))
+                self.stats.failed_flushes += 1
+                logger.warning(
+                    "Usage batch of %d not written, will retry", len(batch), exc_info=True
+                )
+                return written, False
+            self.stats.written += len(batch)
+            self.stats.flushes += 1
+            written += len(batch)
+        return written, True
+
+    def _summary(self, org_id: UUID) -> UsageSummary:
+        summary = self._totals.get(org_id)
+        if summary is None:
+            summary = self._totals[org_id] = UsageSummary(org_id=org_id)
+        return summary
+
+    def _series(self, org_id: UUID, granularity: str) -> deque[tuple[int, UsageBucket]]:
+        series = self._rollups.get((org_id, granularity))
+        if series is None:
+            series = deque(maxlen=self._retention[granularity])
+            self._rollups[(org_id, granularity)] = series
+        return series
+
+    def _seed_day(self, row: dict[str, Any]) -> None:
+        """Add a persisted day total to the org's day bucket for that day."""
+        width = ROLLUP_GRANULARITIES["day"]
+        start = int(row["day"].timestamp() // width) * width
+        series = self._series(row["org_id"], "day")
+        bucket = next((b for s, b in series if s == start), None)
+        if bucket is None:
+            bucket = UsageBucket(start=datetime.fromtimestamp(start, UTC))
+            later = [i for i, (s, _) in enumerate(series) if s > start]
+            if not later:
+                series.append((start, bucket))
+            elif len(series) < self._retention["day"]:
+                series.insert(later[0], (start, bucket))
+            else:
+                return  # older than everything retained
+        bucket.input_tokens += row["input_tokens"]
+        bucket.output_tokens += row["output_tokens"]
+        bucket.record_count += row["record_count"]
+        bucket.tool_calls += row.get("tool_calls", 0)
+        bucket.tool_cost += row.get("tool_cost", 0.0)
+
+    def _buckets(self, org_id: UUID, now: float) -> list[UsageBucket]:
+        """Current bucket of each granularity, opening new ones as windows roll."""
+        buckets = []
+        for granularity, width in ROLLUP_GRANULARITIES.items():
+            start = int(now // width) * width
+            series = self._series(org_id, granularity)
+            # A late record (clock step back) folds into the newest bucket
+            if not series or start > series[-1][0]:
+                series.append((start, UsageBucket(start=datetime.fromtimestamp(start, UTC))))
+            buckets.append(series[-1][1])
+        return buckets
+
+    def _enqueue(self, queue: deque[Any], record: UsageRecord | ToolUsageRecord) -> None:
+        if self._sink is None:
+            return
+        if self.pending >= self._max_pending:
+            oldest = queue.popleft() if queue else record
+            self._lose(oldest, "write-behind queue full")
+            if oldest is record:
+                return
+        queue.append(record)
+        self.stats.enqueued += 1
+        if len(queue) >= self._batch_size:
+            self._wakeup.set()
+
+    def _lose(self, record: UsageRecord | ToolUsageRecord, reason: str) -> None:
+        self.stats.dropped += 1
+        self.loss_tracker.record_failure(
+            org_id=record.org_id,
+            user_id=record.user_id,
+            model_id=record.model_id if isinstance(record, UsageRecord) else record.tool_name,
+            reason=reason,
+        )
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+
+def _month_start(now: float) -> float:
+    """Epoch seconds of the first instant of now's UTC calendar month."""
+    moment = datetime.fromtimestamp(now, UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
+
 
 @dataclass
 class MeteringLossTracker:
@@ -11,6 +11,7 @@ from tests.fakes.session import (
     FakeScalarsResult,
     FakeSessionFactory,
 )
+from tests.fakes.storage import FakeStorage
 
 __all__ = [
     "FakeAsyncSession",
@@ -18,4 +19,5 @@ __all__ = [
     "FakeResult",
     "FakeScalarsResult",
     "FakeSessionFactory",
+    "FakeStorage",
 ]
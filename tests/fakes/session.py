@@ -25,7 +25,7 @@ _UNSET = object()
 class FakeResult:
     """Fake result from session.execute().
 
-    Supports .scalar_one(), .scalar_one_or_none(), .fetchall(), and .rowcount.
+    Supports .scalar_one(), .scalar_one_or_none(), .fetchall(), .fetchone(), and .rowcount.
     """
 
     def __init__(
@@ -52,6 +52,9 @@ class FakeResult:
     def fetchall(self) -> list[Any]:
         return list(self._fetchall_rows)
 
+    def fetchone(self) -> Any | None:
+        return self._fetchall_rows[0] if self._fetchall_rows else None
+
 
 class FakeScalarsResult:
     """Fake result from session.scalars().
@@ -82,6 +85,7 @@ class FakeAsyncSession:
         self.closed: bool = False
         self.close_count: int = 0
         self.execute_calls: list[Any] = []
+        self.scalars_calls: list[Any] = []
 
         self._execute_result: FakeResult | None = None
         self._execute_results_queue: list[FakeResult] = []
@@ -137,6 +141,7 @@ class FakeAsyncSession:
         return self._execute_result or FakeResult()
 
     async def scalars(self, statement: Any) -> FakeScalarsResult:
+        self.scalars_calls.append(statement)
         return self._scalars_result or FakeScalarsResult()
 
     # -- Async context manager protocol --
@@ -0,0 +1,41 @@
+"""Fake StoragePort for testing without Redis.
+
+Dict-backed key-value store; TTLs are recorded but never expire, so tests
+can assert on them deterministically.
+
+Usage:
+    storage = FakeStorage()
+    await storage.put("k", {"a": 1}, ttl=60)
+    assert storage.ttls["k"] == 60
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from typing import Any
+
+from src.ports.storage_port import StoragePort
+
+
+class FakeStorage(StoragePort):
+    """In-memory StoragePort implementation."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.put_count: int = 0
+
+    async def put(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+        self.put_count += 1
+
+    async def get(self, key: str) -> Any | None:
+        return self.data.get(key)
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+    async def list_keys(self, pattern: str) -> list[str]:
+        return [k for k in self.data if fnmatch.fnmatchcase(k, pattern)]
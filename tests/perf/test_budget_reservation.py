@@ -0,0 +1,121 @@
+"""Budget enforcement benchmark: pre-check + deduct vs reserve + settle.
+
+BUDGET_BENCH_CALLS concurrent calls (default 50) from one org, each
+~1100 prompt tokens with max_tokens 500, against a 20k-token budget. The
+provider takes 20ms and reports the prompt's tokens in / 400 out. Runs:
+
+- pre-check: check the budget is not exhausted, call, deduct actual
+  usage afterwards (what BudgetPreCheckMiddleware allows today)
+- reserved: BudgetGuard holds the estimate before the call and settles
+  the actual usage
+
+Reports tokens spent vs budget, calls admitted, estimate accuracy and
+the per-call overhead of estimating + reserving + settling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.infra.billing.budget import BudgetStatus, TokenBudgetManager
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.shared.errors import QuotaExceededError
+from src.shared.org_scope import org_scope
+from src.shared.tokens import TokenCounter
+from src.tool.llm.budget_guard import BudgetGuard, PromptTokenEstimator
+
+_CALLS = int(os.environ.get("BUDGET_BENCH_CALLS", "50"))
+_BUDGET = 20_000
+_COUNTER = TokenCounter()
+_PROMPT = "Summarise the quarterly sales report for the franchise stores. " * 95
+_PARAMS = {"max_tokens": 500}
+
+
+class _Provider(LLMCallPort):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        usage = {"input": _COUNTER.count(prompt), "output": 400}
+        return LLMResponse(text="summary", tokens_used=usage, model_id=model_id)
+
+
+async def _precheck() -> tuple[int, int]:
+    manager, provider = TokenBudgetManager(), _Provider()
+    budget = manager.create_budget(uuid4(), _BUDGET)
+
+    async def one() -> None:
+        if manager.check_budget(budget.id).status == BudgetStatus.EXHAUSTED:
+            return
+        response = await provider.call(_PROMPT, "gpt-4o", parameters=_PARAMS)
+        tokens = response.tokens_used["input"] + response.tokens_used["output"]
+        # Usage already happened: charge it whatever the balance (zero-error billing)
+        budget.used_tokens += tokens
+
+    await asyncio.gather(*(one() for _ in range(_CALLS)))
+    return budget.used_tokens, provider.calls
+
+
+async def _reserved() -> tuple[int, int, BudgetGuard]:
+    manager, provider = TokenBudgetManager(), _Provider()
+    org_id = uuid4()
+    budget = manager.create_budget(org_id, _BUDGET)
+    guard = BudgetGuard(
+        provider,
+        ledger=manager,
+        resolve_budget={org_id: budget.id}.get,
+        estimator=PromptTokenEstimator(_COUNTER),
+    )
+
+    async def one() -> None:
+        with org_scope(org_id), contextlib.suppress(QuotaExceededError):
+            await guard.call(_PROMPT, "gpt-4o", parameters=_PARAMS)
+
+    await asyncio.gather(*(one() for _ in range(_CALLS)))
+    return budget.used_tokens, provider.calls, guard
+
+
+async def _overhead_us(rounds: int = 2000) -> float:
+    manager = TokenBudgetManager()
+    org_id = uuid4()
+    budget = manager.create_budget(org_id, 10**12)
+    estimator = PromptTokenEstimator(_COUNTER)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        hold = await manager.reserve(budget.id, estimator.estimate(_PROMPT, parameters=_PARAMS))
+        await manager.settle(hold, 1900)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+@pytest.mark.perf
+class TestBudgetReservation:
+    @pytest.mark.asyncio()
+    async def test_reservation_prevents_overdraw(self) -> None:
+        pre_used, pre_calls = await _precheck()
+        res_used, res_calls, guard = await _reserved()
+        overhead = await _overhead_us()
+        accuracy = guard.stats.estimated_tokens / max(guard.stats.actual_tokens, 1)
+
+        print(
+            f"\n{_CALLS} concurrent calls, {_BUDGET} token budget:"
+            f"\n  pre-check  admitted {pre_calls:3d}  spent {pre_used:7d}"
+            f" ({pre_used / _BUDGET:.0%} of budget)"
+            f"\n  reserved   admitted {res_calls:3d}  spent {res_used:7d}"
+            f" ({res_used / _BUDGET:.0%} of budget), rejected {guard.stats.rejected}"
+            f"\n  estimate / actual {accuracy:.2f}; estimate + reserve + settle"
+            f" {overhead:.1f}us per call"
+        )
+
+        assert pre_used > _BUDGET * 2  # every call passed the pre-check
+        assert res_used <= _BUDGET
+        assert res_calls == _BUDGET // (guard.stats.estimated_tokens // res_calls)
+        assert accuracy >= 1.0  # estimates lean high
+        assert overhead < 1000
@@ -0,0 +1,233 @@
+"""Context compaction benchmark: prompt tokens, cost and prefix stability.
+
+Replays CONTEXT_COMPACTION_BENCH_TURNS turns (default 30) through
+ContextAssembler: plain, with ContextCompactor, and with the compactor
+also deduplicating against history. The workload
+mirrors what a long shopping session retrieves: the same preferences
+written by several sessions (near-duplicates), knowledge chunks that
+restate those facts alongside new ones, assistant replies quoting them,
+and retrieval ranks that jitter every turn while the retrieved set
+drifts slowly.
+
+Reports prompt tokens (system prompt + history, counted by TokenCounter),
+how much of each system prompt is a byte-identical prefix of the previous
+turn's (what a provider prompt cache can reuse), input cost at ASSUMED
+prices with that prefix billed as cached, and assemble latency p50/p99.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.brain.context.compaction import CompactionPolicy, ContextCompactor
+from src.brain.engine.context_assembler import ContextAssembler
+from src.ports.knowledge_port import KnowledgePort
+from src.ports.memory_core_port import MemoryCorePort
+from src.shared.tokens import TokenCounter
+from src.shared.types import (
+    KnowledgeBundle,
+    MemoryItem,
+    Observation,
+    OrganizationContext,
+    PromotionReceipt,
+    WriteReceipt,
+)
+
+_TURNS = int(os.environ.get("CONTEXT_COMPACTION_BENCH_TURNS", "30"))
+# Assumed prices for illustration, not quotes: cached prefix tokens at 10%
+_USD_PER_M_INPUT = 2.50
+_USD_PER_M_CACHED = 0.25
+
+_FACTS = [
+    "The customer prefers relaxed fit linen shirts in size M.",
+    "Delivery before Friday matters more than price to them.",
+    "They returned a cotton blazer because the sleeves were short.",
+    "Their usual store is the Hangzhou West Lake flagship.",
+    "They avoid polyester blends because of skin irritation.",
+    "Navy and off-white are their preferred colours.",
+    "They are a gold tier member with free express shipping.",
+    "Budget for summer shirts is around 400 yuan each.",
+]
+_CATALOG = [
+    "Linen shirts ship within 3 business days from the regional warehouse.",
+    "Relaxed fit runs half a size large compared with the slim fit line.",
+    "Gold tier members get free express shipping on every order.",
+    "Cotton blazers come in regular and long sleeve lengths.",
+    "The Hangzhou West Lake flagship offers same-day alterations.",
+    "Pure linen pieces contain no polyester or elastane.",
+]
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _p(values: list[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+
+def _jitter(ranked: list[Any], turn: int) -> list[Any]:
+    """Swap two neighbouring ranks, as relevance scores shift between queries."""
+    ranked = list(ranked)
+    i = turn % (len(ranked) - 1)
+    ranked[i], ranked[i + 1] = ranked[i + 1], ranked[i]
+    return ranked
+
+
+def _memories() -> list[MemoryItem]:
+    user_id = uuid4()
+    items = []
+    for i, fact in enumerate(_FACTS):
+        # Each preference was extracted by two sessions, worded slightly differently
+        for variant, content in enumerate((fact, fact.replace(".", "!").lower())):
+            items.append(
+                MemoryItem(
+                    memory_id=uuid4(),
+                    user_id=user_id,
+                    memory_type="preference",
+                    content=content,
+                    valid_at=_T0 + timedelta(days=2 * i + variant),
+                )
+            )
+    return items
+
+
+def _knowledge() -> list[dict[str, Any]]:
+    chunks = []
+    for i, entry in enumerate(_CATALOG):
+        # Chunks restate a customer fact next to catalog facts
+        chunks.append({"id": f"kb-{i}", "content": f"{entry} {_FACTS[i % len(_FACTS)]}"})
+    return chunks
+
+
+class RotatingMemoryCore(MemoryCorePort):
+    """Retrieved set drifts every 5 turns; neighbouring ranks swap each turn."""
+
+    def __init__(self, items: list[MemoryItem]) -> None:
+        self._items = items
+        self.turn = 0
+
+    async def read_personal_memories(
+        self, user_id: UUID, query: str, top_k: int = 10, *, org_id: UUID | None = None
+    ) -> list[MemoryItem]:
+        shift = (self.turn // 5) % len(self._items)
+        ranked = (self._items[shift:] + self._items[:shift])[:top_k]
+        return _jitter(ranked, self.turn)
+
+    async def write_observation(
+        self, user_id: UUID, observation: Observation, *, org_id: UUID | None = None
+    ) -> WriteReceipt:
+        return WriteReceipt(memory_id=uuid4(), version=1, written_at=datetime.now(UTC))
+
+    async def get_session(self, session_id: UUID) -> object:
+        return None
+
+    async def archive_session(self, session_id: UUID) -> object:
+        return None
+
+    async def promote_to_knowledge(
+        self,
+        memory_id: UUID,
+        target_org_id: UUID,
+        target_visibility: str,
+        *,
+        user_id: UUID | None = None,
+    ) -> PromotionReceipt:
+        return PromotionReceipt(
+            proposal_id=memory_id,
+            source_memory_id=memory_id,
+            target_knowledge_id=None,
+            status="promoted",
+            promoted_at=datetime.now(UTC),
+        )
+
+
+class RotatingKnowledge(KnowledgePort):
+    def __init__(self, chunks: list[dict[str, Any]], memory: RotatingMemoryCore) -> None:
+        self._chunks = chunks
+        self._memory = memory
+
+    async def resolve(self, profile_id, query, org_context):
+        return KnowledgeBundle(semantic_contents=_jitter(self._chunks, self._memory.turn))
+
+    async def capabilities(self):
+        return {"semantic_search"}
+
+
+async def _replay(compactor: ContextCompactor | None) -> dict[str, Any]:
+    memory = RotatingMemoryCore(_memories())
+    assembler = ContextAssembler(
+        memory_core=memory,
+        knowledge=RotatingKnowledge(_knowledge(), memory),
+        compactor=compactor,
+    )
+    counter = TokenCounter()
+    user_id = uuid4()
+    org = OrganizationContext(
+        user_id=user_id, org_id=uuid4(), org_tier="brand_hq", org_path="root.brand"
+    )
+    history: list[dict[str, Any]] = []
+    tokens = cached = 0
+    latencies: list[float] = []
+    prefix_shares: list[float] = []
+    previous = ""
+    for turn in range(_TURNS):
+        memory.turn = turn
+        query = f"Turn {turn}: what should I buy for the trip?"
+        start = time.perf_counter()
+        ctx = await assembler.assemble(
+            user_id=user_id, query=query, org_context=org, conversation_history=history[-10:]
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        tokens += counter.count(ctx.system_prompt)
+        tokens += sum(counter.count(m["content"]) for m in history[-10:])
+        if previous:
+            shared = os.path.commonprefix([previous, ctx.system_prompt])  # noqa: RUF071
+            prefix_shares.append(len(shared) / len(ctx.system_prompt))
+            cached += counter.count(shared)
+        previous = ctx.system_prompt
+        history.append({"role": "user", "content": query})
+        history.append(
+            {"role": "assistant", "content": f"Noted. {_FACTS[turn % len(_FACTS)]} Option {turn}."}
+        )
+    return {
+        "tokens": tokens,
+        "usd": ((tokens - cached) * _USD_PER_M_INPUT + cached * _USD_PER_M_CACHED) / 1e6,
+        "p50": _p(latencies, 50),
+        "p99": _p(latencies, 99),
+        "prefix": statistics.mean(prefix_shares),
+        "backend": counter.backend,
+    }
+
+
+@pytest.mark.perf
+class TestContextCompaction:
+    @pytest.mark.asyncio()
+    async def test_compaction_saves_tokens_and_keeps_prefix(self, perf_threshold_ms: int) -> None:
+        runs = {
+            "plain": await _replay(None),
+            "compacted": await _replay(ContextCompactor()),
+            "+history": await _replay(
+                ContextCompactor(CompactionPolicy(dedup_against_history=True))
+            ),
+        }
+
+        lines = [f"\n{_TURNS} turns, tokens via {runs['plain']['backend']}:"]
+        for name, run in runs.items():
+            saved = 1 - run["tokens"] / runs["plain"]["tokens"]
+            lines.append(
+                f"  {name:<10} {run['tokens']:>6,} tokens ({saved:.1%} saved), "
+                f"${run['usd']:.5f}, stable prefix {run['prefix']:.0%}, "
+                f"assemble p50 {run['p50']:.3f}ms p99 {run['p99']:.3f}ms"
+            )
+        print("\n".join(lines))
+
+        plain, compacted = runs["plain"], runs["compacted"]
+        assert compacted["tokens"] < plain["tokens"] * 0.95
+        assert compacted["prefix"] >= plain["prefix"]
+        assert compacted["usd"] < plain["usd"]
+        assert compacted["p99"] < perf_threshold_ms
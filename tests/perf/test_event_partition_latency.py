@@ -0,0 +1,135 @@
+"""conversation_events partitioning benchmark: hot-tier latency vs total volume.
+
+Spreads CONVERSATION_EVENTS_BENCH_TOTAL events over 24 monthly partitions,
+runs the archiver with a 3-month hot window, then measures p50/p99 for
+hot-tier inserts, hot session reads and archived session page-ins
+(gzip JSONL through StoragePort). With monthly partitions the hot tier
+holds only hot_months of data, so its insert/read cost tracks the monthly
+volume instead of the table's total: at 100M total events over 24 months
+PostgreSQL keeps ~12.5M hot rows and prunes every read to one or two
+partitions.
+
+The in-process run models partition routing and the archive path, not
+PostgreSQL I/O. Set CONVERSATION_EVENTS_BENCH_TOTAL to scale it.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.memory.event_archive import (
+    EventArchive,
+    EventArchiver,
+    InMemoryEventPartitions,
+    add_months,
+)
+from src.memory.events import ConversationEvent
+from tests.fakes import FakeStorage
+
+_TOTAL = int(os.environ.get("CONVERSATION_EVENTS_BENCH_TOTAL", "200000"))
+_MONTHS = 24
+_HOT_MONTHS = 3
+_EVENTS_PER_SESSION = 20
+_NOW = datetime(2026, 12, 15, tzinfo=UTC)
+_SAMPLES = 500
+
+
+def _p(values: list[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+
+def _session_events(session_id, month: date, start_seq: int = 1) -> list[ConversationEvent]:
+    org_id = uuid4()
+    base = datetime(month.year, month.month, 1, tzinfo=UTC)
+    return [
+        ConversationEvent(
+            id=uuid4(),
+            org_id=org_id,
+            session_id=session_id,
+            user_id=None,
+            event_type="user_message" if seq % 2 else "assistant_message",
+            role="user" if seq % 2 else "assistant",
+            content={"text": f"turn {seq} about linen shirts and delivery windows"},
+            sequence_number=seq,
+            created_at=base + timedelta(minutes=seq),
+        )
+        for seq in range(start_seq, start_seq + _EVENTS_PER_SESSION)
+    ]
+
+
+@pytest.mark.perf
+class TestEventPartitionLatency:
+    @pytest.mark.asyncio
+    async def test_hot_tier_stays_bounded_and_archive_pages_in(
+        self, perf_threshold_ms: int
+    ) -> None:
+        current = date(_NOW.year, _NOW.month, 1)
+        months = [add_months(current, -i) for i in range(_MONTHS)]
+        partitions = InMemoryEventPartitions()
+        for month in months:
+            await partitions.ensure_partition(month)
+
+        sessions_by_month: dict[date, list] = {m: [] for m in months}
+        n_sessions = _TOTAL // _EVENTS_PER_SESSION
+        for i in range(n_sessions):
+            month = months[i % _MONTHS]
+            session_id = uuid4()
+            sessions_by_month[month].append(session_id)
+            for event in _session_events(session_id, month):
+                partitions.insert(event)
+
+        archive = EventArchive(FakeStorage(), compresslevel=1)
+        archiver = EventArchiver(
+            partitions, archive, hot_months=_HOT_MONTHS, premake_months=1, clock=lambda: _NOW
+        )
+        start = time.perf_counter()
+        report = await archiver.run()
+        archive_seconds = time.perf_counter() - start
+
+        hot_months = months[:_HOT_MONTHS]
+        cold_months = months[_HOT_MONTHS:]
+        hot_sessions = [s for m in hot_months for s in sessions_by_month[m]][:_SAMPLES]
+        cold_sessions = [s for m in cold_months for s in sessions_by_month[m]][:_SAMPLES]
+
+        insert_ms: list[float] = []
+        for _ in range(_SAMPLES // 5):
+            events = _session_events(uuid4(), current)
+            t0 = time.perf_counter()
+            for event in events:
+                partitions.insert(event)
+            insert_ms.append((time.perf_counter() - t0) * 1000 / len(events))
+
+        hot_ms: list[float] = []
+        for s in hot_sessions:
+            t0 = time.perf_counter()
+            assert len(partitions.session_events(s)) == _EVENTS_PER_SESSION
+            hot_ms.append((time.perf_counter() - t0) * 1000)
+
+        cold_ms: list[float] = []
+        for s in cold_sessions:
+            t0 = time.perf_counter()
+            assert len(await archive.read_session(s)) == _EVENTS_PER_SESSION
+            cold_ms.append((time.perf_counter() - t0) * 1000)
+
+        hot_rows = partitions.row_count()
+        print(
+            f"\n{_TOTAL:,} events / {_MONTHS} months: archived {report.events:,} events "
+            f"({len(report.months_archived)} months) in {archive_seconds:.2f}s "
+            f"({report.events / archive_seconds:,.0f} events/s); hot rows {hot_rows:,}\n"
+            f"insert/event p50 {_p(insert_ms, 50):.4f}ms p99 {_p(insert_ms, 99):.4f}ms; "
+            f"hot read p50 {_p(hot_ms, 50):.3f}ms p99 {_p(hot_ms, 99):.3f}ms; "
+            f"archived read p50 {_p(cold_ms, 50):.3f}ms p99 {_p(cold_ms, 99):.3f}ms"
+        )
+
+        assert report.partitions_dropped == _MONTHS - _HOT_MONTHS
+        assert len(await partitions.list_partitions()) == _HOT_MONTHS + 1
+        expected_hot = sum(len(sessions_by_month[m]) for m in hot_months) * _EVENTS_PER_SESSION
+        assert hot_rows == expected_hot + len(insert_ms) * _EVENTS_PER_SESSION
+        assert report.events == _TOTAL - expected_hot - _TOTAL % _EVENTS_PER_SESSION
+        assert _p(cold_ms, 99) < perf_threshold_ms
@@ -0,0 +1,99 @@
+"""Batch evolution benchmark: completed sessions through BatchEvolutionRunner.
+
+Builds a stream of sessions over 500 users where most facts repeat across
+a user's sessions, then runs it through the batch runner (windowed
+aggregation + bulk writes) and, for comparison, the per-session
+EvolutionPipeline.process_session loop. Reports sessions/sec for both and
+the number of writes versus per-session observations.
+
+Set EVOLUTION_BENCH_SESSIONS to shrink the run locally.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.memory.evolution.batch import (
+    BatchEvolutionRunner,
+    CompletedSession,
+    EvolutionWrite,
+)
+from src.memory.evolution.pipeline import EvolutionPipeline
+from tests.fakes import FakeStorage
+
+_SESSIONS = int(os.environ.get("EVOLUTION_BENCH_SESSIONS", "50000"))
+_USERS = 500
+_TEXTS = [
+    "I prefer linen shirts in summer",
+    "I live in Hangzhou near the lake",
+    "Can you check the order status?",
+    "My favorite colour is navy",
+    "What time do you open tomorrow?",
+    "I work night shifts so deliver after 6pm",
+]
+
+
+class _CountingWriter:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.rows = 0
+
+    async def write_many(self, writes: list[EvolutionWrite]) -> int:
+        self.calls += 1
+        self.rows += len(writes)
+        return len(writes)
+
+
+def _stream() -> list[CompletedSession]:
+    org_id = uuid4()
+    users = [uuid4() for _ in range(_USERS)]
+    return [
+        CompletedSession(
+            session_id=uuid4(),
+            org_id=org_id,
+            user_id=users[i % _USERS],
+            messages=[
+                {"role": "user", "content": _TEXTS[i % len(_TEXTS)]},
+                {"role": "assistant", "content": "Noted, thank you!"},
+                {"role": "user", "content": _TEXTS[(i // _USERS) % len(_TEXTS)]},
+            ],
+        )
+        for i in range(_SESSIONS)
+    ]
+
+
+@pytest.mark.perf
+class TestEvolutionBatchThroughput:
+    @pytest.mark.asyncio
+    async def test_batch_runner_beats_per_session_loop(self) -> None:
+        sessions = _stream()
+        writer = _CountingWriter()
+        runner = BatchEvolutionRunner(
+            writer, checkpoints=FakeStorage(), window_size=5000, concurrency=4
+        )
+
+        report = await runner.run("bench", sessions)
+
+        pipeline = EvolutionPipeline()
+        start = time.perf_counter()
+        per_session = 0
+        for s in sessions:
+            per_session += len(await pipeline.process_session(s.session_id, s.messages))
+        serial_rate = len(sessions) / (time.perf_counter() - start)
+
+        print(
+            f"\nbatch: {report.sessions} sessions in {report.elapsed_seconds:.2f}s "
+            f"({report.sessions_per_second:,.0f} sessions/s), {writer.rows} writes in "
+            f"{writer.calls} inserts; per-session loop: {serial_rate:,.0f} sessions/s, "
+            f"{per_session} results"
+        )
+
+        assert report.completed is True
+        assert report.sessions == _SESSIONS
+        assert writer.rows < per_session  # repeats folded per user and window
+        assert writer.calls <= writer.rows // 500 + report.windows
+        assert report.sessions_per_second > serial_rate
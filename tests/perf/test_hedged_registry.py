@@ -0,0 +1,105 @@
+"""Hedged ModelRegistry benchmark: tail latency with a slow-but-alive primary.
+
+Simulates HEDGE_BENCH_CALLS calls (default 300, 10 concurrent) against a
+primary that answers in ~20ms but stalls for 400ms on 8% of calls (never
+failing, so the circuit breaker never trips), with an equivalent backup
+at a steady ~30ms. Latencies are simulated with asyncio.sleep. Runs:
+
+- ordered: the existing fallback chain
+- hedged: HedgePolicy (backup started after the primary's p95)
+- hedged + routing: hedging plus latency-weighted routing among the two
+
+Reports p50 / p99 / max latency and the share of calls hedged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import statistics
+import time
+
+import pytest
+
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.tool.llm.model_registry import HedgePolicy, ModelRegistry, ProviderConfig
+
+_CALLS = int(os.environ.get("HEDGE_BENCH_CALLS", "300"))
+_CONCURRENCY = 10
+
+
+class _SimulatedProviders(LLMCallPort):
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)  # noqa: S311
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        if model_id == "primary":
+            stalled = self._rng.random() < 0.08
+            delay = 0.4 if stalled else self._rng.uniform(0.015, 0.025)
+        else:
+            delay = self._rng.uniform(0.025, 0.035)
+        await asyncio.sleep(delay)
+        return LLMResponse(text="ok", tokens_used={"input": 100, "output": 10}, model_id=model_id)
+
+
+def _registry(hedge: HedgePolicy | None, routing: bool) -> ModelRegistry:
+    return ModelRegistry(
+        adapter=_SimulatedProviders(seed=11),
+        primary="primary",
+        fallback_chain=["backup"],
+        providers={
+            name: ProviderConfig(
+                name=name, models=[name], default_model=name, equivalence="gpt-4o-class"
+            )
+            for name in ("primary", "backup")
+        },
+        hedge=hedge,
+        latency_routing=routing,
+        rng=random.Random(11),  # noqa: S311
+    )
+
+
+async def _run(registry: ModelRegistry) -> dict[str, float]:
+    latencies: list[float] = []
+    gate = asyncio.Semaphore(_CONCURRENCY)
+
+    async def one() -> None:
+        async with gate:
+            start = time.perf_counter()
+            await registry.call("Where is my order?")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(_CALLS)))
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": cuts[49],
+        "p99": cuts[98],
+        "max": max(latencies),
+        "hedged": registry.hedge_stats.hedges / _CALLS,
+    }
+
+
+@pytest.mark.perf
+class TestHedgedRegistry:
+    @pytest.mark.asyncio()
+    async def test_hedging_cuts_tail_latency(self) -> None:
+        policy = HedgePolicy(initial_delay_ms=60, min_samples=20, budget_ratio=0.15)
+        runs = {
+            "ordered": await _run(_registry(None, routing=False)),
+            "hedged": await _run(_registry(policy, routing=False)),
+            "hedged+routing": await _run(_registry(policy, routing=True)),
+        }
+
+        lines = [f"\n{_CALLS} calls, primary stalls 400ms on 8% of calls:"]
+        for name, run in runs.items():
+            lines.append(
+                f"  {name:<15} p50 {run['p50']:6.1f}ms  p99 {run['p99']:6.1f}ms  "
+                f"max {run['max']:6.1f}ms  hedged {run['hedged']:5.1%}"
+            )
+        print("\n".join(lines))
+
+        ordered, hedged = runs["ordered"], runs["hedged"]
+        assert hedged["p99"] < ordered["p99"] * 0.5
+        assert hedged["hedged"] <= policy.budget_ratio + 10 / _CALLS  # budget + initial burst
+        assert runs["hedged+routing"]["p99"] < ordered["p99"] * 0.5
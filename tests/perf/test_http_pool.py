@@ -0,0 +1,116 @@
+"""Pooled HTTP transport benchmark: per-call clients vs HttpClientPool.
+
+Sends HTTP_POOL_BENCH_REQUESTS requests (default 200, 8 in flight) to a
+local stub server that charges 5ms per new connection (standing in for
+the TCP + TLS handshake of a remote API) and 1ms per request:
+
+- per-call: a fresh httpx.AsyncClient per request, as backends do today
+- pooled:   the shared client from HttpClientPool (keep-alive + DNS cache)
+
+Reports p50/p99 latency, connection reuse ratio and DNS lookups.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from src.tool.http.pool import HttpClientPool, HttpPoolPolicy
+
+_REQUESTS = int(os.environ.get("HTTP_POOL_BENCH_REQUESTS", "200"))
+_IN_FLIGHT = 8
+_HANDSHAKE_SECONDS = 0.005
+_SERVICE_SECONDS = 0.001
+
+
+class _SlowHandshakeServer:
+    def __init__(self) -> None:
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(_HANDSHAKE_SECONDS)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                await asyncio.sleep(_SERVICE_SECONDS)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _drive(send) -> list[float]:
+    latencies: list[float] = []
+    gate = asyncio.Semaphore(_IN_FLIGHT)
+
+    async def one() -> None:
+        async with gate:
+            start = time.perf_counter()
+            response = await send()
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+
+    await asyncio.gather(*(one() for _ in range(_REQUESTS)))
+    return sorted(latencies)
+
+
+def _pct(latencies: list[float], q: float) -> float:
+    return latencies[min(int(q * len(latencies)), len(latencies) - 1)]
+
+
+@pytest.mark.perf
+class TestHttpPool:
+    @pytest.mark.asyncio()
+    async def test_pooled_client_latency(self) -> None:
+        server = _SlowHandshakeServer()
+        port = await server.start()
+        url = f"http://localhost:{port}/v1/search"
+        try:
+
+            async def per_call() -> httpx.Response:
+                async with httpx.AsyncClient() as client:
+                    return await client.get(url)
+
+            fresh = await _drive(per_call)
+            fresh_connections = server.connections
+
+            pool = HttpClientPool(HttpPoolPolicy(http2=False))
+            client = pool.client("web_search")
+            await client.get(url)  # warm: first connection + DNS answer
+            pooled = await _drive(lambda: client.get(url))
+            stats = pool.stats()
+            await pool.aclose()
+        finally:
+            await server.stop()
+
+        print(
+            f"\n{_REQUESTS} requests, {_IN_FLIGHT} in flight,"
+            f" {_HANDSHAKE_SECONDS * 1000:.0f}ms connection setup:"
+            f"\n  per-call client  p50 {_pct(fresh, 0.5):6.2f}ms  p99 {_pct(fresh, 0.99):6.2f}ms"
+            f"  connections {fresh_connections}"
+            f"\n  pooled client    p50 {_pct(pooled, 0.5):6.2f}ms  p99 {_pct(pooled, 0.99):6.2f}ms"
+            f"  connections {stats.connections}  reuse {stats.reuse_ratio:.1%}"
+            f"  dns lookups {stats.dns_lookups} (hits {stats.dns_hits})"
+        )
+
+        assert fresh_connections == _REQUESTS
+        assert stats.connections <= _IN_FLIGHT
+        assert stats.reuse_ratio > 0.9
+        assert stats.dns_lookups == 1
+        assert _pct(pooled, 0.5) < _pct(fresh, 0.5)
@@ -0,0 +1,112 @@
+"""Batch LLM job benchmark: items/s and cost against the interactive path.
+
+Generates LLM_BATCH_BENCH_ITEMS product descriptions (default 200,
+~600 input / 150 output tokens each, gpt-4o prices from LiteLLM's cost
+map) three ways:
+
+- sequential: one prompt at a time, as offline callers do today
+- batch interactive: BatchJobRunner, 16 calls in flight, chunks of 100
+- batch provider: BatchJobRunner with a provider batch endpoint
+  (fake, 0.3s turnaround per batch, billed at the batch rate)
+
+The provider takes 20ms per interactive call. Reports items/s and cost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.tool.llm.batch import BatchItem, BatchJobRunner
+from src.tool.llm.gateway_adapter import litellm_cost
+from tests.fakes import FakeStorage
+
+_ITEMS = int(os.environ.get("LLM_BATCH_BENCH_ITEMS", "200"))
+_TOKENS = {"input": 600, "output": 150}
+
+
+class _Provider(LLMCallPort):
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        await asyncio.sleep(0.02)
+        return LLMResponse(text="copy", tokens_used=dict(_TOKENS), model_id="gpt-4o")
+
+
+class _ProviderBatch:
+    def __init__(self) -> None:
+        self._ready: dict[str, tuple[float, list[BatchItem]]] = {}
+
+    def supports(self, model_id: str) -> bool:
+        return True
+
+    async def submit(self, items: list[BatchItem], model_id: str) -> str:
+        batch_id = f"b{len(self._ready)}"
+        self._ready[batch_id] = (time.perf_counter() + 0.3, items)
+        return batch_id
+
+    async def fetch(self, batch_id: str) -> dict[str, LLMResponse | str] | None:
+        ready_at, items = self._ready[batch_id]
+        if time.perf_counter() < ready_at:
+            return None
+        return {
+            i.item_id: LLMResponse(text="copy", tokens_used=dict(_TOKENS), model_id="gpt-4o")
+            for i in items
+        }
+
+
+def _items() -> list[BatchItem]:
+    return [
+        BatchItem(item_id=str(k), prompt=f"Describe product {k}", model_id="gpt-4o")
+        for k in range(_ITEMS)
+    ]
+
+
+async def _sequential() -> tuple[float, float]:
+    provider, cost = _Provider(), 0.0
+    start = time.perf_counter()
+    for item in _items():
+        response = await provider.call(item.prompt, item.model_id)
+        cost += litellm_cost(
+            "gpt-4o", response.tokens_used["input"], response.tokens_used["output"]
+        )
+    return _ITEMS / (time.perf_counter() - start), cost
+
+
+@pytest.mark.perf
+class TestLLMBatch:
+    @pytest.mark.asyncio()
+    async def test_batch_throughput_and_cost(self) -> None:
+        seq_rate, seq_cost = await _sequential()
+        interactive = await BatchJobRunner(
+            _Provider(),
+            checkpoints=FakeStorage(),
+            pricing=litellm_cost,
+            concurrency=16,
+            chunk_size=100,
+        ).run("interactive", _items())
+        provider = await BatchJobRunner(
+            _Provider(),
+            checkpoints=FakeStorage(),
+            pricing=litellm_cost,
+            provider_batch=_ProviderBatch(),
+            chunk_size=100,
+            poll_seconds=0.05,
+        ).run("provider", _items())
+
+        print(
+            f"\n{_ITEMS} items (gpt-4o, 600 in / 150 out tokens each):"
+            f"\n  sequential         {seq_rate:7.1f} items/s  ${seq_cost:.4f}"
+            f"\n  batch interactive  {interactive.items_per_second:7.1f} items/s"
+            f"  ${interactive.cost_usd:.4f}"
+            f"\n  batch provider     {provider.items_per_second:7.1f} items/s"
+            f"  ${provider.cost_usd:.4f} (saves ${provider.savings_usd:.4f},"
+            f" {provider.savings_usd / provider.interactive_cost_usd:.0%})"
+        )
+
+        assert interactive.succeeded == provider.succeeded == _ITEMS
+        assert interactive.items_per_second > seq_rate * 8
+        assert interactive.cost_usd == pytest.approx(seq_cost)
+        assert provider.cost_usd == pytest.approx(seq_cost / 2)
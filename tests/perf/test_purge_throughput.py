@@ -0,0 +1,87 @@
+"""Bulk purge benchmark: 1M memory items through the chunked purge engine.
+
+Seeds an in-memory store (same keyset/chunk contract as PgPurgeStore) with
+1M items spread over 1k users, each with one media object, and purges the
+whole org. Reports items/sec, the number of row/vector/object delete
+round-trips and the deletion_timeout_rate SLI; compares round-trips with
+the per-item path (one DELETE per item) the FSM implied before.
+
+Set PURGE_BENCH_ITEMS to shrink the run locally.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from uuid import UUID, uuid4
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from src.memory.deletion.metrics import DeletionSLI
+from src.memory.deletion.purge import InMemoryPurgeStore, PurgeEngine, PurgeRequest
+from src.shared.types import BatchDeleteResult
+from tests.fakes import FakeStorage
+
+_ITEMS = int(os.environ.get("PURGE_BENCH_ITEMS", "1000000"))
+_USERS = 1000
+
+
+class _CountingObjectStorage:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def delete_objects(self, bucket: str, keys: list[str]) -> BatchDeleteResult:
+        self.calls += 1
+        return BatchDeleteResult(deleted=list(keys))
+
+
+class _CountingVectors:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def delete_points(self, point_ids: list[UUID]) -> None:
+        self.calls += 1
+
+
+@pytest.mark.perf
+class TestPurgeThroughput:
+    @pytest.mark.asyncio
+    async def test_purge_one_million_items(self) -> None:
+        org_id = uuid4()
+        users = [uuid4() for _ in range(_USERS)]
+        store = InMemoryPurgeStore()
+        for i in range(_ITEMS):
+            store.add(uuid4(), org_id=org_id, user_id=users[i % _USERS], object_keys=(f"m/{i}",))
+
+        objects, vectors = _CountingObjectStorage(), _CountingVectors()
+        sli = DeletionSLI(registry=CollectorRegistry())
+        engine = PurgeEngine(
+            store,
+            checkpoints=FakeStorage(),
+            object_storage=objects,
+            vectors=vectors,
+            sli=sli,
+            chunk_size=5000,
+        )
+
+        start = time.perf_counter()
+        report = await engine.run(
+            PurgeRequest(job_id=uuid4(), org_id=org_id, reason="org_offboarding")
+        )
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"\npurged {report.purged} items in {elapsed:.1f}s "
+            f"({report.purged / elapsed:,.0f} items/s), {report.chunks} chunks: "
+            f"{store.delete_calls} row deletes / {vectors.calls} vector deletes / "
+            f"{objects.calls} object deletes (per-item path: {_ITEMS} each), "
+            f"deletion_timeout_rate={sli.deletion_timeout_rate:.0%}"
+        )
+
+        assert report.completed is True
+        assert report.purged == _ITEMS
+        assert store.rows == {}
+        assert store.delete_calls == report.chunks
+        assert store.delete_calls <= _ITEMS // 5000 + 1
+        assert sli.deletion_timeout_rate == 0.0
@@ -0,0 +1,99 @@
+"""LLM response cache benchmark: hit ratio and provider tokens saved.
+
+Replays RESPONSE_CACHE_BENCH_CALLS pinned-temperature calls (default 2,000)
+across 5 orgs: FAQ-style questions drawn with a skewed popularity, a third
+of them reworded (word order and punctuation), with a knowledge write
+every 500 calls. Runs the exact tier alone and exact + semantic (bag of
+words embedder standing in for a real one). The provider is simulated;
+reports hit ratio, provider calls and input/output tokens saved.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+from uuid import uuid4
+
+import pytest
+
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.shared.org_scope import org_scope
+from src.tool.llm.response_cache import ResponseCache, ResponseCachePolicy
+
+_CALLS = int(os.environ.get("RESPONSE_CACHE_BENCH_CALLS", "2000"))
+_QUESTIONS = [
+    f"what is the {topic} for {item}"
+    for topic in ("return policy", "delivery time", "care guide", "size chart", "warranty")
+    for item in ("linen shirts", "cotton blazers", "wool coats", "silk scarves", "denim jeans")
+]
+_VOCAB = sorted({w for q in _QUESTIONS for w in q.split()})
+
+
+class _Provider(LLMCallPort):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        self.calls += 1
+        return LLMResponse(
+            text="Returns are free within 30 days with the receipt.",
+            tokens_used={"input": 900 + len(prompt), "output": 60},
+            model_id=model_id,
+        )
+
+
+def _embed(text: str) -> list[float]:
+    words = re.findall(r"[a-z]+", text.lower())
+    return [float(words.count(w)) for w in _VOCAB]
+
+
+def _reword(question: str, rng: random.Random) -> str:
+    words = question.split()
+    words[2:4] = reversed(words[2:4])  # "the return policy" -> "return the policy"
+    return " ".join(words).capitalize() + rng.choice(["?", " please?", "!"])
+
+
+async def _replay(policy: ResponseCachePolicy, semantic: bool) -> tuple[ResponseCache, int]:
+    rng = random.Random(7)  # noqa: S311
+    provider = _Provider()
+    cache = ResponseCache(provider, policy=policy, embed=_embed if semantic else None)
+    orgs = [uuid4() for _ in range(5)]
+    weights = [1 / (rank + 1) for rank in range(len(_QUESTIONS))]
+    for i in range(_CALLS):
+        if i and i % 500 == 0:
+            await cache.knowledge_changed()
+        question = rng.choices(_QUESTIONS, weights)[0]
+        if rng.random() < 1 / 3:
+            question = _reword(question, rng)
+        with org_scope(rng.choice(orgs)):
+            await cache.call(f"Customer asks: {question}", "gpt-4o", parameters={"temperature": 0})
+    return cache, provider.calls
+
+
+@pytest.mark.perf
+class TestResponseCache:
+    @pytest.mark.asyncio()
+    async def test_cache_saves_provider_calls(self) -> None:
+        exact, exact_calls = await _replay(ResponseCachePolicy(), semantic=False)
+        semantic, semantic_calls = await _replay(
+            ResponseCachePolicy(semantic_threshold=0.95), semantic=True
+        )
+
+        lines = [f"\n{_CALLS} pinned calls, 5 orgs, knowledge write every 500:"]
+        for name, cache, calls in (
+            ("exact", exact, exact_calls),
+            ("+semantic", semantic, semantic_calls),
+        ):
+            stats = cache.stats
+            lines.append(
+                f"  {name:<9} hit ratio {stats.hit_ratio:6.1%}, {calls:>5,} provider calls, "
+                f"saved {stats.saved_input_tokens:>9,} input / "
+                f"{stats.saved_output_tokens:>7,} output tokens"
+            )
+        print("\n".join(lines))
+
+        assert exact.stats.hit_ratio > 0.5
+        assert semantic.stats.semantic_hits > 0
+        assert semantic.stats.hit_ratio > exact.stats.hit_ratio
+        assert semantic_calls < exact_calls < _CALLS
@@ -0,0 +1,169 @@
+"""Rolling summary benchmark: prompt tokens and turn latency on a long session.
+
+Replays ROLLING_SUMMARY_BENCH_TURNS turns (default 200) through
+ConversationEngine with an in-process LLM, once with the summary policy
+and once with the fixed last-10-messages window. Turns alternate short
+and long messages so the fixed window's size swings with message length.
+Reports prompt tokens for the full history, the fixed window and
+summary + recent, plus per-turn p50/p99 latency (summary refreshes run
+in the background and are drained outside the timed section).
+
+Tokens use the engine's ~4 chars/token estimate.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.brain.engine.conversation import ConversationEngine
+from src.brain.engine.summarizer import SummaryPolicy, estimate_tokens
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.ports.memory_core_port import MemoryCorePort
+from src.shared.types import MemoryItem, Observation, PromotionReceipt, WriteReceipt
+
+_TURNS = int(os.environ.get("ROLLING_SUMMARY_BENCH_TURNS", "200"))
+_POLICY = SummaryPolicy(trigger_tokens=1500, keep_recent_messages=6, history_budget_tokens=2000)
+
+
+def _p(values: list[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+
+class _NoMemory(MemoryCorePort):
+    async def read_personal_memories(
+        self, user_id: UUID, query: str, top_k: int = 10, *, org_id: UUID | None = None
+    ) -> list[MemoryItem]:
+        return []
+
+    async def write_observation(
+        self, user_id: UUID, observation: Observation, *, org_id: UUID | None = None
+    ) -> WriteReceipt:
+        return WriteReceipt(memory_id=uuid4(), version=1, written_at=datetime.now(UTC))
+
+    async def get_session(self, session_id: UUID) -> object:
+        return None
+
+    async def archive_session(self, session_id: UUID) -> object:
+        return None
+
+    async def promote_to_knowledge(
+        self,
+        memory_id: UUID,
+        target_org_id: UUID,
+        target_visibility: str,
+        *,
+        user_id: UUID | None = None,
+    ) -> PromotionReceipt:
+        return PromotionReceipt(
+            proposal_id=memory_id,
+            source_memory_id=memory_id,
+            target_knowledge_id=None,
+            status="promoted",
+            promoted_at=datetime.now(UTC),
+        )
+
+
+class _ReplayLLM(LLMCallPort):
+    """Echoes a long answer; summary calls return a bounded summary."""
+
+    def __init__(self) -> None:
+        self.chat_prompt_tokens: list[int] = []
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        if prompt.startswith("Update the running summary"):
+            text = "Summary: customer comparing linen shirts, sizes M/L, delivery by Friday. " * 8
+        else:
+            self.chat_prompt_tokens.append(estimate_tokens(prompt))
+            text = "Here are the options with fabric, fit and delivery details. " * 12
+        return LLMResponse(
+            text=text,
+            tokens_used={"input": estimate_tokens(prompt), "output": estimate_tokens(text)},
+            model_id=model_id,
+            finish_reason="stop",
+        )
+
+
+class _EventStore:
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+
+    async def append_event(self, *, session_id: UUID, event_type: str, **kwargs: Any) -> object:
+        event = {
+            "session_id": session_id,
+            "event_type": event_type,
+            "role": kwargs.get("role", "user"),
+            "content": kwargs.get("content") or {},
+            "sequence_number": len(self.events) + 1,
+        }
+        self.events.append(event)
+        return event
+
+    async def get_session_events(
+        self, session_id: UUID, *, limit: int | None = None
+    ) -> list[object]:
+        return [e for e in self.events if e["session_id"] == session_id][:limit]
+
+
+def _message(turn: int) -> str:
+    detail = "I need the linen shirt in a relaxed fit, tell me about sizing and delivery. "
+    return f"turn {turn}: " + detail * (12 if turn % 3 == 0 else 1)
+
+
+async def _replay(policy: SummaryPolicy | None) -> tuple[_ReplayLLM, list[float], int]:
+    llm = _ReplayLLM()
+    engine = ConversationEngine(
+        llm=llm, memory_core=_NoMemory(), event_store=_EventStore(), summary_policy=policy
+    )
+    session_id, org_id, user_id = uuid4(), uuid4(), uuid4()
+    latency_ms: list[float] = []
+    history: list[dict[str, Any]] = []
+    for turn in range(_TURNS):
+        history = await engine.get_session_history(session_id)
+        t0 = time.perf_counter()
+        await engine.process_message(
+            session_id=session_id,
+            user_id=user_id,
+            org_id=org_id,
+            message=_message(turn),
+            conversation_history=history,
+        )
+        latency_ms.append((time.perf_counter() - t0) * 1000)
+        if engine.summarizer is not None:
+            await engine.summarizer.drain()
+    full_history = sum(estimate_tokens(str(m["content"])) for m in history)
+    return llm, latency_ms, full_history
+
+
+@pytest.mark.perf
+class TestRollingSummary:
+    @pytest.mark.asyncio
+    async def test_summary_caps_prompt_on_long_session(self, perf_threshold_ms: int) -> None:
+        window_llm, window_ms, full_history = await _replay(None)
+        summary_llm, summary_ms, _ = await _replay(_POLICY)
+
+        late = slice(_TURNS // 2, None)  # steady state, past the first refreshes
+        window_tokens = window_llm.chat_prompt_tokens[late]
+        summary_tokens = summary_llm.chat_prompt_tokens[late]
+        current_message = max(estimate_tokens(_message(t)) for t in range(_TURNS))
+        print(
+            f"\n{_TURNS} turns, full history {full_history:,} tokens\n"
+            f"last-10 window: prompt mean {statistics.mean(window_tokens):,.0f} "
+            f"max {max(window_tokens):,} tokens; turn p50 {_p(window_ms, 50):.3f}ms "
+            f"p99 {_p(window_ms, 99):.3f}ms\n"
+            f"summary+recent: prompt mean {statistics.mean(summary_tokens):,.0f} "
+            f"max {max(summary_tokens):,} tokens "
+            f"({1 - max(summary_tokens) / full_history:.1%} below full history); "
+            f"turn p50 {_p(summary_ms, 50):.3f}ms p99 {_p(summary_ms, 99):.3f}ms"
+        )
+
+        # The prompt's history part never exceeds the budget
+        overhead = 100  # system/memory framing around the history
+        assert max(summary_tokens) <= _POLICY.history_budget_tokens + current_message + overhead
+        assert _p(summary_ms, 99) < perf_threshold_ms
@@ -0,0 +1,178 @@
+"""Singleflight benchmark: downstream calls under a synthetic burst.
+
+Fires SINGLEFLIGHT_BENCH_BURST concurrent requests (default 400) at three
+call paths, with and without coalescing:
+
+- DiyuResolver.resolve: 4 orgs, every user asking for the brand context
+  (graph query takes 20ms); also two workers sharing a lease store
+- ModelRegistry.call: 8 distinct prompts (provider takes 50ms)
+- CoalescingEmbedder.aembed: 16 distinct texts (embedding takes 5ms)
+
+Reports downstream calls, the reduction, and burst wall time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.knowledge.embedding import CoalescingEmbedder
+from src.knowledge.resolver.resolver import DiyuResolver
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.shared.singleflight import LeasePolicy, SingleFlight
+from src.shared.types import OrganizationContext
+from src.tool.llm.model_registry import ModelRegistry
+from tests.fakes import FakeStorage
+
+_BURST = int(os.environ.get("SINGLEFLIGHT_BENCH_BURST", "400"))
+
+
+class _Result:
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self._records = iter(records)
+
+    def __aiter__(self) -> _Result:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@dataclass
+class _Graph:
+    """Neo4j stand-in: 20ms per query, counts queries."""
+
+    queries: int = 0
+    records: list[dict[str, Any]] = field(
+        default_factory=lambda: [
+            {
+                "n": {"node_id": str(uuid4()), "org_id": str(uuid4()), "tone": "warm"},
+                "labels": ["BrandKnowledge"],
+            }
+        ]
+    )
+
+    @property
+    def driver(self) -> _Graph:
+        return self
+
+    def session(self) -> _Graph:
+        return self
+
+    async def __aenter__(self) -> _Graph:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def run(self, query: str, **params: Any) -> _Result:
+        self.queries += 1
+        await asyncio.sleep(0.02)
+        return _Result(self.records)
+
+
+class _Provider(LLMCallPort):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return LLMResponse(text="ok", tokens_used={"input": 800, "output": 40}, model_id=model_id)
+
+
+class _Embedder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed(self, text: str) -> list[float]:
+        self.calls += 1
+        time.sleep(0.005)
+        return [0.0] * 8
+
+
+async def _timed(coros: list[Any]) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*coros)
+    return (time.perf_counter() - start) * 1000
+
+
+async def _resolver_burst(workers: int, coalesce: bool) -> tuple[int, float]:
+    graph, store = _Graph(), FakeStorage()
+    lease = LeasePolicy(poll_interval=0.005)
+
+    def flight() -> SingleFlight | None:
+        if not coalesce:
+            return None
+        return SingleFlight(store=store, policy=lease) if workers > 1 else SingleFlight()
+
+    resolvers = [DiyuResolver(graph, None, singleflight=flight()) for _ in range(workers)]
+    orgs = [uuid4() for _ in range(4)]
+    requests = [
+        resolvers[i % workers].resolve(
+            "core:role_adaptation",
+            "brand context",
+            OrganizationContext(
+                user_id=uuid4(), org_id=orgs[i % 4], org_tier="brand_hq", org_path="root"
+            ),
+        )
+        for i in range(_BURST)
+    ]
+    elapsed = await _timed(requests)
+    return graph.queries, elapsed
+
+
+async def _registry_burst(coalesce: bool) -> tuple[int, float]:
+    provider = _Provider()
+    registry = ModelRegistry(adapter=provider, singleflight=SingleFlight() if coalesce else None)
+    requests = [registry.call(f"FAQ {i % 8}: opening hours?", "gpt-4o") for i in range(_BURST)]
+    elapsed = await _timed(requests)
+    return provider.calls, elapsed
+
+
+async def _embedder_burst(coalesce: bool) -> tuple[int, float]:
+    inner = _Embedder()
+    embedder = CoalescingEmbedder(inner)
+    texts = [f"product description {i % 16}" for i in range(_BURST)]
+    if coalesce:
+        requests = [embedder.aembed(t) for t in texts]
+    else:
+        requests = [asyncio.to_thread(inner.embed, t) for t in texts]
+    elapsed = await _timed(requests)
+    return inner.calls, elapsed
+
+
+@pytest.mark.perf
+class TestSingleflightBurst:
+    @pytest.mark.asyncio()
+    async def test_burst_downstream_calls(self) -> None:
+        runs = {
+            "resolver": (await _resolver_burst(1, False), await _resolver_burst(1, True)),
+            "resolver x2 lease": (await _resolver_burst(2, False), await _resolver_burst(2, True)),
+            "llm registry": (await _registry_burst(False), await _registry_burst(True)),
+            "embedder": (await _embedder_burst(False), await _embedder_burst(True)),
+        }
+
+        lines = [f"\n{_BURST} concurrent requests per path (downstream calls, wall time):"]
+        for name, ((plain, plain_ms), (flight, flight_ms)) in runs.items():
+            lines.append(
+                f"  {name:<18} {plain:>4} -> {flight:>3} calls ({1 - flight / plain:.1%} fewer), "
+                f"{plain_ms:7.1f}ms -> {flight_ms:6.1f}ms"
+            )
+        print("\n".join(lines))
+
+        assert runs["resolver"][1][0] == 4  # one graph query per org
+        assert runs["resolver x2 lease"][1][0] == 4  # the lease spans workers
+        assert runs["llm registry"][1][0] == 8
+        assert runs["embedder"][1][0] == 16
+        for (plain, _), (flight, _) in runs.values():
+            assert flight < plain
@@ -0,0 +1,85 @@
+"""Token counting throughput: tokenizer vs estimator, cold vs memoized.
+
+Counts TOKEN_COUNT_BENCH_TEXTS distinct context snippets (mixed English /
+Chinese, 40-400 words) three ways: the offline tokenizer (when its
+vocabulary is on disk), the character-class estimator, and the memoized
+counter on a second pass (what context assembly pays for memories,
+knowledge and history messages it has seen before). Reports texts/s,
+tokens/s and the estimator's error against the tokenizer.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+
+import pytest
+
+from src.brain.budget.allocator import BudgetAllocator
+from src.brain.context.truncation import ContextFitter
+from src.shared.tokens import TokenCounter
+
+_TEXTS = int(os.environ.get("TOKEN_COUNT_BENCH_TEXTS", "5000"))
+
+_EN = (
+    "The customer prefers relaxed linen shirts in size M. "
+    "Delivery before Friday matters more than price. "
+    "They returned a cotton blazer last spring because the sleeves were short. "
+)
+_ZH = "客户偏好宽松版型的亚麻衬衫，尺码为中号。周五前送达比价格更重要。"  # noqa: RUF001
+
+
+def _corpus(n: int) -> list[str]:
+    rng = random.Random(7)  # noqa: S311 -- reproducible corpus
+    texts = []
+    for i in range(n):
+        body = _EN * rng.randint(1, 10) if i % 3 else _ZH * rng.randint(1, 10)
+        texts.append(f"[{i}] {body}")
+    return texts
+
+
+def _rate(counter: TokenCounter, texts: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    tokens = sum(counter.count(t) for t in texts)
+    return time.perf_counter() - start, tokens
+
+
+@pytest.mark.perf
+class TestTokenCounting:
+    def test_counting_throughput(self) -> None:
+        texts = _corpus(_TEXTS)
+        tokenizer = TokenCounter()
+        estimator = TokenCounter(use_tokenizer=False)
+
+        cold_s, cold_tokens = _rate(tokenizer, texts)
+        warm_s, warm_tokens = _rate(tokenizer, texts)
+        est_s, est_tokens = _rate(estimator, texts)
+
+        print(
+            f"\n{_TEXTS:,} texts via {tokenizer.backend}: cold {_TEXTS / cold_s:,.0f} texts/s "
+            f"({cold_tokens / cold_s:,.0f} tokens/s); memoized {_TEXTS / warm_s:,.0f} texts/s "
+            f"({cold_s / warm_s:.1f}x)\n"
+            f"estimator: {_TEXTS / est_s:,.0f} texts/s, total {est_tokens:,} vs "
+            f"{cold_tokens:,} ({est_tokens / cold_tokens - 1:+.1%})"
+        )
+
+        assert warm_tokens == cold_tokens
+        assert tokenizer.stats.hits == _TEXTS
+        if tokenizer.backend == "tiktoken":
+            # Estimator errs high on English and stays within ~35% overall
+            assert 1.0 <= est_tokens / cold_tokens <= 1.35
+
+    def test_fit_latency_with_warm_counter(self, perf_threshold_ms: int) -> None:
+        texts = _corpus(200)
+        fitter = ContextFitter(TokenCounter(), BudgetAllocator(max_tokens=16384))
+        history = [{"role": "user", "content": t} for t in texts[100:]]
+
+        fitter.fit(memories=texts[:50], knowledge=texts[50:100], history=history)
+        start = time.perf_counter()
+        for _ in range(20):
+            fitted = fitter.fit(memories=texts[:50], knowledge=texts[50:100], history=history)
+        per_fit_ms = (time.perf_counter() - start) * 1000 / 20
+
+        print(f"\nfit 200 items into 16k window: {per_fit_ms:.3f}ms ({fitted.tokens})")
+        assert per_fit_ms < perf_threshold_ms
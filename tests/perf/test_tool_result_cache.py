@@ -0,0 +1,131 @@
+"""Tool result cache benchmark: repeated searches and re-signed media URLs.
+
+TOOL_BENCH_CALLS calls (default 400) from 4 orgs. Searches draw from 40
+queries with a Zipf-like skew and vary case / spacing / punctuation;
+image calls reference 20 objects through a freshly signed URL every
+time. Backends take 15ms and cost 0.005 per call. Runs:
+
+- direct: every call goes to the backend
+- cached: tools wrapped with cache_tool (normalized query / content hash)
+
+Reports backend calls, billed cost, hit ratio and mean latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass
+from uuid import uuid4
+
+import pytest
+
+from src.shared.org_scope import org_scope
+from src.tool.cache.result_cache import ToolCachePolicy, ToolCallEvent, cache_tool
+from src.tool.implementations.image_analyze import ImageAnalyzeTool
+from src.tool.implementations.web_search import WebSearchTool
+
+_CALLS = int(os.environ.get("TOOL_BENCH_CALLS", "400"))
+_LATENCY = 0.015
+_COST = 0.005
+_QUERIES = [f"linen shirt style {i}" for i in range(40)]
+_SPELLINGS = [str, str.upper, str.title, lambda q: f"  {q}?  ", lambda q: q.replace(" ", "  ")]
+
+
+class _Search:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def search(self, query, top_k, safe_search):
+        self.calls += 1
+        await asyncio.sleep(_LATENCY)
+        return [{"url": "https://r/1", "title": query, "snippet": ""}]
+
+
+class _Vision:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def analyze(self, image_url, analysis_type, detail_level):
+        self.calls += 1
+        await asyncio.sleep(_LATENCY)
+        return {"description": "a shirt", "analysis_type": analysis_type}
+
+
+@dataclass
+class _Meta:
+    size_bytes: int
+    checksum_sha256: str
+
+
+class _Store:
+    async def head_object(self, url):
+        return _Meta(size_bytes=2048, checksum_sha256=url.split("?")[0].rsplit("/", 1)[-1])
+
+
+def _workload() -> list[tuple[str, dict]]:
+    rng = random.Random(7)  # noqa: S311 -- reproducible workload
+    weights = [1 / (i + 1) for i in range(len(_QUERIES))]
+    calls = []
+    for i in range(_CALLS):
+        if i % 2:
+            query = rng.choices(_QUERIES, weights)[0]
+            calls.append(("search", {"query": rng.choice(_SPELLINGS)(query)}))
+        else:
+            url = f"https://s3/obj-{rng.randrange(20)}?X-Amz-Signature={uuid4().hex}"
+            calls.append(("image", {"image_url": url}))
+    return calls
+
+
+async def _run(cached: bool) -> tuple[int, float, float, float]:
+    search, vision, store = _Search(), _Vision(), _Store()
+    events: list[ToolCallEvent] = []
+    tools: dict[str, object] = {
+        "search": WebSearchTool(search_backend=search),
+        "image": ImageAnalyzeTool(vision_backend=vision),
+    }
+    if cached:
+        policies = {
+            "web_search": ToolCachePolicy(cost_amount=_COST, billing_unit="query"),
+            "image_analyze": ToolCachePolicy(ttl_seconds=86400, cost_amount=_COST),
+        }
+        tools = {
+            name: cache_tool(tool, storage_backend=store, meter=events.append, policies=policies)
+            for name, tool in tools.items()
+        }
+    orgs = [uuid4() for _ in range(4)]
+
+    start = time.perf_counter()
+    for i, (name, params) in enumerate(_workload()):
+        with org_scope(orgs[i % len(orgs)]):
+            await tools[name].execute(params)
+    mean_ms = (time.perf_counter() - start) / _CALLS * 1000
+
+    backend_calls = search.calls + vision.calls
+    billed = sum(e.cost_amount for e in events) if cached else backend_calls * _COST
+    hit_ratio = sum(e.cache_hit for e in events) / _CALLS if cached else 0.0
+    return backend_calls, billed, hit_ratio, mean_ms
+
+
+@pytest.mark.perf
+class TestToolResultCache:
+    @pytest.mark.asyncio()
+    async def test_cache_cuts_backend_calls_and_cost(self) -> None:
+        direct_calls, direct_cost, _, direct_ms = await _run(cached=False)
+        cached_calls, cached_cost, hit_ratio, cached_ms = await _run(cached=True)
+
+        print(
+            f"\n{_CALLS} tool calls, 4 orgs, {int(_LATENCY * 1000)}ms backends:"
+            f"\n  direct  backend calls {direct_calls:4d}  billed {direct_cost:6.3f}"
+            f"  mean {direct_ms:5.1f}ms"
+            f"\n  cached  backend calls {cached_calls:4d}  billed {cached_cost:6.3f}"
+            f"  mean {cached_ms:5.1f}ms  hit ratio {hit_ratio:.0%}"
+        )
+
+        assert direct_calls == _CALLS
+        assert cached_calls <= 4 * (len(_QUERIES) + 20)  # at most one per org and key
+        assert cached_cost == pytest.approx(cached_calls * _COST)
+        assert hit_ratio >= 0.5
+        assert cached_ms < direct_ms
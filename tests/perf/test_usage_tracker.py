@@ -0,0 +1,106 @@
+"""Usage metering benchmark: scan-on-read vs running aggregates.
+
+USAGE_BENCH_RECORDS records (default 50k) for one org, then
+get_org_summary + check_budget on every "request". Runs:
+
+- scan: summary recomputed by iterating the org's history (the tracker's
+  previous behaviour)
+- running: UsageTracker's per-org counters, updated at record time
+
+Also reports record_usage cost with rollups and write-behind queueing,
+and the number of sink round trips needed to persist the history.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.tool.llm.usage_tracker import UsageRecord, UsageSummary, UsageTracker
+
+_RECORDS = int(os.environ.get("USAGE_BENCH_RECORDS", "50000"))
+_CHECKS = 20
+
+
+class _CountingSink:
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.rows = 0
+
+    async def write_llm_usage(self, records) -> None:
+        self.round_trips += 1
+        self.rows += len(records)
+
+    async def write_tool_usage(self, records) -> None:
+        self.round_trips += 1
+        self.rows += len(records)
+
+    async def load_org_totals(self) -> list:
+        return []
+
+    async def load_day_totals(self, since) -> list:
+        return []
+
+
+def _scan_summary(org_id, history: list[UsageRecord]) -> UsageSummary:
+    summary = UsageSummary(org_id=org_id)
+    for record in history:
+        summary.total_input += record.input_tokens
+        summary.total_output += record.output_tokens
+        summary.total_tokens += record.total_tokens
+        summary.record_count += 1
+    return summary
+
+
+@pytest.mark.perf
+class TestUsageTrackerAggregates:
+    @pytest.mark.asyncio()
+    async def test_running_counters_vs_scan(self) -> None:
+        sink = _CountingSink()
+        tracker = UsageTracker(sink=sink, max_pending=_RECORDS)
+        org_id, user_id = uuid4(), uuid4()
+        history: list[UsageRecord] = []
+
+        start = time.perf_counter()
+        for _ in range(_RECORDS):
+            history.append(
+                tracker.record_usage(
+                    org_id=org_id,
+                    user_id=user_id,
+                    model_id="gpt-4o",
+                    input_tokens=120,
+                    output_tokens=80,
+                )
+            )
+        record_us = (time.perf_counter() - start) / _RECORDS * 1e6
+        tracker.set_budget(org_id, _RECORDS * 200 + 1000)
+
+        start = time.perf_counter()
+        for _ in range(_CHECKS):
+            scanned = _scan_summary(org_id, history)
+            _ = scanned.total_tokens + 500 <= _RECORDS * 200 + 1000
+        scan_us = (time.perf_counter() - start) / _CHECKS * 1e6
+
+        start = time.perf_counter()
+        for _ in range(_CHECKS):
+            summary = tracker.get_org_summary(org_id)
+            tracker.check_budget(org_id, 500)
+        running_us = (time.perf_counter() - start) / _CHECKS * 1e6
+
+        await tracker.flush()
+
+        print(
+            f"\n{_RECORDS} records, summary + budget check:"
+            f"\n  scan     {scan_us:10.1f}us per request"
+            f"\n  running  {running_us:10.1f}us per request ({scan_us / running_us:.0f}x faster)"
+            f"\n  record_usage {record_us:.1f}us incl. rollups + queueing;"
+            f" persisted {sink.rows} rows in {sink.round_trips} batched inserts"
+        )
+
+        assert summary == scanned
+        assert sink.rows == _RECORDS
+        assert sink.round_trips == -(-_RECORDS // 500)
+        assert running_us * 10 < scan_us
@@ -0,0 +1,81 @@
+"""Working-set hit ratio: repeated retrievals within active sessions.
+
+Replays turns for 200 users through PgMemoryCoreAdapter with and without
+a MemoryWorkingSet. Each user asks a small rotating set of queries over
+30 turns and writes a new observation every 10th turn (which invalidates
+the user's entries). Reports hit ratio and PG round trips avoided per turn.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.memory.pg_adapter import PgMemoryCoreAdapter
+from src.memory.working_set import MemoryWorkingSet
+from src.shared.types import Observation
+from tests.fakes import FakeAsyncSession, FakeOrmRow, FakeSessionFactory
+
+_USERS = 200
+_TURNS = 30
+_QUERIES = ["order status", "size guide", "linen shirts"]
+
+
+async def _replay(working_set: MemoryWorkingSet | None) -> int:
+    org_id = uuid4()
+    session = FakeAsyncSession()
+    session.set_scalars_result(
+        [
+            FakeOrmRow(
+                id=uuid4(),
+                user_id=uuid4(),
+                org_id=org_id,
+                memory_type="preference",
+                content="prefers linen",
+                confidence=0.9,
+                valid_at=datetime.now(UTC),
+                invalid_at=None,
+                source_sessions=[],
+                superseded_by=None,
+                version=1,
+                provenance=None,
+                epistemic_type="fact",
+            )
+        ]
+    )
+    adapter = PgMemoryCoreAdapter(
+        session_factory=FakeSessionFactory(session), working_set=working_set
+    )
+    users = [uuid4() for _ in range(_USERS)]
+    for turn in range(_TURNS):
+        for user_id in users:
+            query = _QUERIES[turn % len(_QUERIES)]
+            await adapter.read_personal_memories(user_id, query, org_id=org_id)
+            if turn % 10 == 9:
+                await adapter.write_observation(
+                    user_id, Observation(content=f"fact {turn}"), org_id=org_id
+                )
+    return len(session.scalars_calls)
+
+
+@pytest.mark.perf
+class TestWorkingSetHitRatio:
+    async def test_working_set_avoids_most_round_trips(self) -> None:
+        baseline = await _replay(None)
+        ws = MemoryWorkingSet()
+        cached = await _replay(ws)
+
+        turns = _USERS * _TURNS
+        print(
+            f"\nworking set: hit ratio {ws.stats.hit_ratio:.1%}, "
+            f"{ws.stats.round_trips_avoided} of {turns} PG round trips avoided "
+            f"({ws.stats.round_trips_avoided / turns:.2f}/turn); "
+            f"PG reads {baseline} -> {cached}"
+        )
+
+        assert baseline == turns
+        assert cached == turns - ws.stats.round_trips_avoided
+        # 3 cold misses per query rotation after each write: 21 of 30 turns hit
+        assert ws.stats.hit_ratio == pytest.approx(0.7)
@@ -117,3 +117,22 @@ class TestBudgetAllocator:
             assert budget.utilization >= 0.9, (
                 f"Utilization {budget.utilization:.2f} < 0.9 for {kwargs}"
             )
+
+    def test_surplus_goes_to_overflowing_history(self, allocator: BudgetAllocator) -> None:
+        budget = allocator.allocate(
+            history_token_count=5000, memory_token_count=0, knowledge_available=False
+        )
+        # Unused memory share moves to history, which needs more than its share
+        assert budget.memories == 0
+        assert budget.history >= 4096 - 1024 - budget.system_prompt - 1  # int rounding
+        assert budget.response_reserve == 1024
+
+    def test_surplus_capped_to_history_need(self, allocator: BudgetAllocator) -> None:
+        base = allocator.allocate(knowledge_available=False)
+        budget = allocator.allocate(
+            history_token_count=base.history + 100,
+            memory_token_count=0,
+            knowledge_available=False,
+        )
+        assert budget.history == base.history + 100
+        assert budget.utilization >= 0.9
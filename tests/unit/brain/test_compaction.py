@@ -0,0 +1,228 @@
+"""Tests for B4-3: prompt context compaction.
+
+Validates:
+- Near-duplicate memories / knowledge dropped across sources
+- Facts already stated by an earlier snippet collapsed sentence by sentence
+- Surviving copy independent of rank order; history only compacted against
+  when the policy opts in, and never rewritten
+- Stable render order; assembler wiring
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.brain.context.compaction import CompactionPolicy, ContextCompactor
+from src.brain.engine.context_assembler import ContextAssembler
+from src.ports.knowledge_port import KnowledgePort
+from src.ports.memory_core_port import MemoryCorePort
+from src.shared.types import (
+    KnowledgeBundle,
+    MemoryItem,
+    Observation,
+    OrganizationContext,
+    PromotionReceipt,
+    WriteReceipt,
+)
+
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _memory(content: str, *, day: int = 0) -> MemoryItem:
+    return MemoryItem(
+        memory_id=uuid4(),
+        user_id=uuid4(),
+        memory_type="preference",
+        content=content,
+        valid_at=_T0 + timedelta(days=day),
+    )
+
+
+class FixedMemoryCore(MemoryCorePort):
+    """Returns the same memories for every query."""
+
+    def __init__(self, items: list[MemoryItem]) -> None:
+        self._items = items
+
+    async def read_personal_memories(
+        self, user_id: UUID, query: str, top_k: int = 10, *, org_id: UUID | None = None
+    ) -> list[MemoryItem]:
+        return self._items[:top_k]
+
+    async def write_observation(
+        self, user_id: UUID, observation: Observation, *, org_id: UUID | None = None
+    ) -> WriteReceipt:
+        return WriteReceipt(memory_id=uuid4(), version=1, written_at=datetime.now(UTC))
+
+    async def get_session(self, session_id: UUID) -> object:
+        return None
+
+    async def archive_session(self, session_id: UUID) -> object:
+        return None
+
+    async def promote_to_knowledge(
+        self,
+        memory_id: UUID,
+        target_org_id: UUID,
+        target_visibility: str,
+        *,
+        user_id: UUID | None = None,
+    ) -> PromotionReceipt:
+        return PromotionReceipt(
+            proposal_id=memory_id,
+            source_memory_id=memory_id,
+            target_knowledge_id=None,
+            status="promoted",
+            promoted_at=datetime.now(UTC),
+        )
+
+
+class FixedKnowledge(KnowledgePort):
+    def __init__(self, bundle: KnowledgeBundle) -> None:
+        self._bundle = bundle
+
+    async def resolve(self, profile_id, query, org_context):
+        return self._bundle
+
+    async def capabilities(self):
+        return {"semantic_search"}
+
+
+@pytest.mark.unit
+class TestContextCompactor:
+    def test_near_duplicate_memory_dropped(self) -> None:
+        keep = _memory("User prefers relaxed fit linen shirts in size M")
+        dup = _memory("user prefers relaxed-fit linen shirts, in size M!", day=1)
+
+        result = ContextCompactor().compact(memories=[keep, dup], knowledge=[], history=[])
+
+        assert result.memories == [keep]
+        assert result.report.near_duplicates == 1
+
+    def test_numbers_must_match(self) -> None:
+        a = _memory("Store opening hours are 9 to 18 on weekdays")
+        b = _memory("Store opening hours are 10 to 18 on weekdays")
+
+        result = ContextCompactor().compact(memories=[a, b], knowledge=[], history=[])
+
+        assert len(result.memories) == 2
+
+    def test_knowledge_duplicating_history_dropped(self) -> None:
+        history = [{"role": "assistant", "content": "Linen shirts ship within 3 business days."}]
+        knowledge = [
+            {"id": "k1", "content": "Linen shirts ship within 3 business days."},
+            {"id": "k2", "content": "Cotton blazers are dry clean only."},
+        ]
+        compactor = ContextCompactor(CompactionPolicy(dedup_against_history=True))
+
+        result = compactor.compact(memories=[], knowledge=knowledge, history=history)
+
+        assert [k["id"] for k in result.knowledge] == ["k2"]
+
+    def test_history_ignored_by_default(self) -> None:
+        history = [{"role": "assistant", "content": "Linen shirts ship within 3 business days."}]
+        knowledge = [{"id": "k1", "content": "Linen shirts ship within 3 business days."}]
+
+        result = ContextCompactor().compact(memories=[], knowledge=knowledge, history=history)
+
+        assert result.knowledge == knowledge
+
+    def test_surviving_copy_independent_of_rank(self) -> None:
+        older = _memory("User prefers relaxed fit linen shirts in size M", day=0)
+        newer = _memory("user prefers relaxed-fit linen shirts, in size M!", day=2)
+        other = _memory("User lives in Hangzhou", day=1)
+        compactor = ContextCompactor()
+
+        first = compactor.compact(memories=[newer, other, older], knowledge=[], history=[])
+        second = compactor.compact(memories=[other, older, newer], knowledge=[], history=[])
+
+        assert first.memories == [other, older]  # rank order kept
+        assert second.memories == [other, older]
+
+    def test_repeated_facts_collapsed(self) -> None:
+        knowledge = [
+            {"id": "k1", "content": "Free returns within 7 days. Linen breathes well in summer."},
+            {"id": "k2", "content": "Free returns within 7 days. Blazers run one size small."},
+            {"id": "k3", "content": "Free returns within 7 days."},
+        ]
+
+        result = ContextCompactor().compact(memories=[], knowledge=knowledge, history=[])
+
+        assert [k["content"] for k in result.knowledge] == [
+            "Free returns within 7 days. Linen breathes well in summer.",
+            "Blazers run one size small.",
+        ]
+        assert result.knowledge[1]["id"] == "k2"
+        assert result.report.sentences_collapsed == 2
+        assert result.report.emptied == 1
+        assert 0 < result.report.saved_ratio < 1
+
+    def test_short_sentences_never_collapse(self) -> None:
+        knowledge = [{"content": "Yes. Linen is cool."}, {"content": "Yes. Wool is warm."}]
+
+        result = ContextCompactor().compact(memories=[], knowledge=knowledge, history=[])
+
+        assert result.knowledge[1]["content"] == "Yes. Wool is warm."
+
+    def test_history_untouched(self) -> None:
+        history = [{"role": "user", "content": "Hi"}, {"role": "user", "content": "Hi"}]
+        compactor = ContextCompactor(CompactionPolicy(dedup_against_history=True))
+
+        compactor.compact(memories=[], knowledge=[], history=history)
+
+        assert history == [{"role": "user", "content": "Hi"}, {"role": "user", "content": "Hi"}]
+
+    def test_stable_order(self) -> None:
+        old, new = _memory("old fact", day=0), _memory("new fact", day=5)
+        kb = [{"id": "b", "content": "x"}, {"id": "a", "content": "y"}]
+
+        memories, knowledge = ContextCompactor().stable_order([new, old], kb)
+
+        assert memories == [old, new]
+        assert [k["id"] for k in knowledge] == ["a", "b"]
+
+    def test_rejects_bad_threshold(self) -> None:
+        with pytest.raises(ValueError, match="similarity_threshold"):
+            CompactionPolicy(similarity_threshold=0)
+
+
+@pytest.mark.unit
+class TestAssemblerCompaction:
+    @pytest.mark.asyncio()
+    async def test_assembler_compacts_and_orders(self) -> None:
+        memories = [
+            _memory("User prefers linen shirts in size M", day=3),
+            _memory("user prefers linen shirts in size M.", day=1),
+            _memory("User lives in Hangzhou", day=0),
+        ]
+        bundle = KnowledgeBundle(
+            semantic_contents=[{"id": "k1", "content": "User lives in Hangzhou"}]
+        )
+        assembler = ContextAssembler(
+            memory_core=FixedMemoryCore(memories),
+            knowledge=FixedKnowledge(bundle),
+            compactor=ContextCompactor(),
+        )
+        user_id = uuid4()
+
+        ctx = await assembler.assemble(
+            user_id=user_id,
+            query="shirts",
+            org_context=OrganizationContext(
+                user_id=user_id, org_id=uuid4(), org_tier="brand_hq", org_path="root.brand"
+            ),
+        )
+
+        assert ctx.compaction is not None
+        assert ctx.compaction.near_duplicates == 2
+        assert [m.content for m in ctx.personal_memories] == [
+            "user prefers linen shirts in size M.",  # the older copy survives
+            "User lives in Hangzhou",
+        ]
+        assert ctx.knowledge_bundle is not None
+        assert ctx.knowledge_bundle.semantic_contents == []
+        # Rendered oldest first, not by rank
+        assert ctx.system_prompt.index("Hangzhou") < ctx.system_prompt.index("linen")
@@ -202,6 +202,24 @@ class TestContextAssembler:
         ctx = await assembler.assemble(user_id=user_id, query="developer")
         assert "developer" in ctx.system_prompt.lower()
 
+    @pytest.mark.asyncio()
+    async def test_persona_and_context_kept_apart(
+        self,
+        memory_core: FakeMemoryCore,
+    ) -> None:
+        """B4-4: system_prompt is persona + context_prompt, both exposed for caching."""
+        user_id = uuid4()
+        await memory_core.write_observation(
+            user_id=user_id,
+            observation=Observation(content="User is a developer"),
+        )
+        assembler = ContextAssembler(memory_core=memory_core)
+        ctx = await assembler.assemble(user_id=user_id, query="developer")
+        assert ctx.persona
+        assert "developer" in ctx.context_prompt
+        assert "developer" not in ctx.persona
+        assert ctx.system_prompt == f"{ctx.persona}\n\n{ctx.context_prompt}"
+
     @pytest.mark.asyncio()
     async def test_to_prompt_context(
         self,
@@ -294,3 +312,83 @@ class TestRetrievalReceipts:
         await assembler.assemble(user_id=user_id, query="test")
         # No org_context -> no org_id -> no receipts
         assert len(receipt_store._receipts) == 0
+
+
+@pytest.mark.unit
+class TestFusedMemoryFilter:
+    """B3-4: Fused memories are not injected into context."""
+
+    @pytest.mark.asyncio()
+    async def test_fused_memory_dropped(self) -> None:
+        from src.brain.memory.feedback import InMemoryFeedbackStore, PersistentFeedbackFuse
+
+        memory_core = FakeMemoryCore()
+        user_id = uuid4()
+        bad = await memory_core.write_observation(
+            user_id=user_id, observation=Observation(content="User lives in Paris")
+        )
+        await memory_core.write_observation(
+            user_id=user_id, observation=Observation(content="User lives near the lake")
+        )
+        fuse = PersistentFeedbackFuse(InMemoryFeedbackStore(), threshold=1)
+        await fuse.record_negative(bad.memory_id, user_id=user_id, org_id=uuid4())
+
+        assembler = ContextAssembler(memory_core=memory_core, feedback_fuse=fuse)
+        ctx = await assembler.assemble(user_id=user_id, query="lives")
+
+        assert [m.content for m in ctx.personal_memories] == ["User lives near the lake"]
+
+
+@pytest.mark.unit
+class TestTokenBudgetFitting:
+    """B4-2: ContextFitter cuts components by counted tokens."""
+
+    @pytest.mark.asyncio()
+    async def test_components_fitted_to_budget(self) -> None:
+        from src.brain.budget.allocator import BudgetAllocator
+        from src.brain.context.truncation import ContextFitter
+        from src.shared.tokens import TokenCounter
+
+        memory_core = FakeMemoryCore()
+        user_id = uuid4()
+        for i in range(8):
+            await memory_core.write_observation(
+                user_id=user_id,
+                observation=Observation(content=f"Fact {i} about shirts. " * 20),
+            )
+        kb = KnowledgeBundle(semantic_contents=[{"content": "Linen breathes. " * 80, "id": 1}])
+        history = [{"role": "user", "content": f"Turn {i}. " * 30} for i in range(30)]
+        counter = TokenCounter(use_tokenizer=False)
+        assembler = ContextAssembler(
+            memory_core=memory_core,
+            knowledge=FakeKnowledgePort(bundle=kb),
+            context_fitter=ContextFitter(counter, BudgetAllocator(max_tokens=1024)),
+        )
+
+        ctx = await assembler.assemble(
+            user_id=user_id,
+            query="shirts",
+            org_context=OrganizationContext(
+                user_id=user_id, org_id=uuid4(), org_tier="brand_hq", org_path="root.brand"
+            ),
+            conversation_history=history,
+        )
+
+        budget = ctx.token_budget
+        assert budget is not None
+        assert 0 < len(ctx.personal_memories) < 8
+        assert sum(counter(m.content) for m in ctx.personal_memories) <= budget.memories
+        assert ctx.knowledge_bundle is not None
+        (item,) = ctx.knowledge_bundle.semantic_contents
+        assert item["id"] == 1
+        assert item["content"].endswith("Linen breathes.")
+        assert counter(item["content"]) <= budget.knowledge
+        assert ctx.conversation_history[-1] == history[-1]
+        assert len(ctx.conversation_history) < len(history)
+        assert ctx.personal_memories[-1].content in ctx.system_prompt
+
+    @pytest.mark.asyncio()
+    async def test_unfitted_context_has_no_budget(self) -> None:
+        assembler = ContextAssembler(memory_core=FakeMemoryCore())
+        ctx = await assembler.assemble(user_id=uuid4(), query="hi")
+        assert ctx.token_budget is None
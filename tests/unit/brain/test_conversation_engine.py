@@ -260,6 +260,78 @@ class TestConversationEngine:
             )
             assert turn.assistant_response is not None
 
+    @pytest.mark.asyncio()
+    async def test_context_fitter_sizes_history_by_tokens(self) -> None:
+        """With a ContextFitter, history is cut by tokens, not to the last 10."""
+        from src.brain.context.truncation import ContextFitter
+        from src.shared.tokens import TokenCounter
+
+        prompts: list[str] = []
+
+        class RecordingLLM(FakeLLM):
+            async def call(self, prompt, model_id, content_parts=None, parameters=None):
+                prompts.append(prompt)
+                return await super().call(prompt, model_id, content_parts, parameters)
+
+        engine = ConversationEngine(
+            llm=RecordingLLM(),
+            memory_core=FakeMemoryCore(),
+            context_fitter=ContextFitter(TokenCounter(use_tokenizer=False)),
+        )
+        history = [{"role": "user", "content": f"short turn {i}"} for i in range(30)]
+
+        turn = await engine.process_message(
+            session_id=uuid4(),
+            user_id=uuid4(),
+            org_id=uuid4(),
+            message="Follow up",
+            conversation_history=history,
+        )
+
+        assert turn.context.token_budget is not None
+        assert "short turn 0" in prompts[0]
+        assert "short turn 29" in prompts[0]
+
+    @pytest.mark.asyncio()
+    async def test_prompt_builder_sends_structured_blocks(self) -> None:
+        """With a PromptBuilder, the LLM gets role-tagged blocks; cache hits are tallied."""
+        from src.brain.engine.prompt_builder import PromptBuilder
+
+        calls: list[tuple[str, Any]] = []
+
+        class CachingLLM(FakeLLM):
+            async def call(self, prompt, model_id, content_parts=None, parameters=None):
+                calls.append((prompt, content_parts))
+                return LLMResponse(
+                    text="ok", tokens_used={"input": 100, "output": 5, "cached_input": 60}
+                )
+
+        engine = ConversationEngine(
+            llm=CachingLLM(), memory_core=FakeMemoryCore(), prompt_builder=PromptBuilder()
+        )
+        history = [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+        ]
+
+        await engine.process_message(
+            session_id=uuid4(),
+            user_id=uuid4(),
+            org_id=uuid4(),
+            message="Any linen?",
+            conversation_history=history,
+        )
+
+        prompt, blocks = calls[0]
+        assert prompt.endswith("User: Any linen?")  # flattened text fallback kept
+        assert [(b.role, b.text) for b in blocks] == [
+            ("system", "You are a helpful assistant."),
+            ("user", "Hi"),
+            ("assistant", "Hello!"),
+            ("user", "Any linen?"),
+        ]
+        assert engine.prompt_cache_stats.cached_ratio == pytest.approx(0.6)
+
 
 @pytest.mark.unit
 class TestConversationEngineEventStore:
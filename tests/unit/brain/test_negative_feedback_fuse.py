@@ -1,14 +1,28 @@
 """B3-4: Negative feedback fuse tests.
 
 Tests: 3 negations -> fuse, fused memory not injected (confidence=0),
-reset, configurable threshold.
+reset, configurable threshold, persistent store shared across workers,
+Bloom filter fast path.
 """
 
 from __future__ import annotations
 
-from uuid import uuid4
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
-from src.brain.memory.feedback import NegativeFeedbackFuse
+import pytest
+
+from src.brain.memory.feedback import (
+    SNAPSHOT_KEY_PREFIX,
+    BloomFilter,
+    InMemoryFeedbackStore,
+    NegativeFeedbackFuse,
+    PersistentFeedbackFuse,
+)
+from src.shared.types import MemoryItem
+from tests.fakes import FakeStorage
+
+_ORG = uuid4()
 
 
 class TestFuseAfterThreshold:
@@ -119,3 +133,127 @@ class TestDegradingConfidence:
         assert r1.confidence > 0
         assert r2.confidence > 0
         assert r2.confidence < r1.confidence
+
+
+def _memory(user_id: UUID, memory_id: UUID | None = None) -> MemoryItem:
+    return MemoryItem(
+        memory_id=memory_id or uuid4(),
+        user_id=user_id,
+        memory_type="observation",
+        content="fact",
+        valid_at=datetime.now(UTC),
+    )
+
+
+class TestBloomFilter:
+    def test_no_false_negatives_and_round_trip(self) -> None:
+        ids = [uuid4() for _ in range(200)]
+        bloom = BloomFilter.from_ids(ids, 0.01)
+        assert all(i in bloom for i in ids)
+
+        restored = BloomFilter.from_dict(bloom.to_dict())
+        assert all(i in restored for i in ids)
+
+    def test_false_positive_rate_near_target(self) -> None:
+        bloom = BloomFilter.from_ids([uuid4() for _ in range(1000)], 0.01)
+        hits = sum(uuid4() in bloom for _ in range(20_000))
+        assert hits / 20_000 < 0.03
+
+    def test_rejects_empty_size(self) -> None:
+        with pytest.raises(ValueError, match="size_bits"):
+            BloomFilter(0, 3)
+
+
+class TestPersistentFeedbackFuse:
+    async def test_fuses_at_threshold(self) -> None:
+        fuse = PersistentFeedbackFuse(InMemoryFeedbackStore(), threshold=3)
+        user_id, mid = uuid4(), uuid4()
+        results = [await fuse.record_negative(mid, user_id=user_id, org_id=_ORG) for _ in range(3)]
+
+        assert [r.fused for r in results] == [False, False, True]
+        assert results[-1].confidence == 0.0
+        assert await fuse.is_fused(mid, user_id=user_id) is True
+
+    async def test_workers_share_state_through_store(self) -> None:
+        store, shared = InMemoryFeedbackStore(), FakeStorage()
+        worker_a = PersistentFeedbackFuse(store, shared=shared, threshold=2)
+        worker_b = PersistentFeedbackFuse(store, shared=shared, threshold=2)
+        user_id, mid = uuid4(), uuid4()
+
+        await worker_a.record_negative(mid, user_id=user_id, org_id=_ORG)
+        result = await worker_b.record_negative(mid, user_id=user_id, org_id=_ORG)
+
+        assert result.negative_count == 2
+        assert result.fused is True
+        assert f"{SNAPSHOT_KEY_PREFIX}:{user_id}" in shared.data
+        # A fresh worker (restart) loads the shared snapshot, not the store.
+        worker_c = PersistentFeedbackFuse(store, shared=shared, threshold=2)
+        calls = store.fused_ids_calls
+        assert await worker_c.is_fused(mid, user_id=user_id) is True
+        assert store.fused_ids_calls == calls
+
+    async def test_filter_skips_store_for_bloom_misses(self) -> None:
+        store = InMemoryFeedbackStore()
+        fuse = PersistentFeedbackFuse(store, threshold=1)
+        user_id = uuid4()
+        fused = _memory(user_id)
+        clean = [_memory(user_id) for _ in range(20)]
+        assert await fuse.filter_fused(user_id, clean) == clean
+        await fuse.record_negative(fused.memory_id, user_id=user_id, org_id=_ORG)
+
+        kept = await fuse.filter_fused(user_id, [fused, *clean])
+        kept_again = await fuse.filter_fused(user_id, [fused, *clean])
+
+        assert kept == clean
+        assert kept_again == clean
+        assert store.fused_among_calls == 0  # fused on this worker: already confirmed
+
+    async def test_bloom_hits_are_confirmed(self) -> None:
+        store = InMemoryFeedbackStore()
+        user_id, mid = uuid4(), uuid4()
+        await store.record_negative(org_id=_ORG, user_id=user_id, memory_id=mid, threshold=1)
+        fuse = PersistentFeedbackFuse(store, threshold=1)
+        memories = [_memory(user_id, mid), _memory(user_id)]
+
+        kept = await fuse.filter_fused(user_id, memories)
+        await fuse.filter_fused(user_id, memories)
+
+        assert kept == memories[1:]
+        assert store.fused_among_calls == 1  # confirmation cached until refresh
+
+    async def test_refresh_picks_up_fuses_from_other_workers(self) -> None:
+        store, shared = InMemoryFeedbackStore(), FakeStorage()
+        now = [0.0]
+        reader = PersistentFeedbackFuse(
+            store, shared=shared, threshold=1, refresh_seconds=30, clock=lambda: now[0]
+        )
+        writer = PersistentFeedbackFuse(store, shared=shared, threshold=1)
+        user_id, mid = uuid4(), uuid4()
+        assert await reader.is_fused(mid, user_id=user_id) is False
+
+        await writer.record_negative(mid, user_id=user_id, org_id=_ORG)
+        now[0] = 31.0
+
+        assert await reader.is_fused(mid, user_id=user_id) is True
+
+    async def test_reset_unfuses_everywhere(self) -> None:
+        store, shared = InMemoryFeedbackStore(), FakeStorage()
+        fuse = PersistentFeedbackFuse(store, shared=shared, threshold=1)
+        user_id, mid = uuid4(), uuid4()
+        await fuse.record_negative(mid, user_id=user_id, org_id=_ORG)
+
+        await fuse.reset(mid, user_id=user_id)
+
+        assert await fuse.is_fused(mid, user_id=user_id) is False
+        fresh = PersistentFeedbackFuse(store, shared=shared, threshold=1)
+        assert await fresh.is_fused(mid, user_id=user_id) is False
+
+    async def test_user_cache_is_bounded(self) -> None:
+        fuse = PersistentFeedbackFuse(InMemoryFeedbackStore(), max_users=2)
+        for _ in range(5):
+            await fuse.filter_fused(uuid4(), [_memory(uuid4())])
+        assert len(fuse._filters) == 2
+
+    def test_rejects_bad_false_positive_rate(self) -> None:
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            PersistentFeedbackFuse(InMemoryFeedbackStore(), false_positive_rate=1.0)
@@ -0,0 +1,254 @@
+"""Tests for B4-1: speculative session prefetch.
+
+Validates:
+- warm() starts history, memory and default-knowledge retrievals;
+  an open/resume warm (no draft) skips memories
+- assemble() consumes warmed results; in-flight prefetches are joined
+- One-shot history/memories, TTL expiry, LRU bound, failure fallback
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.brain.engine.context_assembler import ContextAssembler
+from src.brain.engine.prefetch import PrefetchPolicy, SessionPrefetcher
+from src.ports.knowledge_port import KnowledgePort
+from src.ports.memory_core_port import MemoryCorePort
+from src.shared.types import (
+    KnowledgeBundle,
+    MemoryItem,
+    Observation,
+    OrganizationContext,
+    PromotionReceipt,
+    WriteReceipt,
+)
+
+
+class CountingMemoryCore(MemoryCorePort):
+    """Substring-matching memory core that counts reads; optionally blocks."""
+
+    def __init__(self, gate: asyncio.Event | None = None) -> None:
+        self._items: list[MemoryItem] = []
+        self.reads: list[str] = []
+        self._gate = gate
+
+    async def read_personal_memories(
+        self,
+        user_id: UUID,
+        query: str,
+        top_k: int = 10,
+        *,
+        org_id: UUID | None = None,
+    ) -> list[MemoryItem]:
+        self.reads.append(query)
+        if self._gate is not None:
+            await self._gate.wait()
+        hits = [m for m in self._items if m.user_id == user_id and query in m.content]
+        return hits[:top_k]
+
+    async def write_observation(
+        self,
+        user_id: UUID,
+        observation: Observation,
+        *,
+        org_id: UUID | None = None,
+    ) -> WriteReceipt:
+        return WriteReceipt(memory_id=uuid4(), version=1, written_at=datetime.now(UTC))
+
+    async def get_session(self, session_id: UUID) -> object:
+        return None
+
+    async def archive_session(self, session_id: UUID) -> object:
+        return None
+
+    async def promote_to_knowledge(
+        self,
+        memory_id: UUID,
+        target_org_id: UUID,
+        target_visibility: str,
+        *,
+        user_id: UUID | None = None,
+    ) -> PromotionReceipt:
+        msg = "not used"
+        raise NotImplementedError(msg)
+
+
+class CountingKnowledge(KnowledgePort):
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls = 0
+        self._fail = fail
+
+    async def resolve(self, profile_id, query, org_context):
+        self.calls += 1
+        if self._fail:
+            msg = "graph down"
+            raise ConnectionError(msg)
+        return KnowledgeBundle(semantic_contents=[{"content": "brand tone: warm"}])
+
+    async def capabilities(self):
+        return {"semantic_search"}
+
+
+def _org(user_id: UUID) -> OrganizationContext:
+    return OrganizationContext(
+        user_id=user_id, org_id=uuid4(), org_tier="brand_hq", org_path="root.brand"
+    )
+
+
+def _item(user_id: UUID, content: str) -> MemoryItem:
+    return MemoryItem(
+        memory_id=uuid4(),
+        user_id=user_id,
+        memory_type="preference",
+        content=content,
+        valid_at=datetime.now(UTC),
+    )
+
+
+@pytest.mark.unit
+class TestSessionPrefetcher:
+    async def test_assemble_consumes_prefetched_results(self) -> None:
+        user_id, session_id = uuid4(), uuid4()
+        org = _org(user_id)
+        memory_core, knowledge = CountingMemoryCore(), CountingKnowledge()
+        memory_core._items.append(_item(user_id, "likes linen shirts"))
+        prefetcher = SessionPrefetcher(memory_core=memory_core, knowledge=knowledge)
+        assembler = ContextAssembler(
+            memory_core=memory_core, knowledge=knowledge, prefetcher=prefetcher
+        )
+
+        prefetcher.warm(session_id, user_id=user_id, org_context=org, draft="linen")
+        ctx = await assembler.assemble(
+            user_id=user_id, query="linen", org_context=org, session_id=session_id
+        )
+
+        assert [m.content for m in ctx.personal_memories] == ["likes linen shirts"]
+        assert ctx.knowledge_bundle is not None
+        assert memory_core.reads == ["linen"]
+        assert knowledge.calls == 1
+        assert prefetcher.stats.hits == 2
+
+    async def test_reader_joins_in_flight_prefetch(self) -> None:
+        user_id, session_id = uuid4(), uuid4()
+        gate = asyncio.Event()
+        memory_core = CountingMemoryCore(gate)
+        prefetcher = SessionPrefetcher(memory_core=memory_core)
+        prefetcher.warm(session_id, user_id=user_id, org_context=_org(user_id), draft="hi")
+
+        reader = asyncio.create_task(
+            prefetcher.memories(session_id, user_id=user_id, query="hi", top_k=10)
+        )
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await reader == []
+        assert memory_core.reads == ["hi"]
+
+    async def test_draft_mismatch_is_a_miss(self) -> None:
+        user_id, session_id = uuid4(), uuid4()
+        prefetcher = SessionPrefetcher(memory_core=CountingMemoryCore())
+        prefetcher.warm(session_id, user_id=user_id, org_context=_org(user_id), draft="size")
+
+        got = await prefetcher.memories(session_id, user_id=user_id, query="colour", top_k=10)
+
+        assert got is None
+        assert prefetcher.stats.misses == 1
+
+    async def test_open_warms_history_and_knowledge_only(self) -> None:
+        user_id, session_id = uuid4(), uuid4()
+        org = _org(user_id)
+        memory_core, knowledge = CountingMemoryCore(), CountingKnowledge()
+
+        async def loader(sid: UUID) -> list[dict[str, str]]:
+            return []
+
+        prefetcher = SessionPrefetcher(
+            memory_core=memory_core, knowledge=knowledge, history_loader=loader
+        )
+        assembler = ContextAssembler(
+            memory_core=memory_core, knowledge=knowledge, prefetcher=prefetcher
+        )
+        prefetcher.warm(session_id, user_id=user_id, org_context=org)
+        await asyncio.sleep(0)
+
+        assert memory_core.reads == []
+        assert await prefetcher.history(session_id) == []
+        await assembler.assemble(
+            user_id=user_id, query="linen", org_context=org, session_id=session_id
+        )
+
+        assert memory_core.reads == ["linen"]
+        assert knowledge.calls == 1
+        assert prefetcher.stats.hits == 2  # history and knowledge
+
+    async def test_history_is_handed_out_once(self) -> None:
+        session_id, user_id = uuid4(), uuid4()
+        loads: list[UUID] = []
+
+        async def loader(sid: UUID) -> list[dict[str, str]]:
+            loads.append(sid)
+            return [{"role": "user", "content": "hello"}]
+
+        prefetcher = SessionPrefetcher(memory_core=CountingMemoryCore(), history_loader=loader)
+        prefetcher.warm(session_id, user_id=user_id, org_context=_org(user_id))
+
+        assert await prefetcher.history(session_id) == [{"role": "user", "content": "hello"}]
+        assert await prefetcher.history(session_id) is None
+        assert loads == [session_id]
+
+    async def test_ttl_expiry(self) -> None:
+        now = [0.0]
+        user_id, session_id = uuid4(), uuid4()
+        prefetcher = SessionPrefetcher(
+            memory_core=CountingMemoryCore(),
+            policy=PrefetchPolicy(ttl_seconds=5),
+            clock=lambda: now[0],
+        )
+        prefetcher.warm(session_id, user_id=user_id, org_context=_org(user_id), draft="hi")
+        now[0] = 6.0
+
+        assert await prefetcher.memories(session_id, user_id=user_id, query="hi", top_k=10) is None
+
+    async def test_lru_bound_cancels_evicted_work(self) -> None:
+        gate = asyncio.Event()
+        prefetcher = SessionPrefetcher(
+            memory_core=CountingMemoryCore(gate), policy=PrefetchPolicy(max_sessions=2)
+        )
+        first = uuid4()
+        user_id = uuid4()
+        prefetcher.warm(first, user_id=user_id, org_context=_org(user_id), draft="hi")
+        task = prefetcher._sessions[first].memories[("hi", 10)]
+        for _ in range(2):
+            prefetcher.warm(uuid4(), user_id=user_id, org_context=_org(user_id), draft="hi")
+        await asyncio.sleep(0)
+
+        assert first not in prefetcher._sessions
+        assert task.cancelled()
+        assert prefetcher.stats.evictions == 1
+        gate.set()
+
+    async def test_failed_prefetch_falls_back(self) -> None:
+        user_id, session_id = uuid4(), uuid4()
+        org = _org(user_id)
+        knowledge = CountingKnowledge(fail=True)
+        prefetcher = SessionPrefetcher(memory_core=CountingMemoryCore(), knowledge=knowledge)
+        assembler = ContextAssembler(
+            memory_core=CountingMemoryCore(), knowledge=knowledge, prefetcher=prefetcher
+        )
+        prefetcher.warm(session_id, user_id=user_id, org_context=org)
+
+        ctx = await assembler.assemble(
+            user_id=user_id, query="q", org_context=org, session_id=session_id
+        )
+
+        assert knowledge.calls == 2
+        assert ctx.degraded is True
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError, match="max_sessions"):
+            PrefetchPolicy(max_sessions=0)
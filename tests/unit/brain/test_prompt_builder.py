@@ -0,0 +1,89 @@
+"""Tests for B4-4: structured prompt builder.
+
+Validates:
+- Sections become role-tagged blocks in stable-first order
+- Cache breakpoints at the end of the stable prefix, summary and history
+- Per-section token accounting
+- Cached-token ratio aggregation
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.brain.engine.prompt_builder import PromptBuilder, PromptCacheStats
+
+
+@pytest.mark.unit
+class TestPromptBuilder:
+    def test_blocks_in_stable_first_order(self) -> None:
+        prompt = PromptBuilder().build(
+            persona="You are a stylist.",
+            context="About the user:\n- likes linen",
+            summary="They asked about shirts.",
+            history=[
+                {"role": "user", "content": "Any in navy?"},
+                {"role": "assistant", "content": "Yes."},
+            ],
+            message="Size M please",
+        )
+
+        assert [(b.role, b.text) for b in prompt.blocks] == [
+            ("system", "You are a stylist."),
+            ("system", "About the user:\n- likes linen"),
+            ("system", "Summary of earlier conversation: They asked about shirts."),
+            ("user", "Any in navy?"),
+            ("assistant", "Yes."),
+            ("user", "Size M please"),
+        ]
+        assert [b.cache for b in prompt.blocks] == [False, True, True, False, True, False]
+
+    def test_persona_ends_prefix_without_context(self) -> None:
+        prompt = PromptBuilder().build(
+            persona="You are a stylist.", context="", summary="", history=[], message="Hi"
+        )
+
+        assert [(b.role, b.cache) for b in prompt.blocks] == [("system", True), ("user", False)]
+
+    def test_unknown_history_role_sent_as_user(self) -> None:
+        prompt = PromptBuilder().build(
+            persona="",
+            context="",
+            summary="",
+            history=[{"role": "tool", "content": "result"}],
+            message="Hi",
+        )
+
+        assert prompt.blocks[0].role == "user"
+
+    def test_section_tokens(self) -> None:
+        prompt = PromptBuilder(count_tokens=len).build(
+            persona="abcd",
+            context="",
+            summary="",
+            history=[{"role": "user", "content": "xy"}, {"role": "assistant", "content": "z"}],
+            message="hello",
+        )
+
+        assert prompt.section_tokens == {
+            "system": 4,
+            "context": 0,
+            "summary": 0,
+            "history": 3,
+            "user": 5,
+        }
+
+
+@pytest.mark.unit
+class TestPromptCacheStats:
+    def test_cached_ratio(self) -> None:
+        stats = PromptCacheStats()
+
+        stats.record({"input": 100, "output": 10, "cached_input": 80})
+        stats.record({"input": 100, "output": 10})
+
+        assert stats.calls == 2
+        assert stats.cached_ratio == pytest.approx(0.4)
+
+    def test_empty_ratio_is_zero(self) -> None:
+        assert PromptCacheStats().cached_ratio == 0.0
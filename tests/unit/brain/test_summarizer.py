@@ -0,0 +1,351 @@
+"""Tests for rolling conversation summarization (B4-2).
+
+Validates:
+- Refresh only when the unsummarized tail passes the token threshold
+- Summary events are persisted and reloaded; recent messages never folded
+- Prompt carries summary + newest messages within the history budget
+- Engine schedules refreshes in the background and hides summary events
+  from session history
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.brain.budget.allocator import BudgetAllocator
+from src.brain.context.truncation import ContextFitter
+from src.brain.engine.conversation import ConversationEngine
+from src.brain.engine.summarizer import (
+    SUMMARY_EVENT_TYPE,
+    RollingSummarizer,
+    SessionSummary,
+    SummaryPolicy,
+)
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.ports.memory_core_port import MemoryCorePort
+from src.shared.org_scope import get_org_id, get_org_tier, get_priority, get_user_id
+from src.shared.tokens import TokenCounter
+from src.shared.types import MemoryItem, Observation, PromotionReceipt, WriteReceipt
+
+
+class EmptyMemoryCore(MemoryCorePort):
+    """MemoryCorePort with no memories; writes are acknowledged and dropped."""
+
+    async def read_personal_memories(
+        self, user_id: UUID, query: str, top_k: int = 10, *, org_id: UUID | None = None
+    ) -> list[MemoryItem]:
+        return []
+
+    async def write_observation(
+        self, user_id: UUID, observation: Observation, *, org_id: UUID | None = None
+    ) -> WriteReceipt:
+        return WriteReceipt(memory_id=uuid4(), version=1, written_at=datetime.now(UTC))
+
+    async def get_session(self, session_id: UUID) -> object:
+        return None
+
+    async def archive_session(self, session_id: UUID) -> object:
+        return None
+
+    async def promote_to_knowledge(
+        self,
+        memory_id: UUID,
+        target_org_id: UUID,
+        target_visibility: str,
+        *,
+        user_id: UUID | None = None,
+    ) -> PromotionReceipt:
+        return PromotionReceipt(
+            proposal_id=memory_id,
+            source_memory_id=memory_id,
+            target_knowledge_id=None,
+            status="promoted",
+            promoted_at=datetime.now(UTC),
+        )
+
+
+class FakeEventStore:
+    """In-memory event store satisfying EventStoreProtocol."""
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+
+    async def append_event(
+        self,
+        *,
+        org_id: UUID,
+        session_id: UUID,
+        user_id: UUID | None = None,
+        event_type: str,
+        role: str = "user",
+        content: dict[str, Any] | None = None,
+        parent_event_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> object:
+        event = {
+            "session_id": session_id,
+            "event_type": event_type,
+            "role": role,
+            "content": content or {},
+            "sequence_number": len(self.events) + 1,
+        }
+        self.events.append(event)
+        return event
+
+    async def get_session_events(
+        self, session_id: UUID, *, limit: int | None = None
+    ) -> list[object]:
+        events = [e for e in self.events if e["session_id"] == session_id]
+        return events[:limit] if limit is not None else events
+
+
+class RecordingLLM(LLMCallPort):
+    """Returns a fixed reply and records every prompt."""
+
+    def __init__(self, response: str = "ok", gate: asyncio.Event | None = None) -> None:
+        self._response = response
+        self._gate = gate
+        self.prompts: list[str] = []
+        self.scopes: list[tuple[UUID | None, str | None, str]] = []
+        self.users: list[UUID | None] = []
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None):
+        self.prompts.append(prompt)
+        self.scopes.append((get_org_id(), get_org_tier(), get_priority()))
+        self.users.append(get_user_id())
+        if self._gate is not None and prompt.startswith("Update the running summary"):
+            await self._gate.wait()
+        return LLMResponse(
+            text=self._response,
+            tokens_used={"input": len(prompt) // 4, "output": 5},
+            model_id=model_id,
+            finish_reason="stop",
+        )
+
+
+class RecordingUsage:
+    """Collects record_usage calls."""
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+
+    def record_usage(self, **kwargs: Any) -> None:
+        self.records.append(kwargs)
+
+
+def _history(n: int, words: int = 40) -> list[dict[str, Any]]:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"m{i} " + "word " * words}
+        for i in range(n)
+    ]
+
+
+def _policy(**overrides: int) -> SummaryPolicy:
+    values = {"trigger_tokens": 200, "keep_recent_messages": 2, "history_budget_tokens": 300}
+    values.update(overrides)
+    return SummaryPolicy(**values)
+
+
+@pytest.mark.unit
+class TestRollingSummarizer:
+    async def test_short_tail_does_not_refresh(self) -> None:
+        llm = RecordingLLM()
+        summarizer = RollingSummarizer(llm=llm, event_store=FakeEventStore(), policy=_policy())
+
+        result = await summarizer.refresh(
+            uuid4(), org_id=uuid4(), user_id=uuid4(), history=_history(3, words=5)
+        )
+
+        assert result is None
+        assert llm.prompts == []
+
+    async def test_refresh_folds_tail_and_persists_event(self) -> None:
+        store = FakeEventStore()
+        llm = RecordingLLM(response="User likes linen.")
+        summarizer = RollingSummarizer(llm=llm, event_store=store, policy=_policy())
+        session_id = uuid4()
+
+        summary = await summarizer.refresh(
+            session_id, org_id=uuid4(), user_id=uuid4(), history=_history(10)
+        )
+
+        assert summary == SessionSummary(text="User likes linen.", covered_messages=8)
+        assert "m7 " in llm.prompts[0]
+        assert "m8 " not in llm.prompts[0]  # keep_recent_messages stay verbatim
+        (event,) = store.events
+        assert event["event_type"] == SUMMARY_EVENT_TYPE
+        assert event["content"] == {"text": "User likes linen.", "covered_messages": 8}
+
+    async def test_next_refresh_builds_on_previous_summary(self) -> None:
+        store = FakeEventStore()
+        llm = RecordingLLM(response="v2")
+        session_id = uuid4()
+        await store.append_event(
+            org_id=uuid4(),
+            session_id=session_id,
+            event_type=SUMMARY_EVENT_TYPE,
+            role="system",
+            content={"text": "v1 summary", "covered_messages": 8},
+        )
+        summarizer = RollingSummarizer(llm=llm, event_store=store, policy=_policy())
+
+        summary = await summarizer.refresh(
+            session_id, org_id=uuid4(), user_id=uuid4(), history=_history(20)
+        )
+
+        assert summary is not None
+        assert summary.covered_messages == 18
+        assert "Current summary:\nv1 summary" in llm.prompts[0]
+        assert "m7 " not in llm.prompts[0]
+        assert "m8 " in llm.prompts[0]
+
+    async def test_fit_respects_budget_and_skips_covered(self) -> None:
+        summarizer = RollingSummarizer(
+            llm=RecordingLLM(), event_store=FakeEventStore(), policy=_policy()
+        )
+        history = _history(20)  # ~52 tokens per message
+
+        text, recent = summarizer.fit(history, SessionSummary("s" * 40, covered_messages=16))
+        assert text == "s" * 40
+        assert [m["content"][:3] for m in recent] == ["m16", "m17", "m18", "m19"]
+
+        _, unsummarized = summarizer.fit(history, None)
+        assert len(unsummarized) == 5  # 300-token budget
+        assert unsummarized[-1] is history[-1]
+
+        _, fitted = summarizer.fit(history, None, budget_tokens=120)
+        assert len(fitted) == 2
+
+    async def test_schedule_runs_one_refresh_per_session(self) -> None:
+        gate = asyncio.Event()
+        llm = RecordingLLM(gate=gate)
+        summarizer = RollingSummarizer(llm=llm, event_store=FakeEventStore(), policy=_policy())
+        session_id = uuid4()
+
+        for _ in range(3):
+            summarizer.schedule(session_id, org_id=uuid4(), user_id=uuid4(), history=_history(10))
+        await asyncio.sleep(0)
+        gate.set()
+        await summarizer.drain()
+
+        assert summarizer.refresh_count == 1
+
+    async def test_refresh_is_org_scoped_batch_and_metered(self) -> None:
+        llm = RecordingLLM()
+        usage = RecordingUsage()
+        summarizer = RollingSummarizer(
+            llm=llm, event_store=FakeEventStore(), policy=_policy(), usage_tracker=usage
+        )
+        org_id, user_id = uuid4(), uuid4()
+
+        summarizer.schedule(
+            uuid4(), org_id=org_id, user_id=user_id, history=_history(10), tier="enterprise"
+        )
+        await summarizer.drain()
+
+        assert llm.scopes == [(org_id, "enterprise", "batch")]
+        assert llm.users == [user_id]
+        (record,) = usage.records
+        assert record["org_id"] == org_id
+        assert record["user_id"] == user_id
+        assert record["output_tokens"] == 5
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError, match="history_budget_tokens"):
+            SummaryPolicy(history_budget_tokens=0)
+
+
+@pytest.mark.unit
+class TestEngineSummarization:
+    async def _replay(self, engine: ConversationEngine, session_id: UUID, turns: int) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        for i in range(turns):
+            history = await engine.get_session_history(session_id)
+            await engine.process_message(
+                session_id=session_id,
+                user_id=user_id,
+                org_id=org_id,
+                message=f"turn {i} " + "detail " * 40,
+                conversation_history=history,
+            )
+            assert engine.summarizer is not None
+            await engine.summarizer.drain()
+
+    async def test_long_session_prompt_stays_within_budget(self) -> None:
+        llm = RecordingLLM(response="reply " * 40)
+        engine = ConversationEngine(
+            llm=llm,
+            memory_core=EmptyMemoryCore(),
+            event_store=FakeEventStore(),
+            summary_policy=_policy(history_budget_tokens=400),
+        )
+        session_id = uuid4()
+
+        await self._replay(engine, session_id, turns=15)
+
+        chat_prompts = [p for p in llm.prompts if not p.startswith("Update the running")]
+        assert engine.summarizer is not None
+        assert engine.summarizer.refresh_count >= 2
+        assert "Summary of earlier conversation: " in chat_prompts[-1]
+        assert len(chat_prompts[-1]) // 4 < 400 + 150  # history budget + current message
+
+    async def test_fitted_context_bounds_summarized_history(self) -> None:
+        llm = RecordingLLM(response="reply " * 40)
+        engine = ConversationEngine(
+            llm=llm,
+            memory_core=EmptyMemoryCore(),
+            event_store=FakeEventStore(),
+            # No refresh and a generous policy budget: only the fitter bounds history
+            summary_policy=_policy(trigger_tokens=100_000, history_budget_tokens=100_000),
+            context_fitter=ContextFitter(
+                TokenCounter(use_tokenizer=False), BudgetAllocator(max_tokens=1200)
+            ),
+        )
+        session_id = uuid4()
+        await self._replay(engine, session_id, turns=12)
+
+        turn = await engine.process_message(
+            session_id=session_id,
+            user_id=uuid4(),
+            org_id=uuid4(),
+            message="last turn",
+            conversation_history=await engine.get_session_history(session_id),
+        )
+
+        budget = turn.context.token_budget
+        assert budget is not None
+        counter = TokenCounter(use_tokenizer=False)
+        history_lines = [
+            line
+            for line in llm.prompts[-1].split("\n\n")
+            if line.startswith(("User: ", "Assistant: ")) and line != "User: last turn"
+        ]
+        assert history_lines
+        assert sum(counter(line) for line in history_lines) <= budget.history + 100
+
+    async def test_summary_events_hidden_from_history(self) -> None:
+        store = FakeEventStore()
+        engine = ConversationEngine(
+            llm=RecordingLLM(response="reply " * 40),
+            memory_core=EmptyMemoryCore(),
+            event_store=store,
+            summary_policy=_policy(),
+        )
+        session_id = uuid4()
+
+        await self._replay(engine, session_id, turns=4)
+
+        history = await engine.get_session_history(session_id)
+        assert len(history) == 8
+        assert any(e["event_type"] == SUMMARY_EVENT_TYPE for e in store.events)
+
+    async def test_disabled_without_event_store(self) -> None:
+        engine = ConversationEngine(
+            llm=RecordingLLM(), memory_core=EmptyMemoryCore(), summary_policy=_policy()
+        )
+        assert engine.summarizer is None
@@ -4,13 +4,28 @@ Task card: B4-3
 - Truncate context when it exceeds token budget
 - Priority order: system > memory > knowledge > history
 - Higher-priority components are never truncated before lower-priority ones
+- Content is cut at sentence boundaries by counted tokens
+- ContextFitter fits memories / knowledge / history into the allocator split
 """
 
 from __future__ import annotations
 
 import pytest
 
-from src.brain.context.truncation import ContextBlock, FixedPriorityPolicy, Priority
+from src.brain.budget.allocator import BudgetAllocator
+from src.brain.context.truncation import (
+    ContextBlock,
+    ContextFitter,
+    FixedPriorityPolicy,
+    Priority,
+    split_sentences,
+    trim_to_tokens,
+)
+from src.shared.tokens import TokenCounter
+
+
+def _counter() -> TokenCounter:
+    return TokenCounter(use_tokenizer=False)  # ceil(len / 4) for ASCII
 
 
 class TestContextBlock:
@@ -114,3 +129,95 @@ class TestFixedPriorityPolicy:
         ]
         result = policy.truncate(blocks, max_tokens=300)
         assert [b.name for b in result] == ["history", "system", "memory"]
+
+
+class TestTrimToTokens:
+    """Sentence-boundary trimming by counted tokens."""
+
+    TEXT = "The shirt is linen. It ships on Friday! Do you want size M? We also have cotton."
+
+    def test_split_sentences_round_trips(self) -> None:
+        pieces = split_sentences(self.TEXT)
+
+        assert len(pieces) == 4
+        assert "".join(pieces) == self.TEXT
+
+    def test_fits_unchanged(self) -> None:
+        assert trim_to_tokens(self.TEXT, 100, _counter()) == self.TEXT
+
+    def test_keeps_whole_leading_sentences(self) -> None:
+        assert (
+            trim_to_tokens(self.TEXT, 11, _counter()) == "The shirt is linen. It ships on Friday!"
+        )
+
+    def test_falls_back_to_words(self) -> None:
+        assert trim_to_tokens(self.TEXT, 3, _counter()) == "The shirt is"
+
+    def test_cjk_sentences_and_clauses(self) -> None:
+        text = "亚麻面料，透气舒适。适合夏季穿着。"  # noqa: RUF001
+        counter = _counter()
+        assert trim_to_tokens(text, 13, counter) == text[:10]  # first sentence
+        assert trim_to_tokens(text, 7, counter) == text[:5]  # first clause
+
+    def test_zero_budget_is_empty(self) -> None:
+        assert trim_to_tokens(self.TEXT, 0, _counter()) == ""
+
+    def test_policy_with_counter_cuts_content(self) -> None:
+        counter = _counter()
+        history = "First turn here. " * 20
+        blocks = [
+            ContextBlock("system", "sys", 50, Priority.SYSTEM),
+            ContextBlock("history", history, counter(history), Priority.HISTORY),
+        ]
+
+        result = FixedPriorityPolicy(counter=counter).truncate(blocks, max_tokens=80)
+
+        trimmed = result[1]
+        assert trimmed.token_count <= 30
+        assert trimmed.token_count == counter(trimmed.content)
+        assert trimmed.content.endswith("First turn here.")
+        assert result[0].content == "sys"
+
+
+class TestContextFitter:
+    """ContextFitter: counted tokens within BudgetAllocator ratios."""
+
+    def test_small_context_kept_whole(self) -> None:
+        fitter = ContextFitter(_counter())
+        history = [{"role": "user", "content": "hi"}]
+
+        fitted = fitter.fit(memories=["likes linen"], knowledge=["fact"], history=history)
+
+        assert fitted.memories == ["likes linen"]
+        assert fitted.knowledge == ["fact"]
+        assert fitted.history == history
+
+    def test_components_cut_to_allocation(self) -> None:
+        counter = _counter()
+        fitter = ContextFitter(counter, BudgetAllocator(max_tokens=1024))
+        sentence = "The customer prefers relaxed linen shirts. "
+        memories = [sentence * 6 for _ in range(10)]
+        knowledge = [sentence * 8 for _ in range(10)]
+        history = [{"role": "user", "content": f"turn {i}. " + sentence * 4} for i in range(20)]
+
+        fitted = fitter.fit(memories=memories, knowledge=knowledge, history=history)
+
+        budget = fitted.budget
+        assert fitted.tokens["memories"] <= budget.memories
+        assert fitted.tokens["knowledge"] <= budget.knowledge
+        assert sum(fitted.tokens.values()) <= budget.memories + budget.knowledge + budget.history
+        assert 0 < len(fitted.memories) < len(memories)
+        assert fitted.memories[-1].endswith("shirts.")  # trimmed at a sentence end
+        assert fitted.history[-1] is not history[-1]  # copies, input untouched
+        assert fitted.history[-1]["content"] == history[-1]["content"]
+
+    def test_unused_budget_flows_to_history(self) -> None:
+        counter = _counter()
+        fitter = ContextFitter(counter, BudgetAllocator(max_tokens=1024))
+        history = [{"role": "user", "content": "a long message. " * 10} for _ in range(40)]
+
+        with_context = fitter.fit(memories=["m" * 400], knowledge=[], history=history)
+        history_only = fitter.fit(memories=[], knowledge=[], history=history)
+
+        assert len(history_only.history) > len(with_context.history)
+        assert history_only.tokens["history"] > with_context.tokens["history"]
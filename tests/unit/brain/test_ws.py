@@ -2,6 +2,7 @@
 
 Validates:
 - WS message handling (message, ping, close)
+- open/typing events warm the session prefetch (B4-1)
 - Session persistence across turns
 - Stream start/end signaling
 - First-byte latency (< 500ms in test env)
@@ -17,6 +18,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from src.brain.engine.conversation import ConversationEngine
+from src.brain.engine.prefetch import PrefetchPolicy
 from src.brain.engine.ws_handler import WSChatHandler, WSMessage
 from src.ports.llm_call_port import LLMCallPort, LLMResponse
 from src.ports.memory_core_port import MemoryCorePort
@@ -331,3 +333,61 @@ class TestWSChatHandler:
         await handler.handle_message(msg, sender)
         elapsed_ms = (time.monotonic() - start) * 1000
         assert elapsed_ms < 500, f"First-byte latency {elapsed_ms:.0f}ms exceeds 500ms"
+
+
+@pytest.mark.unit
+class TestWSPrefetch:
+    async def test_open_then_message_uses_warm_history(self) -> None:
+        event_store = FakeEventStore()
+        engine = ConversationEngine(
+            llm=FakeLLM(),
+            memory_core=FakeMemoryCore(),
+            event_store=event_store,
+            prefetch_policy=PrefetchPolicy(),
+        )
+        handler = WSChatHandler(engine=engine)
+        sender = FakeWSsender()
+        session_id, user_id, org_id = uuid4(), uuid4(), uuid4()
+        await event_store.append_event(
+            org_id=org_id,
+            session_id=session_id,
+            event_type="user_message",
+            content={"text": "earlier"},
+        )
+
+        opened = await handler.handle_message(
+            WSMessage(type="open", session_id=session_id, user_id=user_id, org_id=org_id),
+            sender,
+        )
+        await handler.handle_message(
+            WSMessage(
+                type="message",
+                session_id=session_id,
+                user_id=user_id,
+                org_id=org_id,
+                content="hello",
+            ),
+            sender,
+        )
+
+        assert opened.type == "prefetch"
+        assert [m["type"] for m in sender.sent] == ["stream_start", "message", "stream_end"]
+        assert engine.prefetcher is not None
+        assert engine.prefetcher.stats.hits >= 1  # history served from the prefetch
+
+    async def test_close_discards_session(self) -> None:
+        engine = ConversationEngine(
+            llm=FakeLLM(), memory_core=FakeMemoryCore(), prefetch_policy=PrefetchPolicy()
+        )
+        handler = WSChatHandler(engine=engine)
+        session_id, user_id, org_id = uuid4(), uuid4(), uuid4()
+        msg = WSMessage(type="typing", session_id=session_id, user_id=user_id, org_id=org_id)
+        await handler.handle_message(msg, FakeWSsender())
+
+        await handler.handle_message(
+            WSMessage(type="close", session_id=session_id, user_id=user_id, org_id=org_id),
+            FakeWSsender(),
+        )
+
+        assert engine.prefetcher is not None
+        assert session_id not in engine.prefetcher._sessions
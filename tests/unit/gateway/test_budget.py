@@ -14,6 +14,7 @@ from src.gateway.app import create_app
 from src.gateway.middleware.auth import encode_token
 from src.gateway.middleware.budget import BudgetPreCheckMiddleware, BudgetResolver
 from src.infra.billing.budget import BudgetStatus, TokenBudgetManager
+from src.shared.errors import QuotaExceededError
 
 _JWT_SECRET = "test-secret-for-g2-4-budget-check"  # noqa: S105
 
@@ -140,6 +141,101 @@ class TestBudgetPreCheck:
         )
         assert resp.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_in_flight_holds_reduce_remaining(
+        self,
+        client_with_budget: AsyncClient,
+        auth_headers,
+        budget_manager,
+        budget_resolver,
+        test_user,
+    ):
+        budget = budget_manager.create_budget(test_user["org_id"], 1000)
+        budget_resolver.register(test_user["org_id"], budget.id)
+
+        hold = await budget_manager.reserve(budget.id, 400)
+        resp = await client_with_budget.get("/api/v1/me", headers=auth_headers)
+        assert resp.headers.get("x-budget-remaining") == "600"
+
+        await budget_manager.reserve(budget.id, 600)
+        resp = await client_with_budget.get("/api/v1/me", headers=auth_headers)
+        assert resp.status_code == 402
+
+        await budget_manager.release(hold)
+        resp = await client_with_budget.get("/api/v1/me", headers=auth_headers)
+        assert resp.headers.get("x-budget-remaining") == "400"
+
+
+class SharedLedger:
+    """Balance kept outside the process (stands in for RedisBudgetLedger)."""
+
+    def __init__(self, balances: dict) -> None:
+        self.balances = balances
+
+    async def remaining(self, budget_id):
+        if budget_id not in self.balances:
+            raise KeyError(budget_id)
+        value = self.balances[budget_id]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+class TestLedgerBackedPreCheck:
+    """The middleware reads the ledger BudgetGuard reserves against."""
+
+    async def _get(self, ledger: SharedLedger, org_id, headers):
+        resolver = BudgetResolver()
+        budget_id = uuid4()
+        resolver.register(org_id, budget_id)
+        ledger.balances[budget_id] = ledger.balances.pop("next")
+        app = create_app(
+            jwt_secret=_JWT_SECRET,
+            post_auth_middlewares=[
+                BudgetPreCheckMiddleware(budget_manager=ledger, budget_resolver=resolver)
+            ],
+        )
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            return await c.get("/api/v1/me", headers=headers)
+
+    @pytest.mark.asyncio
+    async def test_shared_balance_drives_check_and_header(self, auth_headers, test_user):
+        resp = await self._get(SharedLedger({"next": 1234}), test_user["org_id"], auth_headers)
+        assert resp.status_code == 200
+        assert resp.headers.get("x-budget-remaining") == "1234"
+
+        resp = await self._get(SharedLedger({"next": 0}), test_user["org_id"], auth_headers)
+        assert resp.status_code == 402
+
+    @pytest.mark.asyncio
+    async def test_ledger_outage_fails_open(self, auth_headers, test_user):
+        ledger = SharedLedger({"next": ConnectionError("redis down")})
+
+        resp = await self._get(ledger, test_user["org_id"], auth_headers)
+
+        assert resp.status_code == 200
+        assert resp.headers.get("x-budget-remaining") == "unknown"
+
+
+class TestQuotaExceededHandler:
+    """A reservation refused during the request maps to 402, not 500."""
+
+    @pytest.mark.asyncio
+    async def test_reservation_rejection_returns_402(self, auth_headers):
+        app = create_app(jwt_secret=_JWT_SECRET)
+
+        @app.get("/api/v1/quota-probe")
+        async def _probe() -> None:
+            raise QuotaExceededError("tokens", limit=1000, current=900)
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            resp = await c.get("/api/v1/quota-probe", headers=auth_headers)
+
+        assert resp.status_code == 402
+        assert resp.json()["error"] == "QUOTA_EXCEEDED"
+        assert resp.headers.get("x-budget-remaining") == "100"
+
 
 class TestBudgetResolver:
     """BudgetResolver unit tests."""
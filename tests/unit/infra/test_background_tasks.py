@@ -0,0 +1,137 @@
+"""Unit tests for the in-process async task executor (I2-2).
+
+Tests: background send_task, run_task, failures, periodic schedules with
+per-org kwargs, one run per slot across workers (lease), close() cancels
+running work, active-org directory.
+Uses Fake adapters (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.infra.org.directory import PgOrgDirectory
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from tests.fakes import FakeAsyncSession, FakeSessionFactory, FakeStorage
+
+
+async def _add(a: int, b: int) -> int:
+    await asyncio.sleep(0)
+    return a + b
+
+
+async def _fail() -> None:
+    msg = "intentional failure"
+    raise RuntimeError(msg)
+
+
+@pytest.mark.unit
+class TestBackgroundTaskExecutor:
+    async def test_send_task_runs_on_the_loop(self) -> None:
+        executor = BackgroundTaskExecutor()
+        executor.register("add", _add)
+
+        task_id = executor.send_task("add", args=(2, 3))
+        result = executor.get_result(task_id)
+        assert result is not None
+        assert result.status == TaskStatus.PENDING  # returned before the body ran
+        await asyncio.sleep(0.01)
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result == 5
+
+    async def test_failures_and_unknown_tasks_are_recorded(self) -> None:
+        executor = BackgroundTaskExecutor()
+        executor.register("fail", _fail)
+
+        failed = await executor.run_task("fail")
+        unknown = executor.get_result(executor.send_task("nope"))
+
+        assert failed.status == TaskStatus.FAILURE
+        assert failed.error == "intentional failure"
+        assert unknown is not None
+        assert unknown.error == "Unknown task: nope"
+
+    async def test_schedule_runs_once_per_kwargs_set(self) -> None:
+        seen: list[str] = []
+
+        async def _job(org_id: str) -> str:
+            seen.append(org_id)
+            return org_id
+
+        async def _orgs() -> list[dict[str, Any]]:
+            return [{"org_id": "a"}, {"org_id": "b"}]
+
+        executor = BackgroundTaskExecutor()
+        executor.register("sweep", _job)
+        executor.schedule("sweep", interval_seconds=60, kwargs=_orgs)
+
+        results = await executor.run_scheduled("sweep")
+
+        assert seen == ["a", "b"]
+        assert [r.result for r in results] == ["a", "b"]
+
+    async def test_lease_lets_one_worker_run_each_slot(self) -> None:
+        runs: list[int] = []
+        now = [120.0]
+        leases = FakeStorage()
+
+        async def _job() -> None:
+            runs.append(1)
+
+        workers = [BackgroundTaskExecutor(leases=leases, clock=lambda: now[0]) for _ in range(2)]
+        for worker in workers:
+            worker.register("nightly", _job)
+            worker.schedule("nightly", interval_seconds=60)
+
+        for worker in workers:
+            await worker.run_scheduled("nightly")
+        assert len(runs) == 1
+        now[0] = 180.0  # next slot
+        for worker in workers:
+            await worker.run_scheduled("nightly")
+        assert len(runs) == 2
+
+    async def test_start_runs_the_current_slot_and_close_cancels(self) -> None:
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def _job() -> None:
+            started.set()
+            await release.wait()
+
+        executor = BackgroundTaskExecutor()
+        executor.register("nightly", _job)
+        executor.schedule("nightly", interval_seconds=3600)
+
+        executor.start()
+        await asyncio.wait_for(started.wait(), timeout=1)
+        await executor.close()
+
+        results = [executor.get_result(task_id) for task_id in list(executor._results)]
+        assert [r.error for r in results if r is not None] == ["cancelled"]
+
+    def test_schedule_validation(self) -> None:
+        executor = BackgroundTaskExecutor()
+        with pytest.raises(ValueError, match="Unknown task"):
+            executor.schedule("nope", interval_seconds=60)
+        executor.register("add", _add)
+        with pytest.raises(ValueError, match="interval_seconds"):
+            executor.schedule("add", interval_seconds=0)
+
+
+@pytest.mark.unit
+class TestPgOrgDirectory:
+    async def test_active_org_ids(self) -> None:
+        org_ids = [uuid4(), uuid4()]
+        session = FakeAsyncSession()
+        session.set_scalars_result(org_ids)
+        directory = PgOrgDirectory(session_factory=FakeSessionFactory(session))  # type: ignore[arg-type]
+
+        assert await directory.active_org_ids() == org_ids
+        compiled = str(session.scalars_calls[0])
+        assert "is_active" in compiled
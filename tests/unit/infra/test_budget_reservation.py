@@ -0,0 +1,285 @@
+"""Unit tests for token budget reservations (I2-3b).
+
+Tests: reserve / settle / release on the in-memory TokenBudgetManager and
+the Redis ledger (hold accounting, over-limit rejection, actual usage
+charged past the hold, expired holds reclaimed, idempotent release,
+hold removal and return committed together under WATCH).
+Uses a local in-memory FakeRedis (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import WatchError
+
+from src.infra.billing.budget import BudgetStatus, TokenBudgetManager
+from src.infra.billing.redis_ledger import RedisBudgetLedger
+from src.shared.errors import QuotaExceededError
+
+
+class FakeRedis:
+    """Hashes, sorted sets, MULTI pipelines and WATCH; each command is atomic."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.versions: dict[str, int] = {}  # bumped on every write, for WATCH
+        self.on_watch: Any = None  # runs between WATCH and EXEC (a racing worker)
+
+    def _touch(self, key: str) -> None:
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    async def hset(self, key: str, mapping: dict[str, int]) -> int:
+        self._touch(key)
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def hget(self, key: str, field: str) -> bytes | None:
+        value = self.hashes.get(key, {}).get(field)
+        return None if value is None else str(value).encode()
+
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]:
+        return [await self.hget(key, f) for f in fields]
+
+    async def hincrby(self, key: str, field: str, amount: int) -> int:
+        self._touch(key)
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = fields.get(field, 0) + amount
+        return fields[field]
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self._touch(key)
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zrem(self, key: str, member: str) -> int:
+        self._touch(key)
+        return 1 if self.zsets.get(key, {}).pop(member, None) is not None else 0
+
+    async def zscore(self, key: str, member: str) -> float | None:
+        return self.zsets.get(key, {}).get(member)
+
+    async def zrangebyscore(
+        self, key: str, low: str, high: float, start: int = 0, num: int = -1
+    ) -> list[bytes]:
+        members = sorted((s, m) for m, s in self.zsets.get(key, {}).items() if s <= high)
+        return [m.encode() for _, m in members[start : start + num]]
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands; after watch() and before multi() they run immediately."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+        self._watched: dict[str, int] = {}
+        self._immediate = False
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self._reset()
+
+    async def watch(self, *keys: str) -> None:
+        self._watched = {k: self._redis.versions.get(k, 0) for k in keys}
+        self._immediate = True
+
+    def multi(self) -> None:
+        self._immediate = False
+
+    def __getattr__(self, name: str) -> Any:
+        if self._immediate:
+            return getattr(self._redis, name)
+
+        def queue(*args: Any) -> FakePipeline:
+            self._commands.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        try:
+            if self._redis.on_watch is not None and self._watched:
+                hook, self._redis.on_watch = self._redis.on_watch, None
+                await hook()
+            if any(self._redis.versions.get(k, 0) != v for k, v in self._watched.items()):
+                raise WatchError
+            return [await getattr(self._redis, name)(*args) for name, args in self._commands]
+        finally:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._commands = []
+        self._watched = {}
+        self._immediate = False
+
+
+def _ledger(clock: list[float]) -> tuple[RedisBudgetLedger, FakeRedis]:
+    ledger = RedisBudgetLedger(clock=lambda: clock[0])
+    fake = FakeRedis()
+    ledger._client = fake
+    return ledger, fake
+
+
+@pytest.mark.unit
+class TestTokenBudgetManagerReservations:
+    async def test_hold_counts_against_available_until_settled(self) -> None:
+        manager = TokenBudgetManager()
+        budget = manager.create_budget(uuid4(), total_tokens=1000)
+
+        hold = await manager.reserve(budget.id, 600)
+        assert budget.reserved_tokens == 600
+        assert budget.available_tokens == 400
+        with pytest.raises(QuotaExceededError):
+            await manager.reserve(budget.id, 500)
+
+        receipt = await manager.settle(hold, 250)
+        assert receipt.tokens_deducted == 250
+        assert budget.used_tokens == 250
+        assert budget.reserved_tokens == 0
+        assert budget.available_tokens == 750
+
+    async def test_actual_usage_charged_past_the_limit(self) -> None:
+        manager = TokenBudgetManager()
+        budget = manager.create_budget(uuid4(), total_tokens=100)
+
+        hold = await manager.reserve(budget.id, 80)
+        receipt = await manager.settle(hold, 130)
+
+        assert budget.used_tokens == 130
+        assert receipt.tokens_remaining == 0
+        assert budget.status == BudgetStatus.EXHAUSTED
+        with pytest.raises(QuotaExceededError):
+            await manager.reserve(budget.id, 1)
+
+    async def test_release_and_expiry_return_the_hold(self) -> None:
+        now = [0.0]
+        manager = TokenBudgetManager(clock=lambda: now[0])
+        budget = manager.create_budget(uuid4(), total_tokens=1000)
+
+        hold = await manager.reserve(budget.id, 400)
+        await manager.release(hold)
+        await manager.release(hold)  # idempotent
+        assert budget.reserved_tokens == 0
+
+        await manager.reserve(budget.id, 900, ttl_seconds=10)
+        now[0] = 11.0
+        await manager.reserve(budget.id, 900)  # expired hold reclaimed
+        assert budget.reserved_tokens == 900
+
+    async def test_deduct_respects_holds(self) -> None:
+        manager = TokenBudgetManager()
+        budget = manager.create_budget(uuid4(), total_tokens=100)
+        await manager.reserve(budget.id, 60)
+
+        with pytest.raises(PermissionError, match="Insufficient"):
+            manager.deduct(budget.id, 50)
+        assert budget.status == BudgetStatus.ACTIVE  # held, not spent
+
+
+@pytest.mark.unit
+class TestRedisBudgetLedger:
+    async def test_reserve_settle_release(self) -> None:
+        ledger, _ = _ledger([0.0])
+        budget_id = uuid4()
+        await ledger.set_budget(budget_id, 1000)
+
+        hold = await ledger.reserve(budget_id, 700)
+        assert await ledger.remaining(budget_id) == 300
+        with pytest.raises(QuotaExceededError) as exc_info:
+            await ledger.reserve(budget_id, 400)
+        assert exc_info.value.current == 700
+        assert await ledger.remaining(budget_id) == 300  # rejected hold rolled back
+
+        receipt = await ledger.settle(hold, 200)
+        assert receipt.tokens_remaining == 800
+        assert await ledger.remaining(budget_id) == 800
+
+        second = await ledger.reserve(budget_id, 100)
+        await ledger.release(second)
+        await ledger.release(second)
+        assert await ledger.remaining(budget_id) == 800
+
+    async def test_concurrent_reservations_never_overdraw(self) -> None:
+        ledger, _ = _ledger([0.0])
+        budget_id = uuid4()
+        await ledger.set_budget(budget_id, 1000)
+
+        results = await asyncio.gather(
+            *(ledger.reserve(budget_id, 300) for _ in range(5)), return_exceptions=True
+        )
+
+        admitted = [r for r in results if not isinstance(r, BaseException)]
+        assert len(admitted) == 3
+        assert all(isinstance(r, QuotaExceededError) for r in results if r not in admitted)
+        assert await ledger.remaining(budget_id) == 100
+
+    async def test_expired_holds_are_swept(self) -> None:
+        now = [1000.0]
+        ledger, fake = _ledger(now)
+        budget_id = uuid4()
+        await ledger.set_budget(budget_id, 1000)
+        stale = await ledger.reserve(budget_id, 900, ttl_seconds=30)
+
+        now[0] += 31
+        await ledger.reserve(budget_id, 900)
+        receipt = await ledger.settle(stale, 50)  # late settle: usage still charged
+
+        assert receipt.tokens_deducted == 50
+        assert await ledger.remaining(budget_id) == 1000 - 900 - 50
+        assert len(fake.zsets[f"billing:budget:{budget_id}:holds"]) == 1
+
+    async def test_settle_racing_sweep_returns_hold_once(self) -> None:
+        now = [1000.0]
+        ledger, fake = _ledger(now)
+        budget_id = uuid4()
+        await ledger.set_budget(budget_id, 1000)
+        hold = await ledger.reserve(budget_id, 600, ttl_seconds=30)
+        now[0] += 31
+
+        # Another worker's sweep returns the expired hold between WATCH and EXEC
+        async def sweep() -> None:
+            await ledger._sweep_expired(fake, budget_id)
+
+        fake.on_watch = sweep
+        receipt = await ledger.settle(hold, 100)
+
+        assert receipt.tokens_deducted == 100
+        assert fake.hashes[f"billing:budget:{budget_id}"]["reserved"] == 0
+        assert await ledger.remaining(budget_id) == 900
+
+    async def test_hold_removal_and_return_commit_together(self) -> None:
+        ledger, fake = _ledger([0.0])
+        budget_id = uuid4()
+        await ledger.set_budget(budget_id, 1000)
+        hold = await ledger.reserve(budget_id, 400)
+
+        async def crash() -> None:
+            msg = "worker lost before EXEC"
+            raise ConnectionError(msg)
+
+        fake.on_watch = crash
+        with pytest.raises(ConnectionError):
+            await ledger.settle(hold, 100)
+
+        # Nothing applied: the hold is still there to be settled or swept
+        assert await ledger.remaining(budget_id) == 600
+        await ledger.settle(hold, 100)
+        assert await ledger.remaining(budget_id) == 900
+
+    async def test_unknown_budget(self) -> None:
+        ledger, _ = _ledger([0.0])
+        budget_id = uuid4()
+
+        with pytest.raises(KeyError):
+            await ledger.reserve(budget_id, 10)
+        with pytest.raises(KeyError):
+            await ledger.remaining(budget_id)
@@ -0,0 +1,308 @@
+"""Unit tests for the Memory Core PostgreSQL batch-job adapters.
+
+Tests: PgConsolidationSource, PgPurgeStore and PgPromotionSource statement
+shape and row mapping, using Fake sessions (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.infra.memory import (
+    PgCompletedSessions,
+    PgConsolidationSource,
+    PgPromotionSource,
+    PgPurgeStore,
+)
+from src.memory.consolidation import Cluster
+from src.memory.deletion.purge import PurgeRequest
+from src.memory.promotion.pipeline import EvolutionProposal, PromotionThresholds
+from src.memory.working_set import MemoryWorkingSet
+from src.shared.similarity import band_keys, minhash_signature
+from src.shared.types import MemoryItem
+from tests.fakes import FakeAsyncSession, FakeOrmRow, FakeResult, FakeSessionFactory
+
+_LATER = datetime.now(UTC) + timedelta(days=10)
+
+
+def _item(confidence: float = 0.5, memory_type: str = "preference") -> MemoryItem:
+    return MemoryItem(
+        memory_id=uuid4(),
+        user_id=uuid4(),
+        memory_type=memory_type,
+        content="x",
+        confidence=confidence,
+        valid_at=datetime.now(UTC),
+    )
+
+
+@pytest.mark.unit
+class TestPgConsolidationSource:
+    async def test_similar_pairs_single_statement(self) -> None:
+        a, b = uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(a=a, b=b, sim=0.97)])
+        source = PgConsolidationSource(session_factory=FakeSessionFactory(session))
+
+        pairs = await source.similar_pairs(uuid4(), [a, b], threshold=0.9)
+
+        assert pairs == [(a, b, pytest.approx(0.97))]
+        sql, params = session.execute_calls[0]
+        assert "a.embedding <=> b.embedding" in str(sql)
+        assert "a.memory_type" in str(sql)
+        assert params["threshold"] == 0.9
+        assert params["ids"] == [str(a), str(b)]
+
+    async def test_similar_pairs_skips_tiny_batches(self) -> None:
+        session = FakeAsyncSession()
+        source = PgConsolidationSource(session_factory=FakeSessionFactory(session))
+        assert await source.similar_pairs(uuid4(), [uuid4()], threshold=0.9) == []
+        assert session.execute_calls == []
+
+    async def test_band_buckets_backfill_missing_bands(self) -> None:
+        unbanded, a, b = uuid4(), uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_results(
+            [
+                FakeResult(fetchall_rows=[(unbanded, "likes green tea")]),
+                FakeResult(),
+                FakeResult(fetchall_rows=[([a, b],)]),
+            ]
+        )
+        source = PgConsolidationSource(session_factory=FakeSessionFactory(session))
+
+        buckets = await source.band_buckets(uuid4(), uuid4())
+
+        assert buckets == [[a, b]]
+        select_sql, backfill, bucket_sql = (call[0] for call in session.execute_calls)
+        assert "minhash_bands IS NULL" in str(select_sql)
+        assert session.execute_calls[1][1] == [
+            {"id": str(unbanded), "bands": band_keys(minhash_signature("likes green tea"))}
+        ]
+        assert "SET minhash_bands" in str(backfill)
+        assert "unnest(minhash_bands)" in str(bucket_sql)
+        assert "GROUP BY b.memory_type, b.band" in str(bucket_sql)
+        assert session.commit_count == 1
+
+    async def test_get_active_filters_retired_rows(self) -> None:
+        session = FakeAsyncSession()
+        session.set_scalars_result([])
+        source = PgConsolidationSource(session_factory=FakeSessionFactory(session))
+
+        await source.get_active(uuid4(), [uuid4(), uuid4()])
+
+        sql = str(session.scalars_calls[0])
+        assert "memory_items.id IN" in sql
+        assert "superseded_by IS NULL" in sql
+
+    async def test_merge_is_one_transaction(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_results(
+            [FakeResult(scalar_one_or_none_value=user_id), FakeResult(rowcount=2)]
+        )
+        working_set = MemoryWorkingSet()
+        source = PgConsolidationSource(
+            session_factory=FakeSessionFactory(session), working_set=working_set
+        )
+        leader = _item(0.6)
+        member = MemoryItem(
+            memory_id=uuid4(),
+            user_id=user_id,
+            memory_type="preference",
+            content="enjoys green tea",
+            confidence=0.8,
+            valid_at=datetime.now(UTC),
+            source_sessions=[uuid4()],
+        )
+        await working_set.put(user_id, "tea", 5, [leader], org_id=org_id)
+
+        new_id = await source.merge(org_id, Cluster(leader=leader, members=[member]))
+
+        (insert_sql, insert_params), (update_sql, update_params) = session.execute_calls
+        assert "src.embedding" in str(insert_sql)
+        assert "src.superseded_by IS NULL" in str(insert_sql)
+        assert insert_params["new_id"] == str(new_id)
+        assert insert_params["confidence"] == 0.8
+        assert insert_params["source_sessions"] == [str(member.source_sessions[0])]
+        assert "superseded_by IS NULL" in str(update_sql)
+        assert update_params["ids"] == [str(leader.memory_id), str(member.memory_id)]
+        assert session.commit_count == 1
+        assert await working_set.get(user_id, "tea", 5, org_id=org_id) is None
+
+    async def test_merge_applies_nothing_if_a_member_was_retired(self) -> None:
+        session = FakeAsyncSession()
+        session.set_execute_results(
+            [FakeResult(scalar_one_or_none_value=uuid4()), FakeResult(rowcount=1)]
+        )
+        source = PgConsolidationSource(session_factory=FakeSessionFactory(session))
+        cluster = Cluster(leader=_item(0.6), members=[_item(0.5)])
+
+        with pytest.raises(KeyError, match="changed during the merge"):
+            await source.merge(uuid4(), cluster)
+        assert session.commit_count == 0
+
+    async def test_merge_rejects_a_retired_leader(self) -> None:
+        session = FakeAsyncSession()
+        session.set_execute_results([FakeResult()])
+        source = PgConsolidationSource(session_factory=FakeSessionFactory(session))
+
+        with pytest.raises(KeyError, match="no longer active"):
+            await source.merge(uuid4(), Cluster(leader=_item(0.6), members=[_item(0.5)]))
+        assert len(session.execute_calls) == 1
+        assert session.commit_count == 0
+
+
+@pytest.mark.unit
+class TestPgPurgeStore:
+    async def test_fetch_chunk_keyset_by_user(self) -> None:
+        mid = uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(id=mid, keys=["a.png"])])
+        store = PgPurgeStore(session_factory=FakeSessionFactory(session))
+        request = PurgeRequest(job_id=uuid4(), org_id=uuid4(), user_id=uuid4())
+
+        targets = await store.fetch_chunk(request, after=uuid4(), limit=500)
+
+        assert targets[0].memory_id == mid
+        assert targets[0].object_keys == ("a.png",)
+        sql = str(session.execute_calls[0][0])
+        assert "memory_items.user_id" in sql
+        assert "memory_items.id >" in sql
+        assert "ORDER BY memory_items.id" in sql
+
+    async def test_delete_rows_single_statement(self) -> None:
+        session = FakeAsyncSession()
+        session.set_execute_result(rowcount=3)
+        store = PgPurgeStore(session_factory=FakeSessionFactory(session))
+
+        deleted = await store.delete_rows(uuid4(), [uuid4(), uuid4(), uuid4()])
+
+        assert deleted == 3
+        assert len(session.execute_calls) == 1
+        assert str(session.execute_calls[0][0]).startswith("DELETE FROM memory_items")
+        assert session.committed is True
+
+
+@pytest.mark.unit
+class TestPgPromotionSource:
+    async def test_scan_candidates_single_statement(self) -> None:
+        mid, user_id = uuid4(), uuid4()
+        row = FakeOrmRow(
+            id=mid,
+            user_id=user_id,
+            memory_type="preference",
+            content="likes linen",
+            confidence=0.9,
+            epistemic_type="fact",
+            version=1,
+            source_sessions=None,
+            provenance=None,
+            valid_at=datetime.now(UTC),
+            frequency=4,
+            embedding="[0.5,0.25]",
+        )
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[row])
+        source = PgPromotionSource(session_factory=FakeSessionFactory(session))
+
+        candidates = await source.scan_candidates(
+            uuid4(), thresholds=PromotionThresholds(), after=None, limit=100, now=_LATER
+        )
+
+        assert candidates[0].memory.memory_id == mid
+        assert candidates[0].frequency_30d == 4
+        assert candidates[0].embedding == [0.5, 0.25]
+        sql, params = session.execute_calls[0]
+        assert "CROSS JOIN LATERAL" in str(sql)
+        assert "FROM memory_receipt_daily d" in str(sql)
+        assert "NOT EXISTS" in str(sql)
+        assert params["frequency_min"] == 3
+        assert params["after"] == str(UUID(int=0))
+        assert params["oldest"] == _LATER - timedelta(days=7)
+
+    async def test_save_proposals_upsert_do_nothing(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        org_id, user_id = uuid4(), uuid4()
+        proposals = [
+            EvolutionProposal(
+                proposal_id=uuid4(),
+                source_memory_id=uuid4(),
+                sanitized_content=content,
+                confidence=0.9,
+                target_org_id=org_id,
+                target_visibility="brand",
+                user_id=user_id,
+            )
+            for content in ("likes linen", "other")
+        ]
+        session = FakeAsyncSession()
+        session.set_execute_result(rowcount=2)
+        source = PgPromotionSource(session_factory=FakeSessionFactory(session))
+
+        saved = await source.save_proposals(org_id, proposals)
+
+        assert saved == 2
+        assert len(session.execute_calls) == 1
+        assert session.commit_count == 1
+        sql = str(session.execute_calls[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO memory_promotion_proposals")
+        assert "ON CONFLICT (source_memory_id) DO NOTHING" in sql
+
+    async def test_pending_counts_grouped(self) -> None:
+        user_id = uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(user_id=user_id, n=4)])
+        source = PgPromotionSource(session_factory=FakeSessionFactory(session))
+
+        counts = await source.pending_counts(uuid4(), [user_id])
+
+        assert counts == {user_id: 4}
+        assert "GROUP BY memory_promotion_proposals.user_id" in str(session.execute_calls[0][0])
+
+
+@pytest.mark.unit
+class TestPgCompletedSessions:
+    async def test_stream_pages_sessions_of_one_day(self) -> None:
+        first, second, org_id, user_id = uuid4(), uuid4(), uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_results(
+            [
+                FakeResult(fetchall_rows=[(first, org_id, str(user_id))]),
+                FakeResult(
+                    fetchall_rows=[
+                        (first, "user", "I wear size M"),
+                        (first, "assistant", "Noted"),
+                        (first, "user", None),
+                    ]
+                ),
+                FakeResult(fetchall_rows=[(second, org_id, str(user_id))]),
+                FakeResult(fetchall_rows=[]),
+            ]
+        )
+        source = PgCompletedSessions(session_factory=FakeSessionFactory(session), page_size=1)
+
+        sessions = [s async for s in source.stream("2026-10-18")]
+
+        assert [s.session_id for s in sessions] == [first, second]
+        assert sessions[0].user_id == user_id
+        assert sessions[0].messages == [
+            {"role": "user", "content": "I wear size M"},
+            {"role": "assistant", "content": "Noted"},
+        ]
+        assert sessions[1].messages == []
+        page_sql, params = session.execute_calls[0]
+        assert "HAVING max(created_at) >= :start" in str(page_sql)
+        assert params["start"] == datetime(2026, 10, 18, tzinfo=UTC)
+        assert params["end"] == datetime(2026, 10, 19, tzinfo=UTC)
+        assert params["after"] == UUID(int=0)
+        assert session.execute_calls[2][1]["after"] == first
+        assert session.execute_calls[1][1]["session_ids"] == [first]
+
+    def test_rejects_non_positive_page_size(self) -> None:
+        with pytest.raises(ValueError, match="page_size"):
+            PgCompletedSessions(session_factory=FakeSessionFactory(FakeAsyncSession()), page_size=0)
@@ -5,6 +5,7 @@ These tests catch drift between models.py and migration files.
 
 Phase 1 (I1-1): organizations, users, org_members, org_settings
 Phase 1 (I1-5): audit_events
+Phase 2 (I2-3c): tool_usage_records (006), llm_usage_records (012)
 """
 
 from __future__ import annotations
@@ -14,9 +15,11 @@ import pytest
 from src.infra.models import (
     AuditEvent,
     Base,
+    LLMUsageRecordModel,
     Organization,
     OrgMember,
     OrgSettings,
+    ToolUsageRecordModel,
     User,
 )
 
@@ -197,6 +200,43 @@ class TestAuditEventModel:
         assert "updated_at" not in cols
 
 
+@pytest.mark.unit
+class TestUsageRecordModels:
+    """Verify usage ORM models match 006 / 012 migrations."""
+
+    def test_llm_usage_columns(self) -> None:
+        assert LLMUsageRecordModel.__tablename__ == "llm_usage_records"
+        expected = {
+            "id",
+            "org_id",
+            "user_id",
+            "brand_id",
+            "model_id",
+            "provider",
+            "input_tokens",
+            "output_tokens",
+            "total_tokens",
+            "cost_amount",
+            "skill_id",
+            "task_id",
+            "created_at",
+        }
+        assert _col_names(LLMUsageRecordModel) == expected
+        for column in ("brand_id", "provider", "cost_amount", "skill_id", "task_id"):
+            assert LLMUsageRecordModel.__table__.c[column].nullable is True
+
+    def test_tool_usage_columns(self) -> None:
+        assert ToolUsageRecordModel.__tablename__ == "tool_usage_records"
+        cols = _col_names(ToolUsageRecordModel)
+        assert {"tool_name", "cost_amount", "billing_unit", "status"}.issubset(cols)
+        assert ToolUsageRecordModel.__table__.c.brand_id.nullable is True
+
+    def test_org_id_has_fk_to_organizations(self) -> None:
+        for model in (LLMUsageRecordModel, ToolUsageRecordModel):
+            fks = {str(fk.target_fullname) for fk in model.__table__.c.org_id.foreign_keys}
+            assert "organizations.id" in fks
+
+
 @pytest.mark.unit
 class TestBaseMetadata:
     """Verify Base.metadata includes all Phase 1 tables."""
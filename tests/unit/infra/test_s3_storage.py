@@ -0,0 +1,115 @@
+"""S3StorageAdapter unit tests (StoragePort over object storage).
+
+Tests: JSON round trip, body read off the loop, missing keys, prefixing, paginated glob listing.
+
+No unittest.mock / MagicMock / patch — uses a Fake S3 client class.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.infra.storage.s3_storage import S3StorageAdapter
+
+
+class ThreadRecordingBody(io.BytesIO):
+    """Object body that records which thread read it."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.read_threads: list[int] = []
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.read_threads.append(threading.get_ident())
+        return super().read(size)
+
+
+class FakeS3Client:
+    """Dict-backed subset of the boto3 S3 client API."""
+
+    def __init__(self, page_size: int = 1000) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.list_calls = 0
+        self.bodies: list[ThreadRecordingBody] = []
+        self._page_size = page_size
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **_: Any) -> None:  # noqa: N803
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body = ThreadRecordingBody(self.objects[(Bucket, Key)])
+        self.bodies.append(body)
+        return {"Body": body}
+
+    def delete_object(self, *, Bucket: str, Key: str) -> None:  # noqa: N803
+        self.objects.pop((Bucket, Key), None)
+
+    def list_objects_v2(
+        self,
+        *,
+        Bucket: str,  # noqa: N803
+        Prefix: str,  # noqa: N803
+        ContinuationToken: str | None = None,  # noqa: N803
+    ) -> dict[str, Any]:
+        self.list_calls += 1
+        keys = sorted(k for b, k in self.objects if b == Bucket and k.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + self._page_size]
+        resp: dict[str, Any] = {"Contents": [{"Key": k} for k in page]}
+        if start + self._page_size < len(keys):
+            resp["IsTruncated"] = True
+            resp["NextContinuationToken"] = str(start + self._page_size)
+        return resp
+
+
+@pytest.mark.unit
+class TestS3StorageAdapter:
+    async def test_put_get_round_trip_under_prefix(self) -> None:
+        client = FakeS3Client()
+        storage = S3StorageAdapter("archive", prefix="diyu/", client=client)
+
+        await storage.put("a:b", {"events": 3, "data": "xyz"}, ttl=60)
+
+        assert ("archive", "diyu/a:b") in client.objects
+        assert await storage.get("a:b") == {"events": 3, "data": "xyz"}
+
+    async def test_body_is_read_off_the_event_loop(self) -> None:
+        client = FakeS3Client()
+        storage = S3StorageAdapter("archive", client=client)
+        await storage.put("k", {"v": 1})
+
+        assert await storage.get("k") == {"v": 1}
+        assert client.bodies[0].read_threads
+        assert threading.get_ident() not in client.bodies[0].read_threads
+
+    async def test_missing_key_returns_none(self) -> None:
+        storage = S3StorageAdapter("archive", client=FakeS3Client())
+        assert await storage.get("nope") is None
+
+    async def test_delete(self) -> None:
+        storage = S3StorageAdapter("archive", client=FakeS3Client())
+        await storage.put("k", 1)
+        await storage.delete("k")
+        assert await storage.get("k") is None
+
+    async def test_list_keys_globs_across_pages(self) -> None:
+        client = FakeS3Client(page_size=2)
+        storage = S3StorageAdapter("archive", prefix="p/", client=client)
+        for key in ("x:2026-01:a", "x:2026-01:b", "x:2026-02:a", "x:month:2026-01", "y:1"):
+            await storage.put(key, 0)
+
+        keys = await storage.list_keys("x:2026-0?:a")
+
+        assert sorted(keys) == ["x:2026-01:a", "x:2026-02:a"]
+        assert client.list_calls == 2  # only the "x:2026-0" prefix is listed
+
+    def test_client_requires_connect(self) -> None:
+        with pytest.raises(RuntimeError, match="connect"):
+            _ = S3StorageAdapter("archive").client
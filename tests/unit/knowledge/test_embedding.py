@@ -0,0 +1,61 @@
+"""Embedding adapter tests.
+
+Tests: deterministic embedder shape, CoalescingEmbedder sharing one
+embedding call between concurrent identical texts.
+Uses Fake adapter pattern (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from src.knowledge.embedding import CoalescingEmbedder, DeterministicEmbedder
+
+
+class SlowEmbedder:
+    """Blocks in the worker thread until released; counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+
+    def embed(self, text: str) -> list[float]:
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return [float(len(text))]
+
+
+class TestDeterministicEmbedder:
+    def test_same_text_same_unit_vector(self) -> None:
+        embedder = DeterministicEmbedder(dim=8)
+
+        vector = embedder.embed("linen")
+
+        assert vector == embedder.embed("linen")
+        assert abs(sum(x * x for x in vector) - 1.0) < 1e-9
+
+
+class TestCoalescingEmbedder:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_texts_embed_once(self) -> None:
+        inner = SlowEmbedder()
+        embedder = CoalescingEmbedder(inner)
+
+        calls = [asyncio.ensure_future(embedder.aembed("linen shirt")) for _ in range(8)]
+        calls.append(asyncio.ensure_future(embedder.aembed("wool coat")))
+        await asyncio.sleep(0.01)
+        inner.release.set()
+        vectors = await asyncio.gather(*calls)
+
+        assert inner.calls == 2
+        assert vectors[0] == [11.0]
+        assert embedder.stats.local_shared == 7
+
+    def test_sync_embed_passes_through(self) -> None:
+        inner = SlowEmbedder()
+        inner.release.set()
+
+        assert CoalescingEmbedder(inner).embed("abc") == [3.0]
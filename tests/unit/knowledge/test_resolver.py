@@ -1,12 +1,13 @@
 """K3-5: Diyu Resolver tests.
 
 Tests: profile resolution, graph-only and graph-first strategies,
-entity grouping, error handling.
+entity grouping, error handling, singleflight coalescing.
 Uses Fake adapter pattern (no unittest.mock).
 """
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import uuid4
@@ -14,7 +15,9 @@ from uuid import uuid4
 import pytest
 
 from src.knowledge.resolver.resolver import BUILTIN_PROFILES, DiyuResolver, ResolverProfile
+from src.shared.singleflight import LeasePolicy, SingleFlight
 from src.shared.types import OrganizationContext
+from tests.fakes import FakeStorage
 
 # -- Fake adapters --
 
@@ -68,6 +71,23 @@ class FakeNeo4jAdapter:
         return self._driver
 
 
+class CountingSession(FakeSession):
+    """Yields to the event loop before answering, so calls overlap."""
+
+    runs = 0
+
+    async def run(self, query: str, **kwargs: Any) -> FakeResult:
+        CountingSession.runs += 1
+        await asyncio.sleep(0.01)
+        return FakeResult(self._records)
+
+
+@dataclass
+class CountingDriver(FakeDriver):
+    def session(self) -> FakeSession:
+        return CountingSession(self._records)
+
+
 @dataclass
 class FakeQdrantAdapter:
     _collection_name: str = "knowledge_vectors"
@@ -163,3 +183,75 @@ class TestResolverProfileRegistration:
         )
         resolver.register_profile(profile)
         assert resolver.get_profile("custom:test") is not None
+
+
+class TestResolverSingleflight:
+    @staticmethod
+    def _records() -> list[dict[str, Any]]:
+        return [
+            {
+                "n": {"node_id": str(uuid4()), "org_id": str(uuid4()), "rule": "formal"},
+                "labels": ["RoleAdaptationRule"],
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_burst_for_one_org_hits_graph_once(self) -> None:
+        CountingSession.runs = 0
+        neo4j = FakeNeo4jAdapter(_driver=CountingDriver(_records=self._records()))
+        resolver = DiyuResolver(neo4j, FakeQdrantAdapter(), singleflight=SingleFlight())  # type: ignore[arg-type]
+        org_id = uuid4()
+        users = [
+            OrganizationContext(
+                user_id=uuid4(), org_id=org_id, org_tier="brand_hq", org_path="root"
+            )
+            for _ in range(20)
+        ]
+
+        bundles = await asyncio.gather(
+            *(resolver.resolve("core:role_adaptation", "q", org) for org in users)
+        )
+
+        assert CountingSession.runs == 1
+        assert all(b == bundles[0] for b in bundles)
+
+    @pytest.mark.asyncio
+    async def test_different_orgs_resolve_separately(self) -> None:
+        CountingSession.runs = 0
+        neo4j = FakeNeo4jAdapter(_driver=CountingDriver(_records=self._records()))
+        resolver = DiyuResolver(neo4j, FakeQdrantAdapter(), singleflight=SingleFlight())  # type: ignore[arg-type]
+        orgs = [
+            OrganizationContext(
+                user_id=uuid4(), org_id=uuid4(), org_tier="brand_hq", org_path="root"
+            )
+            for _ in range(2)
+        ]
+
+        await asyncio.gather(*(resolver.resolve("core:role_adaptation", "q", o) for o in orgs))
+
+        assert CountingSession.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_lease_hands_bundle_to_other_worker(self) -> None:
+        CountingSession.runs = 0
+        store = FakeStorage()
+        policy = LeasePolicy(poll_interval=0.001)
+        neo4j = FakeNeo4jAdapter(_driver=CountingDriver(_records=self._records()))
+        workers = [
+            DiyuResolver(
+                neo4j,  # type: ignore[arg-type]
+                FakeQdrantAdapter(),
+                singleflight=SingleFlight(store=store, policy=policy),
+            )
+            for _ in range(2)
+        ]
+        org = OrganizationContext(
+            user_id=uuid4(), org_id=uuid4(), org_tier="brand_hq", org_path="root"
+        )
+
+        local, remote = await asyncio.gather(
+            *(w.resolve("core:role_adaptation", "q", org) for w in workers)
+        )
+
+        assert CountingSession.runs == 1
+        assert remote == local  # round-tripped through the store
@@ -140,3 +140,55 @@ class TestIsStale:
             )
             is False
         )
+
+
+@pytest.mark.unit
+class TestEffectiveConfidenceExpr:
+    """Decay formula pushed into SQL for ranking/filtering."""
+
+    def _compile(self, expr) -> str:
+        from sqlalchemy.dialects import postgresql
+
+        return str(expr.compile(dialect=postgresql.dialect()))
+
+    def test_expression_mirrors_python_formula(self) -> None:
+        from src.infra.models import MemoryItemModel
+        from src.memory.confidence import effective_confidence_expr
+
+        expr = effective_confidence_expr(
+            MemoryItemModel.confidence,
+            MemoryItemModel.valid_at,
+            MemoryItemModel.last_validated_at,
+            now=datetime.now(UTC),
+        )
+        sql = self._compile(expr)
+
+        assert "power(" in sql
+        assert "coalesce(memory_items.last_validated_at, memory_items.valid_at)" in sql
+        assert "greatest(" in sql
+
+    def test_reusable_in_where_and_order_by(self) -> None:
+        import sqlalchemy as sa
+
+        from src.infra.models import MemoryItemModel
+        from src.memory.confidence import effective_confidence_expr
+
+        expr = effective_confidence_expr(
+            MemoryItemModel.confidence,
+            MemoryItemModel.valid_at,
+            MemoryItemModel.last_validated_at,
+            now=datetime.now(UTC),
+            half_life_days=30.0,
+        )
+        stmt = sa.select(MemoryItemModel).where(expr >= 0.3).order_by(expr.desc())
+        sql = self._compile(stmt)
+
+        assert sql.count("power(") == 2
+        assert "ORDER BY" in sql
+
+    def test_decay_ranking_defaults_match_python(self) -> None:
+        from src.memory.confidence import DecayRanking
+
+        ranking = DecayRanking()
+        assert ranking.half_life_days == 90.0
+        assert ranking.stale_threshold is None
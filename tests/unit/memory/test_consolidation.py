@@ -0,0 +1,258 @@
+"""Unit tests for the batch memory consolidation job."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from src.memory.consolidation import (
+    CHECKPOINT_KEY_PREFIX,
+    CONSOLIDATION_TASK,
+    ConsolidationBudget,
+    ConsolidationPolicy,
+    InMemoryConsolidationSource,
+    MemoryConsolidator,
+    build_clusters,
+    candidate_groups,
+    consolidation_task,
+)
+from src.memory.items import MemoryItemStore
+from src.shared.types import MemoryItem
+from tests.fakes import FakeStorage
+
+_TEA = [1.0, 0.0, 0.0]
+_TEA_NEAR = [0.98, 0.05, 0.0]
+_CITY = [0.0, 1.0, 0.0]
+
+
+def _item(confidence: float = 0.5, memory_type: str = "preference") -> MemoryItem:
+    return MemoryItem(
+        memory_id=uuid4(),
+        user_id=uuid4(),
+        memory_type=memory_type,
+        content="x",
+        confidence=confidence,
+        valid_at=datetime.now(UTC),
+    )
+
+
+def _seed(store: MemoryItemStore, embeddings: dict, user_id, rows) -> list[MemoryItem]:
+    items = []
+    for content, vector, confidence in rows:
+        item = store.create(
+            user_id=user_id,
+            memory_type="preference",
+            content=content,
+            confidence=confidence,
+            source_session_id=uuid4(),
+        )
+        embeddings[item.memory_id] = vector
+        items.append(item)
+    return items
+
+
+@pytest.mark.unit
+class TestBuildClusters:
+    def test_leader_is_highest_confidence(self) -> None:
+        low, high = _item(0.4), _item(0.8)
+        clusters = build_clusters(
+            [low, high], [(low.memory_id, high.memory_id, 0.95)], max_cluster_size=8
+        )
+        assert len(clusters) == 1
+        assert clusters[0].leader is high
+        assert clusters[0].members == [low]
+
+    def test_members_must_link_to_leader(self) -> None:
+        a, b, c = _item(0.9), _item(0.5), _item(0.4)
+        # a-b and b-c similar, a-c not: c must not ride along into a's cluster
+        clusters = build_clusters(
+            [a, b, c],
+            [(a.memory_id, b.memory_id, 0.93), (b.memory_id, c.memory_id, 0.93)],
+            max_cluster_size=8,
+        )
+        assert [(cl.leader, cl.members) for cl in clusters] == [(a, [b])]
+
+    def test_cluster_size_capped(self) -> None:
+        leader = _item(0.9)
+        others = [_item(0.5) for _ in range(5)]
+        pairs = [(leader.memory_id, o.memory_id, 0.95) for o in others]
+        clusters = build_clusters([leader, *others], pairs, max_cluster_size=3)
+        assert len(clusters[0].members) == 2
+
+    def test_singletons_not_clustered(self) -> None:
+        assert build_clusters([_item(), _item()], [], max_cluster_size=8) == []
+
+    def test_candidate_groups_join_buckets_sharing_an_item(self) -> None:
+        a, b, c, d, e = sorted(uuid4() for _ in range(5))
+        groups = candidate_groups([[a, c], [c, e], [b, d]], max_size=8)
+        assert groups == [[a, c, e], [b, d]]
+
+    def test_candidate_groups_split_above_max_size(self) -> None:
+        ids = sorted(uuid4() for _ in range(5))
+        groups = candidate_groups([ids], max_size=2)
+        assert groups == [ids[0:2], ids[2:4]]  # a trailing singleton has no pair
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError, match="similarity_threshold"):
+            ConsolidationPolicy(similarity_threshold=0.0)
+        with pytest.raises(ValueError, match="max_cluster_size"):
+            ConsolidationPolicy(max_cluster_size=1)
+
+
+@pytest.mark.unit
+class TestMemoryConsolidator:
+    async def test_merges_similar_items_via_supersede(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, embeddings = MemoryItemStore(), {}
+        tea_a, tea_b, city = _seed(
+            store,
+            embeddings,
+            user_id,
+            [
+                ("likes green tea", _TEA, 0.6),
+                ("Likes green tea!", _TEA_NEAR, 0.4),
+                ("lives in Hangzhou", _CITY, 0.6),
+            ],
+        )
+        source = InMemoryConsolidationSource(
+            store, embeddings=embeddings, users_by_org={org_id: [user_id]}
+        )
+        checkpoints = FakeStorage()
+        consolidator = MemoryConsolidator(source, checkpoints=checkpoints)
+
+        report = await consolidator.run_org(org_id)
+
+        assert report.completed is True
+        assert report.clusters_merged == 1
+        assert report.items_superseded == 2
+        active = store.list_active(user_id)
+        assert len(active) == 2
+        merged = next(i for i in active if i.memory_id not in {city.memory_id})
+        assert merged.content == "likes green tea"
+        assert merged.version == 2
+        assert store.get(tea_b.memory_id).superseded_by == merged.memory_id
+        assert store.get(tea_a.memory_id).superseded_by == merged.memory_id
+        assert checkpoints.data == {}
+
+    async def test_merge_budget_stops_and_resumes(self) -> None:
+        org_id = uuid4()
+        store, embeddings = MemoryItemStore(), {}
+        users = sorted([uuid4(), uuid4(), uuid4()])
+        for user_id in users:
+            _seed(store, embeddings, user_id, [("tea", _TEA, 0.6), ("tea!", _TEA_NEAR, 0.5)])
+        source = InMemoryConsolidationSource(
+            store, embeddings=embeddings, users_by_org={org_id: users}
+        )
+        checkpoints = FakeStorage()
+        consolidator = MemoryConsolidator(
+            source,
+            checkpoints=checkpoints,
+            budgets={org_id: ConsolidationBudget(max_merges=1)},
+        )
+
+        first = await consolidator.run_org(org_id)
+        assert first.budget_exhausted is True
+        assert first.clusters_merged == 1
+        state = checkpoints.data[f"{CHECKPOINT_KEY_PREFIX}:{org_id}"]
+        assert state["user_id"] == str(users[0])
+
+        second = await consolidator.run_org(org_id)
+        assert second.resumed is True
+        assert second.clusters_merged == 1
+        third = await consolidator.run_org(org_id)
+        fourth = await consolidator.run_org(org_id)
+
+        assert third.clusters_merged == 1
+        assert fourth.completed is True
+        assert all(len(store.list_active(u)) == 1 for u in users)
+
+    async def test_duplicates_far_apart_in_id_order_are_merged(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, embeddings = MemoryItemStore(), {}
+        fillers = [
+            (text, [float(j == i) for j in range(3, 9)], 0.5)
+            for i, text in enumerate(
+                ["plays chess", "rows at dawn", "knits scarves", "folds origami", "owns a cat"]
+            )
+        ]
+        _seed(store, embeddings, user_id, [("likes green tea", _TEA, 0.6), *fillers])
+        _seed(store, embeddings, user_id, [("likes green tea.", _TEA_NEAR, 0.5)])
+        source = InMemoryConsolidationSource(
+            store, embeddings=embeddings, users_by_org={org_id: [user_id]}
+        )
+        consolidator = MemoryConsolidator(
+            source, checkpoints=FakeStorage(), policy=ConsolidationPolicy(batch_size=2)
+        )
+
+        report = await consolidator.run_org(org_id)
+
+        assert report.clusters_merged == 1
+        assert len(store.list_active(user_id)) == 6
+
+    async def test_scan_budget_checkpoints_groups(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, embeddings = MemoryItemStore(), {}
+        rows = []
+        for i, text in enumerate(["likes green tea", "lives in Hangzhou", "works nights"]):
+            # Same text, orthogonal embeddings: candidates, but nothing to merge
+            rows += [(text, [float(j == 2 * i) for j in range(6)], 0.5)]
+            rows += [(text + "!", [float(j == 2 * i + 1) for j in range(6)], 0.5)]
+        _seed(store, embeddings, user_id, rows)
+        source = InMemoryConsolidationSource(
+            store, embeddings=embeddings, users_by_org={org_id: [user_id]}
+        )
+        checkpoints = FakeStorage()
+        consolidator = MemoryConsolidator(
+            source,
+            checkpoints=checkpoints,
+            default_budget=ConsolidationBudget(max_scanned=2),
+        )
+
+        first = await consolidator.run_org(org_id)
+        assert first.items_scanned == 2
+        assert first.budget_exhausted is True
+        second = await consolidator.run_org(org_id)
+        third = await consolidator.run_org(org_id)
+
+        assert second.items_scanned == 2
+        assert third.items_scanned == 2
+        assert third.completed is True
+        assert checkpoints.data == {}
+
+    async def test_budget_override_per_org(self) -> None:
+        org_a, org_b = uuid4(), uuid4()
+        source = InMemoryConsolidationSource(MemoryItemStore(), embeddings={}, users_by_org={})
+        consolidator = MemoryConsolidator(
+            source,
+            checkpoints=FakeStorage(),
+            budgets={org_a: ConsolidationBudget(max_merges=5)},
+        )
+        assert consolidator.budget_for(org_a).max_merges == 5
+        assert consolidator.budget_for(org_b) == ConsolidationBudget()
+
+
+@pytest.mark.unit
+class TestConsolidationTask:
+    async def test_runs_through_task_executor(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, embeddings = MemoryItemStore(), {}
+        _seed(store, embeddings, user_id, [("tea", _TEA, 0.6), ("tea!", _TEA_NEAR, 0.5)])
+        source = InMemoryConsolidationSource(
+            store, embeddings=embeddings, users_by_org={org_id: [user_id]}
+        )
+        executor = BackgroundTaskExecutor()
+        executor.register(
+            CONSOLIDATION_TASK,
+            consolidation_task(MemoryConsolidator(source, checkpoints=FakeStorage())),
+        )
+
+        result = await executor.run_task(CONSOLIDATION_TASK, args=(str(org_id),))
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result["org_id"] == str(org_id)
+        assert result.result["clusters_merged"] == 1
+        assert result.result["completed"] is True
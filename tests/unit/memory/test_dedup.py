@@ -0,0 +1,112 @@
+"""Unit tests for write-path near-duplicate detection (MinHash + LSH bands)."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from src.memory.dedup import (
+    BAND_COUNT,
+    NUM_PERMUTATIONS,
+    DedupPolicy,
+    DedupStats,
+    NearDuplicateIndex,
+    band_keys,
+    content_similarity,
+    jaccard,
+    minhash_signature,
+    normalize_content,
+    shingles,
+)
+
+
+@pytest.mark.unit
+class TestShinglesAndSignature:
+    def test_signature_deterministic(self) -> None:
+        sig = minhash_signature("I like coffee")
+        assert sig == minhash_signature("I like coffee")
+        assert len(sig) == NUM_PERMUTATIONS
+
+    def test_normalization_ignores_case_and_punctuation(self) -> None:
+        assert normalize_content("  I LIKE coffee! ") == "i like coffee"
+        assert minhash_signature("I like coffee!") == minhash_signature("i like coffee")
+
+    def test_empty_content(self) -> None:
+        assert shingles("?!") == set()
+        assert len(minhash_signature("")) == NUM_PERMUTATIONS
+
+    def test_jaccard(self) -> None:
+        assert jaccard({"a", "b"}, {"b", "c"}) == pytest.approx(1 / 3)
+        assert jaccard(set(), set()) == 1.0
+
+    def test_numbers_must_match(self) -> None:
+        a = "I have 12 stores in Shanghai, Beijing and Hangzhou"
+        b = "I have 15 stores in Shanghai, Beijing and Hangzhou"
+        assert content_similarity(a, b) == 0.0
+        assert content_similarity(a, a + "!") == pytest.approx(1.0)
+
+    def test_cjk_shingles(self) -> None:
+        a = shingles("我喜欢早上喝绿茶")
+        assert "我喜欢早" in a
+
+
+@pytest.mark.unit
+class TestBandKeys:
+    def test_band_keys_fit_integer_column(self) -> None:
+        keys = band_keys(minhash_signature("remember my size is M"))
+        assert len(keys) == BAND_COUNT
+        assert all(0 <= k < 2**31 for k in keys)
+
+    def test_near_duplicates_share_a_band(self) -> None:
+        a = band_keys(minhash_signature("I prefer green tea in the morning before work"))
+        b = band_keys(minhash_signature("I prefer green tea in the mornings before work"))
+        assert set(a) & set(b)
+
+    def test_unrelated_content_shares_no_band(self) -> None:
+        a = band_keys(minhash_signature("I prefer green tea in the morning before work"))
+        b = band_keys(minhash_signature("My store is in Shanghai and opens at nine"))
+        assert not set(a) & set(b)
+
+
+@pytest.mark.unit
+class TestDedupPolicy:
+    def test_reinforce_caps_at_ceiling(self) -> None:
+        policy = DedupPolicy(reinforce_step=0.2, confidence_ceiling=0.9)
+        assert policy.reinforced_confidence(0.6) == pytest.approx(0.8)
+        assert policy.reinforced_confidence(0.85) == pytest.approx(0.9)
+
+    def test_reinforce_never_lowers(self) -> None:
+        assert DedupPolicy().reinforced_confidence(1.0) == pytest.approx(1.0)
+
+    def test_threshold_validated(self) -> None:
+        with pytest.raises(ValueError, match="similarity_threshold"):
+            DedupPolicy(similarity_threshold=0.0)
+
+    def test_stats_reduction(self) -> None:
+        stats = DedupStats(writes=10, inserted=4, reinforced=6)
+        assert stats.write_amplification_reduction == pytest.approx(0.6)
+        assert DedupStats().write_amplification_reduction == 0.0
+
+
+@pytest.mark.unit
+class TestNearDuplicateIndex:
+    def test_find_near_duplicate(self) -> None:
+        index = NearDuplicateIndex()
+        user_id, memory_id = uuid4(), uuid4()
+        index.add(user_id, memory_id, "I need size M shirts for the store")
+
+        assert index.find(user_id, "I need size M shirts for the store.") == memory_id
+
+    def test_scoped_per_user(self) -> None:
+        index = NearDuplicateIndex()
+        index.add(uuid4(), uuid4(), "I need size M shirts")
+
+        assert index.find(uuid4(), "I need size M shirts") is None
+
+    def test_miss_for_unrelated(self) -> None:
+        index = NearDuplicateIndex()
+        user_id = uuid4()
+        index.add(user_id, uuid4(), "I need size M shirts")
+
+        assert index.find(user_id, "Our Q3 promotion starts in July") is None
@@ -0,0 +1,443 @@
+"""Unit tests for conversation_events partitioning and archival (MC2-2).
+
+Tests: partition pre-creation, default-partition rows moved into new
+months, cold-month archival + partition drop, crash-safe re-runs, archived
+read path through PgConversationEventStore, task-executor entry points.
+Complies with no-mock policy.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from src.memory.event_archive import (
+    ARCHIVE_KEY_PREFIX,
+    EVENT_ARCHIVE_TASK,
+    EVENT_PARTITION_TASK,
+    EventArchive,
+    EventArchiver,
+    InMemoryEventPartitions,
+    PartitionMaintainer,
+    PgEventPartitions,
+    add_months,
+    event_archive_task,
+    event_partition_task,
+    month_start,
+    partition_name,
+)
+from src.memory.events import ConversationEvent, PgConversationEventStore
+from tests.fakes import (
+    FakeAsyncSession,
+    FakeOrmRow,
+    FakeResult,
+    FakeSessionFactory,
+    FakeStorage,
+)
+
+_NOW = datetime(2026, 6, 15, 12, tzinfo=UTC)
+
+
+def _event(session_id: UUID, seq: int, created_at: datetime, org_id: UUID | None = None):
+    return ConversationEvent(
+        id=uuid4(),
+        org_id=org_id or uuid4(),
+        session_id=session_id,
+        user_id=None,
+        event_type="user_message",
+        role="user",
+        content={"text": f"message {seq}"},
+        sequence_number=seq,
+        metadata={"tokens": seq},
+        created_at=created_at,
+    )
+
+
+async def _partitions(*months: date) -> InMemoryEventPartitions:
+    partitions = InMemoryEventPartitions()
+    for month in months:
+        await partitions.ensure_partition(month)
+    return partitions
+
+
+class CrashingArchive(EventArchive):
+    """Fails the Nth write_session call to simulate a worker crash."""
+
+    def __init__(self, storage: FakeStorage, crash_on: int) -> None:
+        super().__init__(storage)
+        self.writes = 0
+        self._crash_on = crash_on
+
+    async def write_session(self, month: date, events: list[ConversationEvent]) -> None:
+        self.writes += 1
+        if self.writes == self._crash_on:
+            msg = "worker lost"
+            raise RuntimeError(msg)
+        await super().write_session(month, events)
+
+
+class CountingArchive(EventArchive):
+    """Counts full archive reads (chunk downloads)."""
+
+    def __init__(self, storage: FakeStorage) -> None:
+        super().__init__(storage)
+        self.reads = 0
+
+    async def read_session(self, session_id: UUID) -> list[ConversationEvent]:
+        self.reads += 1
+        return await super().read_session(session_id)
+
+
+@pytest.mark.unit
+class TestMonthHelpers:
+    def test_month_arithmetic(self) -> None:
+        assert month_start(_NOW) == date(2026, 6, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert partition_name(date(2026, 3, 1)) == "conversation_events_p202603"
+
+
+@pytest.mark.unit
+class TestEventArchiver:
+    async def test_creates_partitions_ahead(self) -> None:
+        partitions = InMemoryEventPartitions()
+        archiver = EventArchiver(
+            partitions, EventArchive(FakeStorage()), premake_months=2, clock=lambda: _NOW
+        )
+
+        report = await archiver.run()
+
+        assert report.partitions_created == 3
+        assert await partitions.list_partitions() == [
+            date(2026, 6, 1),
+            date(2026, 7, 1),
+            date(2026, 8, 1),
+        ]
+
+    async def test_archives_and_drops_cold_months_only(self) -> None:
+        partitions = await _partitions(*(date(2026, m, 1) for m in range(1, 7)))
+        old, spanning = uuid4(), uuid4()
+        partitions.insert(_event(old, 1, datetime(2026, 1, 3, tzinfo=UTC)))
+        partitions.insert(_event(old, 2, datetime(2026, 1, 4, tzinfo=UTC)))
+        partitions.insert(_event(spanning, 1, datetime(2026, 3, 30, tzinfo=UTC)))
+        partitions.insert(_event(spanning, 2, datetime(2026, 4, 2, tzinfo=UTC)))
+        storage = FakeStorage()
+        archiver = EventArchiver(
+            partitions, EventArchive(storage), hot_months=3, premake_months=0, clock=lambda: _NOW
+        )
+
+        report = await archiver.run()
+
+        assert report.months_archived == ["2026-01", "2026-02", "2026-03"]
+        assert report.partitions_dropped == 3
+        assert report.events == 3
+        assert report.sessions == 2
+        assert await partitions.list_partitions() == [
+            date(2026, 4, 1),
+            date(2026, 5, 1),
+            date(2026, 6, 1),
+        ]
+        assert partitions.row_count() == 1
+        chunk = storage.data[f"{ARCHIVE_KEY_PREFIX}:2026-01:{old}"]
+        assert chunk["format"] == "jsonl+gzip"
+        assert chunk["events"] == 2
+
+    async def test_archived_session_round_trips(self) -> None:
+        partitions = await _partitions(date(2026, 1, 1))
+        session_id = uuid4()
+        originals = [
+            _event(session_id, seq, datetime(2026, 1, seq, tzinfo=UTC)) for seq in (1, 2, 3)
+        ]
+        for e in originals:
+            partitions.insert(e)
+        archive = EventArchive(FakeStorage())
+
+        await EventArchiver(partitions, archive, page_size=2, clock=lambda: _NOW).run()
+
+        assert await archive.read_session(session_id) == originals
+        manifest = await archive.manifest(session_id)
+        assert manifest is not None
+        assert manifest.events == 3
+        assert manifest.last_sequence == 3
+
+    async def test_sessions_split_across_pages_are_written_once(self) -> None:
+        partitions = await _partitions(date(2026, 1, 1))
+        sessions = [uuid4() for _ in range(3)]
+        for s in sessions:
+            for seq in range(1, 5):
+                partitions.insert(_event(s, seq, datetime(2026, 1, 10, tzinfo=UTC)))
+        storage = FakeStorage()
+
+        report = await EventArchiver(
+            partitions, EventArchive(storage), page_size=3, clock=lambda: _NOW
+        ).run()
+
+        assert report.sessions == 3
+        assert report.events == 12
+        chunks = await storage.list_keys(f"{ARCHIVE_KEY_PREFIX}:2026-01:*")
+        assert len(chunks) == 3
+
+    async def test_rerun_after_crash_resumes_without_loss(self) -> None:
+        partitions = await _partitions(date(2026, 1, 1))
+        sessions = [uuid4() for _ in range(3)]
+        for s in sessions:
+            partitions.insert(_event(s, 1, datetime(2026, 1, 10, tzinfo=UTC)))
+        storage = FakeStorage()
+        archive = CrashingArchive(storage, crash_on=2)
+        archiver = EventArchiver(partitions, archive, clock=lambda: _NOW)
+
+        with pytest.raises(RuntimeError, match="worker lost"):
+            await archiver.run()
+        assert date(2026, 1, 1) in await partitions.list_partitions()
+        assert not await archive.is_archived(date(2026, 1, 1))
+
+        report = await archiver.run()
+
+        assert report.months_archived == ["2026-01"]
+        assert report.partitions_dropped == 1
+        for s in sessions:
+            assert len(await archive.read_session(s)) == 1
+
+    async def test_marked_month_is_dropped_without_rearchiving(self) -> None:
+        partitions = await _partitions(date(2026, 1, 1))
+        partitions.insert(_event(uuid4(), 1, datetime(2026, 1, 10, tzinfo=UTC)))
+        archive = EventArchive(FakeStorage())
+        await archive.mark_archived(date(2026, 1, 1), sessions=1, events=1)
+
+        report = await EventArchiver(partitions, archive, clock=lambda: _NOW).run()
+
+        assert report.months_archived == []
+        assert report.partitions_dropped == 1
+
+    async def test_rows_without_a_partition_move_in_when_it_is_created(self) -> None:
+        partitions = InMemoryEventPartitions()
+        session_id = uuid4()
+        partitions.insert(_event(session_id, 1, _NOW))
+
+        assert partitions.default_rows() == 1
+        assert [e.sequence_number for e in partitions.session_events(session_id)] == [1]
+
+        assert await PartitionMaintainer(partitions, clock=lambda: _NOW).run() == 3
+        assert partitions.default_rows() == 0
+        pages = [p async for p in partitions.stream_month(date(2026, 6, 1), page_size=10)]
+        assert [e.session_id for page in pages for e in page] == [session_id]
+
+    def test_rejects_non_positive_knobs(self) -> None:
+        with pytest.raises(ValueError, match="hot_months"):
+            EventArchiver(InMemoryEventPartitions(), EventArchive(FakeStorage()), hot_months=0)
+
+
+@pytest.mark.unit
+class TestEventArchiveTask:
+    async def test_runs_through_task_executor(self) -> None:
+        archiver = EventArchiver(
+            InMemoryEventPartitions(), EventArchive(FakeStorage()), clock=lambda: _NOW
+        )
+        executor = BackgroundTaskExecutor()
+        executor.register(EVENT_ARCHIVE_TASK, event_archive_task(archiver))
+
+        result = await executor.run_task(EVENT_ARCHIVE_TASK)
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result["partitions_created"] == 3
+
+    async def test_partition_task_runs_without_an_archive(self) -> None:
+        partitions = InMemoryEventPartitions()
+        executor = BackgroundTaskExecutor()
+        executor.register(
+            EVENT_PARTITION_TASK,
+            event_partition_task(PartitionMaintainer(partitions, clock=lambda: _NOW)),
+        )
+
+        first = await executor.run_task(EVENT_PARTITION_TASK)
+        second = await executor.run_task(EVENT_PARTITION_TASK)
+
+        assert first.result == {"partitions_created": 3}
+        assert second.result == {"partitions_created": 0}
+        assert len(await partitions.list_partitions()) == 3
+
+
+@pytest.mark.unit
+class TestPgEventPartitions:
+    async def test_lists_months_from_partition_names(self) -> None:
+        session = FakeAsyncSession()
+        session.set_execute_result(
+            fetchall_rows=[
+                ("conversation_events_p202602",),
+                ("conversation_events_p202601",),
+                ("conversation_events_default",),
+            ]
+        )
+        partitions = PgEventPartitions(session_factory=FakeSessionFactory(session))
+
+        assert await partitions.list_partitions() == [date(2026, 1, 1), date(2026, 2, 1)]
+
+    async def test_ensure_and_drop_call_maintenance_functions(self) -> None:
+        session = FakeAsyncSession()
+        session.set_execute_result(scalar_value=True)
+        partitions = PgEventPartitions(session_factory=FakeSessionFactory(session))
+
+        assert await partitions.ensure_partition(date(2026, 7, 1)) is True
+        assert await partitions.drop_partition(date(2026, 1, 1)) is True
+
+        sqls = [str(call[0]) for call in session.execute_calls]
+        assert "conversation_events_ensure_partition" in sqls[0]
+        assert "conversation_events_drop_partition" in sqls[1]
+        assert session.commit_count == 2
+
+    async def test_streams_keyset_pages(self) -> None:
+        sid = uuid4()
+        rows = [
+            FakeOrmRow(
+                id=uuid4(),
+                org_id=uuid4(),
+                session_id=sid,
+                user_id=None,
+                event_type="user_message",
+                role="user",
+                content={},
+                content_schema_version="v3.6",
+                sequence_number=seq,
+                parent_event_id=None,
+                metadata_={},
+                created_at=datetime(2026, 1, 2, tzinfo=UTC),
+            )
+            for seq in (1, 2)
+        ]
+        session = FakeAsyncSession()
+        session.set_execute_results([FakeResult(fetchall_rows=rows), FakeResult(fetchall_rows=[])])
+        partitions = PgEventPartitions(session_factory=FakeSessionFactory(session))
+
+        pages = [p async for p in partitions.stream_month(date(2026, 1, 1), page_size=2)]
+
+        assert [len(p) for p in pages] == [2]
+        first, second = (call[1] for call in session.execute_calls)
+        assert first["lo"] == datetime(2026, 1, 1, tzinfo=UTC)
+        assert first["hi"] == datetime(2026, 2, 1, tzinfo=UTC)
+        assert second["after_session"] == sid
+        assert second["after_seq"] == 2
+
+
+@pytest.mark.unit
+class TestArchivedReadPath:
+    async def _archived(self, session_id: UUID, seqs: range) -> EventArchive:
+        archive = EventArchive(FakeStorage())
+        await archive.write_session(
+            date(2026, 1, 1),
+            [_event(session_id, s, datetime(2026, 1, 5, tzinfo=UTC)) for s in seqs],
+        )
+        return archive
+
+    @staticmethod
+    def _hot_row(session_id: UUID, seq: int) -> FakeOrmRow:
+        return FakeOrmRow(
+            id=uuid4(),
+            org_id=uuid4(),
+            session_id=session_id,
+            user_id=None,
+            event_type="user_message",
+            role="user",
+            content={},
+            content_schema_version="v3.6",
+            sequence_number=seq,
+            parent_event_id=None,
+            metadata_={},
+            created_at=_NOW,
+        )
+
+    async def test_merges_archived_prefix_with_hot_rows(self) -> None:
+        session_id = uuid4()
+        archive = await self._archived(session_id, range(1, 3))
+        session = FakeAsyncSession()
+        session.set_scalars_result([self._hot_row(session_id, 3)])
+        store = PgConversationEventStore(
+            session_factory=FakeSessionFactory(session), archive=archive
+        )
+
+        events = await store.get_session_events(session_id)
+
+        assert [e.sequence_number for e in events] == [1, 2, 3]
+
+    async def test_hot_session_skips_archive(self) -> None:
+        session_id = uuid4()
+        storage = FakeStorage()
+        session = FakeAsyncSession()
+        session.set_scalars_result([self._hot_row(session_id, 1)])
+        store = PgConversationEventStore(
+            session_factory=FakeSessionFactory(session), archive=EventArchive(storage)
+        )
+
+        events = await store.get_session_events(session_id)
+
+        assert len(events) == 1
+        assert storage.data == {}
+
+    async def test_archived_prefix_is_cached(self) -> None:
+        session_id = uuid4()
+        archive = CountingArchive(FakeStorage())
+        await archive.write_session(
+            date(2026, 1, 1),
+            [_event(session_id, s, datetime(2026, 1, 5, tzinfo=UTC)) for s in range(1, 3)],
+        )
+        session = FakeAsyncSession()
+        session.set_scalars_result([self._hot_row(session_id, 3)])
+        store = PgConversationEventStore(
+            session_factory=FakeSessionFactory(session), archive=archive
+        )
+
+        for _ in range(3):
+            events = await store.get_session_events(session_id)
+
+        assert [e.sequence_number for e in events] == [1, 2, 3]
+        assert archive.reads == 1
+
+        # Another month archived: the cached prefix no longer reaches the hot rows
+        await archive.write_session(
+            date(2026, 2, 1),
+            [_event(session_id, 3, datetime(2026, 2, 5, tzinfo=UTC))],
+        )
+        session.set_scalars_result([self._hot_row(session_id, 4)])
+        events = await store.get_session_events(session_id)
+        assert [e.sequence_number for e in events] == [1, 2, 3, 4]
+        assert archive.reads == 2
+
+    async def test_new_session_reads_only_the_manifest(self) -> None:
+        archive = CountingArchive(FakeStorage())
+        store = PgConversationEventStore(
+            session_factory=FakeSessionFactory(FakeAsyncSession()), archive=archive
+        )
+
+        assert await store.get_session_events(uuid4()) == []
+        assert archive.reads == 0
+
+    async def test_append_continues_archived_sequence(self) -> None:
+        session_id = uuid4()
+        archive = await self._archived(session_id, range(1, 6))
+        session = FakeAsyncSession()
+        session.set_execute_result(scalar_value=0)
+        store = PgConversationEventStore(
+            session_factory=FakeSessionFactory(session), archive=archive
+        )
+
+        event = await store.append_event(
+            org_id=uuid4(), session_id=session_id, event_type="user_message"
+        )
+
+        assert event.sequence_number == 6
+
+    async def test_count_and_delete_span_both_tiers(self) -> None:
+        session_id = uuid4()
+        archive = await self._archived(session_id, range(1, 4))
+        session = FakeAsyncSession()
+        session.set_execute_result(scalar_value=2, rowcount=2)
+        store = PgConversationEventStore(
+            session_factory=FakeSessionFactory(session), archive=archive
+        )
+
+        assert await store.count_session_events(session_id) == 5
+        assert await store.delete_session(session_id) == 5
+        assert await archive.read_session(session_id) == []
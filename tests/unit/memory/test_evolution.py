@@ -11,12 +11,14 @@ from uuid import uuid4
 import pytest
 
 from src.memory.evolution.pipeline import (
+    DEFAULT_SIGNALS,
     Analyzer,
     EvolutionPipeline,
     EvolutionResult,
     Evolver,
     ExtractedObservation,
     Observer,
+    SignalMatcher,
 )
 
 # ---------------------------------------------------------------------------
@@ -49,6 +51,38 @@ def session_id():
     return uuid4()
 
 
+# ---------------------------------------------------------------------------
+# Tests: SignalMatcher
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestSignalMatcher:
+    """Precompiled multi-pattern matcher keeps substring semantics."""
+
+    def test_types_in_declaration_order(self) -> None:
+        matcher = SignalMatcher()
+        assert matcher.match("I live in Paris and I LIKE tea") == ["preference", "observation"]
+
+    def test_no_signal(self) -> None:
+        assert SignalMatcher().match("what is the weather?") == []
+
+    def test_overlapping_signals_both_seen(self) -> None:
+        matcher = SignalMatcher({"a": (0.5, ("abc",)), "b": (0.5, ("bcd",))})
+        assert matcher.match("xabcdx") == ["a", "b"]
+
+    def test_matches_substring_reference(self) -> None:
+        matcher = SignalMatcher()
+        samples = ["I'm fine", "remembering", "my catalog", "i amend", "Iam", "MY NAME is Li"]
+        for text in samples:
+            expected = [
+                memory_type
+                for memory_type, (_, signals) in DEFAULT_SIGNALS.items()
+                if any(sig in text.lower() for sig in signals)
+            ]
+            assert matcher.match(text) == expected, text
+
+
 # ---------------------------------------------------------------------------
 # Tests: Observer (Stage 1)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,346 @@
+"""Unit tests for multi-session batch evolution (MC2-5).
+
+Tests: cross-session aggregation, bulk writes, bounded concurrency,
+checkpoint/resume idempotency, task-executor entry point, per-session
+write keys that keep a replayed batch from being applied twice.
+Complies with no-mock policy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from src.memory.evolution.batch import (
+    CHECKPOINT_KEY_PREFIX,
+    EVOLUTION_BATCH_TASK,
+    BatchEvolutionRunner,
+    CompletedSession,
+    EvolutionWrite,
+    InMemoryEvolutionWriter,
+    PgEvolutionWriter,
+    evolution_batch_task,
+)
+from src.memory.items import MemoryItemStore
+from src.memory.pg_adapter import PgMemoryCoreAdapter
+from tests.fakes import (
+    FakeAsyncSession,
+    FakeOrmRow,
+    FakeResult,
+    FakeSessionFactory,
+    FakeStorage,
+)
+
+
+def _session(user_id: UUID, *texts: str, org_id: UUID | None = None) -> CompletedSession:
+    return CompletedSession(
+        session_id=uuid4(),
+        org_id=org_id or uuid4(),
+        user_id=user_id,
+        messages=[{"role": "user", "content": t} for t in texts]
+        + [{"role": "assistant", "content": "I like that too"}],
+    )
+
+
+class CrashingWriter(InMemoryEvolutionWriter):
+    """Fails the Nth write_many call to simulate a worker crash."""
+
+    def __init__(self, store: MemoryItemStore, crash_on: int) -> None:
+        super().__init__(store)
+        self._crash_on = crash_on
+
+    async def write_many(self, writes: list[EvolutionWrite]) -> int:
+        if len(self.batches) + 1 == self._crash_on:
+            self.batches.append(len(writes))
+            msg = "worker lost"
+            raise RuntimeError(msg)
+        return await super().write_many(writes)
+
+
+class SlowWriter(InMemoryEvolutionWriter):
+    """Tracks the peak number of concurrent write_many calls."""
+
+    def __init__(self, store: MemoryItemStore) -> None:
+        super().__init__(store)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def write_many(self, writes: list[EvolutionWrite]) -> int:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        try:
+            return await super().write_many(writes)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.unit
+class TestBatchEvolutionRunner:
+    async def test_aggregates_repeated_facts_across_sessions(self) -> None:
+        user_id = uuid4()
+        sessions = [_session(user_id, "I live in Hangzhou") for _ in range(3)]
+        sessions.append(_session(user_id, "I prefer green tea", "how are you?"))
+        store = MemoryItemStore()
+        writer = InMemoryEvolutionWriter(store)
+        runner = BatchEvolutionRunner(writer, checkpoints=FakeStorage())
+
+        report = await runner.run("job-1", sessions)
+
+        assert report.completed is True
+        assert report.sessions == 4
+        assert report.observations == 4
+        assert report.writes == 2
+        assert report.users == 1
+        by_content = {w.content: w for w in writer.written.values()}
+        assert by_content["I live in Hangzhou"].source_sessions == [
+            s.session_id for s in sessions[:3]
+        ]
+        assert by_content["I prefer green tea"].memory_type == "preference"
+        assert by_content["I prefer green tea"].confidence == pytest.approx(0.6)
+        assert len(store.list_active(user_id)) == 2
+
+    async def test_writes_are_batched(self) -> None:
+        sessions = [_session(uuid4(), f"I work at shop {i}") for i in range(7)]
+        writer = InMemoryEvolutionWriter(MemoryItemStore())
+        runner = BatchEvolutionRunner(writer, checkpoints=FakeStorage(), write_batch_size=3)
+
+        await runner.run("job-1", sessions)
+
+        assert writer.batches == [3, 3, 1]
+
+    async def test_concurrency_is_bounded(self) -> None:
+        sessions = [_session(uuid4(), f"I have {i} cats") for i in range(20)]
+        writer = SlowWriter(MemoryItemStore())
+        runner = BatchEvolutionRunner(
+            writer, checkpoints=FakeStorage(), write_batch_size=1, concurrency=3
+        )
+
+        report = await runner.run("job-1", sessions)
+
+        assert report.writes == 20
+        assert writer.peak == 3
+
+    async def test_accepts_async_stream_and_reports_progress(self) -> None:
+        async def stream():
+            for i in range(5):
+                yield _session(uuid4(), f"my name is user{i}")
+
+        seen: list[int] = []
+        runner = BatchEvolutionRunner(
+            InMemoryEvolutionWriter(MemoryItemStore()),
+            checkpoints=FakeStorage(),
+            window_size=2,
+            on_progress=lambda r: seen.append(r.sessions),
+        )
+
+        report = await runner.run("job-1", stream())
+
+        assert seen == [2, 4, 5]
+        assert report.windows == 3
+        assert report.sessions_per_second > 0
+
+    async def test_resume_skips_finished_windows_without_duplicates(self) -> None:
+        sessions = [_session(uuid4(), f"remember order {i}") for i in range(6)]
+        store = MemoryItemStore()
+        checkpoints = FakeStorage()
+        writer = CrashingWriter(store, crash_on=2)
+        runner = BatchEvolutionRunner(writer, checkpoints=checkpoints, window_size=2)
+
+        with pytest.raises(RuntimeError, match="worker lost"):
+            await runner.run("job-1", sessions)
+        assert checkpoints.data[f"{CHECKPOINT_KEY_PREFIX}:job-1"] == {"offset": 2}
+
+        report = await runner.run("job-1", sessions)
+
+        assert report.resumed is True
+        assert report.skipped == 2
+        assert report.sessions == 4
+        assert len(writer.written) == 6
+        assert checkpoints.data == {}
+
+    def test_rejects_non_positive_knobs(self) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            BatchEvolutionRunner(
+                InMemoryEvolutionWriter(MemoryItemStore()),
+                checkpoints=FakeStorage(),
+                concurrency=0,
+            )
+
+
+@pytest.mark.unit
+class TestEvolutionBatchTask:
+    async def test_runs_through_task_executor(self) -> None:
+        sessions = [_session(uuid4(), "I need size M") for _ in range(3)]
+        runner = BatchEvolutionRunner(
+            InMemoryEvolutionWriter(MemoryItemStore()), checkpoints=FakeStorage()
+        )
+        executor = BackgroundTaskExecutor()
+        executor.register(EVOLUTION_BATCH_TASK, evolution_batch_task(runner, lambda: sessions))
+
+        result = await executor.run_task(EVOLUTION_BATCH_TASK, args=("nightly",))
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result["sessions"] == 3
+        assert result.result["writes"] == 3
+        assert "sessions_per_second" in result.result
+
+
+def _writes(count: int, user_id: UUID | None = None) -> list[EvolutionWrite]:
+    return [
+        EvolutionWrite(
+            memory_id=uuid4(),
+            org_id=uuid4(),
+            user_id=user_id or uuid4(),
+            memory_type="observation",
+            content=f"I keep {i} plants on the balcony",
+            confidence=0.72,
+            source_sessions=[uuid4()],
+        )
+        for i in range(count)
+    ]
+
+
+class KeyLedgerSession(FakeAsyncSession):
+    """Answers the write-key claim like INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+    The ledger can be shared between sessions to stand in for the
+    memory_write_keys table across transactions.
+    """
+
+    def __init__(self, ledger: set[UUID] | None = None) -> None:
+        super().__init__()
+        self.ledger = set() if ledger is None else ledger
+
+    async def execute(self, statement, params=None) -> FakeResult:
+        self.execute_calls.append((statement, params))
+        compiled = statement.compile(dialect=postgresql.dialect())
+        claimed = []
+        for name, key in compiled.params.items():
+            if name.startswith("write_key_") and key not in self.ledger:
+                self.ledger.add(key)
+                claimed.append((key,))
+        return FakeResult(fetchall_rows=claimed)
+
+
+@pytest.mark.unit
+class TestPgEvolutionWriter:
+    """Batch writes share PgMemoryCoreAdapter.write_observation's path."""
+
+    def _writer(self, session: FakeAsyncSession, **kwargs) -> PgEvolutionWriter:
+        adapter = PgMemoryCoreAdapter(session_factory=FakeSessionFactory(session), **kwargs)
+        return PgEvolutionWriter(memory_core=adapter)
+
+    async def test_rows_carry_band_keys(self) -> None:
+        from src.memory.dedup import DedupPolicy, band_keys, minhash_signature
+
+        session = KeyLedgerSession()
+        session.set_scalars_result([])
+        writes = _writes(2)
+
+        written = await self._writer(session, dedup_policy=DedupPolicy()).write_many(writes)
+
+        assert written == 2
+        assert session.commit_count == 1
+        assert [row.id for row in session.added] == [w.memory_id for w in writes]
+        for row, w in zip(session.added, writes, strict=True):
+            assert row.minhash_bands == band_keys(minhash_signature(w.content))
+            assert row.source_sessions == w.source_sessions
+
+    async def test_near_duplicate_reinforces(self) -> None:
+        from src.memory.dedup import DedupPolicy
+
+        (write,) = _writes(1)
+        existing = FakeOrmRow(
+            id=uuid4(),
+            content=write.content + "!",
+            confidence=0.6,
+            source_sessions=[],
+            last_validated_at=None,
+            updated_at=None,
+        )
+        session = KeyLedgerSession()
+        session.set_scalars_result([existing])
+        writer = self._writer(session, dedup_policy=DedupPolicy(reinforce_step=0.1))
+
+        assert await writer.write_many([write]) == 1
+        assert session.added == []
+        assert existing.confidence == pytest.approx(0.7)
+        assert existing.source_sessions == write.source_sessions
+
+    async def test_replayed_batch_is_not_applied_again(self) -> None:
+        ledger: set[UUID] = set()
+        writes = _writes(2)
+        first = KeyLedgerSession(ledger)
+        replay = KeyLedgerSession(ledger)
+
+        assert await self._writer(first).write_many(writes) == 2
+        assert await self._writer(replay).write_many(writes) == 0
+        assert [row.id for row in first.added] == [w.memory_id for w in writes]
+        assert replay.added == []
+        assert len(ledger) == 2
+
+    async def test_replay_does_not_reinforce_twice(self) -> None:
+        from src.memory.dedup import DedupPolicy
+
+        (write,) = _writes(1)
+        existing = FakeOrmRow(
+            id=uuid4(),
+            content=write.content + "!",
+            confidence=0.6,
+            source_sessions=[],
+            last_validated_at=None,
+            updated_at=None,
+        )
+        ledger: set[UUID] = set()
+        policy = DedupPolicy(reinforce_step=0.1)
+        for _ in range(2):
+            session = KeyLedgerSession(ledger)
+            session.set_scalars_result([existing])
+            await self._writer(session, dedup_policy=policy).write_many([write])
+
+        assert existing.confidence == pytest.approx(0.7)
+        assert existing.source_sessions == write.source_sessions
+
+    async def test_partly_applied_write_keeps_only_new_sessions(self) -> None:
+        (write,) = _writes(1)
+        seen, new = write.source_sessions[0], uuid4()
+        ledger: set[UUID] = set()
+        await self._writer(KeyLedgerSession(ledger)).write_many([write])
+
+        # Same fact from a later window: one session already applied, one new
+        regrouped = EvolutionWrite(
+            memory_id=uuid4(),
+            org_id=write.org_id,
+            user_id=write.user_id,
+            memory_type=write.memory_type,
+            content=write.content,
+            confidence=write.confidence,
+            source_sessions=[seen, new],
+        )
+        session = KeyLedgerSession(ledger)
+
+        assert await self._writer(session).write_many([regrouped]) == 1
+        assert session.added[0].source_sessions == [new]
+
+    async def test_invalidates_working_set(self) -> None:
+        from src.memory.working_set import MemoryWorkingSet
+
+        user_id = uuid4()
+        ws = MemoryWorkingSet()
+        session = KeyLedgerSession()
+
+        await self._writer(session, working_set=ws).write_many(_writes(3, user_id) + _writes(1))
+
+        assert ws.stats.invalidations == 2
+
+    async def test_empty_is_noop(self) -> None:
+        session = FakeAsyncSession()
+        assert await self._writer(session).write_many([]) == 0
+        assert session.execute_calls == []
+        assert session.commit_count == 0
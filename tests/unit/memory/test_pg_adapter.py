@@ -433,3 +433,189 @@ class TestPgAdapterHybridRetrieval:
         assert len(results) == 2
         assert results[0].content == "fact B"  # higher RRF score
         assert results[1].content == "fact A"
+
+
+# ---------------------------------------------------------------------------
+# Write-path near-duplicate suppression
+# ---------------------------------------------------------------------------
+
+
+def _fingerprinted_row(user_id, org_id, content: str, **overrides) -> FakeOrmRow:
+    from src.memory.dedup import band_keys, minhash_signature
+
+    fields = {
+        "id": uuid4(),
+        "user_id": user_id,
+        "org_id": org_id,
+        "memory_type": "observation",
+        "content": content,
+        "confidence": 0.6,
+        "version": 1,
+        "source_sessions": [],
+        "minhash_bands": band_keys(minhash_signature(content)),
+        "last_validated_at": None,
+        "updated_at": None,
+    }
+    fields.update(overrides)
+    return FakeOrmRow(**fields)
+
+
+@pytest.mark.unit
+class TestPgAdapterWriteDedup:
+    """Near-duplicates reinforce the existing item instead of inserting."""
+
+    async def test_insert_stores_band_keys(self, user_id, org_id) -> None:
+        from src.memory.dedup import DedupPolicy, band_keys, minhash_signature
+
+        session = FakeAsyncSession()
+        session.set_scalars_result([])
+        adapter = PgMemoryCoreAdapter(
+            session_factory=FakeSessionFactory(session),
+            dedup_policy=DedupPolicy(),
+        )
+
+        await adapter.write_observation(user_id, Observation(content="I prefer tea"), org_id=org_id)
+
+        added = session.added[0]
+        assert added.minhash_bands == band_keys(minhash_signature("I prefer tea"))
+        assert adapter.dedup_stats.inserted == 1
+        assert adapter.dedup_stats.reinforced == 0
+
+    async def test_near_duplicate_reinforces_existing(self, user_id, org_id) -> None:
+        from src.memory.dedup import DedupPolicy
+
+        existing = _fingerprinted_row(user_id, org_id, "I prefer green tea in the morning")
+        session = FakeAsyncSession()
+        session.set_scalars_result([existing])
+        adapter = PgMemoryCoreAdapter(
+            session_factory=FakeSessionFactory(session),
+            dedup_policy=DedupPolicy(reinforce_step=0.1),
+        )
+        session_id = uuid4()
+
+        receipt = await adapter.write_observation(
+            user_id,
+            Observation(content="I prefer green tea in the morning!", source_session_id=session_id),
+            org_id=org_id,
+        )
+
+        assert receipt.memory_id == existing.id
+        assert session.added == []
+        assert session.commit_count == 1
+        assert existing.confidence == pytest.approx(0.7)
+        assert existing.last_validated_at is not None
+        assert session_id in existing.source_sessions
+        assert adapter.dedup_stats.write_amplification_reduction == pytest.approx(1.0)
+
+    async def test_distant_candidate_still_inserts(self, user_id, org_id) -> None:
+        from src.memory.dedup import DedupPolicy
+
+        unrelated = _fingerprinted_row(user_id, org_id, "My dog is called Biscuit")
+        session = FakeAsyncSession()
+        session.set_scalars_result([unrelated])
+        adapter = PgMemoryCoreAdapter(
+            session_factory=FakeSessionFactory(session),
+            dedup_policy=DedupPolicy(),
+        )
+
+        receipt = await adapter.write_observation(
+            user_id, Observation(content="I work as a store manager"), org_id=org_id
+        )
+
+        assert receipt.memory_id != unrelated.id
+        assert len(session.added) == 1
+        assert unrelated.confidence == pytest.approx(0.6)
+
+    async def test_without_policy_no_band_keys(self, user_id, org_id) -> None:
+        session = FakeAsyncSession()
+        adapter = PgMemoryCoreAdapter(session_factory=FakeSessionFactory(session))
+
+        await adapter.write_observation(user_id, Observation(content="x"), org_id=org_id)
+
+        assert session.added[0].minhash_bands is None
+        assert adapter.dedup_stats.writes == 0
+
+
+# ---------------------------------------------------------------------------
+# Decay-ranked retrieval
+# ---------------------------------------------------------------------------
+
+
+class FakeDecayVectorEngine(FakeVectorEngine):
+    """Fake engine exposing decay_ranked_search."""
+
+    def __init__(self, results: list[FusedResult] | None = None) -> None:
+        super().__init__(results)
+        self.decay_calls: list[dict] = []
+
+    async def decay_ranked_search(self, **kwargs) -> list[FusedResult]:
+        self.decay_calls.append(kwargs)
+        return self._results
+
+
+@pytest.mark.unit
+class TestPgAdapterDecayRanking:
+    """Top-k selection accounts for decay inside SQL."""
+
+    async def test_keyword_orders_by_effective_confidence(self, user_id, org_id) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        from src.memory.confidence import DecayRanking
+
+        session = FakeAsyncSession()
+        session.set_scalars_result([])
+        adapter = PgMemoryCoreAdapter(
+            session_factory=FakeSessionFactory(session),
+            decay_ranking=DecayRanking(stale_threshold=0.3),
+        )
+
+        await adapter.read_personal_memories(user_id, "coffee beans", org_id=org_id, top_k=4)
+
+        sql = str(session.scalars_calls[0].compile(dialect=postgresql.dialect()))
+        order_by = sql[sql.index("ORDER BY") :]
+        assert "power(" in order_by
+        assert sql.count("power(") == 2  # ORDER BY + stale filter in WHERE
+        assert "LIMIT" in sql
+
+    async def test_keyword_default_orders_by_raw_confidence(self, user_id, org_id) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        session = FakeAsyncSession()
+        session.set_scalars_result([])
+        adapter = PgMemoryCoreAdapter(session_factory=FakeSessionFactory(session))
+
+        await adapter.read_personal_memories(user_id, "coffee", org_id=org_id)
+
+        sql = str(session.scalars_calls[0].compile(dialect=postgresql.dialect()))
+        assert "power(" not in sql
+        assert "ORDER BY memory_items.confidence DESC" in sql
+
+    async def test_hybrid_uses_decay_ranked_search(self, user_id, org_id) -> None:
+        from src.memory.confidence import DecayRanking
+
+        mid = uuid4()
+        engine = FakeDecayVectorEngine(
+            results=[FusedResult(memory_id=mid, content="", rrf_score=0.1)]
+        )
+        row = _fingerprinted_row(user_id, org_id, "likes oolong", id=mid)
+        row.valid_at = datetime.now(UTC)
+        row.invalid_at = None
+        row.superseded_by = None
+        row.provenance = None
+        row.epistemic_type = "fact"
+        session = FakeAsyncSession()
+        session.set_scalars_result([row])
+        ranking = DecayRanking()
+        adapter = PgMemoryCoreAdapter(
+            session_factory=FakeSessionFactory(session),
+            vector_engine=engine,
+            query_embedder=FakeQueryEmbedder(),
+            decay_ranking=ranking,
+        )
+
+        results = await adapter.read_personal_memories(user_id, "tea", org_id=org_id, top_k=2)
+
+        assert [m.memory_id for m in results] == [mid]
+        assert engine.calls == []
+        assert engine.decay_calls[0]["ranking"] is ranking
+        assert engine.decay_calls[0]["top_k"] == 2
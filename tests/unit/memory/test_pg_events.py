@@ -116,6 +116,23 @@ class TestPgConversationEventStore:
 
         assert event.sequence_number == 4
 
+    async def test_append_event_locks_the_session_first(
+        self,
+        org_id,
+        session_id,
+    ) -> None:
+        from src.memory.events import PgConversationEventStore
+
+        session = FakeAsyncSession()
+        session.set_execute_result(scalar_value=0)
+        store = PgConversationEventStore(session_factory=FakeSessionFactory(session))
+
+        await store.append_event(org_id=org_id, session_id=session_id, event_type="user_message")
+
+        lock = session.execute_calls[0][0].compile(compile_kwargs={"literal_binds": True})
+        assert "pg_advisory_xact_lock(hashtext(" in str(lock)
+        assert str(session_id) in str(lock)
+
     async def test_get_session_events_returns_ordered_list(
         self,
         org_id,
@@ -0,0 +1,63 @@
+"""B3-4: PgFeedbackStore tests.
+
+Tests: atomic upsert counting, fused-ID scans, batched confirmation.
+Uses Fake adapter pattern (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from src.memory.feedback import PgFeedbackStore
+from tests.fakes import FakeAsyncSession, FakeOrmRow, FakeSessionFactory
+
+
+@pytest.mark.unit
+class TestPgFeedbackStore:
+    async def test_record_negative_single_upsert(self) -> None:
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(negative_count=3, fused=True)])
+        store = PgFeedbackStore(session_factory=FakeSessionFactory(session))
+        mid = uuid4()
+
+        count, fused = await store.record_negative(
+            org_id=uuid4(), user_id=uuid4(), memory_id=mid, threshold=3
+        )
+
+        assert (count, fused) == (3, True)
+        assert len(session.execute_calls) == 1
+        assert session.commit_count == 1
+        sql, params = session.execute_calls[0]
+        assert "ON CONFLICT (memory_item_id) DO UPDATE" in str(sql)
+        assert "RETURNING negative_count" in str(sql)
+        assert params["memory_id"] == str(mid)
+        assert params["threshold"] == 3
+
+    async def test_fused_ids(self) -> None:
+        mid = uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(memory_item_id=mid)])
+        store = PgFeedbackStore(session_factory=FakeSessionFactory(session))
+
+        assert await store.fused_ids(uuid4()) == {mid}
+        assert "fused_at IS NOT NULL" in str(session.execute_calls[0][0])
+
+    async def test_fused_among_one_query(self) -> None:
+        mid = uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(memory_item_id=str(mid))])
+        store = PgFeedbackStore(session_factory=FakeSessionFactory(session))
+
+        fused = await store.fused_among(uuid4(), [mid, uuid4()])
+
+        assert fused == {mid}
+        assert len(session.execute_calls) == 1
+        assert len(session.execute_calls[0][1]["memory_ids"]) == 2
+
+    async def test_fused_among_empty_is_noop(self) -> None:
+        session = FakeAsyncSession()
+        store = PgFeedbackStore(session_factory=FakeSessionFactory(session))
+        assert await store.fused_among(uuid4(), []) == set()
+        assert session.execute_calls == []
@@ -1,12 +1,13 @@
 """Unit tests for PgReceiptStore (MC2-6 PG backend).
 
 Tests PgReceiptStore using Fake adapters.
-Verifies: record_injection, record_retrieval, get_receipts_for_item, count_by_type.
+Verifies: record_injection, record_retrieval, get_receipts_for_item, count_by_type,
+and the memory_receipt_daily rollup (upsert on write, windowed frequencies).
 """
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from uuid import uuid4
 
 import pytest
@@ -166,35 +167,132 @@ class TestPgReceiptStore:
 
     async def test_count_by_type_returns_int_dict(
         self,
-        org_id,
         memory_item_id,
     ) -> None:
         from src.memory.receipt import PgReceiptStore
 
-        rows = [
-            _make_orm_receipt(
-                memory_item_id=memory_item_id,
-                org_id=org_id,
-                receipt_type="injection",
-            ),
-            _make_orm_receipt(
-                memory_item_id=memory_item_id,
-                org_id=org_id,
-                receipt_type="injection",
-            ),
-            _make_orm_receipt(
-                memory_item_id=memory_item_id,
-                org_id=org_id,
-                receipt_type="retrieval",
-            ),
-        ]
         session = FakeAsyncSession()
-        session.set_scalars_result(rows)
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(t="injection", n=2)])
         factory = FakeSessionFactory(session)
         store = PgReceiptStore(session_factory=factory)
 
         counts = await store.count_by_type(memory_item_id)
 
-        assert isinstance(counts, dict)
-        assert counts["injection"] == 2
-        assert counts["retrieval"] == 1
+        assert counts == {"injection": 2, "retrieval": 0}
+        stmt, params = session.execute_calls[0]
+        assert "FROM memory_receipt_daily" in str(stmt)
+        assert "GROUP BY receipt_type" in str(stmt)
+        assert params == {"memory_item_id": memory_item_id}
+        assert session.scalars_calls == []
+
+    async def test_record_upserts_daily_rollup(self, org_id, memory_item_id) -> None:
+        from src.memory.receipt import PgReceiptStore
+
+        session = FakeAsyncSession()
+        store = PgReceiptStore(session_factory=FakeSessionFactory(session))
+
+        await store.record_injection(
+            memory_item_id=memory_item_id,
+            org_id=org_id,
+            candidate_score=0.9,
+            decision_reason="high relevance",
+        )
+
+        stmt, params = session.execute_calls[0]
+        sql = str(stmt)
+        assert "INSERT INTO memory_receipt_daily" in sql
+        assert "ON CONFLICT (memory_item_id, receipt_type, day) DO UPDATE" in sql
+        assert "memory_receipt_daily.count + excluded.count" in sql
+        assert params == [
+            {
+                "memory_item_id": memory_item_id,
+                "receipt_type": "injection",
+                "day": datetime.now(UTC).date(),
+                "org_id": org_id,
+                "count": 1,
+            }
+        ]
+        assert session.commit_count == 1
+
+    async def test_frequencies_single_grouped_window_query(self) -> None:
+        from src.memory.receipt import PgReceiptStore
+
+        hot, cold = uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(id=hot, n=7)])
+        store = PgReceiptStore(session_factory=FakeSessionFactory(session))
+        now = datetime(2026, 3, 31, 12, tzinfo=UTC)
+
+        counts = await store.frequencies([hot, cold], days=30, now=now)
+
+        assert counts == {hot: 7, cold: 0}
+        assert len(session.execute_calls) == 1
+        stmt, params = session.execute_calls[0]
+        sql = str(stmt)
+        assert "sum(count) FROM memory_receipt_daily" in sql
+        assert "GROUP BY memory_item_id" in sql
+        assert params["memory_item_ids"] == [hot, cold]
+        assert params["since"] == date(2026, 3, 2)
+        assert params["receipt_type"] is None
+
+    async def test_frequencies_empty_skips_query(self) -> None:
+        from src.memory.receipt import PgReceiptStore
+
+        session = FakeAsyncSession()
+        store = PgReceiptStore(session_factory=FakeSessionFactory(session))
+
+        assert await store.frequencies([]) == {}
+        assert session.execute_calls == []
+
+    async def test_daily_counts_maps_rows(self, memory_item_id) -> None:
+        from src.memory.receipt import PgReceiptStore, ReceiptDailyCount
+
+        day = date(2026, 3, 30)
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[FakeOrmRow(d=day, t="retrieval", n=4)])
+        store = PgReceiptStore(session_factory=FakeSessionFactory(session))
+
+        rows = await store.daily_counts(memory_item_id, days=7)
+
+        assert rows == [ReceiptDailyCount(day=day, receipt_type="retrieval", count=4)]
+        assert "ORDER BY day" in str(session.execute_calls[0][0])
+
+    async def test_record_many_single_flush(
+        self,
+        org_id,
+        memory_item_id,
+    ) -> None:
+        from src.memory.receipt import PgReceiptStore, ReceiptStore
+
+        staging = ReceiptStore()
+        receipts = [
+            await staging.record_retrieval(
+                memory_item_id=memory_item_id,
+                org_id=org_id,
+                candidate_score=0.5,
+                decision_reason="retrieved_for_context",
+                context_position=i,
+            )
+            for i in range(3)
+        ]
+        session = FakeAsyncSession()
+        store = PgReceiptStore(session_factory=FakeSessionFactory(session))
+
+        await store.record_many(receipts)
+
+        assert [row.id for row in session.added] == [r.id for r in receipts]
+        assert len(session.execute_calls) == 1  # daily rollup upsert
+        assert session.commit_count == 1
+        _, rollup = session.execute_calls[0]
+        assert len(rollup) == 1  # pre-aggregated: one (item, type, day)
+        assert rollup[0]["count"] == 3
+
+    async def test_record_many_empty_is_noop(self) -> None:
+        from src.memory.receipt import PgReceiptStore
+
+        session = FakeAsyncSession()
+        store = PgReceiptStore(session_factory=FakeSessionFactory(session))
+
+        await store.record_many([])
+
+        assert session.execute_calls == []
@@ -1,7 +1,8 @@
 """Unit tests for PgVectorSearchEngine (MC2-4 pgvector backend).
 
 Tests PgVectorSearchEngine using Fake adapters (no unittest.mock).
-Verifies: search_by_embedding, search_by_keyword, hybrid_search, empty results.
+Verifies: search_by_embedding, search_by_keyword, hybrid_search, empty results,
+decay-ranked search (statement shape, and stale filtering executed on SQLite).
 """
 
 from __future__ import annotations
@@ -27,6 +28,12 @@ def user_id():
     return uuid4()
 
 
+def _compile(stmt):
+    from sqlalchemy.dialects import postgresql
+
+    return stmt.compile(dialect=postgresql.dialect())
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -204,3 +211,252 @@ class TestPgVectorSearchEngine:
         sql_text = str(session.execute_calls[0][0]).upper()
         assert "LIMIT" in sql_text
         assert len(results) == 2
+
+
+@pytest.mark.unit
+class TestDecayRankedSearch:
+    """Decay-aware RRF ranking computed in a single SQL statement."""
+
+    async def test_single_statement_returns_top_k(self, org_id, user_id) -> None:
+        from datetime import UTC, datetime
+
+        from src.memory.confidence import DecayRanking
+        from src.memory.vector_search import PgVectorSearchEngine
+
+        mid = uuid4()
+        row = FakeOrmRow(id=mid, rrf_score=0.03, effective_confidence=0.5, vr=1, kr=None)
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[row])
+        engine = PgVectorSearchEngine(session_factory=FakeSessionFactory(session))
+
+        results = await engine.decay_ranked_search(
+            embedding=[0.1, 0.2],
+            query="tea",
+            org_id=org_id,
+            user_id=user_id,
+            ranking=DecayRanking(candidate_k=40),
+            now=datetime.now(UTC),
+            top_k=3,
+        )
+
+        assert len(session.execute_calls) == 1
+        compiled = _compile(session.execute_calls[0][0])
+        sql_text = str(compiled)
+        assert "FULL OUTER JOIN" in sql_text
+        assert "<=>" in sql_text
+        assert "power(" in sql_text
+        assert "stale_threshold" not in sql_text
+        assert compiled.params["top_k"] == 3
+        assert compiled.params["candidate_k"] == 40
+        assert 90.0 in compiled.params.values()  # half-life
+        assert results[0].memory_id == mid
+        assert results[0].effective_confidence == pytest.approx(0.5)
+        assert results[0].vector_rank == 1
+        assert results[0].keyword_rank is None
+
+    async def test_stale_filter_inside_both_candidate_pools(self, org_id, user_id) -> None:
+        from datetime import UTC, datetime
+
+        from src.memory.confidence import DecayRanking
+        from src.memory.vector_search import PgVectorSearchEngine
+
+        session = FakeAsyncSession()
+        session.set_execute_result(fetchall_rows=[])
+        engine = PgVectorSearchEngine(session_factory=FakeSessionFactory(session))
+
+        results = await engine.decay_ranked_search(
+            embedding=[0.1],
+            query="tea",
+            org_id=org_id,
+            user_id=user_id,
+            ranking=DecayRanking(stale_threshold=0.3),
+            now=datetime.now(UTC),
+            top_k=5,
+        )
+
+        compiled = _compile(session.execute_calls[0][0])
+        vec_cte, kw_cte = str(compiled).split("fused AS")[0].split("kw AS")
+        assert "%(stale_threshold)s" in vec_cte
+        assert "%(stale_threshold)s" in kw_cte
+        assert compiled.params["stale_threshold"] == 0.3
+        assert results == []
+
+
+# ---------------------------------------------------------------------------
+# Decay-ranked search against a real database (SQLite)
+# ---------------------------------------------------------------------------
+#
+# The statement is executed on aiosqlite. A few pgvector / PostgreSQL pieces
+# are bridged: <=> becomes a Python cosine_distance(), the vector CAST is
+# dropped, EXTRACT(epoch FROM a - b) becomes a julianday() difference, and
+# greatest()/power() are registered as Python functions.
+
+
+def _sqlite_compiler():
+    import sqlalchemy as sa
+    from sqlalchemy.dialects.sqlite.base import SQLiteCompiler
+    from sqlalchemy.sql import operators
+
+    class PgBridgeCompiler(SQLiteCompiler):
+        def visit_custom_op_binary(self, element, operator, **kw):
+            if operator.opstring == "<=>":
+                left = self.process(element.left, **kw)
+                right = self.process(element.right, **kw)
+                return f"cosine_distance({left}, {right})"
+            return super().visit_custom_op_binary(element, operator, **kw)
+
+        def visit_cast(self, cast, **kw):
+            if isinstance(cast.type, sa.types.UserDefinedType):
+                return self.process(cast.clause, **kw)
+            return super().visit_cast(cast, **kw)
+
+        def visit_extract(self, extract, **kw):
+            expr = extract.expr
+            if extract.field == "epoch" and getattr(expr, "operator", None) is operators.sub:
+                left = self.process(expr.left, **kw)
+                right = self.process(expr.right, **kw)
+                return f"((julianday({left}) - julianday({right})) * 86400.0)"
+            return super().visit_extract(extract, **kw)
+
+    return PgBridgeCompiler
+
+
+def _cosine_distance(a: str, b: str) -> float:
+    import json
+
+    from src.memory.vector_search import cosine_similarity
+
+    return 1.0 - cosine_similarity(json.loads(a), json.loads(b))
+
+
+@pytest.fixture()
+async def sqlite_memory(tmp_path):
+    """async_sessionmaker over a SQLite memory_items table plus an insert helper."""
+    import math
+
+    import sqlalchemy as sa
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'memory.db'}")
+    engine.sync_engine.dialect.statement_compiler = _sqlite_compiler()
+
+    @sa.event.listens_for(engine.sync_engine, "connect")
+    def _functions(dbapi_connection, _record) -> None:
+        dbapi_connection.create_function("cosine_distance", 2, _cosine_distance)
+        dbapi_connection.create_function("greatest", 2, max)
+        dbapi_connection.create_function("power", 2, math.pow)
+
+    table = sa.Table(
+        "memory_items",
+        sa.MetaData(),
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("org_id", sa.Uuid()),
+        sa.Column("user_id", sa.Uuid()),
+        sa.Column("content", sa.Text()),
+        sa.Column("embedding", sa.Text()),
+        sa.Column("confidence", sa.Float()),
+        sa.Column("valid_at", sa.DateTime(timezone=True)),
+        sa.Column("last_validated_at", sa.DateTime(timezone=True)),
+        sa.Column("invalid_at", sa.DateTime(timezone=True)),
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(table.metadata.create_all)
+
+    async def insert(**row) -> None:
+        async with engine.begin() as conn:
+            await conn.execute(sa.insert(table).values(**row))
+
+    yield async_sessionmaker(engine), insert
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestDecayRankedSearchExecution:
+    """The stale threshold is applied before candidates are pooled."""
+
+    async def test_stale_rows_do_not_crowd_out_fresh_ones(
+        self, sqlite_memory, org_id, user_id
+    ) -> None:
+        from datetime import UTC, datetime, timedelta
+
+        from src.memory.confidence import DecayRanking
+        from src.memory.vector_search import PgVectorSearchEngine
+
+        session_factory, insert = sqlite_memory
+        now = datetime(2026, 10, 19, tzinfo=UTC)
+
+        # Stale rows are the nearest vectors and carry the highest stored
+        # confidence, so they fill both pools unless filtered inside them.
+        stale_ids = [uuid4() for _ in range(3)]
+        for i, mid in enumerate(stale_ids):
+            await insert(
+                id=mid,
+                org_id=org_id,
+                user_id=user_id,
+                content=f"green tea note {i}",
+                embedding=f"[1.0, {0.01 * i}]",
+                confidence=0.95,
+                valid_at=now - timedelta(days=365),
+            )
+        fresh_ids = [uuid4() for _ in range(2)]
+        for i, mid in enumerate(fresh_ids):
+            await insert(
+                id=mid,
+                org_id=org_id,
+                user_id=user_id,
+                content=f"oolong tea note {i}",
+                embedding=f"[0.5, {0.5 + 0.1 * i}]",
+                confidence=0.6,
+                valid_at=now - timedelta(days=10),
+            )
+
+        engine = PgVectorSearchEngine(session_factory=session_factory)
+        results = await engine.decay_ranked_search(
+            embedding=[1.0, 0.0],
+            query="tea",
+            org_id=org_id,
+            user_id=user_id,
+            ranking=DecayRanking(stale_threshold=0.3, candidate_k=2),
+            now=now,
+            top_k=2,
+        )
+
+        assert [r.memory_id for r in results] == fresh_ids
+        assert all(r.effective_confidence >= 0.3 for r in results)
+        assert results[0].vector_rank == 1
+        assert results[0].keyword_rank is not None
+
+    async def test_without_threshold_stale_rows_still_rank(
+        self, sqlite_memory, org_id, user_id
+    ) -> None:
+        from datetime import UTC, datetime, timedelta
+
+        from src.memory.confidence import DecayRanking
+        from src.memory.vector_search import PgVectorSearchEngine
+
+        session_factory, insert = sqlite_memory
+        now = datetime(2026, 10, 19, tzinfo=UTC)
+        stale_id = uuid4()
+        await insert(
+            id=stale_id,
+            org_id=org_id,
+            user_id=user_id,
+            content="green tea",
+            embedding="[1.0, 0.0]",
+            confidence=0.95,
+            valid_at=now - timedelta(days=365),
+        )
+
+        engine = PgVectorSearchEngine(session_factory=session_factory)
+        results = await engine.decay_ranked_search(
+            embedding=[1.0, 0.0],
+            query="tea",
+            org_id=org_id,
+            user_id=user_id,
+            ranking=DecayRanking(),
+            now=now,
+            top_k=5,
+        )
+
+        assert [r.memory_id for r in results] == [stale_id]
+        assert results[0].effective_confidence == pytest.approx(0.95 * 2 ** (-365 / 90))
@@ -7,7 +7,7 @@ Uses Fake adapter pattern (no unittest.mock).
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -16,7 +16,48 @@ from src.memory.promotion.pipeline import (
     PromotionThresholds,
     sanitize_content,
 )
-from src.shared.types import MemoryItem
+from src.shared.types import MemoryItem, VectorPoint
+
+
+class FakeKnowledgeIndex:
+    """Nearest knowledge hit for known vectors; records each lookup's org."""
+
+    def __init__(self, hits: dict[tuple[float, ...], float]) -> None:
+        self.knowledge_id = uuid4()
+        self.orgs: list[UUID | None] = []
+        self._hits = hits
+
+    async def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        *,
+        org_id: UUID | None = None,
+        limit: int = 10,
+    ) -> list[list[VectorPoint]]:
+        self.orgs.append(org_id)
+        out: list[list[VectorPoint]] = []
+        for vector in query_vectors:
+            score = self._hits.get(tuple(vector))
+            out.append(
+                []
+                if score is None
+                else [
+                    VectorPoint(
+                        point_id=uuid4(), vector=[], graph_node_id=self.knowledge_id, score=score
+                    )
+                ]
+            )
+        return out
+
+
+class FakeEmbedder:
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.calls: list[str] = []
+        self._vectors = vectors
+
+    async def embed(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self._vectors.get(text, [0.0, 0.0])
 
 
 def _make_memory(
@@ -173,3 +214,53 @@ class TestApprovalFlow:
         await pipeline.create_proposal(memory, target_org_id=uuid4())
         receipts = pipeline.get_receipts()
         assert len(receipts) >= 1
+
+
+class TestConflictCheck:
+    @pytest.mark.asyncio
+    async def test_similar_knowledge_rejects_proposal(self) -> None:
+        index = FakeKnowledgeIndex({(1.0, 0.0): 0.97})
+        embedder = FakeEmbedder({"Customer prefers cotton fabrics": [1.0, 0.0]})
+        pipeline = PromotionPipeline(vector_search=index, embedder=embedder)
+        org_id = uuid4()
+
+        receipt = await pipeline.create_proposal(_make_memory(), target_org_id=org_id)
+
+        assert receipt.status == "rejected"
+        assert receipt.target_knowledge_id == index.knowledge_id
+        assert "similarity=0.97" in (receipt.rejection_reason or "")
+        assert index.orgs == [org_id]
+        assert pipeline.get_proposal(receipt.proposal_id) is None
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_creates_proposal(self) -> None:
+        index = FakeKnowledgeIndex({(1.0, 0.0): 0.5})
+        embedder = FakeEmbedder({"Customer prefers cotton fabrics": [1.0, 0.0]})
+        pipeline = PromotionPipeline(vector_search=index, embedder=embedder)
+
+        receipt = await pipeline.create_proposal(_make_memory(), target_org_id=uuid4())
+
+        assert receipt.status == "promoted"
+
+    @pytest.mark.asyncio
+    async def test_stored_embedding_skips_embedder(self) -> None:
+        index = FakeKnowledgeIndex({(0.0, 1.0): 0.95})
+        embedder = FakeEmbedder({})
+        pipeline = PromotionPipeline(vector_search=index, embedder=embedder)
+
+        receipt = await pipeline.create_proposal(
+            _make_memory(), target_org_id=uuid4(), embedding=[0.0, 1.0]
+        )
+
+        assert receipt.status == "rejected"
+        assert embedder.calls == []
+
+    @pytest.mark.asyncio
+    async def test_no_embedding_source_skips_check(self) -> None:
+        index = FakeKnowledgeIndex({})
+        pipeline = PromotionPipeline(vector_search=index)
+
+        receipt = await pipeline.create_proposal(_make_memory(), target_org_id=uuid4())
+
+        assert receipt.status == "promoted"
+        assert index.orgs == []
@@ -0,0 +1,261 @@
+"""MC3-1: Batch promotion scanner tests.
+
+Tests: one-pass eligibility, bulk sanitization, batched conflict lookup,
+persisted/incremental proposals, per-user cap, bounded resumable runs.
+Uses Fake adapter pattern (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from src.memory.items import MemoryItemStore
+from src.memory.promotion.pipeline import (
+    PromotionThresholds,
+    sanitize_content,
+    sanitize_many,
+)
+from src.memory.promotion.scanner import (
+    CHECKPOINT_KEY_PREFIX,
+    PROMOTION_SCAN_TASK,
+    InMemoryPromotionSource,
+    PromotionScanner,
+    PromotionScanPolicy,
+    promotion_scan_task,
+)
+from src.memory.receipt import ReceiptStore
+from src.shared.types import VectorPoint
+from tests.fakes import FakeStorage
+
+_LATER = datetime.now(UTC) + timedelta(days=10)  # seeded items are 10 days old by then
+
+
+class FakeKnowledgeIndex:
+    """Returns a fixed nearest neighbour for known vectors; records each batch."""
+
+    def __init__(self, hits: dict[tuple[float, ...], float] | None = None) -> None:
+        self.batches: list[int] = []
+        self.knowledge_id = uuid4()
+        self._hits = hits or {}
+
+    async def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        *,
+        org_id: UUID | None = None,
+        limit: int = 10,
+    ) -> list[list[VectorPoint]]:
+        self.batches.append(len(query_vectors))
+        out: list[list[VectorPoint]] = []
+        for vector in query_vectors:
+            score = self._hits.get(tuple(vector))
+            if score is None:
+                out.append([])
+                continue
+            out.append(
+                [
+                    VectorPoint(
+                        point_id=uuid4(), vector=[], graph_node_id=self.knowledge_id, score=score
+                    )
+                ]
+            )
+        return out
+
+
+async def _seed(
+    store: MemoryItemStore,
+    receipts: ReceiptStore,
+    org_id: UUID,
+    user_id: UUID,
+    *,
+    content: str = "Customers prefer linen in summer",
+    confidence: float = 0.9,
+    uses: int = 3,
+):
+    item = store.create(
+        user_id=user_id, memory_type="preference", content=content, confidence=confidence
+    )
+    for _ in range(uses):
+        await receipts.record_retrieval(
+            memory_item_id=item.memory_id,
+            org_id=org_id,
+            candidate_score=0.8,
+            decision_reason="retrieved_for_context",
+        )
+    return item
+
+
+def _scanner(source, **kw) -> PromotionScanner:
+    kw.setdefault("checkpoints", FakeStorage())
+    return PromotionScanner(source, clock=lambda: _LATER, **kw)
+
+
+@pytest.mark.unit
+class TestSanitizeMany:
+    def test_matches_single_item_sanitizer(self) -> None:
+        contents = [
+            "likes cotton",
+            "mail me at a.b@example.com",
+            "call 555-123-4567 or card 4111 1111 1111 1111",
+        ]
+        assert sanitize_many(contents) == [sanitize_content(c) for c in contents]
+
+
+@pytest.mark.unit
+class TestPromotionScanner:
+    async def test_selects_only_eligible_memories(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        hot = await _seed(store, receipts, org_id, user_id)
+        await _seed(store, receipts, org_id, user_id, uses=2)
+        await _seed(store, receipts, org_id, user_id, confidence=0.5)
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+
+        report = await _scanner(source).run_org(org_id)
+
+        assert report.completed is True
+        assert report.scanned == 1
+        assert report.proposed == 1
+        proposal = source.proposals[hot.memory_id]
+        assert proposal.status == "pending_approval"
+        assert proposal.user_id == user_id
+        assert proposal.expires_at == _LATER + timedelta(days=7)
+
+    async def test_too_young_memories_skipped(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        await _seed(store, receipts, org_id, user_id)
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+
+        report = await PromotionScanner(source, checkpoints=FakeStorage()).run_org(org_id)
+
+        assert report.scanned == 0
+
+    async def test_pii_persisted_as_sanitize_failed(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        item = await _seed(store, receipts, org_id, user_id, content="email x@example.com")
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+
+        report = await _scanner(source).run_org(org_id)
+
+        assert report.sanitize_failed == 1
+        assert report.proposed == 0
+        proposal = source.proposals[item.memory_id]
+        assert proposal.status == "sanitize_failed"
+        assert "[REDACTED_EMAIL]" in proposal.sanitized_content
+
+    async def test_conflicts_checked_in_one_batch_per_chunk(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        items = [
+            await _seed(store, receipts, org_id, user_id, content=f"fact {i}") for i in range(4)
+        ]
+        embeddings = {item.memory_id: [float(i), 1.0] for i, item in enumerate(items)}
+        index = FakeKnowledgeIndex(hits={(0.0, 1.0): 0.97, (1.0, 1.0): 0.5})
+        source = InMemoryPromotionSource(
+            store, receipts, users_by_org={org_id: [user_id]}, embeddings=embeddings
+        )
+
+        report = await _scanner(source, conflicts=index).run_org(org_id)
+
+        assert index.batches == [4]
+        assert report.conflicts == 1
+        assert report.proposed == 3
+        rejected = source.proposals[items[0].memory_id]
+        assert rejected.status == "rejected"
+        assert rejected.similar_knowledge_id == index.knowledge_id
+        assert rejected.similarity_score == pytest.approx(0.97)
+
+    async def test_second_run_is_incremental(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        await _seed(store, receipts, org_id, user_id)
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+        scanner = _scanner(source)
+        await scanner.run_org(org_id)
+
+        await _seed(store, receipts, org_id, user_id, content="new fact")
+        second = await scanner.run_org(org_id)
+
+        assert second.scanned == 1
+        assert len(source.proposals) == 2
+
+    async def test_pending_cap_defers_extra_candidates(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        for i in range(3):
+            await _seed(store, receipts, org_id, user_id, content=f"fact {i}")
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+        scanner = _scanner(source, thresholds=PromotionThresholds(max_pending_per_user=2))
+
+        report = await scanner.run_org(org_id)
+
+        assert report.proposed == 2
+        assert report.deferred == 1
+        assert len(source.proposals) == 2
+
+    async def test_chunk_budget_checkpoints_and_resumes(self) -> None:
+        org_id = uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        users = [uuid4() for _ in range(5)]
+        for user_id in users:
+            await _seed(store, receipts, org_id, user_id)
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: users})
+        checkpoints = FakeStorage()
+        scanner = _scanner(
+            source, checkpoints=checkpoints, policy=PromotionScanPolicy(chunk_size=2)
+        )
+
+        first = await scanner.run_org(org_id, max_chunks=1)
+        assert first.budget_exhausted is True
+        assert first.scanned == 2
+        assert f"{CHECKPOINT_KEY_PREFIX}:{org_id}" in checkpoints.data
+
+        second = await scanner.run_org(org_id)
+        assert second.resumed is True
+        assert second.scanned == 3
+        assert second.completed is True
+        assert checkpoints.data == {}
+        assert len(source.proposals) == 5
+
+    async def test_time_budget_stops_run(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        await _seed(store, receipts, org_id, user_id)
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+        scanner = _scanner(source, policy=PromotionScanPolicy(time_budget_seconds=0.0))
+
+        report = await scanner.run_org(org_id)
+
+        assert report.budget_exhausted is True
+        assert source.scan_calls == 0
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            PromotionScanPolicy(chunk_size=0)
+        with pytest.raises(ValueError, match="conflict_similarity"):
+            PromotionScanPolicy(conflict_similarity=1.5)
+
+
+@pytest.mark.unit
+class TestPromotionScanTask:
+    async def test_runs_through_task_executor(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store, receipts = MemoryItemStore(), ReceiptStore()
+        await _seed(store, receipts, org_id, user_id)
+        source = InMemoryPromotionSource(store, receipts, users_by_org={org_id: [user_id]})
+        executor = BackgroundTaskExecutor()
+        executor.register(PROMOTION_SCAN_TASK, promotion_scan_task(_scanner(source)))
+
+        result = await executor.run_task(PROMOTION_SCAN_TASK, args=(str(org_id),))
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result["org_id"] == str(org_id)
+        assert result.result["proposed"] == 1
+        assert len(source.proposals) == 1
@@ -0,0 +1,269 @@
+"""Tests for the bulk deletion purge engine and deletion SLI metrics.
+
+Task card: MC4-1 / MC4-3
+- Chunked row deletes, batched vector + object deletes
+- Checkpointed progress survives a crash mid-run
+- deletion_timeout_rate reflects items purged past the SLA
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from src.memory.deletion.fsm import DeletionEvent, DeletionState
+from src.memory.deletion.metrics import DeletionSLI
+from src.memory.deletion.purge import (
+    CHECKPOINT_KEY_PREFIX,
+    PURGE_TASK,
+    InMemoryPurgeStore,
+    PurgeEngine,
+    PurgeRequest,
+    purge_task,
+)
+from src.shared.types import BatchDeleteResult
+from tests.fakes import FakeStorage
+
+
+class FakeObjectStorage:
+    """Records delete_objects batches; keys in `fail_keys` report errors."""
+
+    def __init__(self, fail_keys: set[str] | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self._fail = fail_keys or set()
+
+    async def delete_objects(self, bucket: str, keys: list[str]) -> BatchDeleteResult:
+        self.batches.append(list(keys))
+        return BatchDeleteResult(
+            deleted=[k for k in keys if k not in self._fail],
+            errors=[{"key": k, "error": "AccessDenied"} for k in keys if k in self._fail],
+        )
+
+
+class FakeVectors:
+    def __init__(self) -> None:
+        self.batches: list[list[UUID]] = []
+
+    async def delete_points(self, point_ids: list[UUID]) -> None:
+        self.batches.append(list(point_ids))
+
+
+class CrashingStore(InMemoryPurgeStore):
+    """Raises on the Nth delete_rows call to simulate a worker crash."""
+
+    def __init__(self, crash_on: int) -> None:
+        super().__init__()
+        self._crash_on = crash_on
+
+    async def delete_rows(self, org_id: UUID, memory_ids: list[UUID]) -> int:
+        if self.delete_calls + 1 == self._crash_on:
+            self.delete_calls += 1
+            msg = "worker lost"
+            raise RuntimeError(msg)
+        return await super().delete_rows(org_id, memory_ids)
+
+
+def _seed(store: InMemoryPurgeStore, org_id: UUID, user_id: UUID, n: int, **kw) -> list[UUID]:
+    ids = []
+    for i in range(n):
+        mid = uuid4()
+        keys = (f"{user_id}/{i}.png",) if kw.get("with_objects") else ()
+        store.add(mid, org_id=org_id, user_id=user_id, object_keys=keys)
+        ids.append(mid)
+    return ids
+
+
+@pytest.mark.unit
+class TestPurgeEngine:
+    async def test_user_scope_purges_only_that_user(self) -> None:
+        org_id, user_a, user_b = uuid4(), uuid4(), uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, user_a, 12)
+        keep = _seed(store, org_id, user_b, 3)
+        engine = PurgeEngine(store, checkpoints=FakeStorage(), chunk_size=5)
+
+        report = await engine.run(PurgeRequest(job_id=uuid4(), org_id=org_id, user_id=user_a))
+
+        assert report.completed is True
+        assert report.purged == 12
+        assert report.chunks == 3
+        assert set(store.rows) == set(keep)
+        assert store.delete_calls == 3
+
+    async def test_org_scope_purges_everything(self) -> None:
+        org_id, other_org = uuid4(), uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, uuid4(), 4)
+        _seed(store, org_id, uuid4(), 4)
+        other = _seed(store, other_org, uuid4(), 2)
+        engine = PurgeEngine(store, checkpoints=FakeStorage(), chunk_size=100)
+
+        report = await engine.run(
+            PurgeRequest(job_id=uuid4(), org_id=org_id, reason="org_offboarding")
+        )
+
+        assert report.purged == 8
+        assert set(store.rows) == set(other)
+
+    async def test_batched_vector_and_object_deletes(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, user_id, 6, with_objects=True)
+        objects, vectors = FakeObjectStorage(), FakeVectors()
+        engine = PurgeEngine(
+            store,
+            checkpoints=FakeStorage(),
+            object_storage=objects,
+            vectors=vectors,
+            chunk_size=3,
+        )
+
+        report = await engine.run(PurgeRequest(job_id=uuid4(), org_id=org_id))
+
+        assert [len(b) for b in objects.batches] == [3, 3]
+        assert [len(b) for b in vectors.batches] == [3, 3]
+        assert report.objects_deleted == 6
+
+    async def test_object_failure_keeps_row_and_fails_fsm(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store = InMemoryPurgeStore()
+        ids = _seed(store, org_id, user_id, 3, with_objects=True)
+        bad_key = store.rows[ids[1]][2][0]
+        events: list[DeletionEvent] = []
+
+        async def sink(batch: list[DeletionEvent]) -> None:
+            events.extend(batch)
+
+        engine = PurgeEngine(
+            store,
+            checkpoints=FakeStorage(),
+            object_storage=FakeObjectStorage(fail_keys={bad_key}),
+            event_sink=sink,
+        )
+        request = PurgeRequest(job_id=uuid4(), org_id=org_id)
+
+        report = await engine.run(request)
+
+        assert report.failed == 1
+        assert report.failed_ids == [ids[1]]
+        assert set(store.rows) == {ids[1]}
+        failed = [e for e in events if e.to_state == DeletionState.FAILED]
+        assert [e.memory_id for e in failed] == [ids[1]]
+        assert failed[0].error == "AccessDenied"
+        purged = [e for e in events if e.to_state == DeletionState.PURGED]
+        assert len(purged) == 2
+
+    async def test_resume_after_crash(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store = CrashingStore(crash_on=3)
+        _seed(store, org_id, user_id, 10)
+        checkpoints = FakeStorage()
+        request = PurgeRequest(job_id=uuid4(), org_id=org_id)
+        engine = PurgeEngine(store, checkpoints=checkpoints, chunk_size=2)
+
+        with pytest.raises(RuntimeError, match="worker lost"):
+            await engine.run(request)
+        assert f"{CHECKPOINT_KEY_PREFIX}:{request.job_id}" in checkpoints.data
+        assert len(store.rows) == 6
+
+        report = await engine.run(request)
+
+        assert report.resumed is True
+        assert report.completed is True
+        assert report.purged == 6
+        assert store.rows == {}
+        assert checkpoints.data == {}
+
+    async def test_max_chunks_keeps_checkpoint(self) -> None:
+        org_id = uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, uuid4(), 10)
+        checkpoints = FakeStorage()
+        request = PurgeRequest(job_id=uuid4(), org_id=org_id)
+        engine = PurgeEngine(store, checkpoints=checkpoints, chunk_size=3)
+
+        first = await engine.run(request, max_chunks=2)
+        assert first.completed is False
+        assert first.purged == 6
+        assert checkpoints.ttls[f"{CHECKPOINT_KEY_PREFIX}:{request.job_id}"] is not None
+
+        second = await engine.run(request)
+        assert second.completed is True
+        assert second.purged == 4
+
+    def test_chunk_size_validation(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            PurgeEngine(InMemoryPurgeStore(), checkpoints=FakeStorage(), chunk_size=0)
+
+
+@pytest.mark.unit
+class TestDeletionSLI:
+    async def test_timeout_rate_counts_items_past_sla(self) -> None:
+        registry = CollectorRegistry()
+        sli = DeletionSLI(registry=registry)
+        org_id = uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, uuid4(), 4)
+        late_clock = lambda: datetime.now(UTC) + timedelta(days=31)  # noqa: E731
+        engine = PurgeEngine(store, checkpoints=FakeStorage(), sli=sli, clock=late_clock)
+
+        await engine.run(PurgeRequest(job_id=uuid4(), org_id=org_id))
+
+        assert sli.deletion_timeout_rate == 1.0
+        assert registry.get_sample_value("memory_deletion_timeout_rate") == 1.0
+        assert (
+            registry.get_sample_value("memory_deletion_timeout_total", {"reason": "gdpr_erasure"})
+            == 4.0
+        )
+
+    async def test_within_sla_keeps_rate_zero(self) -> None:
+        registry = CollectorRegistry()
+        sli = DeletionSLI(registry=registry)
+        org_id = uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, uuid4(), 3)
+        engine = PurgeEngine(store, checkpoints=FakeStorage(), sli=sli)
+
+        await engine.run(PurgeRequest(job_id=uuid4(), org_id=org_id))
+
+        assert sli.deletion_timeout_rate == 0.0
+        assert (
+            registry.get_sample_value("memory_deletion_purged_total", {"reason": "gdpr_erasure"})
+            == 3.0
+        )
+        assert registry.get_sample_value("memory_deletion_batch_duration_seconds_count") == 1.0
+
+    def test_idle_rate_is_zero(self) -> None:
+        assert DeletionSLI(registry=CollectorRegistry()).deletion_timeout_rate == 0.0
+
+
+@pytest.mark.unit
+class TestPurgeTask:
+    async def test_runs_through_task_executor(self) -> None:
+        org_id, user_id, job_id = uuid4(), uuid4(), uuid4()
+        store = InMemoryPurgeStore()
+        _seed(store, org_id, user_id, 4)
+        executor = BackgroundTaskExecutor()
+        executor.register(PURGE_TASK, purge_task(PurgeEngine(store, checkpoints=FakeStorage())))
+        requested_at = datetime.now(UTC) - timedelta(days=40)
+
+        result = await executor.run_task(
+            PURGE_TASK,
+            kwargs={
+                "job_id": str(job_id),
+                "org_id": str(org_id),
+                "user_id": str(user_id),
+                "requested_at": requested_at.isoformat(),
+            },
+        )
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result["job_id"] == str(job_id)
+        assert result.result["purged"] == 4
+        assert result.result["timed_out"] == 4  # deadline taken from requested_at
+        assert store.rows == {}
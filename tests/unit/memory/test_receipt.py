@@ -6,11 +6,19 @@ Complies with no-mock policy.
 
 from __future__ import annotations
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 
-from src.memory.receipt import MemoryReceipt, ReceiptStore
+from src.memory.receipt import (
+    BufferedReceiptWriter,
+    MemoryReceipt,
+    ReceiptDailyCount,
+    ReceiptStore,
+    window_start,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -188,3 +196,186 @@ class TestReceiptStore:
         )
         assert len(await store.get_receipts_for_item(mid1)) == 1
         assert len(await store.get_receipts_for_item(mid2)) == 1
+
+
+def _receipt(memory_item_id, org_id, receipt_type: str, created_at: datetime) -> MemoryReceipt:
+    return MemoryReceipt(
+        id=uuid4(),
+        memory_item_id=memory_item_id,
+        org_id=org_id,
+        receipt_type=receipt_type,
+        candidate_score=0.5,
+        decision_reason="r",
+        policy_version="v1",
+        guardrail_hit=False,
+        context_position=None,
+        created_at=created_at,
+    )
+
+
+@pytest.mark.unit
+class TestReceiptFrequency:
+    """Windowed receipt frequencies backed by the daily rollup."""
+
+    _NOW = datetime(2026, 3, 31, 9, tzinfo=UTC)
+
+    async def test_window_includes_today_and_excludes_older(
+        self, store: ReceiptStore, org_id, memory_item_id
+    ) -> None:
+        await store.record_many(
+            [
+                _receipt(memory_item_id, org_id, "injection", self._NOW),
+                _receipt(memory_item_id, org_id, "retrieval", self._NOW - timedelta(days=29)),
+                _receipt(memory_item_id, org_id, "retrieval", self._NOW - timedelta(days=30)),
+            ]
+        )
+
+        assert await store.frequency(memory_item_id, now=self._NOW) == 2
+        assert await store.frequency(memory_item_id, days=1, now=self._NOW) == 1
+        assert await store.frequency(memory_item_id, receipt_type="retrieval", now=self._NOW) == 1
+
+    async def test_frequencies_zero_fill(self, store: ReceiptStore, org_id) -> None:
+        hot, cold = uuid4(), uuid4()
+        await store.record_many([_receipt(hot, org_id, "injection", self._NOW)])
+
+        assert await store.frequencies([hot, cold], now=self._NOW) == {hot: 1, cold: 0}
+
+    async def test_daily_counts_grouped_by_day_and_type(
+        self, store: ReceiptStore, org_id, memory_item_id
+    ) -> None:
+        yesterday = self._NOW - timedelta(days=1)
+        await store.record_many(
+            [
+                _receipt(memory_item_id, org_id, "retrieval", yesterday),
+                _receipt(memory_item_id, org_id, "retrieval", yesterday),
+                _receipt(memory_item_id, org_id, "injection", self._NOW),
+            ]
+        )
+
+        rows = await store.daily_counts(memory_item_id, days=7, now=self._NOW)
+
+        assert rows == [
+            ReceiptDailyCount(day=yesterday.date(), receipt_type="retrieval", count=2),
+            ReceiptDailyCount(day=self._NOW.date(), receipt_type="injection", count=1),
+        ]
+
+    def test_window_start_validation(self) -> None:
+        assert window_start(1, self._NOW) == self._NOW.date()
+        with pytest.raises(ValueError, match="days"):
+            window_start(0)
+
+
+class FailingSink:
+    async def record_many(self, receipts: list[MemoryReceipt]) -> None:
+        msg = "db down"
+        raise ConnectionError(msg)
+
+
+class CountingSink(ReceiptStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    async def record_many(self, receipts: list[MemoryReceipt]) -> None:
+        self.batches.append(len(receipts))
+        await super().record_many(receipts)
+
+
+async def _retrieve(writer: BufferedReceiptWriter, org_id, memory_item_id, n: int) -> None:
+    for i in range(n):
+        await writer.record_retrieval(
+            memory_item_id=memory_item_id,
+            org_id=org_id,
+            candidate_score=0.7,
+            decision_reason="retrieved_for_context",
+            context_position=i,
+        )
+
+
+@pytest.mark.unit
+class TestBufferedReceiptWriter:
+    """Receipts are queued on the hot path and flushed in batches."""
+
+    async def test_record_only_enqueues(self, org_id, memory_item_id) -> None:
+        sink = CountingSink()
+        writer = BufferedReceiptWriter(sink, batch_size=10)
+
+        receipt = await writer.record_injection(
+            memory_item_id=memory_item_id,
+            org_id=org_id,
+            candidate_score=0.9,
+            decision_reason="injected",
+        )
+
+        assert receipt.receipt_type == "injection"
+        assert writer.pending == 1
+        assert sink.batches == []
+
+    async def test_flush_writes_in_batches(self, org_id, memory_item_id) -> None:
+        sink = CountingSink()
+        writer = BufferedReceiptWriter(sink, batch_size=4)
+        await _retrieve(writer, org_id, memory_item_id, 10)
+
+        written = await writer.flush()
+
+        assert written == 10
+        assert sink.batches == [4, 4, 2]
+        assert writer.stats.flushes == 3
+        assert (await sink.count_by_type(memory_item_id))["retrieval"] == 10
+
+    async def test_size_threshold_triggers_background_flush(self, org_id, memory_item_id) -> None:
+        sink = CountingSink()
+        writer = BufferedReceiptWriter(sink, batch_size=5, flush_interval=60.0)
+        writer.start()
+
+        await _retrieve(writer, org_id, memory_item_id, 5)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert sink.batches == [5]
+        await writer.close()
+
+    async def test_time_threshold_flushes_partial_batch(self, org_id, memory_item_id) -> None:
+        sink = CountingSink()
+        writer = BufferedReceiptWriter(sink, batch_size=100, flush_interval=0.01)
+        writer.start()
+
+        await _retrieve(writer, org_id, memory_item_id, 3)
+        await asyncio.sleep(0.05)
+
+        assert sink.batches == [3]
+        await writer.close()
+
+    async def test_close_drains_queue(self, org_id, memory_item_id) -> None:
+        sink = CountingSink()
+        writer = BufferedReceiptWriter(sink, batch_size=100, flush_interval=60.0)
+        writer.start()
+        await _retrieve(writer, org_id, memory_item_id, 7)
+
+        await writer.close()
+
+        assert writer.pending == 0
+        assert writer.stats.written == 7
+
+    async def test_full_queue_drops_and_counts(self, org_id, memory_item_id) -> None:
+        writer = BufferedReceiptWriter(CountingSink(), max_queue=5, batch_size=5)
+
+        await _retrieve(writer, org_id, memory_item_id, 8)
+
+        assert writer.pending == 5
+        assert writer.stats.enqueued == 5
+        assert writer.stats.dropped == 3
+
+    async def test_failed_batch_counted_as_loss(self, org_id, memory_item_id) -> None:
+        writer = BufferedReceiptWriter(FailingSink(), batch_size=2)
+        await _retrieve(writer, org_id, memory_item_id, 3)
+
+        written = await writer.flush()
+
+        assert written == 0
+        assert writer.stats.dropped == 3
+        assert writer.pending == 0
+
+    def test_rejects_queue_smaller_than_batch(self) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            BufferedReceiptWriter(ReceiptStore(), max_queue=5, batch_size=10)
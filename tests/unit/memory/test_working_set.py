@@ -0,0 +1,222 @@
+"""Unit tests for the per-user memory working set (MC2-4).
+
+Tests: LRU/TTL behaviour, shared tier across workers, change-driven
+invalidation from the adapter, item store and purge engine, stats.
+Uses Fake adapters (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.memory.deletion.purge import InMemoryPurgeStore, PurgeEngine, PurgeRequest
+from src.memory.items import PgMemoryItemStore
+from src.memory.pg_adapter import PgMemoryCoreAdapter
+from src.memory.working_set import SHARED_KEY_PREFIX, MemoryWorkingSet
+from src.shared.types import MemoryItem, Observation
+from tests.fakes import FakeAsyncSession, FakeOrmRow, FakeSessionFactory, FakeStorage
+
+
+def _item(user_id: UUID, content: str = "likes coffee") -> MemoryItem:
+    return MemoryItem(
+        memory_id=uuid4(),
+        user_id=user_id,
+        memory_type="preference",
+        content=content,
+        valid_at=datetime.now(UTC),
+        source_sessions=[uuid4()],
+        provenance={"source": "chat"},
+    )
+
+
+def _row(user_id: UUID, org_id: UUID) -> FakeOrmRow:
+    return FakeOrmRow(
+        id=uuid4(),
+        user_id=user_id,
+        org_id=org_id,
+        memory_type="observation",
+        content="likes coffee",
+        confidence=0.9,
+        valid_at=datetime.now(UTC),
+        invalid_at=None,
+        source_sessions=[],
+        superseded_by=None,
+        version=1,
+        provenance=None,
+        epistemic_type="fact",
+    )
+
+
+@pytest.mark.unit
+class TestMemoryWorkingSet:
+    async def test_hit_after_put(self) -> None:
+        ws = MemoryWorkingSet()
+        user_id = uuid4()
+        items = [_item(user_id)]
+
+        assert await ws.get(user_id, "coffee", 10) is None
+        await ws.put(user_id, "coffee", 10, items)
+
+        assert await ws.get(user_id, "coffee", 10) == items
+        assert await ws.get(user_id, "coffee", 5) is None  # top_k is part of the key
+        assert ws.stats.lookups == 3
+        assert ws.stats.hits == 1
+        assert ws.stats.hit_ratio == pytest.approx(1 / 3)
+
+    async def test_local_ttl_expires(self) -> None:
+        now = [0.0]
+        ws = MemoryWorkingSet(local_ttl_seconds=10, clock=lambda: now[0])
+        user_id = uuid4()
+        await ws.put(user_id, "q", 10, [_item(user_id)])
+
+        now[0] = 11.0
+
+        assert await ws.get(user_id, "q", 10) is None
+
+    async def test_lru_bounds_users_and_queries(self) -> None:
+        ws = MemoryWorkingSet(max_users=2, max_queries_per_user=2)
+        users = [uuid4() for _ in range(3)]
+        for user_id in users:
+            await ws.put(user_id, "q", 10, [_item(user_id)])
+        for q in ("a", "b", "c"):
+            await ws.put(users[2], q, 10, [])
+
+        assert await ws.get(users[0], "q", 10) is None
+        assert await ws.get(users[1], "q", 10) is not None
+        assert await ws.get(users[2], "a", 10) is None
+        assert await ws.get(users[2], "c", 10) == []
+
+    async def test_shared_tier_serves_other_workers(self) -> None:
+        shared = FakeStorage()
+        worker_a = MemoryWorkingSet(shared=shared)
+        worker_b = MemoryWorkingSet(shared=shared)
+        user_id, org_id = uuid4(), uuid4()
+        items = [_item(user_id)]
+        await worker_a.put(user_id, "coffee", 10, items, org_id=org_id)
+
+        assert await worker_b.get(user_id, "coffee", 10, org_id=org_id) == items
+        assert worker_b.stats.shared_hits == 1
+        assert await worker_b.get(user_id, "coffee", 10, org_id=org_id) == items
+        assert worker_b.stats.hits == 1
+
+    async def test_invalidate_rotates_shared_generation(self) -> None:
+        shared = FakeStorage()
+        worker_a = MemoryWorkingSet(shared=shared)
+        worker_b = MemoryWorkingSet(shared=shared)
+        user_id = uuid4()
+        await worker_a.put(user_id, "coffee", 10, [_item(user_id)])
+
+        await worker_a.invalidate(user_id)
+
+        assert await worker_a.get(user_id, "coffee", 10) is None
+        assert await worker_b.get(user_id, "coffee", 10) is None
+        assert worker_a.stats.invalidations == 1
+
+    async def test_invalidate_org_drops_org_entries(self) -> None:
+        shared = FakeStorage()
+        ws = MemoryWorkingSet(shared=shared)
+        org_id, other_org = uuid4(), uuid4()
+        user_a, user_b = uuid4(), uuid4()
+        await ws.put(user_a, "q", 10, [_item(user_a)], org_id=org_id)
+        await ws.put(user_b, "q", 10, [_item(user_b)], org_id=other_org)
+
+        await ws.invalidate_org(org_id)
+
+        assert await ws.get(user_a, "q", 10, org_id=org_id) is None
+        assert await ws.get(user_b, "q", 10, org_id=other_org) is not None
+        assert not [k for k in shared.data if k.startswith(f"{SHARED_KEY_PREFIX}:{org_id}:")]
+
+    async def test_local_results_scoped_per_org(self) -> None:
+        ws = MemoryWorkingSet()
+        user_id, org_a, org_b = uuid4(), uuid4(), uuid4()
+        items = [_item(user_id)]
+        await ws.put(user_id, "coffee", 10, items, org_id=org_a)
+
+        assert await ws.get(user_id, "coffee", 10, org_id=org_b) is None
+        assert await ws.get(user_id, "coffee", 10) is None
+        assert await ws.get(user_id, "coffee", 10, org_id=org_a) == items
+
+    async def test_put_after_invalidate_is_dropped(self) -> None:
+        shared = FakeStorage()
+        worker_a = MemoryWorkingSet(shared=shared)
+        worker_b = MemoryWorkingSet(shared=shared)
+        user_id, org_id = uuid4(), uuid4()
+        stale = await worker_a.generation(user_id)
+        stale_b = await worker_b.generation(user_id)
+
+        await worker_a.invalidate(user_id)  # a write lands during the PG read
+        await worker_a.put(user_id, "q", 10, [_item(user_id)], org_id=org_id, generation=stale)
+        await worker_b.put(user_id, "q", 10, [_item(user_id)], org_id=org_id, generation=stale_b)
+
+        assert await worker_a.get(user_id, "q", 10, org_id=org_id) is None
+        assert await worker_b.get(user_id, "q", 10, org_id=org_id) is None
+        fresh = await worker_a.generation(user_id)
+        await worker_a.put(user_id, "q", 10, [_item(user_id)], org_id=org_id, generation=fresh)
+        assert await worker_a.get(user_id, "q", 10, org_id=org_id) is not None
+
+    def test_rejects_non_positive_bounds(self) -> None:
+        with pytest.raises(ValueError, match="max_users"):
+            MemoryWorkingSet(max_users=0)
+
+
+@pytest.mark.unit
+class TestWorkingSetInvalidation:
+    async def test_adapter_second_read_skips_db(self) -> None:
+        user_id, org_id = uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_scalars_result([_row(user_id, org_id)])
+        ws = MemoryWorkingSet()
+        adapter = PgMemoryCoreAdapter(session_factory=FakeSessionFactory(session), working_set=ws)
+
+        first = await adapter.read_personal_memories(user_id, "coffee", org_id=org_id)
+        second = await adapter.read_personal_memories(user_id, "coffee", org_id=org_id)
+
+        assert first == second
+        assert len(session.scalars_calls) == 1
+        assert adapter.working_set_stats is not None
+        assert adapter.working_set_stats.round_trips_avoided == 1
+
+    async def test_write_observation_invalidates(self) -> None:
+        user_id, org_id = uuid4(), uuid4()
+        session = FakeAsyncSession()
+        session.set_scalars_result([_row(user_id, org_id)])
+        adapter = PgMemoryCoreAdapter(
+            session_factory=FakeSessionFactory(session), working_set=MemoryWorkingSet()
+        )
+        await adapter.read_personal_memories(user_id, "coffee", org_id=org_id)
+
+        await adapter.write_observation(user_id, Observation(content="likes tea"), org_id=org_id)
+        await adapter.read_personal_memories(user_id, "coffee", org_id=org_id)
+
+        assert len(session.scalars_calls) == 2
+
+    async def test_item_store_update_and_supersede_invalidate(self) -> None:
+        user_id, org_id = uuid4(), uuid4()
+        ws = MemoryWorkingSet()
+        session = FakeAsyncSession()
+        session.set_execute_result(scalar_one_or_none_value=_row(user_id, org_id))
+        store = PgMemoryItemStore(session_factory=FakeSessionFactory(session), working_set=ws)
+
+        await ws.put(user_id, "q", 10, [])
+        await store.update_item(uuid4(), content="new")
+        assert await ws.get(user_id, "q", 10) is None
+
+        await ws.put(user_id, "q", 10, [])
+        await store.supersede_item(uuid4(), new_memory_id=uuid4())
+        assert await ws.get(user_id, "q", 10) is None
+        assert ws.stats.invalidations == 2
+
+    async def test_purge_invalidates_user(self) -> None:
+        org_id, user_id = uuid4(), uuid4()
+        store = InMemoryPurgeStore()
+        store.add(uuid4(), org_id=org_id, user_id=user_id)
+        ws = MemoryWorkingSet()
+        await ws.put(user_id, "q", 10, [_item(user_id)])
+        engine = PurgeEngine(store, checkpoints=FakeStorage(), working_set=ws)
+
+        await engine.run(PurgeRequest(job_id=uuid4(), org_id=org_id, user_id=user_id))
+
+        assert await ws.get(user_id, "q", 10) is None
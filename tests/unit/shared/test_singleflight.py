@@ -0,0 +1,195 @@
+"""Unit tests for singleflight request coalescing (T2-6).
+
+Tests: local coalescing, errors shared with every waiter, cancellation
+(one waiter vs all waiters), cross-worker lease mode (result handoff,
+holder failure fallback), stats.
+Uses Fake adapters (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.shared.singleflight import LeasePolicy, SingleFlight
+from tests.fakes import FakeStorage
+
+_FAST = LeasePolicy(poll_interval=0.001, wait_seconds=1.0)
+
+
+class Downstream:
+    """Counts executions; each one waits until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def fetch(self, value: str = "bundle") -> str:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return value
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+class TestSingleFlightLocal:
+    @pytest.mark.asyncio()
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        flight, down = SingleFlight(), Downstream()
+
+        calls = [asyncio.ensure_future(flight.do("k", down.fetch)) for _ in range(10)]
+        await _settle()
+        down.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert results == ["bundle"] * 10
+        assert down.calls == 1
+        assert flight.stats.executions == 1
+        assert flight.stats.local_shared == 9
+        assert flight.stats.coalesced_ratio == 0.9
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio()
+    async def test_not_a_cache(self) -> None:
+        flight, down = SingleFlight(), Downstream()
+        down.release.set()
+
+        await flight.do("k", down.fetch)
+        await flight.do("k", down.fetch)
+
+        assert down.calls == 2
+
+    @pytest.mark.asyncio()
+    async def test_distinct_keys_run_separately(self) -> None:
+        flight, down = SingleFlight(), Downstream()
+        down.release.set()
+
+        await asyncio.gather(flight.do("a", down.fetch), flight.do("b", down.fetch))
+
+        assert down.calls == 2
+
+    @pytest.mark.asyncio()
+    async def test_error_reaches_every_waiter(self) -> None:
+        flight = SingleFlight()
+        gate = asyncio.Event()
+
+        async def failing() -> str:
+            await gate.wait()
+            msg = "graph down"
+            raise RuntimeError(msg)
+
+        calls = [asyncio.ensure_future(flight.do("k", failing)) for _ in range(3)]
+        await _settle()
+        gate.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio()
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        flight, down = SingleFlight(), Downstream()
+        first = asyncio.ensure_future(flight.do("k", down.fetch))
+        second = asyncio.ensure_future(flight.do("k", down.fetch))
+        await _settle()
+
+        first.cancel()  # the caller that started the execution
+        await _settle()
+        down.release.set()
+
+        assert await second == "bundle"
+        assert first.cancelled()
+        assert down.cancelled == 0
+
+    @pytest.mark.asyncio()
+    async def test_execution_cancelled_when_nobody_waits(self) -> None:
+        flight, down = SingleFlight(), Downstream()
+        only = asyncio.ensure_future(flight.do("k", down.fetch))
+        await _settle()
+
+        only.cancel()
+        await _settle()
+
+        assert down.cancelled == 1
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio()
+    async def test_do_shared_flags_joiners(self) -> None:
+        flight, down = SingleFlight(), Downstream()
+
+        calls = [asyncio.ensure_future(flight.do_shared("k", down.fetch)) for _ in range(3)]
+        await _settle()
+        down.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert [shared for _, shared in results] == [False, True, True]
+
+
+@pytest.mark.unit
+class TestSingleFlightLease:
+    @pytest.mark.asyncio()
+    async def test_other_worker_reads_published_result(self) -> None:
+        store, down = FakeStorage(), Downstream()
+        worker_a = SingleFlight(store=store, policy=_FAST)
+        worker_b = SingleFlight(store=store, policy=_FAST)
+
+        a = asyncio.ensure_future(worker_a.do("k", down.fetch, encode=str, decode=str))
+        await _settle()
+        b = asyncio.ensure_future(worker_b.do_shared("k", down.fetch, encode=str, decode=str))
+        await _settle()
+        down.release.set()
+
+        assert await a == "bundle"
+        assert await b == ("bundle", True)
+        assert down.calls == 1
+        assert worker_b.stats.remote_shared == 1
+        assert not [k for k in store.data if ":lease:" in k]  # lease released
+
+    @pytest.mark.asyncio()
+    async def test_holder_failure_falls_back(self) -> None:
+        store = FakeStorage()
+        gate = asyncio.Event()
+
+        async def failing() -> str:
+            await gate.wait()
+            msg = "holder crashed"
+            raise RuntimeError(msg)
+
+        async def working() -> str:
+            return "fresh"
+
+        worker_a = SingleFlight(store=store, policy=_FAST)
+        worker_b = SingleFlight(store=store, policy=_FAST)
+        a = asyncio.ensure_future(worker_a.do("k", failing, encode=str, decode=str))
+        await _settle()
+        b = asyncio.ensure_future(worker_b.do("k", working, encode=str, decode=str))
+        await _settle()
+        gate.set()
+
+        with pytest.raises(RuntimeError):
+            await a
+        assert await b == "fresh"
+        assert worker_b.stats.fallbacks == 1
+
+    @pytest.mark.asyncio()
+    async def test_without_codec_stays_local(self) -> None:
+        store, down = FakeStorage(), Downstream()
+        down.release.set()
+
+        await SingleFlight(store=store).do("k", down.fetch)
+
+        assert store.data == {}
+
+    def test_rejects_bad_policy(self) -> None:
+        with pytest.raises(ValueError, match="lease_seconds"):
+            LeasePolicy(lease_seconds=0)
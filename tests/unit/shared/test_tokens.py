@@ -0,0 +1,77 @@
+"""Tests for the token counting service.
+
+Task card: B4-2 (tokenizer-accurate budgeting)
+- Character-class estimate (ASCII / CJK / other) with calibration
+- Counts memoized per content hash (LRU-bounded)
+- tiktoken only when its vocabulary is already on disk
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.shared.tokens import TokenCounter, TokenEstimator, load_offline_encoding
+
+
+class TestTokenEstimator:
+    def test_ascii_four_chars_per_token(self) -> None:
+        assert TokenEstimator()("a" * 40) == 10
+
+    def test_cjk_costs_more_than_ascii_per_char(self) -> None:
+        estimate = TokenEstimator()
+        assert estimate("亚麻衬衫" * 10) == 50
+        assert estimate("linen shirt") == 3
+
+    def test_empty_is_zero(self) -> None:
+        assert TokenEstimator()("") == 0
+
+    def test_calibrated_matches_reference_total(self) -> None:
+        samples = ["a" * 40, "b" * 80]  # estimate 10 + 20
+
+        calibrated = TokenEstimator().calibrated(samples, reference=lambda t: len(t) // 8)
+
+        assert calibrated.scale == pytest.approx(0.5)
+        assert calibrated("a" * 40) == 5
+
+    def test_rejects_non_positive_ratio(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            TokenEstimator(ascii_per_token=0)
+
+
+class TestTokenCounter:
+    def test_estimate_backend_when_tokenizer_disabled(self) -> None:
+        counter = TokenCounter(use_tokenizer=False)
+        assert counter.backend == "estimate"
+        assert counter.count("a" * 40) == 10
+
+    def test_counts_memoized_by_content(self) -> None:
+        counter = TokenCounter(use_tokenizer=False)
+
+        for _ in range(3):
+            counter.count("same text")
+        counter.count("other text")
+
+        assert counter.stats.misses == 2
+        assert counter.stats.hits == 2
+        assert counter.stats.hit_ratio == pytest.approx(0.5)
+
+    def test_cache_is_bounded(self) -> None:
+        counter = TokenCounter(use_tokenizer=False, cache_size=2)
+
+        counter.count("one")
+        counter.count("two")
+        counter.count("three")  # evicts "one"
+        counter.count("one")
+
+        assert counter.stats.hits == 0
+        assert counter.stats.misses == 4
+
+    def test_unknown_encoding_falls_back_to_estimate(self) -> None:
+        assert load_offline_encoding("no_such_encoding") is None
+        assert TokenCounter(encoding="no_such_encoding").backend == "estimate"
+
+    def test_tokenizer_counts_when_available(self) -> None:
+        counter = TokenCounter()
+        if counter.backend != "tiktoken":
+            pytest.skip("cl100k_base vocabulary not available offline")
+        assert counter.count("hello world") == 2
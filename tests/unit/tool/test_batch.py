@@ -0,0 +1,487 @@
+"""Unit tests for batch LLM jobs (T2-9).
+
+Tests: bounded concurrency, per-item retry with backoff, checkpoint and
+resume (finished chunks and submitted provider batches are not redone),
+provider batch path with interactive fallback, streaming, polling,
+cost report, budget guard (interactive and provider batch holds) and usage
+metering, task-executor entry point.
+Uses Fake adapters (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.infra.billing.budget import TokenBudgetManager
+from src.infra.tasks.background import BackgroundTaskExecutor
+from src.infra.tasks.celery_app import TaskStatus
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.shared.org_scope import get_priority
+from src.shared.tokens import TokenCounter
+from src.tool.llm.batch import (
+    LLM_BATCH_TASK,
+    BatchItem,
+    BatchJobRunner,
+    llm_batch_task,
+)
+from src.tool.llm.budget_guard import BudgetGuard, PromptTokenEstimator
+from src.tool.llm.usage_tracker import UsageTracker
+from tests.fakes import FakeStorage
+
+
+class EchoLLM(LLMCallPort):
+    """Echoes the prompt; prompts in `fail` fail their first `flaky` attempts (always if 0)."""
+
+    def __init__(self, *, fail: set[str] | None = None, flaky: int = 0) -> None:
+        self.calls: list[str] = []
+        self.priorities: set[str] = set()
+        self.running = 0
+        self.peak = 0
+        self._fail = fail or set()
+        self._flaky = flaky
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        self.calls.append(prompt)
+        self.priorities.add(get_priority())
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0)
+            if prompt in self._fail and not self._flaky:
+                msg = f"provider rejected {prompt}"
+                raise RuntimeError(msg)
+            if prompt in self._fail and self.calls.count(prompt) <= self._flaky:
+                msg = "rate limited"
+                raise RuntimeError(msg)
+            return LLMResponse(
+                text=prompt.upper(), tokens_used={"input": 100, "output": 10}, model_id="gpt-4o"
+            )
+        finally:
+            self.running -= 1
+
+
+class WorkerCrash(BaseException):
+    """Stands in for the worker dying mid-job (not caught by per-item retries)."""
+
+
+class CrashingLLM(EchoLLM):
+    """Crashes the worker on one prompt, once."""
+
+    def __init__(self, crash_on: str) -> None:
+        super().__init__()
+        self._crash_on = crash_on
+        self.crashed = False
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        if prompt == self._crash_on and not self.crashed:
+            self.crashed = True
+            raise WorkerCrash
+        return await super().call(prompt, model_id, content_parts, parameters)
+
+
+class FakeProviderBatch:
+    """Provider batch endpoint: answers after `polls` fetches; can drop items."""
+
+    def __init__(self, *, polls: int = 1, drop: set[str] | None = None) -> None:
+        self.submitted: list[list[str]] = []
+        self.cancelled: list[str] = []
+        self.fetches = 0
+        self._polls = polls
+        self._drop = drop or set()
+        self._batches: dict[str, list[BatchItem]] = {}
+
+    def supports(self, model_id: str) -> bool:
+        return model_id != "local-model"
+
+    async def submit(self, items: list[BatchItem], model_id: str) -> str:
+        batch_id = f"batch_{len(self._batches)}"
+        self._batches[batch_id] = items
+        self.submitted.append([i.item_id for i in items])
+        return batch_id
+
+    async def fetch(self, batch_id: str) -> dict[str, LLMResponse | str] | None:
+        self.fetches += 1
+        if self.fetches <= self._polls:
+            return None
+        return {
+            item.item_id: (
+                "server_error"
+                if item.item_id in self._drop
+                else LLMResponse(
+                    text=f"batch:{item.prompt}",
+                    tokens_used={"input": 100, "output": 10},
+                    model_id="gpt-4o",
+                )
+            )
+            for item in self._batches[batch_id]
+        }
+
+    async def cancel(self, batch_id: str) -> None:
+        self.cancelled.append(batch_id)
+
+
+async def _no_sleep(_: float) -> None:
+    return None
+
+
+class FakeClock:
+    """Epoch clock advanced by the runner's sleeps."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _items(n: int, model_id: str = "gpt-4o") -> list[BatchItem]:
+    return [BatchItem(item_id=f"i{k}", prompt=f"p{k}", model_id=model_id) for k in range(n)]
+
+
+def _guard(ledger: TokenBudgetManager, org_id: UUID, budget_id: UUID) -> BudgetGuard:
+    return BudgetGuard(
+        EchoLLM(),
+        ledger=ledger,
+        resolve_budget=lambda o: budget_id if o == org_id else None,
+        estimator=PromptTokenEstimator(TokenCounter()),
+    )
+
+
+def _flat_price(model_id: str, input_tokens: int, output_tokens: int, batch: bool) -> float:
+    rate = 0.5 if batch else 1.0
+    return (input_tokens + output_tokens) * rate / 1000
+
+
+@pytest.mark.unit
+class TestBatchJobRunner:
+    async def test_runs_all_items_with_bounded_concurrency(self) -> None:
+        llm = EchoLLM()
+        runner = BatchJobRunner(llm, checkpoints=FakeStorage(), concurrency=3, chunk_size=4)
+
+        report = await runner.run("job", _items(10))
+
+        assert report.completed
+        assert report.items == report.succeeded == 10
+        assert report.chunks == 3
+        assert llm.peak <= 3
+        assert llm.priorities == {"batch"}
+        results = await runner.results("job")
+        assert [r.item_id for r in results] == [f"i{k}" for k in range(10)]
+        assert results[0].text == "P0"
+
+    async def test_retries_with_backoff_then_records_failure(self) -> None:
+        delays: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        runner = BatchJobRunner(
+            EchoLLM(fail={"p1"}, flaky=1),
+            checkpoints=FakeStorage(),
+            max_attempts=3,
+            backoff_seconds=1.0,
+            sleep=sleep,
+        )
+        report = await runner.run("flaky", _items(3))
+        assert report.succeeded == 3
+        assert report.retries == 1
+        assert delays == [1.0]
+
+        delays.clear()
+        always_failing = BatchJobRunner(
+            EchoLLM(fail={"p1"}, flaky=0),
+            checkpoints=FakeStorage(),
+            max_attempts=3,
+            backoff_seconds=1.0,
+            sleep=sleep,
+        )
+        report = await always_failing.run("broken", _items(3))
+        assert report.succeeded == 2
+        assert report.failed == 1
+        assert delays == [1.0, 2.0]
+        failed = [r for r in await always_failing.results("broken") if not r.ok]
+        assert failed[0].item_id == "i1"
+        assert failed[0].attempts == 3
+        assert "provider rejected" in (failed[0].error or "")
+
+    async def test_resume_skips_finished_chunks(self) -> None:
+        storage = FakeStorage()
+        crashing = CrashingLLM(crash_on="p5")
+        runner = BatchJobRunner(crashing, checkpoints=storage, chunk_size=4, concurrency=1)
+        with pytest.raises(WorkerCrash):
+            await runner.run("nightly", _items(10))
+
+        partial = await runner.status("nightly")
+        assert partial is not None
+        assert partial.items == 4
+        assert not partial.completed
+
+        llm = EchoLLM()
+        resumed = BatchJobRunner(llm, checkpoints=storage, chunk_size=4)
+        report = await resumed.run("nightly", _items(10))
+
+        assert report.resumed
+        assert report.restored == 4
+        assert report.items == 10
+        assert sorted(llm.calls) == sorted(f"p{k}" for k in range(4, 10))
+        assert len(await resumed.results("nightly")) == 10
+
+        again = await resumed.run("nightly", _items(10))
+        assert again.completed
+        assert len(llm.calls) == 6  # a completed job does nothing
+
+    async def test_stream_yields_results_as_they_finish(self) -> None:
+        runner = BatchJobRunner(EchoLLM(), checkpoints=FakeStorage(), chunk_size=2)
+
+        seen = [r.item_id async for r in runner.stream("s", _items(5))]
+
+        assert sorted(seen) == [f"i{k}" for k in range(5)]
+
+    async def test_submit_and_poll(self) -> None:
+        runner = BatchJobRunner(EchoLLM(), checkpoints=FakeStorage())
+
+        task = runner.submit("bg", _items(5))
+        await task
+
+        status = await runner.status("bg")
+        assert status is not None
+        assert status.completed
+        assert await runner.status("unknown") is None
+
+    def test_rejects_bad_limits(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            BatchJobRunner(EchoLLM(), checkpoints=FakeStorage(), concurrency=0)
+
+
+@pytest.mark.unit
+class TestProviderBatchPath:
+    async def test_provider_batch_with_interactive_fallback(self) -> None:
+        llm = EchoLLM()
+        api = FakeProviderBatch(polls=2, drop={"i1"})
+        items = [*_items(3), BatchItem(item_id="local", prompt="pl", model_id="local-model")]
+        runner = BatchJobRunner(
+            llm,
+            checkpoints=FakeStorage(),
+            provider_batch=api,
+            pricing=_flat_price,
+            sleep=_no_sleep,
+        )
+
+        report = await runner.run("pb", items)
+
+        assert api.submitted == [["i0", "i1", "i2"]]
+        assert sorted(llm.calls) == ["p1", "pl"]  # dropped item + unsupported model
+        assert report.provider_batch_items == 2
+        assert report.succeeded == 4
+        assert report.retries == 1
+        assert report.cost_usd == pytest.approx(0.11 * 2 * 0.5 + 0.11 * 2)
+        assert report.interactive_cost_usd == pytest.approx(0.11 * 4)
+        assert report.savings_usd == pytest.approx(0.11)
+        results = {r.item_id: r for r in await runner.results("pb")}
+        assert results["i0"].text == "batch:p0"
+        assert results["i0"].provider_batch
+        assert results["i1"].attempts == 2
+
+    async def test_resume_repolls_submitted_batch(self) -> None:
+        storage = FakeStorage()
+        api = FakeProviderBatch(polls=1)
+
+        async def crash(_: float) -> None:
+            raise WorkerCrash
+
+        runner = BatchJobRunner(EchoLLM(), checkpoints=storage, provider_batch=api, sleep=crash)
+        with pytest.raises(WorkerCrash):
+            await runner.run("pb", _items(3))
+        assert len(api.submitted) == 1
+
+        resumed = BatchJobRunner(
+            EchoLLM(), checkpoints=storage, provider_batch=api, sleep=_no_sleep
+        )
+        report = await resumed.run("pb", _items(3))
+
+        assert len(api.submitted) == 1  # not paid for twice
+        assert report.provider_batch_items == 3
+
+    async def test_batch_past_completion_window_is_cancelled(self) -> None:
+        clock = FakeClock()
+        llm = EchoLLM()
+        api = FakeProviderBatch(polls=10**6)  # never finishes
+        runner = BatchJobRunner(
+            llm,
+            checkpoints=FakeStorage(),
+            provider_batch=api,
+            poll_seconds=3600,
+            max_wait_seconds=24 * 3600,
+            sleep=clock.sleep,
+            clock=clock,
+        )
+
+        report = await runner.run("stuck", _items(3))
+
+        assert api.cancelled == ["batch_0"]
+        assert sum(clock.sleeps) == 24 * 3600
+        assert sorted(llm.calls) == ["p0", "p1", "p2"]
+        assert report.succeeded == 3
+        assert report.provider_batch_items == 0
+
+    async def test_job_deadline_bounds_the_wait(self) -> None:
+        clock = FakeClock()
+        api = FakeProviderBatch(polls=10**6)
+        runner = BatchJobRunner(
+            EchoLLM(),
+            checkpoints=FakeStorage(),
+            provider_batch=api,
+            poll_seconds=60,
+            sleep=clock.sleep,
+            clock=clock,
+        )
+
+        report = await runner.run("due", _items(2), deadline=clock.now + 90)
+
+        assert clock.sleeps == [60, 30]
+        assert api.cancelled == ["batch_0"]
+        assert report.succeeded == 2
+
+    async def test_resume_keeps_the_original_window(self) -> None:
+        clock = FakeClock()
+        storage = FakeStorage()
+        api = FakeProviderBatch(polls=10**6)
+
+        async def crash(seconds: float) -> None:
+            clock.now += seconds
+            raise WorkerCrash
+
+        runner = BatchJobRunner(
+            EchoLLM(),
+            checkpoints=storage,
+            provider_batch=api,
+            poll_seconds=3600,
+            max_wait_seconds=7200,
+            sleep=crash,
+            clock=clock,
+        )
+        with pytest.raises(WorkerCrash):
+            await runner.run("pb", _items(2))
+
+        resumed = BatchJobRunner(
+            EchoLLM(),
+            checkpoints=storage,
+            provider_batch=api,
+            poll_seconds=3600,
+            max_wait_seconds=7200,
+            sleep=clock.sleep,
+            clock=clock,
+        )
+        await resumed.run("pb", _items(2))
+
+        assert len(api.submitted) == 1
+        assert clock.sleeps == [3600]  # one hour already spent before the crash
+
+
+@pytest.mark.unit
+class TestBatchBudgetAndUsage:
+    async def test_usage_recorded_for_both_paths(self) -> None:
+        tracker = UsageTracker()
+        api = FakeProviderBatch(polls=0, drop={"i1"})
+        runner = BatchJobRunner(
+            EchoLLM(),
+            checkpoints=FakeStorage(),
+            provider_batch=api,
+            pricing=lambda _m, _i, _o, provider_batch: 0.5 if provider_batch else 1.0,
+            usage_tracker=tracker,
+            sleep=_no_sleep,
+        )
+        org_id, user_id = uuid4(), uuid4()
+
+        await runner.run("metered", _items(3), org_id=org_id, user_id=user_id)
+
+        summary = tracker.get_org_summary(org_id)
+        assert summary.record_count == 3  # two provider batch results + one interactive
+        assert summary.total_tokens == 3 * 110
+        records = tracker.get_records_for_org(org_id)
+        assert {r.user_id for r in records} == {user_id}
+        assert {r.task_id for r in records} == {"metered"}
+        assert sorted(r.cost_amount for r in records) == [0.5, 0.5, 1.0]
+
+    async def test_interactive_path_reserves_on_the_budget(self) -> None:
+        ledger = TokenBudgetManager()
+        org_id = uuid4()
+        budget = ledger.create_budget(org_id, total_tokens=1200)
+        guard = BudgetGuard(
+            EchoLLM(),
+            ledger=ledger,
+            resolve_budget=lambda o: budget.id if o == org_id else None,
+            estimator=PromptTokenEstimator(TokenCounter()),
+        )
+        delays: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        runner = BatchJobRunner(guard, checkpoints=FakeStorage(), concurrency=1, sleep=sleep)
+
+        report = await runner.run("budgeted", _items(4), org_id=org_id, user_id=uuid4())
+
+        # Each hold is ~1030 tokens and settles at 110: two calls fit
+        assert (report.succeeded, report.failed) == (2, 2)
+        assert budget.used_tokens == 220
+        failed = [r for r in await runner.results("budgeted") if not r.ok]
+        assert all("QuotaExceededError" in (r.error or "") for r in failed)
+        assert all(r.attempts == 1 for r in failed)  # not retried
+        assert delays == []
+
+    async def test_provider_batch_holds_and_settles_on_the_budget(self) -> None:
+        ledger = TokenBudgetManager()
+        org_id = uuid4()
+        budget = ledger.create_budget(org_id, total_tokens=5000)
+        guard = _guard(ledger, org_id, budget.id)
+        api = FakeProviderBatch(polls=0)
+        runner = BatchJobRunner(
+            guard, checkpoints=FakeStorage(), provider_batch=api, budget_guard=guard
+        )
+
+        report = await runner.run("batched", _items(3), org_id=org_id, user_id=uuid4())
+
+        assert report.provider_batch_items == 3
+        assert guard.stats.reserved == 1  # one hold for the chunk
+        assert guard.stats.estimated_tokens > 3000
+        assert budget.used_tokens == 3 * 110  # settled from the batch's usage
+
+    async def test_chunk_the_budget_cannot_hold_is_not_submitted(self) -> None:
+        ledger = TokenBudgetManager()
+        org_id = uuid4()
+        budget = ledger.create_budget(org_id, total_tokens=2000)
+        guard = _guard(ledger, org_id, budget.id)
+        api = FakeProviderBatch(polls=0)
+        runner = BatchJobRunner(
+            guard, checkpoints=FakeStorage(), provider_batch=api, budget_guard=guard, concurrency=1
+        )
+
+        report = await runner.run("over", _items(3), org_id=org_id, user_id=uuid4())
+
+        assert api.submitted == []
+        assert report.provider_batch_items == 0
+        assert report.succeeded == 3  # one ~1030-token hold at a time fits
+        assert budget.used_tokens == 3 * 110
+
+
+@pytest.mark.unit
+class TestLLMBatchTask:
+    async def test_runs_through_task_executor(self) -> None:
+        runner = BatchJobRunner(EchoLLM(), checkpoints=FakeStorage())
+        executor = BackgroundTaskExecutor()
+        executor.register(LLM_BATCH_TASK, llm_batch_task(runner, lambda job_id: _items(4)))
+
+        result = await executor.run_task(LLM_BATCH_TASK, args=("eval-gen",))
+
+        assert result.status == TaskStatus.SUCCESS
+        assert result.result["succeeded"] == 4
+        assert "items_per_second" in result.result
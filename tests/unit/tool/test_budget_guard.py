@@ -0,0 +1,211 @@
+"""Unit tests for pre-call token estimation and budget reservation (T2-10).
+
+Tests: estimator (prompt, role blocks, media, max_tokens), reserve ->
+settle with actual usage, release on failure, rejection before the
+provider is called, streamed usage metering, one hold for many calls,
+pass-through without a budget, fail-open on ledger outage, concurrent
+calls cannot overdraw.
+Uses Fake adapters and the in-memory TokenBudgetManager (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.infra.billing.budget import TokenBudgetManager
+from src.ports.llm_call_port import ContentBlock, LLMCallPort, LLMResponse
+from src.shared.errors import QuotaExceededError
+from src.shared.org_scope import org_scope
+from src.shared.tokens import TokenCounter
+from src.tool.llm.budget_guard import (
+    BudgetGuard,
+    BudgetGuardPolicy,
+    PromptTokenEstimator,
+)
+
+
+class UsageLLM(LLMCallPort):
+    """Reports fixed usage; can fail; counts calls."""
+
+    def __init__(self, *, input_tokens: int = 40, output_tokens: int = 60) -> None:
+        self.calls = 0
+        self.fail = False
+        self._usage = {"input": input_tokens, "output": output_tokens}
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            msg = "provider down"
+            raise RuntimeError(msg)
+        return LLMResponse(text="ok", tokens_used=dict(self._usage), model_id=model_id)
+
+
+class DownLedger:
+    async def reserve(self, budget_id: UUID, tokens: int, *, ttl_seconds: float = 0) -> None:
+        msg = "redis unreachable"
+        raise ConnectionError(msg)
+
+    async def settle(self, reservation: object, actual_tokens: int) -> None: ...
+
+    async def release(self, reservation: object) -> None: ...
+
+
+def _estimator(**policy: int) -> PromptTokenEstimator:
+    counter = TokenCounter(use_tokenizer=False)  # ceil(len / 4) for ASCII
+    return PromptTokenEstimator(counter, BudgetGuardPolicy(**policy))
+
+
+def _guarded(
+    llm: LLMCallPort, total_tokens: int, **policy: int
+) -> tuple[BudgetGuard, TokenBudgetManager, UUID, UUID]:
+    manager = TokenBudgetManager()
+    org_id = uuid4()
+    budget = manager.create_budget(org_id, total_tokens)
+    guard = BudgetGuard(
+        llm,
+        ledger=manager,
+        resolve_budget={org_id: budget.id}.get,
+        estimator=_estimator(**policy),
+    )
+    return guard, manager, org_id, budget.id
+
+
+@pytest.mark.unit
+class TestPromptTokenEstimator:
+    def test_prompt_plus_output_cap(self) -> None:
+        estimator = _estimator(default_output_tokens=100, per_message_tokens=4)
+
+        assert estimator.estimate("x" * 40) == 10 + 4 + 100
+        assert estimator.estimate("x" * 40, parameters={"max_tokens": 20}) == 10 + 4 + 20
+
+    def test_role_blocks_and_media(self) -> None:
+        estimator = _estimator(per_message_tokens=4, media_block_tokens=500)
+        blocks = [
+            ContentBlock(type="text", text="s" * 80, role="system"),
+            ContentBlock(type="text", text="u" * 40, role="user"),
+            ContentBlock(type="image", media_id="m1", text_fallback="a cat"),
+        ]
+
+        # prompt is only a fallback when blocks carry roles
+        assert estimator.input_tokens("ignored " * 100, blocks) == 20 + 10 + 500 + 2 + 2 * 4
+
+
+@pytest.mark.unit
+class TestBudgetGuard:
+    async def test_settles_actual_usage(self) -> None:
+        llm = UsageLLM(input_tokens=40, output_tokens=60)
+        guard, manager, org_id, budget_id = _guarded(llm, 10_000, default_output_tokens=500)
+
+        with org_scope(org_id):
+            response = await guard.call("x" * 400, "gpt-4o")
+
+        budget = manager.check_budget(budget_id)
+        assert response.text == "ok"
+        assert budget.used_tokens == 100
+        assert budget.reserved_tokens == 0
+        assert guard.stats.estimated_tokens == 100 + 4 + 500
+        assert guard.stats.actual_tokens == 100
+
+    async def test_rejects_before_calling_provider(self) -> None:
+        llm = UsageLLM()
+        guard, _, org_id, _ = _guarded(llm, 200, default_output_tokens=500)
+
+        with org_scope(org_id), pytest.raises(QuotaExceededError):
+            await guard.call("hello", "gpt-4o")
+
+        assert llm.calls == 0
+        assert guard.stats.rejected == 1
+
+    async def test_failed_call_releases_hold(self) -> None:
+        llm = UsageLLM()
+        llm.fail = True
+        guard, manager, org_id, budget_id = _guarded(llm, 10_000)
+
+        with org_scope(org_id), pytest.raises(RuntimeError):
+            await guard.call("hello", "gpt-4o")
+
+        budget = manager.check_budget(budget_id)
+        assert budget.used_tokens == budget.reserved_tokens == 0
+        assert guard.stats.released == 1
+
+    async def test_concurrent_calls_cannot_overdraw(self) -> None:
+        llm = UsageLLM(input_tokens=100, output_tokens=100)
+        guard, manager, org_id, budget_id = _guarded(llm, 1000, default_output_tokens=300)
+
+        async def one() -> LLMResponse:
+            with org_scope(org_id):
+                return await guard.call("x" * 400, "gpt-4o")  # estimate 404
+
+        results = await asyncio.gather(*(one() for _ in range(5)), return_exceptions=True)
+
+        assert sum(not isinstance(r, BaseException) for r in results) == 2
+        assert llm.calls == 2
+        assert manager.check_budget(budget_id).used_tokens == 400
+
+    async def test_stream_settles_metered_usage(self) -> None:
+        guard, manager, org_id, budget_id = _guarded(UsageLLM(), 10_000)
+
+        with org_scope(org_id):
+            async with guard.hold("hello") as meter:
+                meter.add(input_tokens=2)
+                for _ in range(5):
+                    meter.add(output_tokens=3)
+            with pytest.raises(ConnectionError):
+                async with guard.hold("hello") as meter:
+                    meter.add(input_tokens=2, output_tokens=4)
+                    msg = "stream dropped"
+                    raise ConnectionError(msg)
+
+        budget = manager.check_budget(budget_id)
+        assert budget.used_tokens == 17 + 6  # tokens streamed before the drop are billed
+        assert budget.reserved_tokens == 0
+
+    async def test_hold_calls_reserves_the_summed_estimate(self) -> None:
+        guard, manager, org_id, budget_id = _guarded(UsageLLM(), 10_000, default_output_tokens=96)
+        calls = [("x" * 400, None, None), ("y" * 400, None, {"max_tokens": 46})]
+
+        with org_scope(org_id):
+            async with guard.hold_calls(calls, hold_seconds=3600) as meter:
+                assert manager.check_budget(budget_id).reserved_tokens == 200 + 150
+                meter.add(input_tokens=100, output_tokens=20)
+                meter.add(input_tokens=100, output_tokens=30)
+
+        budget = manager.check_budget(budget_id)
+        assert budget.used_tokens == 250
+        assert budget.reserved_tokens == 0
+        assert guard.stats.reserved == 1
+
+    async def test_passes_through_without_budget(self) -> None:
+        llm = UsageLLM()
+        guard, _, _, _ = _guarded(llm, 10)
+
+        await guard.call("no org scope", "gpt-4o")
+        with org_scope(uuid4()):
+            await guard.call("org without budget", "gpt-4o")
+
+        assert llm.calls == 2
+        assert guard.stats.reserved == 0
+
+    async def test_ledger_outage_fails_open(self) -> None:
+        llm = UsageLLM()
+        org_id = uuid4()
+        guard = BudgetGuard(
+            llm,
+            ledger=DownLedger(),
+            resolve_budget=lambda _: uuid4(),
+            estimator=_estimator(),
+        )
+
+        with org_scope(org_id):
+            response = await guard.call("hello", "gpt-4o")
+
+        assert response.text == "ok"
+        assert guard.stats.unguarded == 1
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError, match="hold_seconds"):
+            BudgetGuardPolicy(hold_seconds=0)
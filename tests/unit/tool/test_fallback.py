@@ -5,20 +5,29 @@ Validates:
 - Automatic failover through fallback chain
 - Provider health tracking
 - Fallback latency (must complete quickly)
+- Singleflight: concurrent identical calls share one provider call
+- Latency tracking, hedged requests (budget, loser cancelled) and
+  latency-weighted routing, simulated with a fake slow provider
 """
 
 from __future__ import annotations
 
+import asyncio
+import random
 import time
+from uuid import UUID, uuid4
 
 import pytest
 
 from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.shared.org_scope import org_scope
+from src.shared.singleflight import SingleFlight
 from src.tool.llm.model_registry import (
     _STATE_CLOSED,
     _STATE_HALF_OPEN,
     _STATE_OPEN,
     CircuitState,
+    HedgePolicy,
     ModelRegistry,
     ProviderConfig,
 )
@@ -175,3 +184,201 @@ class TestModelRegistry:
         registry = self._make_registry(adapter)
         assert registry.get_default_model("openai") == "gpt-4o"
         assert registry.get_default_model("anthropic") == "claude-sonnet-4-20250514"
+
+
+class SlowLLMAdapter(LLMCallPort):
+    """Counts calls; yields to the event loop so identical calls overlap."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return LLMResponse(
+            text=f"Re: {prompt}", tokens_used={"input": 50, "output": 10}, model_id=model_id
+        )
+
+
+class TestModelRegistrySingleflight:
+    @pytest.mark.asyncio()
+    async def test_identical_calls_share_one_provider_call(self) -> None:
+        adapter = SlowLLMAdapter()
+        registry = ModelRegistry(adapter=adapter, singleflight=SingleFlight())
+
+        responses = await asyncio.gather(*(registry.call("Hello", "gpt-4o") for _ in range(5)))
+
+        assert adapter.calls == 1
+        assert {r.text for r in responses} == {"Re: Hello"}
+        # Only the caller that paid is metered
+        assert sum(r.tokens_used["input"] for r in responses) == 50
+        assert sum(r.tokens_used.get("saved_input", 0) for r in responses) == 200
+
+    @pytest.mark.asyncio()
+    async def test_different_calls_not_coalesced(self) -> None:
+        adapter = SlowLLMAdapter()
+        registry = ModelRegistry(adapter=adapter, singleflight=SingleFlight())
+
+        await asyncio.gather(
+            registry.call("Hello", "gpt-4o"),
+            registry.call("Hello", "gpt-4o-mini"),
+            registry.call("Hello", "gpt-4o", parameters={"temperature": 0}),
+        )
+
+        assert adapter.calls == 3
+
+    @pytest.mark.asyncio()
+    async def test_calls_of_different_orgs_not_coalesced(self) -> None:
+        adapter = SlowLLMAdapter()
+        registry = ModelRegistry(adapter=adapter, singleflight=SingleFlight())
+
+        async def call_as(org_id: UUID):
+            with org_scope(org_id):
+                return await registry.call("Hello", "gpt-4o")
+
+        org_a, org_b = uuid4(), uuid4()
+        responses = await asyncio.gather(call_as(org_a), call_as(org_a), call_as(org_b))
+
+        assert adapter.calls == 2
+        assert [r.tokens_used["input"] for r in responses].count(50) == 2
+
+
+class TimedLLMAdapter(LLMCallPort):
+    """Per-model latency in seconds; records started and cancelled calls."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self._delays = delays
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        self.started.append(model_id)
+        try:
+            await asyncio.sleep(self._delays[model_id])
+        except asyncio.CancelledError:
+            self.cancelled.append(model_id)
+            raise
+        return LLMResponse(text=f"from {model_id}", tokens_used={"input": 1}, model_id=model_id)
+
+
+def _pair(**kwargs) -> dict[str, ProviderConfig]:
+    return {
+        name: ProviderConfig(name=name, models=[name], default_model=name, **kwargs)
+        for name in ("slow", "fast")
+    }
+
+
+_QUICK_HEDGE = HedgePolicy(initial_delay_ms=20, min_delay_ms=1, min_samples=5)
+
+
+class TestModelRegistryHedging:
+    @pytest.mark.asyncio()
+    async def test_latency_tracked_per_provider(self) -> None:
+        adapter = TimedLLMAdapter({"slow": 0.02, "fast": 0.0})
+        registry = ModelRegistry(
+            adapter=adapter, primary="slow", fallback_chain=["fast"], providers=_pair()
+        )
+
+        for _ in range(3):
+            await registry.call("Hi")
+
+        stats = registry.latency("slow")
+        assert stats is not None
+        assert stats.samples == 3
+        assert stats.ewma_ms is not None
+        assert stats.ewma_ms >= 15
+        assert registry.latency("fast") is None
+
+    @pytest.mark.asyncio()
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        adapter = TimedLLMAdapter({"slow": 1.0, "fast": 0.01})
+        registry = ModelRegistry(
+            adapter=adapter,
+            primary="slow",
+            fallback_chain=["fast"],
+            providers=_pair(),
+            hedge=_QUICK_HEDGE,
+        )
+
+        start = time.monotonic()
+        response = await registry.call("Hi")
+        elapsed = time.monotonic() - start
+        await asyncio.sleep(0)  # let the loser observe its cancellation
+
+        assert response.model_id == "fast"
+        assert elapsed < 0.5
+        assert adapter.cancelled == ["slow"]
+        assert registry.hedge_stats.hedges == 1
+        assert registry.hedge_stats.hedge_wins == 1
+
+    @pytest.mark.asyncio()
+    async def test_fast_primary_not_hedged(self) -> None:
+        adapter = TimedLLMAdapter({"slow": 0.0, "fast": 0.0})
+        registry = ModelRegistry(
+            adapter=adapter,
+            primary="slow",
+            fallback_chain=["fast"],
+            providers=_pair(),
+            hedge=_QUICK_HEDGE,
+        )
+
+        await registry.call("Hi")
+
+        assert adapter.started == ["slow"]
+        assert registry.hedge_stats.hedges == 0
+
+    @pytest.mark.asyncio()
+    async def test_hedges_capped_by_budget(self) -> None:
+        adapter = TimedLLMAdapter({"slow": 0.05, "fast": 0.01})
+        registry = ModelRegistry(
+            adapter=adapter,
+            primary="slow",
+            fallback_chain=["fast"],
+            providers=_pair(),
+            hedge=HedgePolicy(initial_delay_ms=1, min_delay_ms=1, budget_ratio=0.0, max_burst=1),
+        )
+
+        for _ in range(4):
+            await registry.call("Hi")
+
+        assert registry.hedge_stats.hedges == 1  # the initial token only
+        assert registry.hedge_stats.budget_denied == 3
+
+    @pytest.mark.asyncio()
+    async def test_primary_failure_before_hedge_falls_back(self) -> None:
+        adapter = SelectiveLLMAdapter(failing_models={"slow"})
+        registry = ModelRegistry(
+            adapter=adapter,
+            primary="slow",
+            fallback_chain=["fast"],
+            providers=_pair(),
+            hedge=_QUICK_HEDGE,
+        )
+
+        response = await registry.call("Hi")
+
+        assert response.model_id == "fast"
+        assert registry.hedge_stats.hedges == 0
+
+    @pytest.mark.asyncio()
+    async def test_latency_routing_prefers_faster_equivalent(self) -> None:
+        adapter = TimedLLMAdapter({"slow": 0.02, "fast": 0.001})
+        registry = ModelRegistry(
+            adapter=adapter,
+            primary="slow",
+            fallback_chain=["fast"],
+            providers=_pair(equivalence="gpt-4o-class"),
+            latency_routing=True,
+            rng=random.Random(3),  # noqa: S311
+        )
+
+        for _ in range(40):
+            await registry.call("Hi")
+
+        # Both measured, the faster one takes most of the traffic
+        assert adapter.started.count("fast") > adapter.started.count("slow") * 2
+        assert "slow" in adapter.started
+
+    def test_rejects_bad_hedge_policy(self) -> None:
+        with pytest.raises(ValueError, match="quantile"):
+            HedgePolicy(quantile=1.0)
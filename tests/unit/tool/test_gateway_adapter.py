@@ -8,6 +8,7 @@ Uses DI adapter pattern (no unittest.mock, no monkeypatch).
 
 from __future__ import annotations
 
+import json
 import os
 from types import SimpleNamespace
 from typing import Any
@@ -15,7 +16,13 @@ from typing import Any
 import pytest
 
 from src.ports.llm_call_port import ContentBlock, LLMResponse
-from src.tool.llm.gateway_adapter import LiteLLMGatewayAdapter
+from src.tool.llm.batch import BatchItem
+from src.tool.llm.gateway_adapter import (
+    LiteLLMBatchAPI,
+    LiteLLMGatewayAdapter,
+    litellm_context_window,
+    litellm_cost,
+)
 
 # ---------------------------------------------------------------------------
 # DI fake: replaces litellm.acompletion via constructor injection
@@ -198,6 +205,56 @@ class TestLiteLLMGatewayAdapter:
         assert len(content) == 1
         assert content[0] == {"type": "text", "text": "Only content block"}
 
+    def test_build_messages_structured_blocks(self) -> None:
+        """Role-tagged blocks become one message each; cache hints become cache_control."""
+        adapter = LiteLLMGatewayAdapter()
+        content_parts = [
+            ContentBlock(type="text", text="You are a stylist.", role="system", cache=True),
+            ContentBlock(type="text", text="Hi", role="user"),
+            ContentBlock(type="text", text="Hello!", role="assistant", cache=True),
+            ContentBlock(type="text", text="Any linen?", role="user"),
+        ]
+        messages = adapter._build_messages(prompt="flattened fallback", content_parts=content_parts)
+
+        assert messages == [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "You are a stylist.",
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            },
+            {"role": "user", "content": "Hi"},
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": "Hello!", "cache_control": {"type": "ephemeral"}}
+                ],
+            },
+            {"role": "user", "content": "Any linen?"},
+        ]
+
+    def test_build_messages_structured_attachment_joins_last_user_turn(self) -> None:
+        """Role-less blocks in a structured prompt attach to the final user message."""
+        adapter = LiteLLMGatewayAdapter()
+        content_parts = [
+            ContentBlock(type="text", text="You are a stylist.", role="system"),
+            ContentBlock(type="text", text="What is this?", role="user"),
+            ContentBlock(type="image", media_id="https://example.com/shirt.jpg"),
+        ]
+        messages = adapter._build_messages(prompt="", content_parts=content_parts)
+
+        assert messages[-1] == {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What is this?"},
+                {"type": "image_url", "image_url": {"url": "https://example.com/shirt.jpg"}},
+            ],
+        }
+
     # -- call() tests (DI adapter via acompletion_fn) -----------------------
 
     @pytest.mark.asyncio
@@ -310,6 +367,18 @@ class TestLiteLLMGatewayAdapter:
 
         assert result.tokens_used == {"input": 0, "output": 0}
 
+    @pytest.mark.asyncio
+    async def test_call_reports_cached_input_tokens(self) -> None:
+        """Provider cache reads (normalized by LiteLLM) surface as cached_input."""
+        response = _make_response(prompt_tokens=1000, completion_tokens=20)
+        response.usage.prompt_tokens_details = SimpleNamespace(cached_tokens=768)
+        adapter = LiteLLMGatewayAdapter(acompletion_fn=FakeACompletion(response=response))
+
+        result = await adapter.call(prompt="Test", model_id="gpt-4o")
+
+        assert result.tokens_used == {"input": 1000, "output": 20, "cached_input": 768}
+        assert result.cached_ratio == pytest.approx(0.768)
+
     @pytest.mark.asyncio
     async def test_call_handles_empty_content(self) -> None:
         """Test call handles empty message content."""
@@ -368,3 +437,156 @@ class TestLiteLLMGatewayAdapter:
         await adapter.call(prompt="Test", model_id="gpt-4o", parameters={})
 
         assert fake.call_kwargs["temperature"] == 0.7
+
+
+# ---------------------------------------------------------------------------
+# Provider batch endpoint (T2-9): DI fakes for LiteLLM files + batches
+# ---------------------------------------------------------------------------
+
+
+class FakeBatchEndpoints:
+    """In-memory files + batches API with the LiteLLM call signatures."""
+
+    def __init__(self, status: str = "completed") -> None:
+        self.status = status
+        self.files: dict[str, bytes] = {}
+        self.batch_kwargs: dict[str, Any] = {}
+        self.cancelled: list[str] = []
+
+    async def create_file(self, *, file: tuple[str, bytes], purpose: str, **kwargs: Any) -> Any:
+        file_id = f"file_{len(self.files)}"
+        self.files[file_id] = file[1]
+        return SimpleNamespace(id=file_id)
+
+    async def create_batch(self, **kwargs: Any) -> Any:
+        self.batch_kwargs = kwargs
+        return SimpleNamespace(id="batch_1")
+
+    async def retrieve_batch(self, *, batch_id: str, **kwargs: Any) -> Any:
+        requests = [json.loads(line) for line in self.files["file_0"].decode().splitlines()]
+        output = [
+            {
+                "custom_id": r["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "model": r["body"]["model"],
+                        "choices": [
+                            {
+                                "message": {"content": f"ok {r['custom_id']}"},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {"prompt_tokens": 12, "completion_tokens": 3},
+                    },
+                },
+                "error": None,
+            }
+            for r in requests[:-1]
+        ]
+        errors = [
+            {
+                "custom_id": requests[-1]["custom_id"],
+                "response": {"status_code": 429, "body": {"error": {"message": "slow down"}}},
+                "error": None,
+            }
+        ]
+        self.files["out"] = "\n".join(json.dumps(o) for o in output).encode()
+        self.files["err"] = "\n".join(json.dumps(e) for e in errors).encode()
+        return SimpleNamespace(status=self.status, output_file_id="out", error_file_id="err")
+
+    async def file_content(self, *, file_id: str, **kwargs: Any) -> Any:
+        return SimpleNamespace(content=self.files[file_id])
+
+    async def cancel_batch(self, *, batch_id: str, **kwargs: Any) -> Any:
+        self.cancelled.append(batch_id)
+        return SimpleNamespace(id=batch_id, status="cancelling")
+
+    def api(self, adapter: LiteLLMGatewayAdapter) -> LiteLLMBatchAPI:
+        return LiteLLMBatchAPI(
+            adapter,
+            create_file_fn=self.create_file,
+            create_batch_fn=self.create_batch,
+            retrieve_batch_fn=self.retrieve_batch,
+            file_content_fn=self.file_content,
+            cancel_batch_fn=self.cancel_batch,
+        )
+
+
+class TestLiteLLMBatchAPI:
+    def test_supports_provider_models_only(self) -> None:
+        api = LiteLLMBatchAPI(LiteLLMGatewayAdapter(default_model="gpt-4o"))
+        custom = LiteLLMBatchAPI(LiteLLMGatewayAdapter(base_url="https://gw.example.com/v1"))
+
+        assert api.supports("gpt-4o")
+        assert api.supports("")
+        assert not api.supports("anthropic/claude-3-5-sonnet-20240620")
+        assert not custom.supports("gpt-4o")
+
+    @pytest.mark.asyncio
+    async def test_submit_and_fetch(self) -> None:
+        endpoints = FakeBatchEndpoints()
+        api = endpoints.api(LiteLLMGatewayAdapter(default_model="gpt-4o"))
+        items = [
+            BatchItem(item_id="a", prompt="Describe A", parameters={"max_tokens": 50}),
+            BatchItem(item_id="b", prompt="Describe B"),
+        ]
+
+        batch_id = await api.submit(items, "")
+        outcomes = await api.fetch(batch_id)
+
+        uploaded = [json.loads(line) for line in endpoints.files["file_0"].decode().splitlines()]
+        assert uploaded[0]["custom_id"] == "a"
+        assert uploaded[0]["url"] == "/v1/chat/completions"
+        assert uploaded[0]["body"]["messages"] == [{"role": "user", "content": "Describe A"}]
+        assert uploaded[0]["body"]["max_tokens"] == 50
+        assert "max_tokens" not in uploaded[1]["body"]
+        assert endpoints.batch_kwargs["input_file_id"] == "file_0"
+        assert endpoints.batch_kwargs["completion_window"] == "24h"
+
+        assert outcomes is not None
+        answer = outcomes["a"]
+        assert isinstance(answer, LLMResponse)
+        assert answer.text == "ok a"
+        assert answer.tokens_used == {"input": 12, "output": 3}
+        assert "slow down" in str(outcomes["b"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_while_running(self) -> None:
+        endpoints = FakeBatchEndpoints(status="in_progress")
+        api = endpoints.api(LiteLLMGatewayAdapter(default_model="gpt-4o"))
+        await api.submit([BatchItem(item_id="a", prompt="x")], "gpt-4o")
+
+        assert await api.fetch("batch_1") is None
+
+    @pytest.mark.asyncio
+    async def test_cancel(self) -> None:
+        endpoints = FakeBatchEndpoints(status="in_progress")
+        api = endpoints.api(LiteLLMGatewayAdapter(default_model="gpt-4o"))
+
+        await api.cancel("batch_1")
+
+        assert endpoints.cancelled == ["batch_1"]
+
+
+class TestLiteLLMCost:
+    def test_batch_rate_is_cheaper(self) -> None:
+        interactive = litellm_cost("gpt-4o", 1_000_000, 100_000)
+        batch = litellm_cost("gpt-4o", 1_000_000, 100_000, provider_batch=True)
+
+        assert interactive > 0
+        assert batch == pytest.approx(interactive / 2)
+        assert litellm_cost("openai/gpt-4o", 1000, 0) == litellm_cost("gpt-4o", 1000, 0)
+
+    def test_unknown_model_costs_nothing(self) -> None:
+        assert litellm_cost("in-house-model", 1000, 1000) == 0.0
+
+
+class TestLiteLLMContextWindow:
+    def test_known_model_uses_its_input_window(self) -> None:
+        assert litellm_context_window("gpt-4o") == 128_000
+        assert litellm_context_window("openai/gpt-4o") == 128_000
+
+    def test_unknown_model_falls_back_to_default(self) -> None:
+        assert litellm_context_window("in-house-model") == 4096
+        assert litellm_context_window("in-house-model", default=8192) == 8192
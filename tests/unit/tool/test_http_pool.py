@@ -0,0 +1,208 @@
+"""Unit tests for pooled HTTP clients (T3-4).
+
+Tests: one shared client per backend, keep-alive reuse and reuse ratio,
+DNS cache (hits, TTL expiry, re-resolve after failed connects), env
+proxies, close, policy validation, LiteLLM session injection.
+Runs against a local asyncio stub server (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpcore
+import httpx
+import litellm
+import pytest
+
+from src.tool.http.pool import HttpClientPool, HttpPoolPolicy, _CachingDNSBackend
+from src.tool.llm.gateway_adapter import LiteLLMGatewayAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class StubServer:
+    """Minimal HTTP/1.1 keep-alive server answering 200 "ok"."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture()
+async def stub() -> AsyncIterator[tuple[StubServer, int]]:
+    server = StubServer()
+    port = await server.start()
+    yield server, port
+    await server.stop()
+
+
+class FailingBackend(httpcore.AsyncNetworkBackend):
+    """Refuses every connection; records the hosts it was asked for."""
+
+    def __init__(self) -> None:
+        self.hosts: list[str] = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.hosts.append(host)
+        msg = "refused"
+        raise httpcore.ConnectError(msg)
+
+
+@pytest.mark.unit
+class TestHttpClientPool:
+    async def test_shared_client_per_backend(self) -> None:
+        pool = HttpClientPool()
+
+        assert pool.client("llm") is pool.client("llm")
+        assert pool.client("llm") is not pool.client("web_search")
+        await pool.aclose()
+
+    async def test_keep_alive_reuse(self, stub: tuple[StubServer, int]) -> None:
+        server, port = stub
+        pool = HttpClientPool(HttpPoolPolicy(http2=False))
+        client = pool.client("search", base_url=f"http://localhost:{port}")
+
+        for _ in range(10):
+            response = await client.get("/q")
+            assert response.text == "ok"
+
+        stats = pool.stats("search")
+        assert stats.requests == 10
+        assert stats.connections == 1
+        assert stats.reuse_ratio == pytest.approx(0.9)
+        assert server.connections == 1
+        await pool.aclose()
+
+    async def test_dns_cached_across_clients(self, stub: tuple[StubServer, int]) -> None:
+        _, port = stub
+        pool = HttpClientPool(HttpPoolPolicy(http2=False, max_keepalive_connections=0))
+
+        for name in ("a", "b"):
+            for _ in range(3):
+                await pool.client(name).get(f"http://localhost:{port}/")
+
+        total = pool.stats()
+        assert total.requests == 6
+        assert total.connections == 6  # keep-alive disabled: new connection each time
+        assert total.dns_lookups == 1
+        assert total.dns_hits == 5
+        await pool.aclose()
+
+    async def test_transport_errors_are_httpx_errors(self) -> None:
+        server = StubServer()
+        port = await server.start()
+        await server.stop()
+        pool = HttpClientPool(HttpPoolPolicy(http2=False))
+
+        with pytest.raises(httpx.ConnectError):
+            await pool.client("gone").get(f"http://127.0.0.1:{port}/")
+        await pool.aclose()
+
+    async def test_env_proxy_is_honoured(
+        self, stub: tuple[StubServer, int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server, port = stub
+        closed = StubServer()
+        closed_port = await closed.start()
+        await closed.stop()
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{port}")
+        monkeypatch.setenv("no_proxy", "localhost")
+        pool = HttpClientPool(HttpPoolPolicy(http2=False))
+
+        # Answered by the stub acting as proxy, though the port is closed
+        response = await pool.client("llm").get(f"http://127.0.0.1:{closed_port}/v1")
+        assert response.text == "ok"
+        with pytest.raises(httpx.ConnectError):  # NO_PROXY: direct
+            await pool.client("llm").get(f"http://localhost:{closed_port}/v1")
+        await pool.aclose()
+
+        no_env = HttpClientPool(HttpPoolPolicy(http2=False, trust_env=False))
+        with pytest.raises(httpx.ConnectError):
+            await no_env.client("llm").get(f"http://127.0.0.1:{closed_port}/v1")
+        await no_env.aclose()
+        assert server.connections == 1
+
+    async def test_closed_pool_hands_out_fresh_clients(self) -> None:
+        pool = HttpClientPool()
+        first = pool.client("llm")
+
+        await pool.aclose()
+
+        assert first.is_closed
+        assert pool.client("llm") is not first
+        await pool.aclose()
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError, match="max_connections"):
+            HttpPoolPolicy(max_connections=0)
+        with pytest.raises(ValueError, match="dns_ttl_seconds"):
+            HttpPoolPolicy(dns_ttl_seconds=-1)
+
+
+@pytest.mark.unit
+class TestCachingDNSBackend:
+    async def test_ttl_expiry_and_failed_connect_reresolve(self) -> None:
+        now = [0.0]
+        inner = FailingBackend()
+        backend = _CachingDNSBackend(inner, ttl_seconds=10, clock=lambda: now[0])
+
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("localhost", 80)
+        assert backend.lookups == 1
+        assert inner.hosts
+        assert "localhost" not in inner.hosts  # connected by address
+
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("localhost", 80)
+        assert backend.lookups == 2  # failed addresses were dropped
+
+    async def test_ip_literals_skip_resolution(self) -> None:
+        inner = FailingBackend()
+        backend = _CachingDNSBackend(inner, ttl_seconds=10)
+
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("127.0.0.1", 80)
+
+        assert backend.lookups == 0
+        assert inner.hosts == ["127.0.0.1"]
+
+
+@pytest.mark.unit
+class TestLiteLLMSession:
+    async def test_adapter_installs_shared_client(self) -> None:
+        pool = HttpClientPool()
+        previous = litellm.aclient_session
+        try:
+            LiteLLMGatewayAdapter(default_model="gpt-4o", http_client=pool.client("llm"))
+            assert litellm.aclient_session is pool.client("llm")
+        finally:
+            litellm.aclient_session = previous
+            await pool.aclose()
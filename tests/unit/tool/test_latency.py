@@ -0,0 +1,58 @@
+"""Tests for T2-7: per-provider latency tracking.
+
+Validates:
+- Quantile sketch within its relative accuracy
+- Rotating window follows a provider that slows down
+- EWMA update
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.tool.llm.latency import LatencySketch, LatencyStats
+
+
+class TestLatencySketch:
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        rng = random.Random(5)  # noqa: S311
+        samples = sorted(rng.lognormvariate(4, 0.6) for _ in range(5000))
+        sketch = LatencySketch(window=10_000)
+        for s in samples:
+            sketch.observe(s)
+
+        for q in (0.5, 0.9, 0.99):
+            exact = samples[int(q * (len(samples) - 1))]
+            estimate = sketch.quantile(q)
+            assert estimate is not None
+            assert abs(estimate - exact) / exact <= 0.03
+
+    def test_window_forgets_old_latency(self) -> None:
+        sketch = LatencySketch(window=100)
+        for _ in range(100):
+            sketch.observe(20)
+        for _ in range(200):
+            sketch.observe(500)
+
+        p50 = sketch.quantile(0.5)
+        assert p50 is not None
+        assert p50 > 400
+
+    def test_empty(self) -> None:
+        assert LatencySketch().quantile(0.5) is None
+
+    def test_rejects_bad_accuracy(self) -> None:
+        with pytest.raises(ValueError, match="relative_accuracy"):
+            LatencySketch(relative_accuracy=1.5)
+
+
+class TestLatencyStats:
+    def test_ewma(self) -> None:
+        stats = LatencyStats(alpha=0.5)
+        stats.observe(100)
+        stats.observe(200)
+
+        assert stats.ewma_ms == 150
+        assert stats.samples == 2
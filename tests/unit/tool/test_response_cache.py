@@ -0,0 +1,257 @@
+"""Unit tests for the LLM response cache (T2-5).
+
+Tests: opt-in by pinned temperature, exact key, per-org scope, TTL,
+shared tier across workers, semantic tier, invalidation (org and
+knowledge change, including the KnowledgeWriteAdapter hook), stats.
+Uses Fake adapters (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from src.knowledge.api.write_adapter import KnowledgeWriteAdapter
+from src.ports.llm_call_port import ContentBlock, LLMCallPort, LLMResponse
+from src.shared.org_scope import org_scope
+from src.tool.llm.response_cache import ResponseCache, ResponseCachePolicy
+from tests.fakes import FakeStorage
+
+_PINNED = {"temperature": 0}
+
+
+class CountingLLM(LLMCallPort):
+    """Answers with the call number so reuse is visible."""
+
+    def __init__(self, finish_reason: str = "stop") -> None:
+        self.calls = 0
+        self._finish_reason = finish_reason
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            text=f"answer {self.calls}",
+            tokens_used={"input": 100, "output": 20},
+            model_id=model_id,
+            finish_reason=self._finish_reason,
+        )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _embed(text: str) -> list[float]:
+    """Bag of words over a tiny vocabulary."""
+    vocab = ["return", "policy", "linen", "shirt", "delivery", "days", "blazer"]
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(w)) for w in vocab]
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    @pytest.mark.asyncio()
+    async def test_sampled_calls_bypass(self) -> None:
+        llm = CountingLLM()
+        cache = ResponseCache(llm)
+
+        await cache.call("hi", "gpt-4o")
+        await cache.call("hi", "gpt-4o", parameters={"temperature": 0.7})
+
+        assert llm.calls == 2
+        assert cache.stats.bypassed == 2
+        assert cache.stats.lookups == 0
+
+    @pytest.mark.asyncio()
+    async def test_exact_hit_reports_saved_tokens(self) -> None:
+        llm = CountingLLM()
+        cache = ResponseCache(llm)
+
+        first = await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        second = await cache.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 1
+        assert second.text == first.text
+        assert second.tokens_used == {
+            "input": 0,
+            "output": 0,
+            "saved_input": 100,
+            "saved_output": 20,
+        }
+        assert cache.stats.exact_hits == 1
+        assert cache.stats.hit_ratio == 0.5
+        assert cache.stats.saved_input_tokens == 100
+
+    @pytest.mark.asyncio()
+    async def test_key_covers_model_parameters_and_blocks(self) -> None:
+        llm = CountingLLM()
+        cache = ResponseCache(llm)
+        blocks = [ContentBlock(type="text", text="hi", role="user")]
+
+        await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        await cache.call("hi", "gpt-4o-mini", parameters=_PINNED)
+        await cache.call("hi", "gpt-4o", parameters={"temperature": 0, "max_tokens": 5})
+        await cache.call("hi", "gpt-4o", content_parts=blocks, parameters=_PINNED)
+        # The cache hint alone does not change the key
+        hinted = [ContentBlock(type="text", text="hi", role="user", cache=True)]
+        await cache.call("hi", "gpt-4o", content_parts=hinted, parameters=_PINNED)
+
+        assert llm.calls == 4
+
+    @pytest.mark.asyncio()
+    async def test_scoped_per_org(self) -> None:
+        llm = CountingLLM()
+        cache = ResponseCache(llm)
+
+        with org_scope(uuid4()):
+            await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        with org_scope(uuid4()):
+            await cache.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio()
+    async def test_org_evicted_during_shared_lookup(self) -> None:
+        llm = CountingLLM()
+
+        class EvictingStorage(FakeStorage):
+            async def get(self, key: str) -> object:
+                cache.clear()  # another coroutine pushed this org out of the LRU
+                return await super().get(key)
+
+        cache = ResponseCache(llm, shared=EvictingStorage())
+
+        with org_scope(uuid4()):
+            response = await cache.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert response.text == "answer 1"
+
+    @pytest.mark.asyncio()
+    async def test_ttl_expiry(self) -> None:
+        llm, clock = CountingLLM(), FakeClock()
+        cache = ResponseCache(llm, policy=ResponseCachePolicy(ttl_seconds=60), clock=clock)
+
+        await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        clock.now = 61
+        await cache.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio()
+    async def test_truncated_answers_not_cached(self) -> None:
+        llm = CountingLLM(finish_reason="length")
+        cache = ResponseCache(llm)
+
+        await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        await cache.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio()
+    async def test_shared_tier_serves_other_workers(self) -> None:
+        llm, shared = CountingLLM(), FakeStorage()
+        org_id = uuid4()
+        worker_a = ResponseCache(llm, shared=shared)
+        worker_b = ResponseCache(llm, shared=shared)
+
+        with org_scope(org_id):
+            await worker_a.call("hi", "gpt-4o", parameters=_PINNED)
+            await worker_b.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 1
+        assert worker_b.stats.shared_hits == 1
+
+    @pytest.mark.asyncio()
+    async def test_semantic_hit_above_threshold(self) -> None:
+        llm = CountingLLM()
+        cache = ResponseCache(llm, policy=ResponseCachePolicy(semantic_threshold=0.9), embed=_embed)
+
+        await cache.call("linen shirt return policy?", "gpt-4o", parameters=_PINNED)
+        similar = await cache.call("return policy linen shirt", "gpt-4o", parameters=_PINNED)
+        await cache.call("blazer delivery days?", "gpt-4o", parameters=_PINNED)
+
+        assert similar.text == "answer 1"
+        assert llm.calls == 2
+        assert cache.stats.semantic_hits == 1
+
+    @pytest.mark.asyncio()
+    async def test_semantic_never_crosses_models(self) -> None:
+        llm = CountingLLM()
+        cache = ResponseCache(llm, policy=ResponseCachePolicy(semantic_threshold=0.9), embed=_embed)
+
+        await cache.call("linen shirt return policy?", "gpt-4o", parameters=_PINNED)
+        await cache.call("return policy linen shirt", "gpt-4o-mini", parameters=_PINNED)
+
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_org(self) -> None:
+        llm, shared = CountingLLM(), FakeStorage()
+        org_id = uuid4()
+        cache = ResponseCache(llm, shared=shared)
+
+        with org_scope(org_id):
+            await cache.call("hi", "gpt-4o", parameters=_PINNED)
+            await cache.invalidate_org(org_id)
+            await cache.call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 2
+        assert cache.stats.invalidations == 1
+
+    @pytest.mark.asyncio()
+    async def test_knowledge_write_invalidates_every_org(self) -> None:
+        llm, shared = CountingLLM(), FakeStorage()
+        brand, store = uuid4(), uuid4()
+        cache = ResponseCache(llm, shared=shared)
+        writer = KnowledgeWriteAdapter(on_change=cache.knowledge_changed)
+
+        for org in (brand, store):
+            with org_scope(org):
+                await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        await writer.create_entry(
+            org_id=brand, entity_type="Product", properties={"name": "x"}, user_id=uuid4()
+        )
+        # Knowledge written at the brand is visible to its stores
+        with org_scope(store):
+            await cache.call("hi", "gpt-4o", parameters=_PINNED)
+        # Other workers see the rotated knowledge generation too
+        with org_scope(brand):
+            await ResponseCache(llm, shared=shared).call("hi", "gpt-4o", parameters=_PINNED)
+
+        assert llm.calls == 4
+
+    @pytest.mark.asyncio()
+    async def test_invalidation_reaches_other_workers_local_entries(self) -> None:
+        llm, shared = CountingLLM(), FakeStorage()
+        org_id = uuid4()
+        policy = ResponseCachePolicy(semantic_threshold=0.9)
+        worker_a = ResponseCache(llm, shared=shared, policy=policy, embed=_embed)
+        worker_b = ResponseCache(llm, shared=shared, policy=policy, embed=_embed)
+
+        with org_scope(org_id):
+            await worker_a.call("linen shirt return policy?", "gpt-4o", parameters=_PINNED)
+            await worker_b.call("linen shirt return policy?", "gpt-4o", parameters=_PINNED)
+            assert worker_b.stats.shared_hits == 1  # now in worker_b's LRU too
+
+            await worker_a.invalidate_org(org_id)
+            exact = await worker_b.call("linen shirt return policy?", "gpt-4o", parameters=_PINNED)
+            await worker_a.knowledge_changed()
+            similar = await worker_b.call("return policy linen shirt", "gpt-4o", parameters=_PINNED)
+
+        assert exact.text == "answer 2"
+        assert similar.text == "answer 3"  # semantic tier skips stale entries as well
+        assert worker_b.stats.exact_hits == 0
+        assert worker_b.stats.semantic_hits == 0
+
+    def test_semantic_requires_embedder(self) -> None:
+        with pytest.raises(ValueError, match="embed"):
+            ResponseCache(CountingLLM(), policy=ResponseCachePolicy(semantic_threshold=0.9))
+
+    def test_rejects_bad_threshold(self) -> None:
+        with pytest.raises(ValueError, match="semantic_threshold"):
+            ResponseCachePolicy(semantic_threshold=1.5)
@@ -0,0 +1,256 @@
+"""Unit tests for the LLM call scheduler (T2-8).
+
+Tests: global and per-model caps, weighted fair queuing across orgs by
+tier, interactive before batch, queue deadline, queue bound, cancellation
+(no leaked slots), stats. Uses Fake adapters (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.ports.llm_call_port import LLMCallPort, LLMResponse
+from src.shared.errors import ServiceUnavailableError
+from src.shared.org_scope import call_priority, org_scope
+from src.tool.llm.scheduler import LLMScheduler, SchedulerPolicy
+
+
+class GatedLLM(LLMCallPort):
+    """Holds every call until released; records start order by prompt."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._gates: dict[str, asyncio.Event] = {}
+
+    async def call(self, prompt, model_id, content_parts=None, parameters=None) -> LLMResponse:
+        self.started.append(prompt)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        gate = self._gates.setdefault(prompt, asyncio.Event())
+        try:
+            await gate.wait()
+        finally:
+            self.running -= 1
+        return LLMResponse(text=prompt, model_id=model_id)
+
+    def release(self, prompt: str) -> None:
+        self._gates.setdefault(prompt, asyncio.Event()).set()
+
+    def release_all(self) -> None:
+        for prompt in self.started:
+            self.release(prompt)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _submit(
+    scheduler: LLMScheduler,
+    prompt: str,
+    *,
+    model_id: str = "gpt-4o",
+    org=None,
+    tier: str | None = None,
+    priority: str = "interactive",
+) -> asyncio.Task[LLMResponse]:
+    async def run() -> LLMResponse:
+        with org_scope(org, tier), call_priority(priority):
+            return await scheduler.call(prompt, model_id)
+
+    return asyncio.create_task(run())
+
+
+class TestLLMSchedulerCaps:
+    @pytest.mark.asyncio()
+    async def test_global_cap(self) -> None:
+        llm = GatedLLM()
+        scheduler = LLMScheduler(llm, policy=SchedulerPolicy(max_concurrency=2))
+        tasks = [_submit(scheduler, f"p{i}") for i in range(5)]
+        await _settle()
+
+        assert llm.started == ["p0", "p1"]
+        assert scheduler.stats.depth["interactive"] == 3
+
+        llm.release("p0")
+        await _settle()
+        assert llm.started == ["p0", "p1", "p2"]
+
+        for _ in range(4):
+            llm.release_all()
+            await _settle()
+        await asyncio.gather(*tasks)
+        assert llm.peak == 2
+        assert scheduler.stats.running == 0
+
+    @pytest.mark.asyncio()
+    async def test_per_model_cap_does_not_block_other_models(self) -> None:
+        llm = GatedLLM()
+        policy = SchedulerPolicy(max_concurrency=4, model_concurrency={"big": 1})
+        scheduler = LLMScheduler(llm, policy=policy)
+        tasks = [
+            _submit(scheduler, "big-1", model_id="big"),
+            _submit(scheduler, "big-2", model_id="big"),
+            _submit(scheduler, "small-1", model_id="small"),
+        ]
+        await _settle()
+
+        assert llm.started == ["big-1", "small-1"]
+
+        llm.release("big-1")
+        await _settle()
+        assert "big-2" in llm.started
+
+        llm.release_all()
+        await asyncio.gather(*tasks)
+
+
+class TestLLMSchedulerFairness:
+    @pytest.mark.asyncio()
+    async def test_bulk_org_does_not_starve_others(self) -> None:
+        llm = GatedLLM()
+        scheduler = LLMScheduler(llm, policy=SchedulerPolicy(max_concurrency=1))
+        bulk, other = uuid4(), uuid4()
+        blocker = _submit(scheduler, "blocker")
+        await _settle()
+        tasks = [_submit(scheduler, f"bulk-{i}", org=bulk) for i in range(6)]
+        await _settle()
+        tasks += [_submit(scheduler, f"other-{i}", org=other) for i in range(2)]
+        await _settle()
+
+        llm.release("blocker")
+        for _ in range(8):
+            await _settle()
+            llm.release_all()
+        await asyncio.gather(blocker, *tasks)
+
+        order = llm.started[1:]
+        assert order.index("other-0") <= 2
+        assert order.index("other-1") <= 4
+
+    @pytest.mark.asyncio()
+    async def test_tier_weight_sets_share(self) -> None:
+        llm = GatedLLM()
+        scheduler = LLMScheduler(llm, policy=SchedulerPolicy(max_concurrency=1))
+        hq, store = uuid4(), uuid4()
+        blocker = _submit(scheduler, "blocker")
+        await _settle()
+        tasks = [_submit(scheduler, f"hq-{i}", org=hq, tier="brand_hq") for i in range(8)]
+        tasks += [
+            _submit(scheduler, f"store-{i}", org=store, tier="franchise_store") for i in range(8)
+        ]
+        await _settle()
+
+        llm.release("blocker")
+        for _ in range(17):
+            await _settle()
+            llm.release_all()
+        await asyncio.gather(blocker, *tasks)
+
+        first_ten = llm.started[1:11]
+        hq_share = sum(p.startswith("hq") for p in first_ten)
+        assert hq_share == 8  # weight 4 vs 1: brand HQ drains first, store still served
+        assert any(p.startswith("store") for p in first_ten)
+
+    @pytest.mark.asyncio()
+    async def test_interactive_before_batch(self) -> None:
+        llm = GatedLLM()
+        scheduler = LLMScheduler(llm, policy=SchedulerPolicy(max_concurrency=1))
+        blocker = _submit(scheduler, "blocker")
+        await _settle()
+        tasks = [_submit(scheduler, f"batch-{i}", priority="batch") for i in range(3)]
+        await _settle()
+        tasks.append(_submit(scheduler, "chat"))
+        await _settle()
+
+        llm.release("blocker")
+        for _ in range(5):
+            await _settle()
+            llm.release_all()
+        await asyncio.gather(blocker, *tasks)
+
+        assert llm.started[1] == "chat"
+
+
+class TestLLMSchedulerLimits:
+    @pytest.mark.asyncio()
+    async def test_deadline_rejects_and_frees_queue(self) -> None:
+        llm = GatedLLM()
+        policy = SchedulerPolicy(max_concurrency=1, interactive_deadline_seconds=0.01)
+        scheduler = LLMScheduler(llm, policy=policy)
+        blocker = _submit(scheduler, "blocker")
+        await _settle()
+
+        with pytest.raises(ServiceUnavailableError, match="interactive queue"):
+            await scheduler.call("late", "gpt-4o")
+
+        assert scheduler.stats.expired == 1
+        assert scheduler.stats.depth["interactive"] == 0
+        llm.release("blocker")
+        await blocker
+        llm.release("next")
+        assert (await scheduler.call("next", "gpt-4o")).text == "next"
+
+    @pytest.mark.asyncio()
+    async def test_full_queue_rejects(self) -> None:
+        llm = GatedLLM()
+        policy = SchedulerPolicy(max_concurrency=1, max_queue_depth=2)
+        scheduler = LLMScheduler(llm, policy=policy)
+        tasks = [_submit(scheduler, f"p{i}") for i in range(3)]
+        await _settle()
+
+        with pytest.raises(ServiceUnavailableError, match="queue full"):
+            await scheduler.call("overflow", "gpt-4o")
+        assert scheduler.stats.rejected == 1
+
+        for _ in range(3):
+            llm.release_all()
+            await _settle()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio()
+    async def test_cancelled_waiter_releases_nothing_it_does_not_hold(self) -> None:
+        llm = GatedLLM()
+        scheduler = LLMScheduler(llm, policy=SchedulerPolicy(max_concurrency=1))
+        running = _submit(scheduler, "running")
+        waiting = _submit(scheduler, "waiting")
+        await _settle()
+
+        waiting.cancel()
+        await _settle()
+        running.cancel()
+        await _settle()
+
+        assert scheduler.stats.running == 0
+        assert scheduler.stats.depth["interactive"] == 0
+        llm.release("after")
+        assert (await scheduler.call("after", "gpt-4o")).text == "after"
+
+    @pytest.mark.asyncio()
+    async def test_wait_stats(self) -> None:
+        llm = GatedLLM()
+        llm.release("quick")
+        scheduler = LLMScheduler(llm)
+
+        await scheduler.call("quick", "gpt-4o")
+
+        assert scheduler.stats.submitted == 1
+        assert scheduler.stats.immediate == 1
+        assert scheduler.stats.wait_ms("interactive", 0.5) is not None
+        assert scheduler.stats.wait_ms("batch", 0.5) is None
+
+
+class TestSchedulerPolicy:
+    def test_rejects_bad_caps(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            SchedulerPolicy(model_concurrency={"gpt-4o": 0})
+
+    def test_rejects_unknown_priority(self) -> None:
+        with pytest.raises(ValueError, match="priority"), call_priority("urgent"):
+            pass
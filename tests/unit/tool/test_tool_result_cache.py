@@ -0,0 +1,301 @@
+"""Unit tests for the tool result cache (T3-1 / T3-2 / T3-3).
+
+Tests: normalized search keys, time-sensitive queries, media content
+hashes across re-signed URLs, per-org scope, TTL, errors not cached,
+shared tier across workers, zero-cost billing events for hits (and the
+UsageTracker bridge), stats.
+Uses Fake backends and tests.fakes.FakeStorage (no unittest.mock).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.shared.org_scope import org_scope
+from src.tool.cache.result_cache import (
+    CACHE_HIT_BILLING_UNIT,
+    ToolCachePolicy,
+    ToolCallEvent,
+    cache_tool,
+    normalize_query,
+    usage_meter,
+)
+from src.tool.implementations.audio_transcribe import AudioTranscribeTool
+from src.tool.implementations.image_analyze import ImageAnalyzeTool
+from src.tool.implementations.web_search import WebSearchTool
+from src.tool.llm.usage_tracker import UsageTracker
+from tests.fakes import FakeStorage
+
+
+class CountingSearch:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+
+    async def search(self, query: str, top_k: int, safe_search: bool) -> list[dict[str, str]]:
+        self.calls += 1
+        if self.fail:
+            msg = "search backend down"
+            raise ConnectionError(msg)
+        return [{"url": f"https://r/{self.calls}", "title": query, "snippet": ""}]
+
+
+class CountingVision:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def analyze(self, image_url: str, analysis_type: str, detail_level: str) -> dict:
+        self.calls += 1
+        return {"description": f"analysis {self.calls}", "analysis_type": analysis_type}
+
+
+class CountingTranscriber:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def transcribe(self, audio_url: str, language: str, output_format: str) -> dict:
+        self.calls += 1
+        return {"text": f"transcript {self.calls}", "language": language, "segments": []}
+
+
+@dataclass
+class _Meta:
+    size_bytes: int
+    checksum_sha256: str
+    mime_type: str = "image/png"
+    last_modified: datetime = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeObjectStore:
+    """head_object by URL path: query strings (signatures) are ignored."""
+
+    def __init__(self, checksums: dict[str, str]) -> None:
+        self._checksums = checksums
+
+    async def head_object(self, url: str) -> _Meta:
+        return _Meta(size_bytes=1024, checksum_sha256=self._checksums[url.split("?")[0]])
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _search(**policy: Any) -> tuple[Any, CountingSearch, list[ToolCallEvent]]:
+    backend, events = CountingSearch(), []
+    cached = cache_tool(
+        WebSearchTool(search_backend=backend),
+        meter=events.append,
+        policies={"web_search": ToolCachePolicy(**policy)} if policy else None,
+    )
+    return cached, backend, events
+
+
+@pytest.mark.unit
+class TestSearchCaching:
+    def test_normalize_query(self) -> None:
+        assert normalize_query("  Linen  SHIRT\uff1f ") == "linen shirt"
+        assert normalize_query("\uff26\uff35\uff2c\uff2c width!") == "full width"  # fullwidth
+
+    async def test_equivalent_queries_share_an_entry(self) -> None:
+        cached, backend, _ = _search()
+
+        with org_scope(uuid4()):
+            first = await cached.execute({"query": "linen shirt"})
+            second = await cached.execute({"query": "  Linen SHIRT? "})
+            await cached.execute({"query": "linen shirt", "top_k": 3})
+
+        assert backend.calls == 2  # top_k changes the result
+        assert second.data == first.data
+        assert second.metadata["cache_hit"] is True
+        assert cached.stats.hits == 1
+
+    async def test_time_sensitive_queries(self) -> None:
+        clock = FakeClock()
+        backend = CountingSearch()
+        cached = cache_tool(WebSearchTool(search_backend=backend), clock=clock)
+
+        with org_scope(uuid4()):
+            await cached.execute({"query": "latest linen trends"})
+            clock.now = 59
+            await cached.execute({"query": "latest linen trends"})
+            clock.now = 61
+            await cached.execute({"query": "latest linen trends"})
+            await cached.execute({"query": "今天 天气"})
+            await cached.execute({"query": "I know linen"})  # "know" is not "now"
+            clock.now = 900
+            await cached.execute({"query": "I know linen"})
+
+        assert backend.calls == 4
+
+        uncached, backend, _ = _search(volatile_terms=frozenset({"news"}))
+        with org_scope(uuid4()):
+            await uncached.execute({"query": "linen news"})
+            await uncached.execute({"query": "linen news"})
+        assert backend.calls == 2
+        assert uncached.stats.bypassed == 2
+
+    async def test_scoped_per_org(self) -> None:
+        cached, backend, _ = _search()
+
+        for org_id in (uuid4(), uuid4()):
+            with org_scope(org_id):
+                await cached.execute({"query": "linen shirt"})
+
+        assert backend.calls == 2
+
+    async def test_errors_not_cached(self) -> None:
+        cached, backend, _ = _search()
+        backend.fail = True
+
+        with org_scope(uuid4()):
+            assert (await cached.execute({"query": "linen"})).status == "error"
+            backend.fail = False
+            assert (await cached.execute({"query": "linen"})).status == "success"
+
+        assert backend.calls == 2
+
+    async def test_hit_result_is_a_copy(self) -> None:
+        cached, _, _ = _search()
+
+        with org_scope(uuid4()):
+            await cached.execute({"query": "linen"})
+            hit = await cached.execute({"query": "linen"})
+            hit.data["results"].clear()
+            again = await cached.execute({"query": "linen"})
+
+        assert len(again.data["results"]) == 1
+
+
+@pytest.mark.unit
+class TestMediaCaching:
+    async def test_content_hash_survives_resigned_urls(self) -> None:
+        vision = CountingVision()
+        store = FakeObjectStore(
+            {"https://s3/a.png": "aaa", "https://s3/copy-of-a.png": "aaa", "https://s3/b.png": "b"}
+        )
+        cached = cache_tool(
+            ImageAnalyzeTool(vision_backend=vision, storage_backend=store),
+            storage_backend=store,
+        )
+
+        with org_scope(uuid4()):
+            await cached.execute({"image_url": "https://s3/a.png?X-Amz-Signature=1"})
+            await cached.execute({"image_url": "https://s3/a.png?X-Amz-Signature=2"})
+            await cached.execute({"image_url": "https://s3/copy-of-a.png?sig=3"})
+            await cached.execute({"image_url": "https://s3/b.png?sig=4"})
+            await cached.execute({"image_url": "https://s3/a.png?sig=5", "analysis_type": "scene"})
+
+        assert vision.calls == 3
+
+    async def test_url_fallback_without_storage(self) -> None:
+        transcriber = CountingTranscriber()
+        cached = cache_tool(AudioTranscribeTool(transcription_backend=transcriber))
+
+        with org_scope(uuid4()):
+            await cached.execute({"audio_url": "https://cdn/a.mp3"})
+            hit = await cached.execute({"audio_url": "https://cdn/a.mp3", "language": "auto"})
+            await cached.execute({"audio_url": "https://cdn/a.mp3?v=2"})
+
+        assert transcriber.calls == 2
+        assert hit.data["text"] == "transcript 1"
+
+    def test_unknown_tool_rejected(self) -> None:
+        class OtherTool:
+            name = "document_extract"
+            version = "1.0"
+
+        with pytest.raises(ValueError, match="document_extract"):
+            cache_tool(OtherTool())
+
+
+@pytest.mark.unit
+class TestSharedTierAndBilling:
+    async def test_shared_tier_across_workers(self) -> None:
+        shared = FakeStorage()
+        backend = CountingSearch()
+        workers = [
+            cache_tool(WebSearchTool(search_backend=backend), shared=shared) for _ in range(2)
+        ]
+
+        with org_scope(uuid4()):
+            first = await workers[0].execute({"query": "linen shirt"})
+            second = await workers[1].execute({"query": "Linen shirt"})
+
+        assert backend.calls == 1
+        assert type(second) is type(first)
+        assert second.data == first.data
+        assert workers[1].stats.shared_hits == 1
+        assert all(ttl == 900 for ttl in shared.ttls.values())
+
+    async def test_hits_billed_as_zero_cost(self) -> None:
+        cached, _, events = _search(cost_amount=0.005, billing_unit="query")
+        org_id = uuid4()
+
+        with org_scope(org_id):
+            for _ in range(4):
+                await cached.execute({"query": "linen"})
+
+        assert [e.cache_hit for e in events] == [False, True, True, True]
+        assert events[0].cost_amount == 0.005
+        assert {(e.cost_amount, e.billing_unit) for e in events[1:]} == {
+            (0.0, CACHE_HIT_BILLING_UNIT)
+        }
+        assert all(e.org_id == org_id for e in events)
+        assert cached.stats.hit_ratio == 0.75
+        assert cached.stats.saved_cost == pytest.approx(0.015)
+
+    async def test_usage_meter_records_tool_usage(self) -> None:
+        tracker = UsageTracker()
+        org_id, alice, bob = uuid4(), uuid4(), uuid4()
+        record = usage_meter(tracker)
+        events: list[ToolCallEvent] = []
+
+        def meter(event: ToolCallEvent) -> None:
+            events.append(event)
+            record(event)
+
+        cached = cache_tool(
+            WebSearchTool(search_backend=CountingSearch()),
+            meter=meter,
+            policies={"web_search": ToolCachePolicy(cost_amount=0.01, billing_unit="query")},
+        )
+
+        with org_scope(org_id, user_id=alice):
+            for _ in range(2):
+                await cached.execute({"query": "linen"})
+        with org_scope(org_id, user_id=bob):
+            await cached.execute({"query": "linen"})
+        with org_scope(org_id):
+            await cached.execute({"query": "linen"})  # no user: not recordable
+        await cached.execute({"query": "linen"})  # no org: not recordable
+
+        summary = tracker.get_org_summary(org_id)
+        assert summary.tool_calls == 3
+        assert summary.tool_cost == pytest.approx(0.01)
+        assert [e.user_id for e in events] == [alice, alice, bob, None, None]
+
+    async def test_meter_failure_does_not_fail_the_call(self) -> None:
+        def broken(event: ToolCallEvent) -> None:
+            msg = "ledger down"
+            raise RuntimeError(msg)
+
+        cached = cache_tool(WebSearchTool(search_backend=CountingSearch()), meter=broken)
+
+        result = await cached.execute({"query": "linen"})
+
+        assert result.status == "success"
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            ToolCachePolicy(ttl_seconds=0)
+        with pytest.raises(ValueError, match="max_orgs"):
+            ToolCachePolicy(max_orgs=0)
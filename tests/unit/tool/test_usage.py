@@ -3,17 +3,72 @@
 Validates:
 - Every LLM call recorded (zero metering loss)
 - Usage aggregation per org
-- Budget pre-check enforcement
+- Budget pre-check enforcement against the current month's usage
 - Record retrieval
+- Running totals and minute/hour/day rollups
+- Write-behind batches: retry on sink failure, loss reported on overflow
+- Attribution: provider and price derived from the model, caller overrides
 """
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
 import pytest
 
-from src.tool.llm.usage_tracker import MeteringLossTracker, UsageTracker
+from src.tool.llm.usage_tracker import (
+    MeteringLossTracker,
+    ToolUsageRecord,
+    UsageRecord,
+    UsageTracker,
+)
+
+
+class FakeUsageSink:
+    """Collects written batches; can be switched to fail."""
+
+    def __init__(
+        self,
+        totals: list[dict[str, Any]] | None = None,
+        days: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.llm_batches: list[list[UsageRecord]] = []
+        self.tool_batches: list[list[ToolUsageRecord]] = []
+        self.fail = False
+        self.day_since: datetime | None = None
+        self._totals = totals or []
+        self._days = days or []
+
+    async def write_llm_usage(self, records) -> None:
+        if self.fail:
+            msg = "db down"
+            raise ConnectionError(msg)
+        self.llm_batches.append(list(records))
+
+    async def write_tool_usage(self, records) -> None:
+        if self.fail:
+            msg = "db down"
+            raise ConnectionError(msg)
+        self.tool_batches.append(list(records))
+
+    async def load_org_totals(self) -> list[dict[str, Any]]:
+        return self._totals
+
+    async def load_day_totals(self, since: datetime) -> list[dict[str, Any]]:
+        self.day_since = since
+        return [d for d in self._days if d["day"] >= since]
+
+
+def _record(tracker: UsageTracker, org_id, tokens: int = 10) -> UsageRecord:
+    return tracker.record_usage(
+        org_id=org_id,
+        user_id=uuid4(),
+        model_id="gpt-4o",
+        input_tokens=tokens,
+        output_tokens=tokens,
+    )
 
 
 @pytest.mark.unit
@@ -38,6 +93,49 @@ class TestUsageTracker:
         assert record.output_tokens == 50
         assert record.total_tokens == 150
         assert record.model_id == "gpt-4o"
+        assert record.provider is None
+        assert record.cost_amount is None
+
+    def test_provider_and_price_derived_from_model(self) -> None:
+        tracker = UsageTracker(
+            pricing=lambda model_id, i, o: (i + o) / 1000,
+            provider_of=lambda model_id: model_id.split("/", 1)[0],
+        )
+        brand_id = uuid4()
+
+        record = tracker.record_usage(
+            org_id=uuid4(),
+            user_id=uuid4(),
+            model_id="anthropic/claude-x",
+            input_tokens=300,
+            output_tokens=200,
+            brand_id=brand_id,
+            skill_id="merchandising",
+            task_id="job-1",
+        )
+
+        assert record.provider == "anthropic"
+        assert record.cost_amount == pytest.approx(0.5)
+        assert (record.brand_id, record.skill_id, record.task_id) == (
+            brand_id,
+            "merchandising",
+            "job-1",
+        )
+
+    def test_caller_cost_and_provider_win(self) -> None:
+        tracker = UsageTracker(pricing=lambda *_: 9.0, provider_of=lambda _: "derived")
+
+        record = tracker.record_usage(
+            org_id=uuid4(),
+            user_id=uuid4(),
+            model_id="gpt-4o",
+            input_tokens=1,
+            output_tokens=1,
+            provider="openai",
+            cost_amount=0.25,
+        )
+
+        assert (record.provider, record.cost_amount) == ("openai", 0.25)
 
     def test_org_summary(self, tracker: UsageTracker) -> None:
         org_id = uuid4()
@@ -141,6 +239,251 @@ class TestUsageTracker:
         assert summary.record_count == 100
 
 
+@pytest.mark.unit
+class TestUsageAggregates:
+    """Running totals and rollup buckets."""
+
+    def test_summary_is_a_snapshot(self) -> None:
+        tracker = UsageTracker()
+        org_id = uuid4()
+        _record(tracker, org_id)
+
+        summary = tracker.get_org_summary(org_id)
+        summary.total_tokens = 0
+
+        assert tracker.get_org_summary(org_id).total_tokens == 20
+
+    def test_tool_usage_counted_separately(self) -> None:
+        tracker = UsageTracker()
+        org_id = uuid4()
+        tracker.set_budget(org_id, 100)
+        for _ in range(3):
+            tracker.record_tool_usage(
+                org_id=org_id,
+                user_id=uuid4(),
+                tool_name="web_search",
+                tool_version="1.0.0",
+                cost_amount=0.01,
+                billing_unit="call",
+            )
+
+        summary = tracker.get_org_summary(org_id)
+        assert summary.tool_calls == 3
+        assert summary.tool_cost == pytest.approx(0.03)
+        assert summary.total_tokens == 0
+        assert tracker.check_budget(org_id, 100) is True
+
+    def test_tool_status_validated(self) -> None:
+        with pytest.raises(ValueError, match="status"):
+            UsageTracker().record_tool_usage(
+                org_id=uuid4(),
+                user_id=uuid4(),
+                tool_name="web_search",
+                tool_version="1.0.0",
+                cost_amount=0.0,
+                billing_unit="call",
+                status="pending",
+            )
+
+    def test_rollups_per_granularity(self) -> None:
+        now = [datetime(2026, 3, 1, 10, 0, 30, tzinfo=UTC).timestamp()]
+        tracker = UsageTracker(clock=lambda: now[0])
+        org_id = uuid4()
+
+        _record(tracker, org_id, 1)
+        now[0] += 20  # same minute
+        _record(tracker, org_id, 2)
+        now[0] += 60  # next minute, same hour
+        _record(tracker, org_id, 3)
+        now[0] += 3600  # next hour, same day
+        _record(tracker, org_id, 4)
+
+        minutes = tracker.get_usage_series(org_id, "minute")
+        assert [b.total_tokens for b in minutes] == [6, 6, 8]
+        assert minutes[0].start == datetime(2026, 3, 1, 10, 0, tzinfo=UTC)
+        assert [b.record_count for b in tracker.get_usage_series(org_id, "hour")] == [3, 1]
+        assert [b.total_tokens for b in tracker.get_usage_series(org_id, "day")] == [20]
+
+        since = datetime(2026, 3, 1, 10, 30, tzinfo=UTC)
+        hours = tracker.get_usage_series(org_id, "hour", since=since)
+        assert [b.total_tokens for b in hours] == [12, 8]  # bucket containing `since` kept
+        with pytest.raises(ValueError, match="granularity"):
+            tracker.get_usage_series(org_id, "week")
+
+    def test_budget_resets_each_month(self) -> None:
+        now = [datetime(2026, 1, 31, 23, 0, tzinfo=UTC).timestamp()]
+        tracker = UsageTracker(clock=lambda: now[0])
+        org_id = uuid4()
+        tracker.set_budget(org_id, 1000)
+
+        _record(tracker, org_id, 450)  # 900 tokens in January
+        assert tracker.check_budget(org_id, 200) is False
+
+        now[0] += 2 * 3600  # February 1st
+        assert tracker.check_budget(org_id, 200) is True
+        _record(tracker, org_id, 300)
+        assert tracker.check_budget(org_id, 500) is False
+        assert tracker.get_org_summary(org_id).total_tokens == 1500
+
+    def test_rollup_retention_bounded(self) -> None:
+        now = [0.0]
+        tracker = UsageTracker(clock=lambda: now[0], retention={"minute": 3})
+        org_id = uuid4()
+        for _ in range(5):
+            _record(tracker, org_id)
+            now[0] += 60
+
+        assert len(tracker.get_usage_series(org_id, "minute")) == 3
+        assert tracker.get_org_summary(org_id).record_count == 5
+
+    def test_recent_records_bounded(self) -> None:
+        tracker = UsageTracker(recent_limit=10)
+        org_id = uuid4()
+        for _ in range(25):
+            _record(tracker, org_id)
+
+        assert len(tracker.get_records_for_org(org_id)) == 10
+        assert tracker.get_org_summary(org_id).record_count == 25
+
+
+@pytest.mark.unit
+class TestUsageWriteBehind:
+    """Batched persistence through a sink."""
+
+    async def test_flush_writes_batches(self) -> None:
+        sink = FakeUsageSink()
+        tracker = UsageTracker(sink=sink, batch_size=4)
+        org_id = uuid4()
+        for _ in range(10):
+            _record(tracker, org_id)
+        tracker.record_tool_usage(
+            org_id=org_id,
+            user_id=uuid4(),
+            tool_name="image_generate",
+            tool_version="1.0.0",
+            cost_amount=0.04,
+            billing_unit="image",
+        )
+
+        assert await tracker.flush() == 11
+        assert [len(b) for b in sink.llm_batches] == [4, 4, 2]
+        assert len(sink.tool_batches) == 1
+        assert tracker.pending == 0
+
+    async def test_failed_batch_retried_in_order(self) -> None:
+        sink = FakeUsageSink()
+        tracker = UsageTracker(sink=sink, batch_size=2)
+        org_id = uuid4()
+        records = [_record(tracker, org_id, i) for i in range(3)]
+
+        sink.fail = True
+        assert await tracker.flush() == 0
+        assert tracker.pending == 3
+        assert tracker.stats.failed_flushes == 1
+
+        sink.fail = False
+        await tracker.flush()
+        written = [r for batch in sink.llm_batches for r in batch]
+        assert written == records
+        assert tracker.loss_tracker.lost_count == 0
+
+    async def test_overflow_and_close_report_loss(self) -> None:
+        sink = FakeUsageSink()
+        tracker = UsageTracker(sink=sink, batch_size=2, max_pending=3)
+        org_id = uuid4()
+        for _ in range(5):
+            _record(tracker, org_id)
+
+        assert tracker.pending == 3
+        assert tracker.loss_tracker.lost_count == 2
+
+        sink.fail = True
+        await tracker.close()
+        assert tracker.pending == 0
+        assert tracker.loss_tracker.lost_count == 5
+        assert tracker.get_org_summary(org_id).record_count == 5  # counters unaffected
+
+    async def test_start_seeds_totals_and_background_flush(self) -> None:
+        org_id = uuid4()
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        sink = FakeUsageSink(
+            totals=[
+                {
+                    "org_id": org_id,
+                    "input_tokens": 700,
+                    "output_tokens": 200,
+                    "record_count": 12,
+                    "tool_calls": 2,
+                    "tool_cost": 0.5,
+                }
+            ],
+            days=[
+                {
+                    "org_id": org_id,
+                    "day": today,
+                    "input_tokens": 700,
+                    "output_tokens": 200,
+                    "record_count": 12,
+                }
+            ],
+        )
+        tracker = UsageTracker(sink=sink, flush_interval=0.01)
+        tracker.set_budget(org_id, 1000)
+
+        await tracker.start()
+        _record(tracker, org_id, 10)
+        await tracker.close()
+
+        summary = tracker.get_org_summary(org_id)
+        assert summary.total_tokens == 920
+        assert summary.record_count == 13
+        assert summary.tool_calls == 2
+        assert tracker.check_budget(org_id, 100) is False
+        assert sum(len(b) for b in sink.llm_batches) == 1
+        assert sink.day_since == today.replace(day=1)
+
+    async def test_budget_seed_ignores_earlier_months(self) -> None:
+        org_id = uuid4()
+        now = datetime(2026, 3, 14, 12, tzinfo=UTC)
+        sink = FakeUsageSink(
+            totals=[
+                {
+                    "org_id": org_id,
+                    "input_tokens": 50_000,
+                    "output_tokens": 0,
+                    "record_count": 100,
+                }
+            ],
+            days=[
+                {
+                    "org_id": org_id,
+                    "day": datetime(2026, 2, 27, tzinfo=UTC),
+                    "input_tokens": 49_700,
+                    "output_tokens": 0,
+                    "record_count": 99,
+                },
+                {
+                    "org_id": org_id,
+                    "day": datetime(2026, 3, 2, tzinfo=UTC),
+                    "input_tokens": 300,
+                    "output_tokens": 0,
+                    "record_count": 1,
+                },
+            ],
+        )
+        tracker = UsageTracker(sink=sink, clock=now.timestamp)
+        tracker.set_budget(org_id, 1000)
+
+        await tracker.start()
+        await tracker.close()
+
+        assert tracker.get_org_summary(org_id).total_tokens == 50_000  # lifetime
+        assert tracker.check_budget(org_id, 700) is True
+        assert tracker.check_budget(org_id, 701) is False
+        days = tracker.get_usage_series(org_id, "day")
+        assert [(b.start.day, b.total_tokens) for b in days] == [(2, 300)]
+
+
 @pytest.mark.unit
 class TestMeteringLossTracker:
     """Metering loss monitoring."""